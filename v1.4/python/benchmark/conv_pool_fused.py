@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""
+This file measures Convolution2dPool2dMax against Convolution2d followed by Pooling2dMax.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+#-------------------------------------------------------------------------------
+__author__     = "Ando Ki"
+__copyright__  = "Copyright 2020, Future Design Systems"
+__credits__    = ["none", "some"]
+__license__    = "FUTURE DESIGN SYSTEMS SOFTWARE END-USER LICENSE AGREEMENT"
+__version__    = "0"
+__revision__   = "1"
+__maintainer__ = "Ando Ki"
+__email__      = "contact@future-ds.com"
+__status__     = "Development"
+__date__       = "2026.10.18"
+__description__= "Benchmark of Convolution2dPool2dMax"
+
+#-------------------------------------------------------------------------------
+import time
+import numpy as np
+from python.modules import dlr_common
+from python.modules.convolution_2d_wrapper import Convolution2d
+from python.modules.activation_wrapper import ActivationLeakyReLu
+from python.modules.pooling_2d_max_wrapper import Pooling2dMax
+from python.modules.convolution_2d_pool_2d_max_wrapper import Convolution2dPool2dMax
+
+#===============================================================================
+def Measure(func, repeat=5):
+    """
+    Returns the shortest time in msec of 'repeat' calls of 'func()'
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = (time.perf_counter()-start)*1E3
+        best = elapsed if (best is None) or (elapsed<best) else best
+    return best
+
+def BenchmarkConvolution2dPool2dMax(in_channel, in_size, out_channel, kernel_size=3, padding=1, _dtype=np.float32):
+    """
+    Compares Convolution2dPool2dMax of LeakyReLu and 2x2 of stride 2 pooling against
+    Convolution2d, ActivationLeakyReLu and Pooling2dMax, which write and read back
+    the full-resolution output.
+    """
+    rng = np.random.default_rng(0)
+    in_data = rng.uniform(-1, 1, [in_channel,in_size,in_size]).astype(_dtype)
+    kernel  = rng.uniform(-1, 1, [out_channel,in_channel,kernel_size,kernel_size]).astype(_dtype)
+    bias    = rng.uniform(-1, 1, [out_channel]).astype(_dtype)
+    conv_size = in_size-kernel_size+2*padding+1
+    out_conv  = np.empty([out_channel,conv_size,conv_size], dtype=_dtype)
+    out_data  = np.empty([out_channel,conv_size//2,conv_size//2], dtype=_dtype)
+    out_fused = np.empty([out_channel,conv_size//2,conv_size//2], dtype=_dtype)
+    def Separate():
+        Convolution2d(out_conv, in_data, kernel, bias, 1, padding)
+        ActivationLeakyReLu(out_conv, out_conv, negative_slope=0.1)
+        Pooling2dMax(out_data, out_conv, 2, 2)
+    t_sep   = Measure(Separate)
+    t_fused = Measure(lambda: Convolution2dPool2dMax(out_fused, in_data, kernel, bias, 1, padding, 2, 2
+                                                    , activation='LeakyReLu', negative_slope=0.1))
+    diff = np.max(np.abs(out_data-out_fused))
+    dlr_common.DlrPrint(f"Convolution2dPool2dMax {in_channel}x{in_size}x{in_size} -> {out_channel} k={kernel_size}:"
+                        f" {t_fused:9.3f} msec, separate {t_sep:9.3f} msec, ratio {t_sep/t_fused:5.2f}"
+                        f" {'OK' if diff<1E-3 else 'mis-match'}", flush=True)
+
+#===============================================================================
+if __name__=='__main__':
+    dlr_common.DlrPrint("Benchmark of Convolution2dPool2dMax", flush=True)
+    dlr_common.DlrPrint("***********************************", flush=True)
+    BenchmarkConvolution2dPool2dMax(in_channel=1, in_size=32, out_channel=6, kernel_size=5, padding=0) # LeNet-5
+    BenchmarkConvolution2dPool2dMax(in_channel=3, in_size=416, out_channel=16) # Tiny YOLO-V2
+    BenchmarkConvolution2dPool2dMax(in_channel=16, in_size=208, out_channel=32)
+    BenchmarkConvolution2dPool2dMax(in_channel=64, in_size=52, out_channel=128)
+
+#===============================================================================
+# Revision history:
+#
+# 2026.10.18: Started.
+#===============================================================================
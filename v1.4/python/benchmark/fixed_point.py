@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+"""
+This file measures a pass of Tiny YOLO-V2 by fixed-point routines against float.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+#-------------------------------------------------------------------------------
+__author__     = "Ando Ki"
+__copyright__  = "Copyright 2020, Future Design Systems"
+__credits__    = ["none", "some"]
+__license__    = "FUTURE DESIGN SYSTEMS SOFTWARE END-USER LICENSE AGREEMENT"
+__version__    = "0"
+__revision__   = "1"
+__maintainer__ = "Ando Ki"
+__email__      = "contact@future-ds.com"
+__status__     = "Development"
+__date__       = "2026.10.18"
+__description__= "Benchmark of fixed-point routines by Tiny YOLO-V2"
+
+#-------------------------------------------------------------------------------
+import sys
+import time
+import numpy as np
+from python.modules import dlr_common
+from python.modules.convolution_2d_wrapper import Convolution2d, GetOutputSizeOfConvolution2d
+from python.modules.pooling_2d_max_wrapper import Pooling2dMax, GetOutputSizeOfPooling2dMax
+from python.modules.norm_2d_batch_wrapper import Norm2dBatch
+from python.modules.activation_wrapper import ActivationLeakyReLu
+
+#===============================================================================
+# Tiny YOLO-V2 (VOC): 3x3 convolution with batch normalization and LeakyReLu
+# followed by 2x2 max pooling, where the last pooling of stride 1 goes without
+# padding, i.e., 12x12 rather than 13x13 of darknet.
+# (out_channel, kernel_size, pool stride or 0 for no pooling)
+_layers = [ (  16, 3, 2), (  32, 3, 2), (  64, 3, 2), ( 128, 3, 2), ( 256, 3, 2)
+          , ( 512, 3, 1), (1024, 3, 0), (1024, 3, 0), ( 125, 1, 0) ]
+
+def TinyYoloV2(in_data, params, dtype):
+    """
+    Returns output of Tiny YOLO-V2 and elapsed time in sec of each kind of routines
+    """
+    elapsed = { 'conv': 0.0, 'norm': 0.0, 'act': 0.0, 'pool': 0.0 }
+    x = in_data
+    for (out_channel, kernel_size, stride), (kernel, bias, mean, var, scale, shift) in zip(_layers, params):
+        padding = kernel_size//2
+        status, out_size = GetOutputSizeOfConvolution2d(x.shape[2], kernel_size, 1, padding)
+        z = np.empty([out_channel, out_size, out_size], dtype=dtype)
+        start = time.perf_counter()
+        Convolution2d(z, x, kernel, bias, 1, padding, algorithm='reference')
+        elapsed['conv'] += time.perf_counter()-start
+        if scale is None: # the last layer
+            x = z
+            break
+        start = time.perf_counter()
+        Norm2dBatch(z, z, mean, var, scale, shift, inplace=True)
+        elapsed['norm'] += time.perf_counter()-start
+        start = time.perf_counter()
+        ActivationLeakyReLu(z, z, negative_slope=0.1, inplace=True)
+        elapsed['act'] += time.perf_counter()-start
+        x = z
+        if stride:
+            status, out_size = GetOutputSizeOfPooling2dMax(x.shape[2], 2, stride, 0)
+            z = np.empty([out_channel, out_size, out_size], dtype=dtype)
+            start = time.perf_counter()
+            Pooling2dMax(z, x, 2, stride, 0)
+            elapsed['pool'] += time.perf_counter()-start
+            x = z
+    return x, elapsed
+
+def Parameters(rng, in_channel):
+    """
+    Returns list of (kernel, bias, mean, var, scale, shift) of float64 keeping activations about unit
+    """
+    params = []
+    for out_channel, kernel_size, stride in _layers:
+        std = np.sqrt(2.0/(in_channel*kernel_size*kernel_size))
+        kernel = rng.normal(0, std, [out_channel,in_channel,kernel_size,kernel_size])
+        bias   = rng.uniform(-0.1, 0.1, [out_channel])
+        if out_channel==_layers[-1][0]:
+            params.append((kernel, bias, None, None, None, None))
+        else:
+            params.append((kernel, bias
+                          , rng.uniform(-0.1, 0.1, [out_channel]), rng.uniform(0.5, 2.0, [out_channel])
+                          , rng.uniform(0.5, 1.5, [out_channel]), rng.uniform(-0.1, 0.1, [out_channel])))
+        in_channel = out_channel
+    return params
+
+#===============================================================================
+if __name__=='__main__':
+    in_size = int(sys.argv[1]) if len(sys.argv)>1 else 416
+    dlr_common.DlrPrint(f"Benchmark of Tiny YOLO-V2 {in_size}x{in_size} by fixed-point", flush=True)
+    dlr_common.DlrPrint("*********************************************", flush=True)
+    rng = np.random.default_rng(0)
+    image  = rng.uniform(0, 1, [3,in_size,in_size])
+    params = Parameters(rng, 3)
+
+    start = time.perf_counter()
+    expect, elapsed = TinyYoloV2(image.astype(np.float32)
+                                , [tuple(None if p is None else p.astype(np.float32) for p in layer) for layer in params]
+                                , np.float32)
+    total = time.perf_counter()-start
+    dlr_common.DlrPrint(f"float32            : {total:8.3f} sec "
+                        +" ".join(f"{name}={value:.3f}" for name, value in elapsed.items()), flush=True)
+
+    saved = dlr_common.get_fixed_format()
+    for width, int_width in [(16, 8), (24, 10)]:
+        dlr_common.set_fixed_format(width, int_width, 'RND', 'SAT')
+        start = time.perf_counter()
+        output, elapsed = TinyYoloV2(dlr_common.ToFixed(image)
+                                    , [tuple(None if p is None else dlr_common.ToFixed(p) for p in layer) for layer in params]
+                                    , dlr_common.fixed)
+        total = time.perf_counter()-start
+        diff = np.max(np.abs(dlr_common.FromFixed(output, np.float64)-expect))/np.max(np.abs(expect))
+        dlr_common.DlrPrint(f"fixed<{width},{int_width},RND,SAT>: {total:8.3f} sec "
+                            +" ".join(f"{name}={value:.3f}" for name, value in elapsed.items())
+                            +f" max diff to float {diff:.3e} of max", flush=True)
+    dlr_common.set_fixed_format(*saved)
+
+#===============================================================================
+# Revision history:
+#
+# 2026.10.18: Started.
+#===============================================================================
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+"""
+This file measures Convolution2d and Pooling2dAvg with padding against the same
+routine with padding=0 over input padded in advance, both of the library found
+through DLR_HOME. It does not run the loops before splitting padding border from
+interior; to compare with them, run this file against a library built from an
+older source, e.g., 'DLR_HOME=<older v1.4> PYTHONPATH=<older v1.4> python3 padding_split.py',
+and compare the 'padding' columns.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+#-------------------------------------------------------------------------------
+__author__     = "Ando Ki"
+__copyright__  = "Copyright 2020, Future Design Systems"
+__credits__    = ["none", "some"]
+__license__    = "FUTURE DESIGN SYSTEMS SOFTWARE END-USER LICENSE AGREEMENT"
+__version__    = "0"
+__revision__   = "1"
+__maintainer__ = "Ando Ki"
+__email__      = "contact@future-ds.com"
+__status__     = "Development"
+__date__       = "2026.10.18"
+__description__= "Benchmark of padding of Convolution2d and Pooling2dAvg"
+
+#-------------------------------------------------------------------------------
+import time
+import numpy as np
+from python.modules import dlr_common
+from python.modules.convolution_2d_wrapper import Convolution2d
+from python.modules.pooling_2d_avg_wrapper import Pooling2dAvg
+
+#===============================================================================
+def Measure(func, repeat=5):
+    """
+    Returns the shortest time in msec of 'repeat' calls of 'func()'
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = (time.perf_counter()-start)*1E3
+        best = elapsed if (best is None) or (elapsed<best) else best
+    return best
+
+def BenchmarkConvolution2d(in_channel, in_size, out_channel, kernel_size=3, padding=1, _dtype=np.float32):
+    """
+    Measures padding of Convolution2d (reference algorithm) against padding=0 over
+    input padded in advance, which does the same amount of work without padding check.
+    A ratio near or below 1 means padding costs little, not a speed-up over older loops.
+    """
+    rng = np.random.default_rng(0)
+    in_data = rng.uniform(-1, 1, [in_channel,in_size,in_size]).astype(_dtype)
+    kernel  = rng.uniform(-1, 1, [out_channel,in_channel,kernel_size,kernel_size]).astype(_dtype)
+    bias    = rng.uniform(-1, 1, [out_channel]).astype(_dtype)
+    in_pad  = np.pad(in_data, ((0,0),(padding,padding),(padding,padding)))
+    out_size = in_size-kernel_size+2*padding+1
+    out_data = np.empty([out_channel,out_size,out_size], dtype=_dtype)
+    out_pad  = np.empty([out_channel,out_size,out_size], dtype=_dtype)
+    t_pad = Measure(lambda: Convolution2d(out_data, in_data, kernel, bias, 1, padding, algorithm='reference'))
+    t_pre = Measure(lambda: Convolution2d(out_pad, in_pad, kernel, bias, 1, 0, algorithm='reference'))
+    diff  = np.max(np.abs(out_data-out_pad))
+    dlr_common.DlrPrint(f"Convolution2d {in_channel}x{in_size}x{in_size} -> {out_channel} k={kernel_size} padding={padding}:"
+                        f" padding {t_pad:9.3f} msec, pre-padded {t_pre:9.3f} msec, ratio {t_pad/t_pre:5.2f}"
+                        f" {'OK' if diff<1E-4 else 'mis-match'}", flush=True)
+
+def BenchmarkPooling2dAvg(channel, in_size, kernel_size=3, padding=1, _dtype=np.float32):
+    """
+    Measures padding of Pooling2dAvg against padding=0 over input padded in advance.
+    """
+    rng = np.random.default_rng(0)
+    in_data = rng.uniform(-1, 1, [channel,in_size,in_size]).astype(_dtype)
+    in_pad  = np.pad(in_data, ((0,0),(padding,padding),(padding,padding)))
+    out_size = in_size-kernel_size+2*padding+1
+    out_data = np.empty([channel,out_size,out_size], dtype=_dtype)
+    out_pad  = np.empty([channel,out_size,out_size], dtype=_dtype)
+    t_pad = Measure(lambda: Pooling2dAvg(out_data, in_data, kernel_size, 1, padding))
+    t_pre = Measure(lambda: Pooling2dAvg(out_pad, in_pad, kernel_size, 1, 0))
+    diff  = np.max(np.abs(out_data-out_pad))
+    dlr_common.DlrPrint(f"Pooling2dAvg {channel}x{in_size}x{in_size} k={kernel_size} padding={padding}:"
+                        f" padding {t_pad:9.3f} msec, pre-padded {t_pre:9.3f} msec, ratio {t_pad/t_pre:5.2f}"
+                        f" {'OK' if diff<1E-5 else 'mis-match'}", flush=True)
+
+#===============================================================================
+if __name__=='__main__':
+    dlr_common.DlrPrint("Benchmark of padding", flush=True)
+    dlr_common.DlrPrint("********************", flush=True)
+    BenchmarkConvolution2d(in_channel=3, in_size=416, out_channel=16)
+    BenchmarkConvolution2d(in_channel=256, in_size=13, out_channel=256)
+    BenchmarkPooling2dAvg(channel=16, in_size=416)
+    BenchmarkPooling2dAvg(channel=512, in_size=13)
+
+#===============================================================================
+# Revision history:
+#
+# 2026.10.18: described as padding against pre-padded input, not before/after
+# 2026.10.18: Started.
+#===============================================================================
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""
+This file measures float routines for each instruction set of SIMD kernels.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+#-------------------------------------------------------------------------------
+__author__     = "Ando Ki"
+__copyright__  = "Copyright 2020, Future Design Systems"
+__credits__    = ["none", "some"]
+__license__    = "FUTURE DESIGN SYSTEMS SOFTWARE END-USER LICENSE AGREEMENT"
+__version__    = "0"
+__revision__   = "1"
+__maintainer__ = "Ando Ki"
+__email__      = "contact@future-ds.com"
+__status__     = "Development"
+__date__       = "2026.10.18"
+__description__= "Benchmark of SIMD kernels for each instruction set"
+
+#-------------------------------------------------------------------------------
+import numpy as np
+from python.modules import dlr_common
+from python.modules.convolution_2d_wrapper import Convolution2d
+from python.modules.linear_1d_wrapper import Linear1d
+from python.modules.pooling_2d_max_wrapper import Pooling2dMax
+from python.modules.norm_2d_batch_wrapper import Norm2dBatch
+from python.modules.activation_wrapper import ActivationReLu, ActivationSigmoid, ActivationTanh
+from python.benchmark.padding_split import Measure
+
+#===============================================================================
+def Benchmark(name, func, out_data, isas):
+    """
+    Runs 'func()' for each instruction set and compares results against 'scalar'.
+    """
+    expect = None
+    report = []
+    for isa in isas:
+        dlr_common.set_isa(isa)
+        elapsed = Measure(func)
+        if expect is None: expect = out_data.copy()
+        diff = np.max(np.abs(out_data-expect))
+        report.append(f"{isa} {elapsed:9.3f} msec {'OK' if diff<1E-3 else 'mis-match'}")
+    dlr_common.set_isa()
+    dlr_common.DlrPrint(f"{name:32s}: "+", ".join(report), flush=True)
+
+#===============================================================================
+if __name__=='__main__':
+    dlr_common.DlrPrint("Benchmark of SIMD kernels", flush=True)
+    dlr_common.DlrPrint("*************************", flush=True)
+    isas = [isa for isa in ('scalar', 'avx2', 'avx512', 'neon') if dlr_common.set_isa(isa)]
+    dlr_common.set_isa()
+    dlr_common.DlrPrint(f"default: {dlr_common.get_isa()}", flush=True)
+
+    rng = np.random.default_rng(0)
+    x = rng.uniform(-1, 1, [64,56,56]).astype(np.float32)
+    k = rng.uniform(-1, 1, [64,64,3,3]).astype(np.float32)
+    b = rng.uniform(-1, 1, [64]).astype(np.float32)
+    z = np.empty([64,56,56], dtype=np.float32)
+    Benchmark("Convolution2d 64x56x56 k=3", lambda: Convolution2d(z, x, k, b, 1, 1, algorithm='reference'), z, isas)
+
+    v = rng.uniform(-1, 1, [4096]).astype(np.float32)
+    w = rng.uniform(-1, 1, [1000,4096]).astype(np.float32)
+    u = rng.uniform(-1, 1, [1000]).astype(np.float32)
+    y = np.empty([1000], dtype=np.float32)
+    Benchmark("Linear1d 4096->1000", lambda: Linear1d(y, v, w, u), y, isas)
+
+    x = rng.uniform(-1, 1, [64,112,112]).astype(np.float32)
+    z = np.empty([64,56,56], dtype=np.float32)
+    Benchmark("Pooling2dMax 64x112x112 k=2", lambda: Pooling2dMax(z, x, 2, 2), z, isas)
+
+    mean  = rng.uniform(-1, 1, [64]).astype(np.float32)
+    var   = rng.uniform( 0, 1, [64]).astype(np.float32)
+    scale = rng.uniform(-1, 1, [64]).astype(np.float32)
+    shift = rng.uniform(-1, 1, [64]).astype(np.float32)
+    z = np.empty([64,112,112], dtype=np.float32)
+    Benchmark("Norm2dBatch 64x112x112", lambda: Norm2dBatch(z, x, mean, var, scale, shift), z, isas)
+    Benchmark("ActivationReLu 64x112x112", lambda: ActivationReLu(z, x), z, isas)
+
+    for func in [ActivationSigmoid, ActivationTanh]:
+        report = [f"{str(accuracy):5s} {Measure(lambda: func(z, x, accuracy=accuracy)):9.3f} msec"
+                  for accuracy in [None, 'exact', 'lut', 'poly']]
+        dlr_common.DlrPrint(f"{func.__name__+' 64x112x112':32s}: "+", ".join(report), flush=True)
+
+#===============================================================================
+# Revision history:
+#
+# 2026.10.18: sigmoid and tanh for each accuracy added.
+# 2026.10.18: Started.
+#===============================================================================
@@ -1,12 +1,18 @@
 from .activation_wrapper        import *
+from .activation_lut_wrapper    import *
 from .concat_2d_wrapper         import *
 from .convolution_2d_wrapper    import *
+from .convolution_2d_bn_act_wrapper import *
+from .convolution_2d_pool_2d_max_wrapper import *
 from .deconvolution_2d_wrapper  import *
 from .dlr_common                import *
 from .linear_1d_wrapper         import *
+from .linear_batch_wrapper      import *
 from .linear_nd_wrapper         import *
 from .norm_1d_batch_wrapper     import *
 from .norm_2d_batch_wrapper     import *
 from .norm_3d_batch_wrapper     import *
+from .packed_weights_wrapper    import *
+from .pooling_2d_adaptive_wrapper import *
 from .pooling_2d_avg_wrapper    import *
 from .pooling_2d_max_wrapper    import *
@@ -0,0 +1,294 @@
+#!/usr/bin/env python
+"""
+This file contains Python interface of table-driven activation for quantized data
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+#-------------------------------------------------------------------------------
+__author__     = "Ando Ki"
+__copyright__  = "Copyright 2020, Future Design Systems"
+__credits__    = ["none", "some"]
+__license__    = "FUTURE DESIGN SYSTEMS SOFTWARE END-USER LICENSE AGREEMENT"
+__version__    = "0"
+__revision__   = "1"
+__maintainer__ = "Ando Ki"
+__email__      = "contact@future-ds.com"
+__status__     = "Development"
+__date__       = "2026.10.18"
+__description__= "Python interface of table-driven activation for quantized data"
+
+#-------------------------------------------------------------------------------
+import ctypes
+import collections
+import threading
+import numpy as np
+from python.modules import dlr_common
+
+#===============================================================================
+# function of table (DLR_LUT_xxx)
+_lut_functions = { 'Sigmoid'  : 0
+                 , 'Tanh'     : 1
+                 , 'LeakyReLu': 2 }
+
+dlr_common.RegisterSignature('ActivationLutBuild'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # table
+                                             ,ctypes.c_int     # function
+                                             ,ctypes.c_float   # in_scale
+                                             ,ctypes.c_int     # in_zero_point
+                                             ,ctypes.c_float   # out_scale
+                                             ,ctypes.c_int     # out_zero_point
+                                             ,ctypes.c_ubyte   # bits
+                                             ,ctypes.c_float   # negative_slope
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int     # verbose
+                                             ])
+dlr_common.RegisterSignature('ActivationLut'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # output
+                                             ,ctypes.POINTER(_ctype) # input
+                                             ,ctypes.POINTER(_ctype) # table
+                                             ,ctypes.c_uint    # number of elements
+                                             ,ctypes.c_ushort  # number of channels
+                                             ,ctypes.c_ubyte   # bits
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int     # verbose
+                                             ])
+dlr_common.RegisterSignature('ActivationLutBatch'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # output
+                                             ,ctypes.POINTER(_ctype) # input
+                                             ,ctypes.POINTER(_ctype) # table
+                                             ,ctypes.c_uint    # number of elements
+                                             ,ctypes.c_ushort  # number of channels
+                                             ,ctypes.c_ushort  # minibatch
+                                             ,ctypes.c_ubyte   # bits
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int     # verbose
+                                             ])
+
+#===============================================================================
+# tables kept across calls
+# - key: (function, scale, bits, zero_point, out_scale, out_zero_point, negative_slope)
+_luts      = collections.OrderedDict()
+_luts_max  = 64 # max num of cached tables
+_luts_lock = threading.Lock()
+
+def GetActivationLut( func_name # 'Sigmoid', 'Tanh' or 'LeakyReLu'
+                    , scale     # scale of quantized input
+                    , bits=8    # bits of quantized input (signed)
+                    , zero_point=0
+                    , out_scale=None # None for 1/2^(bits-1) of Sigmoid/Tanh and 'scale' of LeakyReLu
+                    , out_zero_point=0
+                    , negative_slope=0.01
+                    , rigor=False
+                    , verbose=False):
+    """
+    Returns table of 'func_name' for quantized input, which is built only when not in the cache.
+    Quantized input 'q' stands for 'scale*(q-zero_point)', while output
+    'table[q+2^(bits-1)]' is quantized by 'out_scale' and 'out_zero_point'.
+    :return: NumPy array of 2^bits int32 on success, None on failure.
+    """
+    if func_name not in _lut_functions:
+        dlr_common.DlrError(f"not support {func_name}")
+        return None
+    if out_scale is None:
+        out_scale = scale if func_name=='LeakyReLu' else 1.0/(1<<(bits-1))
+    key = (func_name, float(scale), bits, zero_point, float(out_scale), out_zero_point,
+           float(negative_slope) if func_name=='LeakyReLu' else None)
+    with _luts_lock:
+        table = _luts.get(key)
+        if table is not None:
+            _luts.move_to_end(key)
+            return table
+        _Build, _ctype = dlr_common.GetFunction('ActivationLutBuild', np.int32)
+        if _Build is None:
+            dlr_common.DlrError("not support ActivationLutBuild")
+            return None
+        table = np.empty([1<<bits], dtype=np.int32)
+        _Build(table.ctypes.data_as(ctypes.POINTER(_ctype))
+              ,ctypes.c_int(_lut_functions[func_name])
+              ,ctypes.c_float(scale)
+              ,ctypes.c_int(zero_point)
+              ,ctypes.c_float(out_scale)
+              ,ctypes.c_int(out_zero_point)
+              ,ctypes.c_ubyte(bits)
+              ,ctypes.c_float(negative_slope)
+              ,1 if rigor else 0
+              ,1 if verbose else 0)
+        table.flags.writeable = False
+        _luts[key] = table
+        if len(_luts)>_luts_max: _luts.popitem(last=False)
+        return table
+
+def ClearActivationLut():
+    """
+    Removes all tables in the cache.
+    """
+    with _luts_lock:
+        _luts.clear()
+
+def WriteActivationLut( file_name
+                      , func_name
+                      , scale
+                      , bits=8
+                      , zero_point=0
+                      , out_scale=None
+                      , out_zero_point=0
+                      , negative_slope=0.01
+                      , name=None):
+    """
+    Writes table of GetActivationLut() as a C array for the HLS flow,
+    which is given to ActivationLut<int>() as 'table'.
+    :param name: name of C array, 'dlr_lut_<func_name>_<bits>' when None
+    :return: 'True' on success, 'False' on failure.
+    """
+    table = GetActivationLut(func_name, scale, bits, zero_point, out_scale, out_zero_point, negative_slope)
+    if table is None: return False
+    if name is None: name = f"dlr_lut_{func_name.lower()}_{bits}"
+    if out_scale is None:
+        out_scale = scale if func_name=='LeakyReLu' else 1.0/(1<<(bits-1))
+    lines = [ "#pragma once"
+            , f"// {func_name} table of ActivationLut<int>() generated by activation_lut_wrapper.py"
+            , f"// input : q*{scale!r} (zero point {zero_point}), {bits}-bit signed"
+            , f"// output: q*{out_scale!r} (zero point {out_zero_point})"
+            + (f", negative slope {negative_slope!r}" if func_name=='LeakyReLu' else "")
+            , f"#define {name.upper()}_BITS {bits}"
+            , f"static const int {name}[{len(table)}] = {{" ]
+    for n in range(0, len(table), 16):
+        lines.append("    "+", ".join(f"{v:d}" for v in table[n:n+16])+("," if n+16<len(table) else ""))
+    lines.append("};")
+    with open(file_name, "w") as fp:
+        fp.write("\n".join(lines)+"\n")
+    return True
+
+#===============================================================================
+def ActivationLut( func_name # 'Sigmoid', 'Tanh' or 'LeakyReLu'
+                 , out_data  # any dimension
+                 , in_data   # any dimension
+                 , scale
+                 , bits=8
+                 , zero_point=0
+                 , out_scale=None
+                 , out_zero_point=0
+                 , negative_slope=0.01
+                 , rigor=False
+                 , verbose=False):
+    """
+    Returns True on success, otherwize returns False
+    Applies table of 'func_name' over quantized input data, i.e., a single lookup per element.
+    Note that all nd-array lists are NumPy (mutable) and contiguous int32.
+    :param out_data: <mutable> output data, out_data[...]
+    :param in_data: input data, in_data[...]
+    :param scale, bits, zero_point, out_scale, out_zero_point, negative_slope: see GetActivationLut()
+    :param rigor: check values rigorously when 'True'
+    :param verbose: output message more when 'True'
+    :return: 'True' on success, 'False' on failure.
+    """
+    if rigor or dlr_common.rigor:
+        if (out_data.shape!=in_data.shape) or (out_data.dtype!=in_data.dtype):
+            dlr_common.DlrError(f"data shape mis-match {in_data.shape} {out_data.shape}")
+            return False
+    _Lut, _ctype = dlr_common.GetFunction('ActivationLut', out_data.dtype)
+    if _Lut is None:
+        dlr_common.DlrError("not support "+str(out_data.dtype.type))
+        return False
+    table = GetActivationLut(func_name, scale, bits, zero_point, out_scale, out_zero_point,
+                             negative_slope, rigor, verbose)
+    if table is None: return False
+    channel = out_data.shape[0] if out_data.ndim>=2 else 1
+    size    = out_data.size//channel if out_data.size>0 else 0
+    _Lut(out_data.ctypes.data_as(ctypes.POINTER(_ctype))
+        ,in_data.ctypes.data_as(ctypes.POINTER(_ctype))
+        ,table.ctypes.data_as(ctypes.POINTER(_ctype))
+        ,ctypes.c_uint(size)
+        ,ctypes.c_ushort(channel)
+        ,ctypes.c_ubyte(bits)
+        ,1 if rigor else 0
+        ,1 if verbose else 0)
+    return True
+
+def ActivationLutBatch( func_name # 'Sigmoid', 'Tanh' or 'LeakyReLu'
+                      , out_data  # minibatch x any dimension
+                      , in_data   # minibatch x any dimension
+                      , scale
+                      , bits=8
+                      , zero_point=0
+                      , out_scale=None
+                      , out_zero_point=0
+                      , negative_slope=0.01
+                      , rigor=False
+                      , verbose=False):
+    """
+    Returns True on success, otherwize returns False
+    Applies table of 'func_name' over a minibatch of quantized input data by a single call of the C routine.
+    """
+    if rigor or dlr_common.rigor:
+        if (out_data.shape!=in_data.shape) or (out_data.dtype!=in_data.dtype) or (in_data.ndim<1):
+            dlr_common.DlrError(f"data shape mis-match {in_data.shape} {out_data.shape}")
+            return False
+    _Lut, _ctype = dlr_common.GetFunction('ActivationLutBatch', out_data.dtype)
+    if _Lut is None:
+        dlr_common.DlrError("not support "+str(out_data.dtype.type))
+        return False
+    table = GetActivationLut(func_name, scale, bits, zero_point, out_scale, out_zero_point,
+                             negative_slope, rigor, verbose)
+    if table is None: return False
+    minibatch = out_data.shape[0]
+    channel   = out_data.shape[1] if out_data.ndim>2 else 1
+    size      = out_data.size//(minibatch*channel) if out_data.size>0 else 0
+    _Lut(out_data.ctypes.data_as(ctypes.POINTER(_ctype))
+        ,in_data.ctypes.data_as(ctypes.POINTER(_ctype))
+        ,table.ctypes.data_as(ctypes.POINTER(_ctype))
+        ,ctypes.c_uint(size)
+        ,ctypes.c_ushort(channel)
+        ,ctypes.c_ushort(minibatch)
+        ,ctypes.c_ubyte(bits)
+        ,1 if rigor else 0
+        ,1 if verbose else 0)
+    return True
+
+#===============================================================================
+if __name__=='__main__':
+    import os
+    import tempfile
+
+    def TestActivationLut(bits=8, scale=0.05, zero_point=3):
+        """
+        Compares against activation in double precision quantized in the same way
+        """
+        qmin, qmax = -(1<<(bits-1)), (1<<(bits-1))-1
+        in_data = np.random.randint(qmin-20, qmax+20, size=[2,3,17]).astype(np.int32)
+        x = scale*(np.clip(in_data, qmin, qmax)-zero_point).astype(np.float64)
+        for func_name, func, out_scale in [ ('Sigmoid'  , lambda x: 1.0/(1.0+np.exp(-x)), 1.0/(1<<(bits-1)))
+                                          , ('Tanh'     , np.tanh                        , 1.0/(1<<(bits-1)))
+                                          , ('LeakyReLu', lambda x: np.where(x<0, x*0.01, x), scale) ]:
+            expect = np.clip(np.floor(func(x)/out_scale+0.5), qmin, qmax).astype(np.int32)
+            out_data = np.empty_like(in_data)
+            ok  = ActivationLut(func_name, out_data[0], in_data[0], scale, bits, zero_point, rigor=True)
+            ok &= ActivationLutBatch(func_name, out_data, in_data, scale, bits, zero_point, rigor=True)
+            diff = np.max(np.abs(out_data-expect))
+            dlr_common.DlrPrint(f"ActivationLut {func_name} bits={bits}: "
+                               +("OK" if ok and (diff<=1) else f"mis-match {diff}"), flush=True)
+        # the same table from the cache
+        if GetActivationLut('Sigmoid', scale, bits, zero_point) is not GetActivationLut('Sigmoid', scale, bits, zero_point):
+            dlr_common.DlrPrint("ActivationLut cache mis-match", flush=True)
+        with tempfile.TemporaryDirectory() as tmp:
+            file_name = os.path.join(tmp, "lut.h")
+            WriteActivationLut(file_name, 'Tanh', scale, bits, zero_point)
+            with open(file_name) as fp: text = fp.read()
+            values = text[text.index("{")+1:text.index("}")].replace("\n", " ").split(",")
+            table = GetActivationLut('Tanh', scale, bits, zero_point)
+            dlr_common.DlrPrint(f"WriteActivationLut {file_name}: "
+                               +("OK" if np.array_equal(np.array(values, dtype=np.int32), table) else "mis-match"), flush=True)
+
+if __name__=='__main__':
+    dlr_common.DlrPrint("Testing ActivationLut", flush=True)
+    dlr_common.DlrPrint("*********************", flush=True)
+    TestActivationLut(bits=8)
+    TestActivationLut(bits=12, scale=0.004, zero_point=-7)
+
+#===============================================================================
+# Revision history:
+#
+# 2026.10.18: Started.
+#===============================================================================
@@ -27,12 +27,71 @@ import math
 from python.modules import dlr_common
 
 #===============================================================================
+for _func_name in ['ReLu', 'Tanh', 'Sigmoid']:
+    dlr_common.RegisterSignature('Activation'+_func_name
+                                , lambda _ctype: [ctypes.POINTER(_ctype) # output
+                                                 ,ctypes.POINTER(_ctype) # input
+                                                 ,ctypes.c_uint    # number of elements
+                                                 ,ctypes.c_ushort  # number of channels
+                                                 ,ctypes.c_int     # rigor
+                                                 ,ctypes.c_int     # verbose
+                                                 ])
+dlr_common.RegisterSignature('ActivationLeakyReLu'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # output
+                                             ,ctypes.POINTER(_ctype) # input
+                                             ,ctypes.c_uint    # number of elements
+                                             ,ctypes.c_ushort  # number of channels
+                                             ,ctypes.c_uint    # negative slope
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int     # verbose
+                                             ])
+
+# accuracy of 'Tanh' and 'Sigmoid' in float precision (DLR_ACCURACY_xxx),
+# where None goes the routine in double precision.
+_accuracies = { 'exact': 0 # float library function
+              , 'lut'  : 1 # table with linear interpolation
+              , 'poly' : 2 # rational polynomial
+              }
+
+for _func_name in ['Tanh', 'Sigmoid']:
+    dlr_common.RegisterSignature('Activation'+_func_name+'Fast'
+                                , lambda _ctype: [ctypes.POINTER(_ctype) # output
+                                                 ,ctypes.POINTER(_ctype) # input
+                                                 ,ctypes.c_uint    # number of elements
+                                                 ,ctypes.c_ushort  # number of channels
+                                                 ,ctypes.c_int     # accuracy
+                                                 ,ctypes.c_int     # rigor
+                                                 ,ctypes.c_int     # verbose
+                                                 ])
+    dlr_common.RegisterSignature('Activation'+_func_name+'BatchFast'
+                                , lambda _ctype: [ctypes.POINTER(_ctype) # output
+                                                 ,ctypes.POINTER(_ctype) # input
+                                                 ,ctypes.c_uint    # number of elements
+                                                 ,ctypes.c_ushort  # number of channels
+                                                 ,ctypes.c_ushort  # minibatch
+                                                 ,ctypes.c_int     # accuracy
+                                                 ,ctypes.c_int     # rigor
+                                                 ,ctypes.c_int     # verbose
+                                                 ])
+
+def _GetAccuracy(func_name, accuracy):
+    """
+    Returns (variant, extra arguments) of the C routine for 'accuracy'
+    """
+    if accuracy is None: return '', []
+    if (func_name not in ['Tanh', 'Sigmoid']) or (accuracy not in _accuracies):
+        dlr_common.DlrError(f"accuracy '{accuracy}' not supported for {func_name}")
+        return None, None
+    return 'Fast', [ctypes.c_int(_accuracies[accuracy])]
+
 def Activations( func_name 
                , out_data # any dimension
                , in_data  # any dimension
                , negative_slope=0.01 # for LeakyReLu
                , rigor=False
-               , verbose=False):
+               , verbose=False
+               , accuracy=None
+               , inplace=False):
     """
     Returns True on success, otherwize returns False
     Applies a non-linear activation function over an input data composed of several input channels.
@@ -41,6 +100,9 @@ def Activations( func_name
     :param in_data: input data, in_data[...]
     :param rigor: check values rigorously when 'True'
     :param verbose: output message more when 'True'
+    :param accuracy: None for double precision, 'exact', 'lut' or 'poly' for float precision
+                     of 'Tanh' and 'Sigmoid' (see ActivationSigmoidFloatFast())
+    :param inplace: write results into 'in_data', i.e., 'out_data' may be None or 'in_data' itself
     :return: 'True' on success, 'False' on failure.
     Follwoings are derived from input arguments
     . out_size: array size of out_data
@@ -51,6 +113,8 @@ def Activations( func_name
                       , rigor=True
                       , verbose=True)
     """
+    out_data = dlr_common.GetInplaceOutput(out_data, in_data, inplace)
+    if out_data is None: return False
     if rigor:
        error =0
        if (out_data.ndim!=in_data.ndim):
@@ -76,33 +140,14 @@ def Activations( func_name
         channel = out_data.shape[0]
         size = np.prod(out_data.shape[1:])
 
-    #_fname=''
-    #_ctype=''
-    if out_data.dtype.type == np.int32:
-        _fname = 'Activation'+func_name+'Int'
-        _ctype = ctypes.c_int
-    elif out_data.dtype.type == np.float32:
-        _fname = 'Activation'+func_name+'Float'
-        _ctype = ctypes.c_float
-    elif out_data.dtype.type == np.float64:
-        _fname = 'Activation'+func_name+'Double'
-        _ctype = ctypes.c_double
-    else:
+    variant, extra = _GetAccuracy(func_name, accuracy)
+    if variant is None: return False
+    _Activation, _ctype = dlr_common.GetFunction('Activation'+func_name, out_data.dtype, variant)
+    if _Activation is None:
         dlr_common.DlrError("not support "+str(out_data.dtype.type))
         return False
 
     if func_name == 'LeakyReLu':
-        _Activation=dlr_common.WrapFunction(dlr_common._dlr
-                                    ,_fname
-                                    , None          # return type
-                                    ,[ctypes.POINTER(_ctype) # output
-                                     ,ctypes.POINTER(_ctype) # input
-                                     ,ctypes.c_uint    # number of elements
-                                     ,ctypes.c_ushort  # number of channels
-                                     ,ctypes.c_uint    # negative slope
-                                     ,ctypes.c_int     # rigor
-                                     ,ctypes.c_int     # verbose
-                                     ]) 
         CP_out_data       = out_data.ctypes.data_as(ctypes.POINTER(_ctype))
         CP_in_data        = in_data.ctypes.data_as(ctypes.POINTER(_ctype))
         CP_size           = ctypes.c_uint(size)
@@ -120,16 +165,6 @@ def Activations( func_name
                    ,CP_verbose
                    )
     else :
-        _Activation=dlr_common.WrapFunction(dlr_common._dlr
-                                    ,_fname
-                                    , None          # return type
-                                    ,[ctypes.POINTER(_ctype) # output
-                                     ,ctypes.POINTER(_ctype) # input
-                                     ,ctypes.c_uint    # number of elements
-                                     ,ctypes.c_ushort  # number of channels
-                                     ,ctypes.c_int     # rigor
-                                     ,ctypes.c_int     # verbose
-                                     ]) 
         CP_out_data    = out_data.ctypes.data_as(ctypes.POINTER(_ctype))
         CP_in_data     = in_data.ctypes.data_as(ctypes.POINTER(_ctype))
         CP_size        = ctypes.c_uint(size)
@@ -141,6 +176,7 @@ def Activations( func_name
                    ,CP_in_data      
                    ,CP_size    
                    ,CP_channel
+                   ,*extra
                    ,CP_rigor
                    ,CP_verbose
                    )
@@ -150,41 +186,155 @@ def Activations( func_name
 def ActivationReLu( out_data # any dimension
                   , in_data  # any dimension
                   , rigor=False
-                  , verbose=False):
+                  , verbose=False
+                  , inplace=False):
     return Activations( 'ReLu'
                       , out_data=out_data
                       , in_data=in_data
                       , rigor=rigor
-                      , verbose=verbose)
+                      , verbose=verbose
+                      , inplace=inplace)
 def ActivationLeakyReLu( out_data # any dimension
                        , in_data  # any dimension
                        , negative_slope=0.01
                        , rigor=False
-                       , verbose=False):
+                       , verbose=False
+                       , inplace=False):
     return Activations( 'LeakyReLu'
                       , out_data=out_data
                       , in_data=in_data
                       , negative_slope=negative_slope
                       , rigor=rigor
-                      , verbose=verbose)
+                      , verbose=verbose
+                      , inplace=inplace)
 def ActivationTanh( out_data # any dimension
                   , in_data  # any dimension
                   , rigor=False
-                  , verbose=False):
+                  , verbose=False
+                  , accuracy=None
+                  , inplace=False):
     return Activations( 'Tanh'
                       , out_data=out_data
                       , in_data=in_data
                       , rigor=rigor
-                      , verbose=verbose)
+                      , verbose=verbose
+                      , accuracy=accuracy
+                      , inplace=inplace)
 def ActivationSigmoid( out_data # any dimension
                      , in_data  # any dimension
                      , rigor=False
-                     , verbose=False):
+                     , verbose=False
+                     , accuracy=None
+                     , inplace=False):
     return Activations( 'Sigmoid'
                       , out_data=out_data
                       , in_data=in_data
                       , rigor=rigor
-                      , verbose=verbose)
+                      , verbose=verbose
+                      , accuracy=accuracy
+                      , inplace=inplace)
+
+#===============================================================================
+for _func_name in ['ReLu', 'Tanh', 'Sigmoid']:
+    dlr_common.RegisterSignature('Activation'+_func_name+'Batch'
+                                , lambda _ctype: [ctypes.POINTER(_ctype) # output
+                                                 ,ctypes.POINTER(_ctype) # input
+                                                 ,ctypes.c_uint    # number of elements
+                                                 ,ctypes.c_ushort  # number of channels
+                                                 ,ctypes.c_ushort  # minibatch
+                                                 ,ctypes.c_int     # rigor
+                                                 ,ctypes.c_int     # verbose
+                                                 ])
+dlr_common.RegisterSignature('ActivationLeakyReLuBatch'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # output
+                                             ,ctypes.POINTER(_ctype) # input
+                                             ,ctypes.c_uint    # number of elements
+                                             ,ctypes.c_ushort  # number of channels
+                                             ,ctypes.c_ushort  # minibatch
+                                             ,ctypes.c_uint    # negative slope
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int     # verbose
+                                             ])
+
+def ActivationsBatch( func_name
+                    , out_data # minibatch x any dimension
+                    , in_data  # minibatch x any dimension
+                    , negative_slope=0.01 # for LeakyReLu
+                    , rigor=False
+                    , verbose=False
+                    , accuracy=None
+                    , inplace=False):
+    """
+    Returns True on success, otherwize returns False
+    Applies a non-linear activation function over a minibatch of input data by a single call of the C routine.
+    Note that all nd-array lists are NumPy (mutable) and contiguous.
+    :param out_data: <mutable> output data, out_data[minibatch][...]
+    :param in_data: input data, in_data[minibatch][...]
+    :param rigor: check values rigorously when 'True'
+    :param verbose: output message more when 'True'
+    :param accuracy: None, 'exact', 'lut' or 'poly' for 'Tanh' and 'Sigmoid' as Activations()
+    :param inplace: write results into 'in_data' as Activations()
+    :return: 'True' on success, 'False' on failure.
+    """
+    out_data = dlr_common.GetInplaceOutput(out_data, in_data, inplace)
+    if out_data is None: return False
+    if rigor:
+       if (out_data.shape!=in_data.shape) or (in_data.ndim<1):
+           if verbose: dlr_common.DlrError(f"data shape mis-match {in_data.shape} {out_data.shape}")
+           dlr_common.DlrError("parameter mis-match");
+           return False
+    minibatch = out_data.shape[0]
+    if (out_data.ndim<=2):
+        channel = 1
+    else:
+        channel = out_data.shape[1]
+    size = out_data.size//(minibatch*channel) if out_data.size>0 else 0
+
+    variant, extra = _GetAccuracy(func_name, accuracy)
+    if variant is None: return False
+    _Activation, _ctype = dlr_common.GetFunction('Activation'+func_name+'Batch', out_data.dtype, variant)
+    if _Activation is None:
+        dlr_common.DlrError("not support "+str(out_data.dtype.type))
+        return False
+
+    CP_out_data    = out_data.ctypes.data_as(ctypes.POINTER(_ctype))
+    CP_in_data     = in_data.ctypes.data_as(ctypes.POINTER(_ctype))
+    CP_size        = ctypes.c_uint(size)
+    CP_channel     = ctypes.c_ushort(channel)
+    CP_minibatch   = ctypes.c_ushort(minibatch)
+    CP_rigor       = 1 if rigor else 0
+    CP_verbose     = 1 if verbose else 0
+    if func_name == 'LeakyReLu':
+        CP_negative_slope = ctypes.c_uint.from_buffer(ctypes.c_float(negative_slope)).value
+        _Activation(CP_out_data
+                   ,CP_in_data
+                   ,CP_size
+                   ,CP_channel
+                   ,CP_minibatch
+                   ,CP_negative_slope
+                   ,CP_rigor
+                   ,CP_verbose
+                   )
+    else :
+        _Activation(CP_out_data
+                   ,CP_in_data
+                   ,CP_size
+                   ,CP_channel
+                   ,CP_minibatch
+                   ,*extra
+                   ,CP_rigor
+                   ,CP_verbose
+                   )
+    return True
+
+def ActivationReLuBatch( out_data, in_data, rigor=False, verbose=False, inplace=False):
+    return ActivationsBatch('ReLu', out_data, in_data, rigor=rigor, verbose=verbose, inplace=inplace)
+def ActivationLeakyReLuBatch( out_data, in_data, negative_slope=0.01, rigor=False, verbose=False, inplace=False):
+    return ActivationsBatch('LeakyReLu', out_data, in_data, negative_slope=negative_slope, rigor=rigor, verbose=verbose, inplace=inplace)
+def ActivationTanhBatch( out_data, in_data, rigor=False, verbose=False, accuracy=None, inplace=False):
+    return ActivationsBatch('Tanh', out_data, in_data, rigor=rigor, verbose=verbose, accuracy=accuracy, inplace=inplace)
+def ActivationSigmoidBatch( out_data, in_data, rigor=False, verbose=False, accuracy=None, inplace=False):
+    return ActivationsBatch('Sigmoid', out_data, in_data, rigor=rigor, verbose=verbose, accuracy=accuracy, inplace=inplace)
 
 #===============================================================================
 if __name__=='__main__':
@@ -212,15 +362,79 @@ if __name__=='__main__':
                    dlr_common.DlrPrint(f"in_data\n{in_data}")
                    dlr_common.DlrPrint(f"out_data\n{out_data}")
 
+    def TestActivationsFast():
+        """
+        Reports difference of 'Tanh' and 'Sigmoid' in float precision against double precision
+        """
+        in_data = np.linspace(-20, 20, 1<<16, dtype=np.float32)
+        expect  = { 'Tanh'   : np.tanh(in_data.astype(np.float64))
+                  , 'Sigmoid': 1.0/(1.0+np.exp(-in_data.astype(np.float64))) }
+        for func in ['Tanh', 'Sigmoid']:
+            for accuracy in _accuracies:
+                out_data = np.empty_like(in_data)
+                if not globals()["Activation"+func](out_data, in_data, rigor=True, accuracy=accuracy): continue
+                diff = np.max(np.abs(out_data-expect[func]))
+                dlr_common.DlrPrint(f"Activation{func} accuracy={accuracy:5s}: max abs diff {diff:.3e}"
+                                   +(" OK" if diff<1E-4 else " mis-match"), flush=True)
+
+    def TestActivationsInplace(_dtype):
+        """
+        Compares in-place results against out-of-place ones and checks partial overlap is rejected
+        """
+        in_data = ((100+100)*np.random.random(size=(3,4,5))-100).astype(_dtype)
+        for func in ["ReLu", "LeakyReLu", "Tanh", "Sigmoid"]:
+            expect = np.empty_like(in_data)
+            globals()["Activation"+func](expect, in_data, rigor=True)
+            inout = in_data.copy()
+            status = globals()["Activation"+func](None, inout, rigor=True, inplace=True)
+            diff = np.max(np.abs(inout-expect))
+            dlr_common.DlrPrint(f"Activation{func} inplace: max abs diff {diff:.3e}"
+                               +(" OK" if status and diff==0 else " mis-match"), flush=True)
+        inout = in_data.reshape(-1).copy()
+        status = ActivationReLu(inout[1:], inout[:-1])
+        dlr_common.DlrPrint("ActivationReLu partial overlap"
+                           +(" OK" if not status else " mis-match"), flush=True)
+
+    def TestActivationsStructured():
+        """
+        Checks that only 'fixed' and 'bfloat16' go their routines and other structured
+        data are rejected without writing past the end of 'out_data'
+        """
+        in_data = np.arange(-4, 4, dtype=np.int32)
+        out_data = np.empty(8, dtype=dlr_common.fixed)
+        status = ActivationReLu(out_data, in_data.view(dlr_common.fixed), rigor=True)
+        dlr_common.DlrPrint("ActivationReLu fixed"
+                           +(" OK" if status and np.array_equal(out_data.view(np.int32), np.maximum(in_data, 0)) else " mis-match"), flush=True)
+        out_data = np.empty(8, dtype=dlr_common.bfloat16)
+        status = ActivationReLu(out_data, dlr_common.ToBFloat16(in_data), rigor=True)
+        dlr_common.DlrPrint("ActivationReLu bfloat16"
+                           +(" OK" if status and np.array_equal(dlr_common.FromBFloat16(out_data), np.maximum(in_data, 0)) else " mis-match"), flush=True)
+        for dtype in [ np.dtype([('a', np.int16)]), np.dtype([('a', np.float32)])
+                     , np.dtype([('raw', np.int32), ('pad', np.int32)])
+                     , np.dtype((np.record, [('a', np.uint8)])), np.dtype((np.record, [('raw', np.float32)])) ]:
+            buffer = np.full(16*dtype.itemsize, 0xFF, dtype=np.uint8) # guard after 8 items
+            in_data = np.zeros(8, dtype=dtype)
+            out_data = buffer[:8*dtype.itemsize].view(dtype)
+            status = ActivationReLu(out_data, in_data, rigor=True)
+            dlr_common.DlrPrint(f"ActivationReLu {dtype} rejected"
+                               +(" OK" if not status and np.all(buffer[8*dtype.itemsize:]==0xFF) else " mis-match"), flush=True)
+
 if __name__=='__main__':
     dlr_common.DlrPrint("Testing Activations", flush=True);
     dlr_common.DlrPrint("*********************", flush=True)
     #TestActivations(_dtype=np.int32)
     TestActivations(_dtype=np.float32)
     #TestActivations(_dtype=np.float64)
+    TestActivationsFast()
+    TestActivationsInplace(_dtype=np.float32)
+    TestActivationsStructured()
 
 #===============================================================================
 # Revision history:
 #
+# 2026.10.18: TestActivationsStructured() added for dispatch of structured data
+# 2026.10.18: 'inplace' added
+# 2026.10.18: 'accuracy' added for Tanh and Sigmoid in float precision
+# 2026.10.18: 'Activation*Batch' added for minibatch
 # 2020.04.58: Started by Ando Ki (adki@future-ds.com)
 #===============================================================================
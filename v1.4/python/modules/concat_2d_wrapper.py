@@ -27,6 +27,19 @@ import math
 from python.modules import dlr_common
 
 #===============================================================================
+dlr_common.RegisterSignature('Concat2d'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # output
+                                             ,ctypes.POINTER(_ctype) # input
+                                             ,ctypes.POINTER(_ctype) # input
+                                             ,ctypes.c_ushort  # in_rowsA
+                                             ,ctypes.c_ushort  # in_colsA
+                                             ,ctypes.c_ushort  # in_rowsB
+                                             ,ctypes.c_ushort  # in_colsB
+                                             ,ctypes.c_ubyte   # dim
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int     # verbose
+                                             ])
+
 def Concat2d( out_data    #
             , in_dataA    # in_rowsA x in_colsA
             , in_dataB    # in_rowsB x in_colsB
@@ -106,34 +119,10 @@ def Concat2d( out_data    #
        if (error!=0):
            dlr_common.DlrError("parameter mis-match");
            return False
-    #_fname=''
-    #_ctype=''
-    if out_data.dtype.type == np.int32:
-        _fname = 'Concat2dInt'
-        _ctype = ctypes.c_int
-    elif out_data.dtype.type == np.float32:
-        _fname = 'Concat2dFloat'
-        _ctype = ctypes.c_float
-    elif out_data.dtype.type == np.float64:
-        _fname = 'Concat2dDouble'
-        _ctype = ctypes.c_double
-    else:
+    _Concat2d, _ctype = dlr_common.GetFunction('Concat2d', out_data.dtype)
+    if _Concat2d is None:
         dlr_common.DlrError("not support "+str(out_data.dtype.type))
         return False
-    _Concat2d=dlr_common.WrapFunction(dlr_common._dlr
-                              ,_fname
-                              , None          # return type
-                              ,[ctypes.POINTER(_ctype) # output
-                               ,ctypes.POINTER(_ctype) # input
-                               ,ctypes.POINTER(_ctype) # input
-                               ,ctypes.c_ushort  # in_rowsA
-                               ,ctypes.c_ushort  # in_colsA
-                               ,ctypes.c_ushort  # in_rowsB
-                               ,ctypes.c_ushort  # in_colsB
-                               ,ctypes.c_ubyte   # dim
-                               ,ctypes.c_int     # rigor
-                               ,ctypes.c_int     # verbose
-                               ]) 
     CP_out_data    = out_data.ctypes.data_as(ctypes.POINTER(_ctype))
     CP_in_dataA    = in_dataA.ctypes.data_as(ctypes.POINTER(_ctype))
     CP_in_dataB    = in_dataB.ctypes.data_as(ctypes.POINTER(_ctype))
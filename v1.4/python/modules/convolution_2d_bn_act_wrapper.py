@@ -0,0 +1,313 @@
+#!/usr/bin/env python
+"""
+This file contains Python interface of convolution_2d_bn_act.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+#-------------------------------------------------------------------------------
+__author__     = "Ando Ki"
+__copyright__  = "Copyright 2020, Future Design Systems"
+__credits__    = ["none", "some"]
+__license__    = "FUTURE DESIGN SYSTEMS SOFTWARE END-USER LICENSE AGREEMENT"
+__version__    = "0"
+__revision__   = "1"
+__maintainer__ = "Ando Ki"
+__email__      = "contact@future-ds.com"
+__status__     = "Development"
+__date__       = "2026.10.18"
+__description__= "Python interface of convolution_2d_bn_act"
+
+#-------------------------------------------------------------------------------
+import ctypes
+import ctypes.util
+import numpy as np
+from python.modules import dlr_common
+
+#===============================================================================
+dlr_common.RegisterSignature('Convolution2dBnFold'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # folded kernels
+                                             ,ctypes.POINTER(_ctype) # folded bias
+                                             ,ctypes.POINTER(_ctype) # kernels
+                                             ,ctypes.POINTER(_ctype) # bias
+                                             ,ctypes.POINTER(_ctype) # running_mean
+                                             ,ctypes.POINTER(_ctype) # running_var
+                                             ,ctypes.POINTER(_ctype) # scale
+                                             ,ctypes.POINTER(_ctype) # shift
+                                             ,ctypes.c_ubyte   # kernel_size (only for square filter)
+                                             ,ctypes.c_ushort  # bias_size
+                                             ,ctypes.c_ushort  # scale_size
+                                             ,ctypes.c_ushort  # shift_size
+                                             ,ctypes.c_ushort  # in_channel
+                                             ,ctypes.c_ushort  # out_channel
+                                             ,ctypes.c_float   # epsilon
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ])  # verbose
+
+def FoldConvolution2dBn( kernel       # out_channel x in_channel x kernel_size x kernel_size
+                       , bias         # None or out_channel
+                       , running_mean # out_channel
+                       , running_var  # out_channel
+                       , scale=None   # None or out_channel (gamma)
+                       , shift=None   # None or out_channel (beta)
+                       , epsilon=1E-5
+                       , rigor=False
+                       , verbose=False):
+    """
+    Returns (kernel_folded, bias_folded) on success, otherwize returns (None, None)
+    Folds batch normalization following convolution into kernel and bias,
+    which should be done once when the model is loaded.
+    :param kernel: kernel (or filter), kernel[out_channel][in_channel][kernel_size][kernel_size]
+    :param bias: None or bias for each filter (kernel), bias[out_channel]
+    :param running_mean: running_mean[out_channel]
+    :param running_var: running_var[out_channel]
+    :param scale: None or scale[out_channel] (gamma, i.e., weight of batch normalization)
+    :param shift: None or shift[out_channel] (beta, i.e., bias of batch normalization)
+    :param epsilon: noise for regularization
+    :param rigor: check values rigorously when 'True'
+    :param verbose: output message more when 'True'
+    :return: (kernel_folded, bias_folded) of NumPy on success, (None, None) on failure.
+    """
+    if rigor or dlr_common.rigor:
+       error =0
+       if (kernel.ndim!=4):
+           error += 1
+           if verbose: dlr_common.DlrError("kernel is not 4 dim", flush=True)
+       for name, value in [('bias',bias), ('running_mean',running_mean), ('running_var',running_var)
+                          ,('scale',scale), ('shift',shift)]:
+           if (value is not None) and (value.shape!=(kernel.shape[0],)):
+               error += 1
+               if verbose: dlr_common.DlrError(f"{name} should be out_channel: {value.shape}", flush=True)
+       if (error!=0):
+           dlr_common.DlrError(" parameter mis-match", flush=True)
+           return None, None
+    _Fold, _ctype = dlr_common.GetFunction('Convolution2dBnFold', kernel.dtype)
+    if _Fold is None:
+        dlr_common.DlrError(" not support "+str(kernel.dtype.type), flush=True)
+        return None, None
+    def _Pointer(value):
+        if value is None: return ctypes.POINTER(_ctype)(), ctypes.c_ushort(0)
+        return value.ctypes.data_as(ctypes.POINTER(_ctype)), ctypes.c_ushort(value.shape[0])
+    t_kernel      = np.ascontiguousarray(kernel)
+    kernel_folded = np.empty(kernel.shape, dtype=kernel.dtype)
+    bias_folded   = np.empty([kernel.shape[0]], dtype=kernel.dtype)
+    CP_bias,  CP_bias_size  = _Pointer(bias)
+    CP_scale, CP_scale_size = _Pointer(scale)
+    CP_shift, CP_shift_size = _Pointer(shift)
+    _Fold(kernel_folded.ctypes.data_as(ctypes.POINTER(_ctype))
+         ,bias_folded.ctypes.data_as(ctypes.POINTER(_ctype))
+         ,t_kernel.ctypes.data_as(ctypes.POINTER(_ctype))
+         ,CP_bias
+         ,running_mean.ctypes.data_as(ctypes.POINTER(_ctype))
+         ,running_var.ctypes.data_as(ctypes.POINTER(_ctype))
+         ,CP_scale
+         ,CP_shift
+         ,ctypes.c_ubyte (kernel.shape[3]) # kernel_size
+         ,CP_bias_size
+         ,CP_scale_size
+         ,CP_shift_size
+         ,ctypes.c_ushort(kernel.shape[1]) # in_channel
+         ,ctypes.c_ushort(kernel.shape[0]) # out_channel
+         ,ctypes.c_float (epsilon)
+         ,1 if rigor else 0
+         ,1 if verbose else 0)
+    return kernel_folded, bias_folded
+
+#===============================================================================
+# activation: None, 'ReLu' or 'LeakyReLu'
+_activations = { None: '', 'ReLu': 'ReLu', 'LeakyReLu': 'LeakyReLu' }
+
+dlr_common.RegisterSignature('Convolution2dBnAct'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # output features
+                                             ,ctypes.POINTER(_ctype) # input image
+                                             ,ctypes.POINTER(_ctype) # folded kernels
+                                             ,ctypes.POINTER(_ctype) # folded bias
+                                             ,ctypes.c_ushort  # out_size
+                                             ,ctypes.c_ushort  # in_size
+                                             ,ctypes.c_ubyte   # kernel_size (only for square filter)
+                                             ,ctypes.c_ushort  # in_channel
+                                             ,ctypes.c_ushort  # out_channel
+                                             ,ctypes.c_ubyte   # stride
+                                             ,ctypes.c_ubyte   # padding
+                                             ,ctypes.c_float   # negative_slope
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ])  # verbose
+
+def Convolution2dBnAct( out_data      # out_channel x out_size x out_size
+                      , in_data       # in_channel x in_size x in_size
+                      , kernel        # out_channel x in_channel x kernel_size x kernel_size (folded)
+                      , bias          # out_channel (folded)
+                      , stride=1
+                      , padding=0
+                      , activation=None
+                      , negative_slope=0.1
+                      , rigor=False
+                      , verbose=False):
+    """
+    Returns True on success, otherwize returns False
+    Applies a 2D convolution fused with batch normalization and activation,
+    where kernel and bias are folded by FoldConvolution2dBn().
+    :param out_data: <mutable> output data, out_data[out_channel][out_size][out_size]
+    :param in_data: input data, in_data[in_channel][in_size][in_size]
+    :param kernel: folded kernel, kernel[out_channel][in_channel][kernel_size][kernel_size]
+    :param bias: folded bias, bias[out_channel]
+    :param stride: num of skips to apply next filter
+    :param padding: num of pixes at the boundary
+    :param activation: None, 'ReLu' or 'LeakyReLu'
+    :param negative_slope: slope of 'LeakyReLu'
+    :param rigor: check values rigorously when 'True'
+    :param verbose: output message more when 'True'
+    :return: 'True' on success, 'False' on failure.
+    """
+    return _Convolution2dBnAct('Convolution2dBnAct', out_data, in_data, kernel, bias
+                              , stride, padding, activation, negative_slope, rigor, verbose)
+
+dlr_common.RegisterSignature('Convolution2dBnActBatch'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # output features
+                                             ,ctypes.POINTER(_ctype) # input image
+                                             ,ctypes.POINTER(_ctype) # folded kernels
+                                             ,ctypes.POINTER(_ctype) # folded bias
+                                             ,ctypes.c_ushort  # out_size
+                                             ,ctypes.c_ushort  # in_size
+                                             ,ctypes.c_ubyte   # kernel_size (only for square filter)
+                                             ,ctypes.c_ushort  # in_channel
+                                             ,ctypes.c_ushort  # out_channel
+                                             ,ctypes.c_ushort  # minibatch
+                                             ,ctypes.c_ubyte   # stride
+                                             ,ctypes.c_ubyte   # padding
+                                             ,ctypes.c_float   # negative_slope
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ])  # verbose
+
+def Convolution2dBnActBatch( out_data      # minibatch x out_channel x out_size x out_size
+                           , in_data       # minibatch x in_channel x in_size x in_size
+                           , kernel        # out_channel x in_channel x kernel_size x kernel_size (folded)
+                           , bias          # out_channel (folded)
+                           , stride=1
+                           , padding=0
+                           , activation=None
+                           , negative_slope=0.1
+                           , rigor=False
+                           , verbose=False):
+    """
+    Returns True on success, otherwize returns False
+    Applies Convolution2dBnAct() over a minibatch by a single call of the C routine.
+    :param out_data: <mutable> output data, out_data[minibatch][out_channel][out_size][out_size]
+    :param in_data: input data, in_data[minibatch][in_channel][in_size][in_size]
+    :param kernel: folded kernel, kernel[out_channel][in_channel][kernel_size][kernel_size]
+    :param bias: folded bias, bias[out_channel]
+    :param stride: num of skips to apply next filter
+    :param padding: num of pixes at the boundary
+    :param activation: None, 'ReLu' or 'LeakyReLu'
+    :param negative_slope: slope of 'LeakyReLu'
+    :param rigor: check values rigorously when 'True'
+    :param verbose: output message more when 'True'
+    :return: 'True' on success, 'False' on failure.
+    """
+    return _Convolution2dBnAct('Convolution2dBnActBatch', out_data, in_data, kernel, bias
+                              , stride, padding, activation, negative_slope, rigor, verbose)
+
+def _Convolution2dBnAct( op # 'Convolution2dBnAct' or 'Convolution2dBnActBatch'
+                       , out_data
+                       , in_data
+                       , kernel
+                       , bias
+                       , stride
+                       , padding
+                       , activation
+                       , negative_slope
+                       , rigor
+                       , verbose):
+    t_ndim = 4 if op=='Convolution2dBnActBatch' else 3
+    if rigor or dlr_common.rigor:
+       error =0
+       if (out_data.ndim!=t_ndim) or (in_data.ndim!=t_ndim):
+           error += 1
+           if verbose: dlr_common.DlrError(f"out_data and in_data should be {t_ndim} dim", flush=True)
+       if (kernel.ndim!=4):
+           error += 1
+           if verbose: dlr_common.DlrError("kernel is not 4 dim", flush=True)
+       if (bias.shape!=(kernel.shape[0],)):
+           error += 1
+           if verbose: dlr_common.DlrError(f"bias should be out_channel: {bias.shape}", flush=True)
+       if (out_data.shape[-1]!=((in_data.shape[-1]-kernel.shape[3]+2*padding)//stride)+1):
+           error += 1
+           if verbose: dlr_common.DlrError("out_size mis-match", flush=True)
+       if (error!=0):
+           dlr_common.DlrError(" parameter mis-match", flush=True)
+           return False
+    if activation not in _activations:
+        dlr_common.DlrError(f" not supported activation: {activation}", flush=True)
+        return False
+    _Conv2d, _ctype = dlr_common.GetFunction(op, out_data.dtype, _activations[activation])
+    if _Conv2d is None:
+        dlr_common.DlrError(" not support "+str(out_data.dtype.type), flush=True)
+        return False
+    CP_args = [ out_data.ctypes.data_as(ctypes.POINTER(_ctype))
+              , in_data.ctypes.data_as(ctypes.POINTER(_ctype))
+              , kernel.ctypes.data_as(ctypes.POINTER(_ctype))
+              , bias.ctypes.data_as(ctypes.POINTER(_ctype))
+              , ctypes.c_ushort(out_data.shape[-1]) # out_size
+              , ctypes.c_ushort(in_data.shape[-1]) # in_size
+              , ctypes.c_ubyte (kernel.shape[3]) # kernel_size
+              , ctypes.c_ushort(kernel.shape[1]) # in_channel
+              , ctypes.c_ushort(kernel.shape[0]) ] # out_channel
+    if t_ndim==4: CP_args.append(ctypes.c_ushort(in_data.shape[0])) # minibatch
+    CP_args += [ ctypes.c_ubyte (stride)
+               , ctypes.c_ubyte (padding)
+               , ctypes.c_float (negative_slope)
+               , 1 if rigor else 0
+               , 1 if verbose else 0 ]
+    _Conv2d(*CP_args)
+    return True
+
+#===============================================================================
+if __name__=='__main__':
+    from python.modules.convolution_2d_wrapper import Convolution2dBatch
+
+    def TestConvolution2dBnAct(_dtype):
+        """
+        _dtype: specify data type of data one of {np.float32, np.float64}
+        """
+        rng = np.random.default_rng(0)
+        minibatch, in_channel, in_size, out_channel, kernel_size = 2, 3, 13, 8, 3
+        in_data      = rng.uniform(-1, 1, [minibatch,in_channel,in_size,in_size]).astype(_dtype)
+        kernel       = rng.uniform(-1, 1, [out_channel,in_channel,kernel_size,kernel_size]).astype(_dtype)
+        bias         = rng.uniform(-1, 1, [out_channel]).astype(_dtype)
+        running_mean = rng.uniform(-1, 1, [out_channel]).astype(_dtype)
+        running_var  = rng.uniform( 0, 2, [out_channel]).astype(_dtype)
+        scale        = rng.uniform(-1, 1, [out_channel]).astype(_dtype)
+        shift        = rng.uniform(-1, 1, [out_channel]).astype(_dtype)
+        epsilon      = 1E-5
+        kernel_folded, bias_folded = FoldConvolution2dBn( kernel, bias, running_mean, running_var
+                                                        , scale, shift, epsilon)
+        for stride, padding in [(1,1), (2,0)]:
+            out_size = ((in_size-kernel_size+2*padding)//stride)+1
+            out_conv = np.empty([minibatch,out_channel,out_size,out_size], dtype=_dtype)
+            Convolution2dBatch(out_conv, in_data, kernel, bias, stride, padding, algorithm='reference')
+            out_norm = ((out_conv-running_mean[:,None,None])/np.sqrt(running_var[:,None,None]+epsilon))\
+                      *scale[:,None,None]+shift[:,None,None]
+            for activation in [None, 'ReLu', 'LeakyReLu']:
+                if activation=='ReLu': out_ref = np.maximum(out_norm, 0)
+                elif activation=='LeakyReLu': out_ref = np.where(out_norm<0, out_norm*0.1, out_norm)
+                else: out_ref = out_norm
+                out_data = np.empty([minibatch,out_channel,out_size,out_size], dtype=_dtype)
+                Convolution2dBnActBatch( out_data, in_data, kernel_folded, bias_folded
+                                       , stride, padding, activation, 0.1)
+                diff = np.max(np.abs(out_data-out_ref))
+                dlr_common.DlrPrint(f"{np.dtype(_dtype)} stride={stride} padding={padding} {activation}"
+                                    f" max abs err={diff:.3e} {'OK' if diff<1E-4 else 'mis-match'}", flush=True)
+
+#===============================================================================
+if __name__=='__main__':
+    dlr_common.DlrPrint("Testing Convolution2dBnAct", flush=True)
+    dlr_common.DlrPrint("**************************", flush=True)
+    TestConvolution2dBnAct(_dtype=np.float32)
+    TestConvolution2dBnAct(_dtype=np.float64)
+
+#===============================================================================
+# Revision history:
+#
+# 2026.10.18: Started.
+#===============================================================================
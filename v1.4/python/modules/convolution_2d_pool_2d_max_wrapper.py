@@ -0,0 +1,338 @@
+#!/usr/bin/env python
+"""
+This file contains Python interface of convolution_2d_pool_2d_max.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+#-------------------------------------------------------------------------------
+__author__     = "Ando Ki"
+__copyright__  = "Copyright 2020, Future Design Systems"
+__credits__    = ["none", "some"]
+__license__    = "FUTURE DESIGN SYSTEMS SOFTWARE END-USER LICENSE AGREEMENT"
+__version__    = "0"
+__revision__   = "1"
+__maintainer__ = "Ando Ki"
+__email__      = "contact@future-ds.com"
+__status__     = "Development"
+__date__       = "2026.10.18"
+__description__= "Python interface of convolution_2d_pool_2d_max"
+
+#-------------------------------------------------------------------------------
+import ctypes
+import ctypes.util
+import numpy as np
+import math
+from python.modules import dlr_common
+
+#===============================================================================
+def GetOutputSizeOfConvolution2dPool2dMax( in_size
+                                         , kernel_size
+                                         , stride
+                                         , padding
+                                         , pool_size=2
+                                         , pool_stride=2
+                                         , ceil_mode=False
+                                         , rigor=False
+                                         , verbose=False):
+    """
+    Returns status and the size of pooled output tensor
+    :param in_size:
+    :param kernel_size: kernel_size of convolution
+    :param stride: stride of convolution
+    :param padding: padding of convolution
+    :param pool_size: kernel_size of pooling
+    :param pool_stride: stride of pooling
+    :param ceil_mode: use floor when false, otherwize ceil when true
+    :return: the size of pooled output tensor
+    """
+    err = 0
+    conv_size = ((in_size-kernel_size+2*padding)//stride)+1
+    if rigor:
+       if (kernel_size<1) or (stride<1) or (padding<0) or (padding>(kernel_size//2)):
+           err+=1
+           if verbose: dlr_common.DlrError(f"convolution mis-match: {kernel_size} {stride} {padding}", flush=True)
+       if (pool_size<1) or (pool_stride<1) or (conv_size<pool_size):
+           err+=1
+           if verbose: dlr_common.DlrError(f"pooling mis-match: {conv_size} {pool_size} {pool_stride}", flush=True)
+    if ceil_mode: out_size = math.ceil((conv_size-pool_size)/pool_stride)+1
+    else:         out_size = ((conv_size-pool_size)//pool_stride)+1
+    if ceil_mode and ((out_size-1)*pool_stride>=conv_size):
+        out_size -= 1 # the last window should start in convolution output as PyTorch
+    if err>0: return False, out_size
+    else:     return True, out_size
+
+#===============================================================================
+# activation: None, 'ReLu' or 'LeakyReLu'
+_activations = { None: '', 'ReLu': 'ReLu', 'LeakyReLu': 'LeakyReLu' }
+
+# Convolution2dPool2dMax[Batch]<Int|Float|Double|Half|BFloat16>[ReLu|LeakyReLu] (software-only)
+dlr_common.RegisterSignature('Convolution2dPool2dMax'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # output features (pooled)
+                                             ,ctypes.POINTER(_ctype) # input image
+                                             ,ctypes.POINTER(_ctype) # kernels
+                                             ,ctypes.POINTER(_ctype) # bias
+                                             ,ctypes.c_ushort  # out_size (pooled)
+                                             ,ctypes.c_ushort  # in_size
+                                             ,ctypes.c_ubyte   # kernel_size (only for square filter)
+                                             ,ctypes.c_ushort  # bias_size
+                                             ,ctypes.c_ushort  # in_channel
+                                             ,ctypes.c_ushort  # out_channel
+                                             ,ctypes.c_ubyte   # stride
+                                             ,ctypes.c_ubyte   # padding
+                                             ,ctypes.c_ubyte   # pool_size
+                                             ,ctypes.c_ubyte   # pool_stride
+                                             ,ctypes.c_int     # ceil_mode
+                                             ,ctypes.c_float   # negative_slope
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ])  # verbose
+
+dlr_common.RegisterSignature('Convolution2dPool2dMaxBatch'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # output features (pooled)
+                                             ,ctypes.POINTER(_ctype) # input image
+                                             ,ctypes.POINTER(_ctype) # kernels
+                                             ,ctypes.POINTER(_ctype) # bias
+                                             ,ctypes.c_ushort  # out_size (pooled)
+                                             ,ctypes.c_ushort  # in_size
+                                             ,ctypes.c_ubyte   # kernel_size (only for square filter)
+                                             ,ctypes.c_ushort  # bias_size
+                                             ,ctypes.c_ushort  # in_channel
+                                             ,ctypes.c_ushort  # out_channel
+                                             ,ctypes.c_ushort  # minibatch
+                                             ,ctypes.c_ubyte   # stride
+                                             ,ctypes.c_ubyte   # padding
+                                             ,ctypes.c_ubyte   # pool_size
+                                             ,ctypes.c_ubyte   # pool_stride
+                                             ,ctypes.c_int     # ceil_mode
+                                             ,ctypes.c_float   # negative_slope
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ])  # verbose
+
+def Convolution2dPool2dMax( out_data      # out_channel x out_size x out_size (pooled)
+                          , in_data       # in_channel x in_size x in_size
+                          , kernel        # out_channel x in_channel x kernel_size x kernel_size
+                          , bias=None     # out_channel
+                          , stride=1
+                          , padding=0
+                          , pool_size=2
+                          , pool_stride=2
+                          , ceil_mode=False
+                          , activation=None
+                          , negative_slope=0.1
+                          , rigor=False
+                          , verbose=False):
+    """
+    Returns True on success, otherwize returns False
+    Applies a 2D convolution, activation and 2D max-pooling of no padding,
+    where only pooled outputs are written.
+    :param out_data: <mutable> output data, out_data[out_channel][out_size][out_size]
+    :param in_data: input data, in_data[in_channel][in_size][in_size]
+    :param kernel: kernel[out_channel][in_channel][kernel_size][kernel_size]
+    :param bias: None or bias[out_channel]
+    :param stride: num of skips to apply next filter
+    :param padding: num of pixes at the boundary
+    :param pool_size: kernel_size of pooling
+    :param pool_stride: stride of pooling
+    :param ceil_mode: use floor() when false, otherwize ceil() for pooling
+    :param activation: None, 'ReLu' or 'LeakyReLu'
+    :param negative_slope: slope of 'LeakyReLu', applied before pooling when negative
+    :param rigor: check values rigorously when 'True'
+    :param verbose: output message more when 'True'
+    :return: 'True' on success, 'False' on failure.
+    """
+    return _Convolution2dPool2dMax('Convolution2dPool2dMax', out_data, in_data, kernel, bias
+                                  , stride, padding, pool_size, pool_stride, ceil_mode
+                                  , activation, negative_slope, rigor, verbose)
+
+def Convolution2dPool2dMaxBatch( out_data      # minibatch x out_channel x out_size x out_size (pooled)
+                               , in_data       # minibatch x in_channel x in_size x in_size
+                               , kernel        # out_channel x in_channel x kernel_size x kernel_size
+                               , bias=None     # out_channel
+                               , stride=1
+                               , padding=0
+                               , pool_size=2
+                               , pool_stride=2
+                               , ceil_mode=False
+                               , activation=None
+                               , negative_slope=0.1
+                               , rigor=False
+                               , verbose=False):
+    """
+    Returns True on success, otherwize returns False
+    Applies Convolution2dPool2dMax() over a minibatch by a single call of the C routine.
+    :param out_data: <mutable> output data, out_data[minibatch][out_channel][out_size][out_size]
+    :param in_data: input data, in_data[minibatch][in_channel][in_size][in_size]
+    """
+    return _Convolution2dPool2dMax('Convolution2dPool2dMaxBatch', out_data, in_data, kernel, bias
+                                  , stride, padding, pool_size, pool_stride, ceil_mode
+                                  , activation, negative_slope, rigor, verbose)
+
+def _Convolution2dPool2dMax( op # 'Convolution2dPool2dMax' or 'Convolution2dPool2dMaxBatch'
+                           , out_data
+                           , in_data
+                           , kernel
+                           , bias
+                           , stride
+                           , padding
+                           , pool_size
+                           , pool_stride
+                           , ceil_mode
+                           , activation
+                           , negative_slope
+                           , rigor
+                           , verbose):
+    t_ndim = 4 if op=='Convolution2dPool2dMaxBatch' else 3
+    if rigor or dlr_common.rigor:
+       error =0
+       if (out_data.ndim!=t_ndim) or (in_data.ndim!=t_ndim):
+           error += 1
+           if verbose: dlr_common.DlrError(f"out_data and in_data should be {t_ndim} dim", flush=True)
+       if (kernel.ndim!=4):
+           error += 1
+           if verbose: dlr_common.DlrError("kernel is not 4 dim", flush=True)
+       if (bias is not None) and (bias.shape!=(kernel.shape[0],)):
+           error += 1
+           if verbose: dlr_common.DlrError(f"bias should be out_channel: {bias.shape}", flush=True)
+       status, t_out_size = GetOutputSizeOfConvolution2dPool2dMax( in_data.shape[-1], kernel.shape[3]
+                                                                 , stride, padding, pool_size, pool_stride
+                                                                 , ceil_mode, rigor=True, verbose=verbose)
+       if (not status) or (out_data.shape[-1]!=t_out_size):
+           error += 1
+           if verbose: dlr_common.DlrError(f"out_size mis-match {out_data.shape[-1]} {t_out_size}", flush=True)
+       if (error!=0):
+           dlr_common.DlrError(" parameter mis-match", flush=True)
+           return False
+    if activation not in _activations:
+        dlr_common.DlrError(f" not supported activation: {activation}", flush=True)
+        return False
+    _Conv2d, _ctype = dlr_common.GetFunction(op, out_data.dtype, _activations[activation])
+    if _Conv2d is None:
+        dlr_common.DlrError(" not support "+str(out_data.dtype.type), flush=True)
+        return False
+    CP_args = [ out_data.ctypes.data_as(ctypes.POINTER(_ctype))
+              , in_data.ctypes.data_as(ctypes.POINTER(_ctype))
+              , kernel.ctypes.data_as(ctypes.POINTER(_ctype))
+              , None if bias is None else bias.ctypes.data_as(ctypes.POINTER(_ctype))
+              , ctypes.c_ushort(out_data.shape[-1]) # out_size
+              , ctypes.c_ushort(in_data.shape[-1]) # in_size
+              , ctypes.c_ubyte (kernel.shape[3]) # kernel_size
+              , ctypes.c_ushort(0 if bias is None else bias.shape[0]) # bias_size
+              , ctypes.c_ushort(kernel.shape[1]) # in_channel
+              , ctypes.c_ushort(kernel.shape[0]) ] # out_channel
+    if t_ndim==4: CP_args.append(ctypes.c_ushort(in_data.shape[0])) # minibatch
+    CP_args += [ ctypes.c_ubyte (stride)
+               , ctypes.c_ubyte (padding)
+               , ctypes.c_ubyte (pool_size)
+               , ctypes.c_ubyte (pool_stride)
+               , 1 if ceil_mode else 0
+               , ctypes.c_float (negative_slope)
+               , 1 if rigor else 0
+               , 1 if verbose else 0 ]
+    _Conv2d(*CP_args)
+    return True
+
+#===============================================================================
+if __name__=='__main__':
+    from python.modules.convolution_2d_wrapper import Convolution2dBatch
+
+    def TestConvolution2dPool2dMax(_dtype):
+        """
+        Compares Convolution2dPool2dMaxBatch against Convolution2dBatch, activation and
+        max of each window by NumPy
+        """
+        rng = np.random.default_rng(0)
+        # in_size, in_channel, out_channel, kernel_size, stride, padding, pool_size, pool_stride, ceil_mode
+        configs = [ (32, 1, 6, 5, 1, 0, 2, 2, False) # LeNet-5
+                  , (26, 4, 8, 3, 1, 1, 2, 2, False) # Tiny YOLO-V2
+                  , (13, 4, 8, 3, 1, 1, 2, 1, False)
+                  , (15, 3, 5, 3, 2, 1, 3, 2, True) ]
+        minibatch = 2
+        for in_size, in_channel, out_channel, kernel_size, stride, padding, pool_size, pool_stride, ceil_mode in configs:
+            in_data  = rng.integers(-8, 8, [minibatch,in_channel,in_size,in_size]).astype(_dtype)
+            kernel   = rng.integers(-4, 4, [out_channel,in_channel,kernel_size,kernel_size]).astype(_dtype)
+            bias     = rng.integers(-4, 4, [out_channel]).astype(_dtype)
+            conv_size = ((in_size-kernel_size+2*padding)//stride)+1
+            out_conv = np.empty([minibatch,out_channel,conv_size,conv_size], dtype=_dtype)
+            Convolution2dBatch(out_conv, in_data, kernel, bias, stride, padding, algorithm='reference')
+            status, out_size = GetOutputSizeOfConvolution2dPool2dMax( in_size, kernel_size, stride, padding
+                                                                    , pool_size, pool_stride, ceil_mode)
+            for activation, negative_slope in [(None, 0.125), ('ReLu', 0.125), ('LeakyReLu', 0.125), ('LeakyReLu', -0.5)]:
+                if activation=='ReLu': out_act = np.maximum(out_conv.astype(np.float64), 0)
+                elif activation=='LeakyReLu': out_act = np.where(out_conv<0, out_conv*negative_slope, out_conv)
+                else: out_act = out_conv.astype(np.float64)
+                if np.issubdtype(_dtype, np.integer): out_act = np.trunc(out_act)
+                out_ref = np.empty([minibatch,out_channel,out_size,out_size], dtype=np.float64)
+                for g in range(out_size):
+                    for k in range(out_size):
+                        window = out_act[:,:,g*pool_stride:g*pool_stride+pool_size,k*pool_stride:k*pool_stride+pool_size]
+                        out_ref[:,:,g,k] = np.max(window, axis=(2,3))
+                out_data = np.empty([minibatch,out_channel,out_size,out_size], dtype=_dtype)
+                status = Convolution2dPool2dMaxBatch( out_data, in_data, kernel, bias, stride, padding
+                                                    , pool_size, pool_stride, ceil_mode
+                                                    , activation, negative_slope, rigor=True)
+                diff = np.max(np.abs(out_data-out_ref))
+                ok = status and (diff<1E-4)
+                dlr_common.DlrPrint(f"{np.dtype(_dtype).name:8} {[in_size, kernel_size, stride, padding]}"
+                                    f" pool {[pool_size, pool_stride]} ceil_mode={ceil_mode!s:5} {activation!s:9} {negative_slope:6}"
+                                    f" max abs diff {diff:.3e} "+("OK" if ok else "mis-match"), flush=True)
+
+    def TestConvolution2dPool2dMaxFixed():
+        """
+        Compares Convolution2dPool2dMaxBatch of fixed-point data against Convolution2dBatch
+        of fixed-point data, activation and max of each window by NumPy,
+        where the activation may differ by an LSB of the rounded product.
+        """
+        rng = np.random.default_rng(0)
+        saved = dlr_common.get_fixed_format()
+        dlr_common.set_fixed_format(16, 8, 'TRN', 'SAT')
+        lsb = 2.0**-8
+        # in_size, in_channel, out_channel, kernel_size, stride, padding, pool_size, pool_stride, ceil_mode
+        configs = [ (32, 1, 6, 5, 1, 0, 2, 2, False)
+                  , (15, 3, 5, 3, 2, 1, 3, 2, True) ]
+        minibatch = 2
+        for in_size, in_channel, out_channel, kernel_size, stride, padding, pool_size, pool_stride, ceil_mode in configs:
+            in_data  = dlr_common.ToFixed(rng.uniform(-1.0, 1.0, [minibatch,in_channel,in_size,in_size]))
+            kernel   = dlr_common.ToFixed(rng.uniform(-0.5, 0.5, [out_channel,in_channel,kernel_size,kernel_size]))
+            bias     = dlr_common.ToFixed(rng.uniform(-0.5, 0.5, [out_channel]))
+            conv_size = ((in_size-kernel_size+2*padding)//stride)+1
+            out_conv = np.empty([minibatch,out_channel,conv_size,conv_size], dtype=dlr_common.fixed)
+            Convolution2dBatch(out_conv, in_data, kernel, bias, stride, padding, algorithm='reference')
+            out_conv = dlr_common.FromFixed(out_conv, np.float64)
+            status, out_size = GetOutputSizeOfConvolution2dPool2dMax( in_size, kernel_size, stride, padding
+                                                                    , pool_size, pool_stride, ceil_mode)
+            for activation, negative_slope in [(None, 0.125), ('ReLu', 0.125), ('LeakyReLu', 0.125), ('LeakyReLu', -0.5)]:
+                if activation=='ReLu': out_act = np.maximum(out_conv, 0)
+                elif activation=='LeakyReLu': out_act = np.where(out_conv<0, out_conv*negative_slope, out_conv)
+                else: out_act = out_conv
+                out_ref = np.empty([minibatch,out_channel,out_size,out_size], dtype=np.float64)
+                for g in range(out_size):
+                    for k in range(out_size):
+                        window = out_act[:,:,g*pool_stride:g*pool_stride+pool_size,k*pool_stride:k*pool_stride+pool_size]
+                        out_ref[:,:,g,k] = np.max(window, axis=(2,3))
+                out_data = np.empty([minibatch,out_channel,out_size,out_size], dtype=dlr_common.fixed)
+                status = Convolution2dPool2dMaxBatch( out_data, in_data, kernel, bias, stride, padding
+                                                    , pool_size, pool_stride, ceil_mode
+                                                    , activation, negative_slope, rigor=True)
+                diff = np.max(np.abs(dlr_common.FromFixed(out_data, np.float64)-out_ref))
+                ok = status and (diff<=(lsb if activation=='LeakyReLu' else 0.0))
+                dlr_common.DlrPrint(f"fixed<16,8> {[in_size, kernel_size, stride, padding]}"
+                                    f" pool {[pool_size, pool_stride]} ceil_mode={ceil_mode!s:5} {activation!s:9} {negative_slope:6}"
+                                    f" max abs diff {diff:.3e} "+("OK" if ok else "mis-match"), flush=True)
+        dlr_common.set_fixed_format(*saved)
+
+#===============================================================================
+if __name__=='__main__':
+    dlr_common.DlrPrint("Testing Convolution2dPool2dMax", flush=True)
+    dlr_common.DlrPrint("******************************", flush=True)
+    for _dtype in [np.int32, np.float32, np.float64]:
+        TestConvolution2dPool2dMax(_dtype)
+    TestConvolution2dPool2dMaxFixed()
+
+#===============================================================================
+# Revision history:
+#
+# 2026.10.18: fixed-point data go '<Op>Fixed' routines
+# 2026.10.18: LeakyReLu of negative slope tested
+# 2026.10.18: Started.
+#===============================================================================
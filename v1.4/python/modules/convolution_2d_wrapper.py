@@ -22,6 +22,8 @@ __description__= "Python interface of convolution_2d"
 #-------------------------------------------------------------------------------
 import ctypes
 import ctypes.util
+import threading
+import collections
 import numpy as np
 from python.modules import dlr_common
 
@@ -63,6 +65,65 @@ def GetOutputSizeOfConvolution2d( in_size
     else:     return True, int(((in_size-kernel_size+2*padding)/stride)+1)
 
 #===============================================================================
+# algorithm of convolution
+# - 'auto'     : 'winograd' when IsConvolution2dWinograd(), otherwise 'reference'
+# - 'reference': Convolution2d<Int|Float|Double|Fixed|Half|BFloat16>, the same as HLS version
+# - 'fast'     : Convolution2d<Int|Float|Double>Fast, im2col and blocked GEMM (software-only)
+# - 'winograd' : Convolution2dWinograd<Float|Double>, Winograd F(2x2,3x3) (software-only)
+_algorithms = { 'auto'     : None
+              , 'reference': ''
+              , 'fast'     : 'Fast'
+              , 'winograd' : 'Winograd' }
+_algorithm  = 'auto' # default algorithm
+
+def SetConvolution2dAlgorithm(algorithm='auto'):
+    """
+    Selects default algorithm of Convolution2d() and Convolution2dBatch()
+    :param algorithm: one of 'auto', 'reference', 'fast' and 'winograd'
+    :return: 'True' on success, 'False' on failure.
+    """
+    global _algorithm
+    if algorithm not in _algorithms:
+        dlr_common.DlrError(f" not supported algorithm: {algorithm}", flush=True)
+        return False
+    _algorithm = algorithm
+    return True
+
+def GetConvolution2dAlgorithm(): return _algorithm
+
+def IsConvolution2dWinograd(kernel, stride, padding):
+    """
+    Returns True when Winograd F(2x2,3x3) can be used,
+    i.e., 3x3 kernel, stride 1, padding 0 or 1, and floating-point data.
+    """
+    return (kernel.shape[2]==3) and (kernel.shape[3]==3) and (stride==1)\
+           and (padding in (0, 1)) and (kernel.dtype.type in (np.float32, np.float64))
+
+def _GetAlgorithm(algorithm, kernel, stride, padding):
+    if algorithm is None: algorithm = _algorithm
+    if algorithm not in _algorithms: return None
+    if algorithm=='auto':
+        return 'winograd' if IsConvolution2dWinograd(kernel, stride, padding) else 'reference'
+    if (algorithm=='winograd') and not IsConvolution2dWinograd(kernel, stride, padding): return None
+    return algorithm
+
+#===============================================================================
+dlr_common.RegisterSignature('Convolution2d'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # output features
+                                             ,ctypes.POINTER(_ctype) # input image
+                                             ,ctypes.POINTER(_ctype) # kernels
+                                             ,ctypes.POINTER(_ctype)  # bias
+                                             ,ctypes.c_ushort  # out_size
+                                             ,ctypes.c_ushort  # in_size
+                                             ,ctypes.c_ubyte   # kernel_size (only for square filter)
+                                             ,ctypes.c_ushort  # bias_size
+                                             ,ctypes.c_ushort  # in_channel
+                                             ,ctypes.c_ushort  # out_channel
+                                             ,ctypes.c_ubyte   # stride
+                                             ,ctypes.c_ubyte   # padding
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ])  # verbose
+
 def Convolution2d( out_data    # out_channel x out_size x out_size
                  , in_data     # in_channel x in_size x in_size
                  , kernel      # out_channel x in_channel x kernel_size x kernel_size
@@ -70,7 +131,9 @@ def Convolution2d( out_data    # out_channel x out_size x out_size
                  , stride=1
                  , padding=0
                  , rigor=False
-                 , verbose=False):
+                 , verbose=False
+                 , algorithm=None
+                 , kernel_version=None):
     """
     Returns True on success, otherwize returns False
     Applies a 2D convolution over an input data composed of several input channels.
@@ -83,6 +146,9 @@ def Convolution2d( out_data    # out_channel x out_size x out_size
     :param padding: num of pixes at the boundary
     :param rigor: check values rigorously when 'True'
     :param verbose: output message more when 'True'
+    :param algorithm: None (default by SetConvolution2dAlgorithm()), 'auto', 'reference', 'fast' or 'winograd'
+    :param kernel_version: version of kernel for Winograd filter cache, e.g., 'weight._version' of PyTorch,
+                           content of kernel is compared when it is None (see GetConvolution2dWinogradFilter())
     :return: 'True' on success, 'False' on failure.
     Follwoings are derived from input arguments
     . out_size: array size of out_data
@@ -152,37 +218,17 @@ def Convolution2d( out_data    # out_channel x out_size x out_size
        if (error!=0):
            dlr_common.DlrError(" parameter mis-match", flush=True)
            return False
-    #_fname=''
-    #_ctype=''
-    if out_data.dtype.type == np.int32:
-        _fname = 'Convolution2dInt'
-        _ctype = ctypes.c_int
-    elif out_data.dtype.type == np.float32:
-        _fname = 'Convolution2dFloat'
-        _ctype = ctypes.c_float
-    elif out_data.dtype.type == np.float64:
-        _fname = 'Convolution2dDouble'
-        _ctype = ctypes.c_double
-    else:
+    _algorithm_ = _GetAlgorithm(algorithm, kernel, stride, padding)
+    if _algorithm_ is None:
+        dlr_common.DlrError(f" not supported algorithm: {algorithm}", flush=True)
+        return False
+    if _algorithm_=='winograd':
+        return _Convolution2dWinograd('Convolution2dWinograd', out_data, in_data, kernel, bias
+                                     , padding, kernel_version, rigor, verbose)
+    _Conv2d, _ctype = dlr_common.GetFunction('Convolution2d', out_data.dtype, _algorithms[_algorithm_])
+    if _Conv2d is None:
         dlr_common.DlrError(" not support "+str(out_data.dtype.type), flush=True)
         return False
-    _Conv2d=dlr_common.WrapFunction(dlr_common._dlr
-                            ,_fname
-                            , None          # return type
-                            ,[ctypes.POINTER(_ctype) # output features
-                             ,ctypes.POINTER(_ctype) # input image
-                             ,ctypes.POINTER(_ctype) # kernels
-                             ,ctypes.POINTER(_ctype)  # bias
-                             ,ctypes.c_ushort  # out_size
-                             ,ctypes.c_ushort  # in_size
-                             ,ctypes.c_ubyte   # kernel_size (only for square filter)
-                             ,ctypes.c_ushort  # bias_size
-                             ,ctypes.c_ushort  # in_channel
-                             ,ctypes.c_ushort  # out_channel
-                             ,ctypes.c_ubyte   # stride
-                             ,ctypes.c_ubyte   # padding
-                             ,ctypes.c_int     # rigor
-                             ,ctypes.c_int ])  # verbose
     CP_out_data    = out_data.ctypes.data_as(ctypes.POINTER(_ctype))
     CP_in_data     = in_data.ctypes.data_as(ctypes.POINTER(_ctype))
     CP_kernel      = kernel.ctypes.data_as(ctypes.POINTER(_ctype))
@@ -217,6 +263,477 @@ def Convolution2d( out_data    # out_channel x out_size x out_size
            ,CP_verbose)
     return True
 
+#===============================================================================
+dlr_common.RegisterSignature('Convolution2dBatch'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # output features
+                                             ,ctypes.POINTER(_ctype) # input image
+                                             ,ctypes.POINTER(_ctype) # kernels
+                                             ,ctypes.POINTER(_ctype)  # bias
+                                             ,ctypes.c_ushort  # out_size
+                                             ,ctypes.c_ushort  # in_size
+                                             ,ctypes.c_ubyte   # kernel_size (only for square filter)
+                                             ,ctypes.c_ushort  # bias_size
+                                             ,ctypes.c_ushort  # in_channel
+                                             ,ctypes.c_ushort  # out_channel
+                                             ,ctypes.c_ushort  # minibatch
+                                             ,ctypes.c_ubyte   # stride
+                                             ,ctypes.c_ubyte   # padding
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ])  # verbose
+
+def Convolution2dBatch( out_data    # minibatch x out_channel x out_size x out_size
+                      , in_data     # minibatch x in_channel x in_size x in_size
+                      , kernel      # out_channel x in_channel x kernel_size x kernel_size
+                      , bias=None   # out_channel
+                      , stride=1
+                      , padding=0
+                      , rigor=False
+                      , verbose=False
+                      , algorithm=None
+                      , kernel_version=None):
+    """
+    Returns True on success, otherwize returns False
+    Applies a 2D convolution over a minibatch of input data by a single call of the C routine.
+    Note that all nd-array lists are NumPy (mutable) and contiguous.
+    :param out_data: <mutable> output data, out_data[minibatch][out_channel][out_size][out_size]
+    :param in_data: input data, in_data[minibatch][in_channel][in_size][in_size]
+    :param kernel: kernel (or filter), kernel[out_channel][in_channel][kernel_size][kernel_size]
+    :param bias: bias for each filter (kernel), bias[out_channel]
+    :param stride: num of skips to apply next filter
+    :param padding: num of pixes at the boundary
+    :param rigor: check values rigorously when 'True'
+    :param verbose: output message more when 'True'
+    :param algorithm: None (default by SetConvolution2dAlgorithm()), 'auto', 'reference', 'fast' or 'winograd'
+    :param kernel_version: version of kernel for Winograd filter cache, e.g., 'weight._version' of PyTorch,
+                           content of kernel is compared when it is None (see GetConvolution2dWinogradFilter())
+    :return: 'True' on success, 'False' on failure.
+    """
+    if rigor or dlr_common.rigor:
+       error =0
+       if (out_data.ndim!=4):
+           error += 1
+           if verbose: dlr_common.DlrError("out_data is not 4 dim", flush=True)
+       if (in_data.ndim!=4):
+           error += 1
+           if verbose: dlr_common.DlrError("in_data is not 4 dim", flush=True)
+       if (out_data.shape[0]!=in_data.shape[0]):
+           error += 1
+           if verbose: dlr_common.DlrError("minibatch mis-match", flush=True)
+       if (error!=0):
+           dlr_common.DlrError(" parameter mis-match", flush=True)
+           return False
+    _algorithm_ = _GetAlgorithm(algorithm, kernel, stride, padding)
+    if _algorithm_ is None:
+        dlr_common.DlrError(f" not supported algorithm: {algorithm}", flush=True)
+        return False
+    if _algorithm_=='winograd':
+        return _Convolution2dWinograd('Convolution2dWinogradBatch', out_data, in_data, kernel, bias
+                                     , padding, kernel_version, rigor, verbose)
+    _Conv2d, _ctype = dlr_common.GetFunction('Convolution2dBatch', out_data.dtype, _algorithms[_algorithm_])
+    if _Conv2d is None:
+        dlr_common.DlrError(" not support "+str(out_data.dtype.type), flush=True)
+        return False
+    CP_out_data    = out_data.ctypes.data_as(ctypes.POINTER(_ctype))
+    CP_in_data     = in_data.ctypes.data_as(ctypes.POINTER(_ctype))
+    CP_kernel      = kernel.ctypes.data_as(ctypes.POINTER(_ctype))
+    CP_out_size    = ctypes.c_ushort(out_data.shape[3]) # note ndim (i.e., rank) is 4
+    CP_in_size     = ctypes.c_ushort(in_data.shape[3]) # note ndim (i.e., rank) is 4
+    CP_kernel_size = ctypes.c_ubyte (kernel.shape[3]) # note ndim (i.e., rank) is 4
+    CP_in_channel  = ctypes.c_ushort(in_data.shape[1])
+    CP_out_channel = ctypes.c_ushort(kernel.shape[0])
+    CP_minibatch   = ctypes.c_ushort(in_data.shape[0])
+    CP_stride      = ctypes.c_ubyte (stride)
+    CP_padding     = ctypes.c_ubyte (padding)
+    CP_rigor       = 1 if rigor else 0
+    CP_verbose     = 1 if verbose else 0
+    if (bias is None) or (bias.size == 0):
+       CP_bias        = ctypes.POINTER(_ctype)()
+       CP_bias_size   = ctypes.c_ushort(0)
+    else:
+       CP_bias        = bias.ctypes.data_as(ctypes.POINTER(_ctype))
+       CP_bias_size   = ctypes.c_ushort(bias.shape[0])
+    _Conv2d(CP_out_data
+           ,CP_in_data
+           ,CP_kernel
+           ,CP_bias
+           ,CP_out_size
+           ,CP_in_size
+           ,CP_kernel_size
+           ,CP_bias_size
+           ,CP_in_channel
+           ,CP_out_channel
+           ,CP_minibatch
+           ,CP_stride
+           ,CP_padding
+           ,CP_rigor
+           ,CP_verbose)
+    return True
+
+#===============================================================================
+# Winograd F(2x2,3x3): kernel transformed by Convolution2dWinogradFilter<Float|Double>
+# is kept in '_winograd_filters' so that repeated inferences skip the transform.
+# - key: (address, shape, dtype, version) of kernel
+# - kernel itself is also kept in order not to reuse its address for others
+# - content of kernel is compared when 'kernel_version' is not given
+# - a given 'kernel_version' is trusted without comparing, but PyTorch does not bump
+#   'weight._version' on writes through 'weight.data', so ClearConvolution2dWinogradFilter()
+#   should be called after them
+dlr_common.RegisterSignature('Convolution2dWinogradFilter'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # transformed kernel
+                                             ,ctypes.POINTER(_ctype) # kernels
+                                             ,ctypes.c_ushort  # in_channel
+                                             ,ctypes.c_ushort  # out_channel
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ])  # verbose
+dlr_common.RegisterSignature('Convolution2dWinograd'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # output features
+                                             ,ctypes.POINTER(_ctype) # input image
+                                             ,ctypes.POINTER(_ctype) # transformed kernel
+                                             ,ctypes.POINTER(_ctype) # bias
+                                             ,ctypes.c_ushort  # out_size
+                                             ,ctypes.c_ushort  # in_size
+                                             ,ctypes.c_ushort  # bias_size
+                                             ,ctypes.c_ushort  # in_channel
+                                             ,ctypes.c_ushort  # out_channel
+                                             ,ctypes.c_ubyte   # padding
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ])  # verbose
+dlr_common.RegisterSignature('Convolution2dWinogradBatch'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # output features
+                                             ,ctypes.POINTER(_ctype) # input image
+                                             ,ctypes.POINTER(_ctype) # transformed kernel
+                                             ,ctypes.POINTER(_ctype) # bias
+                                             ,ctypes.c_ushort  # out_size
+                                             ,ctypes.c_ushort  # in_size
+                                             ,ctypes.c_ushort  # bias_size
+                                             ,ctypes.c_ushort  # in_channel
+                                             ,ctypes.c_ushort  # out_channel
+                                             ,ctypes.c_ushort  # minibatch
+                                             ,ctypes.c_ubyte   # padding
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ])  # verbose
+
+_winograd_filters      = collections.OrderedDict()
+_winograd_filters_max  = 64 # max num of cached kernels
+_winograd_filters_lock = threading.Lock()
+
+def GetConvolution2dWinogradFilter( kernel # out_channel x in_channel x 3 x 3
+                                  , kernel_version=None
+                                  , rigor=False
+                                  , verbose=False):
+    """
+    Returns transformed kernel for Winograd F(2x2,3x3), filter[16][out_channel][in_channel]
+    It transforms the kernel only when it is not in the cache.
+    :param kernel: kernel (or filter), kernel[out_channel][in_channel][3][3]
+    :param kernel_version: version of kernel, e.g., 'weight._version' of PyTorch,
+                           content of kernel is compared when it is None.
+                           Writes through 'weight.data' do not change 'weight._version'.
+    :return: NumPy array on success, None on failure.
+    """
+    key = (kernel.ctypes.data, kernel.shape, kernel.dtype.str, kernel_version)
+    with _winograd_filters_lock:
+        entry = _winograd_filters.get(key)
+        if entry is not None:
+            if (kernel_version is not None) or np.array_equal(entry[0], kernel):
+                _winograd_filters.move_to_end(key)
+                return entry[1]
+        _Filter, _ctype = dlr_common.GetFunction('Convolution2dWinogradFilter', kernel.dtype)
+        if _Filter is None:
+            dlr_common.DlrError(" not support "+str(kernel.dtype.type), flush=True)
+            return None
+        t_kernel = np.ascontiguousarray(kernel)
+        t_filter = np.empty([16, kernel.shape[0], kernel.shape[1]], dtype=kernel.dtype)
+        _Filter(t_filter.ctypes.data_as(ctypes.POINTER(_ctype))
+               ,t_kernel.ctypes.data_as(ctypes.POINTER(_ctype))
+               ,ctypes.c_ushort(kernel.shape[1])
+               ,ctypes.c_ushort(kernel.shape[0])
+               ,1 if rigor else 0
+               ,1 if verbose else 0)
+        _winograd_filters[key] = (kernel if kernel_version is not None else kernel.copy(), t_filter)
+        if len(_winograd_filters)>_winograd_filters_max: _winograd_filters.popitem(last=False)
+        return t_filter
+
+def ClearConvolution2dWinogradFilter():
+    """
+    Removes all transformed kernels in the cache.
+    """
+    with _winograd_filters_lock:
+        _winograd_filters.clear()
+
+def _Convolution2dWinograd( op # 'Convolution2dWinograd' or 'Convolution2dWinogradBatch'
+                          , out_data
+                          , in_data
+                          , kernel
+                          , bias
+                          , padding
+                          , kernel_version
+                          , rigor
+                          , verbose):
+    _Conv2d, _ctype = dlr_common.GetFunction(op, out_data.dtype)
+    if _Conv2d is None:
+        dlr_common.DlrError(" not support "+str(out_data.dtype.type), flush=True)
+        return False
+    t_filter = GetConvolution2dWinogradFilter(kernel, kernel_version, rigor, verbose)
+    if t_filter is None: return False
+    CP_out_data    = out_data.ctypes.data_as(ctypes.POINTER(_ctype))
+    CP_in_data     = in_data.ctypes.data_as(ctypes.POINTER(_ctype))
+    CP_filter      = t_filter.ctypes.data_as(ctypes.POINTER(_ctype))
+    CP_out_size    = ctypes.c_ushort(out_data.shape[-1])
+    CP_in_size     = ctypes.c_ushort(in_data.shape[-1])
+    CP_in_channel  = ctypes.c_ushort(in_data.shape[-3])
+    CP_out_channel = ctypes.c_ushort(kernel.shape[0])
+    CP_padding     = ctypes.c_ubyte (padding)
+    CP_rigor       = 1 if rigor else 0
+    CP_verbose     = 1 if verbose else 0
+    if (bias is None) or (bias.size == 0):
+       CP_bias        = ctypes.POINTER(_ctype)()
+       CP_bias_size   = ctypes.c_ushort(0)
+    else:
+       CP_bias        = bias.ctypes.data_as(ctypes.POINTER(_ctype))
+       CP_bias_size   = ctypes.c_ushort(bias.shape[0])
+    if out_data.ndim==4:
+       _Conv2d(CP_out_data
+              ,CP_in_data
+              ,CP_filter
+              ,CP_bias
+              ,CP_out_size
+              ,CP_in_size
+              ,CP_bias_size
+              ,CP_in_channel
+              ,CP_out_channel
+              ,ctypes.c_ushort(in_data.shape[0]) # minibatch
+              ,CP_padding
+              ,CP_rigor
+              ,CP_verbose)
+    else:
+       _Conv2d(CP_out_data
+              ,CP_in_data
+              ,CP_filter
+              ,CP_bias
+              ,CP_out_size
+              ,CP_in_size
+              ,CP_bias_size
+              ,CP_in_channel
+              ,CP_out_channel
+              ,CP_padding
+              ,CP_rigor
+              ,CP_verbose)
+    return True
+
+#===============================================================================
+# int8 x int8 --> int32 with requantization to int8 for each output channel,
+# where a quantized value 'q' stands for 'scale*(q-zero_point)' and the kernel
+# is symmetric (see dlr_common.GetRequantization()).
+dlr_common.RegisterSignature('Convolution2dInt8'
+                            , lambda _ctype: [ctypes.POINTER(ctypes.c_int8)  # output features
+                                             ,ctypes.POINTER(ctypes.c_int8)  # input image
+                                             ,ctypes.POINTER(ctypes.c_int8)  # kernels
+                                             ,ctypes.POINTER(ctypes.c_int32) # bias
+                                             ,ctypes.POINTER(ctypes.c_int32) # multiplier
+                                             ,ctypes.POINTER(ctypes.c_int8)  # shift
+                                             ,ctypes.c_int32   # in_zero_point
+                                             ,ctypes.c_int32   # out_zero_point
+                                             ,ctypes.c_ushort  # out_size
+                                             ,ctypes.c_ushort  # in_size
+                                             ,ctypes.c_ubyte   # kernel_size (only for square filter)
+                                             ,ctypes.c_ushort  # bias_size
+                                             ,ctypes.c_ushort  # in_channel
+                                             ,ctypes.c_ushort  # out_channel
+                                             ,ctypes.c_ubyte   # stride
+                                             ,ctypes.c_ubyte   # padding
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ])  # verbose
+
+dlr_common.RegisterSignature('Convolution2dBatchInt8'
+                            , lambda _ctype: [ctypes.POINTER(ctypes.c_int8)  # output features
+                                             ,ctypes.POINTER(ctypes.c_int8)  # input image
+                                             ,ctypes.POINTER(ctypes.c_int8)  # kernels
+                                             ,ctypes.POINTER(ctypes.c_int32) # bias
+                                             ,ctypes.POINTER(ctypes.c_int32) # multiplier
+                                             ,ctypes.POINTER(ctypes.c_int8)  # shift
+                                             ,ctypes.c_int32   # in_zero_point
+                                             ,ctypes.c_int32   # out_zero_point
+                                             ,ctypes.c_ushort  # out_size
+                                             ,ctypes.c_ushort  # in_size
+                                             ,ctypes.c_ubyte   # kernel_size (only for square filter)
+                                             ,ctypes.c_ushort  # bias_size
+                                             ,ctypes.c_ushort  # in_channel
+                                             ,ctypes.c_ushort  # out_channel
+                                             ,ctypes.c_ushort  # minibatch
+                                             ,ctypes.c_ubyte   # stride
+                                             ,ctypes.c_ubyte   # padding
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ])  # verbose
+
+def Convolution2dInt8( out_data       # out_channel x out_size x out_size
+                     , in_data        # in_channel x in_size x in_size
+                     , kernel         # out_channel x in_channel x kernel_size x kernel_size
+                     , bias           # None or out_channel
+                     , multiplier     # out_channel
+                     , shift          # out_channel
+                     , in_zero_point=0
+                     , out_zero_point=0
+                     , stride=1
+                     , padding=0
+                     , rigor=False
+                     , verbose=False):
+    """
+    Returns True on success, otherwize returns False
+    Applies a 2D convolution of int8 data and int8 kernel accumulated in int32,
+    which is requantized to int8 by 'multiplier' and 'shift' for each output channel.
+    Note that all nd-array lists are NumPy (mutable) and contiguous.
+    :param out_data: <mutable> int8 output data, out_data[out_channel][out_size][out_size]
+    :param in_data: int8 input data, in_data[in_channel][in_size][in_size]
+    :param kernel: int8 kernel, kernel[out_channel][in_channel][kernel_size][kernel_size]
+    :param bias: None or int32 bias of scale 'in_scale*kernel_scale', bias[out_channel]
+    :param multiplier: int32 Q31 multiplier for each output channel (see dlr_common.GetRequantization())
+    :param shift: int8 shift for each output channel (see dlr_common.GetRequantization())
+    :param in_zero_point: zero point of in_data
+    :param out_zero_point: zero point of out_data
+    :param stride: num of skips to apply next filter
+    :param padding: num of pixes at the boundary
+    :param rigor: check values rigorously when 'True'
+    :param verbose: output message more when 'True'
+    :return: 'True' on success, 'False' on failure.
+    """
+    return _Convolution2dInt8('Convolution2d', out_data, in_data, kernel, bias, multiplier, shift
+                             , in_zero_point, out_zero_point, stride, padding, False, rigor, verbose)
+
+def Convolution2dBatchInt8( out_data       # minibatch x out_channel x out_size x out_size
+                          , in_data        # minibatch x in_channel x in_size x in_size
+                          , kernel         # out_channel x in_channel x kernel_size x kernel_size
+                          , bias           # None or out_channel
+                          , multiplier     # out_channel
+                          , shift          # out_channel
+                          , in_zero_point=0
+                          , out_zero_point=0
+                          , stride=1
+                          , padding=0
+                          , rigor=False
+                          , verbose=False):
+    """
+    Returns True on success, otherwize returns False
+    Minibatch version of Convolution2dInt8(), where out_data and in_data have
+    leading minibatch dimension.
+    """
+    return _Convolution2dInt8('Convolution2dBatch', out_data, in_data, kernel, bias, multiplier, shift
+                             , in_zero_point, out_zero_point, stride, padding, True, rigor, verbose)
+
+def _Convolution2dInt8( op # 'Convolution2d' or 'Convolution2dBatch'
+                      , out_data
+                      , in_data
+                      , kernel
+                      , bias
+                      , multiplier
+                      , shift
+                      , in_zero_point
+                      , out_zero_point
+                      , stride
+                      , padding
+                      , batch
+                      , rigor
+                      , verbose):
+    t_ndim = 4 if batch else 3
+    if rigor or dlr_common.rigor:
+       error =0
+       if (out_data.ndim!=t_ndim) or (in_data.ndim!=t_ndim) or (kernel.ndim!=4):
+           error += 1
+           if verbose: dlr_common.DlrError(f"out_data and in_data should be {t_ndim} dim, kernel 4 dim", flush=True)
+       if (out_data.dtype!=np.int8) or (in_data.dtype!=np.int8) or (kernel.dtype!=np.int8):
+           error += 1
+           if verbose: dlr_common.DlrError("out_data, in_data and kernel should be int8", flush=True)
+       if (bias is not None) and (bias.dtype!=np.int32):
+           error += 1
+           if verbose: dlr_common.DlrError(f"bias should be int32: {bias.dtype}", flush=True)
+       if (multiplier.dtype!=np.int32) or (shift.dtype!=np.int8) or\
+          (multiplier.shape!=(kernel.shape[0],)) or (shift.shape!=(kernel.shape[0],)):
+           error += 1
+           if verbose: dlr_common.DlrError("multiplier (int32) and shift (int8) should be out_channel", flush=True)
+       if batch and (out_data.shape[0]!=in_data.shape[0]):
+           error += 1
+           if verbose: dlr_common.DlrError("minibatch mis-match", flush=True)
+       if (error!=0):
+           dlr_common.DlrError(" parameter mis-match", flush=True)
+           return False
+    _Conv2d, _ctype = dlr_common.GetFunction(op, np.int8)
+    if _Conv2d is None:
+        dlr_common.DlrError(" not support "+op+"Int8", flush=True)
+        return False
+    if (bias is None) or (bias.size == 0):
+       CP_bias        = ctypes.POINTER(ctypes.c_int32)()
+       CP_bias_size   = ctypes.c_ushort(0)
+    else:
+       CP_bias        = bias.ctypes.data_as(ctypes.POINTER(ctypes.c_int32))
+       CP_bias_size   = ctypes.c_ushort(bias.shape[0])
+    args = [out_data.ctypes.data_as(ctypes.POINTER(ctypes.c_int8))
+           ,in_data.ctypes.data_as(ctypes.POINTER(ctypes.c_int8))
+           ,kernel.ctypes.data_as(ctypes.POINTER(ctypes.c_int8))
+           ,CP_bias
+           ,multiplier.ctypes.data_as(ctypes.POINTER(ctypes.c_int32))
+           ,shift.ctypes.data_as(ctypes.POINTER(ctypes.c_int8))
+           ,ctypes.c_int32(in_zero_point)
+           ,ctypes.c_int32(out_zero_point)
+           ,ctypes.c_ushort(out_data.shape[-1]) # out_size
+           ,ctypes.c_ushort(in_data.shape[-1]) # in_size
+           ,ctypes.c_ubyte (kernel.shape[3]) # kernel_size
+           ,CP_bias_size
+           ,ctypes.c_ushort(in_data.shape[-3]) # in_channel
+           ,ctypes.c_ushort(kernel.shape[0])] # out_channel
+    if batch: args.append(ctypes.c_ushort(in_data.shape[0])) # minibatch
+    _Conv2d(*args
+           ,ctypes.c_ubyte(stride)
+           ,ctypes.c_ubyte(padding)
+           ,1 if rigor else 0
+           ,1 if verbose else 0)
+    return True
+
+#===============================================================================
+if __name__=='__main__':
+    def TestConvolution2dInt8():
+        """
+        Compares Convolution2dBatchInt8() against integer arithmetic of NumPy, which should be bit-exact.
+        """
+        configs = [ # minibatch, in_channel, in_size, out_channel, kernel_size, stride, padding
+                    [1, 3, 13, 8, 3, 1, 1]
+                  , [2, 4, 10, 5, 3, 2, 1]
+                  , [1, 2,  9, 3, 5, 1, 2]
+                  , [2, 3,  8, 4, 1, 1, 0] ]
+        rng = np.random.default_rng(0)
+        for minibatch, in_channel, in_size, out_channel, kernel_size, stride, padding in configs:
+            status, out_size = GetOutputSizeOfConvolution2d(in_size, kernel_size, stride, padding)
+            in_data    = rng.integers(-128, 128, [minibatch,in_channel,in_size,in_size]).astype(np.int8)
+            kernel     = rng.integers(-127, 128, [out_channel,in_channel,kernel_size,kernel_size]).astype(np.int8)
+            bias       = rng.integers(-5000, 5000, [out_channel]).astype(np.int32)
+            multiplier, shift = dlr_common.GetRequantization(rng.uniform(1E-4, 1E-2, [out_channel]))
+            in_zero_point, out_zero_point = -3, 5
+            out_data   = np.empty([minibatch,out_channel,out_size,out_size], dtype=np.int8)
+            status = Convolution2dBatchInt8(out_data, in_data, kernel, bias, multiplier, shift
+                                           , in_zero_point, out_zero_point, stride, padding, rigor=True)
+            # padding stands for zero point, i.e., real zero
+            t_data = np.pad(in_data.astype(np.int64)-in_zero_point, ((0,0),(0,0),(padding,padding),(padding,padding)))
+            accum  = np.zeros([minibatch,out_channel,out_size,out_size], dtype=np.int64)+bias[:,None,None]
+            for i in range(kernel_size):
+                for j in range(kernel_size):
+                    window = t_data[:,:,i:i+stride*(out_size-1)+1:stride,j:j+stride*(out_size-1)+1:stride]
+                    accum += np.einsum('bchw,oc->bohw', window, kernel[:,:,i,j].astype(np.int64))
+            expect = dlr_common.Requantize(accum, multiplier[:,None,None], shift[:,None,None], out_zero_point)
+            mismatch = np.count_nonzero(out_data!=expect)
+            dlr_common.DlrPrint(f"int8 {[minibatch,in_channel,in_size,out_channel,kernel_size,stride,padding]}"
+                                +(" OK" if status and mismatch==0 else f" mis-match {mismatch}"), flush=True)
+
+    def TestRequantization():
+        """
+        Checks that GetRequantization() keeps M=multiplier*2^-(31+shift) within Q31 precision
+        and saturates M of 2^30 or more to (2^31-1)*2^-1.
+        """
+        real = np.array([1E-6, 3E-3, 0.5, 1.0, 7.3, 2.0**29, 2.0**30-1, 2.0**30, 3E9, 2.0**40])
+        multiplier, shift = dlr_common.GetRequantization(real)
+        applied = multiplier.astype(np.float64)*np.exp2(-(31.0+shift))
+        expect  = np.minimum(real, ((1<<31)-1)*0.5)
+        status  = np.all((shift>=-30) & (shift<=32)) and np.all(np.abs(applied-expect)<=expect*2.0**-30)
+        dlr_common.DlrPrint(f"requantization {real.tolist()}"
+                            +(" OK" if status else f" mis-match {applied.tolist()}"), flush=True)
+
 #===============================================================================
 if __name__=='__main__':
     def TestConvolution2d(_dtype):
@@ -266,6 +783,106 @@ if __name__=='__main__':
             dlr_common.DlrPrint(f"bias:\n{bias}", flush=True)
             dlr_common.DlrPrint(f"out_data:\n{out_data}", flush=True)
 
+#===============================================================================
+if __name__=='__main__':
+    def TestConvolution2dWinograd(_dtype):
+        """
+        Reports error of Winograd F(2x2,3x3) against the reference.
+        _dtype: specify data type of data one of {np.float32, np.float64}
+        """
+        configs = [ # minibatch, in_channel, in_size, out_channel, padding
+                    [1,  3, 416, 16, 1]
+                  , [1, 16, 104, 32, 1]
+                  , [1, 64,  26, 64, 0]
+                  , [2,512,  13, 32, 1]
+                  , [4,  8,  11,  8, 1] ]
+        rng = np.random.default_rng(0)
+        for minibatch, in_channel, in_size, out_channel, padding in configs:
+            status, out_size = GetOutputSizeOfConvolution2d(in_size, 3, 1, padding)
+            if not status: return
+            in_data  = rng.uniform(-1.0, 1.0, [minibatch,in_channel,in_size,in_size]).astype(_dtype)
+            kernel   = rng.uniform(-1.0, 1.0, [out_channel,in_channel,3,3]).astype(_dtype)
+            bias     = rng.uniform(-1.0, 1.0, [out_channel]).astype(_dtype)
+            out_ref  = np.empty([minibatch,out_channel,out_size,out_size], dtype=_dtype)
+            out_wino = np.empty([minibatch,out_channel,out_size,out_size], dtype=_dtype)
+            Convolution2dBatch(out_ref, in_data, kernel, bias, 1, padding, algorithm='reference')
+            Convolution2dBatch(out_wino, in_data, kernel, bias, 1, padding, algorithm='winograd')
+            diff = np.abs(out_wino.astype(np.float64)-out_ref)
+            dlr_common.DlrPrint(f"{str(np.dtype(_dtype)):7s} {[minibatch,in_channel,in_size,out_channel,padding]}"
+                                f" max abs err={np.max(diff):.3e}"
+                                f" max rel err={np.max(diff)/np.max(np.abs(out_ref)):.3e}", flush=True)
+
+#===============================================================================
+if __name__=='__main__':
+    def TestConvolution2dFixed():
+        """
+        Compares Convolution2dBatch() of fixed-point data against integer arithmetic of NumPy,
+        which should be bit-exact, where each product is rounded once as 'accum += x*w' of ap_fixed.
+        """
+        configs = [ # minibatch, in_channel, in_size, out_channel, kernel_size, stride, padding
+                    [1, 3, 13, 8, 3, 1, 1]
+                  , [2, 4, 10, 5, 3, 2, 1]
+                  , [1, 2,  9, 3, 5, 1, 2] ]
+        rng = np.random.default_rng(0)
+        saved = dlr_common.get_fixed_format()
+        for quantization in ['TRN', 'RND']:
+            dlr_common.set_fixed_format(16, 8, quantization, 'SAT')
+            frac = 16-8
+            for minibatch, in_channel, in_size, out_channel, kernel_size, stride, padding in configs:
+                status, out_size = GetOutputSizeOfConvolution2d(in_size, kernel_size, stride, padding)
+                in_data  = dlr_common.ToFixed(rng.uniform(-1.0, 1.0, [minibatch,in_channel,in_size,in_size]))
+                kernel   = dlr_common.ToFixed(rng.uniform(-1.0, 1.0, [out_channel,in_channel,kernel_size,kernel_size]))
+                bias     = dlr_common.ToFixed(rng.uniform(-1.0, 1.0, [out_channel]))
+                out_data = np.empty([minibatch,out_channel,out_size,out_size], dtype=dlr_common.fixed)
+                status = Convolution2dBatch(out_data, in_data, kernel, bias, stride, padding, rigor=True)
+                t_data = np.pad(in_data.view(np.int32).astype(np.int64), ((0,0),(0,0),(padding,padding),(padding,padding)))
+                t_kernel = kernel.view(np.int32).astype(np.int64)
+                expect = np.zeros([minibatch,out_channel,out_size,out_size], dtype=np.int64)+bias.view(np.int32)[:,None,None]
+                for i in range(kernel_size):
+                    for j in range(kernel_size):
+                        window  = t_data[:,None,:,i:i+stride*(out_size-1)+1:stride,j:j+stride*(out_size-1)+1:stride]
+                        product = window*t_kernel[None,:,:,i,j,None,None] # minibatch x out x in x size x size
+                        expect += dlr_common.QuantizeFixed(product, 2*frac).view(np.int32).sum(axis=2)
+                mismatch = np.count_nonzero(out_data.view(np.int32)!=expect)
+                real = np.empty([minibatch,out_channel,out_size,out_size], dtype=np.float64)
+                Convolution2dBatch(real, dlr_common.FromFixed(in_data, np.float64), dlr_common.FromFixed(kernel, np.float64)
+                                  , dlr_common.FromFixed(bias, np.float64), stride, padding)
+                diff = np.max(np.abs(dlr_common.FromFixed(out_data, np.float64)-real))
+                dlr_common.DlrPrint(f"fixed<16,8,{quantization}> {[minibatch,in_channel,in_size,out_channel,kernel_size,stride,padding]}"
+                                    f" max abs diff to double={diff:.3e}"
+                                    +(" OK" if status and mismatch==0 else f" mis-match {mismatch}"), flush=True)
+        dlr_common.set_fixed_format(*saved)
+
+    def TestConvolution2dHalf():
+        """
+        Compares Convolution2dBatch() of np.float16 and bfloat16 data against double of the same
+        data rounded once to the storage, which should be within an ulp since sum goes float.
+        """
+        configs = [ # minibatch, in_channel, in_size, out_channel, kernel_size, stride, padding
+                    [1, 16, 13, 8, 3, 1, 1]
+                  , [2, 32, 10, 5, 3, 2, 1]
+                  , [1,  8,  9, 3, 5, 1, 2] ]
+        storages = { 'float16' : (lambda data: data.astype(np.float16), lambda data: data.astype(np.float64), 10)
+                   , 'bfloat16': (dlr_common.ToBFloat16, lambda data: dlr_common.FromBFloat16(data, np.float64), 7) }
+        rng = np.random.default_rng(0)
+        for name, (to_storage, from_storage, mantissa) in storages.items():
+            for minibatch, in_channel, in_size, out_channel, kernel_size, stride, padding in configs:
+                status, out_size = GetOutputSizeOfConvolution2d(in_size, kernel_size, stride, padding)
+                in_data  = to_storage(rng.uniform(-1.0, 1.0, [minibatch,in_channel,in_size,in_size]))
+                kernel   = to_storage(rng.uniform(-1.0, 1.0, [out_channel,in_channel,kernel_size,kernel_size]))
+                bias     = to_storage(rng.uniform(-1.0, 1.0, [out_channel]))
+                out_data = np.empty([minibatch,out_channel,out_size,out_size], dtype=in_data.dtype)
+                status = Convolution2dBatch(out_data, in_data, kernel, bias, stride, padding, rigor=True)
+                real = np.empty([minibatch,out_channel,out_size,out_size], dtype=np.float64)
+                Convolution2dBatch(real, from_storage(in_data), from_storage(kernel), from_storage(bias), stride, padding)
+                ulp = np.ldexp(1.0, np.frexp(real)[1]-1-mantissa) # ulp of storage at each value
+                ulp = np.maximum(ulp, np.ldexp(1.0, -24 if name=='float16' else -133)) # subnormal
+                mismatch = np.count_nonzero(np.abs(from_storage(out_data)-real)>ulp)
+                diff = np.max(np.abs(from_storage(out_data)-real))
+                dlr_common.DlrPrint(f"{name:8s} {[minibatch,in_channel,in_size,out_channel,kernel_size,stride,padding]}"
+                                    f" max abs diff to double={diff:.3e}"
+                                    +(" OK" if status and mismatch==0 else f" mis-match {mismatch}"), flush=True)
+
 #===============================================================================
 if __name__=='__main__':
     dlr_common.DlrPrint("Testing Convolution2d", flush=True)
@@ -273,10 +890,31 @@ if __name__=='__main__':
     TestConvolution2d(_dtype=np.int32)
     TestConvolution2d(_dtype=np.float32)
     TestConvolution2d(_dtype=np.float64)
+    dlr_common.DlrPrint("Testing Convolution2d Winograd F(2x2,3x3)", flush=True)
+    dlr_common.DlrPrint("*****************************************", flush=True)
+    TestConvolution2dWinograd(_dtype=np.float32)
+    TestConvolution2dWinograd(_dtype=np.float64)
+    dlr_common.DlrPrint("Testing Convolution2dInt8", flush=True)
+    dlr_common.DlrPrint("*************************", flush=True)
+    TestConvolution2dInt8()
+    TestRequantization()
+    dlr_common.DlrPrint("Testing Convolution2dFixed", flush=True)
+    dlr_common.DlrPrint("**************************", flush=True)
+    TestConvolution2dFixed()
+    dlr_common.DlrPrint("Testing Convolution2dHalf and Convolution2dBFloat16", flush=True)
+    dlr_common.DlrPrint("***************************************************", flush=True)
+    TestConvolution2dHalf()
 
 #===============================================================================
 # Revision history:
 #
+# 2026.10.18: TestRequantization() added for saturation of large multipliers
+# 2026.10.18: np.float16 and bfloat16 data go 'Convolution2dHalf' and 'Convolution2dBFloat16'
+# 2026.10.18: fixed-point data go 'Convolution2dFixed' and 'Convolution2dBatchFixed'
+# 2026.10.18: 'Convolution2dInt8' and 'Convolution2dBatchInt8' added for int8 with requantization
+# 2026.10.18: 'winograd' algorithm with transformed kernel cache, 'auto' by default
+# 2026.10.18: 'algorithm' selector added ('reference' or 'fast')
+# 2026.10.18: 'Convolution2dBatch' added for minibatch
 # 2020.09.30: argument order of bias and bias_size changed
 # 2020.04.25: Started by Ando Ki (adki@future-ds.com)
 #===============================================================================
@@ -69,6 +69,22 @@ def GetOutputSizeOfDeconvolution2d( in_size
     # refer to conf  : out_size = (in_size+2*padding-kernel)/stride +1
 
 #===============================================================================
+dlr_common.RegisterSignature('Deconvolution2d'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # output features
+                                             ,ctypes.POINTER(_ctype) # input image
+                                             ,ctypes.POINTER(_ctype) # kernels
+                                             ,ctypes.POINTER(_ctype)  # bias
+                                             ,ctypes.c_ushort  # out_size
+                                             ,ctypes.c_ushort  # in_size
+                                             ,ctypes.c_ubyte   # kernel_size (only for square filter)
+                                             ,ctypes.c_ushort  # bias_size
+                                             ,ctypes.c_ushort  # in_channel
+                                             ,ctypes.c_ushort  # out_channel
+                                             ,ctypes.c_ubyte   # stride
+                                             ,ctypes.c_ubyte   # padding
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ])  # verbose
+
 def Deconvolution2d( out_data    # out_channel x out_size x out_size
                    , in_data     # in_channel x in_size x in_size
                    , kernel      # in_channel x out_channel x kernel_size x kernel_size
@@ -160,37 +176,10 @@ def Deconvolution2d( out_data    # out_channel x out_size x out_size
        if (error!=0):
            dlr_common.DlrError(" parameter mis-match", flush=True)
            return False
-    #_fname=''
-    #_ctype=''
-    if out_data.dtype.type == np.int32:
-        _fname = 'Deconvolution2dInt'
-        _ctype = ctypes.c_int
-    elif out_data.dtype.type == np.float32:
-        _fname = 'Deconvolution2dFloat'
-        _ctype = ctypes.c_float
-    elif out_data.dtype.type == np.float64:
-        _fname = 'Deconvolution2dDouble'
-        _ctype = ctypes.c_double
-    else:
+    _Deconv2d, _ctype = dlr_common.GetFunction('Deconvolution2d', out_data.dtype)
+    if _Deconv2d is None:
         dlr_common.DlrError(" not support "+str(out_data.dtype.type), flush=True)
         return False
-    _Deconv2d=dlr_common.WrapFunction(dlr_common._dlr
-                            ,_fname
-                            , None          # return type
-                            ,[ctypes.POINTER(_ctype) # output features
-                             ,ctypes.POINTER(_ctype) # input image
-                             ,ctypes.POINTER(_ctype) # kernels
-                             ,ctypes.POINTER(_ctype)  # bias
-                             ,ctypes.c_ushort  # out_size
-                             ,ctypes.c_ushort  # in_size
-                             ,ctypes.c_ubyte   # kernel_size (only for square filter)
-                             ,ctypes.c_ushort  # bias_size
-                             ,ctypes.c_ushort  # in_channel
-                             ,ctypes.c_ushort  # out_channel
-                             ,ctypes.c_ubyte   # stride
-                             ,ctypes.c_ubyte   # padding
-                             ,ctypes.c_int     # rigor
-                             ,ctypes.c_int ])  # verbose
     CP_out_data    = out_data.ctypes.data_as(ctypes.POINTER(_ctype))
     CP_in_data     = in_data.ctypes.data_as(ctypes.POINTER(_ctype))
     CP_kernel      = kernel.ctypes.data_as(ctypes.POINTER(_ctype))
@@ -225,6 +214,100 @@ def Deconvolution2d( out_data    # out_channel x out_size x out_size
            ,CP_verbose)
     return True
 
+#===============================================================================
+dlr_common.RegisterSignature('Deconvolution2dBatch'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # output features
+                                             ,ctypes.POINTER(_ctype) # input image
+                                             ,ctypes.POINTER(_ctype) # kernels
+                                             ,ctypes.POINTER(_ctype)  # bias
+                                             ,ctypes.c_ushort  # out_size
+                                             ,ctypes.c_ushort  # in_size
+                                             ,ctypes.c_ubyte   # kernel_size (only for square filter)
+                                             ,ctypes.c_ubyte   # bias_size
+                                             ,ctypes.c_ushort  # in_channel
+                                             ,ctypes.c_ushort  # out_channel
+                                             ,ctypes.c_ushort  # minibatch
+                                             ,ctypes.c_ubyte   # stride
+                                             ,ctypes.c_ubyte   # padding
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ])  # verbose
+
+def Deconvolution2dBatch( out_data    # minibatch x out_channel x out_size x out_size
+                      , in_data     # minibatch x in_channel x in_size x in_size
+                      , kernel      # in_channel x out_channel x kernel_size x kernel_size
+                      , bias=None   # out_channel
+                      , stride=1
+                      , padding=0
+                      , rigor=False
+                      , verbose=False):
+    """
+    Returns True on success, otherwize returns False
+    Applies a 2D deconvolution (transpose convolution) over a minibatch of input data by a single call of the C routine.
+    Note that all nd-array lists are NumPy (mutable) and contiguous.
+    :param out_data: <mutable> output data, out_data[minibatch][out_channel][out_size][out_size]
+    :param in_data: input data, in_data[minibatch][in_channel][in_size][in_size]
+    :param kernel: kernel (or filter), kernel[in_channel][out_channel][kernel_size][kernel_size]
+    :param bias: bias for each filter (kernel), bias[out_channel]
+    :param stride: num of skips to apply next filter
+    :param padding: num of pixes at the boundary
+    :param rigor: check values rigorously when 'True'
+    :param verbose: output message more when 'True'
+    :return: 'True' on success, 'False' on failure.
+    """
+    if rigor or dlr_common.rigor:
+       error =0
+       if (out_data.ndim!=4):
+           error += 1
+           if verbose: dlr_common.DlrError("out_data is not 4 dim", flush=True)
+       if (in_data.ndim!=4):
+           error += 1
+           if verbose: dlr_common.DlrError("in_data is not 4 dim", flush=True)
+       if (out_data.shape[0]!=in_data.shape[0]):
+           error += 1
+           if verbose: dlr_common.DlrError("minibatch mis-match", flush=True)
+       if (error!=0):
+           dlr_common.DlrError(" parameter mis-match", flush=True)
+           return False
+    _Deconv2d, _ctype = dlr_common.GetFunction('Deconvolution2dBatch', out_data.dtype)
+    if _Deconv2d is None:
+        dlr_common.DlrError(" not support "+str(out_data.dtype.type), flush=True)
+        return False
+    CP_out_data    = out_data.ctypes.data_as(ctypes.POINTER(_ctype))
+    CP_in_data     = in_data.ctypes.data_as(ctypes.POINTER(_ctype))
+    CP_kernel      = kernel.ctypes.data_as(ctypes.POINTER(_ctype))
+    CP_out_size    = ctypes.c_ushort(out_data.shape[3]) # note ndim (i.e., rank) is 4
+    CP_in_size     = ctypes.c_ushort(in_data.shape[3]) # note ndim (i.e., rank) is 4
+    CP_kernel_size = ctypes.c_ubyte (kernel.shape[3]) # note ndim (i.e., rank) is 4
+    CP_in_channel  = ctypes.c_ushort(in_data.shape[1])
+    CP_out_channel = ctypes.c_ushort(kernel.shape[1])
+    CP_minibatch   = ctypes.c_ushort(in_data.shape[0])
+    CP_stride      = ctypes.c_ubyte (stride)
+    CP_padding     = ctypes.c_ubyte (padding)
+    CP_rigor       = 1 if rigor else 0
+    CP_verbose     = 1 if verbose else 0
+    if (bias is None) or (bias.size == 0):
+       CP_bias        = ctypes.POINTER(_ctype)()
+       CP_bias_size   = ctypes.c_ubyte(0)
+    else:
+       CP_bias        = bias.ctypes.data_as(ctypes.POINTER(_ctype))
+       CP_bias_size   = ctypes.c_ubyte(bias.shape[0])
+    _Deconv2d(CP_out_data
+           ,CP_in_data
+           ,CP_kernel
+           ,CP_bias
+           ,CP_out_size
+           ,CP_in_size
+           ,CP_kernel_size
+           ,CP_bias_size
+           ,CP_in_channel
+           ,CP_out_channel
+           ,CP_minibatch
+           ,CP_stride
+           ,CP_padding
+           ,CP_rigor
+           ,CP_verbose)
+    return True
+
 #===============================================================================
 if __name__=='__main__':
     def TestDeconvolution2d(_dtype):
@@ -285,6 +368,7 @@ if __name__=='__main__':
 #===============================================================================
 # Revision history:
 #
+# 2026.10.18: 'Deconvolution2dBatch' added for minibatch
 # 2020.09.30: argument order of bias and bias_size changed
 # 2020.04.25: Started by Ando Ki (adki@future-ds.com)
 #===============================================================================
@@ -26,6 +26,7 @@ import traceback
 import inspect
 import ctypes
 import ctypes.util
+import numpy as np
 
 #===============================================================================
 # utility functions
@@ -105,12 +106,284 @@ else:
    if __debug__: print (GetFunctionName(), _libdlr+" found.", flush=True)
 
 #-------------------------------------------------------------------------------
+# '_dlr' releases the GIL during a call (ctypes.CDLL semantics),
+# while '_dlr_gil' holds the GIL (ctypes.PyDLL semantics).
 try:
-    _dlr = ctypes.CDLL(_libdlr)
+    _dlr     = ctypes.CDLL(_libdlr)
+    _dlr_gil = ctypes.PyDLL(_libdlr)
 except:
     traceback.print_exc(file=sys.stdout)
     sys.exit(1)
 
+#-------------------------------------------------------------------------------
+# error of C routines
+# Each routine returns DLR_SUCCESS (0) or DLR_FAILURE (-1), or NULL handle on failure,
+# while the message is kept for the calling thread (see dlrGetLastError()).
+class DlrRuntimeError(RuntimeError):
+    """
+    Raised when a C routine reports an error, e.g., a 'rigor' check failed
+    """
+    pass
+
+_dlrGetLastError = WrapFunction(_dlr, 'dlrGetLastError', ctypes.c_char_p, [])
+
+def GetLastError():
+    """
+    Returns the message of the last error of C routines in the calling thread
+    """
+    return _dlrGetLastError().decode(errors='replace')
+
+def _CheckStatus(result, func, args):
+    if result!=0: raise DlrRuntimeError(f"{func.__name__}: {GetLastError().strip()}")
+    return result
+
+def _CheckHandle(result, func, args):
+    if not result: raise DlrRuntimeError(f"{func.__name__}: {GetLastError().strip()}")
+    return result
+
+#-------------------------------------------------------------------------------
+# function-handle registry
+# C routines are named as '<Op><Int|Float|Double|Int8|Fixed|Half|BFloat16>[<variant>]',
+# e.g., 'Convolution2dFloat', 'Convolution2dFloatFast' and 'Pooling2dMaxIntReLu'.
+# Each wrapper module registers argument types of its routine once and
+# a symbol is looked up and configured only at its first use.
+# Data types are matched on exact NumPy dtype, since any structured array
+# has the type of np.void or np.record whatever its fields and itemsize.
+_dtypes = { np.dtype(np.int32)  : ('Int'   , ctypes.c_int   )
+          , np.dtype(np.float32): ('Float' , ctypes.c_float )
+          , np.dtype(np.float64): ('Double', ctypes.c_double)
+          , np.dtype(np.int8)   : ('Int8'  , ctypes.c_int8  )
+          , np.dtype(np.float16): ('Half'  , ctypes.c_uint16) } # 'fixed' and 'bfloat16' are added below
+
+_signatures = {} # op --> (restype, argtypes), where argtypes is a function of ctype
+_functions  = {} # (op, dtype, variant, release_gil) --> (ctypes function, ctype)
+
+release_gil = True # execution mode: release the GIL while a C routine runs
+
+def set_release_gil( rg ):
+    """
+    Selects execution mode of C routines
+    :param rg: 'True' to release the GIL during a call so that other Python threads
+               run concurrently, 'False' to hold the GIL during a call
+    """
+    global release_gil
+    release_gil = bool(rg)
+def get_release_gil(): return release_gil
+
+def RegisterSignature(op, argtypes, restype=ctypes.c_int):
+    """
+    Registers argument types of a C routine
+    :param op: string of routine name without data type, e.g., 'Convolution2d',
+               or with variant when its arguments differ, e.g., 'ActivationSigmoidFast',
+               or with data type when its arguments differ, e.g., 'Convolution2dInt8'
+    :param argtypes: function returning a list of argument types for a given ctype
+    :param restype: type of return value, ctypes.c_int for status or ctypes.c_void_p for handle
+    """
+    _signatures[op] = (restype, argtypes)
+
+def GetFunction(op, dtype, variant=''):
+    """
+    Returns ctypes function and ctype of the C routine, which are prepared once
+    :param op: string of routine name without data type, e.g., 'Convolution2d'
+    :param dtype: NumPy data type, e.g., np.float32 or out_data.dtype,
+                  which should be given as dtype rather than dtype.type for 'fixed' and 'bfloat16'
+    :param variant: '', 'ReLu' or 'LeakyReLu' for fused activation, 'Fast' for fast algorithm
+    :return: (function, ctype) on success, (None, None) when not supported.
+    Note that the function raises DlrRuntimeError when the C routine reports an error.
+    """
+    dtype = np.dtype(dtype)
+    key = (op, dtype, variant, release_gil)
+    handle = _functions.get(key)
+    if handle is not None: return handle
+    if dtype not in _dtypes: return None, None
+    suffix, ctype = _dtypes[dtype]
+    signature = _signatures.get(op+suffix+variant, _signatures.get(op+variant, _signatures.get(op)))
+    if signature is None: return None, None
+    restype, argtypes = signature
+    try:
+        lib  = _dlr if release_gil else _dlr_gil
+        func = WrapFunction(lib, op+suffix+variant, restype, argtypes(ctype))
+    except AttributeError:
+        return None, None
+    func.errcheck = _CheckHandle if restype==ctypes.c_void_p else _CheckStatus
+    handle = (func, ctype)
+    _functions[key] = handle
+    return handle
+
+#-------------------------------------------------------------------------------
+# in-place execution of element-wise routines, e.g., activations and batch normalization,
+# which are safe when 'out_data' is 'in_data' exactly or does not overlap it.
+def GetInplaceOutput(out_data, in_data, inplace=False):
+    """
+    Returns array to be written, i.e., 'in_data' when 'inplace' or 'out_data' is None,
+    otherwise 'out_data', or None when 'out_data' partially overlaps 'in_data'.
+    """
+    if inplace or (out_data is None):
+        if not in_data.flags.writeable:
+            DlrError("in_data should be writeable for in-place")
+            return None
+        return in_data
+    if np.may_share_memory(out_data, in_data) and \
+       ((out_data.ctypes.data!=in_data.ctypes.data) or (out_data.strides!=in_data.strides)):
+        DlrError("out_data partially overlaps in_data")
+        return None
+    return out_data
+
+#-------------------------------------------------------------------------------
+# requantization of int8 routines, e.g., Convolution2dInt8(), where the real
+# multiplier M=in_scale*weight_scale/out_scale goes to Q31 'multiplier' and
+# 'shift' as M=multiplier*2^-(31+shift) (see dlr_quant.hpp).
+def GetRequantization(real_multiplier):
+    """
+    Returns (multiplier, shift) of int32 and int8 NumPy arrays for the real multipliers
+    :param real_multiplier: scalar or array of non-negative real multipliers,
+                            where multipliers of 2^30 or more saturate to (2^31-1)*2^-1
+    """
+    real = np.atleast_1d(np.asarray(real_multiplier, dtype=np.float64))
+    mantissa, exponent = np.frexp(real) # real=mantissa*2^exponent, mantissa in [0.5, 1)
+    multiplier = np.round(mantissa*(1<<31)).astype(np.int64)
+    carry = multiplier==(1<<31)
+    multiplier[carry] >>= 1
+    exponent[carry] += 1
+    shift = -exponent.astype(np.int64)
+    small = shift>32 # too small to keep in Q31 with the largest shift
+    multiplier[small] >>= np.minimum(shift[small]-32, 62)
+    shift[small] = 32
+    large = shift<-30 # too large to keep in Q31 with the smallest shift, i.e., M>=2^30
+    multiplier[large] = (1<<31)-1 # saturates to the largest M=(2^31-1)*2^-1
+    shift[large] = -30
+    multiplier[real==0] = 0
+    return multiplier.astype(np.int32), shift.astype(np.int8)
+
+def Requantize(accum, multiplier, shift, zero_point):
+    """
+    Returns int8 NumPy array of int32 accumulators requantized as dlr_quant.hpp does,
+    where 'multiplier' and 'shift' are broadcast along the accumulators
+    """
+    t_shift = 31+np.asarray(shift, dtype=np.int64)
+    value = np.asarray(accum, dtype=np.int64)*np.asarray(multiplier, dtype=np.int64)
+    value = ((value+(np.int64(1)<<(t_shift-1)))>>t_shift)+zero_point
+    return np.clip(value, -128, 127).astype(np.int8)
+
+#-------------------------------------------------------------------------------
+# fixed-point data of '<Op>Fixed' routines, e.g., Convolution2dFixed(), which
+# emulate 'ap_fixed<width, int_width, quantization, overflow>' of HLS (see dlr_fixed.hpp).
+# Data are int32 raw bits of 'value*2^(width-int_width)' in NumPy array of
+# 'fixed' dtype, which is told from int32 and other structured dtypes as a whole.
+fixed = np.dtype([('raw', np.int32)])
+_dtypes[fixed] = ('Fixed', ctypes.c_int32)
+
+_quantizations = { 'TRN': 0, 'RND': 1, 'RND_CONV': 2 } # DLR_FIXED_xxx
+_overflows     = { 'WRAP': 0, 'SAT': 1 }
+
+_dlrSetFixedFormat = WrapFunction(_dlr, 'dlrSetFixedFormat', ctypes.c_int
+                                 , [ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int])
+_dlrGetFixedFormat = WrapFunction(_dlr, 'dlrGetFixedFormat', None
+                                 , [ctypes.POINTER(ctypes.c_int)]*4)
+
+def set_fixed_format( width=16, int_width=8, quantization='TRN', overflow='WRAP' ):
+    """
+    Sets the format of fixed-point data, i.e., 'ap_fixed<width, int_width, AP_quantization, AP_overflow>'
+    :param width: total bits including sign, 1..32
+    :param int_width: integer bits including sign, where 'width-int_width' should be 0..31
+    :param quantization: one of 'TRN', 'RND' and 'RND_CONV'
+    :param overflow: one of 'WRAP' and 'SAT'
+    :return: True on success, False on failure
+    """
+    if (quantization not in _quantizations) or (overflow not in _overflows):
+        DlrError(f"unknown quantization or overflow: {quantization} {overflow}")
+        return False
+    if _dlrSetFixedFormat(width, int_width, _quantizations[quantization], _overflows[overflow])!=0:
+        DlrError(GetLastError().strip())
+        return False
+    return True
+
+def get_fixed_format():
+    """
+    Returns (width, int_width, quantization, overflow) of fixed-point data
+    """
+    values = [ctypes.c_int() for _ in range(4)]
+    _dlrGetFixedFormat(*[ctypes.byref(value) for value in values])
+    width, int_width, quantization, overflow = [value.value for value in values]
+    return ( width, int_width
+           , next(name for name, value in _quantizations.items() if value==quantization)
+           , next(name for name, value in _overflows.items() if value==overflow))
+
+def QuantizeFixed(raw, frac=0):
+    """
+    Returns 'fixed' NumPy array of integer 'raw*2^-frac' as dlr_fixed.hpp does
+    :param raw: integer array, e.g., int64 accumulators of products having 2*frac fraction bits
+    :param frac: fraction bits of 'raw'
+    """
+    width, int_width, quantization, overflow = get_fixed_format()
+    value = np.asarray(raw, dtype=np.int64)
+    shift = frac-(width-int_width)
+    if shift>0:
+        if quantization=='RND':
+            value = value+(np.int64(1)<<(shift-1))
+        elif quantization=='RND_CONV':
+            value = value+((np.int64(1)<<(shift-1))-1)+((value>>shift)&1)
+        value = value>>shift
+    elif shift<0:
+        value = value<<(-shift)
+    return _OverflowFixed(value, width, overflow)
+
+def _OverflowFixed(value, width, overflow):
+    if overflow=='SAT':
+        value = np.clip(value, -(1<<(width-1)), (1<<(width-1))-1)
+    else:
+        value = ((value+(1<<(width-1)))&((1<<width)-1))-(1<<(width-1))
+    return value.astype(np.int32).view(fixed)
+
+def ToFixed(data):
+    """
+    Returns 'fixed' NumPy array of real data, which is rounded and checked for overflow
+    in the format of set_fixed_format() as dlr_fixed.hpp does
+    """
+    width, int_width, quantization, overflow = get_fixed_format()
+    value = np.ldexp(np.asarray(data, dtype=np.float64), width-int_width)
+    if quantization=='RND':
+        value = np.floor(value+0.5)
+    elif quantization=='RND_CONV':
+        value = np.rint(value)
+    else:
+        value = np.floor(value)
+    value = np.nan_to_num(value, nan=-2.0**62)
+    value = np.clip(value, -2.0**62, 2.0**62).astype(np.int64)
+    return _OverflowFixed(value, width, overflow)
+
+def FromFixed(data, dtype=np.float32):
+    """
+    Returns real NumPy array of 'fixed' NumPy array in the format of set_fixed_format()
+    """
+    width, int_width, _, _ = get_fixed_format()
+    return np.ldexp(data.view(np.int32).astype(np.float64), -(width-int_width)).astype(dtype)
+
+#-------------------------------------------------------------------------------
+# bfloat16 data of '<Op>BFloat16' routines, e.g., Convolution2dBFloat16(), which
+# keep upper 16 bits of float and are computed in float (see dlr_half.hpp),
+# while np.float16 goes '<Op>Half' routines of IEEE 754 binary16.
+# NumPy has no bfloat16, so data are uint16 bits in NumPy array of
+# 'bfloat16' dtype, which is told from 'fixed' and other structured dtypes as a whole.
+bfloat16 = np.dtype((np.record, [('raw', np.uint16)]))
+_dtypes[bfloat16] = ('BFloat16', ctypes.c_uint16)
+
+def ToBFloat16(data):
+    """
+    Returns 'bfloat16' NumPy array of real data rounded to nearest even as dlr_half.hpp does
+    """
+    bits = np.asarray(data, dtype=np.float32).view(np.uint32).astype(np.uint64)
+    nan  = (bits&0x7FFFFFFF)>0x7F800000
+    bits = (bits+0x7FFF+((bits>>16)&1))>>16
+    bits[nan] = (np.asarray(data, dtype=np.float32).view(np.uint32)[nan]>>16)|0x40
+    return bits.astype(np.uint16).view(bfloat16)
+
+def FromBFloat16(data, dtype=np.float32):
+    """
+    Returns real NumPy array of 'bfloat16' NumPy array
+    """
+    return (data.view(np.uint16).astype(np.uint32)<<16).view(np.float32).astype(dtype)
+
 #-------------------------------------------------------------------------------
 # need debug for this 'rigor' and 'verbose'
 rigor = False
@@ -122,8 +395,62 @@ def get_rigor(): return rigor
 def set_verbose ( ve ): verbose = ve
 def get_verbose (): return verbose
 
+#-------------------------------------------------------------------------------
+# number of threads of C routines, which is effective only when
+# the library is built with OpenMP, i.e., 'make OPENMP=1'.
+_dlrSetNumThreads = WrapFunction(_dlr, 'dlrSetNumThreads', ctypes.c_int, [ctypes.c_int])
+_dlrGetNumThreads = WrapFunction(_dlr, 'dlrGetNumThreads', ctypes.c_int, [])
+
+def set_num_threads( num_threads=0 ):
+    """
+    Sets the number of threads of C routines (0 for all processors)
+    :return: the number of threads to be used, 1 when not built with OpenMP
+    """
+    return _dlrSetNumThreads(num_threads)
+def get_num_threads(): return _dlrGetNumThreads()
+
+#-------------------------------------------------------------------------------
+# instruction set of float kernels, where the best one of the CPU is
+# selected when the library is loaded. It can be pinned for benchmarks.
+_isas = { 'scalar': 0, 'avx2': 1, 'avx512': 2, 'neon': 3 } # DLR_ISA_xxx
+
+_dlrSetIsa = WrapFunction(_dlr, 'dlrSetIsa', ctypes.c_int, [ctypes.c_int])
+_dlrGetIsa = WrapFunction(_dlr, 'dlrGetIsa', ctypes.c_int, [])
+
+def set_isa( isa=None ):
+    """
+    Sets the instruction set of float kernels
+    :param isa: one of 'scalar', 'avx2', 'avx512' and 'neon', or None for the best
+    :return: True on success, False when not supported by the CPU
+    """
+    if isa is None: return _dlrSetIsa(-1)==0
+    if isa not in _isas:
+        DlrError(f"unknown ISA: {isa}")
+        return False
+    return _dlrSetIsa(_isas[isa])==0
+
+def get_isa():
+    """
+    Returns the name of instruction set of float kernels
+    """
+    isa = _dlrGetIsa()
+    return next((name for name, value in _isas.items() if value==isa), str(isa))
+
 #===============================================================================
 # Revision history:
 #
+# 2026.10.18: GetRequantization() saturates multiplier of M>=2^30 along with its shift
+# 2026.10.18: '<Op>BFloat16' routines selected only for exact 'bfloat16' dtype
+# 2026.10.18: '<Op>Fixed' routines selected only for exact 'fixed' dtype
+# 2026.10.18: 'Half' of np.float16 and 'BFloat16' data type with ToBFloat16() and FromBFloat16() added
+# 2026.10.18: 'Fixed' data type with set_fixed_format(), ToFixed() and FromFixed() added
+# 2026.10.18: 'Int8' data type and GetRequantization()/Requantize() added for int8 routines
+# 2026.10.18: GetInplaceOutput() added for in-place execution
+# 2026.10.18: signature of a variant registered by its own, e.g., 'ActivationSigmoidFast'
+# 2026.10.18: set_isa()/get_isa() added for SIMD kernels
+# 2026.10.18: DlrRuntimeError raised when a C routine returns error status
+# 2026.10.18: set_num_threads()/get_num_threads() added for OpenMP build
+# 2026.10.18: 'release_gil' execution mode added (set_release_gil/get_release_gil)
+# 2026.10.18: function-handle registry added (RegisterSignature/GetFunction)
 # 2020.04.58: Started        by Ando Ki     (adki@future-ds.com)
 #===============================================================================
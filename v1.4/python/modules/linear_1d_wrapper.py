@@ -26,6 +26,17 @@ import numpy as np
 from python.modules import dlr_common
 
 #===============================================================================
+dlr_common.RegisterSignature('Linear1d'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # out data
+                                             ,ctypes.POINTER(_ctype) # in data
+                                             ,ctypes.POINTER(_ctype) # weight
+                                             ,ctypes.POINTER(_ctype) # bias
+                                             ,ctypes.c_ushort  # out_size
+                                             ,ctypes.c_ushort  # in_size
+                                             ,ctypes.c_ushort  # bias_size
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ])  # verbose
+
 def Linear1d( out_data    # out_size
             , in_data     # in_size
             , weight      # out_size x in_size
@@ -87,32 +98,10 @@ def Linear1d( out_data    # out_size
        if (error!=0):
            dlr_common.DlrError(" parameter mis-match", flush=True)
            return False
-    #_fname=''
-    #_ctype=''
-    if out_data.dtype.type == np.int32:
-        _fname = 'Linear1dInt'
-        _ctype = ctypes.c_int
-    elif out_data.dtype.type == np.float32:
-        _fname = 'Linear1dFloat'
-        _ctype = ctypes.c_float
-    elif out_data.dtype.type == np.float64:
-        _fname = 'Linear1dDouble'
-        _ctype = ctypes.c_double
-    else:
+    _Linear1d, _ctype = dlr_common.GetFunction('Linear1d', out_data.dtype)
+    if _Linear1d is None:
         dlr_common.DlrError(" not support "+str(out_data.dtype.type), flush=True)
         return False
-    _Linear1d=dlr_common.WrapFunction(dlr_common._dlr
-                              ,_fname
-                              , None          # return type
-                              ,[ctypes.POINTER(_ctype) # out data
-                               ,ctypes.POINTER(_ctype) # in data
-                               ,ctypes.POINTER(_ctype) # weight
-                               ,ctypes.POINTER(_ctype) # bias
-                               ,ctypes.c_ushort  # out_size
-                               ,ctypes.c_ushort  # in_size
-                               ,ctypes.c_ushort  # bias_size
-                               ,ctypes.c_int     # rigor
-                               ,ctypes.c_int ])  # verbose
     CP_out_data    = out_data.ctypes.data_as(ctypes.POINTER(_ctype))
     CP_in_data     = in_data.ctypes.data_as(ctypes.POINTER(_ctype))
     CP_weight      = weight.ctypes.data_as(ctypes.POINTER(_ctype))
@@ -137,6 +126,258 @@ def Linear1d( out_data    # out_size
              ,CP_verbose)
     return True
 
+#===============================================================================
+dlr_common.RegisterSignature('Linear1dBatch'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # out data
+                                             ,ctypes.POINTER(_ctype) # in data
+                                             ,ctypes.POINTER(_ctype) # weight
+                                             ,ctypes.POINTER(_ctype) # bias
+                                             ,ctypes.c_ushort  # out_size
+                                             ,ctypes.c_ushort  # in_size
+                                             ,ctypes.c_ushort  # bias_size
+                                             ,ctypes.c_ushort  # minibatch
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ])  # verbose
+
+def Linear1dBatch( out_data    # minibatch x out_size
+                 , in_data     # minibatch x in_size
+                 , weight      # out_size x in_size
+                 , bias=None   # out_size
+                 , rigor=False
+                 , verbose=False):
+    """
+    Returns True on success, otherwize returns False
+    Applies a 1D matrix multiplication over a minibatch of input data by a single call of the C routine.
+    Note that all nd-array lists are NumPy (mutable) and contiguous.
+    :param out_data: <mutable> output data, out_data[minibatch][out_size]
+    :param in_data: input data, in_data[minibatch][in_size]
+    :param weight: weight[out_size][in_size]
+    :param bias: bias for each output, bias[out_size]
+    :param rigor: check values rigorously when 'True'
+    :param verbose: output message more when 'True'
+    :return: 'True' on success, 'False' on failure.
+    """
+    if rigor:
+       error =0
+       if (out_data.ndim!=2):
+           error += 1
+           if verbose: dlr_common.DlrError("out_data is not 2 dim", flush=True)
+       if (in_data.ndim!=2):
+           error += 1
+           if verbose: dlr_common.DlrError("in_data is not 2 dim", flush=True)
+       if (out_data.shape[0]!=in_data.shape[0]):
+           error += 1
+           if verbose: dlr_common.DlrError("minibatch mis-match", flush=True)
+       if (weight.shape!=(out_data.shape[1], in_data.shape[1])):
+           error += 1
+           if verbose: dlr_common.DlrError(f"weight mis-match {weight.shape}", flush=True)
+       if (error!=0):
+           dlr_common.DlrError(" parameter mis-match", flush=True)
+           return False
+    _Linear1d, _ctype = dlr_common.GetFunction('Linear1dBatch', out_data.dtype)
+    if _Linear1d is None:
+        dlr_common.DlrError(" not support "+str(out_data.dtype.type), flush=True)
+        return False
+    CP_out_data    = out_data.ctypes.data_as(ctypes.POINTER(_ctype))
+    CP_in_data     = in_data.ctypes.data_as(ctypes.POINTER(_ctype))
+    CP_weight      = weight.ctypes.data_as(ctypes.POINTER(_ctype))
+    CP_out_size    = ctypes.c_ushort(out_data.shape[1])
+    CP_in_size     = ctypes.c_ushort(in_data.shape[1])
+    CP_minibatch   = ctypes.c_ushort(in_data.shape[0])
+    CP_rigor       = 1 if rigor else 0
+    CP_verbose     = 1 if verbose else 0
+    if (bias is None) or (bias.size == 0):
+       CP_bias        = ctypes.POINTER(_ctype)()
+       CP_bias_size   = ctypes.c_ushort(0)
+    else:
+       CP_bias        = bias.ctypes.data_as(ctypes.POINTER(_ctype))
+       CP_bias_size   = ctypes.c_ushort(bias.shape[0])
+    _Linear1d(CP_out_data
+             ,CP_in_data
+             ,CP_weight
+             ,CP_bias
+             ,CP_out_size
+             ,CP_in_size
+             ,CP_bias_size
+             ,CP_minibatch
+             ,CP_rigor
+             ,CP_verbose)
+    return True
+
+#===============================================================================
+# int8 x int8 --> int32 with requantization to int8 for each output,
+# where a quantized value 'q' stands for 'scale*(q-zero_point)' and the weight
+# is symmetric (see dlr_common.GetRequantization()).
+dlr_common.RegisterSignature('Linear1dInt8'
+                            , lambda _ctype: [ctypes.POINTER(ctypes.c_int8)  # out data
+                                             ,ctypes.POINTER(ctypes.c_int8)  # in data
+                                             ,ctypes.POINTER(ctypes.c_int8)  # weight
+                                             ,ctypes.POINTER(ctypes.c_int32) # bias
+                                             ,ctypes.POINTER(ctypes.c_int32) # multiplier
+                                             ,ctypes.POINTER(ctypes.c_int8)  # shift
+                                             ,ctypes.c_int32   # in_zero_point
+                                             ,ctypes.c_int32   # out_zero_point
+                                             ,ctypes.c_ushort  # out_size
+                                             ,ctypes.c_ushort  # in_size
+                                             ,ctypes.c_ushort  # bias_size
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ])  # verbose
+
+dlr_common.RegisterSignature('Linear1dBatchInt8'
+                            , lambda _ctype: [ctypes.POINTER(ctypes.c_int8)  # out data
+                                             ,ctypes.POINTER(ctypes.c_int8)  # in data
+                                             ,ctypes.POINTER(ctypes.c_int8)  # weight
+                                             ,ctypes.POINTER(ctypes.c_int32) # bias
+                                             ,ctypes.POINTER(ctypes.c_int32) # multiplier
+                                             ,ctypes.POINTER(ctypes.c_int8)  # shift
+                                             ,ctypes.c_int32   # in_zero_point
+                                             ,ctypes.c_int32   # out_zero_point
+                                             ,ctypes.c_ushort  # out_size
+                                             ,ctypes.c_ushort  # in_size
+                                             ,ctypes.c_ushort  # bias_size
+                                             ,ctypes.c_ushort  # minibatch
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ])  # verbose
+
+def Linear1dInt8( out_data       # out_size
+                , in_data        # in_size
+                , weight         # out_size x in_size
+                , bias           # None or out_size
+                , multiplier     # out_size
+                , shift          # out_size
+                , in_zero_point=0
+                , out_zero_point=0
+                , rigor=False
+                , verbose=False):
+    """
+    Returns True on success, otherwize returns False
+    Applies a 1D matrix multiplication of int8 data and int8 weight accumulated in int32,
+    which is requantized to int8 by 'multiplier' and 'shift' for each output.
+    Note that all nd-array lists are NumPy (mutable) and contiguous.
+    :param out_data: <mutable> int8 output data, out_data[out_size]
+    :param in_data: int8 input data, in_data[in_size]
+    :param weight: int8 weight[out_size][in_size]
+    :param bias: None or int32 bias of scale 'in_scale*weight_scale', bias[out_size]
+    :param multiplier: int32 Q31 multiplier for each output (see dlr_common.GetRequantization())
+    :param shift: int8 shift for each output (see dlr_common.GetRequantization())
+    :param in_zero_point: zero point of in_data
+    :param out_zero_point: zero point of out_data
+    :param rigor: check values rigorously when 'True'
+    :param verbose: output message more when 'True'
+    :return: 'True' on success, 'False' on failure.
+    """
+    return _Linear1dInt8('Linear1d', out_data, in_data, weight, bias, multiplier, shift
+                        , in_zero_point, out_zero_point, False, rigor, verbose)
+
+def Linear1dBatchInt8( out_data       # minibatch x out_size
+                     , in_data        # minibatch x in_size
+                     , weight         # out_size x in_size
+                     , bias           # None or out_size
+                     , multiplier     # out_size
+                     , shift          # out_size
+                     , in_zero_point=0
+                     , out_zero_point=0
+                     , rigor=False
+                     , verbose=False):
+    """
+    Returns True on success, otherwize returns False
+    Minibatch version of Linear1dInt8(), where out_data and in_data have
+    leading minibatch dimension and a row of weight is read once for all items.
+    """
+    return _Linear1dInt8('Linear1dBatch', out_data, in_data, weight, bias, multiplier, shift
+                        , in_zero_point, out_zero_point, True, rigor, verbose)
+
+def _Linear1dInt8( op # 'Linear1d' or 'Linear1dBatch'
+                 , out_data
+                 , in_data
+                 , weight
+                 , bias
+                 , multiplier
+                 , shift
+                 , in_zero_point
+                 , out_zero_point
+                 , batch
+                 , rigor
+                 , verbose):
+    t_ndim = 2 if batch else 1
+    if rigor:
+       error =0
+       if (out_data.ndim!=t_ndim) or (in_data.ndim!=t_ndim):
+           error += 1
+           if verbose: dlr_common.DlrError(f"out_data and in_data should be {t_ndim} dim", flush=True)
+       if (out_data.dtype!=np.int8) or (in_data.dtype!=np.int8) or (weight.dtype!=np.int8):
+           error += 1
+           if verbose: dlr_common.DlrError("out_data, in_data and weight should be int8", flush=True)
+       if (weight.shape!=(out_data.shape[-1], in_data.shape[-1])):
+           error += 1
+           if verbose: dlr_common.DlrError(f"weight mis-match {weight.shape}", flush=True)
+       if (bias is not None) and (bias.dtype!=np.int32):
+           error += 1
+           if verbose: dlr_common.DlrError(f"bias should be int32: {bias.dtype}", flush=True)
+       if (multiplier.dtype!=np.int32) or (shift.dtype!=np.int8) or\
+          (multiplier.shape!=(weight.shape[0],)) or (shift.shape!=(weight.shape[0],)):
+           error += 1
+           if verbose: dlr_common.DlrError("multiplier (int32) and shift (int8) should be out_size", flush=True)
+       if batch and (out_data.shape[0]!=in_data.shape[0]):
+           error += 1
+           if verbose: dlr_common.DlrError("minibatch mis-match", flush=True)
+       if (error!=0):
+           dlr_common.DlrError(" parameter mis-match", flush=True)
+           return False
+    _Linear1d, _ctype = dlr_common.GetFunction(op, np.int8)
+    if _Linear1d is None:
+        dlr_common.DlrError(" not support "+op+"Int8", flush=True)
+        return False
+    if (bias is None) or (bias.size == 0):
+       CP_bias        = ctypes.POINTER(ctypes.c_int32)()
+       CP_bias_size   = ctypes.c_ushort(0)
+    else:
+       CP_bias        = bias.ctypes.data_as(ctypes.POINTER(ctypes.c_int32))
+       CP_bias_size   = ctypes.c_ushort(bias.shape[0])
+    args = [out_data.ctypes.data_as(ctypes.POINTER(ctypes.c_int8))
+           ,in_data.ctypes.data_as(ctypes.POINTER(ctypes.c_int8))
+           ,weight.ctypes.data_as(ctypes.POINTER(ctypes.c_int8))
+           ,CP_bias
+           ,multiplier.ctypes.data_as(ctypes.POINTER(ctypes.c_int32))
+           ,shift.ctypes.data_as(ctypes.POINTER(ctypes.c_int8))
+           ,ctypes.c_int32(in_zero_point)
+           ,ctypes.c_int32(out_zero_point)
+           ,ctypes.c_ushort(out_data.shape[-1]) # out_size
+           ,ctypes.c_ushort(in_data.shape[-1]) # in_size
+           ,CP_bias_size]
+    if batch: args.append(ctypes.c_ushort(in_data.shape[0])) # minibatch
+    _Linear1d(*args
+             ,1 if rigor else 0
+             ,1 if verbose else 0)
+    return True
+
+#===============================================================================
+if __name__=='__main__':
+    def TestLinear1dInt8():
+        """
+        Compares Linear1dInt8() and Linear1dBatchInt8() against integer arithmetic of NumPy,
+        which should be bit-exact.
+        """
+        rng = np.random.default_rng(0)
+        for minibatch, in_size, out_size in [(1, 7, 5), (4, 256, 100), (9, 1000, 10)]:
+            in_data    = rng.integers(-128, 128, [minibatch,in_size]).astype(np.int8)
+            weight     = rng.integers(-127, 128, [out_size,in_size]).astype(np.int8)
+            bias       = rng.integers(-5000, 5000, [out_size]).astype(np.int32)
+            multiplier, shift = dlr_common.GetRequantization(rng.uniform(1E-5, 1E-3, [out_size]))
+            in_zero_point, out_zero_point = 7, -2
+            out_data   = np.empty([minibatch,out_size], dtype=np.int8)
+            if minibatch==1:
+                status = Linear1dInt8(out_data[0], in_data[0], weight, bias, multiplier, shift
+                                     , in_zero_point, out_zero_point, rigor=True)
+            else:
+                status = Linear1dBatchInt8(out_data, in_data, weight, bias, multiplier, shift
+                                          , in_zero_point, out_zero_point, rigor=True)
+            accum  = np.matmul(in_data.astype(np.int64)-in_zero_point, weight.T.astype(np.int64))+bias
+            expect = dlr_common.Requantize(accum, multiplier, shift, out_zero_point)
+            mismatch = np.count_nonzero(out_data!=expect)
+            dlr_common.DlrPrint(f"int8 {[minibatch,in_size,out_size]}"
+                                +(" OK" if status and mismatch==0 else f" mis-match {mismatch}"), flush=True)
+
 #===============================================================================
 if __name__=='__main__':
     def TestLinear1d(_dtype):
@@ -179,10 +420,15 @@ if __name__=='__main__':
     TestLinear1d(_dtype=np.int32)
     TestLinear1d(_dtype=np.float32)
     TestLinear1d(_dtype=np.float64)
+    dlr_common.DlrPrint("Testing Linar1dInt8", flush=True)
+    dlr_common.DlrPrint("*********************", flush=True)
+    TestLinear1dInt8()
 
 #===============================================================================
 # Revision history:
 #
+# 2026.10.18: 'Linear1dInt8' and 'Linear1dBatchInt8' added for int8 with requantization
+# 2026.10.18: 'Linear1dBatch' added for minibatch
 # 2020.09.30: argument order of bias and bias_size changed
 # 2020.04.25: Started by Ando Ki (adki@future-ds.com)
 #===============================================================================
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+"""
+This file contains Python interface of linear_batch.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+#-------------------------------------------------------------------------------
+__author__     = "Ando Ki"
+__copyright__  = "Copyright 2020, Future Design Systems"
+__credits__    = ["none", "some"]
+__license__    = "FUTURE DESIGN SYSTEMS SOFTWARE END-USER LICENSE AGREEMENT"
+__version__    = "0"
+__revision__   = "1"
+__maintainer__ = "Ando Ki"
+__email__      = "contact@future-ds.com"
+__status__     = "Development"
+__date__       = "2026.10.18"
+__description__= "Python interface of linear_batch"
+
+#-------------------------------------------------------------------------------
+import ctypes
+import ctypes.util
+import numpy as np
+from python.modules import dlr_common
+
+#===============================================================================
+dlr_common.RegisterSignature('LinearBatch'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # out data
+                                             ,ctypes.POINTER(_ctype) # in data
+                                             ,ctypes.POINTER(_ctype) # weight
+                                             ,ctypes.POINTER(_ctype) # bias
+                                             ,ctypes.c_ushort  # out_size
+                                             ,ctypes.c_ushort  # in_size
+                                             ,ctypes.c_ushort  # bias_size
+                                             ,ctypes.c_uint    # rows
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ])  # verbose
+
+def LinearBatch( out_data    # ... x out_size
+               , in_data     # ... x in_size
+               , weight      # out_size x in_size
+               , bias=None   # out_size
+               , rigor=False
+               , verbose=False):
+    """
+    Returns True on success, otherwize returns False
+    Applies a linear transformation over all rows of an input data at once, i.e.,
+    leading dimensions (minibatch, ndim and so on) are taken as rows of a matrix,
+    while weight is read once for each block of rows of weight.
+    Note that all nd-array lists are NumPy (mutable) and contiguous.
+    :param out_data: <mutable> output data, out_data[...][out_size]
+    :param in_data: input data, in_data[...][in_size]
+    :param weight: weight[out_size][in_size]
+    :param bias: None or bias for each output, bias[out_size]
+    :param rigor: check values rigorously when 'True'
+    :param verbose: output message more when 'True'
+    :return: 'True' on success, 'False' on failure.
+    """
+    if rigor:
+       error =0
+       if (in_data.ndim<1) or (out_data.shape[:-1]!=in_data.shape[:-1]):
+           error += 1
+           if verbose: dlr_common.DlrError("out_data in_data dimension mis-match", flush=True)
+       if (weight.ndim!=2) or (weight.shape[0]!=out_data.shape[-1]) or (weight.shape[1]!=in_data.shape[-1]):
+           error += 1
+           if verbose: dlr_common.DlrError(f"weight should be out_size x in_size: {weight.shape}", flush=True)
+       if (bias is not None) and (bias.shape!=(weight.shape[0],)):
+           error += 1
+           if verbose: dlr_common.DlrError(f"bias should be out_size: {bias.shape}", flush=True)
+       if (error!=0):
+           dlr_common.DlrError(" parameter mis-match", flush=True)
+           return False
+    _LinearBatch, _ctype = dlr_common.GetFunction('LinearBatch', out_data.dtype)
+    if _LinearBatch is None:
+        dlr_common.DlrError(" not support "+str(out_data.dtype.type), flush=True)
+        return False
+    if (bias is None) or (bias.size == 0):
+       CP_bias        = ctypes.POINTER(_ctype)()
+       CP_bias_size   = ctypes.c_ushort(0)
+    else:
+       CP_bias        = bias.ctypes.data_as(ctypes.POINTER(_ctype))
+       CP_bias_size   = ctypes.c_ushort(bias.shape[0])
+    _LinearBatch(out_data.ctypes.data_as(ctypes.POINTER(_ctype))
+                ,in_data.ctypes.data_as(ctypes.POINTER(_ctype))
+                ,weight.ctypes.data_as(ctypes.POINTER(_ctype))
+                ,CP_bias
+                ,ctypes.c_ushort(out_data.shape[-1]) # out_size
+                ,ctypes.c_ushort(in_data.shape[-1]) # in_size
+                ,CP_bias_size
+                ,ctypes.c_uint(in_data.size//in_data.shape[-1]) # rows
+                ,1 if rigor else 0
+                ,1 if verbose else 0)
+    return True
+
+#===============================================================================
+if __name__=='__main__':
+    def TestLinearBatch(_dtype):
+        """
+        Compares LinearBatch() against NumPy for several shapes including edges of tiles
+        """
+        for shape, in_size, out_size in [([1], 7, 5), ([3, 5], 33, 13), ([8], 256, 100), ([2, 4, 6], 64, 64)]:
+            in_data  = np.random.uniform(-10, 10, size=shape+[in_size]).astype(_dtype)
+            weight   = np.random.uniform(-1, 1, size=[out_size, in_size]).astype(_dtype)
+            bias     = np.random.uniform(-1, 1, size=[out_size]).astype(_dtype)
+            out_data = np.empty(shape+[out_size], dtype=_dtype)
+            status   = LinearBatch(out_data, in_data, weight, bias, rigor=True)
+            expect   = np.matmul(in_data.astype(np.float64), weight.astype(np.float64).T)+bias
+            diff = np.max(np.abs(out_data-expect))
+            dlr_common.DlrPrint(f"{np.dtype(_dtype).name} {list(in_data.shape)}x{list(weight.shape)}: "
+                               f"max abs diff {diff:.3e}"+(" OK" if status and diff<1E-3 else " mis-match"), flush=True)
+
+#===============================================================================
+if __name__=='__main__':
+    dlr_common.DlrPrint("Testing LinearBatch", flush=True)
+    dlr_common.DlrPrint("*********************", flush=True)
+    TestLinearBatch(_dtype=np.float32)
+    TestLinearBatch(_dtype=np.float64)
+
+#===============================================================================
+# Revision history:
+#
+# 2026.10.18: Started.
+#===============================================================================
@@ -26,6 +26,18 @@ import numpy as np
 from python.modules import dlr_common
 
 #===============================================================================
+dlr_common.RegisterSignature('LinearNd'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # out data
+                                             ,ctypes.POINTER(_ctype) # in data
+                                             ,ctypes.POINTER(_ctype) # weight
+                                             ,ctypes.POINTER(_ctype) # bias
+                                             ,ctypes.c_ushort  # out_size
+                                             ,ctypes.c_ushort  # in_size
+                                             ,ctypes.c_ushort  # bias_size
+                                             ,ctypes.c_ubyte   # ndim
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ])  # verbose
+
 def LinearNd( out_data    # ndim x out_size
             , in_data     # ndim x in_size
             , weight      # out_size x in_size
@@ -93,33 +105,10 @@ def LinearNd( out_data    # ndim x out_size
        if (error!=0):
            dlr_common.DlrError(" parameter mis-match", flush=True)
            return False
-    #_fname=''
-    #_ctype=''
-    if out_data.dtype.type == np.int32:
-        _fname = 'LinearNdInt'
-        _ctype = ctypes.c_int
-    elif out_data.dtype.type == np.float32:
-        _fname = 'LinearNdFloat'
-        _ctype = ctypes.c_float
-    elif out_data.dtype.type == np.float64:
-        _fname = 'LinearNdDouble'
-        _ctype = ctypes.c_double
-    else:
+    _LinearNd, _ctype = dlr_common.GetFunction('LinearNd', out_data.dtype)
+    if _LinearNd is None:
         dlr_common.DlrError(" not support "+str(out_data.dtype.type), flush=True)
         return False
-    _LinearNd=dlr_common.WrapFunction(dlr_common._dlr
-                              ,_fname
-                              , None          # return type
-                              ,[ctypes.POINTER(_ctype) # out data
-                               ,ctypes.POINTER(_ctype) # in data
-                               ,ctypes.POINTER(_ctype) # weight
-                               ,ctypes.POINTER(_ctype) # bias
-                               ,ctypes.c_ushort  # out_size
-                               ,ctypes.c_ushort  # in_size
-                               ,ctypes.c_ushort  # bias_size
-                               ,ctypes.c_ubyte   # ndim
-                               ,ctypes.c_int     # rigor
-                               ,ctypes.c_int ])  # verbose
     CP_out_data    = out_data.ctypes.data_as(ctypes.POINTER(_ctype))
     CP_in_data     = in_data.ctypes.data_as(ctypes.POINTER(_ctype))
     CP_weight      = weight.ctypes.data_as(ctypes.POINTER(_ctype))
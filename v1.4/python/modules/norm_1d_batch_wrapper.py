@@ -26,6 +26,21 @@ import numpy as np
 from python.modules import dlr_common
 
 #===============================================================================
+dlr_common.RegisterSignature('Norm1dBatch'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # out data
+                                             ,ctypes.POINTER(_ctype) # in data
+                                             ,ctypes.POINTER(_ctype) # running_mean
+                                             ,ctypes.POINTER(_ctype) # running_var
+                                             ,ctypes.POINTER(_ctype) # scale
+                                             ,ctypes.POINTER(_ctype) # bias
+                                             ,ctypes.c_uint    # in_size
+                                             ,ctypes.c_ushort  # scale_size
+                                             ,ctypes.c_ushort  # bias_size
+                                             ,ctypes.c_ushort  # in_channel
+                                             ,ctypes.c_float   # epsilon
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ])  # verbose
+
 def Norm1dBatch( out_data     # in_channel x in_size (contiguous)
                , in_data      # in_channel x in_size (contiguous)
                , running_mean # in_channel
@@ -34,7 +49,8 @@ def Norm1dBatch( out_data     # in_channel x in_size (contiguous)
                , bias=None    # None or in_channel (default 0)
                , epsilon=1E-5
                , rigor=False
-               , verbose=False):
+               , verbose=False
+               , inplace=False):
     """
     Returns True on success, otherwize returns False
     Applies a 1D matrix multiplication over an input data data.
@@ -48,6 +64,7 @@ def Norm1dBatch( out_data     # in_channel x in_size (contiguous)
     :param epsilon:
     :param rigor: check values rigorously when 'True'
     :param verbose: output message more when 'True'
+    :param inplace: write results into 'in_data', i.e., 'out_data' may be None or 'in_data' itself
     :return: 'True' on success, 'False' on failure.
     Following is an example usage for PyTorch.
         Norm1dBatch( tensor_out_data.data.numpy() # ndim x out_size
@@ -60,6 +77,8 @@ def Norm1dBatch( out_data     # in_channel x in_size (contiguous)
                        , rigor=True
                        , verbose=True)
     """
+    out_data = dlr_common.GetInplaceOutput(out_data, in_data, inplace)
+    if out_data is None: return False
     if rigor:
        error =0
        if (out_data.ndim!=in_data.ndim):
@@ -96,36 +115,10 @@ def Norm1dBatch( out_data     # in_channel x in_size (contiguous)
        if (error!=0):
            dlr_common.DlrError("parameter mis-match", flush=True)
            return False
-    #_fname=''
-    #_ctype=''
-    if out_data.dtype.type == np.int32:
-        _fname = 'Norm1dBatchInt'
-        _ctype = ctypes.c_int
-    elif out_data.dtype.type == np.float32:
-        _fname = 'Norm1dBatchFloat'
-        _ctype = ctypes.c_float
-    elif out_data.dtype.type == np.float64:
-        _fname = 'Norm1dBatchDouble'
-        _ctype = ctypes.c_double
-    else:
+    _Norm1dBatch, _ctype = dlr_common.GetFunction('Norm1dBatch', out_data.dtype)
+    if _Norm1dBatch is None:
         dlr_common.DlrError(" not support "+str(out_data.dtype.type), flush=True)
         return False
-    _Norm1dBatch=dlr_common.WrapFunction(dlr_common._dlr
-                                        ,_fname
-                                        , None          # return type
-                                        ,[ctypes.POINTER(_ctype) # out data
-                                         ,ctypes.POINTER(_ctype) # in data
-                                         ,ctypes.POINTER(_ctype) # running_mean
-                                         ,ctypes.POINTER(_ctype) # running_var
-                                         ,ctypes.POINTER(_ctype) # scale
-                                         ,ctypes.POINTER(_ctype) # bias
-                                         ,ctypes.c_uint    # in_size
-                                         ,ctypes.c_ushort  # scale_size
-                                         ,ctypes.c_ushort  # bias_size
-                                         ,ctypes.c_ushort  # in_channel
-                                         ,ctypes.c_float   # epsilon
-                                         ,ctypes.c_int     # rigor
-                                         ,ctypes.c_int ])  # verbose
     in_channel     = in_data.shape[0]
     in_size        = int(in_data.size/in_channel) # num of elements per channel
     CP_out_data    = out_data.ctypes.data_as(ctypes.POINTER(_ctype))
@@ -164,6 +157,107 @@ def Norm1dBatch( out_data     # in_channel x in_size (contiguous)
                 ,CP_verbose)
     return True
 
+#===============================================================================
+dlr_common.RegisterSignature('Norm1dBatchBatch'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # out data
+                                             ,ctypes.POINTER(_ctype) # in data
+                                             ,ctypes.POINTER(_ctype) # running_mean
+                                             ,ctypes.POINTER(_ctype) # running_var
+                                             ,ctypes.POINTER(_ctype) # scale
+                                             ,ctypes.POINTER(_ctype) # bias
+                                             ,ctypes.c_uint    # in_size
+                                             ,ctypes.c_ushort  # scale_size
+                                             ,ctypes.c_ushort  # bias_size
+                                             ,ctypes.c_ushort  # in_channel
+                                             ,ctypes.c_ushort  # minibatch
+                                             ,ctypes.c_float   # epsilon
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ])  # verbose
+
+def Norm1dBatchBatch( out_data     # minibatch x in_channel x ...
+                    , in_data      # minibatch x in_channel x ...
+                    , running_mean # in_channel
+                    , running_var  # in_channel
+                    , scale=None   # None or in_channel (default 1)
+                    , bias=None    # None or in_channel (default 0)
+                    , epsilon=1E-5
+                    , rigor=False
+                    , verbose=False
+                    , inplace=False):
+    """
+    Returns True on success, otherwize returns False
+    Applies batch normalization over a minibatch of input data by a single call of the C routine.
+    Note that all nd-array lists are NumPy (mutable) and contiguous.
+    :param out_data: <mutable> output data, out_data[minibatch][channel][...]
+    :param in_data: input data, in_data[minibatch][channel][...]
+    :param running_mean:
+    :param running_var:
+    :param scale:
+    :param bias:
+    :param epsilon:
+    :param rigor: check values rigorously when 'True'
+    :param verbose: output message more when 'True'
+    :param inplace: write results into 'in_data', i.e., 'out_data' may be None or 'in_data' itself
+    :return: 'True' on success, 'False' on failure.
+    """
+    out_data = dlr_common.GetInplaceOutput(out_data, in_data, inplace)
+    if out_data is None: return False
+    if rigor:
+       error =0
+       if (out_data.shape!=in_data.shape) or (in_data.ndim<2):
+           error += 1
+           if verbose: dlr_common.DlrError("out_data in_data dimension mis-match", flush=True)
+       if (running_mean.size!=in_data.shape[1]) or (running_var.size!=in_data.shape[1]):
+           error += 1
+           if verbose: dlr_common.DlrError("running_mean/var size mis-match", flush=True)
+       if (error!=0):
+           dlr_common.DlrError("parameter mis-match", flush=True)
+           return False
+    _Norm1dBatch, _ctype = dlr_common.GetFunction('Norm1dBatchBatch', out_data.dtype)
+    if _Norm1dBatch is None:
+        dlr_common.DlrError(" not support "+str(out_data.dtype.type), flush=True)
+        return False
+    minibatch      = in_data.shape[0]
+    in_channel     = in_data.shape[1]
+    in_size        = int(in_data.size/(minibatch*in_channel)) # num of elements per channel
+    CP_out_data    = out_data.ctypes.data_as(ctypes.POINTER(_ctype))
+    CP_in_data     = in_data.ctypes.data_as(ctypes.POINTER(_ctype))
+    CP_running_mean= running_mean.ctypes.data_as(ctypes.POINTER(_ctype))
+    CP_running_var = running_var.ctypes.data_as(ctypes.POINTER(_ctype))
+    CP_in_size     = ctypes.c_uint(in_size)
+    CP_in_channel  = ctypes.c_ushort(in_channel)
+    CP_minibatch   = ctypes.c_ushort(minibatch)
+    CP_epsilon     = ctypes.c_float(epsilon)
+    CP_rigor       = 1 if rigor else 0
+    CP_verbose     = 1 if verbose else 0
+    if (scale is None) or (scale.size == 0):
+       CP_scale       = ctypes.POINTER(_ctype)()
+       CP_scale_size  = ctypes.c_ushort(0)
+    else:
+       CP_scale       = scale.ctypes.data_as(ctypes.POINTER(_ctype))
+       CP_scale_size  = ctypes.c_ushort(scale.size)
+    if (bias is None) or (bias.size == 0):
+       CP_bias        = ctypes.POINTER(_ctype)()
+       CP_bias_size   = ctypes.c_ushort(0)
+    else:
+       CP_bias        = bias.ctypes.data_as(ctypes.POINTER(_ctype))
+       CP_bias_size   = ctypes.c_ushort(bias.size)
+    _Norm1dBatch(CP_out_data
+                ,CP_in_data
+                ,CP_running_mean
+                ,CP_running_var
+                ,CP_scale
+                ,CP_bias
+                ,CP_in_size
+                ,CP_scale_size
+                ,CP_bias_size
+                ,CP_in_channel
+                ,CP_minibatch
+                ,CP_epsilon
+                ,CP_rigor
+                ,CP_verbose)
+    return True
+
 #===============================================================================
 if __name__=='__main__':
     def TestNorm1dBatch(_dtype):
@@ -216,6 +310,8 @@ if __name__=='__main__':
 #===============================================================================
 # Revision history:
 #
+# 2026.10.18: 'inplace' added
+# 2026.10.18: 'Norm1dBatchBatch' added for minibatch
 # 2020.09.30: argument order of bias and bias_size changed
 # 2020.04.25: Started by Ando Ki (adki@future-ds.com)
 #===============================================================================
@@ -26,6 +26,21 @@ import numpy as np
 from python.modules import dlr_common
 
 #===============================================================================
+dlr_common.RegisterSignature('Norm2dBatch'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # out data
+                                             ,ctypes.POINTER(_ctype) # in data
+                                             ,ctypes.POINTER(_ctype) # running_mean
+                                             ,ctypes.POINTER(_ctype) # running_var
+                                             ,ctypes.POINTER(_ctype) # scale
+                                             ,ctypes.POINTER(_ctype) # bias
+                                             ,ctypes.c_uint    # in_size
+                                             ,ctypes.c_ushort  # scale_size
+                                             ,ctypes.c_ushort  # bias_size
+                                             ,ctypes.c_ushort  # in_channel
+                                             ,ctypes.c_float   # epsilon
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ])  # verbose
+
 def Norm2dBatch( out_data     # in_channel x in_size x in_size
                , in_data      # in_channel x in_size x in_size
                , running_mean # in_channel
@@ -34,7 +49,8 @@ def Norm2dBatch( out_data     # in_channel x in_size x in_size
                , bias=None    # None or in_channel (default 0)
                , epsilon=1E-5
                , rigor=False
-               , verbose=False):
+               , verbose=False
+               , inplace=False):
     """
     Returns True on success, otherwize returns False
     Applies a 1D matrix multiplication over an input data data.
@@ -48,6 +64,7 @@ def Norm2dBatch( out_data     # in_channel x in_size x in_size
     :param epsilon:
     :param rigor: check values rigorously when 'True'
     :param verbose: output message more when 'True'
+    :param inplace: write results into 'in_data', i.e., 'out_data' may be None or 'in_data' itself
     :return: 'True' on success, 'False' on failure.
     Following is an example usage for PyTorch.
         Norm2dBatch( tensor_out_data.data.numpy() # ndim x out_size
@@ -60,6 +77,8 @@ def Norm2dBatch( out_data     # in_channel x in_size x in_size
                        , rigor=True
                        , verbose=True)
     """
+    out_data = dlr_common.GetInplaceOutput(out_data, in_data, inplace)
+    if out_data is None: return False
     if rigor:
        error =0
        if (out_data.ndim!=in_data.ndim):
@@ -99,36 +118,10 @@ def Norm2dBatch( out_data     # in_channel x in_size x in_size
        if (error!=0):
            dlr_common.DlrError("parameter mis-match", flush=True)
            return False
-    #_fname=''
-    #_ctype=''
-    if out_data.dtype.type == np.int32:
-        _fname = 'Norm2dBatchInt'
-        _ctype = ctypes.c_int
-    elif out_data.dtype.type == np.float32:
-        _fname = 'Norm2dBatchFloat'
-        _ctype = ctypes.c_float
-    elif out_data.dtype.type == np.float64:
-        _fname = 'Norm2dBatchDouble'
-        _ctype = ctypes.c_double
-    else:
+    _Norm2dBatch, _ctype = dlr_common.GetFunction('Norm2dBatch', out_data.dtype)
+    if _Norm2dBatch is None:
         dlr_common.DlrError(" not support "+str(out_data.dtype.type), flush=True)
         return False
-    _Norm2dBatch=dlr_common.WrapFunction(dlr_common._dlr
-                                 ,_fname
-                                 , None          # return type
-                                 ,[ctypes.POINTER(_ctype) # out data
-                                  ,ctypes.POINTER(_ctype) # in data
-                                  ,ctypes.POINTER(_ctype) # running_mean
-                                  ,ctypes.POINTER(_ctype) # running_var
-                                  ,ctypes.POINTER(_ctype) # scale
-                                  ,ctypes.POINTER(_ctype) # bias
-                                  ,ctypes.c_uint    # in_size
-                                  ,ctypes.c_ushort  # scale_size
-                                  ,ctypes.c_ushort  # bias_size
-                                  ,ctypes.c_ushort  # in_channel
-                                  ,ctypes.c_float   # epsilon
-                                  ,ctypes.c_int     # rigor
-                                  ,ctypes.c_int ])  # verbose
     in_channel     = in_data.shape[0]
     in_size        = int(in_data.size/in_channel) # num of elements per channel
     CP_out_data    = out_data.ctypes.data_as(ctypes.POINTER(_ctype))
@@ -167,6 +160,274 @@ def Norm2dBatch( out_data     # in_channel x in_size x in_size
                 ,CP_verbose)
     return True
 
+#===============================================================================
+dlr_common.RegisterSignature('Norm2dBatchBatch'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # out data
+                                             ,ctypes.POINTER(_ctype) # in data
+                                             ,ctypes.POINTER(_ctype) # running_mean
+                                             ,ctypes.POINTER(_ctype) # running_var
+                                             ,ctypes.POINTER(_ctype) # scale
+                                             ,ctypes.POINTER(_ctype) # bias
+                                             ,ctypes.c_uint    # in_size
+                                             ,ctypes.c_ushort  # scale_size
+                                             ,ctypes.c_ushort  # bias_size
+                                             ,ctypes.c_ushort  # in_channel
+                                             ,ctypes.c_ushort  # minibatch
+                                             ,ctypes.c_float   # epsilon
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ])  # verbose
+
+def Norm2dBatchBatch( out_data     # minibatch x in_channel x ...
+                    , in_data      # minibatch x in_channel x ...
+                    , running_mean # in_channel
+                    , running_var  # in_channel
+                    , scale=None   # None or in_channel (default 1)
+                    , bias=None    # None or in_channel (default 0)
+                    , epsilon=1E-5
+                    , rigor=False
+                    , verbose=False
+                    , inplace=False):
+    """
+    Returns True on success, otherwize returns False
+    Applies batch normalization over a minibatch of input data by a single call of the C routine.
+    Note that all nd-array lists are NumPy (mutable) and contiguous.
+    :param out_data: <mutable> output data, out_data[minibatch][channel][...]
+    :param in_data: input data, in_data[minibatch][channel][...]
+    :param running_mean:
+    :param running_var:
+    :param scale:
+    :param bias:
+    :param epsilon:
+    :param rigor: check values rigorously when 'True'
+    :param verbose: output message more when 'True'
+    :param inplace: write results into 'in_data', i.e., 'out_data' may be None or 'in_data' itself
+    :return: 'True' on success, 'False' on failure.
+    """
+    out_data = dlr_common.GetInplaceOutput(out_data, in_data, inplace)
+    if out_data is None: return False
+    if rigor:
+       error =0
+       if (out_data.shape!=in_data.shape) or (in_data.ndim<2):
+           error += 1
+           if verbose: dlr_common.DlrError("out_data in_data dimension mis-match", flush=True)
+       if (running_mean.size!=in_data.shape[1]) or (running_var.size!=in_data.shape[1]):
+           error += 1
+           if verbose: dlr_common.DlrError("running_mean/var size mis-match", flush=True)
+       if (error!=0):
+           dlr_common.DlrError("parameter mis-match", flush=True)
+           return False
+    _Norm2dBatch, _ctype = dlr_common.GetFunction('Norm2dBatchBatch', out_data.dtype)
+    if _Norm2dBatch is None:
+        dlr_common.DlrError(" not support "+str(out_data.dtype.type), flush=True)
+        return False
+    minibatch      = in_data.shape[0]
+    in_channel     = in_data.shape[1]
+    in_size        = int(in_data.size/(minibatch*in_channel)) # num of elements per channel
+    CP_out_data    = out_data.ctypes.data_as(ctypes.POINTER(_ctype))
+    CP_in_data     = in_data.ctypes.data_as(ctypes.POINTER(_ctype))
+    CP_running_mean= running_mean.ctypes.data_as(ctypes.POINTER(_ctype))
+    CP_running_var = running_var.ctypes.data_as(ctypes.POINTER(_ctype))
+    CP_in_size     = ctypes.c_uint(in_size)
+    CP_in_channel  = ctypes.c_ushort(in_channel)
+    CP_minibatch   = ctypes.c_ushort(minibatch)
+    CP_epsilon     = ctypes.c_float(epsilon)
+    CP_rigor       = 1 if rigor else 0
+    CP_verbose     = 1 if verbose else 0
+    if (scale is None) or (scale.size == 0):
+       CP_scale       = ctypes.POINTER(_ctype)()
+       CP_scale_size  = ctypes.c_ushort(0)
+    else:
+       CP_scale       = scale.ctypes.data_as(ctypes.POINTER(_ctype))
+       CP_scale_size  = ctypes.c_ushort(scale.size)
+    if (bias is None) or (bias.size == 0):
+       CP_bias        = ctypes.POINTER(_ctype)()
+       CP_bias_size   = ctypes.c_ushort(0)
+    else:
+       CP_bias        = bias.ctypes.data_as(ctypes.POINTER(_ctype))
+       CP_bias_size   = ctypes.c_ushort(bias.size)
+    _Norm2dBatch(CP_out_data
+                ,CP_in_data
+                ,CP_running_mean
+                ,CP_running_var
+                ,CP_scale
+                ,CP_bias
+                ,CP_in_size
+                ,CP_scale_size
+                ,CP_bias_size
+                ,CP_in_channel
+                ,CP_minibatch
+                ,CP_epsilon
+                ,CP_rigor
+                ,CP_verbose)
+    return True
+
+#===============================================================================
+dlr_common.RegisterSignature('Norm2dBatchFold'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # coef_a
+                                             ,ctypes.POINTER(_ctype) # coef_b
+                                             ,ctypes.POINTER(_ctype) # running_mean
+                                             ,ctypes.POINTER(_ctype) # running_var
+                                             ,ctypes.POINTER(_ctype) # scale
+                                             ,ctypes.POINTER(_ctype) # bias
+                                             ,ctypes.c_ushort  # scale_size
+                                             ,ctypes.c_ushort  # bias_size
+                                             ,ctypes.c_ushort  # in_channel
+                                             ,ctypes.c_float   # epsilon
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ])  # verbose
+
+def Norm2dBatchFold( running_mean # in_channel
+                   , running_var  # in_channel
+                   , scale=None   # None or in_channel (default 1)
+                   , bias=None    # None or in_channel (default 0)
+                   , epsilon=1E-5
+                   , rigor=False
+                   , verbose=False):
+    """
+    Returns (coef_a, coef_b) on success, otherwize returns (None, None)
+    Folds batch normalization into per-channel coefficients for Norm2dBatchPrepared(),
+    which should be done once when the model is loaded, i.e.,
+        coef_a = scale/sqrt(running_var+epsilon)
+        coef_b = bias-running_mean*coef_a
+    :param running_mean: running_mean[in_channel]
+    :param running_var: running_var[in_channel]
+    :param scale: None or scale[in_channel] (gamma, i.e., weight of batch normalization)
+    :param bias: None or bias[in_channel] (beta, i.e., bias of batch normalization)
+    :param epsilon: noise for regularization
+    :param rigor: check values rigorously when 'True'
+    :param verbose: output message more when 'True'
+    :return: (coef_a, coef_b) of NumPy on success, (None, None) on failure.
+    """
+    in_channel = running_mean.size
+    if rigor:
+       error =0
+       for name, value in [('running_var',running_var), ('scale',scale), ('bias',bias)]:
+           if (value is not None) and (value.size!=0) and (value.size!=in_channel):
+               error += 1
+               if verbose: dlr_common.DlrError(f"{name} should be in_channel: {value.shape}", flush=True)
+       if (error!=0):
+           dlr_common.DlrError("parameter mis-match", flush=True)
+           return None, None
+    _Fold, _ctype = dlr_common.GetFunction('Norm2dBatchFold', running_mean.dtype)
+    if _Fold is None:
+        dlr_common.DlrError(" not support "+str(running_mean.dtype.type), flush=True)
+        return None, None
+    def _Pointer(value):
+        if (value is None) or (value.size==0): return ctypes.POINTER(_ctype)(), ctypes.c_ushort(0)
+        value = np.ascontiguousarray(value)
+        return value.ctypes.data_as(ctypes.POINTER(_ctype)), ctypes.c_ushort(value.size)
+    coef_a = np.empty([in_channel], dtype=running_mean.dtype)
+    coef_b = np.empty([in_channel], dtype=running_mean.dtype)
+    CP_scale, CP_scale_size = _Pointer(scale)
+    CP_bias,  CP_bias_size  = _Pointer(bias)
+    _Fold(coef_a.ctypes.data_as(ctypes.POINTER(_ctype))
+         ,coef_b.ctypes.data_as(ctypes.POINTER(_ctype))
+         ,np.ascontiguousarray(running_mean).ctypes.data_as(ctypes.POINTER(_ctype))
+         ,np.ascontiguousarray(running_var).ctypes.data_as(ctypes.POINTER(_ctype))
+         ,CP_scale
+         ,CP_bias
+         ,CP_scale_size
+         ,CP_bias_size
+         ,ctypes.c_ushort(in_channel)
+         ,ctypes.c_float(epsilon)
+         ,1 if rigor else 0
+         ,1 if verbose else 0)
+    return coef_a, coef_b
+
+#===============================================================================
+dlr_common.RegisterSignature('Norm2dBatchPrepared'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # out data
+                                             ,ctypes.POINTER(_ctype) # in data
+                                             ,ctypes.POINTER(_ctype) # coef_a
+                                             ,ctypes.POINTER(_ctype) # coef_b
+                                             ,ctypes.c_uint    # in_size
+                                             ,ctypes.c_ushort  # in_channel
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ])  # verbose
+
+dlr_common.RegisterSignature('Norm2dBatchPreparedBatch'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # out data
+                                             ,ctypes.POINTER(_ctype) # in data
+                                             ,ctypes.POINTER(_ctype) # coef_a
+                                             ,ctypes.POINTER(_ctype) # coef_b
+                                             ,ctypes.c_uint    # in_size
+                                             ,ctypes.c_ushort  # in_channel
+                                             ,ctypes.c_ushort  # minibatch
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ])  # verbose
+
+def Norm2dBatchPrepared( out_data # in_channel x ...
+                       , in_data  # in_channel x ...
+                       , coef_a   # in_channel
+                       , coef_b   # in_channel
+                       , rigor=False
+                       , verbose=False
+                       , inplace=False):
+    """
+    Returns True on success, otherwize returns False
+    Applies batch normalization by coefficients folded by Norm2dBatchFold(),
+    i.e., one multiply-add for each element, which is the same as Norm2dBatch().
+    Note that all nd-array lists are NumPy (mutable) and contiguous.
+    :param out_data: <mutable> output data, out_data[channel][...]
+    :param in_data: input data, in_data[channel][...]
+    :param coef_a: coef_a[channel] (see Norm2dBatchFold())
+    :param coef_b: coef_b[channel] (see Norm2dBatchFold())
+    :param rigor: check values rigorously when 'True'
+    :param verbose: output message more when 'True'
+    :param inplace: write results into 'in_data', i.e., 'out_data' may be None or 'in_data' itself
+    :return: 'True' on success, 'False' on failure.
+    """
+    return _Norm2dBatchPrepared('Norm2dBatchPrepared', out_data, in_data, coef_a, coef_b
+                               , 0, rigor, verbose, inplace)
+
+def Norm2dBatchPreparedBatch( out_data # minibatch x in_channel x ...
+                            , in_data  # minibatch x in_channel x ...
+                            , coef_a   # in_channel
+                            , coef_b   # in_channel
+                            , rigor=False
+                            , verbose=False
+                            , inplace=False):
+    """
+    Returns True on success, otherwize returns False
+    Minibatch version of Norm2dBatchPrepared() by a single call of the C routine.
+    :param out_data: <mutable> output data, out_data[minibatch][channel][...]
+    :param in_data: input data, in_data[minibatch][channel][...]
+    :return: 'True' on success, 'False' on failure.
+    """
+    return _Norm2dBatchPrepared('Norm2dBatchPreparedBatch', out_data, in_data, coef_a, coef_b
+                               , 1, rigor, verbose, inplace)
+
+def _Norm2dBatchPrepared(op, out_data, in_data, coef_a, coef_b, batch, rigor, verbose, inplace):
+    out_data = dlr_common.GetInplaceOutput(out_data, in_data, inplace)
+    if out_data is None: return False
+    if rigor:
+       error =0
+       if (out_data.shape!=in_data.shape) or (in_data.ndim<batch+1):
+           error += 1
+           if verbose: dlr_common.DlrError("out_data in_data dimension mis-match", flush=True)
+       if (coef_a.size!=in_data.shape[batch]) or (coef_b.size!=in_data.shape[batch]):
+           error += 1
+           if verbose: dlr_common.DlrError("coef_a/b size mis-match", flush=True)
+       if (error!=0):
+           dlr_common.DlrError("parameter mis-match", flush=True)
+           return False
+    _Norm2dBatch, _ctype = dlr_common.GetFunction(op, out_data.dtype)
+    if _Norm2dBatch is None:
+        dlr_common.DlrError(" not support "+str(out_data.dtype.type), flush=True)
+        return False
+    minibatch  = in_data.shape[0] if batch else 1
+    in_channel = in_data.shape[batch]
+    in_size    = int(in_data.size/(minibatch*in_channel)) # num of elements per channel
+    args = [out_data.ctypes.data_as(ctypes.POINTER(_ctype))
+           ,in_data.ctypes.data_as(ctypes.POINTER(_ctype))
+           ,coef_a.ctypes.data_as(ctypes.POINTER(_ctype))
+           ,coef_b.ctypes.data_as(ctypes.POINTER(_ctype))
+           ,ctypes.c_uint(in_size)
+           ,ctypes.c_ushort(in_channel)]
+    if batch: args.append(ctypes.c_ushort(minibatch))
+    _Norm2dBatch(*args, 1 if rigor else 0, 1 if verbose else 0)
+    return True
+
 #===============================================================================
 if __name__=='__main__':
     def TestNorm2dBatch(_dtype):
@@ -208,6 +469,29 @@ if __name__=='__main__':
             dlr_common.DlrPrint(f"bias:\n{bias}", flush=True)
             dlr_common.DlrPrint(f"epsilon:\n{epsilon}", flush=True)
 
+    def TestNorm2dBatchPrepared(_dtype):
+        """
+        Compares Norm2dBatchPrepared() with folded coefficients against Norm2dBatch()
+        """
+        in_data      = np.random.uniform(-10, 10, size=[4, 8, 6, 6]).astype(_dtype)
+        running_mean = np.random.uniform(-1, 1, size=[8]).astype(_dtype)
+        running_var  = np.random.uniform(0.5, 2, size=[8]).astype(_dtype)
+        scale        = np.random.uniform(-2, 2, size=[8]).astype(_dtype)
+        bias         = np.random.uniform(-2, 2, size=[8]).astype(_dtype)
+        expect       = np.empty_like(in_data)
+        Norm2dBatchBatch(expect, in_data, running_mean, running_var, scale, bias, rigor=True)
+        coef_a, coef_b = Norm2dBatchFold(running_mean, running_var, scale, bias, rigor=True)
+        out_data = np.empty_like(in_data)
+        status = Norm2dBatchPreparedBatch(out_data, in_data, coef_a, coef_b, rigor=True)
+        diff = np.max(np.abs(out_data-expect))
+        dlr_common.DlrPrint(f"Norm2dBatchPreparedBatch: max abs diff {diff:.3e}"
+                           +(" OK" if status and diff<1E-4 else " mis-match"), flush=True)
+        out_data = np.empty_like(in_data[0])
+        status = Norm2dBatchPrepared(out_data, in_data[0], coef_a, coef_b, rigor=True)
+        diff = np.max(np.abs(out_data-expect[0]))
+        dlr_common.DlrPrint(f"Norm2dBatchPrepared: max abs diff {diff:.3e}"
+                           +(" OK" if status and diff<1E-4 else " mis-match"), flush=True)
+
 #===============================================================================
 if __name__=='__main__':
     dlr_common.DlrPrint("Testing Norm2dBatch", flush=True)
@@ -215,10 +499,14 @@ if __name__=='__main__':
     #TestNorm2dBatch(_dtype=np.int32)
     TestNorm2dBatch(_dtype=np.float32)
     #TestNorm2dBatch(_dtype=np.float64)
+    TestNorm2dBatchPrepared(_dtype=np.float32)
 
 #===============================================================================
 # Revision history:
 #
+# 2026.10.18: 'Norm2dBatchFold' and 'Norm2dBatchPrepared[Batch]' added
+# 2026.10.18: 'inplace' added
+# 2026.10.18: 'Norm2dBatchBatch' added for minibatch
 # 2020.09.30: argument order of bias and bias_size changed
 # 2020.04.25: Started by Ando Ki (adki@future-ds.com)
 #===============================================================================
@@ -0,0 +1,426 @@
+#!/usr/bin/env python
+"""
+This file contains Python interface of packed_weights.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+#-------------------------------------------------------------------------------
+__author__     = "Ando Ki"
+__copyright__  = "Copyright 2020, Future Design Systems"
+__credits__    = ["none", "some"]
+__license__    = "FUTURE DESIGN SYSTEMS SOFTWARE END-USER LICENSE AGREEMENT"
+__version__    = "0"
+__revision__   = "1"
+__maintainer__ = "Ando Ki"
+__email__      = "contact@future-ds.com"
+__status__     = "Development"
+__date__       = "2026.10.18"
+__description__= "Python interface of packed_weights"
+
+#-------------------------------------------------------------------------------
+import ctypes
+import ctypes.util
+import numpy as np
+from python.modules import dlr_common
+
+#===============================================================================
+_PackedWeightsFree = dlr_common.WrapFunction(dlr_common._dlr, 'PackedWeightsFree'
+                                            , ctypes.c_int, [ctypes.c_void_p])
+
+class PackedWeights:
+    """
+    Handle of weights and bias reordered once by the C routine,
+    which is released when this object is deleted.
+    . op: 'Convolution2d' or 'Linear1d'
+    . dtype: NumPy data type of weights
+    . shape: shape of the original weights
+    """
+    def __init__(self, handle, op, dtype, shape):
+        self.handle = handle
+        self.op     = op
+        self.dtype  = dtype
+        self.shape  = shape
+
+    def __del__(self):
+        if self.handle: _PackedWeightsFree(self.handle)
+        self.handle = None
+
+#===============================================================================
+dlr_common.RegisterSignature('PackedWeightsConvolution2d'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # kernels
+                                             ,ctypes.POINTER(_ctype) # bias
+                                             ,ctypes.c_ubyte   # kernel_size (only for square filter)
+                                             ,ctypes.c_ushort  # bias_size
+                                             ,ctypes.c_ushort  # in_channel
+                                             ,ctypes.c_ushort  # out_channel
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ]   # verbose
+                            , ctypes.c_void_p)
+
+def PackWeightsConvolution2d( kernel      # out_channel x in_channel x kernel_size x kernel_size
+                            , bias=None   # out_channel
+                            , rigor=False
+                            , verbose=False):
+    """
+    Returns PackedWeights on success, otherwize returns None
+    Reorders kernel once into the layout of GEMM and keeps it with bias.
+    :param kernel: kernel (or filter), kernel[out_channel][in_channel][kernel_size][kernel_size]
+    :param bias: bias for each filter (kernel), bias[out_channel]
+    :param rigor: check values rigorously when 'True'
+    :param verbose: output message more when 'True'
+    :return: PackedWeights on success, None on failure.
+    """
+    if rigor or dlr_common.rigor:
+       error =0
+       if (kernel.ndim!=4):
+           error += 1
+           if verbose: dlr_common.DlrError("kernel is not 4 dim", flush=True)
+       if (bias is not None) and (bias.ndim!=1):
+           error += 1
+           if verbose: dlr_common.DlrError(f"bias should be 1 dim: {bias.ndim}", flush=True)
+       if (error!=0):
+           dlr_common.DlrError(" parameter mis-match", flush=True)
+           return None
+    _Pack, _ctype = dlr_common.GetFunction('PackedWeightsConvolution2d', kernel.dtype)
+    if _Pack is None:
+        dlr_common.DlrError(" not support "+str(kernel.dtype.type), flush=True)
+        return None
+    t_kernel       = np.ascontiguousarray(kernel)
+    CP_kernel      = t_kernel.ctypes.data_as(ctypes.POINTER(_ctype))
+    CP_kernel_size = ctypes.c_ubyte (kernel.shape[3]) # note ndim (i.e., rank) is 4
+    CP_in_channel  = ctypes.c_ushort(kernel.shape[1])
+    CP_out_channel = ctypes.c_ushort(kernel.shape[0])
+    CP_rigor       = 1 if rigor else 0
+    CP_verbose     = 1 if verbose else 0
+    if (bias is None) or (bias.size == 0):
+       CP_bias        = ctypes.POINTER(_ctype)()
+       CP_bias_size   = ctypes.c_ushort(0)
+    else:
+       CP_bias        = bias.ctypes.data_as(ctypes.POINTER(_ctype))
+       CP_bias_size   = ctypes.c_ushort(bias.shape[0])
+    handle = _Pack(CP_kernel
+                  ,CP_bias
+                  ,CP_kernel_size
+                  ,CP_bias_size
+                  ,CP_in_channel
+                  ,CP_out_channel
+                  ,CP_rigor
+                  ,CP_verbose)
+    if not handle: return None
+    return PackedWeights(handle, 'Convolution2d', kernel.dtype.type, kernel.shape)
+
+#===============================================================================
+dlr_common.RegisterSignature('PackedWeightsLinear1d'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # weight
+                                             ,ctypes.POINTER(_ctype) # bias
+                                             ,ctypes.c_ushort  # out_size
+                                             ,ctypes.c_ushort  # in_size
+                                             ,ctypes.c_ushort  # bias_size
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ]   # verbose
+                            , ctypes.c_void_p)
+
+def PackWeightsLinear1d( weight      # out_size x in_size
+                       , bias=None   # out_size
+                       , rigor=False
+                       , verbose=False):
+    """
+    Returns PackedWeights on success, otherwize returns None
+    Reorders weight once into the layout of GEMM and keeps it with bias.
+    :param weight: weight[out_size][in_size]
+    :param bias: bias[out_size]
+    :param rigor: check values rigorously when 'True'
+    :param verbose: output message more when 'True'
+    :return: PackedWeights on success, None on failure.
+    """
+    if rigor or dlr_common.rigor:
+       error =0
+       if (weight.ndim!=2):
+           error += 1
+           if verbose: dlr_common.DlrError("weight is not 2 dim", flush=True)
+       if (bias is not None) and (bias.ndim!=1):
+           error += 1
+           if verbose: dlr_common.DlrError(f"bias should be 1 dim: {bias.ndim}", flush=True)
+       if (error!=0):
+           dlr_common.DlrError(" parameter mis-match", flush=True)
+           return None
+    _Pack, _ctype = dlr_common.GetFunction('PackedWeightsLinear1d', weight.dtype)
+    if _Pack is None:
+        dlr_common.DlrError(" not support "+str(weight.dtype.type), flush=True)
+        return None
+    t_weight     = np.ascontiguousarray(weight)
+    CP_weight    = t_weight.ctypes.data_as(ctypes.POINTER(_ctype))
+    CP_out_size  = ctypes.c_ushort(weight.shape[0])
+    CP_in_size   = ctypes.c_ushort(weight.shape[1])
+    CP_rigor     = 1 if rigor else 0
+    CP_verbose   = 1 if verbose else 0
+    if (bias is None) or (bias.size == 0):
+       CP_bias      = ctypes.POINTER(_ctype)()
+       CP_bias_size = ctypes.c_ushort(0)
+    else:
+       CP_bias      = bias.ctypes.data_as(ctypes.POINTER(_ctype))
+       CP_bias_size = ctypes.c_ushort(bias.shape[0])
+    handle = _Pack(CP_weight
+                  ,CP_bias
+                  ,CP_out_size
+                  ,CP_in_size
+                  ,CP_bias_size
+                  ,CP_rigor
+                  ,CP_verbose)
+    if not handle: return None
+    return PackedWeights(handle, 'Linear1d', weight.dtype.type, weight.shape)
+
+#===============================================================================
+def _CheckPacked(op, packed, out_data):
+    if (packed is None) or (packed.op!=op) or (not packed.handle):
+        dlr_common.DlrError(f" packed weights should be {op}", flush=True)
+        return False
+    if (packed.dtype!=out_data.dtype.type):
+        dlr_common.DlrError(f" data type mis-match: {packed.dtype} {out_data.dtype.type}", flush=True)
+        return False
+    return True
+
+dlr_common.RegisterSignature('Convolution2dPacked'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # output features
+                                             ,ctypes.POINTER(_ctype) # input image
+                                             ,ctypes.c_void_p  # packed weights
+                                             ,ctypes.c_ushort  # out_size
+                                             ,ctypes.c_ushort  # in_size
+                                             ,ctypes.c_ubyte   # stride
+                                             ,ctypes.c_ubyte   # padding
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ])  # verbose
+
+dlr_common.RegisterSignature('Convolution2dPackedBatch'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # output features
+                                             ,ctypes.POINTER(_ctype) # input image
+                                             ,ctypes.c_void_p  # packed weights
+                                             ,ctypes.c_ushort  # out_size
+                                             ,ctypes.c_ushort  # in_size
+                                             ,ctypes.c_ushort  # minibatch
+                                             ,ctypes.c_ubyte   # stride
+                                             ,ctypes.c_ubyte   # padding
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ])  # verbose
+
+def Convolution2dPacked( out_data    # out_channel x out_size x out_size
+                       , in_data     # in_channel x in_size x in_size
+                       , packed      # PackedWeights from PackWeightsConvolution2d()
+                       , stride=1
+                       , padding=0
+                       , rigor=False
+                       , verbose=False):
+    """
+    Returns True on success, otherwize returns False
+    Applies a 2D convolution with kernel and bias of PackWeightsConvolution2d().
+    :param out_data: <mutable> output data, out_data[out_channel][out_size][out_size]
+    :param in_data: input data, in_data[in_channel][in_size][in_size]
+    :param packed: PackedWeights from PackWeightsConvolution2d()
+    :param stride: num of skips to apply next filter
+    :param padding: num of pixes at the boundary
+    :param rigor: check values rigorously when 'True'
+    :param verbose: output message more when 'True'
+    :return: 'True' on success, 'False' on failure.
+    """
+    if not _CheckPacked('Convolution2d', packed, out_data): return False
+    if rigor or dlr_common.rigor:
+       error =0
+       if (out_data.ndim!=3) or (in_data.ndim!=3):
+           error += 1
+           if verbose: dlr_common.DlrError("out_data and in_data should be 3 dim", flush=True)
+       if (in_data.shape[0]!=packed.shape[1]) or (out_data.shape[0]!=packed.shape[0]):
+           error += 1
+           if verbose: dlr_common.DlrError("channel mis-match", flush=True)
+       if (error!=0):
+           dlr_common.DlrError(" parameter mis-match", flush=True)
+           return False
+    _Conv2d, _ctype = dlr_common.GetFunction('Convolution2dPacked', out_data.dtype)
+    if _Conv2d is None:
+        dlr_common.DlrError(" not support "+str(out_data.dtype.type), flush=True)
+        return False
+    _Conv2d(out_data.ctypes.data_as(ctypes.POINTER(_ctype))
+           ,in_data.ctypes.data_as(ctypes.POINTER(_ctype))
+           ,packed.handle
+           ,ctypes.c_ushort(out_data.shape[2]) # out_size
+           ,ctypes.c_ushort(in_data.shape[2]) # in_size
+           ,ctypes.c_ubyte (stride)
+           ,ctypes.c_ubyte (padding)
+           ,1 if rigor else 0
+           ,1 if verbose else 0)
+    return True
+
+def Convolution2dPackedBatch( out_data    # minibatch x out_channel x out_size x out_size
+                            , in_data     # minibatch x in_channel x in_size x in_size
+                            , packed      # PackedWeights from PackWeightsConvolution2d()
+                            , stride=1
+                            , padding=0
+                            , rigor=False
+                            , verbose=False):
+    """
+    Returns True on success, otherwize returns False
+    Applies a 2D convolution over a minibatch with kernel and bias of PackWeightsConvolution2d().
+    :param out_data: <mutable> output data, out_data[minibatch][out_channel][out_size][out_size]
+    :param in_data: input data, in_data[minibatch][in_channel][in_size][in_size]
+    :param packed: PackedWeights from PackWeightsConvolution2d()
+    :param stride: num of skips to apply next filter
+    :param padding: num of pixes at the boundary
+    :param rigor: check values rigorously when 'True'
+    :param verbose: output message more when 'True'
+    :return: 'True' on success, 'False' on failure.
+    """
+    if not _CheckPacked('Convolution2d', packed, out_data): return False
+    if rigor or dlr_common.rigor:
+       error =0
+       if (out_data.ndim!=4) or (in_data.ndim!=4):
+           error += 1
+           if verbose: dlr_common.DlrError("out_data and in_data should be 4 dim", flush=True)
+       if (out_data.shape[0]!=in_data.shape[0]):
+           error += 1
+           if verbose: dlr_common.DlrError("minibatch mis-match", flush=True)
+       if (error!=0):
+           dlr_common.DlrError(" parameter mis-match", flush=True)
+           return False
+    _Conv2d, _ctype = dlr_common.GetFunction('Convolution2dPackedBatch', out_data.dtype)
+    if _Conv2d is None:
+        dlr_common.DlrError(" not support "+str(out_data.dtype.type), flush=True)
+        return False
+    _Conv2d(out_data.ctypes.data_as(ctypes.POINTER(_ctype))
+           ,in_data.ctypes.data_as(ctypes.POINTER(_ctype))
+           ,packed.handle
+           ,ctypes.c_ushort(out_data.shape[3]) # out_size
+           ,ctypes.c_ushort(in_data.shape[3]) # in_size
+           ,ctypes.c_ushort(in_data.shape[0]) # minibatch
+           ,ctypes.c_ubyte (stride)
+           ,ctypes.c_ubyte (padding)
+           ,1 if rigor else 0
+           ,1 if verbose else 0)
+    return True
+
+#===============================================================================
+dlr_common.RegisterSignature('Linear1dPacked'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # out data
+                                             ,ctypes.POINTER(_ctype) # in data
+                                             ,ctypes.c_void_p  # packed weights
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ])  # verbose
+
+dlr_common.RegisterSignature('Linear1dPackedBatch'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # out data
+                                             ,ctypes.POINTER(_ctype) # in data
+                                             ,ctypes.c_void_p  # packed weights
+                                             ,ctypes.c_ushort  # minibatch
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int ])  # verbose
+
+def Linear1dPacked( out_data    # out_size
+                  , in_data     # in_size
+                  , packed      # PackedWeights from PackWeightsLinear1d()
+                  , rigor=False
+                  , verbose=False):
+    """
+    Returns True on success, otherwize returns False
+    Applies a 1D vector matrix multiplication with weight and bias of PackWeightsLinear1d().
+    :param out_data: <mutable> output data, out_data[out_size]
+    :param in_data: input data, in_data[in_size]
+    :param packed: PackedWeights from PackWeightsLinear1d()
+    :param rigor: check values rigorously when 'True'
+    :param verbose: output message more when 'True'
+    :return: 'True' on success, 'False' on failure.
+    """
+    if not _CheckPacked('Linear1d', packed, out_data): return False
+    if rigor or dlr_common.rigor:
+       if (out_data.shape[-1]!=packed.shape[0]) or (in_data.shape[-1]!=packed.shape[1]):
+           dlr_common.DlrError(" parameter mis-match", flush=True)
+           return False
+    _Linear1d, _ctype = dlr_common.GetFunction('Linear1dPacked', out_data.dtype)
+    if _Linear1d is None:
+        dlr_common.DlrError(" not support "+str(out_data.dtype.type), flush=True)
+        return False
+    _Linear1d(out_data.ctypes.data_as(ctypes.POINTER(_ctype))
+             ,in_data.ctypes.data_as(ctypes.POINTER(_ctype))
+             ,packed.handle
+             ,1 if rigor else 0
+             ,1 if verbose else 0)
+    return True
+
+def Linear1dPackedBatch( out_data    # minibatch x out_size
+                       , in_data     # minibatch x in_size
+                       , packed      # PackedWeights from PackWeightsLinear1d()
+                       , rigor=False
+                       , verbose=False):
+    """
+    Returns True on success, otherwize returns False
+    Applies a 1D vector matrix multiplication over a minibatch with weight and bias of PackWeightsLinear1d().
+    :param out_data: <mutable> output data, out_data[minibatch][out_size]
+    :param in_data: input data, in_data[minibatch][in_size]
+    :param packed: PackedWeights from PackWeightsLinear1d()
+    :param rigor: check values rigorously when 'True'
+    :param verbose: output message more when 'True'
+    :return: 'True' on success, 'False' on failure.
+    """
+    if not _CheckPacked('Linear1d', packed, out_data): return False
+    if rigor or dlr_common.rigor:
+       if (out_data.shape[0]!=in_data.shape[0]):
+           dlr_common.DlrError(" minibatch mis-match", flush=True)
+           return False
+    _Linear1d, _ctype = dlr_common.GetFunction('Linear1dPackedBatch', out_data.dtype)
+    if _Linear1d is None:
+        dlr_common.DlrError(" not support "+str(out_data.dtype.type), flush=True)
+        return False
+    _Linear1d(out_data.ctypes.data_as(ctypes.POINTER(_ctype))
+             ,in_data.ctypes.data_as(ctypes.POINTER(_ctype))
+             ,packed.handle
+             ,ctypes.c_ushort(in_data.shape[0]) # minibatch
+             ,1 if rigor else 0
+             ,1 if verbose else 0)
+    return True
+
+#===============================================================================
+if __name__=='__main__':
+    from python.modules.convolution_2d_wrapper import Convolution2dBatch
+    from python.modules.linear_1d_wrapper import Linear1dBatch
+
+    def TestPackedWeights(_dtype):
+        """
+        _dtype: specify data type of data one of {np.int32, np.float32, np.float64}
+        """
+        rng = np.random.default_rng(0)
+        minibatch, in_channel, in_size, out_channel, kernel_size = 2, 3, 11, 5, 3
+        for stride, padding in [(1,0), (1,1), (2,1)]:
+            out_size = ((in_size-kernel_size+2*padding)//stride)+1
+            in_data  = rng.integers(-9, 10, [minibatch,in_channel,in_size,in_size]).astype(_dtype)
+            kernel   = rng.integers(-3, 4, [out_channel,in_channel,kernel_size,kernel_size]).astype(_dtype)
+            bias     = rng.integers(-3, 4, [out_channel]).astype(_dtype)
+            out_ref  = np.empty([minibatch,out_channel,out_size,out_size], dtype=_dtype)
+            out_pack = np.empty([minibatch,out_channel,out_size,out_size], dtype=_dtype)
+            Convolution2dBatch(out_ref, in_data, kernel, bias, stride, padding, algorithm='reference')
+            packed = PackWeightsConvolution2d(kernel, bias)
+            Convolution2dPackedBatch(out_pack, in_data, packed, stride, padding)
+            dlr_common.DlrPrint(f"Convolution2dPacked {np.dtype(_dtype)} stride={stride} padding={padding}"
+                                f" {'OK' if np.allclose(out_ref, out_pack) else 'mis-match'}", flush=True)
+        in_data  = rng.integers(-9, 10, [minibatch,17]).astype(_dtype)
+        weight   = rng.integers(-3, 4, [7,17]).astype(_dtype)
+        bias     = rng.integers(-3, 4, [7]).astype(_dtype)
+        out_ref  = np.empty([minibatch,7], dtype=_dtype)
+        out_pack = np.empty([minibatch,7], dtype=_dtype)
+        Linear1dBatch(out_ref, in_data, weight, bias)
+        packed = PackWeightsLinear1d(weight, bias)
+        Linear1dPackedBatch(out_pack, in_data, packed)
+        dlr_common.DlrPrint(f"Linear1dPacked {np.dtype(_dtype)}"
+                            f" {'OK' if np.allclose(out_ref, out_pack) else 'mis-match'}", flush=True)
+
+#===============================================================================
+if __name__=='__main__':
+    dlr_common.DlrPrint("Testing PackedWeights", flush=True)
+    dlr_common.DlrPrint("*********************", flush=True)
+    TestPackedWeights(_dtype=np.int32)
+    TestPackedWeights(_dtype=np.float32)
+    TestPackedWeights(_dtype=np.float64)
+
+#===============================================================================
+# Revision history:
+#
+# 2026.10.18: Started.
+#===============================================================================
@@ -0,0 +1,293 @@
+#!/usr/bin/env python
+"""
+This file contains Python interface of pooling_2d_adaptive.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+#-------------------------------------------------------------------------------
+__author__     = "Ando Ki"
+__copyright__  = "Copyright 2020, Future Design Systems"
+__credits__    = ["none", "some"]
+__license__    = "FUTURE DESIGN SYSTEMS SOFTWARE END-USER LICENSE AGREEMENT"
+__version__    = "0"
+__revision__   = "1"
+__maintainer__ = "Ando Ki"
+__email__      = "contact@future-ds.com"
+__status__     = "Development"
+__date__       = "2026.10.18"
+__description__= "Python interface of pooling_2d_adaptive"
+
+#-------------------------------------------------------------------------------
+import ctypes
+import ctypes.util
+import numpy as np
+import math
+from python.modules import dlr_common
+
+#===============================================================================
+def GetWindowsOfPooling2dAdaptive( out_size
+                                 , in_size ):
+    """
+    Returns a list of (lo, hi) window of each output index as PyTorch,
+    i.e., from floor(k*in_size/out_size) to ceil((k+1)*in_size/out_size)
+    :param out_size:
+    :param in_size:
+    """
+    return [((k*in_size)//out_size, -((-(k+1)*in_size)//out_size)) for k in range(out_size)]
+
+#===============================================================================
+# Pooling2dGlobal<Avg|Max><Type>() and Pooling2dAdaptive<Avg|Max><Type>()
+# of Int/Float/Double/Half/BFloat16 (software-only)
+for _op in ['Pooling2dGlobalAvg', 'Pooling2dGlobalMax']:
+    dlr_common.RegisterSignature(_op
+                                , lambda _ctype: [ctypes.POINTER(_ctype) # output features
+                                                 ,ctypes.POINTER(_ctype) # input image
+                                                 ,ctypes.c_ushort  # in_size
+                                                 ,ctypes.c_ushort  # channel
+                                                 ,ctypes.c_int     # rigor
+                                                 ,ctypes.c_int     # verbose
+                                                 ])
+    dlr_common.RegisterSignature(_op+'Batch'
+                                , lambda _ctype: [ctypes.POINTER(_ctype) # output features
+                                                 ,ctypes.POINTER(_ctype) # input image
+                                                 ,ctypes.c_ushort  # in_size
+                                                 ,ctypes.c_ushort  # channel
+                                                 ,ctypes.c_ushort  # minibatch
+                                                 ,ctypes.c_int     # rigor
+                                                 ,ctypes.c_int     # verbose
+                                                 ])
+for _op in ['Pooling2dAdaptiveAvg', 'Pooling2dAdaptiveMax']:
+    dlr_common.RegisterSignature(_op
+                                , lambda _ctype: [ctypes.POINTER(_ctype) # output features
+                                                 ,ctypes.POINTER(_ctype) # input image
+                                                 ,ctypes.c_ushort  # out_size
+                                                 ,ctypes.c_ushort  # in_size
+                                                 ,ctypes.c_ushort  # channel
+                                                 ,ctypes.c_int     # rigor
+                                                 ,ctypes.c_int     # verbose
+                                                 ])
+    dlr_common.RegisterSignature(_op+'Batch'
+                                , lambda _ctype: [ctypes.POINTER(_ctype) # output features
+                                                 ,ctypes.POINTER(_ctype) # input image
+                                                 ,ctypes.c_ushort  # out_size
+                                                 ,ctypes.c_ushort  # in_size
+                                                 ,ctypes.c_ushort  # channel
+                                                 ,ctypes.c_ushort  # minibatch
+                                                 ,ctypes.c_int     # rigor
+                                                 ,ctypes.c_int     # verbose
+                                                 ])
+
+def _Pooling2dAdaptive( op
+                      , out_data
+                      , in_data
+                      , rigor=False
+                      , verbose=False):
+    """
+    Calls 'op' of Pooling2dGlobal<Avg|Max>[Batch] or Pooling2dAdaptive<Avg|Max>[Batch],
+    where 'Batch' takes 4 dim of in_data and the others take 3 dim.
+    """
+    batch  = op.endswith('Batch')
+    adaptive = op.startswith('Pooling2dAdaptive')
+    in_ndim  = 4 if batch else 3
+    out_ndim = (in_ndim if adaptive else in_ndim-2)
+    if rigor:
+       error =0
+       if (in_data.ndim!=in_ndim):
+           error += 1
+           if verbose: dlr_common.DlrError(f"in_data is not {in_ndim} dim")
+       if (out_data.ndim!=out_ndim):
+           error += 1
+           if verbose: dlr_common.DlrError(f"out_data is not {out_ndim} dim")
+       if (out_data.shape[0:in_ndim-2]!=in_data.shape[0:in_ndim-2]):
+           error += 1
+           if verbose: dlr_common.DlrError("minibatch or channel mis-match")
+       if (in_data.shape[-1]!=in_data.shape[-2]) or (adaptive and (out_data.shape[-1]!=out_data.shape[-2])):
+           error += 1
+           if verbose: dlr_common.DlrError("only for square matrix")
+       if (error!=0):
+           dlr_common.DlrError("parameter mis-match");
+           return False
+    _Pooling2d, _ctype = dlr_common.GetFunction(op, out_data.dtype)
+    if _Pooling2d is None:
+        dlr_common.DlrError("not support "+str(out_data.dtype.type))
+        return False
+    CP_out_data  = out_data.ctypes.data_as(ctypes.POINTER(_ctype))
+    CP_in_data   = in_data.ctypes.data_as(ctypes.POINTER(_ctype))
+    CP_in_size   = ctypes.c_ushort(in_data.shape[-1])
+    CP_channel   = ctypes.c_ushort(in_data.shape[-3])
+    CP_rigor     = 1 if rigor else 0
+    CP_verbose   = 1 if verbose else 0
+    args = [CP_out_data, CP_in_data]
+    if adaptive: args.append(ctypes.c_ushort(out_data.shape[-1])) # out_size
+    args += [CP_in_size, CP_channel]
+    if batch: args.append(ctypes.c_ushort(in_data.shape[0])) # minibatch
+    _Pooling2d(*args, CP_rigor, CP_verbose)
+    return True
+
+def Pooling2dGlobalAvg( out_data # channel
+                      , in_data  # channel x in_size x in_size
+                      , rigor=False
+                      , verbose=False):
+    """
+    Returns True on success, otherwize returns False
+    Applies average of each channel as 'torch.nn.AdaptiveAvgPool2d(1)'.
+    Note that all nd-array lists are NumPy (mutable) and contiguous.
+    :param out_data: <mutable> output data, out_data[channel]
+    :param in_data: input data, in_data[channel][in_size][in_size]
+    :param rigor: check values rigorously when 'True'
+    :param verbose: output message more when 'True'
+    :return: 'True' on success, 'False' on failure.
+    """
+    return _Pooling2dAdaptive('Pooling2dGlobalAvg', out_data, in_data, rigor, verbose)
+
+def Pooling2dGlobalMax( out_data # channel
+                      , in_data  # channel x in_size x in_size
+                      , rigor=False
+                      , verbose=False):
+    """
+    Returns True on success, otherwize returns False
+    Applies max of each channel as 'torch.nn.AdaptiveMaxPool2d(1)'.
+    :param out_data: <mutable> output data, out_data[channel]
+    :param in_data: input data, in_data[channel][in_size][in_size]
+    """
+    return _Pooling2dAdaptive('Pooling2dGlobalMax', out_data, in_data, rigor, verbose)
+
+def Pooling2dAdaptiveAvg( out_data # channel x out_size x out_size
+                        , in_data  # channel x in_size x in_size
+                        , rigor=False
+                        , verbose=False):
+    """
+    Returns True on success, otherwize returns False
+    Applies average over windows of GetWindowsOfPooling2dAdaptive() as
+    'torch.nn.AdaptiveAvgPool2d(out_size)', where out_size comes from out_data.
+    Note that integer goes truncated toward zero.
+    :param out_data: <mutable> output data, out_data[channel][out_size][out_size]
+    :param in_data: input data, in_data[channel][in_size][in_size]
+    """
+    return _Pooling2dAdaptive('Pooling2dAdaptiveAvg', out_data, in_data, rigor, verbose)
+
+def Pooling2dAdaptiveMax( out_data # channel x out_size x out_size
+                        , in_data  # channel x in_size x in_size
+                        , rigor=False
+                        , verbose=False):
+    """
+    Returns True on success, otherwize returns False
+    Applies max over windows of GetWindowsOfPooling2dAdaptive() as
+    'torch.nn.AdaptiveMaxPool2d(out_size)', where out_size comes from out_data.
+    :param out_data: <mutable> output data, out_data[channel][out_size][out_size]
+    :param in_data: input data, in_data[channel][in_size][in_size]
+    """
+    return _Pooling2dAdaptive('Pooling2dAdaptiveMax', out_data, in_data, rigor, verbose)
+
+def Pooling2dGlobalAvgBatch( out_data # minibatch x channel
+                           , in_data  # minibatch x channel x in_size x in_size
+                           , rigor=False
+                           , verbose=False):
+    """
+    minibatch version of Pooling2dGlobalAvg() by a single call of the C routine
+    """
+    return _Pooling2dAdaptive('Pooling2dGlobalAvgBatch', out_data, in_data, rigor, verbose)
+
+def Pooling2dGlobalMaxBatch( out_data # minibatch x channel
+                           , in_data  # minibatch x channel x in_size x in_size
+                           , rigor=False
+                           , verbose=False):
+    """
+    minibatch version of Pooling2dGlobalMax() by a single call of the C routine
+    """
+    return _Pooling2dAdaptive('Pooling2dGlobalMaxBatch', out_data, in_data, rigor, verbose)
+
+def Pooling2dAdaptiveAvgBatch( out_data # minibatch x channel x out_size x out_size
+                             , in_data  # minibatch x channel x in_size x in_size
+                             , rigor=False
+                             , verbose=False):
+    """
+    minibatch version of Pooling2dAdaptiveAvg() by a single call of the C routine
+    """
+    return _Pooling2dAdaptive('Pooling2dAdaptiveAvgBatch', out_data, in_data, rigor, verbose)
+
+def Pooling2dAdaptiveMaxBatch( out_data # minibatch x channel x out_size x out_size
+                             , in_data  # minibatch x channel x in_size x in_size
+                             , rigor=False
+                             , verbose=False):
+    """
+    minibatch version of Pooling2dAdaptiveMax() by a single call of the C routine
+    """
+    return _Pooling2dAdaptive('Pooling2dAdaptiveMaxBatch', out_data, in_data, rigor, verbose)
+
+#===============================================================================
+if __name__=='__main__':
+    def TestPooling2dAdaptive(_dtype):
+        """
+        Compares Pooling2dGlobal<Avg|Max> and Pooling2dAdaptive<Avg|Max> against
+        each window by NumPy, where out_size of 1 is global.
+        """
+        rng = np.random.default_rng(0)
+        configs = [ (7, 1), (8, 2), (7, 3), (13, 5), (5, 7) ] # in_size, out_size
+        minibatch, channel = 2, 3
+        for in_size, out_size in configs:
+            in_data = rng.integers(-100, 100, [minibatch,channel,in_size,in_size]).astype(_dtype)
+            windows = GetWindowsOfPooling2dAdaptive(out_size, in_size)
+            for name, reduce in [('Avg', np.mean), ('Max', np.max)]:
+                expect = np.empty([minibatch,channel,out_size,out_size], dtype=np.float64)
+                for g, (y0, y1) in enumerate(windows):
+                    for k, (x0, x1) in enumerate(windows):
+                        expect[:,:,g,k] = reduce(in_data[:,:,y0:y1,x0:x1].astype(np.float64), axis=(2,3))
+                if np.issubdtype(_dtype, np.integer): expect = np.trunc(expect)
+                out_data = np.empty([minibatch,channel,out_size,out_size], dtype=_dtype)
+                status = globals()['Pooling2dAdaptive'+name+'Batch'](out_data, in_data, rigor=True)
+                if out_size==1:
+                    out_global = np.empty([channel], dtype=_dtype)
+                    status = status and globals()['Pooling2dGlobal'+name](out_global, in_data[0], rigor=True)
+                    status = status and np.array_equal(out_global, out_data[0,:,0,0])
+                diff = np.max(np.abs(out_data-expect))
+                ok = status and (diff<=(1e-5*100 if _dtype==np.float32 else 1e-12*100))
+                dlr_common.DlrPrint(f"{np.dtype(_dtype).name:8} {name} in_size={in_size:2} out_size={out_size}"
+                                    f" max abs diff {diff:.3e} "+("OK" if ok else "mis-match"))
+
+    def TestPooling2dAdaptiveFixed():
+        """
+        Compares Pooling2dAdaptive<Avg|Max>Batch() of fixed-point data against NumPy,
+        where Max should be bit-exact and Avg within an LSB of truncated division.
+        """
+        rng = np.random.default_rng(0)
+        saved = dlr_common.get_fixed_format()
+        dlr_common.set_fixed_format(16, 8, 'TRN', 'SAT')
+        lsb = 2.0**-8
+        minibatch, channel = 2, 3
+        for in_size, out_size in [ (7, 1), (8, 2), (13, 5) ]:
+            in_data = dlr_common.ToFixed(rng.uniform(-1.0, 1.0, [minibatch,channel,in_size,in_size]))
+            t_data  = dlr_common.FromFixed(in_data, np.float64)
+            windows = GetWindowsOfPooling2dAdaptive(out_size, in_size)
+            for name, reduce, limit in [('Avg', np.mean, lsb), ('Max', np.max, 0.0)]:
+                expect = np.empty([minibatch,channel,out_size,out_size], dtype=np.float64)
+                for g, (y0, y1) in enumerate(windows):
+                    for k, (x0, x1) in enumerate(windows):
+                        expect[:,:,g,k] = reduce(t_data[:,:,y0:y1,x0:x1], axis=(2,3))
+                out_data = np.empty([minibatch,channel,out_size,out_size], dtype=dlr_common.fixed)
+                status = globals()['Pooling2dAdaptive'+name+'Batch'](out_data, in_data, rigor=True)
+                if out_size==1:
+                    out_global = np.empty([channel], dtype=dlr_common.fixed)
+                    status = status and globals()['Pooling2dGlobal'+name](out_global, in_data[0], rigor=True)
+                    status = status and np.array_equal(out_global.view(np.int32), out_data[0,:,0,0].view(np.int32))
+                diff = np.max(np.abs(dlr_common.FromFixed(out_data, np.float64)-expect))
+                ok = status and (diff<=limit)
+                dlr_common.DlrPrint(f"fixed<16,8> {name} in_size={in_size:2} out_size={out_size}"
+                                    f" max abs diff {diff:.3e} "+("OK" if ok else "mis-match"))
+        dlr_common.set_fixed_format(*saved)
+
+if __name__=='__main__':
+    dlr_common.DlrPrint("Testing Pooling2dAdaptive", flush=True);
+    dlr_common.DlrPrint("**************************", flush=True)
+    for _dtype in [np.int32, np.float32, np.float64]:
+        TestPooling2dAdaptive(_dtype)
+    TestPooling2dAdaptiveFixed()
+
+#===============================================================================
+# Revision history:
+#
+# 2026.10.18: fixed-point data go '<Op>Fixed' routines
+# 2026.10.18: Started.
+#===============================================================================
@@ -53,9 +53,7 @@ def GetOutputSizeOfPooling2dAvg( in_size
        if (kernel_size<1):      
            err+=1
            if verbose: dlr_common.DlrError(f"kernel_size should be positive: {kernel_size}", flush=True)
-       if ((kernel_size%2)==1): 
-           err+=1
-           if verbose: dlr_common.DlrError(f"kernel_size should be even: {kernel_size}", flush=True)
+       # kernel_size of odd goes as well, which Pooling2dAvg() checks for its own routine
        if (stride<1):           
            err+=1
            if verbose: dlr_common.DlrError(f"stride should be larger than 0: {stride}", flush=True)
@@ -64,16 +62,50 @@ def GetOutputSizeOfPooling2dAvg( in_size
            if verbose: dlr_common.DlrError(f"padding should be positive: {padding}", flush=True)
     if ceil_mode: out_size = math.ceil(((in_size-kernel_size+2*padding)/stride)+1)
     else:         out_size = math.floor(((in_size-kernel_size+2*padding)/stride)+1)
+    if ceil_mode and ((out_size-1)*stride>=(in_size+padding)):
+        out_size -= 1 # the last window should start in input or left padding as PyTorch
     if err>0: return False, out_size
     else:     return True, out_size
 
 #===============================================================================
+dlr_common.RegisterSignature('Pooling2dAvg'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # output features
+                                             ,ctypes.POINTER(_ctype) # input image
+                                             ,ctypes.c_ushort  # out_size
+                                             ,ctypes.c_ushort  # in_size
+                                             ,ctypes.c_ubyte   # kernel_size (only for square filter)
+                                             ,ctypes.c_ushort  # channel
+                                             ,ctypes.c_ubyte   # stride
+                                             ,ctypes.c_ubyte   # padding
+                                             ,ctypes.c_int     # ceil_mode
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int     # verbose
+                                             ])
+
+# Pooling2dAvg<Int|Float|Double|Half|BFloat16>Integral of summed-area table,
+# which takes 'count_include_pad' and covers 'ceil_mode' (software-only)
+dlr_common.RegisterSignature('Pooling2dAvgIntegral'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # output features
+                                             ,ctypes.POINTER(_ctype) # input image
+                                             ,ctypes.c_ushort  # out_size
+                                             ,ctypes.c_ushort  # in_size
+                                             ,ctypes.c_ubyte   # kernel_size (only for square filter)
+                                             ,ctypes.c_ushort  # channel
+                                             ,ctypes.c_ubyte   # stride
+                                             ,ctypes.c_ubyte   # padding
+                                             ,ctypes.c_int     # ceil_mode
+                                             ,ctypes.c_int     # count_include_pad
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int     # verbose
+                                             ])
+
 def Pooling2dAvg( out_data    # out_channel x out_size x out_size
                 , in_data     # in_channel x in_size x in_size
                 , kernel_size # kernel_size x kernel_size
                 , stride=1
                 , padding=0
                 , ceil_mode=False
+                , count_include_pad=True
                 , rigor=False
                 , verbose=False):
     """
@@ -86,9 +118,11 @@ def Pooling2dAvg( out_data    # out_channel x out_size x out_size
     :param stride: num of skips to apply next filter
     :param padding: num of pixes at the boundary
     :param ceil_mode: use floor() when false, otherwize ceil()
+    :param count_include_pad: count padding for the divisor when 'True' as PyTorch
     :param rigor: check values rigorously when 'True'
     :param verbose: output message more when 'True'
     :return: 'True' on success, 'False' on failure.
+    Note that 'ceil_mode' or 'count_include_pad' of 'False' goes Pooling2dAvg<Type>Integral.
     Follwoings are derived from input arguments
     . out_size: array size of out_data
     . in_size: array size of in_data
@@ -133,12 +167,13 @@ def Pooling2dAvg( out_data    # out_channel x out_size x out_size
        status, t_out_size_expect = GetOutputSizeOfPooling2dAvg( t_in_size
                                                               , t_kernel_size
                                                               , t_stride
-                                                              , t_padding )
+                                                              , t_padding
+                                                              , ceil_mode )
        if not status: return False # something wrong with arguments
        if (t_out_size!=t_out_size_expect):
            error += 1
            if verbose: dlr_common.DlrError(f"out_size mis-match {t_out_size} {t_out_size_expect}")
-       if ((t_kernel_size%2)==1):
+       if ((t_kernel_size%2)==1) and not (ceil_mode or not count_include_pad): # Integral takes odd as well
            error += 1
            if verbose: dlr_common.DlrError(f"kernel_size should be even")
        if verbose:
@@ -152,35 +187,12 @@ def Pooling2dAvg( out_data    # out_channel x out_size x out_size
        if (error!=0):
            dlr_common.DlrError("parameter mis-match");
            return False
-    #_fname=''
-    #_ctype=''
-    if out_data.dtype.type == np.int32:
-        _fname = 'Pooling2dAvgInt'
-        _ctype = ctypes.c_int
-    elif out_data.dtype.type == np.float32:
-        _fname = 'Pooling2dAvgFloat'
-        _ctype = ctypes.c_float
-    elif out_data.dtype.type == np.float64:
-        _fname = 'Pooling2dAvgDouble'
-        _ctype = ctypes.c_double
-    else:
+    integral = ceil_mode or not count_include_pad
+    _Pooling2dAvg, _ctype = dlr_common.GetFunction('Pooling2dAvg', out_data.dtype
+                                                  , 'Integral' if integral else '')
+    if _Pooling2dAvg is None:
         dlr_common.DlrError("not support "+str(out_data.dtype.type))
         return False
-    _Pooling2dAvg=dlr_common.WrapFunction(dlr_common._dlr
-                                  ,_fname
-                                  , None          # return type
-                                  ,[ctypes.POINTER(_ctype) # output features
-                                   ,ctypes.POINTER(_ctype) # input image
-                                   ,ctypes.c_ushort  # out_size
-                                   ,ctypes.c_ushort  # in_size
-                                   ,ctypes.c_ubyte   # kernel_size (only for square filter)
-                                   ,ctypes.c_ushort  # channel
-                                   ,ctypes.c_ubyte   # stride
-                                   ,ctypes.c_ubyte   # padding
-                                   ,ctypes.c_int     # ceil_mode
-                                   ,ctypes.c_int     # rigor
-                                   ,ctypes.c_int     # verbose
-                                   ]) 
     CP_out_data    = out_data.ctypes.data_as(ctypes.POINTER(_ctype))
     CP_in_data     = in_data.ctypes.data_as(ctypes.POINTER(_ctype))
     CP_out_size    = ctypes.c_ushort(out_data.shape[2]) # note ndim (i.e., rank) is 3
@@ -190,9 +202,25 @@ def Pooling2dAvg( out_data    # out_channel x out_size x out_size
     CP_stride      = ctypes.c_ubyte(stride)
     CP_padding     = ctypes.c_ubyte(padding)
     CP_ceil_mode   = 1 if ceil_mode else 0
+    CP_count_pad   = 1 if count_include_pad else 0
     CP_rigor       = 1 if rigor else 0
     CP_verbose     = 1 if verbose else 0
 
+    if integral:
+        _Pooling2dAvg(CP_out_data
+                     ,CP_in_data
+                     ,CP_out_size
+                     ,CP_in_size
+                     ,CP_kernel_size
+                     ,CP_channel
+                     ,CP_stride
+                     ,CP_padding
+                     ,CP_ceil_mode
+                     ,CP_count_pad
+                     ,CP_rigor
+                     ,CP_verbose
+                     )
+        return True
     _Pooling2dAvg(CP_out_data    
                  ,CP_in_data      
                  ,CP_out_size    
@@ -207,6 +235,126 @@ def Pooling2dAvg( out_data    # out_channel x out_size x out_size
                  )
     return True
 
+#===============================================================================
+dlr_common.RegisterSignature('Pooling2dAvgBatch'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # output features
+                                             ,ctypes.POINTER(_ctype) # input image
+                                             ,ctypes.c_ushort  # out_size
+                                             ,ctypes.c_ushort  # in_size
+                                             ,ctypes.c_ubyte   # kernel_size (only for square filter)
+                                             ,ctypes.c_ushort  # channel
+                                             ,ctypes.c_ushort  # minibatch
+                                             ,ctypes.c_ubyte   # stride
+                                             ,ctypes.c_ubyte   # padding
+                                             ,ctypes.c_int     # ceil_mode
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int     # verbose
+                                             ])
+
+dlr_common.RegisterSignature('Pooling2dAvgBatchIntegral'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # output features
+                                             ,ctypes.POINTER(_ctype) # input image
+                                             ,ctypes.c_ushort  # out_size
+                                             ,ctypes.c_ushort  # in_size
+                                             ,ctypes.c_ubyte   # kernel_size (only for square filter)
+                                             ,ctypes.c_ushort  # channel
+                                             ,ctypes.c_ushort  # minibatch
+                                             ,ctypes.c_ubyte   # stride
+                                             ,ctypes.c_ubyte   # padding
+                                             ,ctypes.c_int     # ceil_mode
+                                             ,ctypes.c_int     # count_include_pad
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int     # verbose
+                                             ])
+
+def Pooling2dAvgBatch( out_data    # minibatch x channel x out_size x out_size
+                     , in_data     # minibatch x channel x in_size x in_size
+                     , kernel_size # kernel_size x kernel_size
+                     , stride=1
+                     , padding=0
+                     , ceil_mode=False
+                     , count_include_pad=True
+                     , rigor=False
+                     , verbose=False):
+    """
+    Returns True on success, otherwize returns False
+    Applies a 2D average-pooling over a minibatch of input data by a single call of the C routine.
+    Note that all nd-array lists are NumPy (mutable) and contiguous.
+    :param out_data: <mutable> output data, out_data[minibatch][channel][out_size][out_size]
+    :param in_data: input data, in_data[minibatch][channel][in_size][in_size]
+    :param kernel_size:
+    :param stride: num of skips to apply next filter
+    :param padding: num of pixes at the boundary
+    :param ceil_mode: use floor() when false, otherwize ceil()
+    :param count_include_pad: count padding for the divisor when 'True' as PyTorch
+    :param rigor: check values rigorously when 'True'
+    :param verbose: output message more when 'True'
+    :return: 'True' on success, 'False' on failure.
+    """
+    if rigor:
+       error =0
+       if (out_data.ndim!=4):
+           error += 1
+           if verbose: dlr_common.DlrError("out_data is not 4 dim")
+       if (in_data.ndim!=4):
+           error += 1
+           if verbose: dlr_common.DlrError("in_data is not 4 dim")
+       if (out_data.shape[0:2]!=in_data.shape[0:2]):
+           error += 1
+           if verbose: dlr_common.DlrError("minibatch or channel mis-match")
+       if (error!=0):
+           dlr_common.DlrError("parameter mis-match");
+           return False
+    integral = ceil_mode or not count_include_pad
+    _Pooling2dAvg, _ctype = dlr_common.GetFunction('Pooling2dAvgBatch', out_data.dtype
+                                                  , 'Integral' if integral else '')
+    if _Pooling2dAvg is None:
+        dlr_common.DlrError("not support "+str(out_data.dtype.type))
+        return False
+    CP_out_data    = out_data.ctypes.data_as(ctypes.POINTER(_ctype))
+    CP_in_data     = in_data.ctypes.data_as(ctypes.POINTER(_ctype))
+    CP_out_size    = ctypes.c_ushort(out_data.shape[3]) # note ndim (i.e., rank) is 4
+    CP_in_size     = ctypes.c_ushort(in_data.shape[3]) # note ndim (i.e., rank) is 4
+    CP_kernel_size = ctypes.c_ubyte(kernel_size)
+    CP_channel     = ctypes.c_ushort(in_data.shape[1])
+    CP_minibatch   = ctypes.c_ushort(in_data.shape[0])
+    CP_stride      = ctypes.c_ubyte(stride)
+    CP_padding     = ctypes.c_ubyte(padding)
+    CP_ceil_mode   = 1 if ceil_mode else 0
+    CP_rigor       = 1 if rigor else 0
+    CP_verbose     = 1 if verbose else 0
+
+    if integral:
+        _Pooling2dAvg(CP_out_data
+                     ,CP_in_data
+                     ,CP_out_size
+                     ,CP_in_size
+                     ,CP_kernel_size
+                     ,CP_channel
+                     ,CP_minibatch
+                     ,CP_stride
+                     ,CP_padding
+                     ,CP_ceil_mode
+                     ,1 if count_include_pad else 0
+                     ,CP_rigor
+                     ,CP_verbose
+                     )
+        return True
+    _Pooling2dAvg(CP_out_data
+                 ,CP_in_data
+                 ,CP_out_size
+                 ,CP_in_size
+                 ,CP_kernel_size
+                 ,CP_channel
+                 ,CP_minibatch
+                 ,CP_stride
+                 ,CP_padding
+                 ,CP_ceil_mode
+                 ,CP_rigor
+                 ,CP_verbose
+                 )
+    return True
+
 #===============================================================================
 # # Testing function
 # def _Convolution2dRef_not_yet( out_data    # out_channel x out_size x out_size
@@ -268,6 +416,36 @@ if __name__=='__main__':
             dlr_common.DlrPrint(f"in_data:\n{in_data}")
             dlr_common.DlrPrint(f"out_data:\n{out_data}")
 
+    def TestPooling2dAvgIntegral(_dtype):
+        """
+        Compares Pooling2dAvg<Type>Integral against sum of each window by NumPy
+        for 'ceil_mode' and 'count_include_pad'
+        """
+        rng = np.random.default_rng(0)
+        configs = [ (7, 3, 2, 1), (8, 2, 2, 1), (12, 6, 3, 2), (13, 5, 1, 2) ] # in_size, kernel_size, stride, padding
+        for in_size, kernel_size, stride, padding in configs:
+            for ceil_mode in [False, True]:
+                for count_include_pad in [True, False]:
+                    status, out_size = GetOutputSizeOfPooling2dAvg(in_size, kernel_size, stride, padding, ceil_mode)
+                    in_data  = rng.integers(-100, 100, [3,in_size,in_size]).astype(_dtype)
+                    out_data = np.empty([3,out_size,out_size], dtype=_dtype)
+                    expect   = np.empty([3,out_size,out_size], dtype=np.float64)
+                    for g in range(out_size):
+                        for k in range(out_size):
+                            y0, x0 = g*stride-padding, k*stride-padding
+                            y1, x1 = min(y0+kernel_size, in_size+padding), min(x0+kernel_size, in_size+padding)
+                            window = in_data[:,max(y0,0):min(y1,in_size),max(x0,0):min(x1,in_size)]
+                            count  = (y1-y0)*(x1-x0) if count_include_pad else window.shape[1]*window.shape[2]
+                            expect[:,g,k] = np.sum(window, axis=(1,2), dtype=np.float64)/count
+                    if np.issubdtype(_dtype, np.integer): expect = np.trunc(expect)
+                    status = Pooling2dAvg(out_data, in_data, kernel_size, stride, padding
+                                         , ceil_mode=ceil_mode, count_include_pad=count_include_pad)
+                    diff = np.max(np.abs(out_data-expect))
+                    ok = status and (diff<=(1e-5*100 if _dtype==np.float32 else 1e-12*100))
+                    dlr_common.DlrPrint(f"{np.dtype(_dtype).name:8} {[in_size, kernel_size, stride, padding]}"
+                                        f" ceil_mode={ceil_mode!s:5} count_include_pad={count_include_pad!s:5}"
+                                        f" out_size={out_size:2} max abs diff {diff:.3e} "+("OK" if ok else "mis-match"))
+
 if __name__=='__main__':
     dlr_common.DlrPrint("Testing Pooling2dAvg", flush=True);
     dlr_common.DlrPrint("*********************", flush=True)
@@ -275,8 +453,15 @@ if __name__=='__main__':
     #TestPooling2dAvg(_dtype=np.float32)
     #TestPooling2dAvg(_dtype=np.float64)
 
+    dlr_common.DlrPrint("Testing Pooling2dAvgIntegral", flush=True);
+    dlr_common.DlrPrint("*****************************", flush=True)
+    for _dtype in [np.int32, np.float32, np.float64]:
+        TestPooling2dAvgIntegral(_dtype)
+
 #===============================================================================
 # Revision history:
 #
+# 2026.10.18: 'count_include_pad' and 'ceil_mode' by Pooling2dAvg<Type>Integral
+# 2026.10.18: 'Pooling2dAvgBatch' added for minibatch
 # 2020.04.58: Started by Ando Ki (adki@future-ds.com)
 #===============================================================================
@@ -68,6 +68,20 @@ def GetOutputSizeOfPooling2dMax( in_size
     else:     return True, out_size
 
 #===============================================================================
+dlr_common.RegisterSignature('Pooling2dMax'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # output features
+                                             ,ctypes.POINTER(_ctype) # input image
+                                             ,ctypes.c_ushort  # out_size
+                                             ,ctypes.c_ushort  # in_size
+                                             ,ctypes.c_ubyte   # kernel_size (only for square filter)
+                                             ,ctypes.c_ushort  # channel
+                                             ,ctypes.c_ubyte   # stride
+                                             ,ctypes.c_ubyte   # padding
+                                             ,ctypes.c_int     # ceil_mode
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int     # verbose
+                                             ])
+
 def Pooling2dMax( out_data    # out_channel x out_size x out_size
                 , in_data     # in_channel x in_size x in_size
                 , kernel_size # kernel_size x kernel_size
@@ -80,6 +94,8 @@ def Pooling2dMax( out_data    # out_channel x out_size x out_size
     Returns True on success, otherwize returns False
     Applies a 2D mAXpolling over an input data composed of several input channels.
     Note that all nd-array lists are NumPy (mutable), not PyTorch tensor (immutable).
+    Note that int8 data goes Pooling2dMaxInt8, where out_data has the same scale
+    and zero point as in_data.
     :param out_data: <mutable> output data, out_data[out_channel][out_size][out_size]
     :param in_data: input data, in_data[in_channel][in_size][in_size]
     :param kernel_size:
@@ -152,35 +168,10 @@ def Pooling2dMax( out_data    # out_channel x out_size x out_size
        if (error!=0):
            dlr_common.DlrError("parameter mis-match");
            return False
-    #_fname=''
-    #_ctype=''
-    if out_data.dtype.type == np.int32:
-        _fname = 'Pooling2dMaxInt'
-        _ctype = ctypes.c_int
-    elif out_data.dtype.type == np.float32:
-        _fname = 'Pooling2dMaxFloat'
-        _ctype = ctypes.c_float
-    elif out_data.dtype.type == np.float64:
-        _fname = 'Pooling2dMaxDouble'
-        _ctype = ctypes.c_double
-    else:
+    _Pooling2dMax, _ctype = dlr_common.GetFunction('Pooling2dMax', out_data.dtype)
+    if _Pooling2dMax is None:
         dlr_common.DlrError("not support "+str(out_data.dtype.type))
         return False
-    _Pooling2dMax=dlr_common.WrapFunction(dlr_common._dlr
-                                  ,_fname
-                                  , None          # return type
-                                  ,[ctypes.POINTER(_ctype) # output features
-                                   ,ctypes.POINTER(_ctype) # input image
-                                   ,ctypes.c_ushort  # out_size
-                                   ,ctypes.c_ushort  # in_size
-                                   ,ctypes.c_ubyte   # kernel_size (only for square filter)
-                                   ,ctypes.c_ushort  # channel
-                                   ,ctypes.c_ubyte   # stride
-                                   ,ctypes.c_ubyte   # padding
-                                   ,ctypes.c_int     # ceil_mode
-                                   ,ctypes.c_int     # rigor
-                                   ,ctypes.c_int     # verbose
-                                   ]) 
     CP_out_data    = out_data.ctypes.data_as(ctypes.POINTER(_ctype))
     CP_in_data     = in_data.ctypes.data_as(ctypes.POINTER(_ctype))
     CP_out_size    = ctypes.c_ushort(out_data.shape[2]) # note ndim (i.e., rank) is 3
@@ -207,6 +198,232 @@ def Pooling2dMax( out_data    # out_channel x out_size x out_size
                  )
     return True
 
+#===============================================================================
+dlr_common.RegisterSignature('Pooling2dMaxBatch'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # output features
+                                             ,ctypes.POINTER(_ctype) # input image
+                                             ,ctypes.c_ushort  # out_size
+                                             ,ctypes.c_ushort  # in_size
+                                             ,ctypes.c_ubyte   # kernel_size (only for square filter)
+                                             ,ctypes.c_ushort  # channel
+                                             ,ctypes.c_ushort  # minibatch
+                                             ,ctypes.c_ubyte   # stride
+                                             ,ctypes.c_ubyte   # padding
+                                             ,ctypes.c_int     # ceil_mode
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int     # verbose
+                                             ])
+
+def Pooling2dMaxBatch( out_data    # minibatch x channel x out_size x out_size
+                     , in_data     # minibatch x channel x in_size x in_size
+                     , kernel_size # kernel_size x kernel_size
+                     , stride=1
+                     , padding=0
+                     , ceil_mode=False
+                     , rigor=False
+                     , verbose=False):
+    """
+    Returns True on success, otherwize returns False
+    Applies a 2D max-pooling over a minibatch of input data by a single call of the C routine.
+    Note that all nd-array lists are NumPy (mutable) and contiguous.
+    :param out_data: <mutable> output data, out_data[minibatch][channel][out_size][out_size]
+    :param in_data: input data, in_data[minibatch][channel][in_size][in_size]
+    :param kernel_size:
+    :param stride: num of skips to apply next filter
+    :param padding: num of pixes at the boundary
+    :param ceil_mode: use floor() when false, otherwize ceil()
+    :param rigor: check values rigorously when 'True'
+    :param verbose: output message more when 'True'
+    :return: 'True' on success, 'False' on failure.
+    """
+    if rigor:
+       error =0
+       if (out_data.ndim!=4):
+           error += 1
+           if verbose: dlr_common.DlrError("out_data is not 4 dim")
+       if (in_data.ndim!=4):
+           error += 1
+           if verbose: dlr_common.DlrError("in_data is not 4 dim")
+       if (out_data.shape[0:2]!=in_data.shape[0:2]):
+           error += 1
+           if verbose: dlr_common.DlrError("minibatch or channel mis-match")
+       if (error!=0):
+           dlr_common.DlrError("parameter mis-match");
+           return False
+    _Pooling2dMax, _ctype = dlr_common.GetFunction('Pooling2dMaxBatch', out_data.dtype)
+    if _Pooling2dMax is None:
+        dlr_common.DlrError("not support "+str(out_data.dtype.type))
+        return False
+    CP_out_data    = out_data.ctypes.data_as(ctypes.POINTER(_ctype))
+    CP_in_data     = in_data.ctypes.data_as(ctypes.POINTER(_ctype))
+    CP_out_size    = ctypes.c_ushort(out_data.shape[3]) # note ndim (i.e., rank) is 4
+    CP_in_size     = ctypes.c_ushort(in_data.shape[3]) # note ndim (i.e., rank) is 4
+    CP_kernel_size = ctypes.c_ubyte(kernel_size)
+    CP_channel     = ctypes.c_ushort(in_data.shape[1])
+    CP_minibatch   = ctypes.c_ushort(in_data.shape[0])
+    CP_stride      = ctypes.c_ubyte(stride)
+    CP_padding     = ctypes.c_ubyte(padding)
+    CP_ceil_mode   = 1 if ceil_mode else 0
+    CP_rigor       = 1 if rigor else 0
+    CP_verbose     = 1 if verbose else 0
+
+    _Pooling2dMax(CP_out_data
+                 ,CP_in_data
+                 ,CP_out_size
+                 ,CP_in_size
+                 ,CP_kernel_size
+                 ,CP_channel
+                 ,CP_minibatch
+                 ,CP_stride
+                 ,CP_padding
+                 ,CP_ceil_mode
+                 ,CP_rigor
+                 ,CP_verbose
+                 )
+    return True
+
+#===============================================================================
+dlr_common.RegisterSignature('Pooling2dMaxIndices'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # output features
+                                             ,ctypes.POINTER(ctypes.c_int32) # output indices
+                                             ,ctypes.POINTER(_ctype) # input image
+                                             ,ctypes.c_ushort  # out_size
+                                             ,ctypes.c_ushort  # in_size
+                                             ,ctypes.c_ubyte   # kernel_size (only for square filter)
+                                             ,ctypes.c_ushort  # channel
+                                             ,ctypes.c_ubyte   # stride
+                                             ,ctypes.c_ubyte   # padding
+                                             ,ctypes.c_int     # ceil_mode
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int     # verbose
+                                             ])
+
+def Pooling2dMaxIndices( out_data    # channel x out_size x out_size
+                       , out_indices # channel x out_size x out_size of np.int32
+                       , in_data     # channel x in_size x in_size
+                       , kernel_size # kernel_size x kernel_size
+                       , stride=1
+                       , padding=0
+                       , ceil_mode=False
+                       , rigor=False
+                       , verbose=False):
+    """
+    Returns True on success, otherwize returns False
+    Applies a 2D max-pooling with index of each max as 'return_indices' of PyTorch.
+    Note that all nd-array lists are NumPy (mutable) and contiguous.
+    :param out_data: <mutable> output data, out_data[channel][out_size][out_size]
+    :param out_indices: <mutable> np.int32 index of the max in the channel of in_data,
+                        i.e., row*in_size+column, out_indices[channel][out_size][out_size]
+    :param in_data: input data, in_data[channel][in_size][in_size]
+    :param kernel_size:
+    :param stride: num of skips to apply next filter
+    :param padding: num of pixes at the boundary
+    :param ceil_mode: use floor() when false, otherwize ceil()
+    :param rigor: check values rigorously when 'True'
+    :param verbose: output message more when 'True'
+    :return: 'True' on success, 'False' on failure.
+    """
+    if rigor:
+       error =0
+       if (out_data.ndim!=3) or (in_data.ndim!=3):
+           error += 1
+           if verbose: dlr_common.DlrError("out_data or in_data is not 3 dim")
+       if (out_indices.shape!=out_data.shape) or (out_indices.dtype!=np.int32):
+           error += 1
+           if verbose: dlr_common.DlrError("out_indices should be np.int32 of out_data shape")
+       if (out_data.shape[0]!=in_data.shape[0]):
+           error += 1
+           if verbose: dlr_common.DlrError("in/out channel should be the same")
+       if (error!=0):
+           dlr_common.DlrError("parameter mis-match");
+           return False
+    _Pooling2dMax, _ctype = dlr_common.GetFunction('Pooling2dMaxIndices', out_data.dtype)
+    if _Pooling2dMax is None:
+        dlr_common.DlrError("not support "+str(out_data.dtype.type))
+        return False
+    _Pooling2dMax(out_data.ctypes.data_as(ctypes.POINTER(_ctype))
+                 ,out_indices.ctypes.data_as(ctypes.POINTER(ctypes.c_int32))
+                 ,in_data.ctypes.data_as(ctypes.POINTER(_ctype))
+                 ,ctypes.c_ushort(out_data.shape[2]) # note ndim (i.e., rank) is 3
+                 ,ctypes.c_ushort(in_data.shape[2])
+                 ,ctypes.c_ubyte(kernel_size)
+                 ,ctypes.c_ushort(in_data.shape[0])
+                 ,ctypes.c_ubyte(stride)
+                 ,ctypes.c_ubyte(padding)
+                 ,1 if ceil_mode else 0
+                 ,1 if rigor else 0
+                 ,1 if verbose else 0
+                 )
+    return True
+
+#===============================================================================
+dlr_common.RegisterSignature('Pooling2dMaxIndicesBatch'
+                            , lambda _ctype: [ctypes.POINTER(_ctype) # output features
+                                             ,ctypes.POINTER(ctypes.c_int32) # output indices
+                                             ,ctypes.POINTER(_ctype) # input image
+                                             ,ctypes.c_ushort  # out_size
+                                             ,ctypes.c_ushort  # in_size
+                                             ,ctypes.c_ubyte   # kernel_size (only for square filter)
+                                             ,ctypes.c_ushort  # channel
+                                             ,ctypes.c_ushort  # minibatch
+                                             ,ctypes.c_ubyte   # stride
+                                             ,ctypes.c_ubyte   # padding
+                                             ,ctypes.c_int     # ceil_mode
+                                             ,ctypes.c_int     # rigor
+                                             ,ctypes.c_int     # verbose
+                                             ])
+
+def Pooling2dMaxIndicesBatch( out_data    # minibatch x channel x out_size x out_size
+                            , out_indices # minibatch x channel x out_size x out_size of np.int32
+                            , in_data     # minibatch x channel x in_size x in_size
+                            , kernel_size # kernel_size x kernel_size
+                            , stride=1
+                            , padding=0
+                            , ceil_mode=False
+                            , rigor=False
+                            , verbose=False):
+    """
+    Returns True on success, otherwize returns False
+    Applies Pooling2dMaxIndices() over a minibatch of input data by a single call of the C routine.
+    :param out_data: <mutable> output data, out_data[minibatch][channel][out_size][out_size]
+    :param out_indices: <mutable> np.int32 index of the max in the channel of in_data
+    :param in_data: input data, in_data[minibatch][channel][in_size][in_size]
+    :return: 'True' on success, 'False' on failure.
+    """
+    if rigor:
+       error =0
+       if (out_data.ndim!=4) or (in_data.ndim!=4):
+           error += 1
+           if verbose: dlr_common.DlrError("out_data or in_data is not 4 dim")
+       if (out_indices.shape!=out_data.shape) or (out_indices.dtype!=np.int32):
+           error += 1
+           if verbose: dlr_common.DlrError("out_indices should be np.int32 of out_data shape")
+       if (out_data.shape[0:2]!=in_data.shape[0:2]):
+           error += 1
+           if verbose: dlr_common.DlrError("minibatch or channel mis-match")
+       if (error!=0):
+           dlr_common.DlrError("parameter mis-match");
+           return False
+    _Pooling2dMax, _ctype = dlr_common.GetFunction('Pooling2dMaxIndicesBatch', out_data.dtype)
+    if _Pooling2dMax is None:
+        dlr_common.DlrError("not support "+str(out_data.dtype.type))
+        return False
+    _Pooling2dMax(out_data.ctypes.data_as(ctypes.POINTER(_ctype))
+                 ,out_indices.ctypes.data_as(ctypes.POINTER(ctypes.c_int32))
+                 ,in_data.ctypes.data_as(ctypes.POINTER(_ctype))
+                 ,ctypes.c_ushort(out_data.shape[3]) # note ndim (i.e., rank) is 4
+                 ,ctypes.c_ushort(in_data.shape[3])
+                 ,ctypes.c_ubyte(kernel_size)
+                 ,ctypes.c_ushort(in_data.shape[1])
+                 ,ctypes.c_ushort(in_data.shape[0])
+                 ,ctypes.c_ubyte(stride)
+                 ,ctypes.c_ubyte(padding)
+                 ,1 if ceil_mode else 0
+                 ,1 if rigor else 0
+                 ,1 if verbose else 0
+                 )
+    return True
+
 #===============================================================================
 # # Testing function
 # def _Convolution2dRef_not_yet( out_data    # out_channel x out_size x out_size
@@ -268,15 +485,76 @@ if __name__=='__main__':
             dlr_common.DlrPrint(f"in_data:\n{in_data}")
             dlr_common.DlrPrint(f"out_data:\n{out_data}")
 
+if __name__=='__main__':
+    def TestPooling2dMaxInt8():
+        """
+        Compares Pooling2dMaxBatch() of int8 against NumPy, where windows are clipped to input.
+        """
+        rng = np.random.default_rng(0)
+        for minibatch, channel, in_size, kernel_size, stride, padding in [(2, 3, 8, 2, 2, 0)
+                                                                          ,(1, 4, 13, 3, 2, 1)
+                                                                          ,(2, 2, 9, 2, 1, 1)]:
+            status, out_size = GetOutputSizeOfPooling2dMax(in_size, kernel_size, stride, padding)
+            in_data  = rng.integers(-128, 128, [minibatch,channel,in_size,in_size]).astype(np.int8)
+            out_data = np.empty([minibatch,channel,out_size,out_size], dtype=np.int8)
+            status = Pooling2dMaxBatch(out_data, in_data, kernel_size, stride, padding)
+            t_data = np.pad(in_data, ((0,0),(0,0),(padding,padding),(padding,padding)), constant_values=-128)
+            expect = np.full(out_data.shape, -128, dtype=np.int8)
+            for i in range(kernel_size):
+                for j in range(kernel_size):
+                    window = t_data[:,:,i:i+stride*(out_size-1)+1:stride,j:j+stride*(out_size-1)+1:stride]
+                    expect = np.maximum(expect, window)
+            mismatch = np.count_nonzero(out_data!=expect)
+            dlr_common.DlrPrint(f"int8 {[minibatch,channel,in_size,kernel_size,stride,padding]}"
+                                +(" OK" if status and mismatch==0 else f" mis-match {mismatch}"), flush=True)
+
+if __name__=='__main__':
+    def TestPooling2dMaxIndices(_dtype):
+        """
+        Compares Pooling2dMaxIndicesBatch() against the first max in row-major order
+        of each window clipped to input, where data have many ties.
+        """
+        rng = np.random.default_rng(0)
+        for minibatch, channel, in_size, kernel_size, stride, padding in [(2, 3, 8, 2, 2, 0)
+                                                                          ,(1, 4, 13, 3, 2, 1)
+                                                                          ,(2, 2, 12, 6, 3, 2)]:
+            status, out_size = GetOutputSizeOfPooling2dMax(in_size, kernel_size, stride, padding)
+            in_data     = rng.integers(-4, 4, [minibatch,channel,in_size,in_size]).astype(_dtype)
+            out_data    = np.empty([minibatch,channel,out_size,out_size], dtype=_dtype)
+            out_indices = np.empty([minibatch,channel,out_size,out_size], dtype=np.int32)
+            status = Pooling2dMaxIndicesBatch(out_data, out_indices, in_data, kernel_size, stride, padding, rigor=True)
+            expect = np.empty(out_indices.shape, dtype=np.int32)
+            for g in range(out_size):
+                for k in range(out_size):
+                    y0, x0 = max(g*stride-padding, 0), max(k*stride-padding, 0)
+                    y1, x1 = min(g*stride-padding+kernel_size, in_size), min(k*stride-padding+kernel_size, in_size)
+                    window = in_data[:,:,y0:y1,x0:x1].reshape(minibatch, channel, -1)
+                    at = np.argmax(window, axis=2) # the first max
+                    expect[:,:,g,k] = (y0+at//(x1-x0))*in_size+x0+at%(x1-x0)
+            values = np.take_along_axis(in_data.reshape(minibatch, channel, -1)
+                                       , out_indices.reshape(minibatch, channel, -1), axis=2)
+            mismatch = np.count_nonzero(out_indices!=expect)+np.count_nonzero(values!=out_data.reshape(values.shape))
+            dlr_common.DlrPrint(f"{np.dtype(_dtype).name} {[minibatch,channel,in_size,kernel_size,stride,padding]}"
+                                +(" OK" if status and mismatch==0 else f" mis-match {mismatch}"), flush=True)
+
 if __name__=='__main__':
     dlr_common.DlrPrint("Testing Pooling2dMax", flush=True);
     dlr_common.DlrPrint("*********************", flush=True)
     TestPooling2dMax(_dtype=np.int32)
     #TestPooling2dMax(_dtype=np.float32)
     #TestPooling2dMax(_dtype=np.float64)
+    TestPooling2dMaxInt8()
+
+    dlr_common.DlrPrint("Testing Pooling2dMaxIndices", flush=True);
+    dlr_common.DlrPrint("****************************", flush=True)
+    for _dtype in [np.int32, np.float32, np.float64]:
+        TestPooling2dMaxIndices(_dtype)
 
 #===============================================================================
 # Revision history:
 #
+# 2026.10.18: 'Pooling2dMaxIndices' and 'Pooling2dMaxIndicesBatch' of argmax
+# 2026.10.18: int8 data type of 'Pooling2dMaxInt8' and 'Pooling2dMaxBatchInt8'
+# 2026.10.18: 'Pooling2dMaxBatch' added for minibatch
 # 2020.04.58: Started by Ando Ki (adki@future-ds.com)
 #===============================================================================
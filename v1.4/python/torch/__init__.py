@@ -1,2 +1,3 @@
 
 from .dlr_pytorch_wrapper import *
+from .dlr_calibration import *
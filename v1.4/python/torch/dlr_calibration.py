@@ -0,0 +1,268 @@
+#!/usr/bin/env python
+"""
+This file contains int8 calibration of a model running through dlr_pytorch_wrapper.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+#-------------------------------------------------------------------------------
+__author__     = "Ando Ki"
+__copyright__  = "Copyright 2020, Future Design Systems"
+__credits__    = ["none", "some"]
+__license__    = "FUTURE DESIGN SYSTEMS SOFTWARE END-USER LICENSE AGREEMENT"
+__version__    = "0"
+__revision__   = "1"
+__maintainer__ = "Ando Ki"
+__email__      = "contact@future-ds.com"
+__status__     = "Development"
+__date__       = "2026.10.18"
+__description__= "int8 calibration of DLR for PyTorch"
+
+#-------------------------------------------------------------------------------
+import numpy as np
+import torch
+
+import python.modules as _dlr
+from python.torch import dlr_pytorch_wrapper as _dlr_torch
+
+#===============================================================================
+# A quantized value 'q' of int8 stands for 'scale*(q-zero_point)', where
+# activations are asymmetric per tensor and weights are symmetric per output
+# channel (zero point 0), which are what Convolution2dInt8(), Linear1dInt8()
+# and Pooling2dMaxInt8() take.
+def GetQuantization(min_value, max_value):
+    """
+    Returns (scale, zero_point) of asymmetric int8 for a range, which is widened to include 0
+    """
+    min_value = min(float(min_value), 0.0)
+    max_value = max(float(max_value), 0.0)
+    scale = (max_value-min_value)/255.0
+    if scale==0.0: scale = 1.0
+    zero_point = int(np.clip(np.round(-128-min_value/scale), -128, 127))
+    return scale, zero_point
+
+def Quantize(data, scale, zero_point):
+    """
+    Returns int8 NumPy array of a tensor or an array
+    """
+    if isinstance(data, torch.Tensor): data = data.detach().cpu().numpy()
+    return np.clip(np.round(data/scale)+zero_point, -128, 127).astype(np.int8)
+
+def Dequantize(data, scale, zero_point):
+    """
+    Returns float32 tensor of int8 NumPy array
+    """
+    return torch.from_numpy(((data.astype(np.float32)-zero_point)*scale).astype(np.float32))
+
+#===============================================================================
+class Calibrator:
+    """
+    Collects ranges of activations of conv2d(), linear() and max_pool2d() while
+    a model runs through dlr_pytorch_wrapper and emits int8 quantization of
+    each call of them, i.e., a layer, in the order of calls.
+    Following is an example usage, where 'model' calls 'dlr_pytorch_wrapper.conv2d()' and so on.
+        calibrator = Calibrator()
+        for images in dataset: calibrator.observe(model, images)
+        layers = calibrator.quantize()
+    """
+    _functions = ('conv2d', 'linear', 'max_pool2d')
+
+    def __init__(self):
+        self.layers = [] # list of dictionary of a layer, see _record()
+        self._index = 0
+        self._saved = {}
+
+    def __enter__(self):
+        self._index = 0
+        for name in self._functions:
+            function = getattr(_dlr_torch, name)
+            self._saved[name] = function
+            setattr(_dlr_torch, name, self._observer(name, function))
+        return self
+
+    def __exit__(self, *args):
+        for name, function in self._saved.items(): setattr(_dlr_torch, name, function)
+        self._saved = {}
+        return False
+
+    def observe(self, model, *args, **kwargs):
+        """
+        Runs the model once, i.e., 'model(*args, **kwargs)', while collecting ranges
+        :return: output of the model
+        """
+        with self:
+            return model(*args, **kwargs)
+
+    def _observer(self, name, function):
+        def observer(input, *args, **kwargs):
+            output = function(input, *args, **kwargs)
+            if output is not None: self._record(name, input, output, args, kwargs)
+            return output
+        return observer
+
+    def _record(self, name, input, output, args, kwargs):
+        if self._index==len(self.layers):
+            layer = { 'op'     : name
+                    , 'args'   : args
+                    , 'kwargs' : { key: value for key, value in kwargs.items() if key!='out' }
+                    , 'in_min' : 0.0, 'in_max' : 0.0
+                    , 'out_min': 0.0, 'out_max': 0.0 }
+            self.layers.append(layer)
+        layer = self.layers[self._index]
+        if layer['op']!=name:
+            _dlr.DlrError(f"layer {self._index} changed from {layer['op']} to {name}", flush=True)
+            return
+        layer['in_min']  = min(layer['in_min'] , float(input.min()))
+        layer['in_max']  = max(layer['in_max'] , float(input.max()))
+        layer['out_min'] = min(layer['out_min'], float(output.min()))
+        layer['out_max'] = max(layer['out_max'], float(output.max()))
+        self._index += 1
+
+    def scales(self):
+        """
+        Returns list of (in_scale, in_zero_point, out_scale, out_zero_point) of layers,
+        where max_pool2d() keeps scale and zero point of its input.
+        """
+        scales = []
+        for layer in self.layers:
+            in_scale, in_zero_point = GetQuantization(layer['in_min'], layer['in_max'])
+            if layer['op']=='max_pool2d':
+                out_scale, out_zero_point = in_scale, in_zero_point
+            else:
+                out_scale, out_zero_point = GetQuantization(layer['out_min'], layer['out_max'])
+            scales.append((in_scale, in_zero_point, out_scale, out_zero_point))
+        return scales
+
+    def quantize(self):
+        """
+        Returns list of dictionary of int8 parameters of layers, which has
+        'op', 'in_scale', 'in_zero_point', 'out_scale' and 'out_zero_point',
+        and for conv2d() and linear() 'weight' (int8), 'weight_scale', 'bias' (int32 or None),
+        'multiplier' and 'shift' as well (see forward_int8()).
+        """
+        layers = []
+        for layer, (in_scale, in_zero_point, out_scale, out_zero_point) in zip(self.layers, self.scales()):
+            args, kwargs = layer['args'], layer['kwargs']
+            quantized = { 'op'            : layer['op']
+                        , 'in_scale'      : in_scale
+                        , 'in_zero_point' : in_zero_point
+                        , 'out_scale'     : out_scale
+                        , 'out_zero_point': out_zero_point }
+            if layer['op']=='max_pool2d':
+                names = ('kernel_size', 'stride', 'padding', 'ceil_mode')
+                defaults = (None, 1, 0, False)
+            else:
+                weight = args[0] if len(args)>0 else kwargs['weight']
+                bias   = args[1] if len(args)>1 else kwargs.get('bias', None)
+                weight = weight.detach().cpu().numpy().astype(np.float64)
+                t_absmax = np.abs(weight.reshape(weight.shape[0], -1)).max(axis=1)
+                weight_scale = np.where(t_absmax>0, t_absmax/127.0, 1.0)
+                t_shape = (-1,)+(1,)*(weight.ndim-1)
+                quantized['weight'] = np.clip(np.round(weight/weight_scale.reshape(t_shape)), -127, 127).astype(np.int8)
+                quantized['weight_scale'] = weight_scale
+                quantized['bias'] = None if bias is None else \
+                    np.round(bias.detach().cpu().numpy()/(in_scale*weight_scale)).astype(np.int32)
+                quantized['multiplier'], quantized['shift'] = \
+                    _dlr.GetRequantization(in_scale*weight_scale/out_scale)
+                if layer['op']=='conv2d':
+                    names, defaults = ('stride', 'padding'), (1, 0)
+                else:
+                    names, defaults = (), ()
+                args = args[2:]
+            for position, (name, default) in enumerate(zip(names, defaults)):
+                quantized[name] = args[position] if position<len(args) else kwargs.get(name, default)
+            layers.append(quantized)
+        return layers
+
+#===============================================================================
+def forward_int8(layer, input):
+    """
+    Returns int8 NumPy array of a layer of Calibrator.quantize()
+    :param layer: dictionary of a layer
+    :param input: int8 NumPy array of scale and zero point of the layer, with leading minibatch dimension
+    :return: int8 NumPy array of out_scale and out_zero_point of the layer, None on failure.
+    """
+    input = np.ascontiguousarray(input)
+    if layer['op']=='conv2d':
+        weight = layer['weight']
+        status, out_size = _dlr.GetOutputSizeOfConvolution2d(input.shape[3], weight.shape[3]
+                                                            , layer['stride'], layer['padding'])
+        output = np.empty([input.shape[0], weight.shape[0], out_size, out_size], dtype=np.int8)
+        status = _dlr.Convolution2dBatchInt8(output, input, weight, layer['bias']
+                                            , layer['multiplier'], layer['shift']
+                                            , layer['in_zero_point'], layer['out_zero_point']
+                                            , layer['stride'], layer['padding'])
+    elif layer['op']=='linear':
+        weight = layer['weight']
+        output = np.empty([input.shape[0], weight.shape[0]], dtype=np.int8)
+        status = _dlr.Linear1dBatchInt8(output, input.reshape(input.shape[0], -1), weight, layer['bias']
+                                       , layer['multiplier'], layer['shift']
+                                       , layer['in_zero_point'], layer['out_zero_point'])
+    elif layer['op']=='max_pool2d':
+        stride = layer['stride'] if layer['stride'] else layer['kernel_size']
+        status, out_size = _dlr.GetOutputSizeOfPooling2dMax(input.shape[3], layer['kernel_size']
+                                                           , stride, layer['padding'], layer['ceil_mode'])
+        output = np.empty([input.shape[0], input.shape[1], out_size, out_size], dtype=np.int8)
+        status = _dlr.Pooling2dMaxBatch(output, input, layer['kernel_size']
+                                       , stride, layer['padding'], layer['ceil_mode'])
+    else:
+        status = False
+    return output if status else None
+
+#===============================================================================
+if __name__=='__main__':
+    import torch.nn.functional as F
+
+    def TestCalibration():
+        """
+        Calibrates a small model conv2d-relu-max_pool2d-linear with random data,
+        and runs it by int8 routines, whose output should be close to that of float
+        within a few steps of output scale.
+        """
+        torch.manual_seed(0)
+        weight0, bias0 = torch.randn(8, 3, 3, 3)*0.3, torch.randn(8)*0.1
+        weight1, bias1 = torch.randn(10, 8*6*6)*0.05, torch.randn(10)*0.1
+        def model(x):
+            x = _dlr_torch.conv2d(x, weight0, bias0, 1, 1)
+            x = _dlr_torch.relu(x)
+            x = _dlr_torch.max_pool2d(x, 2, 2)
+            x = x.reshape(x.shape[0], -1)
+            return _dlr_torch.linear(x, weight1, bias1)
+
+        calibrator = Calibrator()
+        for _ in range(4): calibrator.observe(model, torch.randn(8, 3, 12, 12))
+        layers = calibrator.quantize()
+        ops = [layer['op'] for layer in layers]
+        status = ops==['conv2d', 'max_pool2d', 'linear']
+        for layer in layers:
+            _dlr.DlrPrint(f"{layer['op']:10s} in scale={layer['in_scale']:.4e} zero_point={layer['in_zero_point']:4d}"
+                          f" out scale={layer['out_scale']:.4e} zero_point={layer['out_zero_point']:4d}", flush=True)
+
+        input  = torch.randn(4, 3, 12, 12)
+        expect = model(input)
+        conv, pool, fc = layers
+        q = forward_int8(conv, Quantize(input, conv['in_scale'], conv['in_zero_point']))
+        q = np.maximum(q, conv['out_zero_point']) # relu of int8
+        q = Quantize(Dequantize(q, conv['out_scale'], conv['out_zero_point']), pool['in_scale'], pool['in_zero_point'])
+        q = forward_int8(pool, q)
+        q = Quantize(Dequantize(q, pool['out_scale'], pool['out_zero_point']), fc['in_scale'], fc['in_zero_point'])
+        q = forward_int8(fc, q)
+        output = Dequantize(q, fc['out_scale'], fc['out_zero_point'])
+        error  = torch.max(torch.abs(output-expect)).item()
+        status = status and (error<8*fc['out_scale'])
+        _dlr.DlrPrint(f"int8 vs float max abs diff {error:.4e} ({error/fc['out_scale']:.1f} steps of out scale)"
+                      +(" OK" if status else " mis-match"), flush=True)
+        return status
+
+#===============================================================================
+if __name__=='__main__':
+    _dlr.DlrPrint("Testing Calibration", flush=True)
+    _dlr.DlrPrint("*******************", flush=True)
+    TestCalibration()
+
+#===============================================================================
+# Revision history:
+#
+# 2026.10.18: Started.
+#===============================================================================
@@ -20,12 +20,152 @@ __date__       = "2020.09.30"
 __description__= "PyTorch interface of Deep Learning Processing Routines"
 
 #-------------------------------------------------------------------------------
+import os
+import functools
+import threading
+import collections
+import concurrent.futures
 import torch
 import torch.nn as nn
 import torch.nn.functional as F
 
 import python.modules as _dlr
 
+#===============================================================================
+# NumPy array sharing memory with a tensor, where torch.float16 goes np.float16
+# of '<Op>Half' routines and torch.bfloat16, which NumPy does not have,
+# goes 'bfloat16' of '<Op>BFloat16' routines (see python.modules.dlr_common).
+def _numpy(tensor):
+    """
+    Returns NumPy array of 'tensor' without copy
+    """
+    if tensor.dtype==torch.bfloat16:
+        return tensor.data.view(torch.int16).numpy().view(_dlr.bfloat16)
+    return tensor.data.numpy()
+
+#===============================================================================
+# thread pool to fan minibatch items out across cores.
+# Each worker calls a '*Batch' routine over its own slice of the minibatch,
+# which runs concurrently since the C routine releases the GIL
+# (see python.modules.dlr_common.set_release_gil()).
+_num_threads = 1
+_executor    = None
+
+def set_num_threads(num_threads=None):
+    """
+    Sets the number of threads to process a minibatch, i.e., Python threads
+    each calling a '*Batch' routine over a slice of the minibatch.
+    Note that python.modules.set_num_threads() is a different one,
+    which sets OpenMP threads inside a C routine.
+    :param num_threads: 1 to process in the calling thread,
+                        None or 0 to use all cores
+    """
+    global _num_threads, _executor
+    if not num_threads: num_threads = os.cpu_count() or 1
+    if num_threads<1: num_threads = 1
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+    _num_threads = num_threads
+    if _num_threads>1:
+        _executor = concurrent.futures.ThreadPoolExecutor(max_workers=_num_threads)
+
+def get_num_threads(): return _num_threads
+
+def _run_minibatch(function, out_data, input, *args, **kwargs):
+    """
+    Calls 'function(out_slice, in_slice, *args, **kwargs)' over the minibatch
+    :param function: one of '*Batch' routines of python.modules
+    :param out_data: output tensor, out_data[minibatch][...]
+    :param input: input tensor, input[minibatch][...]
+    :return: 'True' when all calls succeed
+    """
+    xout_data = _numpy(out_data)
+    xin_data  = _numpy(input.contiguous())
+    minibatch = xin_data.shape[0]
+    if (_executor is None) or (minibatch<2):
+        return function(xout_data, xin_data, *args, **kwargs)
+    num = min(_num_threads, minibatch)
+    bounds = [(minibatch*n)//num for n in range(num+1)]
+    futures = [ _executor.submit(function, xout_data[a:b], xin_data[a:b], *args, **kwargs)
+                for a, b in zip(bounds[:-1], bounds[1:]) ]
+    return all([f.result() for f in futures])
+
+#===============================================================================
+# packed weights kept across calls (see python.modules.PackedWeights).
+# - key: identity and version counter of weight and bias tensors
+# - tensors are also kept in order not to reuse their identities for others
+# - in-place operations on a tensor bump its version counter and cause repacking,
+#   but writes through 'tensor.data' (e.g., 'weight.data.mul_(2)' or 'weight.data = ...')
+#   do not, so call clear_packed_weights() after them
+_packed_weights      = collections.OrderedDict()
+_packed_weights_max  = 64 # max num of cached layers
+_packed_weights_lock = threading.Lock()
+
+def _get_packed_weights(pack, *tensors, **kwargs):
+    """
+    Returns packed weights of 'tensors', which are packed only when changed
+    :param pack: _dlr.PackWeightsConvolution2d, _dlr.PackWeightsLinear1d or _dlr.FoldConvolution2dBn
+    :param tensors: weight, bias and so on, which can be None
+    :param kwargs: passed to 'pack' and also part of the key
+    """
+    key = (pack.__name__,)
+    for tensor in tensors:
+        key += (None, None) if tensor is None else (id(tensor), tensor._version)
+    key += tuple(sorted(kwargs.items()))
+    with _packed_weights_lock:
+        entry = _packed_weights.get(key)
+        if entry is not None:
+            _packed_weights.move_to_end(key)
+            return entry[1]
+        packed = pack(*[None if tensor is None else _numpy(tensor) for tensor in tensors], **kwargs)
+        if (packed is None) or (isinstance(packed, tuple) and (packed[0] is None)): return None
+        _packed_weights[key] = (tensors, packed)
+        if len(_packed_weights)>_packed_weights_max: _packed_weights.popitem(last=False)
+        return packed
+
+def clear_packed_weights():
+    """
+    Releases all packed weights,
+    which is needed after writes through 'tensor.data' since they are not seen by the cache
+    """
+    with _packed_weights_lock:
+        _packed_weights.clear()
+
+#===============================================================================
+# output tensors kept across calls, which are reused while shape and dtype are the same.
+# - key: given by 'out' argument, e.g., name of layer
+# - the tensor returned is overwritten by the next call with the same key
+_output_cache      = {}
+_output_cache_lock = threading.Lock()
+
+def _get_output(out, shape, dtype):
+    """
+    Returns output tensor of 'shape' and 'dtype' or None on failure
+    :param out: None to allocate, tensor to be filled, or key of output cache
+    """
+    shape = torch.Size(shape)
+    if out is None:
+        return torch.empty(shape, dtype=dtype)
+    if isinstance(out, torch.Tensor):
+        if (out.shape!=shape) or (out.dtype!=dtype) or (not out.is_contiguous()):
+            _dlr.DlrError(f"out should be contiguous {list(shape)} of {dtype}: {list(out.shape)} of {out.dtype}")
+            return None
+        return out
+    with _output_cache_lock:
+        out_data = _output_cache.get(out)
+        if (out_data is None) or (out_data.shape!=shape) or (out_data.dtype!=dtype):
+            out_data = torch.empty(shape, dtype=dtype)
+            _output_cache[out] = out_data
+        return out_data
+
+def clear_output_cache():
+    """
+    Releases all output tensors kept across calls
+    """
+    with _output_cache_lock:
+        _output_cache.clear()
+
 #===============================================================================
 def conv2d( input     # in_minibatch x in_channel x in_size x in_size
           , weight    # out_channel  x in_channel x kernel_size x kernel_size
@@ -35,7 +175,10 @@ def conv2d( input     # in_minibatch x in_channel x in_size x in_size
           , dilation=1
           , groups=1
           , rigor=False
-          , verbose=False):
+          , verbose=False
+          , algorithm=None
+          , out=None
+          , kernel_version=None):
     """
     Corresponding torch.nn.functional.conv2d(input, weight, bias=None,
                                              stride, padding, dilation, groups)
@@ -51,6 +194,15 @@ def conv2d( input     # in_minibatch x in_channel x in_size x in_size
     :param groups:
     :param rigor: check values rigorously when 'True'
     :param verbose: output message more when 'True'
+    :param algorithm: None (default), 'auto', 'reference', 'fast' or 'winograd' (see python.modules.SetConvolution2dAlgorithm()),
+                      or 'packed' to use packed weights kept across calls,
+                      where clear_packed_weights() should be called after writes through 'weight.data'
+    :param out: None to allocate, tensor to be filled,
+                or key of output tensor kept across calls (see clear_output_cache())
+    :param kernel_version: None (default) to compare content of weight with the Winograd filter cache,
+                           or version of weight, e.g., 'weight._version', to skip the comparison.
+                           Note that writes through 'weight.data' do not bump 'weight._version',
+                           so call python.modules.ClearConvolution2dWinogradFilter() after them.
     :return: out_data on success, None on failure.
     """
     if rigor:
@@ -78,22 +230,205 @@ def conv2d( input     # in_minibatch x in_channel x in_size x in_size
                                                         , rigor=rigor
                                                         , verbose=verbose)
     if not status: return None
-    out_data = torch.empty([in_minibatch,out_channel,out_size,out_size], dtype=dtype)
+    out_data = _get_output(out, [in_minibatch,out_channel,out_size,out_size], dtype)
+    if out_data is None: return None
+    if algorithm=='packed':
+        packed = _get_packed_weights(_dlr.PackWeightsConvolution2d, weight, bias)
+        if packed is None: return None
+        status = _run_minibatch( _dlr.Convolution2dPackedBatch
+                               , out_data # in_minibatch x ...
+                               , input    # in_minibatch x ...
+                               , packed
+                               , stride
+                               , padding
+                               , rigor=rigor
+                               , verbose=verbose)
+        return out_data if status else None
+    if in_minibatch>1: # whole minibatch by a single call or split across the thread pool
+        status = _run_minibatch( _dlr.Convolution2dBatch
+                               , out_data # in_minibatch x ...
+                               , input    # in_minibatch x ...
+                               , _numpy(weight)   # out_channel x in_channel x kernel_size x kernel_size
+                               , _numpy(bias) if bias is not None else None
+                               , stride
+                               , padding
+                               , rigor=rigor
+                               , verbose=verbose
+                               , algorithm=algorithm
+                               , kernel_version=kernel_version)
+        return out_data if status else None
     for mb in range(in_minibatch):
         xout_data = out_data[mb]
         xin_data  = input[mb]
-        status = _dlr.Convolution2d( xout_data.data.numpy() # out_channel x out_size x out_size
-                                   , xin_data.data.numpy()  # in_channel x in_size x in_size
-                                   , weight.data.numpy()   # in_channel x out_channel x kernel_size x kernel_size
-                                   , bias.data.numpy() if bias is not None else None
+        status = _dlr.Convolution2d( _numpy(xout_data) # out_channel x out_size x out_size
+                                   , _numpy(xin_data)  # in_channel x in_size x in_size
+                                   , _numpy(weight)   # in_channel x out_channel x kernel_size x kernel_size
+                                   , _numpy(bias) if bias is not None else None
                                    , stride
                                    , padding
                                    , rigor=rigor
-                                   , verbose=verbose)
+                                   , verbose=verbose
+                                   , algorithm=algorithm
+                                   , kernel_version=kernel_version)
         if not status: return None
-        out_data[mb] = xout_data
     return out_data
 
+#===============================================================================
+def conv2d_bn_act( input        # in_minibatch x in_channel x in_size x in_size
+                 , weight       # out_channel  x in_channel x kernel_size x kernel_size
+                 , bias         # None or out_channel
+                 , running_mean # out_channel
+                 , running_var  # out_channel
+                 , bn_weight=None # None or out_channel (gamma)
+                 , bn_bias=None   # None or out_channel (beta)
+                 , stride=1
+                 , padding=0
+                 , eps=1E-5
+                 , activation=None
+                 , negative_slope=0.01
+                 , rigor=False
+                 , verbose=False
+                 , out=None):
+    """
+    Corresponding activation(F.batch_norm(F.conv2d(input, weight, bias, stride, padding),
+                                          running_mean, running_var, bn_weight, bn_bias,
+                                          training=False, eps=eps))
+    Returns output tensor on success
+    Applies a 2D convolution fused with batch normalization and activation,
+    where batch normalization is folded into weight and bias, which is kept across calls.
+    :param input: input data, input[in_minibatch][in_channel][in_size][in_size]
+    :param weight: kernel (or filter), weight[out_channel][in_channel][kernel_size][kernel_size]
+    :param bias: None or bias for each filter (kernel), bias[out_channel]
+    :param running_mean: running_mean[out_channel] of batch normalization
+    :param running_var: running_var[out_channel] of batch normalization
+    :param bn_weight: None or weight[out_channel] of batch normalization
+    :param bn_bias: None or bias[out_channel] of batch normalization
+    :param stride: num of skips to apply next filter
+    :param padding: num of pixes at the boundary
+    :param eps: noise for regularization of batch normalization
+    :param activation: None, 'relu' or 'leaky_relu'
+    :param negative_slope: slope of 'leaky_relu'
+    :param rigor: check values rigorously when 'True'
+    :param verbose: output message more when 'True'
+    :param out: None to allocate, tensor to be filled,
+                or key of output tensor kept across calls (see clear_output_cache())
+    :return: out_data on success, None on failure.
+    """
+    if rigor:
+       error = 0
+       if (input.dim()!=4): error += 1
+       if (input.shape[2]!=input.shape[3]): error += 1 # not square
+       if (weight.dim()!=4): error += 1
+       if (weight.shape[2]!=weight.shape[3]): error += 1 # not square
+       if (input.shape[1]!=weight.shape[1]): error += 1 # in_channel
+       if (stride<=0) or (padding<0): error += 1
+       if activation not in [None, 'relu', 'leaky_relu']: error += 1
+       if error!=0: return None
+    in_minibatch = input.shape[0]
+    status, out_size = _dlr.GetOutputSizeOfConvolution2d( input.shape[3]
+                                                        , weight.shape[3]
+                                                        , stride
+                                                        , padding
+                                                        , rigor=rigor
+                                                        , verbose=verbose)
+    if not status: return None
+    folded = _get_packed_weights( _dlr.FoldConvolution2dBn
+                                , weight, bias, running_mean, running_var, bn_weight, bn_bias
+                                , epsilon=eps)
+    if folded is None: return None
+    out_data = _get_output(out, [in_minibatch,weight.shape[0],out_size,out_size], input.dtype)
+    if out_data is None: return None
+    status = _run_minibatch( _dlr.Convolution2dBnActBatch
+                           , out_data # in_minibatch x ...
+                           , input    # in_minibatch x ...
+                           , folded[0] # folded kernel
+                           , folded[1] # folded bias
+                           , stride
+                           , padding
+                           , activation={None:None, 'relu':'ReLu', 'leaky_relu':'LeakyReLu'}.get(activation)
+                           , negative_slope=negative_slope
+                           , rigor=rigor
+                           , verbose=verbose)
+    return out_data if status else None
+
+#===============================================================================
+def conv2d_max_pool2d( input        # in_minibatch x in_channel x in_size x in_size
+                     , weight       # out_channel  x in_channel x kernel_size x kernel_size
+                     , bias=None    # None or out_channel
+                     , stride=1
+                     , padding=0
+                     , pool_kernel_size=2
+                     , pool_stride=None
+                     , ceil_mode=False
+                     , activation=None
+                     , negative_slope=0.01
+                     , rigor=False
+                     , verbose=False
+                     , out=None):
+    """
+    Corresponding F.max_pool2d(activation(F.conv2d(input, weight, bias, stride, padding)),
+                               pool_kernel_size, pool_stride, ceil_mode=ceil_mode)
+    Returns output tensor on success
+    Applies a 2D convolution fused with activation and 2D max pooling of no padding,
+    where only pooled outputs are written, e.g., conv and 2x2 pooling of LeNet-5.
+    :param input: input data, input[in_minibatch][in_channel][in_size][in_size]
+    :param weight: kernel (or filter), weight[out_channel][in_channel][kernel_size][kernel_size]
+    :param bias: None or bias for each filter (kernel), bias[out_channel]
+    :param stride: num of skips to apply next filter
+    :param padding: num of pixes at the boundary
+    :param pool_kernel_size: kernel_size of pooling
+    :param pool_stride: stride of pooling, None for pool_kernel_size
+    :param ceil_mode: use ceil instead of floor for output size of pooling
+    :param activation: None, 'relu' or 'leaky_relu'
+    :param negative_slope: slope of 'leaky_relu', applied before pooling when negative
+    :param rigor: check values rigorously when 'True'
+    :param verbose: output message more when 'True'
+    :param out: None to allocate, tensor to be filled,
+                or key of output tensor kept across calls (see clear_output_cache())
+    :return: out_data on success, None on failure.
+    """
+    if pool_stride is None: pool_stride = pool_kernel_size
+    if rigor:
+       error = 0
+       if (input.dim()!=4): error += 1
+       if (input.shape[2]!=input.shape[3]): error += 1 # not square
+       if (weight.dim()!=4): error += 1
+       if (weight.shape[2]!=weight.shape[3]): error += 1 # not square
+       if (input.shape[1]!=weight.shape[1]): error += 1 # in_channel
+       if (bias is not None) and (bias.shape!=weight.shape[0:1]): error += 1 # out_channel
+       if (stride<=0) or (padding<0): error += 1
+       if (pool_kernel_size<=0) or (pool_stride<=0): error += 1
+       if activation not in [None, 'relu', 'leaky_relu']: error += 1
+       if error!=0: return None
+    in_minibatch = input.shape[0]
+    status, out_size = _dlr.GetOutputSizeOfConvolution2dPool2dMax( input.shape[3]
+                                                                 , weight.shape[3]
+                                                                 , stride
+                                                                 , padding
+                                                                 , pool_kernel_size
+                                                                 , pool_stride
+                                                                 , ceil_mode
+                                                                 , rigor=rigor
+                                                                 , verbose=verbose)
+    if not status: return None
+    out_data = _get_output(out, [in_minibatch,weight.shape[0],out_size,out_size], input.dtype)
+    if out_data is None: return None
+    status = _run_minibatch( _dlr.Convolution2dPool2dMaxBatch
+                           , out_data # in_minibatch x ...
+                           , input    # in_minibatch x ...
+                           , _numpy(weight.contiguous())
+                           , _numpy(bias.contiguous()) if bias is not None else None
+                           , stride
+                           , padding
+                           , pool_kernel_size
+                           , pool_stride
+                           , ceil_mode
+                           , activation={None:None, 'relu':'ReLu', 'leaky_relu':'LeakyReLu'}.get(activation)
+                           , negative_slope=negative_slope
+                           , rigor=rigor
+                           , verbose=verbose)
+    return out_data if status else None
+
 #===============================================================================
 def max_pool2d ( input     # in_minibatch x in_channel x in_size x in_size
                , kernel_size
@@ -101,7 +436,9 @@ def max_pool2d ( input     # in_minibatch x in_channel x in_size x in_size
                , padding=0
                , ceil_mode=False
                , rigor=False
-               , verbose=False):
+               , verbose=False
+               , out=None
+               , return_indices=False):
     """
     Corresponding torch.nn.functional.max_pool2d(input, kernel_size,
                                                  stride, padding, ceil_mode,
@@ -117,7 +454,12 @@ def max_pool2d ( input     # in_minibatch x in_channel x in_size x in_size
     :param ceil_mode: when True, will use ceil instead of floor in the formula to compute the output shape
     :param rigor: check values rigorously when 'True'
     :param verbose: output message more when 'True'
+    :param out: None to allocate, tensor to be filled,
+                or key of output tensor kept across calls (see clear_output_cache())
+    :param return_indices: when True, returns indices of the max as well,
+                which are torch.int64 of int32 index map by Pooling2dMaxIndicesBatch()
     :return: out_data on success, None on failure.
+             (out_data, indices) when 'return_indices' is True.
     """
     if rigor:
        error = 0
@@ -139,12 +481,36 @@ def max_pool2d ( input     # in_minibatch x in_channel x in_size x in_size
                                                        , rigor=rigor
                                                        , verbose=verbose)
     if not status: return None
-    out_data = torch.empty([in_minibatch,out_channel,out_size,out_size], dtype=dtype)
+    out_data = _get_output(out, [in_minibatch,out_channel,out_size,out_size], dtype)
+    if out_data is None: return None
+    if return_indices: # values and int32 indices in the same pass
+        indices = torch.empty([in_minibatch,out_channel,out_size,out_size], dtype=torch.int32)
+        status = _dlr.Pooling2dMaxIndicesBatch( _numpy(out_data)
+                                              , indices.numpy()
+                                              , _numpy(input.contiguous())
+                                              , kernel_size
+                                              , stride
+                                              , padding
+                                              , ceil_mode
+                                              , rigor=rigor
+                                              , verbose=verbose)
+        return (out_data, indices.to(torch.int64)) if status else None
+    if in_minibatch>1: # whole minibatch by a single call or split across the thread pool
+        status = _run_minibatch( _dlr.Pooling2dMaxBatch
+                               , out_data # in_minibatch x ...
+                               , input    # in_minibatch x ...
+                               , kernel_size
+                               , stride
+                               , padding
+                               , ceil_mode
+                               , rigor=rigor
+                               , verbose=verbose)
+        return out_data if status else None
     for mb in range(in_minibatch):
         xout_data = out_data[mb]
         xin_data  = input[mb]
-        status = _dlr.Pooling2dMax( xout_data.data.numpy() # out_channel x out_size x out_size
-                                 , xin_data.data.numpy()  # in_channel x in_size x in_size
+        status = _dlr.Pooling2dMax( _numpy(xout_data) # out_channel x out_size x out_size
+                                 , _numpy(xin_data)  # in_channel x in_size x in_size
                                  , kernel_size
                                  , stride
                                  , padding
@@ -152,7 +518,6 @@ def max_pool2d ( input     # in_minibatch x in_channel x in_size x in_size
                                  , rigor=rigor
                                  , verbose=verbose)
         if not status: return None
-        out_data[mb] = xout_data
     return out_data
 
 #===============================================================================
@@ -161,8 +526,10 @@ def avg_pool2d ( input     # in_minibatch x in_channel x in_size x in_size
                , stride=1
                , padding=0
                , ceil_mode=False
+               , count_include_pad=True
                , rigor=False
-               , verbose=False):
+               , verbose=False
+               , out=None):
     """
     Corresponding torch.nn.functional.avg_pool2d(input, kernel_size,
                                                  stride, padding, ceil_mode,
@@ -176,13 +543,15 @@ def avg_pool2d ( input     # in_minibatch x in_channel x in_size x in_size
     :param stride: num of skips to apply next filter
     :param padding: num of pixes at the boundary
     :param ceil_mode: when True, will use ceil instead of floor in the formula to compute the output shape
+    :param count_include_pad: when True, will include the zero-padding in the averaging calculation
     :param rigor: check values rigorously when 'True'
     :param verbose: output message more when 'True'
+    :param out: None to allocate, tensor to be filled,
+                or key of output tensor kept across calls (see clear_output_cache())
     :return: out_data on success, None on failure.
     """
     if rigor:
        error = 0
-       if ceil_mode: error += 1 # not support
        if (input.dim()!=4): error += 1
        if (input.shape[2]!=input.shape[3]): error += 1 # not square
        if (kernel_size<=0): error += 1
@@ -200,22 +569,115 @@ def avg_pool2d ( input     # in_minibatch x in_channel x in_size x in_size
                                                       , rigor=rigor
                                                       , verbose=verbose)
     if not status: return None
-    out_data = torch.empty([in_minibatch,out_channel,out_size,out_size], dtype=dtype)
+    out_data = _get_output(out, [in_minibatch,out_channel,out_size,out_size], dtype)
+    if out_data is None: return None
+    if in_minibatch>1: # whole minibatch by a single call or split across the thread pool
+        status = _run_minibatch( _dlr.Pooling2dAvgBatch
+                               , out_data # in_minibatch x ...
+                               , input    # in_minibatch x ...
+                               , kernel_size
+                               , stride
+                               , padding
+                               , ceil_mode
+                               , count_include_pad=count_include_pad
+                               , rigor=rigor
+                               , verbose=verbose)
+        return out_data if status else None
     for mb in range(in_minibatch):
         xout_data = out_data[mb]
         xin_data  = input[mb]
-        status = _dlr.Pooling2dAvg( xout_data.data.numpy() # out_channel x out_size x out_size
-                                 , xin_data.data.numpy()  # in_channel x in_size x in_size
+        status = _dlr.Pooling2dAvg( _numpy(xout_data) # out_channel x out_size x out_size
+                                 , _numpy(xin_data)  # in_channel x in_size x in_size
                                  , kernel_size
                                  , stride
                                  , padding
                                  , ceil_mode
+                                 , count_include_pad=count_include_pad
                                  , rigor=rigor
                                  , verbose=verbose)
         if not status: return None
-        out_data[mb] = xout_data
     return out_data
 
+#===============================================================================
+def _adaptive_pool2d( func
+                    , input     # in_minibatch x in_channel x in_size x in_size
+                    , output_size
+                    , rigor=False
+                    , verbose=False
+                    , out=None):
+    """
+    Returns output tensor of adaptive_avg_pool2d() or adaptive_max_pool2d() on success
+    :param func: 'Avg' or 'Max'
+    """
+    if isinstance(output_size, (tuple, list)):
+        if (len(output_size)!=2) or (output_size[0]!=output_size[1]):
+            _dlr.DlrError(f"output_size should be square: {output_size}")
+            return None
+        output_size = output_size[0]
+    if rigor:
+       error = 0
+       if (input.dim()!=4): error += 1
+       if (input.shape[2]!=input.shape[3]): error += 1 # not square
+       if (output_size is None) or (output_size<=0): error += 1
+       if error!=0: return None
+    dtype = input.dtype
+    in_minibatch = input.shape[0]
+    out_channel = input.shape[1]
+    out_data = _get_output(out, [in_minibatch,out_channel,output_size,output_size], dtype)
+    if out_data is None: return None
+    if output_size==1: # a single reduction of each channel
+        status = _run_minibatch( getattr(_dlr, 'Pooling2dGlobal'+func+'Batch')
+                               , out_data.view(in_minibatch,out_channel) # in_minibatch x ...
+                               , input    # in_minibatch x ...
+                               , rigor=rigor
+                               , verbose=verbose)
+    else:
+        status = _run_minibatch( getattr(_dlr, 'Pooling2dAdaptive'+func+'Batch')
+                               , out_data # in_minibatch x ...
+                               , input    # in_minibatch x ...
+                               , rigor=rigor
+                               , verbose=verbose)
+    return out_data if status else None
+
+def adaptive_avg_pool2d ( input     # in_minibatch x in_channel x in_size x in_size
+                        , output_size
+                        , rigor=False
+                        , verbose=False
+                        , out=None):
+    """
+    Corresponding torch.nn.functional.adaptive_avg_pool2d(input, output_size)
+    Returns output tensor on success
+    Applies a 2D adaptive average pooling, where output_size of 1 goes Pooling2dGlobalAvg.
+    :param input: input data, input[in_minibatch][in_channel][in_size][in_size]
+    :param output_size: size of output, int or square (int, int)
+    :param rigor: check values rigorously when 'True'
+    :param verbose: output message more when 'True'
+    :param out: None to allocate, tensor to be filled,
+                or key of output tensor kept across calls (see clear_output_cache())
+    :return: out_data on success, None on failure.
+    """
+    return _adaptive_pool2d('Avg', input, output_size, rigor=rigor, verbose=verbose, out=out)
+
+def adaptive_max_pool2d ( input     # in_minibatch x in_channel x in_size x in_size
+                        , output_size
+                        , rigor=False
+                        , verbose=False
+                        , out=None):
+    """
+    Corresponding torch.nn.functional.adaptive_max_pool2d(input, output_size,
+                                                          return_indices=False)
+    Returns output tensor on success
+    Applies a 2D adaptive max pooling, where output_size of 1 goes Pooling2dGlobalMax.
+    :param input: input data, input[in_minibatch][in_channel][in_size][in_size]
+    :param output_size: size of output, int or square (int, int)
+    :param rigor: check values rigorously when 'True'
+    :param verbose: output message more when 'True'
+    :param out: None to allocate, tensor to be filled,
+                or key of output tensor kept across calls (see clear_output_cache())
+    :return: out_data on success, None on failure.
+    """
+    return _adaptive_pool2d('Max', input, output_size, rigor=rigor, verbose=verbose, out=out)
+
 #===============================================================================
 # example: def __init__(self):
 #              super().__init__()
@@ -235,7 +697,9 @@ def linear ( input   # in_minibatch x in_size
            , weight  # out_size x in_size
            , bias=None   # out_size
            , rigor=False
-           , verbose=False):
+           , verbose=False
+           , algorithm=None
+           , out=None):
     """
     Correspond torch.nn.functional.linear(input, weight, bias)
     Returns output tensor on success
@@ -246,20 +710,88 @@ def linear ( input   # in_minibatch x in_size
     :param bias: bias[out_size]
     :param rigor: check values rigorously when 'True'
     :param verbose: output message more when 'True'
+    :param algorithm: None (default) to take all rows at once for any rank (see linear_batch()),
+                      'reference' for linear1d() or linearNd(),
+                      or 'packed' to use packed weights kept across calls for 2D input,
+                      where clear_packed_weights() should be called after writes through 'weight.data'
+    :param out: None to allocate, tensor to be filled,
+                or key of output tensor kept across calls (see clear_output_cache())
     :return: out_data on success, None on failure.
     """
+    if (algorithm is None):
+        return linear_batch( input   # ... x in_size
+                           , weight  # out_size x in_size
+                           , bias
+                           , rigor
+                           , verbose
+                           , out=out)
     if (input.dim()==2):
         return linear1d( input   # in_minibatch x N x in_size
                        , weight  # out_size x in_size
                        , bias
                        , rigor
-                       , verbose)
+                       , verbose
+                       , algorithm
+                       , out=out)
     else:
         return linearNd( input   # in_minibatch x N x in_size
                        , weight  # out_size x in_size
                        , bias
                        , rigor
-                       , verbose)
+                       , verbose
+                       , out=out)
+
+#===============================================================================
+# Z = X * W' + B, where W' is transposed and rows of X are all leading dimensions
+def linear_batch ( input   # ... x in_size
+                 , weight  # out_size x in_size
+                 , bias=None   # out_size
+                 , rigor=False
+                 , verbose=False
+                 , out=None):
+    """
+    Correspond torch.nn.functional.linear(input, weight, bias)
+    Returns output tensor on success
+    Applies a linear transformation over all rows of an input data of any rank at once,
+    where weight is read once for each block instead of once for each row.
+    Note that all nd-array lists are PyTorch tensor (immutable).
+    :param input: input data, input[...][in_size]
+    :param weight: weight[out_size][in_size]
+    :param bias: None or bias[out_size]
+    :param rigor: check values rigorously when 'True'
+    :param verbose: output message more when 'True'
+    :param out: None to allocate, tensor to be filled,
+                or key of output tensor kept across calls (see clear_output_cache())
+    :return: out_data on success, None on failure.
+    """
+    if rigor:
+       error = 0
+       if (input.dim()<1): error += 1
+       if (weight.dim()!=2): error += 1 # not 2D
+       if (weight.shape[1]!=input.shape[-1]): error += 1
+       if (bias is not None) and (bias.dim()!=1): error += 1
+       if (bias is not None) and (bias.shape[0]!=weight.shape[0]): error += 1
+       if error!=0: return None
+    out_data = _get_output(out, list(input.shape[:-1])+[weight.shape[0]], input.dtype)
+    if out_data is None: return None
+    xweight = _numpy(weight.contiguous()) # out_size x in_size
+    xbias   = None if bias is None else _numpy(bias.contiguous()) # out_size
+    if input.dim()==1: # no leading dimension to split
+        status = _dlr.LinearBatch( _numpy(out_data)
+                                 , _numpy(input.contiguous())
+                                 , xweight
+                                 , xbias
+                                 , rigor=rigor
+                                 , verbose=verbose)
+        return out_data if status else None
+    status = _run_minibatch( _dlr.LinearBatch
+                           , out_data # in_minibatch x ...
+                           , input    # in_minibatch x ...
+                           , xweight
+                           , xbias
+                           , rigor=rigor
+                           , verbose=verbose)
+    return out_data if status else None
 
 #===============================================================================
 # Z = X * W' + B, where W' is transposed
@@ -267,7 +799,9 @@ def linear1d ( input   # in_minibatch x in_size
              , weight  # out_size x in_size
              , bias=None   # out_size
              , rigor=False
-             , verbose=False):
+             , verbose=False
+             , algorithm=None
+             , out=None):
     """
     Correspond torch.nn.functional.linear(input, weight, bias)
     Returns output tensor on success
@@ -278,6 +812,10 @@ def linear1d ( input   # in_minibatch x in_size
     :param bias: bias[out_size]
     :param rigor: check values rigorously when 'True'
     :param verbose: output message more when 'True'
+    :param algorithm: None (default) or 'reference', or 'packed' to use packed weights kept across calls,
+                      where clear_packed_weights() should be called after writes through 'weight.data'
+    :param out: None to allocate, tensor to be filled,
+                or key of output tensor kept across calls (see clear_output_cache())
     :return: out_data on success, None on failure.
     """
     if rigor:
@@ -292,18 +830,37 @@ def linear1d ( input   # in_minibatch x in_size
     in_minibatch = input.shape[0]
     in_size = input.shape[1]
     out_size = weight.shape[0]
-    out_data = torch.empty([in_minibatch,out_size], dtype=dtype)
+    out_data = _get_output(out, [in_minibatch,out_size], dtype)
+    if out_data is None: return None
+    if algorithm=='packed':
+        packed = _get_packed_weights(_dlr.PackWeightsLinear1d, weight, bias)
+        if packed is None: return None
+        status = _run_minibatch( _dlr.Linear1dPackedBatch
+                               , out_data # in_minibatch x ...
+                               , input    # in_minibatch x ...
+                               , packed
+                               , rigor=rigor
+                               , verbose=verbose)
+        return out_data if status else None
+    if in_minibatch>1: # whole minibatch by a single call or split across the thread pool
+        status = _run_minibatch( _dlr.Linear1dBatch
+                               , out_data # in_minibatch x ...
+                               , input    # in_minibatch x ...
+                               , _numpy(weight) # out_size x in_size
+                               , None if bias is None else _numpy(bias) # out_size
+                               , rigor=rigor
+                               , verbose=verbose)
+        return out_data if status else None
     for mb in range(in_minibatch):
         xout_data = out_data[mb]
         xin_data  = input[mb]
-        status = _dlr.Linear1d( xout_data.data.numpy() # out_size
-                              , xin_data.data.numpy()  # in_size
-                              , weight.data.numpy() # out_size x in_size
-                              , None if bias is None else bias.data.numpy() # out_size
+        status = _dlr.Linear1d( _numpy(xout_data) # out_size
+                              , _numpy(xin_data)  # in_size
+                              , _numpy(weight) # out_size x in_size
+                              , None if bias is None else _numpy(bias) # out_size
                               , rigor=rigor
                               , verbose=verbose)
         if not status: return None
-        out_data[mb] = xout_data
     return out_data
 
 #===============================================================================
@@ -312,7 +869,8 @@ def linearNd ( input   # in_minibatch x in_size x ...
              , weight  # out_size x in_size
              , bias=None   # out_size
              , rigor=False
-             , verbose=False):
+             , verbose=False
+             , out=None):
     """
     Correspond torch.nn.functional.linear(input, weight, bias)
     Returns output tensor on success
@@ -323,6 +881,8 @@ def linearNd ( input   # in_minibatch x in_size x ...
     :param bias: bias[out_size]
     :param rigor: check values rigorously when 'True'
     :param verbose: output message more when 'True'
+    :param out: None to allocate, tensor to be filled,
+                or key of output tensor kept across calls (see clear_output_cache())
     :return: out_data on success, None on failure.
     """
     if (input.dim()==2):
@@ -330,7 +890,8 @@ def linearNd ( input   # in_minibatch x in_size x ...
                        , weight  # out_size x in_size
                        , bias
                        , rigor
-                       , verbose)
+                       , verbose
+                       , out=out)
     if rigor:
        error = 0
        if (weight.dim()!=2): error += 1 # not 2D
@@ -339,25 +900,26 @@ def linearNd ( input   # in_minibatch x in_size x ...
        if (bias is not None) and (bias.shape[0]!=weight.shape[0]): error += 1
        if error!=0: return None
     in_minibatch = input.shape[0]
-    out_data = torch.empty([in_minibatch,input.shape[0],weight.shape[1]], dtype=input.dtype)
+    out_data = _get_output(out, [in_minibatch,input.shape[1],weight.shape[0]], input.dtype)
+    if out_data is None: return None
     for mb in range(in_minibatch):
         xout_data = out_data[mb]
         xin_data  = input[mb]
-        status = _dlr.LinearNd( xout_data.data.numpy() # ndim x out_size
-                              , xin_data.data.numpy()  # ndim x in_size
-                              , weight.data.numpy() # out_size x in_size
-                              , None if bias is None else bias.data.numpy() # out_size
+        status = _dlr.LinearNd( _numpy(xout_data) # ndim x out_size
+                              , _numpy(xin_data)  # ndim x in_size
+                              , _numpy(weight) # out_size x in_size
+                              , None if bias is None else _numpy(bias) # out_size
                               , rigor=rigor
                               , verbose=verbose)
         if not status: return None
-        out_data[mb] = xout_data
     return out_data
 
 #===============================================================================
 def cat( tensors
        , dim=0
        , rigor=False
-       , verbose=False):
+       , verbose=False
+       , out=None):
     """
     Correspond torch.cat(tensors,dim,out=None) for tensor.dim is 3, i.e, (minibatch,rows,cols)
     """
@@ -366,14 +928,16 @@ def cat( tensors
                    , tensors[1]
                    , dim
                    , rigor
-                   , verbose)
+                   , verbose
+                   , out=out)
 
 #===============================================================================
 def concat2d( inputA # minibatch x rowsA x colsA
             , inputB # minibatch x rowsB x colsB
             , dim=0
             , rigor=False
-            , verbose=False):
+            , verbose=False
+            , out=None):
     """
     Correspond torch.cat(tensors,dim,out=None) for tensor.dim is 3, i.e, (minibatch,rows,cols)
     Returns output tensor on success
@@ -384,6 +948,8 @@ def concat2d( inputA # minibatch x rowsA x colsA
     :param dim: dimension
     :param rigor: check values rigorously when 'True'
     :param verbose: output message more when 'True'
+    :param out: None to allocate, tensor to be filled,
+                or key of output tensor kept across calls (see clear_output_cache())
     :return: out_data on success, None on failure.
     """
     if rigor:
@@ -399,21 +965,21 @@ def concat2d( inputA # minibatch x rowsA x colsA
     else:
        out_rows = inputA.shape[1]+inputB.shape[1]
        out_cols = inputA.shape[2]
-    dtype = input.dtype
+    dtype = inputA.dtype
     minibatch = inputA.shape[0]
-    out_data = torch.empty([minibatch,out_rows,our_cols], dtype=dtype)
-    for mb in range(in_minibatch):
+    out_data = _get_output(out, [minibatch,out_rows,out_cols], dtype)
+    if out_data is None: return None
+    for mb in range(minibatch):
        xout_data  = out_data[mb]
        xin_dataA  = inputA[mb]
        xin_dataB  = inputB[mb]
-       status = _dlr.Concat2d( xout_data.data.numpy()
-                            , xin_dataA.data.numpy()
-                            , xin_dataB.data.numpy()
+       status = _dlr.Concat2d( _numpy(xout_data)
+                            , _numpy(xin_dataA)
+                            , _numpy(xin_dataB)
                             , dim
                             , rigor=rigor
                             , verbose=verbose)
        if not status: return None
-       out_data[mb] = xout_data
     return out_data
 
 #===============================================================================
@@ -421,7 +987,10 @@ def activations( func
                , input
                , negative_slope=0.01
                , rigor=False
-               , verbose=False):
+               , verbose=False
+               , out=None
+               , accuracy=None
+               , inplace=False):
     """
     Bridge to a specific non-linear activation function
     Returns output tensor on success
@@ -431,56 +1000,94 @@ def activations( func
     :param input: input data, input[minibatch][....] in any dimension
     :param rigor: check values rigorously when 'True'
     :param verbose: output message more when 'True'
+    :param out: None to allocate, tensor to be filled,
+                or key of output tensor kept across calls (see clear_output_cache())
+    :param accuracy: None, 'exact', 'lut' or 'poly' for Tanh and Sigmoid in float precision
+    :param inplace: overwrite 'input' and return it, where 'out' is ignored
+                    (non-contiguous 'input' is computed into a contiguous temporary and copied back)
     :return: out_data on success, None on failure.
     """
+    if inplace and not input.is_contiguous():
+        out_data = activations(func, input, negative_slope, rigor, verbose, accuracy=accuracy)
+        return None if out_data is None else input.copy_(out_data)
     func_name = 'Activation'+func
     function  = getattr(_dlr, func_name)
     minibatch = input.shape[0]
     dtype     = input.dtype
-    out_data = torch.empty(input.shape, dtype=dtype)
+    out_data = _get_output(input if inplace else out, input.shape, dtype)
+    if out_data is None: return None
+    if minibatch>1: # whole minibatch by a single call or split across the thread pool
+       status = _run_minibatch( functools.partial(_dlr.ActivationsBatch, func)
+                              , out_data
+                              , input
+                              , negative_slope=negative_slope
+                              , rigor=rigor
+                              , verbose=verbose
+                              , accuracy=accuracy)
+       return out_data if status else None
     for mb in range(minibatch):
        xout_data = out_data[mb]
        xin_data  = input[mb]
        if func == 'LeakyReLu':
-           status = function( xout_data.data.numpy()
-                            , xin_data.data.numpy()
+           status = function( _numpy(xout_data)
+                            , _numpy(xin_data)
                             , negative_slope=negative_slope
                             , rigor=rigor
                             , verbose=verbose)
        else:
-           # status = _dlr.__getattribute__(func_name)( xout_data.data.numpy()
-           status = function( xout_data.data.numpy()
-                            , xin_data.data.numpy()
+           # status = _dlr.__getattribute__(func_name)( _numpy(xout_data)
+           status = function( _numpy(xout_data)
+                            , _numpy(xin_data)
                             , rigor=rigor
-                            , verbose=verbose)
+                            , verbose=verbose
+                            , **({} if accuracy is None else {'accuracy': accuracy}))
        if not status: return None
-       out_data[mb] = xout_data
     return out_data
 
-def relu(input, rigor=False, verbose=False):
+def relu(input, rigor=False, verbose=False, out=None, inplace=False):
     """
-    Correspond torch.nn.functional.relu(input, inplace=False)
+    Correspond torch.nn.functional.relu(input, inplace)
     """
     return activations( 'ReLu'
                       , input
-                      , rigor
-                      , verbose)
-def leaky_relu(input, negative_slope=0.01, rigor=False, verbose=False):
+                      , rigor=rigor
+                      , verbose=verbose
+                      , out=out
+                      , inplace=inplace)
+def leaky_relu(input, negative_slope=0.01, rigor=False, verbose=False, out=None, inplace=False):
+    """
+    Correspond torch.nn.functional.leaky_relu(input, negative_slope, inplace)
+    """
     return activations( 'LeakyReLu'
                       , input
                       , negative_slope
                       , rigor
-                      , verbose)
-def tanh(input, rigor=False, verbose=False):
+                      , verbose
+                      , out=out
+                      , inplace=inplace)
+def tanh(input, rigor=False, verbose=False, out=None, accuracy=None, inplace=False):
+    """
+    Correspond torch.tanh(input), where 'accuracy' is one of None (double precision),
+    'exact', 'lut' and 'poly' (float precision).
+    """
     return activations( 'Tanh'
                       , input
-                      , rigor
-                      , verbose)
-def sigmoid(input, rigor=False, verbose=False):
+                      , rigor=rigor
+                      , verbose=verbose
+                      , out=out
+                      , accuracy=accuracy
+                      , inplace=inplace)
+def sigmoid(input, rigor=False, verbose=False, out=None, accuracy=None, inplace=False):
+    """
+    Correspond torch.sigmoid(input), where 'accuracy' is as tanh()
+    """
     return activations( 'Sigmoid'
                       , input
-                      , rigor
-                      , verbose)
+                      , rigor=rigor
+                      , verbose=verbose
+                      , out=out
+                      , accuracy=accuracy
+                      , inplace=inplace)
 
 #===============================================================================
 def batch_norm ( input   # in_minibatch x in_channel x <...>
@@ -490,21 +1097,26 @@ def batch_norm ( input   # in_minibatch x in_channel x <...>
                , bias=None
                , eps=1E-5
                , rigor=False
-               , verbose=False):
+               , verbose=False
+               , out=None
+               , inplace=False
+               , prepared=False):
     """
     Correspond torch.nn.functional.batch_norm(input, running_mean, running_var,
                                               weight, bias,
                                               training=False, momentum=0.1, eps)
+    where 'prepared' is only for 4D input (see batch_norm2d()).
     """
     if (input.dim()==3):
         return batch_norm1d(input, running_mean, running_var,
-                           weight, bias, eps, rigor, verbose)
+                           weight, bias, eps, rigor, verbose, out=out, inplace=inplace)
     elif (input.dim()==4):
         return batch_norm2d(input, running_mean, running_var,
-                           weight, bias, eps, rigor, verbose)
+                           weight, bias, eps, rigor, verbose, out=out, inplace=inplace,
+                           prepared=prepared)
     elif (input.dim()==5):
         return batch_norm3d(input, running_mean, running_var,
-                           weight, bias, eps, rigor, verbose)
+                           weight, bias, eps, rigor, verbose, out=out, inplace=inplace)
     else:
         if verbose: _dlr.DlrError(f"batch_norm for more than 3D not supported")
         return None
@@ -517,7 +1129,9 @@ def batch_norm1d ( input   # in_minibatch x 1 x in_size
                  , bias=None # 1 x in_size
                  , eps=1E-5
                  , rigor=False
-                 , verbose=False):
+                 , verbose=False
+                 , out=None
+                 , inplace=False):
     """
     Correspond torch.nn.functional.batch_norm(input, running_mean, running_var,
                                               weight, bias,
@@ -532,6 +1146,10 @@ def batch_norm1d ( input   # in_minibatch x 1 x in_size
     :param bias: None or bias[in_channel]
     :param rigor: check values rigorously when 'True'
     :param verbose: output message more when 'True'
+    :param out: None to allocate, tensor to be filled,
+                or key of output tensor kept across calls (see clear_output_cache())
+    :param inplace: overwrite 'input' and return it, where 'out' is ignored
+                    (non-contiguous 'input' is computed into a contiguous temporary and copied back)
     :return: out_data on success, None on failure.
     """
     if rigor:
@@ -550,23 +1168,38 @@ def batch_norm1d ( input   # in_minibatch x 1 x in_size
            if (bias is not None) and (bias.numel()!=in_channel): error += 1
        else: error += 1; _dlr.DlrError("only supported for data with channel")
        if error!=0: return None
+    if inplace and not input.is_contiguous():
+        out_data = batch_norm1d(input, running_mean, running_var, weight, bias, eps, rigor, verbose)
+        return None if out_data is None else input.copy_(out_data)
     dtype = input.dtype
     in_minibatch = input.shape[0]
-    out_data = torch.empty(input.shape, dtype=dtype)
+    out_data = _get_output(input if inplace else out, input.shape, dtype)
+    if out_data is None: return None
+    if in_minibatch>1: # whole minibatch by a single call or split across the thread pool
+        status = _run_minibatch( _dlr.Norm1dBatchBatch
+                               , out_data # in_minibatch x ...
+                               , input    # in_minibatch x ...
+                               , _numpy(running_mean)
+                               , _numpy(running_var)
+                               , None if weight is None else _numpy(weight)
+                               , None if bias is None else _numpy(bias)
+                               , eps
+                               , rigor=rigor
+                               , verbose=verbose)
+        return out_data if status else None
     for mb in range(in_minibatch):
         xout_data = out_data[mb]
         xin_data  = input[mb]
-        status = _dlr.Norm1dBatch( xout_data.data.numpy() # ndim x out_size
-                                 , xin_data.data.numpy()  # ndim x in_size
-                                 , running_mean.data.numpy() # out_size x in_size
-                                 , running_var.data.numpy() # out_size x in_size
-                                 , None if weight is None else weight.data.numpy() # out_size
-                                 , None if bias is None else bias.data.numpy() # out_size
+        status = _dlr.Norm1dBatch( _numpy(xout_data) # ndim x out_size
+                                 , _numpy(xin_data)  # ndim x in_size
+                                 , _numpy(running_mean) # out_size x in_size
+                                 , _numpy(running_var) # out_size x in_size
+                                 , None if weight is None else _numpy(weight) # out_size
+                                 , None if bias is None else _numpy(bias) # out_size
                                  , eps
                                  , rigor=rigor
                                  , verbose=verbose)
         if not status: return None
-        out_data[mb] = xout_data
     return out_data
 
 #===============================================================================
@@ -577,7 +1210,10 @@ def batch_norm2d ( input   # in_minibatch x in_channel x in_size x in_size
                  , bias=None # in_channel x in_size x in_size
                  , eps=1E-5
                  , rigor=False
-                 , verbose=False):
+                 , verbose=False
+                 , out=None
+                 , inplace=False
+                 , prepared=False):
     """
     Correspond torch.nn.functional.batch_norm(input, running_mean, running_var,
                                               weight, bias,
@@ -592,6 +1228,12 @@ def batch_norm2d ( input   # in_minibatch x in_channel x in_size x in_size
     :param bias: None or bias[in_channel]
     :param rigor: check values rigorously when 'True'
     :param verbose: output message more when 'True'
+    :param out: None to allocate, tensor to be filled,
+                or key of output tensor kept across calls (see clear_output_cache())
+    :param inplace: overwrite 'input' and return it, where 'out' is ignored
+                    (non-contiguous 'input' is computed into a contiguous temporary and copied back)
+    :param prepared: use per-channel coefficients folded once and kept across calls
+                     (see batch_norm_coefficients())
     :return: out_data on success, None on failure.
     """
     if rigor:
@@ -607,25 +1249,66 @@ def batch_norm2d ( input   # in_minibatch x in_channel x in_size x in_size
        if (bias is not None) and (bias.dim()!=1): error += 1
        if (bias is not None) and (bias.numel()!=in_channel): error += 1
        if error!=0: return None
+    if inplace and not input.is_contiguous():
+        out_data = batch_norm2d(input, running_mean, running_var, weight, bias, eps, rigor, verbose, prepared=prepared)
+        return None if out_data is None else input.copy_(out_data)
     dtype = input.dtype
     in_minibatch = input.shape[0]
-    out_data = torch.empty(input.shape, dtype=dtype)
+    out_data = _get_output(input if inplace else out, input.shape, dtype)
+    if out_data is None: return None
+    if prepared:
+        folded = _get_packed_weights( _dlr.Norm2dBatchFold
+                                    , running_mean, running_var, weight, bias
+                                    , epsilon=eps)
+        if folded is None: return None
+        status = _run_minibatch( _dlr.Norm2dBatchPreparedBatch
+                               , out_data # in_minibatch x ...
+                               , input    # in_minibatch x ...
+                               , folded[0] # coef_a
+                               , folded[1] # coef_b
+                               , rigor=rigor
+                               , verbose=verbose)
+        return out_data if status else None
+    if in_minibatch>1: # whole minibatch by a single call or split across the thread pool
+        status = _run_minibatch( _dlr.Norm2dBatchBatch
+                               , out_data # in_minibatch x ...
+                               , input    # in_minibatch x ...
+                               , _numpy(running_mean)
+                               , _numpy(running_var)
+                               , None if weight is None else _numpy(weight)
+                               , None if bias is None else _numpy(bias)
+                               , eps
+                               , rigor=rigor
+                               , verbose=verbose)
+        return out_data if status else None
     for mb in range(in_minibatch):
         xout_data = out_data[mb]
         xin_data  = input[mb]
-        status = _dlr.Norm2dBatch( xout_data.data.numpy() # ndim x out_size
-                                 , xin_data.data.numpy()  # ndim x in_size
-                                 , running_mean.data.numpy() # out_size x in_size
-                                 , running_var.data.numpy() # out_size x in_size
-                                 , None if weight is None else weight.data.numpy() # out_size
-                                 , None if bias is None else bias.data.numpy() # out_size
+        status = _dlr.Norm2dBatch( _numpy(xout_data) # ndim x out_size
+                                 , _numpy(xin_data)  # ndim x in_size
+                                 , _numpy(running_mean) # out_size x in_size
+                                 , _numpy(running_var) # out_size x in_size
+                                 , None if weight is None else _numpy(weight) # out_size
+                                 , None if bias is None else _numpy(bias) # out_size
                                  , eps
                                  , rigor=rigor
                                  , verbose=verbose)
         if not status: return None
-        out_data[mb] = xout_data
     return out_data
 
+def batch_norm_coefficients(module):
+    """
+    Returns per-channel coefficients (coef_a, coef_b) of NumPy folded from 'module'
+    of torch.nn.BatchNorm2d in eval mode, or None on failure, which are folded once
+    and kept across calls until running statistics or affine parameters are changed.
+    """
+    return _get_packed_weights( _dlr.Norm2dBatchFold
+                              , module.running_mean
+                              , module.running_var
+                              , module.weight
+                              , module.bias
+                              , epsilon=module.eps)
+
 #===============================================================================
 # not fully tested
 def batch_norm3d ( input   # in_minibatch x in_channel x in_depth x in_height x in_width
@@ -635,7 +1318,9 @@ def batch_norm3d ( input   # in_minibatch x in_channel x in_depth x in_height x
                  , bias=None # in_channel x in_depth x in_height x in_width
                  , eps=1E-5
                  , rigor=False
-                 , verbose=False):
+                 , verbose=False
+                 , out=None
+                 , inplace=False):
     """
     Correspond torch.nn.functional.batch_norm(input, running_mean, running_var,
                                              weight, bias,
@@ -650,6 +1335,10 @@ def batch_norm3d ( input   # in_minibatch x in_channel x in_depth x in_height x
     :param bias: None or bias[in_channel]
     :param rigor: check values rigorously when 'True'
     :param verbose: output message more when 'True'
+    :param out: None to allocate, tensor to be filled,
+                or key of output tensor kept across calls (see clear_output_cache())
+    :param inplace: overwrite 'input' and return it, where 'out' is ignored
+                    (non-contiguous 'input' is computed into a contiguous temporary and copied back)
     :return: out_data on success, None on failure.
     """
     if rigor:
@@ -668,23 +1357,38 @@ def batch_norm3d ( input   # in_minibatch x in_channel x in_depth x in_height x
        if (bias is not None) and (bias.dim()!=1): error += 1
        if (bias is not None) and (bias.numel()!=in_channel): error += 1
        if error!=0: return None
+    if inplace and not input.is_contiguous():
+        out_data = batch_norm3d(input, running_mean, running_var, weight, bias, eps, rigor, verbose)
+        return None if out_data is None else input.copy_(out_data)
     dtype = input.dtype
     in_minibatch = input.shape[0]
-    out_data = torch.empty(input.shape, dtype=dtype)
+    out_data = _get_output(input if inplace else out, input.shape, dtype)
+    if out_data is None: return None
+    if in_minibatch>1: # whole minibatch by a single call or split across the thread pool
+        status = _run_minibatch( _dlr.Norm3dBatchBatch
+                               , out_data # in_minibatch x ...
+                               , input    # in_minibatch x ...
+                               , _numpy(running_mean)
+                               , _numpy(running_var)
+                               , None if weight is None else _numpy(weight)
+                               , None if bias is None else _numpy(bias)
+                               , eps
+                               , rigor=rigor
+                               , verbose=verbose)
+        return out_data if status else None
     for mb in range(in_minibatch):
         xout_data = out_data[mb]
         xin_data  = input[mb]
-        status = _dlr.Norm3dBatch( xout_data.data.numpy() # ndim x out_size
-                                 , xin_data.data.numpy()  # ndim x in_size
-                                 , running_mean.data.numpy() # out_size x in_size
-                                 , running_var.data.numpy() # out_size x in_size
-                                 , None if weight is None else weight.data.numpy() # out_size
-                                 , None if bias is None else bias.data.numpy() # out_size
+        status = _dlr.Norm3dBatch( _numpy(xout_data) # ndim x out_size
+                                 , _numpy(xin_data)  # ndim x in_size
+                                 , _numpy(running_mean) # out_size x in_size
+                                 , _numpy(running_var) # out_size x in_size
+                                 , None if weight is None else _numpy(weight) # out_size
+                                 , None if bias is None else _numpy(bias) # out_size
                                  , eps
                                  , rigor=rigor
                                  , verbose=verbose)
         if not status: return None
-        out_data[mb] = xout_data
     return out_data
 
 #===============================================================================
@@ -697,7 +1401,8 @@ def conv_transpose2d( input     # in_minibatch x in_channel x in_size x in_size
                     , groups=1
                     , dilation=1
                     , rigor=False
-                    , verbose=False):
+                    , verbose=False
+                    , out=None):
     """
     Corresponding torch.nn.functional.conv_transpose2d(input, weight, bias=None,
                                              stride, padding, dilation, groups)
@@ -713,6 +1418,8 @@ def conv_transpose2d( input     # in_minibatch x in_channel x in_size x in_size
     :param groups:
     :param rigor: check values rigorously when 'True'
     :param verbose: output message more when 'True'
+    :param out: None to allocate, tensor to be filled,
+                or key of output tensor kept across calls (see clear_output_cache())
     :return: out_data on success, None on failure.
     """
     if rigor:
@@ -744,20 +1451,31 @@ def conv_transpose2d( input     # in_minibatch x in_channel x in_size x in_size
                                                           , rigor=rigor
                                                           , verbose=verbose)
     if not status: return None
-    out_data = torch.empty([in_minibatch,out_channel,out_size,out_size], dtype=dtype)
+    out_data = _get_output(out, [in_minibatch,out_channel,out_size,out_size], dtype)
+    if out_data is None: return None
+    if in_minibatch>1: # whole minibatch by a single call or split across the thread pool
+        status = _run_minibatch( _dlr.Deconvolution2dBatch
+                               , out_data # in_minibatch x ...
+                               , input    # in_minibatch x ...
+                               , _numpy(weight)   # in_channel x out_channel x kernel_size x kernel_size
+                               , _numpy(bias) if bias is not None else None
+                               , stride
+                               , padding
+                               , rigor=rigor
+                               , verbose=verbose)
+        return out_data if status else None
     for mb in range(in_minibatch):
         xout_data = out_data[mb]
         xin_data  = input[mb]
-        status = _dlr.Deconvolution2d( xout_data.data.numpy() # out_channel x out_size x out_size
-                                     , xin_data.data.numpy()  # in_channel x in_size x in_size
-                                     , weight.data.numpy()   # in_channel x out_channel x kernel_size x kernel_size
-                                     , bias.data.numpy()     # out_channel
+        status = _dlr.Deconvolution2d( _numpy(xout_data) # out_channel x out_size x out_size
+                                     , _numpy(xin_data)  # in_channel x in_size x in_size
+                                     , _numpy(weight)   # in_channel x out_channel x kernel_size x kernel_size
+                                     , _numpy(bias)     # out_channel
                                      , stride
                                      , padding
                                      , rigor=rigor
                                      , verbose=verbose)
         if not status: return None
-        out_data[mb] = xout_data
     return out_data
 
 #===============================================================================
@@ -771,6 +1489,34 @@ if __name__=='__main__':
     def TestLinearNd     (dtype,limit,random,rigor,verbose):
         return False
 
+    def TestLinearBatch(dtype, limit, random, rigor, verbose):
+        """
+        Compares linear() against torch.nn.functional.linear for inputs of any rank
+        """
+        configs = [ ([64], 100, 10, None) # input shape except in_size, in_size, out_size, algorithm
+                  , ([8, 64], 256, 100, None)
+                  , ([4, 5, 33], 33, 13, None)
+                  , ([2, 3, 4, 16], 16, 20, None)
+                  , ([8, 64], 256, 100, 'reference')
+                  , ([8, 64], 256, 100, 'packed')
+                  , ([4, 5, 33], 33, 13, 'reference') ]
+        error = 0
+        for shape, in_size, out_size, algorithm in configs:
+            shape   = torch.Size(shape[:-1]+[in_size])
+            in_data = torch.randn(shape) if random else torch.linspace(-1, 1, shape.numel()).reshape(shape)
+            weight  = torch.randn(out_size, in_size)
+            bias    = torch.randn(out_size)
+            expect   = F.linear(in_data, weight, bias)
+            out_data = linear(in_data, weight, bias, rigor=rigor, verbose=verbose, algorithm=algorithm)
+            status = (out_data is not None) and (out_data.shape==expect.shape) and \
+                     torch.all(torch.lt(torch.abs(out_data-expect), limit)).item()
+            if status:
+                _dlr.DlrInfo(f"OK linear {list(in_data.shape)}x{list(weight.shape)} {algorithm}")
+            else:
+                error += 1
+                _dlr.DlrError(f"Mis-match linear {list(in_data.shape)}x{list(weight.shape)} {algorithm}")
+        return True if error==0 else False
+
 #===============================================================================
 if __name__=='__main__':
     def TestPooling2dMax(dtype,limit,random,rigor,verbose):
@@ -806,6 +1552,12 @@ if __name__=='__main__':
                   ,[1,512,12,6,2,1,0]
                   ,[1,512,12,6,3,2,0]
                   ]
+        if func == 'avg': # count_include_pad[7], which goes Pooling2dAvg<Type>Integral with ceil_mode
+            configs += [ [1,16,13,3,2,1,1,1]
+                       , [1,16,13,3,2,1,1,0]
+                       , [2,32,12,5,3,2,0,0]
+                       , [2,32,12,5,3,2,1,1]
+                       , [1, 8, 7,2,2,1,1,0] ]
         errors = torch.zeros(len(configs))
         for idx in range(len(configs)):
             minibatch   = configs[idx][0]
@@ -815,6 +1567,7 @@ if __name__=='__main__':
             stride      = configs[idx][4]
             padding     = configs[idx][5]
             ceil_mode   = False if configs[idx][6] == 0 else True
+            count_include_pad = (len(configs[idx])<8) or (configs[idx][7]!=0)
             data        = torch.zeros(size=[minibatch,in_channel,in_size,in_size])
             in_data     = GenDataPooling2d(data, rigor=rigor, verbose=verbose)
 
@@ -832,17 +1585,33 @@ if __name__=='__main__':
                                        , ceil_mode=ceil_mode
                                        , rigor=rigor
                                        , verbose=verbose)
+                _, out_indices = F.max_pool2d( input=in_data
+                                             , kernel_size=kernel_size
+                                             , stride=stride
+                                             , padding=padding
+                                             , ceil_mode=ceil_mode
+                                             , return_indices=True)
+                nout_result = max_pool2d ( input=in_data
+                                         , kernel_size=kernel_size
+                                         , stride=stride
+                                         , padding=padding
+                                         , ceil_mode=ceil_mode
+                                         , rigor=rigor
+                                         , verbose=verbose
+                                         , return_indices=True)
             elif func == 'avg':
                 out_data  = F.avg_pool2d( input=in_data
                                         , kernel_size=kernel_size
                                         , stride=stride
                                         , padding=padding
-                                        , ceil_mode=ceil_mode)
+                                        , ceil_mode=ceil_mode
+                                        , count_include_pad=count_include_pad)
                 nout_data = avg_pool2d ( input=in_data
                                        , kernel_size=kernel_size
                                        , stride=stride
                                        , padding=padding
                                        , ceil_mode=ceil_mode
+                                       , count_include_pad=count_include_pad
                                        , rigor=rigor
                                        , verbose=verbose)
             else:
@@ -856,6 +1625,10 @@ if __name__=='__main__':
                 if not status:
                     diff_max = torch.max(torch.abs(torch.add(out_data, -nout_data)))
                     _dlr.DlrWarn(f"diff max: {diff_max}")
+            if status and (func == 'max'): # return_indices
+                status = (nout_result is not None) and torch.equal(nout_result[0], nout_data)\
+                                                   and torch.equal(nout_result[1], out_indices)
+                if not status: _dlr.DlrWarn(f"indices of return_indices differ")
 
             ok = 0; error = 0
             if status:
@@ -879,6 +1652,33 @@ if __name__=='__main__':
 
         return True if torch.sum(errors)==0.0 else False
 
+    def TestPooling2dAdaptive(dtype,limit,random,rigor,verbose):
+        """
+        Compares adaptive_avg_pool2d() and adaptive_max_pool2d() against PyTorch,
+        where output_size of 1 is global pooling
+        """
+        configs = [ [2, 64, 7,1] # minibatch, in_channel, in_size, output_size
+                  , [1,512,13,1]
+                  , [2, 16,12,3]
+                  , [1, 16,13,5]
+                  , [4,  8, 5,7]
+                  , [1,  3,224,7] ]
+        error = 0
+        for minibatch, in_channel, in_size, output_size in configs:
+            in_data = GenDataPooling2d(torch.zeros(size=[minibatch,in_channel,in_size,in_size])).to(dtype)
+            for name, func, reference in [ ('avg', adaptive_avg_pool2d, F.adaptive_avg_pool2d)
+                                         , ('max', adaptive_max_pool2d, F.adaptive_max_pool2d) ]:
+                expect   = reference(in_data.float(), output_size)
+                out_data = func(in_data, output_size, rigor=rigor, verbose=verbose)
+                status = (out_data is not None) and (out_data.shape==expect.shape) and \
+                         torch.all(torch.lt(torch.abs(out_data.float()-expect), limit)).item()
+                if status:
+                    _dlr.DlrInfo(f"OK adaptive_{name}_pool2d {list(in_data.shape)} to {output_size}")
+                else:
+                    error += 1
+                    _dlr.DlrError(f"Mis-match adaptive_{name}_pool2d {list(in_data.shape)} to {output_size}")
+        return True if error==0 else False
+
     def GenDataPooling2d(data, rigor=False, verbose=False):
         if (data.dim()==4): # minibatch x channel x size x size
             in_minibatch = data.shape[0]
@@ -908,6 +1708,9 @@ if __name__=='__main__':
                   ,[1, 8,416,64,5,1,0]
                   ,[1, 8,416,64,5,1,1]
                   ,[1, 8,416,64,5,1,2]
+                  ,[1, 3,416,16,3,1,1] # Winograd F(2x2,3x3) by default
+                  ,[1,16,104,32,3,1,0]
+                  ,[2,16, 13,32,3,1,1]
                   ]
 
         errors = torch.zeros(len(configs))
@@ -992,6 +1795,142 @@ if __name__=='__main__':
 
         return in_data, in_kernel, in_bias
 
+#===============================================================================
+if __name__=='__main__':
+    def TestWeightUpdate(dtype=torch.float32
+                        ,limit=1.0E-3 # error limit
+                        ,random=False
+                        ,rigor=False
+                        ,verbose=False):
+        """
+        Checks that cached weights follow in-place updates of parameters.
+        Writes through '.data' do not bump '_version', which are seen by conv2d() by default,
+        but need clear_packed_weights() for 'packed' algorithm.
+        """
+        m = torch.nn.Conv2d(3, 4, 3, padding=1)
+        in_data = torch.rand(size=[1,3,16,16], dtype=dtype)*2-1
+        results = []
+        with torch.no_grad():
+            results.append(("conv2d", F.conv2d(in_data, m.weight, m.bias, padding=1)
+                                    , conv2d(in_data, m.weight, m.bias, padding=1, rigor=rigor, verbose=verbose)))
+            m.weight.data.mul_(2) # '_version' not changed
+            results.append(("conv2d after weight.data", F.conv2d(in_data, m.weight, m.bias, padding=1)
+                                    , conv2d(in_data, m.weight, m.bias, padding=1, rigor=rigor, verbose=verbose)))
+            m.weight.mul_(2) # '_version' changed
+            results.append(("conv2d kernel_version", F.conv2d(in_data, m.weight, m.bias, padding=1)
+                                    , conv2d(in_data, m.weight, m.bias, padding=1, kernel_version=m.weight._version
+                                            , rigor=rigor, verbose=verbose)))
+            packed_data = conv2d(in_data, m.weight, m.bias, padding=1, algorithm='packed', rigor=rigor, verbose=verbose)
+            results.append(("conv2d packed", F.conv2d(in_data, m.weight, m.bias, padding=1), packed_data))
+            m.weight.add_(1) # '_version' changed, repacked
+            results.append(("conv2d packed after in-place", F.conv2d(in_data, m.weight, m.bias, padding=1)
+                                    , conv2d(in_data, m.weight, m.bias, padding=1, algorithm='packed'
+                                            , rigor=rigor, verbose=verbose)))
+            m.weight.data.mul_(2) # '_version' not changed
+            clear_packed_weights()
+            results.append(("conv2d packed after weight.data and clear_packed_weights()"
+                                    , F.conv2d(in_data, m.weight, m.bias, padding=1)
+                                    , conv2d(in_data, m.weight, m.bias, padding=1, algorithm='packed'
+                                            , rigor=rigor, verbose=verbose)))
+            l = torch.nn.Linear(16, 8)
+            in_vec = torch.rand(size=[4,16], dtype=dtype)*2-1
+            results.append(("linear packed", F.linear(in_vec, l.weight, l.bias)
+                                    , linear(in_vec, l.weight, l.bias, algorithm='packed', rigor=rigor, verbose=verbose)))
+            l.bias.sub_(1) # '_version' changed, repacked
+            results.append(("linear packed after in-place", F.linear(in_vec, l.weight, l.bias)
+                                    , linear(in_vec, l.weight, l.bias, algorithm='packed', rigor=rigor, verbose=verbose)))
+        errors = 0
+        for name, out_data, nout_data in results:
+            diff_max = torch.max(torch.abs(out_data-nout_data)) if nout_data is not None else None
+            if (diff_max is not None) and (diff_max<limit):
+               _dlr.DlrInfo(f"OK {name} diff max: {diff_max}")
+            else:
+               errors += 1
+               _dlr.DlrError(f"Mis-match {name} diff max: {diff_max}")
+        return errors==0
+
+#===============================================================================
+if __name__=='__main__':
+    def TestConvolution2dBnAct(dtype=torch.float32
+                              ,limit=1.0E-3 # error limit
+                              ,random=False
+                              ,rigor=False
+                              ,verbose=False):
+        configs = [
+                   [1, 3,416,16,3,1,1,'leaky_relu']#minibatch,in_chan,in_size,out_chan,kernel_size,stride,padding,activation
+                  ,[2,16, 52,32,3,2,1,'relu']
+                  ,[2,32, 13,64,1,1,0,None]
+                  ]
+        errors = 0
+        for minibatch, in_channel, in_size, out_channel, kernel_size, stride, padding, activation in configs:
+            in_data      = torch.rand(size=[minibatch,in_channel,in_size,in_size], dtype=dtype)*2-1
+            weight       = torch.rand(size=[out_channel,in_channel,kernel_size,kernel_size], dtype=dtype)*2-1
+            bias         = torch.rand(size=[out_channel], dtype=dtype)*2-1
+            running_mean = torch.rand(size=[out_channel], dtype=dtype)*2-1
+            running_var  = torch.rand(size=[out_channel], dtype=dtype)*2
+            bn_weight    = torch.rand(size=[out_channel], dtype=dtype)*2-1
+            bn_bias      = torch.rand(size=[out_channel], dtype=dtype)*2-1
+            out_data = F.batch_norm( F.conv2d(in_data, weight, bias, stride=stride, padding=padding)
+                                   , running_mean, running_var, bn_weight, bn_bias
+                                   , training=False, eps=1E-5)
+            if activation=='relu': out_data = F.relu(out_data)
+            elif activation=='leaky_relu': out_data = F.leaky_relu(out_data, 0.01)
+            nout_data = conv2d_bn_act( in_data, weight, bias, running_mean, running_var
+                                     , bn_weight, bn_bias, stride=stride, padding=padding
+                                     , eps=1E-5, activation=activation, negative_slope=0.01
+                                     , rigor=rigor, verbose=verbose)
+            diff_max = torch.max(torch.abs(out_data-nout_data)) if nout_data is not None else None
+            if (diff_max is not None) and (diff_max<limit):
+               _dlr.DlrInfo(f"OK {out_data.shape} {activation} diff max: {diff_max}")
+            else:
+               errors += 1
+               _dlr.DlrError(f"Mis-match {out_data.shape} {activation} diff max: {diff_max}")
+        return errors==0
+
+#===============================================================================
+if __name__=='__main__':
+    def TestConvolution2dPool2dMax(dtype=torch.float32
+                                  ,limit=1.0E-3 # error limit
+                                  ,random=False
+                                  ,rigor=False
+                                  ,verbose=False):
+        """
+        Compares conv2d_max_pool2d() against F.max_pool2d() of activation of F.conv2d()
+        """
+        configs = [
+                   [1, 1, 32, 6,5,1,0,2,2,0,'relu']      # LeNet-5
+                  ,[2, 6, 14,16,5,1,0,2,2,0,'relu']      # LeNet-5
+                  ,[1, 3,416,16,3,1,1,2,2,0,'leaky_relu']# Tiny YOLO-V2
+                  ,[2,16, 52,32,3,1,1,2,2,0,'leaky_relu']# Tiny YOLO-V2
+                  ,[1,32, 13,64,3,1,1,2,1,0,None]
+                  ,[2, 8, 15, 8,3,2,1,3,2,1,None]
+                  ,[2, 4, 16, 8,3,1,1,2,2,0,'leaky_relu',-0.5] # negative slope
+                  ] # minibatch,in_chan,in_size,out_chan,kernel_size,stride,padding,pool_size,pool_stride,ceil,activation[,slope]
+        errors = 0
+        for config in configs:
+            minibatch, in_channel, in_size, out_channel, kernel_size, stride, padding\
+            , pool_size, pool_stride, ceil_mode, activation = config[:11]
+            negative_slope = config[11] if len(config)>11 else 0.01
+            in_data = torch.rand(size=[minibatch,in_channel,in_size,in_size], dtype=dtype)*2-1
+            weight  = torch.rand(size=[out_channel,in_channel,kernel_size,kernel_size], dtype=dtype)*2-1
+            bias    = torch.rand(size=[out_channel], dtype=dtype)*2-1
+            out_data = F.conv2d(in_data, weight, bias, stride=stride, padding=padding)
+            if activation=='relu': out_data = F.relu(out_data)
+            elif activation=='leaky_relu': out_data = F.leaky_relu(out_data, negative_slope)
+            out_data = F.max_pool2d(out_data, pool_size, pool_stride, ceil_mode=(ceil_mode!=0))
+            nout_data = conv2d_max_pool2d( in_data, weight, bias, stride=stride, padding=padding
+                                         , pool_kernel_size=pool_size, pool_stride=pool_stride
+                                         , ceil_mode=(ceil_mode!=0), activation=activation
+                                         , negative_slope=negative_slope, rigor=rigor, verbose=verbose)
+            diff_max = torch.max(torch.abs(out_data-nout_data)) if (nout_data is not None) and\
+                       (nout_data.shape==out_data.shape) else None
+            if (diff_max is not None) and (diff_max<limit):
+               _dlr.DlrInfo(f"OK {out_data.shape} {activation} {negative_slope} diff max: {diff_max}")
+            else:
+               errors += 1
+               _dlr.DlrError(f"Mis-match {out_data.shape} {activation} {negative_slope} diff max: {diff_max}")
+        return errors==0
+
 #===============================================================================
 if __name__=='__main__':
     def TestDeconvolution2d(dtype=torch.float32
@@ -1078,6 +2017,41 @@ if __name__=='__main__':
 
         return in_data, in_kernel, in_bias
 
+#===============================================================================
+if __name__=='__main__':
+    def TestDeconvolution2dPadding(dtype=torch.float32
+                                  ,limit=1.0E-3 # error limit
+                                  ,random=False
+                                  ,rigor=False
+                                  ,verbose=False):
+        """
+        Compares conv_transpose2d() against F.conv_transpose2d() with padding,
+        where padded rows/columns of the output should be dropped, not accumulated.
+        """
+        configs = [
+                   [1,2,5,3,3,1,0]
+                  ,[1,2,5,3,3,1,1]
+                  ,[2,3,8,4,3,1,1]
+                  ,[1,4,7,2,5,1,2]
+                  ,[2,3,6,4,3,2,1]
+                  ] # minibatch,in_channel,in_size,out_channel,kernel_size,stride,padding
+        errors = 0
+        for minibatch, in_channel, in_size, out_channel, kernel_size, stride, padding in configs:
+            in_data = torch.rand(size=[minibatch,in_channel,in_size,in_size], dtype=dtype)*2-1
+            weight  = torch.rand(size=[in_channel,out_channel,kernel_size,kernel_size], dtype=dtype)*2-1
+            bias    = torch.rand(size=[out_channel], dtype=dtype)*2-1
+            out_data  = F.conv_transpose2d(in_data, weight, bias, stride=stride, padding=padding)
+            nout_data = conv_transpose2d(in_data, weight, bias, stride=stride, padding=padding
+                                        , rigor=rigor, verbose=verbose)
+            diff_max = torch.max(torch.abs(out_data-nout_data)) if (nout_data is not None) and\
+                       (nout_data.shape==out_data.shape) else None
+            if (diff_max is not None) and (diff_max<limit):
+               _dlr.DlrInfo(f"OK {out_data.shape} stride={stride} padding={padding} diff max: {diff_max}")
+            else:
+               errors += 1
+               _dlr.DlrError(f"Mis-match {out_data.shape} stride={stride} padding={padding} diff max: {diff_max}")
+        return errors==0
+
 #===============================================================================
 if __name__=='__main__':
     def TestNormBatch(dtype=torch.float32
@@ -1312,6 +2286,201 @@ if __name__=='__main__':
     def TestActivationSigmoid(dtype, random, limit, rigor, verbose):
         return TestActivations('Sigmoid', 'sigmoid', dtype=dtype, limit=limit, random=random, rigor=rigor, verbose=verbose)
 
+    def TestActivationAccuracy(dtype, random, limit, rigor, verbose):
+        """
+        Reports error bound of tanh() and sigmoid() for each accuracy against torch
+        """
+        in_data = torch.linspace(-20, 20, 1<<20, dtype=torch.float32).reshape(4, -1)
+        if random: in_data = in_data[:, torch.randperm(in_data.shape[1])]
+        error = 0
+        for tfunc in ['tanh', 'sigmoid']:
+            expect = getattr(torch, tfunc)(in_data.type(torch.float64))
+            for accuracy in [None, 'exact', 'lut', 'poly']:
+                out_data = globals()[tfunc](in_data, rigor=rigor, verbose=verbose, accuracy=accuracy)
+                if out_data is None:
+                    error += 1
+                    _dlr.DlrError(f"Mis-match {tfunc} accuracy={accuracy}")
+                    continue
+                diff    = torch.abs(out_data.type(torch.float64)-expect)
+                abs_max = torch.max(diff).item()
+                rel_max = torch.max(diff/torch.clamp(torch.abs(expect), min=1E-6)).item()
+                status  = abs_max<limit
+                if status:
+                    _dlr.DlrInfo(f"OK {tfunc} accuracy={str(accuracy):5s}"
+                                 f" max abs error {abs_max:.3e}, max rel error {rel_max:.3e}")
+                else:
+                    error += 1
+                    _dlr.DlrError(f"Mis-match {tfunc} accuracy={str(accuracy):5s}"
+                                  f" max abs error {abs_max:.3e}, max rel error {rel_max:.3e}")
+        # NaN and infinities in vector bodies and remainders of all ISAs of the CPU
+        special = torch.tensor([float('nan'), float('inf'), -float('inf'), 0.0, 1.0, -1.0, 30.0], dtype=torch.float32)
+        special = special.repeat(6)[:37].reshape(1, -1)
+        for isa in ['scalar', 'avx2', 'avx512', 'neon']:
+            if not _dlr.set_isa(isa): continue
+            for tfunc in ['tanh', 'sigmoid']:
+                expect = getattr(torch, tfunc)(special)
+                for accuracy in ['exact', 'lut', 'poly']:
+                    out_data = globals()[tfunc](special, rigor=rigor, verbose=verbose, accuracy=accuracy)
+                    status = (out_data is not None) and\
+                             torch.equal(torch.isnan(out_data), torch.isnan(expect)) and\
+                             bool(torch.all(torch.abs(torch.nan_to_num(out_data-expect))<limit))
+                    if status:
+                        _dlr.DlrInfo(f"OK {tfunc} accuracy={accuracy:5s} isa={isa} of NaN and inf")
+                    else:
+                        error += 1
+                        _dlr.DlrError(f"Mis-match {tfunc} accuracy={accuracy:5s} isa={isa} of NaN and inf: {out_data}")
+        _dlr.set_isa(None)
+        return True if error==0 else False
+
+    def TestInplace(dtype, random, limit, rigor, verbose):
+        """
+        Compares 'inplace=True' of activations and batch_norm() against out-of-place results
+        """
+        in_data = torch.randn(4, 3, 8, 8, dtype=dtype) if random else \
+                  torch.linspace(-4, 4, 4*3*8*8, dtype=dtype).reshape(4, 3, 8, 8)
+        mean    = torch.randn(3, dtype=dtype)
+        var     = torch.rand(3, dtype=dtype)+0.5
+        weight  = torch.randn(3, dtype=dtype)
+        bias    = torch.randn(3, dtype=dtype)
+        cases = [ ('relu'      , lambda x, **kw: relu(x, rigor=rigor, verbose=verbose, **kw))
+                , ('leaky_relu', lambda x, **kw: leaky_relu(x, 0.1, rigor=rigor, verbose=verbose, **kw))
+                , ('tanh'      , lambda x, **kw: tanh(x, rigor=rigor, verbose=verbose, **kw))
+                , ('sigmoid'   , lambda x, **kw: sigmoid(x, rigor=rigor, verbose=verbose, **kw))
+                , ('batch_norm', lambda x, **kw: batch_norm(x, mean, var, weight, bias, rigor=rigor, verbose=verbose, **kw)) ]
+        error = 0
+        for name, func in cases:
+            for xin_data in [in_data[0:1], in_data, in_data.transpose(2, 3)]: # single item, minibatch and non-contiguous
+                expect   = func(xin_data)
+                inout    = xin_data.clone()
+                out_data = func(inout, inplace=True)
+                status = (expect is not None) and (out_data is not None) and \
+                         (out_data.data_ptr()==inout.data_ptr()) and \
+                         torch.all(torch.lt(torch.abs(out_data-expect), limit)).item()
+                if status:
+                    _dlr.DlrInfo(f"OK {name} inplace {list(xin_data.shape)}"
+                                 f"{'' if xin_data.is_contiguous() else ' non-contiguous'}")
+                else:
+                    error += 1
+                    _dlr.DlrError(f"Mis-match {name} inplace {list(xin_data.shape)}"
+                                  f"{'' if xin_data.is_contiguous() else ' non-contiguous'}")
+        return True if error==0 else False
+
+    def TestHalf(dtype, random, limit, rigor, verbose):
+        """
+        Compares torch.float16 and torch.bfloat16 of conv2d(), pooling, linear(), activations
+        and batch_norm() against PyTorch in float of the same data, which should be within
+        an ulp of the storage since each output is computed in float and rounded once
+        """
+        in_data = torch.randn(2, 8, 12, 12) if random else \
+                  torch.linspace(-4, 4, 2*8*12*12).reshape(2, 8, 12, 12)
+        kernel  = torch.rand(4, 8, 3, 3)*2-1
+        weight  = torch.rand(5, 64)*2-1
+        bias    = torch.rand(5)*2-1
+        mean    = torch.rand(8)*0.2-0.1
+        var     = torch.rand(8)+0.5
+        error = 0
+        for half in [torch.float16, torch.bfloat16]:
+            h = lambda x: x.to(half)
+            f = lambda x: x.to(half).float()
+            cases = [ ('conv2d'    , conv2d(h(in_data), h(kernel), h(bias[0:4]), 1, 1, rigor=rigor, verbose=verbose)
+                                   , F.conv2d(f(in_data), f(kernel), f(bias[0:4]), 1, 1))
+                    , ('max_pool2d', max_pool2d(h(in_data), 2, 2, rigor=rigor, verbose=verbose)
+                                   , F.max_pool2d(f(in_data), 2, 2))
+                    , ('avg_pool2d', avg_pool2d(h(in_data), 2, 2, rigor=rigor, verbose=verbose)
+                                   , F.avg_pool2d(f(in_data), 2, 2))
+                    , ('linear'    , linear(h(in_data.reshape(-1, 64)), h(weight), h(bias), rigor=rigor, verbose=verbose)
+                                   , F.linear(f(in_data.reshape(-1, 64)), f(weight), f(bias)))
+                    , ('relu'      , relu(h(in_data), rigor=rigor, verbose=verbose), F.relu(f(in_data)))
+                    , ('leaky_relu', leaky_relu(h(in_data), 0.1, rigor=rigor, verbose=verbose), F.leaky_relu(f(in_data), 0.1))
+                    , ('tanh'      , tanh(h(in_data), rigor=rigor, verbose=verbose), torch.tanh(f(in_data)))
+                    , ('sigmoid'   , sigmoid(h(in_data), rigor=rigor, verbose=verbose), torch.sigmoid(f(in_data)))
+                    , ('batch_norm', batch_norm(h(in_data), h(mean), h(var), rigor=rigor, verbose=verbose)
+                                   , F.batch_norm(f(in_data), f(mean), f(var))) ]
+            eps = torch.finfo(half).eps
+            for name, out_data, expect in cases:
+                status = (out_data is not None) and (out_data.dtype==half) and \
+                         torch.allclose(out_data.float(), expect, rtol=eps, atol=eps)
+                diff = float('nan') if out_data is None else torch.max(torch.abs(out_data.float()-expect)).item()
+                if status:
+                    _dlr.DlrInfo(f"OK {name} {str(half)[6:]:8s} max abs diff {diff:.3e}")
+                else:
+                    error += 1
+                    _dlr.DlrError(f"Mis-match {name} {str(half)[6:]:8s} max abs diff {diff:.3e}")
+        return True if error==0 else False
+
+    def TestNormPrepared(dtype, random, limit, rigor, verbose):
+        """
+        Compares batch_norm2d(prepared=True) against torch.nn.BatchNorm2d in eval mode,
+        where folded coefficients are kept until running statistics are changed
+        """
+        module = torch.nn.BatchNorm2d(16).eval()
+        with torch.no_grad():
+            module.running_mean.uniform_(-1, 1)
+            module.running_var.uniform_(0.5, 2)
+            module.weight.uniform_(-2, 2)
+            module.bias.uniform_(-2, 2)
+        in_data = torch.randn(4, 16, 12, 12) if random else \
+                  torch.linspace(-4, 4, 4*16*12*12).reshape(4, 16, 12, 12)
+        error = 0
+        for step in ['folded', 'cached', 'updated']:
+            if step=='updated':
+                with torch.no_grad(): module.running_mean.add_(0.5)
+            folded = batch_norm_coefficients(module)
+            if step=='cached': status = folded is cached
+            else: status = (folded is not None) and (step=='folded' or folded is not cached)
+            cached = folded
+            with torch.no_grad(): expect = module(in_data)
+            for xin_data in [in_data[0:1], in_data]:
+                out_data = batch_norm2d(xin_data, module.running_mean, module.running_var,
+                                        module.weight, module.bias, module.eps,
+                                        rigor=rigor, verbose=verbose, prepared=True)
+                status = status and (out_data is not None) and \
+                         torch.all(torch.lt(torch.abs(out_data-expect[0:xin_data.shape[0]]), limit)).item()
+            if status:
+                _dlr.DlrInfo(f"OK batch_norm2d prepared {step}")
+            else:
+                error += 1
+                _dlr.DlrError(f"Mis-match batch_norm2d prepared {step}")
+        return True if error==0 else False
+
+    def TestThreads(dtype, random, limit, rigor, verbose):
+        """
+        Compares conv2d(), max_pool2d() and batch_norm2d() over a minibatch fanned out
+        by set_num_threads() against a single thread, with the GIL released and held
+        (see python.modules.set_release_gil()), which should be bit-exact
+        """
+        in_data = torch.randn(5, 8, 20, 20) if random else \
+                  torch.linspace(-4, 4, 5*8*20*20).reshape(5, 8, 20, 20)
+        weight  = torch.randn(6, 8, 3, 3)
+        bias    = torch.randn(6)
+        mean, var = torch.randn(8), torch.rand(8)+0.5
+        scale, shift = torch.randn(8), torch.randn(8)
+        cases = [ ('conv2d'      , lambda: conv2d(in_data, weight, bias, padding=1, rigor=rigor, verbose=verbose))
+                , ('max_pool2d'  , lambda: max_pool2d(in_data, 2, stride=2, rigor=rigor, verbose=verbose))
+                , ('batch_norm2d', lambda: batch_norm2d(in_data, mean, var, scale, shift, rigor=rigor, verbose=verbose)) ]
+        saved = (get_num_threads(), _dlr.get_release_gil())
+        error = 0
+        try:
+            set_num_threads(1)
+            _dlr.set_release_gil(True)
+            expects = { name: function() for name, function in cases }
+            for num_threads, release_gil in [(3, True), (3, False), (5, False)]:
+                set_num_threads(num_threads)
+                _dlr.set_release_gil(release_gil)
+                for name, function in cases:
+                    out_data = function()
+                    status = (_executor is not None) and (out_data is not None) and \
+                             torch.equal(out_data, expects[name])
+                    if status:
+                        _dlr.DlrInfo(f"OK {name} threads={get_num_threads()} release_gil={release_gil}")
+                    else:
+                        error += 1
+                        _dlr.DlrError(f"Mis-match {name} threads={get_num_threads()} release_gil={release_gil}")
+        finally:
+            set_num_threads(saved[0])
+            _dlr.set_release_gil(saved[1])
+        return True if error==0 else False
+
 #===============================================================================
 
 if __name__=='__main__':
@@ -1324,17 +2493,17 @@ if __name__=='__main__':
 
     parser.add_argument('--layer', dest='layer', type=str, default='ReLu',
                         help='Specify layer to test (default: ReLu)\n'
-                            +'ReLu LeakyReLu Tanh Sigmoid\n'
-                            +'Convolution2d Pooling2dMax Pooling2dAvg\n'
-                            +'Linear1d Linear2d Concat2d\n'
-                            +'NormBatch'+'Deconvlution2d'
+                            +'ReLu LeakyReLu Tanh Sigmoid ActivationAccuracy Inplace NormPrepared Half Threads\n'
+                            +'Convolution2d Convolution2dBnAct Convolution2dPool2dMax WeightUpdate Pooling2dMax Pooling2dAvg Pooling2dAdaptive\n'
+                            +'Linear1d Linear2d LinearBatch Concat2d\n'
+                            +'NormBatch'+'Deconvlution2d Deconvolution2dPadding'
                        )
     parser.add_argument('--limit', dest='limit', type=float, default=1.0E-3,
                         help='Specify error limmit (default: 1.0E-3)')
     parser.add_argument('--nslope', dest='negative_slope', type=float, default=0.01,
                         help='Specify negative slope of LeakyReLU (default: 0.01)')
     parser.add_argument('--dtype', dest='dtype', type=str, default='int32',
-                        help='Specify data type (default: int32) float32, float64')
+                        help='Specify data type (default: int32) float32, float64, float16, bfloat16')
     parser.add_argument('--random', dest='random', action='store_true', default=False,
                         help='Use random pattern (default: False)')
     parser.add_argument('--rigor', dest='rigor', action='store_true', default=False,
@@ -1350,21 +2519,34 @@ if __name__=='__main__':
     negative_slope = args.negative_slope
     dtype = { 'int32'   : torch.int32,
               'float32' : torch.float32,
-              'float64' : torch.float64
+              'float64' : torch.float64,
+              'float16' : torch.float16,
+              'bfloat16': torch.bfloat16
             } [args.dtype]
     layer = args.layer
     func  = { 'Convolution2d'  : TestConvolution2d      
+            , 'Convolution2dBnAct': TestConvolution2dBnAct
+            , 'WeightUpdate'   : TestWeightUpdate
+            , 'Convolution2dPool2dMax': TestConvolution2dPool2dMax
             , 'Pooling2dMax'   : TestPooling2dMax       
             , 'Pooling2dAvg'   : TestPooling2dAvg       
+            , 'Pooling2dAdaptive': TestPooling2dAdaptive
             , 'Linear1d'       : TestLinear1d           
             , 'LinearNd'       : TestLinearNd           
+            , 'LinearBatch'    : TestLinearBatch
             , 'Concat2d'       : TestConcat2d           
             , 'ReLu'           : TestActivationReLu     
             , 'LeakyReLu'      : TestActivationLeakyReLu
             , 'Tanh'           : TestActivationTanh     
             , 'Sigmoid'        : TestActivationSigmoid  
+            , 'ActivationAccuracy': TestActivationAccuracy
+            , 'Inplace'        : TestInplace
+            , 'NormPrepared'   : TestNormPrepared
+            , 'Half'           : TestHalf
+            , 'Threads'        : TestThreads
             , 'NormBatch'      : TestNormBatch         
             , 'Deconvolution2d': TestDeconvolution2d
+            , 'Deconvolution2dPadding': TestDeconvolution2dPadding
             } [layer]
 
     _dlr.DlrPrint("Testing " + layer, flush=True)
@@ -1378,5 +2560,28 @@ if __name__=='__main__':
 #===============================================================================
 # Revision history:
 #
+# 2026.10.18: TestThreads added for set_num_threads() and the GIL held
+# 2026.10.18: 'inplace' of non-contiguous input through a contiguous temporary
+# 2026.10.18: NaN and inf of tanh() and sigmoid() tested by TestActivationAccuracy
+# 2026.10.18: negative slope of conv2d_max_pool2d() applied before pooling
+# 2026.10.18: '.data' writes of 'packed' algorithm documented and tested by TestWeightUpdate
+# 2026.10.18: Winograd filter cache of conv2d() compares weight unless 'kernel_version' given
+# 2026.10.18: conv2d_max_pool2d() by Convolution2dPool2dMaxBatch with activation fused
+# 2026.10.18: adaptive_avg_pool2d() and adaptive_max_pool2d() by Pooling2dGlobal/Adaptive<Avg|Max>Batch
+# 2026.10.18: 'return_indices' of max_pool2d() by Pooling2dMaxIndicesBatch
+# 2026.10.18: 'ceil_mode' and 'count_include_pad' of avg_pool2d() by Pooling2dAvg<Type>Integral
+# 2026.10.18: torch.float16 and torch.bfloat16 go '<Op>Half' and '<Op>BFloat16' routines
+# 2026.10.18: linear_batch() for all ranks, which is default of linear()
+# 2026.10.18: 'prepared' of batch_norm2d() with folded coefficients and batch_norm_coefficients()
+# 2026.10.18: 'inplace' added to activations and batch_norm()
+# 2026.10.18: 'accuracy' added to tanh() and sigmoid() for float precision
+# 2026.10.18: 'out' argument and output cache added, copy-back of minibatch items removed
+# 2026.10.18: conv2d_bn_act() added with batch normalization folded into conv
+# 2026.10.18: 'packed' algorithm of conv2d() and linear1d() with packed weights cache
+# 2026.10.18: 'kernel_version' passed to Convolution2d() for Winograd kernel cache
+# 2026.10.18: 'algorithm' argument added to conv2d()
+# 2026.10.18: TestDeconvolution2dPadding added for padding of conv_transpose2d
+# 2026.10.18: thread pool added for minibatch (set_num_threads)
+# 2026.10.18: minibatch processed by a single call of '*Batch' routines
 # 2020.09.30: Started by Ando Ki (adki@future-ds.com)
 #===============================================================================
@@ -0,0 +1,203 @@
+#include "activation_fast.hpp"
+
+extern "C" {
+
+int ActivationSigmoidFloatFast
+(           float    *out_data // contiguous: channel x size
+    , const float    *in_data  // contiguous: channel x size
+    , const uint32_t  size     // number of elements per channel
+    , const uint16_t  channel  // number of channels
+    , const int       accuracy // DLR_ACCURACY_EXACT, DLR_ACCURACY_LUT or DLR_ACCURACY_POLY
+    , const int       rigor    // check rigorously when 1
+    , const int       verbose  // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::ActivationSigmoidFast<float>
+    (     out_data
+        , in_data
+        , size
+        , channel
+        , accuracy
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int ActivationSigmoidDoubleFast
+(           double   *out_data // contiguous: channel x size
+    , const double   *in_data  // contiguous: channel x size
+    , const uint32_t  size     // number of elements per channel
+    , const uint16_t  channel  // number of channels
+    , const int       accuracy // DLR_ACCURACY_EXACT, DLR_ACCURACY_LUT or DLR_ACCURACY_POLY
+    , const int       rigor    // check rigorously when 1
+    , const int       verbose  // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::ActivationSigmoidFast<double>
+    (     out_data
+        , in_data
+        , size
+        , channel
+        , accuracy
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int ActivationSigmoidBatchFloatFast
+(           float    *out_data  // contiguous: minibatch x channel x size
+    , const float    *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    , const int       accuracy  // DLR_ACCURACY_EXACT, DLR_ACCURACY_LUT or DLR_ACCURACY_POLY
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::ActivationSigmoidBatchFast<float>
+    (     out_data
+        , in_data
+        , size
+        , channel
+        , minibatch
+        , accuracy
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int ActivationSigmoidBatchDoubleFast
+(           double   *out_data  // contiguous: minibatch x channel x size
+    , const double   *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    , const int       accuracy  // DLR_ACCURACY_EXACT, DLR_ACCURACY_LUT or DLR_ACCURACY_POLY
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::ActivationSigmoidBatchFast<double>
+    (     out_data
+        , in_data
+        , size
+        , channel
+        , minibatch
+        , accuracy
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int ActivationTanhFloatFast
+(           float    *out_data // contiguous: channel x size
+    , const float    *in_data  // contiguous: channel x size
+    , const uint32_t  size     // number of elements per channel
+    , const uint16_t  channel  // number of channels
+    , const int       accuracy // DLR_ACCURACY_EXACT, DLR_ACCURACY_LUT or DLR_ACCURACY_POLY
+    , const int       rigor    // check rigorously when 1
+    , const int       verbose  // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::ActivationTanhFast<float>
+    (     out_data
+        , in_data
+        , size
+        , channel
+        , accuracy
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int ActivationTanhDoubleFast
+(           double   *out_data // contiguous: channel x size
+    , const double   *in_data  // contiguous: channel x size
+    , const uint32_t  size     // number of elements per channel
+    , const uint16_t  channel  // number of channels
+    , const int       accuracy // DLR_ACCURACY_EXACT, DLR_ACCURACY_LUT or DLR_ACCURACY_POLY
+    , const int       rigor    // check rigorously when 1
+    , const int       verbose  // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::ActivationTanhFast<double>
+    (     out_data
+        , in_data
+        , size
+        , channel
+        , accuracy
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int ActivationTanhBatchFloatFast
+(           float    *out_data  // contiguous: minibatch x channel x size
+    , const float    *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    , const int       accuracy  // DLR_ACCURACY_EXACT, DLR_ACCURACY_LUT or DLR_ACCURACY_POLY
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::ActivationTanhBatchFast<float>
+    (     out_data
+        , in_data
+        , size
+        , channel
+        , minibatch
+        , accuracy
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int ActivationTanhBatchDoubleFast
+(           double   *out_data  // contiguous: minibatch x channel x size
+    , const double   *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    , const int       accuracy  // DLR_ACCURACY_EXACT, DLR_ACCURACY_LUT or DLR_ACCURACY_POLY
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::ActivationTanhBatchFast<double>
+    (     out_data
+        , in_data
+        , size
+        , channel
+        , minibatch
+        , accuracy
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+} // extern "C"
+
+/*
+ * Revision history
+ *
+ * 2026.10.18: Started.
+ */
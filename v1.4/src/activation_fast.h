@@ -0,0 +1,108 @@
+#pragma once
+#include <stdint.h>
+#include "dlr_common.h"
+
+// software-only: sigmoid and tanh in their own precision (see DLR_ACCURACY_xxx)
+#if !defined(__SYNTHESIS__)
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#define ActivationSigmoidFast ActivationSigmoidFloatFast
+#define ActivationSigmoidBatchFast ActivationSigmoidBatchFloatFast
+#define ActivationTanhFast ActivationTanhFloatFast
+#define ActivationTanhBatchFast ActivationTanhBatchFloatFast
+
+extern int ActivationSigmoidFloatFast
+(           float    *out_data // contiguous: channel x size
+    , const float    *in_data  // contiguous: channel x size
+    , const uint32_t  size     // number of elements per channel
+    , const uint16_t  channel  // number of channels
+    , const int       accuracy // DLR_ACCURACY_EXACT, DLR_ACCURACY_LUT or DLR_ACCURACY_POLY
+    , const int       rigor    // check rigorously when 1
+    , const int       verbose  // verbose level
+);
+
+extern int ActivationSigmoidDoubleFast
+(           double   *out_data // contiguous: channel x size
+    , const double   *in_data  // contiguous: channel x size
+    , const uint32_t  size     // number of elements per channel
+    , const uint16_t  channel  // number of channels
+    , const int       accuracy // DLR_ACCURACY_EXACT, DLR_ACCURACY_LUT or DLR_ACCURACY_POLY
+    , const int       rigor    // check rigorously when 1
+    , const int       verbose  // verbose level
+);
+
+extern int ActivationSigmoidBatchFloatFast
+(           float    *out_data  // contiguous: minibatch x channel x size
+    , const float    *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    , const int       accuracy  // DLR_ACCURACY_EXACT, DLR_ACCURACY_LUT or DLR_ACCURACY_POLY
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+extern int ActivationSigmoidBatchDoubleFast
+(           double   *out_data  // contiguous: minibatch x channel x size
+    , const double   *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    , const int       accuracy  // DLR_ACCURACY_EXACT, DLR_ACCURACY_LUT or DLR_ACCURACY_POLY
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+extern int ActivationTanhFloatFast
+(           float    *out_data // contiguous: channel x size
+    , const float    *in_data  // contiguous: channel x size
+    , const uint32_t  size     // number of elements per channel
+    , const uint16_t  channel  // number of channels
+    , const int       accuracy // DLR_ACCURACY_EXACT, DLR_ACCURACY_LUT or DLR_ACCURACY_POLY
+    , const int       rigor    // check rigorously when 1
+    , const int       verbose  // verbose level
+);
+
+extern int ActivationTanhDoubleFast
+(           double   *out_data // contiguous: channel x size
+    , const double   *in_data  // contiguous: channel x size
+    , const uint32_t  size     // number of elements per channel
+    , const uint16_t  channel  // number of channels
+    , const int       accuracy // DLR_ACCURACY_EXACT, DLR_ACCURACY_LUT or DLR_ACCURACY_POLY
+    , const int       rigor    // check rigorously when 1
+    , const int       verbose  // verbose level
+);
+
+extern int ActivationTanhBatchFloatFast
+(           float    *out_data  // contiguous: minibatch x channel x size
+    , const float    *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    , const int       accuracy  // DLR_ACCURACY_EXACT, DLR_ACCURACY_LUT or DLR_ACCURACY_POLY
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+extern int ActivationTanhBatchDoubleFast
+(           double   *out_data  // contiguous: minibatch x channel x size
+    , const double   *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    , const int       accuracy  // DLR_ACCURACY_EXACT, DLR_ACCURACY_LUT or DLR_ACCURACY_POLY
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+#ifdef __cplusplus
+}
+#endif
+#endif // !defined(__SYNTHESIS__)
+/*
+ * Revision history
+ *
+ * 2026.10.18: Started.
+ */
@@ -0,0 +1,131 @@
+#pragma once
+/*
+ * Copyright (c) 2019-2020 by Future Design Systems.
+ * All right reserved.
+ * http://www.future-ds.com
+ *
+ * @file activation_fast.hpp
+ * @brief This file contains sigmoid and tanh activation routines
+ *        in their own precision with selectable accuracy (software-only, not for HLS).
+ * @author FDS
+ * @date Oct. 18, 2026
+ */
+#if !defined(__SYNTHESIS__)
+#include <stdint.h>
+#include <stdio.h>
+#include <math.h>
+#include "dlr_common.h"
+#include "dlr_simd.hpp"
+
+namespace dlr { // deep learning routines
+
+// Same as ActivationSigmoid(), but it does not promote to double.
+// - DLR_ACCURACY_EXACT: library function of TYPE, i.e., expf() for float
+// - DLR_ACCURACY_LUT  : table with linear interpolation (float only, else exact)
+// - DLR_ACCURACY_POLY : (1+tanh(x/2))/2 by rational polynomial (float only, else exact)
+template<class TYPE=float>
+void ActivationSigmoidFast
+(           TYPE     *out_data // contiguous: channel x size (can be in_data for in-place)
+    , const TYPE     *in_data  // contiguous: channel x size
+    , const uint32_t  size     // number of elements per channel
+    , const uint16_t  channel  // num of channels
+    , const int       accuracy=DLR_ACCURACY_POLY
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+)
+{
+    if (verbose) {
+        dlrInfo("size          =%u\n", size);
+        dlrInfo("channel       =%u\n", channel);
+        dlrInfo("accuracy      =%d\n", accuracy);
+        fflush(stderr); fflush(stdout);
+    }
+    if (rigor) {
+        dlrCheck (size>0);
+        dlrCheckAlias (out_data, in_data, (uint32_t)channel*size);
+        dlrCheck ((accuracy>=DLR_ACCURACY_EXACT)&&(accuracy<=DLR_ACCURACY_POLY));
+    }
+
+    const uint32_t t_num = (uint32_t)channel*size;
+    if (SimdSigmoid(out_data, in_data, accuracy, t_num)) return;
+    for (uint32_t s=0; s<t_num; ++s) {
+        out_data[s] = (TYPE)1/((TYPE)1+exp(-in_data[s]));
+    }
+}
+
+// Same as ActivationTanh(), but it does not promote to double.
+// - DLR_ACCURACY_EXACT: library function of TYPE, i.e., tanhf() for float
+// - DLR_ACCURACY_LUT  : 2*sigmoid(2x)-1 by table with linear interpolation (float only, else exact)
+// - DLR_ACCURACY_POLY : rational polynomial (float only, else exact)
+template<class TYPE=float>
+void ActivationTanhFast
+(           TYPE     *out_data // contiguous: channel x size (can be in_data for in-place)
+    , const TYPE     *in_data  // contiguous: channel x size
+    , const uint32_t  size     // number of elements per channel
+    , const uint16_t  channel  // num of channels
+    , const int       accuracy=DLR_ACCURACY_POLY
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+)
+{
+    if (verbose) {
+        dlrInfo("size          =%u\n", size);
+        dlrInfo("channel       =%u\n", channel);
+        dlrInfo("accuracy      =%d\n", accuracy);
+        fflush(stderr); fflush(stdout);
+    }
+    if (rigor) {
+        dlrCheck (size>0);
+        dlrCheckAlias (out_data, in_data, (uint32_t)channel*size);
+        dlrCheck ((accuracy>=DLR_ACCURACY_EXACT)&&(accuracy<=DLR_ACCURACY_POLY));
+    }
+
+    const uint32_t t_num = (uint32_t)channel*size;
+    if (SimdTanh(out_data, in_data, accuracy, t_num)) return;
+    for (uint32_t s=0; s<t_num; ++s) {
+        out_data[s] = tanh(in_data[s]);
+    }
+}
+
+// minibatch version: in_data and out_data have leading minibatch dimension
+template<class TYPE=float>
+void ActivationSigmoidBatchFast
+(           TYPE     *out_data  // contiguous: minibatch x channel x size (can be in_data)
+    , const TYPE     *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    , const int       accuracy=DLR_ACCURACY_POLY
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+)
+{
+    // all items at once since elements are independent
+    ActivationSigmoidFast<TYPE>(out_data, in_data, (uint32_t)channel*size, minibatch, accuracy, rigor, verbose);
+}
+
+// minibatch version: in_data and out_data have leading minibatch dimension
+template<class TYPE=float>
+void ActivationTanhBatchFast
+(           TYPE     *out_data  // contiguous: minibatch x channel x size (can be in_data)
+    , const TYPE     *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    , const int       accuracy=DLR_ACCURACY_POLY
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+)
+{
+    // all items at once since elements are independent
+    ActivationTanhFast<TYPE>(out_data, in_data, (uint32_t)channel*size, minibatch, accuracy, rigor, verbose);
+}
+
+} // namespace dlr
+#endif // !defined(__SYNTHESIS__)
+/*
+ * Revision history
+ *
+ * 2026.10.18: in-place (out_data==in_data) checked.
+ * 2026.10.18: Started.
+ */
@@ -1,9 +1,11 @@
 
 #include "activation_leakyrelu.hpp"
+#include "dlr_fixed.hpp"
+#include "dlr_half.hpp"
 
 extern "C" {
 
-void ActivationLeakyReLuInt
+int ActivationLeakyReLuInt
 (           int      *out_data // channel x size x size
     , const int      *in_data  // channel x size x size
     , const uint32_t  size
@@ -15,6 +17,7 @@ void ActivationLeakyReLuInt
     #endif
 )
 {
+    dlrClearLastError();
     dlr::ActivationLeakyReLu<int>
     (     out_data
         , in_data
@@ -26,9 +29,10 @@ void ActivationLeakyReLuInt
         , verbose
         #endif
     );
+    return dlrGetLastStatus();
 }
 
-void ActivationLeakyReLuFloat
+int ActivationLeakyReLuFloat
 (           float    *out_data
     , const float    *in_data
     , const uint32_t  size
@@ -40,6 +44,7 @@ void ActivationLeakyReLuFloat
     #endif
 )
 {
+    dlrClearLastError();
     dlr::ActivationLeakyReLu<float>
     (     out_data
         , in_data
@@ -51,9 +56,10 @@ void ActivationLeakyReLuFloat
         , verbose
         #endif
     );
+    return dlrGetLastStatus();
 }
 
-void ActivationLeakyReLuDouble
+int ActivationLeakyReLuDouble
 (           double   *out_data
     , const double   *in_data
     , const uint32_t  size
@@ -65,6 +71,7 @@ void ActivationLeakyReLuDouble
     #endif
 )
 {
+    dlrClearLastError();
     dlr::ActivationLeakyReLu<double>
     (     out_data
         , in_data
@@ -76,6 +83,245 @@ void ActivationLeakyReLuDouble
         , verbose
         #endif
     );
+    return dlrGetLastStatus();
 }
 
+int ActivationLeakyReLuBatchInt
+(           int      *out_data       // contiguous: minibatch x channel x size
+    , const int      *in_data        // contiguous: minibatch x channel x size
+    , const uint32_t  size           // number of elements per channel
+    , const uint16_t  channel        // number of channels
+    , const uint16_t  minibatch      // number of minibatch items
+    , const uint32_t  negative_slope // negative slope for LeakyReLu (float32 bit-pattern)
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::ActivationLeakyReLuBatch<int>
+    (     out_data
+        , in_data
+        , size
+        , channel
+        , minibatch
+        , negative_slope
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int ActivationLeakyReLuBatchFloat
+(           float    *out_data       // contiguous: minibatch x channel x size
+    , const float    *in_data        // contiguous: minibatch x channel x size
+    , const uint32_t  size           // number of elements per channel
+    , const uint16_t  channel        // number of channels
+    , const uint16_t  minibatch      // number of minibatch items
+    , const uint32_t  negative_slope // negative slope for LeakyReLu (float32 bit-pattern)
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::ActivationLeakyReLuBatch<float>
+    (     out_data
+        , in_data
+        , size
+        , channel
+        , minibatch
+        , negative_slope
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int ActivationLeakyReLuBatchDouble
+(           double   *out_data       // contiguous: minibatch x channel x size
+    , const double   *in_data        // contiguous: minibatch x channel x size
+    , const uint32_t  size           // number of elements per channel
+    , const uint16_t  channel        // number of channels
+    , const uint16_t  minibatch      // number of minibatch items
+    , const uint32_t  negative_slope // negative slope for LeakyReLu (float32 bit-pattern)
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::ActivationLeakyReLuBatch<double>
+    (     out_data
+        , in_data
+        , size
+        , channel
+        , minibatch
+        , negative_slope
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+#if !defined(__SYNTHESIS__)
+// fixed-point of dlr_fixed.hpp, whose data are raw bits (see dlrSetFixedFormat())
+int ActivationLeakyReLuFixed
+(           int32_t  *out_data // channel x size x size
+    , const int32_t  *in_data  // channel x size x size
+    , const uint32_t  size
+    , const uint16_t  channel
+    , const uint32_t  negative_slope
+    , const int       rigor
+    , const int       verbose
+)
+{
+    dlrClearLastError();
+    dlr::ActivationLeakyReLu<dlr::Fixed>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , size
+        , channel
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int ActivationLeakyReLuBatchFixed
+(           int32_t  *out_data       // contiguous: minibatch x channel x size
+    , const int32_t  *in_data        // contiguous: minibatch x channel x size
+    , const uint32_t  size           // number of elements per channel
+    , const uint16_t  channel        // number of channels
+    , const uint16_t  minibatch      // number of minibatch items
+    , const uint32_t  negative_slope // negative slope for LeakyReLu (float32 bit-pattern)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::ActivationLeakyReLuBatch<dlr::Fixed>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , size
+        , channel
+        , minibatch
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+#endif
+
+#if !defined(__SYNTHESIS__)
+// IEEE 754 binary16 (fp16) storage computed in float (see dlr_half.hpp)
+int ActivationLeakyReLuHalf
+(           uint16_t *out_data // channel x size x size
+    , const uint16_t *in_data  // channel x size x size
+    , const uint32_t  size
+    , const uint16_t  channel
+    , const uint32_t  negative_slope
+    , const int       rigor
+    , const int       verbose
+)
+{
+    dlrClearLastError();
+    dlr::ActivationLeakyReLu<dlr::Half>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , size
+        , channel
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int ActivationLeakyReLuBatchHalf
+(           uint16_t *out_data       // contiguous: minibatch x channel x size
+    , const uint16_t *in_data        // contiguous: minibatch x channel x size
+    , const uint32_t  size           // number of elements per channel
+    , const uint16_t  channel        // number of channels
+    , const uint16_t  minibatch      // number of minibatch items
+    , const uint32_t  negative_slope // negative slope for LeakyReLu (float32 bit-pattern)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::ActivationLeakyReLuBatch<dlr::Half>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , size
+        , channel
+        , minibatch
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+// bfloat16 (bf16) storage computed in float (see dlr_half.hpp)
+int ActivationLeakyReLuBFloat16
+(           uint16_t *out_data // channel x size x size
+    , const uint16_t *in_data  // channel x size x size
+    , const uint32_t  size
+    , const uint16_t  channel
+    , const uint32_t  negative_slope
+    , const int       rigor
+    , const int       verbose
+)
+{
+    dlrClearLastError();
+    dlr::ActivationLeakyReLu<dlr::BFloat16>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , size
+        , channel
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int ActivationLeakyReLuBatchBFloat16
+(           uint16_t *out_data       // contiguous: minibatch x channel x size
+    , const uint16_t *in_data        // contiguous: minibatch x channel x size
+    , const uint32_t  size           // number of elements per channel
+    , const uint16_t  channel        // number of channels
+    , const uint16_t  minibatch      // number of minibatch items
+    , const uint32_t  negative_slope // negative slope for LeakyReLu (float32 bit-pattern)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::ActivationLeakyReLuBatch<dlr::BFloat16>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , size
+        , channel
+        , minibatch
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+#endif
+
 } // extern "C"
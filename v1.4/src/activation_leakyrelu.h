@@ -6,8 +6,9 @@ extern "C" {
 #endif
 
 #define ActivationLeakyReLu ActivationLeakyReLuFloat
+#define ActivationLeakyReLuBatch ActivationLeakyReLuBatchFloat
 
-extern void ActivationLeakyReLuInt
+extern int ActivationLeakyReLuInt
 (           int      *out_data
     , const int      *in_data
     , const uint32_t  size
@@ -19,7 +20,7 @@ extern void ActivationLeakyReLuInt
     #endif
 );
 
-extern void ActivationLeakyReLuFloat
+extern int ActivationLeakyReLuFloat
 (           float    *out_data
     , const float    *in_data
     , const uint32_t  size
@@ -31,7 +32,7 @@ extern void ActivationLeakyReLuFloat
     #endif
 );
 
-extern void ActivationLeakyReLuDouble
+extern int ActivationLeakyReLuDouble
 (           double   *out_data
     , const double   *in_data
     , const uint32_t  size
@@ -43,6 +44,115 @@ extern void ActivationLeakyReLuDouble
     #endif
 );
 
+extern int ActivationLeakyReLuBatchInt
+(           int      *out_data       // contiguous: minibatch x channel x size
+    , const int      *in_data        // contiguous: minibatch x channel x size
+    , const uint32_t  size           // number of elements per channel
+    , const uint16_t  channel        // number of channels
+    , const uint16_t  minibatch      // number of minibatch items
+    , const uint32_t  negative_slope // negative slope for LeakyReLu (float32 bit-pattern)
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+extern int ActivationLeakyReLuBatchFloat
+(           float    *out_data       // contiguous: minibatch x channel x size
+    , const float    *in_data        // contiguous: minibatch x channel x size
+    , const uint32_t  size           // number of elements per channel
+    , const uint16_t  channel        // number of channels
+    , const uint16_t  minibatch      // number of minibatch items
+    , const uint32_t  negative_slope // negative slope for LeakyReLu (float32 bit-pattern)
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+extern int ActivationLeakyReLuBatchDouble
+(           double   *out_data       // contiguous: minibatch x channel x size
+    , const double   *in_data        // contiguous: minibatch x channel x size
+    , const uint32_t  size           // number of elements per channel
+    , const uint16_t  channel        // number of channels
+    , const uint16_t  minibatch      // number of minibatch items
+    , const uint32_t  negative_slope // negative slope for LeakyReLu (float32 bit-pattern)
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+#if !defined(__SYNTHESIS__)
+// fixed-point of raw bits in the format of dlrSetFixedFormat()
+extern int ActivationLeakyReLuFixed
+(           int32_t  *out_data
+    , const int32_t  *in_data
+    , const uint32_t  size
+    , const uint16_t  channel
+    , const uint32_t  negative_slope
+    , const int       rigor
+    , const int       verbose
+);
+
+extern int ActivationLeakyReLuBatchFixed
+(           int32_t  *out_data       // contiguous: minibatch x channel x size
+    , const int32_t  *in_data        // contiguous: minibatch x channel x size
+    , const uint32_t  size           // number of elements per channel
+    , const uint16_t  channel        // number of channels
+    , const uint16_t  minibatch      // number of minibatch items
+    , const uint32_t  negative_slope // negative slope for LeakyReLu (float32 bit-pattern)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+#endif
+
+#if !defined(__SYNTHESIS__)
+// IEEE 754 binary16 (fp16) storage of uint16_t bits computed in float
+extern int ActivationLeakyReLuHalf
+(           uint16_t *out_data
+    , const uint16_t *in_data
+    , const uint32_t  size
+    , const uint16_t  channel
+    , const uint32_t  negative_slope
+    , const int       rigor
+    , const int       verbose
+);
+
+extern int ActivationLeakyReLuBatchHalf
+(           uint16_t *out_data       // contiguous: minibatch x channel x size
+    , const uint16_t *in_data        // contiguous: minibatch x channel x size
+    , const uint32_t  size           // number of elements per channel
+    , const uint16_t  channel        // number of channels
+    , const uint16_t  minibatch      // number of minibatch items
+    , const uint32_t  negative_slope // negative slope for LeakyReLu (float32 bit-pattern)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+// bfloat16 (bf16) storage of uint16_t bits computed in float
+extern int ActivationLeakyReLuBFloat16
+(           uint16_t *out_data
+    , const uint16_t *in_data
+    , const uint32_t  size
+    , const uint16_t  channel
+    , const uint32_t  negative_slope
+    , const int       rigor
+    , const int       verbose
+);
+
+extern int ActivationLeakyReLuBatchBFloat16
+(           uint16_t *out_data       // contiguous: minibatch x channel x size
+    , const uint16_t *in_data        // contiguous: minibatch x channel x size
+    , const uint32_t  size           // number of elements per channel
+    , const uint16_t  channel        // number of channels
+    , const uint16_t  minibatch      // number of minibatch items
+    , const uint32_t  negative_slope // negative slope for LeakyReLu (float32 bit-pattern)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+#endif
+
 #ifdef __cplusplus
 }
 #endif
@@ -12,9 +12,9 @@
 #include <stdint.h>
 #if !defined(__SYNTHESIS__)
 #include <stdio.h>
-#include <assert.h>
 #include <typeinfo>
 #include "dlr_common.h"
+#include "dlr_simd.hpp"
 #endif
 
 namespace dlr { // deep learning routines
@@ -48,7 +48,8 @@ void ActivationLeakyReLu
         fflush(stderr); fflush(stdout);
     }
     if (rigor) {
-        assert (size>0);
+        dlrCheck (size>0);
+        dlrCheckAlias (out_data, in_data, (uint32_t)channel*size);
     }
     #undef QuoteMacro
     #undef QuoteIdent
@@ -60,10 +61,13 @@ void ActivationLeakyReLu
     TYPE  *pX = (TYPE *)in_data;
     TYPE  *pZ = (TYPE *)out_data;
     float slope = *((float *)&negative_slope); // make sure that it is 32-bit wide item
+    #if !defined(__SYNTHESIS__)
+    if (SimdLeakyReLu(pZ, pX, slope, (uint32_t)channel*size)) return; // float
+    #endif
     for (c=0; c<channel; ++c){
         for (s=0; s<size; ++s){
             TYPE  value = *pX;
-           *pZ = (value<(TYPE )0) ? ((float)value*slope) : value;
+           *pZ = (value<(TYPE )0) ? (TYPE)((float)value*slope) : value;
             pX++;
             pZ++;
         } // for (s=0;
@@ -72,10 +76,53 @@ void ActivationLeakyReLu
 
 // Z[n]=f(X[n])
 
+// minibatch version: in_data and out_data have leading minibatch dimension
+template<class TYPE=float>
+void ActivationLeakyReLuBatch
+(           TYPE     *out_data                  // contiguous: minibatch x channel x size
+    , const TYPE     *in_data                   // contiguous: minibatch x channel x size
+    , const uint32_t  size                      // number of elements per channel
+    , const uint16_t  channel                   // number of channels
+    , const uint16_t  minibatch                 // number of minibatch items
+    , const uint32_t  negative_slope=0x3DCCCCCD // negative slope for LeakyReLu (float32 bit-pattern)
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+    #endif
+)
+{
+    const uint32_t t_out_step=(uint32_t)channel*size;
+    const uint32_t t_in_step =(uint32_t)channel*size;
+    TYPE       *pZ = out_data;
+    const TYPE *pX = in_data;
+    uint16_t mb;
+
+    for (mb=0; mb<minibatch; ++mb) {
+        ActivationLeakyReLu<TYPE>
+        (     pZ
+            , pX
+            , size
+            , channel
+            , negative_slope
+            #if !defined(__SYNTHESIS__)
+            , rigor
+            , verbose
+            #endif
+        );
+        pZ += t_out_step;
+        pX += t_in_step;
+    }
+}
+
 } // namespace dlr
 /*
  * Revision history
  *
+ * 2026.10.18: negative value casted to TYPE for 'Half' and 'BFloat16'.
+ * 2026.10.18: in-place (out_data==in_data) checked.
+ * 2026.10.18: SIMD for float (dlr_simd.hpp).
+ * 2026.10.18: 'dlrCheck()' in place of 'assert()' for rigor checks.
+ * 2026.10.18: 'ActivationLeakyReLuBatch' added for minibatch.
  * 2020.10.20: 'channel' added.
  * 2020.07.01: Started by Ando Ki (adki@future-ds.com)
  *             - ChaeEon Lim; GeunSu Song; YoonSeong Lim;
@@ -0,0 +1,102 @@
+#include "activation_lut.hpp"
+
+extern "C" {
+
+int ActivationLutInt
+(           int      *out_data // contiguous: channel x size
+    , const int      *in_data  // contiguous: channel x size
+    , const int      *table    // 2^bits entries
+    , const uint32_t  size     // number of elements per channel
+    , const uint16_t  channel  // number of channels
+    , const uint8_t   bits     // bits of quantized input
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor    // check rigorously when 1
+    , const int       verbose  // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::ActivationLut<int>
+    (     out_data
+        , in_data
+        , table
+        , size
+        , channel
+        , bits
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int ActivationLutBatchInt
+(           int      *out_data  // contiguous: minibatch x channel x size
+    , const int      *in_data   // contiguous: minibatch x channel x size
+    , const int      *table     // 2^bits entries
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    , const uint8_t   bits      // bits of quantized input
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::ActivationLutBatch<int>
+    (     out_data
+        , in_data
+        , table
+        , size
+        , channel
+        , minibatch
+        , bits
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+#if !defined(__SYNTHESIS__)
+int ActivationLutBuildInt
+(           int      *table          // 2^bits entries
+    , const int       function       // DLR_LUT_SIGMOID, DLR_LUT_TANH or DLR_LUT_LEAKYRELU
+    , const float     in_scale
+    , const int32_t   in_zero_point
+    , const float     out_scale
+    , const int32_t   out_zero_point
+    , const uint8_t   bits
+    , const float     negative_slope // for DLR_LUT_LEAKYRELU
+    , const int       rigor          // check rigorously when 1
+    , const int       verbose        // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::ActivationLutBuild<int>
+    (     table
+        , function
+        , in_scale
+        , in_zero_point
+        , out_scale
+        , out_zero_point
+        , bits
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+#endif // !defined(__SYNTHESIS__)
+
+} // extern "C"
+
+/*
+ * Revision history
+ *
+ * 2026.10.18: Started.
+ */
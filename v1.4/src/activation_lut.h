@@ -0,0 +1,62 @@
+#pragma once
+#include <stdint.h>
+#include "dlr_common.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#define ActivationLut ActivationLutInt
+#define ActivationLutBatch ActivationLutBatchInt
+
+extern int ActivationLutInt
+(           int      *out_data // contiguous: channel x size
+    , const int      *in_data  // contiguous: channel x size
+    , const int      *table    // 2^bits entries
+    , const uint32_t  size     // number of elements per channel
+    , const uint16_t  channel  // number of channels
+    , const uint8_t   bits     // bits of quantized input
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor    // check rigorously when 1
+    , const int       verbose  // verbose level
+    #endif
+);
+
+extern int ActivationLutBatchInt
+(           int      *out_data  // contiguous: minibatch x channel x size
+    , const int      *in_data   // contiguous: minibatch x channel x size
+    , const int      *table     // 2^bits entries
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    , const uint8_t   bits      // bits of quantized input
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+// software-only: fills table for ActivationLutInt()
+#if !defined(__SYNTHESIS__)
+extern int ActivationLutBuildInt
+(           int      *table          // 2^bits entries
+    , const int       function       // DLR_LUT_SIGMOID, DLR_LUT_TANH or DLR_LUT_LEAKYRELU
+    , const float     in_scale
+    , const int32_t   in_zero_point
+    , const float     out_scale
+    , const int32_t   out_zero_point
+    , const uint8_t   bits
+    , const float     negative_slope // for DLR_LUT_LEAKYRELU
+    , const int       rigor          // check rigorously when 1
+    , const int       verbose        // verbose level
+);
+#endif // !defined(__SYNTHESIS__)
+
+#ifdef __cplusplus
+}
+#endif
+/*
+ * Revision history
+ *
+ * 2026.10.18: Started.
+ */
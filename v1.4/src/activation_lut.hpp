@@ -0,0 +1,159 @@
+#pragma once
+/*
+ * Copyright (c) 2019-2020 by Future Design Systems.
+ * All right reserved.
+ * http://www.future-ds.com
+ *
+ * @file activation_lut.hpp
+ * @brief This file contains table-driven activation routine for quantized data.
+ * @author FDS
+ * @date Oct. 18, 2026
+ */
+#include <stdint.h>
+#if !defined(__SYNTHESIS__)
+#include <stdio.h>
+#include <math.h>
+#include <typeinfo>
+#include "dlr_common.h"
+#endif
+
+namespace dlr { // deep learning routines
+
+// Quantized input 'q' of 'bits' (signed) stands for 'in_scale*(q-in_zero_point)'
+// and table[q+2^(bits-1)] keeps quantized output of the activation function,
+// where inputs out of 'bits' are saturated.
+template<class TYPE=int>
+void ActivationLut
+(           TYPE     *out_data // contiguous: channel x size
+    , const TYPE     *in_data  // contiguous: channel x size
+    , const TYPE     *table    // 2^bits entries (see ActivationLutBuild())
+    , const uint32_t  size     // number of elements per channel
+    , const uint16_t  channel  // num of channels
+    , const uint8_t   bits     // bits of quantized input
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+    #endif
+)
+{
+    #if !defined(__SYNTHESIS__)
+    if (verbose) {
+        dlrInfo("size          =%u\n", size);
+        dlrInfo("channel       =%u\n", channel);
+        dlrInfo("bits          =%u\n", bits);
+        fflush(stderr); fflush(stdout);
+    }
+    if (rigor) {
+        dlrCheck (size>0);
+        dlrCheck ((bits>=2)&&(bits<=16));
+    }
+    #endif
+
+    const int32_t t_min = -((int32_t)1<<(bits-1));
+    const int32_t t_max =  ((int32_t)1<<(bits-1))-1;
+    const uint32_t t_num = (uint32_t)channel*size;
+    uint32_t s;
+
+    for (s=0; s<t_num; ++s) {
+        int32_t q = (int32_t)in_data[s];
+        q = (q<t_min) ? t_min : (q>t_max) ? t_max : q;
+        out_data[s] = table[q-t_min];
+    }
+}
+
+// minibatch version: in_data and out_data have leading minibatch dimension
+template<class TYPE=int>
+void ActivationLutBatch
+(           TYPE     *out_data  // contiguous: minibatch x channel x size
+    , const TYPE     *in_data   // contiguous: minibatch x channel x size
+    , const TYPE     *table     // 2^bits entries (see ActivationLutBuild())
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    , const uint8_t   bits      // bits of quantized input
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+    #endif
+)
+{
+    const uint32_t t_step=(uint32_t)channel*size;
+    TYPE       *pZ = out_data;
+    const TYPE *pX = in_data;
+    uint16_t mb;
+
+    for (mb=0; mb<minibatch; ++mb) {
+        ActivationLut<TYPE>
+        (     pZ
+            , pX
+            , table
+            , size
+            , channel
+            , bits
+            #if !defined(__SYNTHESIS__)
+            , rigor
+            , verbose
+            #endif
+        );
+        pZ += t_step;
+        pX += t_step;
+    }
+}
+
+#if !defined(__SYNTHESIS__)
+// Fills table of ActivationLut() for 'function' (DLR_LUT_SIGMOID, DLR_LUT_TANH
+// or DLR_LUT_LEAKYRELU), where output is quantized by 'out_scale' and
+// 'out_zero_point' and saturated to 'bits' as well.
+template<class TYPE=int>
+void ActivationLutBuild
+(           TYPE     *table          // 2^bits entries
+    , const int       function       // DLR_LUT_SIGMOID, DLR_LUT_TANH or DLR_LUT_LEAKYRELU
+    , const float     in_scale
+    , const int32_t   in_zero_point
+    , const float     out_scale
+    , const int32_t   out_zero_point
+    , const uint8_t   bits
+    , const float     negative_slope=0.01 // for DLR_LUT_LEAKYRELU
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+)
+{
+    if (verbose) {
+        dlrInfo("function      =%d\n", function);
+        dlrInfo("in_scale      =%f\n", in_scale);
+        dlrInfo("in_zero_point =%d\n", in_zero_point);
+        dlrInfo("out_scale     =%f\n", out_scale);
+        dlrInfo("out_zero_point=%d\n", out_zero_point);
+        dlrInfo("bits          =%u\n", bits);
+        fflush(stderr); fflush(stdout);
+    }
+    if (rigor) {
+        dlrCheck ((bits>=2)&&(bits<=16));
+        dlrCheck ((in_scale>0.0f)&&(out_scale>0.0f));
+        dlrCheck ((function==DLR_LUT_SIGMOID)||(function==DLR_LUT_TANH)||(function==DLR_LUT_LEAKYRELU));
+    }
+
+    const int32_t t_min = -((int32_t)1<<(bits-1));
+    const int32_t t_max =  ((int32_t)1<<(bits-1))-1;
+    for (int32_t q=t_min; q<=t_max; ++q) {
+        const double x = (double)in_scale*(q-in_zero_point);
+        double y;
+        switch (function) {
+        case DLR_LUT_SIGMOID  : y = 1.0/(1.0+exp(-x)); break;
+        case DLR_LUT_TANH     : y = tanh(x); break;
+        case DLR_LUT_LEAKYRELU: y = (x<0.0) ? x*negative_slope : x; break;
+        default               : y = x; break;
+        }
+        double z = floor(y/out_scale+0.5)+out_zero_point;
+        z = (z<t_min) ? t_min : (z>t_max) ? t_max : z;
+        table[q-t_min] = (TYPE)z;
+    }
+}
+#endif // !defined(__SYNTHESIS__)
+
+} // namespace dlr
+/*
+ * Revision history
+ *
+ * 2026.10.18: Started.
+ */
@@ -6,8 +6,9 @@ extern "C" {
 #endif
 
 #define ActivationReLu ActivationReLuFloat
+#define ActivationReLuBatch ActivationReLuBatchFloat
 
-extern void ActivationReLuInt
+extern int ActivationReLuInt
 (           int      *out_data
     , const int      *in_data
     , const uint32_t  size
@@ -18,7 +19,7 @@ extern void ActivationReLuInt
     #endif
 );
 
-extern void ActivationReLuFloat
+extern int ActivationReLuFloat
 (           float    *out_data
     , const float    *in_data
     , const uint32_t  size
@@ -29,7 +30,7 @@ extern void ActivationReLuFloat
     #endif
 );
 
-extern void ActivationReLuDouble
+extern int ActivationReLuDouble
 (           double   *out_data
     , const double   *in_data
     , const uint32_t  size
@@ -40,6 +41,106 @@ extern void ActivationReLuDouble
     #endif
 );
 
+extern int ActivationReLuBatchInt
+(           int      *out_data  // contiguous: minibatch x channel x size
+    , const int      *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+extern int ActivationReLuBatchFloat
+(           float    *out_data  // contiguous: minibatch x channel x size
+    , const float    *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+extern int ActivationReLuBatchDouble
+(           double   *out_data  // contiguous: minibatch x channel x size
+    , const double   *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+#if !defined(__SYNTHESIS__)
+// fixed-point of raw bits in the format of dlrSetFixedFormat()
+extern int ActivationReLuFixed
+(           int32_t  *out_data
+    , const int32_t  *in_data
+    , const uint32_t  size
+    , const uint16_t  channel
+    , const int       rigor
+    , const int       verbose
+);
+
+extern int ActivationReLuBatchFixed
+(           int32_t  *out_data  // contiguous: minibatch x channel x size
+    , const int32_t  *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+#endif
+
+#if !defined(__SYNTHESIS__)
+// IEEE 754 binary16 (fp16) storage of uint16_t bits computed in float
+extern int ActivationReLuHalf
+(           uint16_t *out_data
+    , const uint16_t *in_data
+    , const uint32_t  size
+    , const uint16_t  channel
+    , const int       rigor
+    , const int       verbose
+);
+
+extern int ActivationReLuBatchHalf
+(           uint16_t *out_data  // contiguous: minibatch x channel x size
+    , const uint16_t *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+// bfloat16 (bf16) storage of uint16_t bits computed in float
+extern int ActivationReLuBFloat16
+(           uint16_t *out_data
+    , const uint16_t *in_data
+    , const uint32_t  size
+    , const uint16_t  channel
+    , const int       rigor
+    , const int       verbose
+);
+
+extern int ActivationReLuBatchBFloat16
+(           uint16_t *out_data  // contiguous: minibatch x channel x size
+    , const uint16_t *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+#endif
+
 #ifdef __cplusplus
 }
 #endif
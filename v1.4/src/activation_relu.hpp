@@ -12,16 +12,16 @@
 #include <stdint.h>
 #if !defined(__SYNTHESIS__)
 #include <stdio.h>
-#include <assert.h>
 #include <typeinfo>
 #include "dlr_common.h"
+#include "dlr_simd.hpp"
 #endif
 
 namespace dlr { // deep learning routines
 
 template<class TYPE=float>
 void ActivationReLu
-(           TYPE     *out_data // contiguous: channel x size
+(           TYPE     *out_data // contiguous: channel x size (can be in_data for in-place)
     , const TYPE     *in_data  // contiguous: channel x size
     , const uint32_t  size     // number of elements per channel
     , const uint16_t  channel
@@ -41,7 +41,8 @@ void ActivationReLu
         fflush(stderr); fflush(stdout);
     }
     if (rigor) {
-        assert (size>0);
+        dlrCheck (size>0);
+        dlrCheckAlias (out_data, in_data, (uint32_t)channel*size);
     }
     #undef QuoteMacro
     #undef QuoteIdent
@@ -49,10 +50,11 @@ void ActivationReLu
     #pragma HLS inline off
     #endif
 
+#if !defined(__SYNTHESIS__)
+    SimdReLu((TYPE*)out_data, in_data, (uint32_t)channel*size); // vector for float
+#elif 1
     uint16_t c;
     uint32_t s;
-
-#if 1
     for (c=0; c<channel; ++c){
         for (s=0; s<size; ++s){
             TYPE *pX = (TYPE*)(in_data +c*size+s);
@@ -62,6 +64,8 @@ void ActivationReLu
         } // for (s=0;
     } // for (c=0;
 #else
+    uint16_t c;
+    uint32_t s;
     TYPE *pX = (TYPE*)in_data ;
     TYPE *pZ = (TYPE*)out_data;
     for (c=0; c<channel; ++c){
@@ -77,10 +81,51 @@ void ActivationReLu
 
 // Z[n]=f(X[n])
 
+// minibatch version: in_data and out_data have leading minibatch dimension
+template<class TYPE=float>
+void ActivationReLuBatch
+(           TYPE     *out_data  // contiguous: minibatch x channel x size (can be in_data)
+    , const TYPE     *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+    #endif
+)
+{
+    const uint32_t t_out_step=(uint32_t)channel*size;
+    const uint32_t t_in_step =(uint32_t)channel*size;
+    TYPE       *pZ = out_data;
+    const TYPE *pX = in_data;
+    uint16_t mb;
+
+    for (mb=0; mb<minibatch; ++mb) {
+        ActivationReLu<TYPE>
+        (     pZ
+            , pX
+            , size
+            , channel
+            #if !defined(__SYNTHESIS__)
+            , rigor
+            , verbose
+            #endif
+        );
+        pZ += t_out_step;
+        pX += t_in_step;
+    }
+}
+
 } // namespace dlr
 /*
  * Revision history
  *
+ * 2026.10.18: loop variables declared only for the HLS loops.
+ * 2026.10.18: in-place (out_data==in_data) checked.
+ * 2026.10.18: SIMD for float (dlr_simd.hpp).
+ * 2026.10.18: 'dlrCheck()' in place of 'assert()' for rigor checks.
+ * 2026.10.18: 'ActivationReLuBatch' added for minibatch.
  * 2020.10.20: 'channel' added
  * 2020.07.01: Started by Ando Ki (adki@future-ds.com)
  *             - ChaeEon Lim; GeunSu Song; YoonSeong Lim;
@@ -1,9 +1,11 @@
 
 #include "activation_sigmoid.hpp"
+#include "dlr_fixed.hpp"
+#include "dlr_half.hpp"
 
 extern "C" {
 
-void ActivationSigmoidInt
+int ActivationSigmoidInt
 (           int      *out_data
     , const int      *in_data
     , const uint32_t  size
@@ -14,6 +16,7 @@ void ActivationSigmoidInt
     #endif
 )
 {
+    dlrClearLastError();
     dlr::ActivationSigmoid<int>
     (     out_data
         , in_data
@@ -24,9 +27,10 @@ void ActivationSigmoidInt
         , verbose
         #endif
     );
+    return dlrGetLastStatus();
 }
 
-void ActivationSigmoidFloat
+int ActivationSigmoidFloat
 (           float    *out_data
     , const float    *in_data
     , const uint32_t  size
@@ -37,6 +41,7 @@ void ActivationSigmoidFloat
     #endif
 )
 {
+    dlrClearLastError();
     dlr::ActivationSigmoid<float>
     (     out_data
         , in_data
@@ -47,9 +52,10 @@ void ActivationSigmoidFloat
         , verbose
         #endif
     );
+    return dlrGetLastStatus();
 }
 
-void ActivationSigmoidDouble
+int ActivationSigmoidDouble
 (           double   *out_data
     , const double   *in_data
     , const uint32_t  size
@@ -60,6 +66,7 @@ void ActivationSigmoidDouble
     #endif
 )
 {
+    dlrClearLastError();
     dlr::ActivationSigmoid<double>
     (     out_data
         , in_data
@@ -70,6 +77,227 @@ void ActivationSigmoidDouble
         , verbose
         #endif
     );
+    return dlrGetLastStatus();
 }
 
+int ActivationSigmoidBatchInt
+(           int      *out_data  // contiguous: minibatch x channel x size
+    , const int      *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::ActivationSigmoidBatch<int>
+    (     out_data
+        , in_data
+        , size
+        , channel
+        , minibatch
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int ActivationSigmoidBatchFloat
+(           float    *out_data  // contiguous: minibatch x channel x size
+    , const float    *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::ActivationSigmoidBatch<float>
+    (     out_data
+        , in_data
+        , size
+        , channel
+        , minibatch
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int ActivationSigmoidBatchDouble
+(           double   *out_data  // contiguous: minibatch x channel x size
+    , const double   *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::ActivationSigmoidBatch<double>
+    (     out_data
+        , in_data
+        , size
+        , channel
+        , minibatch
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+#if !defined(__SYNTHESIS__)
+// fixed-point of dlr_fixed.hpp, whose data are raw bits (see dlrSetFixedFormat())
+int ActivationSigmoidFixed
+(           int32_t  *out_data
+    , const int32_t  *in_data
+    , const uint32_t  size
+    , const uint16_t  channel
+    , const int       rigor
+    , const int       verbose
+)
+{
+    dlrClearLastError();
+    dlr::ActivationSigmoid<dlr::Fixed>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , size
+        , channel
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int ActivationSigmoidBatchFixed
+(           int32_t  *out_data  // contiguous: minibatch x channel x size
+    , const int32_t  *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::ActivationSigmoidBatch<dlr::Fixed>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , size
+        , channel
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+#endif
+
+#if !defined(__SYNTHESIS__)
+// IEEE 754 binary16 (fp16) storage computed in float (see dlr_half.hpp)
+int ActivationSigmoidHalf
+(           uint16_t *out_data
+    , const uint16_t *in_data
+    , const uint32_t  size
+    , const uint16_t  channel
+    , const int       rigor
+    , const int       verbose
+)
+{
+    dlrClearLastError();
+    dlr::ActivationSigmoid<dlr::Half>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , size
+        , channel
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int ActivationSigmoidBatchHalf
+(           uint16_t *out_data  // contiguous: minibatch x channel x size
+    , const uint16_t *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::ActivationSigmoidBatch<dlr::Half>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , size
+        , channel
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+// bfloat16 (bf16) storage computed in float (see dlr_half.hpp)
+int ActivationSigmoidBFloat16
+(           uint16_t *out_data
+    , const uint16_t *in_data
+    , const uint32_t  size
+    , const uint16_t  channel
+    , const int       rigor
+    , const int       verbose
+)
+{
+    dlrClearLastError();
+    dlr::ActivationSigmoid<dlr::BFloat16>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , size
+        , channel
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int ActivationSigmoidBatchBFloat16
+(           uint16_t *out_data  // contiguous: minibatch x channel x size
+    , const uint16_t *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::ActivationSigmoidBatch<dlr::BFloat16>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , size
+        , channel
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+#endif
+
 } // extern "C"
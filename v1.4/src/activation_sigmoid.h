@@ -6,8 +6,9 @@ extern "C" {
 #endif
 
 #define ActivationSigmoid ActivationSigmoidFloat
+#define ActivationSigmoidBatch ActivationSigmoidBatchFloat
 
-extern void ActivationSigmoidInt
+extern int ActivationSigmoidInt
 (           int      *out_data
     , const int      *in_data
     , const uint32_t  size
@@ -18,7 +19,7 @@ extern void ActivationSigmoidInt
     #endif
 );
 
-extern void ActivationSigmoidFloat
+extern int ActivationSigmoidFloat
 (           float    *out_data
     , const float    *in_data
     , const uint32_t  size
@@ -29,7 +30,7 @@ extern void ActivationSigmoidFloat
     #endif
 );
 
-extern void ActivationSigmoidDouble
+extern int ActivationSigmoidDouble
 (           double   *out_data
     , const double   *in_data
     , const uint32_t  size
@@ -40,6 +41,106 @@ extern void ActivationSigmoidDouble
     #endif
 );
 
+extern int ActivationSigmoidBatchInt
+(           int      *out_data  // contiguous: minibatch x channel x size
+    , const int      *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+extern int ActivationSigmoidBatchFloat
+(           float    *out_data  // contiguous: minibatch x channel x size
+    , const float    *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+extern int ActivationSigmoidBatchDouble
+(           double   *out_data  // contiguous: minibatch x channel x size
+    , const double   *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+#if !defined(__SYNTHESIS__)
+// fixed-point of raw bits in the format of dlrSetFixedFormat()
+extern int ActivationSigmoidFixed
+(           int32_t  *out_data
+    , const int32_t  *in_data
+    , const uint32_t  size
+    , const uint16_t  channel
+    , const int       rigor
+    , const int       verbose
+);
+
+extern int ActivationSigmoidBatchFixed
+(           int32_t  *out_data  // contiguous: minibatch x channel x size
+    , const int32_t  *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+#endif
+
+#if !defined(__SYNTHESIS__)
+// IEEE 754 binary16 (fp16) storage of uint16_t bits computed in float
+extern int ActivationSigmoidHalf
+(           uint16_t *out_data
+    , const uint16_t *in_data
+    , const uint32_t  size
+    , const uint16_t  channel
+    , const int       rigor
+    , const int       verbose
+);
+
+extern int ActivationSigmoidBatchHalf
+(           uint16_t *out_data  // contiguous: minibatch x channel x size
+    , const uint16_t *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+// bfloat16 (bf16) storage of uint16_t bits computed in float
+extern int ActivationSigmoidBFloat16
+(           uint16_t *out_data
+    , const uint16_t *in_data
+    , const uint32_t  size
+    , const uint16_t  channel
+    , const int       rigor
+    , const int       verbose
+);
+
+extern int ActivationSigmoidBatchBFloat16
+(           uint16_t *out_data  // contiguous: minibatch x channel x size
+    , const uint16_t *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+#endif
+
 #ifdef __cplusplus
 }
 #endif
@@ -13,7 +13,6 @@
 #include <math.h>
 #if !defined(__SYNTHESIS__)
 #include <stdio.h>
-#include <assert.h>
 #include <typeinfo>
 #include "dlr_common.h"
 #endif
@@ -44,7 +43,8 @@ void ActivationSigmoid
         fflush(stderr); fflush(stdout);
     }
     if (rigor) {
-        assert (size>0);
+        dlrCheck (size>0);
+        dlrCheckAlias (out_data, in_data, (uint32_t)channel*size);
     }
     #undef QuoteMacro
     #undef QuoteIdent
@@ -67,10 +67,49 @@ void ActivationSigmoid
 
 // Z[n]=f(X[n])
 
+// minibatch version: in_data and out_data have leading minibatch dimension
+template<class TYPE=float>
+void ActivationSigmoidBatch
+(           TYPE     *out_data  // contiguous: minibatch x channel x size (can be in_data)
+    , const TYPE     *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+    #endif
+)
+{
+    const uint32_t t_out_step=(uint32_t)channel*size;
+    const uint32_t t_in_step =(uint32_t)channel*size;
+    TYPE       *pZ = out_data;
+    const TYPE *pX = in_data;
+    uint16_t mb;
+
+    for (mb=0; mb<minibatch; ++mb) {
+        ActivationSigmoid<TYPE>
+        (     pZ
+            , pX
+            , size
+            , channel
+            #if !defined(__SYNTHESIS__)
+            , rigor
+            , verbose
+            #endif
+        );
+        pZ += t_out_step;
+        pX += t_in_step;
+    }
+}
+
 } // namespace dlr
 /*
  * Revision history
  *
+ * 2026.10.18: in-place (out_data==in_data) checked.
+ * 2026.10.18: 'dlrCheck()' in place of 'assert()' for rigor checks.
+ * 2026.10.18: 'ActivationSigmoidBatch' added for minibatch.
  * 2020.10.20: 'channel' added
  * 2020.07.01: Started by Ando Ki (adki@future-ds.com)
  *             - ChaeEon Lim; GeunSu Song; YoonSeong Lim;
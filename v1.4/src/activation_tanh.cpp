@@ -1,9 +1,11 @@
 
 #include "activation_tanh.hpp"
+#include "dlr_fixed.hpp"
+#include "dlr_half.hpp"
 
 extern "C" {
 
-void ActivationTanhInt
+int ActivationTanhInt
 (           int      *out_data
     , const int      *in_data
     , const uint32_t  size
@@ -14,6 +16,7 @@ void ActivationTanhInt
     #endif
 )
 {
+    dlrClearLastError();
     dlr::ActivationTanh<int>
     (     out_data
         , in_data
@@ -24,9 +27,10 @@ void ActivationTanhInt
         , verbose
         #endif
     );
+    return dlrGetLastStatus();
 }
 
-void ActivationTanhFloat
+int ActivationTanhFloat
 (           float    *out_data
     , const float    *in_data
     , const uint32_t  size
@@ -37,6 +41,7 @@ void ActivationTanhFloat
     #endif
 )
 {
+    dlrClearLastError();
     dlr::ActivationTanh<float>
     (     out_data
         , in_data
@@ -47,9 +52,10 @@ void ActivationTanhFloat
         , verbose
         #endif
     );
+    return dlrGetLastStatus();
 }
 
-void ActivationTanhDouble
+int ActivationTanhDouble
 (           double   *out_data
     , const double   *in_data
     , const uint32_t  size
@@ -60,6 +66,7 @@ void ActivationTanhDouble
     #endif
 )
 {
+    dlrClearLastError();
     dlr::ActivationTanh<double>
     (     out_data
         , in_data
@@ -70,6 +77,227 @@ void ActivationTanhDouble
         , verbose
         #endif
     );
+    return dlrGetLastStatus();
 }
 
+int ActivationTanhBatchInt
+(           int      *out_data  // contiguous: minibatch x channel x size
+    , const int      *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::ActivationTanhBatch<int>
+    (     out_data
+        , in_data
+        , size
+        , channel
+        , minibatch
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int ActivationTanhBatchFloat
+(           float    *out_data  // contiguous: minibatch x channel x size
+    , const float    *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::ActivationTanhBatch<float>
+    (     out_data
+        , in_data
+        , size
+        , channel
+        , minibatch
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int ActivationTanhBatchDouble
+(           double   *out_data  // contiguous: minibatch x channel x size
+    , const double   *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::ActivationTanhBatch<double>
+    (     out_data
+        , in_data
+        , size
+        , channel
+        , minibatch
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+#if !defined(__SYNTHESIS__)
+// fixed-point of dlr_fixed.hpp, whose data are raw bits (see dlrSetFixedFormat())
+int ActivationTanhFixed
+(           int32_t  *out_data
+    , const int32_t  *in_data
+    , const uint32_t  size
+    , const uint16_t  channel
+    , const int       rigor
+    , const int       verbose
+)
+{
+    dlrClearLastError();
+    dlr::ActivationTanh<dlr::Fixed>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , size
+        , channel
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int ActivationTanhBatchFixed
+(           int32_t  *out_data  // contiguous: minibatch x channel x size
+    , const int32_t  *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::ActivationTanhBatch<dlr::Fixed>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , size
+        , channel
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+#endif
+
+#if !defined(__SYNTHESIS__)
+// IEEE 754 binary16 (fp16) storage computed in float (see dlr_half.hpp)
+int ActivationTanhHalf
+(           uint16_t *out_data
+    , const uint16_t *in_data
+    , const uint32_t  size
+    , const uint16_t  channel
+    , const int       rigor
+    , const int       verbose
+)
+{
+    dlrClearLastError();
+    dlr::ActivationTanh<dlr::Half>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , size
+        , channel
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int ActivationTanhBatchHalf
+(           uint16_t *out_data  // contiguous: minibatch x channel x size
+    , const uint16_t *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::ActivationTanhBatch<dlr::Half>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , size
+        , channel
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+// bfloat16 (bf16) storage computed in float (see dlr_half.hpp)
+int ActivationTanhBFloat16
+(           uint16_t *out_data
+    , const uint16_t *in_data
+    , const uint32_t  size
+    , const uint16_t  channel
+    , const int       rigor
+    , const int       verbose
+)
+{
+    dlrClearLastError();
+    dlr::ActivationTanh<dlr::BFloat16>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , size
+        , channel
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int ActivationTanhBatchBFloat16
+(           uint16_t *out_data  // contiguous: minibatch x channel x size
+    , const uint16_t *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::ActivationTanhBatch<dlr::BFloat16>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , size
+        , channel
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+#endif
+
 } // extern "C"
@@ -6,8 +6,9 @@ extern "C" {
 #endif
 
 #define ActivationTanh ActivationTanhFloat
+#define ActivationTanhBatch ActivationTanhBatchFloat
 
-extern void ActivationTanhInt
+extern int ActivationTanhInt
 (           int      *out_data
     , const int      *in_data
     , const uint32_t  size
@@ -18,7 +19,7 @@ extern void ActivationTanhInt
     #endif
 );
 
-extern void ActivationTanhFloat
+extern int ActivationTanhFloat
 (           float    *out_data
     , const float    *in_data
     , const uint32_t  size
@@ -29,7 +30,7 @@ extern void ActivationTanhFloat
     #endif
 );
 
-extern void ActivationTanhDouble
+extern int ActivationTanhDouble
 (           double   *out_data
     , const double   *in_data
     , const uint32_t  size
@@ -40,6 +41,106 @@ extern void ActivationTanhDouble
     #endif
 );
 
+extern int ActivationTanhBatchInt
+(           int      *out_data  // contiguous: minibatch x channel x size
+    , const int      *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+extern int ActivationTanhBatchFloat
+(           float    *out_data  // contiguous: minibatch x channel x size
+    , const float    *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+extern int ActivationTanhBatchDouble
+(           double   *out_data  // contiguous: minibatch x channel x size
+    , const double   *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+#if !defined(__SYNTHESIS__)
+// fixed-point of raw bits in the format of dlrSetFixedFormat()
+extern int ActivationTanhFixed
+(           int32_t  *out_data
+    , const int32_t  *in_data
+    , const uint32_t  size
+    , const uint16_t  channel
+    , const int       rigor
+    , const int       verbose
+);
+
+extern int ActivationTanhBatchFixed
+(           int32_t  *out_data  // contiguous: minibatch x channel x size
+    , const int32_t  *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+#endif
+
+#if !defined(__SYNTHESIS__)
+// IEEE 754 binary16 (fp16) storage of uint16_t bits computed in float
+extern int ActivationTanhHalf
+(           uint16_t *out_data
+    , const uint16_t *in_data
+    , const uint32_t  size
+    , const uint16_t  channel
+    , const int       rigor
+    , const int       verbose
+);
+
+extern int ActivationTanhBatchHalf
+(           uint16_t *out_data  // contiguous: minibatch x channel x size
+    , const uint16_t *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+// bfloat16 (bf16) storage of uint16_t bits computed in float
+extern int ActivationTanhBFloat16
+(           uint16_t *out_data
+    , const uint16_t *in_data
+    , const uint32_t  size
+    , const uint16_t  channel
+    , const int       rigor
+    , const int       verbose
+);
+
+extern int ActivationTanhBatchBFloat16
+(           uint16_t *out_data  // contiguous: minibatch x channel x size
+    , const uint16_t *in_data   // contiguous: minibatch x channel x size
+    , const uint32_t  size      // number of elements per channel
+    , const uint16_t  channel   // number of channels
+    , const uint16_t  minibatch // number of minibatch items
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+#endif
+
 #ifdef __cplusplus
 }
 #endif
@@ -1,9 +1,10 @@
 
 #include "concat_2d.hpp"
+#include "dlr_fixed.hpp"
 
 extern "C" {
 
-void Concat2dInt
+int Concat2dInt
 (           int      *out_data // depends on dim; size of (in_rowsA*in_colsA+in_rowsB*in_colsB)
     , const int      *in_dataA // in_rowsA x in_colsA
     , const int      *in_dataB // in_rowsB x in_colsB
@@ -18,6 +19,7 @@ void Concat2dInt
     #endif
 )
 {
+    dlrClearLastError();
     dlr::Concat2d<int>
     (     out_data
         , in_dataA
@@ -32,9 +34,10 @@ void Concat2dInt
         , verbose
         #endif
     );
+    return dlrGetLastStatus();
 }
 
-void Concat2dFloat
+int Concat2dFloat
 (           float    *out_data // depends on dim; size of (in_rowsA*in_colsA+in_rowsB*in_colsB)
     , const float    *in_dataA // in_rowsA x in_colsA
     , const float    *in_dataB // in_rowsB x in_colsB
@@ -49,6 +52,7 @@ void Concat2dFloat
     #endif
 )
 {
+    dlrClearLastError();
     dlr::Concat2d<float>
     (     out_data
         , in_dataA
@@ -63,9 +67,10 @@ void Concat2dFloat
         , verbose
         #endif
     );
+    return dlrGetLastStatus();
 }
 
-void Concat2dDouble
+int Concat2dDouble
 (           double   *out_data // depends on dim; size of (in_rowsA*in_colsA+in_rowsB*in_colsB)
     , const double   *in_dataA // in_rowsA x in_colsA
     , const double   *in_dataB // in_rowsB x in_colsB
@@ -80,6 +85,7 @@ void Concat2dDouble
     #endif
 )
 {
+    dlrClearLastError();
     dlr::Concat2d<double>
     (     out_data
         , in_dataA
@@ -94,6 +100,39 @@ void Concat2dDouble
         , verbose
         #endif
     );
+    return dlrGetLastStatus();
 }
 
+#if !defined(__SYNTHESIS__)
+// fixed-point of dlr_fixed.hpp, whose data are raw bits (see dlrSetFixedFormat())
+int Concat2dFixed
+(           int32_t  *out_data // depends on dim; size of (in_rowsA*in_colsA+in_rowsB*in_colsB)
+    , const int32_t  *in_dataA // in_rowsA x in_colsA
+    , const int32_t  *in_dataB // in_rowsB x in_colsB
+    , const uint16_t  in_rowsA // height
+    , const uint16_t  in_colsA // width
+    , const uint16_t  in_rowsB // height
+    , const uint16_t  in_colsB // width
+    , const uint8_t   dim      // 0 or 1
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Concat2d<dlr::Fixed>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_dataA
+        , (const dlr::Fixed*)in_dataB
+        , in_rowsA
+        , in_colsA
+        , in_rowsB
+        , in_colsB
+        , dim
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+#endif
+
 } // extern "C"
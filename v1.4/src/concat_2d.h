@@ -8,7 +8,7 @@ extern "C" {
 
 #define Concat2d  Concat2dFloat
 
-extern void Concat2dInt
+extern int Concat2dInt
 (           int      *out_data // depend on dim
     , const int      *in_dataA // in_rowsA x in_colsA
     , const int      *in_dataB // in_rowsB x in_colsB
@@ -23,7 +23,7 @@ extern void Concat2dInt
     #endif
 );
 
-extern void Concat2dFloat
+extern int Concat2dFloat
 (           float    *out_data // depend on dim
     , const float    *in_dataA // in_rowsA x in_colsA
     , const float    *in_dataB // in_rowsB x in_colsB
@@ -38,7 +38,7 @@ extern void Concat2dFloat
     #endif
 );
 
-extern void Concat2dDouble
+extern int Concat2dDouble
 (           double   *out_data // depend on dim
     , const double   *in_dataA // in_rowsA x in_colsA
     , const double   *in_dataB // in_rowsB x in_colsB
@@ -53,6 +53,22 @@ extern void Concat2dDouble
     #endif
 );
 
+#if !defined(__SYNTHESIS__)
+// fixed-point of raw bits in the format of dlrSetFixedFormat()
+extern int Concat2dFixed
+(           int32_t  *out_data // depend on dim
+    , const int32_t  *in_dataA // in_rowsA x in_colsA
+    , const int32_t  *in_dataB // in_rowsB x in_colsB
+    , const uint16_t  in_rowsA // height
+    , const uint16_t  in_colsA // width
+    , const uint16_t  in_rowsB // height
+    , const uint16_t  in_colsB // width
+    , const uint8_t   dim      // 0 or 1
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+#endif
+
 #ifdef __cplusplus
 }
 #endif
@@ -13,7 +13,6 @@
 #include <string.h>
 #if !defined(__SYNTHESIS__)
 #include <stdio.h>
-#include <assert.h>
 #include <typeinfo>
 #include "dlr_common.h"
 #endif
@@ -51,11 +50,11 @@ void Concat2d
         fflush(stderr); fflush(stdout);
     }
     if (rigor) {
-        assert ((dim>=0)&&(dim<2));
-        assert ((in_rowsA>0)&&(in_colsA>0));
-        assert ((in_rowsB>0)&&(in_colsB>0));
-        if (dim==0) assert(in_colsA==in_colsB); // width should be the same
-        if (dim==1) assert(in_rowsA==in_rowsB); // height should be the same
+        dlrCheck ((dim>=0)&&(dim<2));
+        dlrCheck ((in_rowsA>0)&&(in_colsA>0));
+        dlrCheck ((in_rowsB>0)&&(in_colsB>0));
+        if (dim==0) dlrCheck(in_colsA==in_colsB); // width should be the same
+        if (dim==1) dlrCheck(in_rowsA==in_rowsB); // height should be the same
     }
     #undef QuoteMacro
     #undef QuoteIdent
@@ -172,6 +171,7 @@ void Concat2d
 /*
  * Revision history
  *
+ * 2026.10.18: 'dlrCheck()' in place of 'assert()' for rigor checks.
  * 2020.09.20: parameter order of bias and bias_size changed.
  *             parameter 'rigor' and 'verbose' added.
  * 2020.08.31: Updated by participants of 2020 Summer Intern Program.
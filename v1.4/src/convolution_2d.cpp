@@ -1,9 +1,11 @@
 
 #include "convolution_2d.hpp"
+#include "dlr_fixed.hpp"
+#include "dlr_half.hpp"
 
 extern "C" {
 
-void Convolution2dInt
+int Convolution2dInt
 (           int      *out_data    // out_channel x out_size x out_size
     , const int      *in_data     // in_channel x in_size x in_size
     , const int      *kernel      // in_channel x out_channel x kernel_size x kernel_size
@@ -22,6 +24,7 @@ void Convolution2dInt
     #endif
 )
 {
+    dlrClearLastError();
     dlr::Convolution2d<int> ( out_data
                   , in_data
                   , kernel
@@ -39,9 +42,10 @@ void Convolution2dInt
                   , verbose
                   #endif
                   );
+    return dlrGetLastStatus();
 }
 
-void Convolution2dFloat
+int Convolution2dFloat
 (           float    *out_data    // out_channel x out_size x out_size
     , const float    *in_data     // in_channel x in_size x in_size
     , const float    *kernel      // in_channel x out_channel x kernel_size x kernel_size
@@ -60,6 +64,7 @@ void Convolution2dFloat
     #endif
 )
 {
+    dlrClearLastError();
     dlr::Convolution2d<float> ( out_data
                   , in_data
                   , kernel
@@ -77,9 +82,10 @@ void Convolution2dFloat
                   , verbose
                   #endif
                   );
+    return dlrGetLastStatus();
 }
 
-void Convolution2dDouble
+int Convolution2dDouble
 (           double   *out_data    // out_channel x out_size x out_size
     , const double   *in_data     // in_channel x in_size x in_size
     , const double   *kernel      // in_channel x out_channel x kernel_size x kernel_size
@@ -98,6 +104,7 @@ void Convolution2dDouble
     #endif
 )
 {
+    dlrClearLastError();
     dlr::Convolution2d<double> ( out_data
                   , in_data
                   , kernel
@@ -115,6 +122,460 @@ void Convolution2dDouble
                   , verbose
                   #endif
                   );
+    return dlrGetLastStatus();
 }
 
+int Convolution2dBatchInt
+(           int      *out_data    // minibatch x out_channel x out_size x out_size
+    , const int      *in_data     // minibatch x in_channel x in_size x in_size
+    , const int      *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const int      *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dBatch<int>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dBatchFloat
+(           float    *out_data    // minibatch x out_channel x out_size x out_size
+    , const float    *in_data     // minibatch x in_channel x in_size x in_size
+    , const float    *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const float    *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dBatch<float>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dBatchDouble
+(           double   *out_data    // minibatch x out_channel x out_size x out_size
+    , const double   *in_data     // minibatch x in_channel x in_size x in_size
+    , const double   *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const double   *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dBatch<double>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+#if !defined(__SYNTHESIS__)
+int Convolution2dInt8
+(           int8_t   *out_data      // out_channel x out_size x out_size
+    , const int8_t   *in_data       // in_channel x in_size x in_size
+    , const int8_t   *kernel        // out_channel x in_channel x kernel_size x kernel_size
+    , const int32_t  *bias          // out_channel
+    , const int32_t  *multiplier    // out_channel, Q31 of requantization
+    , const int8_t   *shift         // out_channel, shift of requantization
+    , const int32_t   in_zero_point
+    , const int32_t   out_zero_point
+    , const uint16_t  out_size      // only for square matrix
+    , const uint16_t  in_size       // only for square matrix
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  bias_size     // out_channel
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dInt8 ( out_data
+                  , in_data
+                  , kernel
+                  , bias
+                  , multiplier
+                  , shift
+                  , in_zero_point
+                  , out_zero_point
+                  , out_size
+                  , in_size
+                  , kernel_size
+                  , bias_size
+                  , in_channel
+                  , out_channel
+                  , stride
+                  , padding
+                  , rigor
+                  , verbose
+                  );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dBatchInt8
+(           int8_t   *out_data      // minibatch x out_channel x out_size x out_size
+    , const int8_t   *in_data       // minibatch x in_channel x in_size x in_size
+    , const int8_t   *kernel        // out_channel x in_channel x kernel_size x kernel_size
+    , const int32_t  *bias          // out_channel
+    , const int32_t  *multiplier    // out_channel, Q31 of requantization
+    , const int8_t   *shift         // out_channel, shift of requantization
+    , const int32_t   in_zero_point
+    , const int32_t   out_zero_point
+    , const uint16_t  out_size      // only for square matrix
+    , const uint16_t  in_size       // only for square matrix
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  bias_size     // out_channel
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const uint16_t  minibatch     // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dBatchInt8 ( out_data
+                  , in_data
+                  , kernel
+                  , bias
+                  , multiplier
+                  , shift
+                  , in_zero_point
+                  , out_zero_point
+                  , out_size
+                  , in_size
+                  , kernel_size
+                  , bias_size
+                  , in_channel
+                  , out_channel
+                  , minibatch
+                  , stride
+                  , padding
+                  , rigor
+                  , verbose
+                  );
+    return dlrGetLastStatus();
+}
+#endif
+
+#if !defined(__SYNTHESIS__)
+// fixed-point of dlr_fixed.hpp, whose data are raw bits (see dlrSetFixedFormat())
+int Convolution2dFixed
+(           int32_t  *out_data    // out_channel x out_size x out_size
+    , const int32_t  *in_data     // in_channel x in_size x in_size
+    , const int32_t  *kernel      // in_channel x out_channel x kernel_size x kernel_size
+    , const int32_t  *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor   // check rigorously when 1
+    , const int       verbose // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2d<dlr::Fixed> ( (dlr::Fixed*)out_data
+                  , (const dlr::Fixed*)in_data
+                  , (const dlr::Fixed*)kernel
+                  , (const dlr::Fixed*)bias
+                  , out_size
+                  , in_size
+                  , kernel_size
+                  , bias_size
+                  , in_channel
+                  , out_channel
+                  , stride
+                  , padding
+                  , rigor
+                  , verbose
+                  );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dBatchFixed
+(           int32_t  *out_data    // minibatch x out_channel x out_size x out_size
+    , const int32_t  *in_data     // minibatch x in_channel x in_size x in_size
+    , const int32_t  *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const int32_t  *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dBatch<dlr::Fixed>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , (const dlr::Fixed*)kernel
+        , (const dlr::Fixed*)bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+#endif
+
+#if !defined(__SYNTHESIS__)
+// IEEE 754 binary16 (fp16) storage computed in float (see dlr_half.hpp)
+int Convolution2dHalf
+(           uint16_t *out_data    // out_channel x out_size x out_size
+    , const uint16_t *in_data     // in_channel x in_size x in_size
+    , const uint16_t *kernel      // in_channel x out_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor   // check rigorously when 1
+    , const int       verbose // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2d<dlr::Half> ( (dlr::Half*)out_data
+                  , (const dlr::Half*)in_data
+                  , (const dlr::Half*)kernel
+                  , (const dlr::Half*)bias
+                  , out_size
+                  , in_size
+                  , kernel_size
+                  , bias_size
+                  , in_channel
+                  , out_channel
+                  , stride
+                  , padding
+                  , rigor
+                  , verbose
+                  );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dBatchHalf
+(           uint16_t *out_data    // minibatch x out_channel x out_size x out_size
+    , const uint16_t *in_data     // minibatch x in_channel x in_size x in_size
+    , const uint16_t *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dBatch<dlr::Half>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , (const dlr::Half*)kernel
+        , (const dlr::Half*)bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+// bfloat16 (bf16) storage computed in float (see dlr_half.hpp)
+int Convolution2dBFloat16
+(           uint16_t *out_data    // out_channel x out_size x out_size
+    , const uint16_t *in_data     // in_channel x in_size x in_size
+    , const uint16_t *kernel      // in_channel x out_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor   // check rigorously when 1
+    , const int       verbose // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2d<dlr::BFloat16> ( (dlr::BFloat16*)out_data
+                  , (const dlr::BFloat16*)in_data
+                  , (const dlr::BFloat16*)kernel
+                  , (const dlr::BFloat16*)bias
+                  , out_size
+                  , in_size
+                  , kernel_size
+                  , bias_size
+                  , in_channel
+                  , out_channel
+                  , stride
+                  , padding
+                  , rigor
+                  , verbose
+                  );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dBatchBFloat16
+(           uint16_t *out_data    // minibatch x out_channel x out_size x out_size
+    , const uint16_t *in_data     // minibatch x in_channel x in_size x in_size
+    , const uint16_t *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dBatch<dlr::BFloat16>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , (const dlr::BFloat16*)kernel
+        , (const dlr::BFloat16*)bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+#endif
+
 } // extern "C"
@@ -6,8 +6,9 @@ extern "C" {
 #endif
 
 #define Convolution2d Convolution2dFloat
+#define Convolution2dBatch Convolution2dBatchFloat
 
-extern void Convolution2dInt
+extern int Convolution2dInt
 (           int      *out_data    // out_channel x out_size x out_size
     , const int      *in_data     // in_channel x in_size x in_size
     , const int      *kernel      // in_channel x out_channel x kernel_size x kernel_size
@@ -26,7 +27,7 @@ extern void Convolution2dInt
     #endif
 );
 
-extern void Convolution2dFloat
+extern int Convolution2dFloat
 (           float    *out_data    // out_channel x out_size x out_size
     , const float    *in_data     // in_channel x in_size x in_size
     , const float    *kernel      // in_channel x out_channel x kernel_size x kernel_size
@@ -45,7 +46,7 @@ extern void Convolution2dFloat
     #endif
 );
 
-extern void Convolution2dDouble
+extern int Convolution2dDouble
 (           double   *out_data    // out_channel x out_size x out_size
     , const double   *in_data     // in_channel x in_size x in_size
     , const double   *kernel      // in_channel x out_channel x kernel_size x kernel_size
@@ -64,6 +65,224 @@ extern void Convolution2dDouble
     #endif
 );
 
+extern int Convolution2dBatchInt
+(           int      *out_data    // minibatch x out_channel x out_size x out_size
+    , const int      *in_data     // minibatch x in_channel x in_size x in_size
+    , const int      *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const int      *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+extern int Convolution2dBatchFloat
+(           float    *out_data    // minibatch x out_channel x out_size x out_size
+    , const float    *in_data     // minibatch x in_channel x in_size x in_size
+    , const float    *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const float    *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+extern int Convolution2dBatchDouble
+(           double   *out_data    // minibatch x out_channel x out_size x out_size
+    , const double   *in_data     // minibatch x in_channel x in_size x in_size
+    , const double   *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const double   *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+#if !defined(__SYNTHESIS__)
+// int8 x int8 --> int32 with requantization to int8 for each output channel
+extern int Convolution2dInt8
+(           int8_t   *out_data      // out_channel x out_size x out_size
+    , const int8_t   *in_data       // in_channel x in_size x in_size
+    , const int8_t   *kernel        // out_channel x in_channel x kernel_size x kernel_size
+    , const int32_t  *bias          // out_channel
+    , const int32_t  *multiplier    // out_channel, Q31 of requantization
+    , const int8_t   *shift         // out_channel, shift of requantization
+    , const int32_t   in_zero_point
+    , const int32_t   out_zero_point
+    , const uint16_t  out_size      // only for square matrix
+    , const uint16_t  in_size       // only for square matrix
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  bias_size     // out_channel
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+);
+
+extern int Convolution2dBatchInt8
+(           int8_t   *out_data      // minibatch x out_channel x out_size x out_size
+    , const int8_t   *in_data       // minibatch x in_channel x in_size x in_size
+    , const int8_t   *kernel        // out_channel x in_channel x kernel_size x kernel_size
+    , const int32_t  *bias          // out_channel
+    , const int32_t  *multiplier    // out_channel, Q31 of requantization
+    , const int8_t   *shift         // out_channel, shift of requantization
+    , const int32_t   in_zero_point
+    , const int32_t   out_zero_point
+    , const uint16_t  out_size      // only for square matrix
+    , const uint16_t  in_size       // only for square matrix
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  bias_size     // out_channel
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const uint16_t  minibatch     // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+);
+#endif
+
+#if !defined(__SYNTHESIS__)
+// fixed-point of raw bits in the format of dlrSetFixedFormat()
+extern int Convolution2dFixed
+(           int32_t  *out_data    // out_channel x out_size x out_size
+    , const int32_t  *in_data     // in_channel x in_size x in_size
+    , const int32_t  *kernel      // in_channel x out_channel x kernel_size x kernel_size
+    , const int32_t  *bias        // bias per kernel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // number of biases, it should be the same as out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride      // stride default 1
+    , const uint8_t   padding     // padding default 0
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dBatchFixed
+(           int32_t  *out_data    // minibatch x out_channel x out_size x out_size
+    , const int32_t  *in_data     // minibatch x in_channel x in_size x in_size
+    , const int32_t  *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const int32_t  *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+#endif
+
+#if !defined(__SYNTHESIS__)
+// IEEE 754 binary16 (fp16) storage of uint16_t bits computed in float
+extern int Convolution2dHalf
+(           uint16_t *out_data    // out_channel x out_size x out_size
+    , const uint16_t *in_data     // in_channel x in_size x in_size
+    , const uint16_t *kernel      // in_channel x out_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // bias per kernel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // number of biases, it should be the same as out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride      // stride default 1
+    , const uint8_t   padding     // padding default 0
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dBatchHalf
+(           uint16_t *out_data    // minibatch x out_channel x out_size x out_size
+    , const uint16_t *in_data     // minibatch x in_channel x in_size x in_size
+    , const uint16_t *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+// bfloat16 (bf16) storage of uint16_t bits computed in float
+extern int Convolution2dBFloat16
+(           uint16_t *out_data    // out_channel x out_size x out_size
+    , const uint16_t *in_data     // in_channel x in_size x in_size
+    , const uint16_t *kernel      // in_channel x out_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // bias per kernel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // number of biases, it should be the same as out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride      // stride default 1
+    , const uint8_t   padding     // padding default 0
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dBatchBFloat16
+(           uint16_t *out_data    // minibatch x out_channel x out_size x out_size
+    , const uint16_t *in_data     // minibatch x in_channel x in_size x in_size
+    , const uint16_t *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+#endif
+
 #ifdef __cplusplus
 }
 #endif
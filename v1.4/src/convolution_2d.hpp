@@ -12,13 +12,44 @@
 #include <stdint.h>
 #if !defined(__SYNTHESIS__)
 #include <stdio.h>
-#include <assert.h>
 #include <typeinfo>
+#include <vector>
+#include <type_traits>
 #include "dlr_common.h"
+#include "dlr_half.hpp"
+#include "dlr_simd.hpp"
+#include "dlr_quant.hpp"
 #endif
 
 namespace dlr { // deep learning routines
 
+#if !defined(__SYNTHESIS__)
+// Returns sum of products of a kernel window at (y0,x0) of input,
+// where the window is clipped to input, i.e., padding is skipped.
+template<class TYPE=float>
+inline typename Accumulator<TYPE>::type Convolution2dWindow
+(     const TYPE     *in_data     // in_size x in_size of a channel
+    , const TYPE     *kernel      // kernel_size x kernel_size of a channel
+    , const int32_t   y0          // top row of the window, negative in padding
+    , const int32_t   x0          // left column of the window, negative in padding
+    , const uint16_t  in_size
+    , const uint8_t   kernel_size
+)
+{
+    const int32_t i0 = (y0<0) ? -y0 : 0;
+    const int32_t j0 = (x0<0) ? -x0 : 0;
+    const int32_t i1 = ((y0+kernel_size)>in_size) ? in_size-y0 : kernel_size;
+    const int32_t j1 = ((x0+kernel_size)>in_size) ? in_size-x0 : kernel_size;
+    typename Accumulator<TYPE>::type accum=0;
+    for (int32_t i=i0; i<i1; ++i) {
+        for (int32_t j=j0; j<j1; ++j) {
+            accum += in_data[(y0+i)*in_size+(x0+j)]*kernel[i*kernel_size+j];
+        }
+    }
+    return accum;
+}
+#endif
+
 template<class TYPE=float>
 void Convolution2d
 (           TYPE     *out_data    // out_channel x out_size x out_size
@@ -56,19 +87,20 @@ void Convolution2d
         fflush(stderr); fflush(stdout);
     }
     if (rigor) {
-        assert (in_channel>0);
-        assert (out_channel>0);
-        assert (out_size==(((in_size-kernel_size+2*padding)/stride)+1));
-        assert ((kernel_size%2)==1);
-        assert (stride>0);
-        assert (padding>=0);
-        assert (padding<=(kernel_size/2));
-        assert ((bias_size==0)||(out_channel==bias_size));
+        dlrCheck (in_channel>0);
+        dlrCheck (out_channel>0);
+        dlrCheck (out_size==(((in_size-kernel_size+2*padding)/stride)+1));
+        dlrCheck ((kernel_size%2)==1);
+        dlrCheck (stride>0);
+        dlrCheck (padding>=0);
+        dlrCheck (padding<=(kernel_size/2));
+        dlrCheck ((bias_size==0)||(out_channel==bias_size));
     }
     #undef QuoteMacro
     #undef QuoteIdent
     #endif
 
+    #if defined(__SYNTHESIS__)
     #define UpperPadding(CURSOR, PADDING)          (CURSOR <   PADDING)
     #define LowerPadding(CURSOR, PADDING, IN_SIZE) (CURSOR >= (PADDING+IN_SIZE))
     #define LeftPadding( CURSOR, PADDING)          (CURSOR <   PADDING)
@@ -139,6 +171,74 @@ void Convolution2d
     #undef LeftPadding
     #undef RightPadding
     #undef IsPadding
+    #else // !defined(__SYNTHESIS__)
+    // Only the border ring of outputs touches padding. The kernel window of
+    // outputs in rows and columns of [t_lo, t_hi) lies inside of input and
+    // goes over contiguous input rows without checking padding, while
+    // the window of the others is clipped to input by Convolution2dWindow().
+    // Outputs of a filter are accumulated over channels in 'ACCUM', which is
+    // out_data itself unless TYPE is a storage-only type such as 'Half'.
+    typedef typename Accumulator<TYPE>::type ACCUM;
+    const bool t_direct = std::is_same<ACCUM, TYPE>::value;
+    const uint32_t t_in_area  = (uint32_t)in_size*in_size;
+    const uint32_t t_out_area = (uint32_t)out_size*out_size;
+    const uint32_t t_ker_area = (uint32_t)kernel_size*kernel_size;
+    uint16_t t_hi = ((in_size+padding)>=kernel_size) ? (in_size+padding-kernel_size)/stride+1 : 0;
+    if (t_hi>out_size) t_hi = out_size;
+    uint16_t t_lo = (padding+stride-1)/stride;
+    if (t_lo>t_hi) t_lo = t_hi;
+
+    uint16_t ch, f, g, k;
+    uint8_t  i, j;
+    uint32_t n;
+
+    #if defined(_OPENMP)
+    #pragma omp parallel for private(ch, g, k, i, j, n)
+    #endif
+    for (f=0; f<out_channel; ++f) {
+        const ACCUM B = (bias_size==0) ? (ACCUM)0 : (ACCUM)bias[f];
+        std::vector<ACCUM> t_accum(t_direct ? 0 : t_out_area);
+        ACCUM *pZ = t_direct ? (ACCUM*)(out_data+(uint32_t)f*t_out_area) : t_accum.data();
+        for (n=0; n<t_out_area; ++n) pZ[n] = B;
+        for (ch=0; ch<in_channel; ++ch) {
+            const TYPE *pX = in_data+(uint32_t)ch*t_in_area;
+            const TYPE *pW = kernel+((uint32_t)f*in_channel+ch)*t_ker_area;
+            for (g=0; g<out_size; ++g) {
+                const int32_t y0 = (int32_t)g*stride-padding;
+                ACCUM *pZg = pZ+(uint32_t)g*out_size;
+                if ((g<t_lo)||(g>=t_hi)) { // border row
+                    for (k=0; k<out_size; ++k)
+                        pZg[k] += Convolution2dWindow<TYPE>(pX, pW, y0, (int32_t)k*stride-padding, in_size, kernel_size);
+                    continue;
+                }
+                for (k=0; k<t_lo; ++k) // left border
+                    pZg[k] += Convolution2dWindow<TYPE>(pX, pW, y0, (int32_t)k*stride-padding, in_size, kernel_size);
+                // interior of stride 1 goes vector kernel for float
+                if ((stride!=1)||!SimdConvRow(pZg+t_lo, pX+(uint32_t)y0*in_size+(t_lo-padding), pW, t_hi-t_lo, in_size, kernel_size)) {
+                    for (k=t_lo; k<t_hi; ++k) { // interior
+                        const TYPE *pXw = pX+(uint32_t)y0*in_size+((uint32_t)k*stride-padding);
+                        const TYPE *pWw = pW;
+                        ACCUM accum=0;
+                        for (i=0; i<kernel_size; ++i) {
+                            for (j=0; j<kernel_size; ++j) {
+                                accum += pXw[j]*pWw[j];
+                            }
+                            pXw += in_size;
+                            pWw += kernel_size;
+                        }
+                        pZg[k] += accum;
+                    }
+                }
+                for (k=t_hi; k<out_size; ++k) // right border
+                    pZg[k] += Convolution2dWindow<TYPE>(pX, pW, y0, (int32_t)k*stride-padding, in_size, kernel_size);
+            } // for (g=0
+        } // for (ch=0
+        if (!t_direct) {
+            TYPE *pZo = out_data+(uint32_t)f*t_out_area;
+            for (n=0; n<t_out_area; ++n) pZo[n] = (TYPE)pZ[n];
+        }
+    } // for (f=0
+    #endif // !defined(__SYNTHESIS__)
 }
 
 //  out_data[out_channel][out_size][out_size]
@@ -146,10 +246,233 @@ void Convolution2d
 //  kernel[out_channel][in_channel][kernel_size][kernel_size] # note the order of dimensions
 //  bias[out_channel]
 
+// minibatch version: in_data and out_data have leading minibatch dimension
+template<class TYPE=float>
+void Convolution2dBatch
+(           TYPE     *out_data    // minibatch x out_channel x out_size x out_size
+    , const TYPE     *in_data     // minibatch x in_channel x in_size x in_size
+    , const TYPE     *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const TYPE     *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding=0
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+    #endif
+)
+{
+    const uint32_t t_out_step=(uint32_t)out_channel*out_size*out_size;
+    const uint32_t t_in_step =(uint32_t)in_channel*in_size*in_size;
+    TYPE       *pZ = out_data;
+    const TYPE *pX = in_data;
+    uint16_t mb;
+
+    for (mb=0; mb<minibatch; ++mb) {
+        Convolution2d<TYPE>
+        (     pZ
+            , pX
+            , kernel
+            , bias
+            , out_size
+            , in_size
+            , kernel_size
+            , bias_size
+            , in_channel
+            , out_channel
+            , stride
+            , padding
+            #if !defined(__SYNTHESIS__)
+            , rigor
+            , verbose
+            #endif
+        );
+        pZ += t_out_step;
+        pX += t_in_step;
+    }
+}
+
+#if !defined(__SYNTHESIS__)
+// int8 x int8 --> int32 version, where the accumulator of each output channel
+// is requantized to int8 by 'multiplier' and 'shift' (see dlr_quant.hpp).
+// Padding stands for real zero, i.e., 'in_zero_point', which adds nothing.
+//  out_data[out_channel][out_size][out_size]   int8 of out_scale and out_zero_point
+//  in_data[in_channel][in_size][in_size]       int8 of in_scale and in_zero_point
+//  kernel[out_channel][in_channel][kernel_size][kernel_size] int8 of kernel_scale[out_channel]
+//  bias[out_channel]                           int32 of in_scale*kernel_scale[out_channel]
+inline void Convolution2dInt8
+(           int8_t   *out_data      // out_channel x out_size x out_size
+    , const int8_t   *in_data       // in_channel x in_size x in_size
+    , const int8_t   *kernel        // out_channel x in_channel x kernel_size x kernel_size
+    , const int32_t  *bias          // out_channel
+    , const int32_t  *multiplier    // out_channel, Q31 of requantization
+    , const int8_t   *shift         // out_channel, shift of requantization
+    , const int32_t   in_zero_point
+    , const int32_t   out_zero_point
+    , const uint16_t  out_size      // only for square matrix
+    , const uint16_t  in_size       // only for square matrix
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  bias_size     // out_channel
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding=0
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+)
+{
+    if (verbose) {
+        dlrInfo("out_size   =%d\n", out_size    );
+        dlrInfo("in_size    =%d\n", in_size     );
+        dlrInfo("kernel_size=%d\n", kernel_size );
+        dlrInfo("bias_size  =%d\n", bias_size   );
+        dlrInfo("in_channel =%d\n", in_channel  );
+        dlrInfo("out_channel=%d\n", out_channel );
+        dlrInfo("stride     =%d\n", stride      );
+        dlrInfo("padding    =%d\n", padding     );
+        dlrInfo("zero_point =%d %d\n", in_zero_point, out_zero_point);
+        fflush(stderr); fflush(stdout);
+    }
+    if (rigor) {
+        dlrCheck (in_channel>0);
+        dlrCheck (out_channel>0);
+        dlrCheck (out_size==(((in_size-kernel_size+2*padding)/stride)+1));
+        dlrCheck ((kernel_size%2)==1);
+        dlrCheck (stride>0);
+        dlrCheck (padding<=(kernel_size/2));
+        dlrCheck ((bias_size==0)||(out_channel==bias_size));
+        dlrCheck ((in_zero_point>=DLR_INT8_MIN)&&(in_zero_point<=DLR_INT8_MAX));
+        dlrCheck ((out_zero_point>=DLR_INT8_MIN)&&(out_zero_point<=DLR_INT8_MAX));
+        for (uint16_t f=0; f<out_channel; ++f) {
+            dlrCheck ((multiplier[f]>=0)&&(shift[f]>=-30)&&(shift[f]<=32));
+        }
+    }
+
+    // Windows of input less in_zero_point go rows of int16 'im2col', where
+    // padding is 0, i.e., real zero. Each output is dot of its row and
+    // a kernel, which is taken by blocks of kernels staying in cache.
+    // Rows and kernels are padded by 0 to multiple of 16 for vector kernels.
+    const uint32_t t_in_area  = (uint32_t)in_size*in_size;
+    const uint32_t t_out_area = (uint32_t)out_size*out_size;
+    const uint32_t t_ker_area = (uint32_t)kernel_size*kernel_size;
+    const uint32_t t_depth    = (uint32_t)in_channel*t_ker_area;
+    const uint32_t t_ld       = (t_depth+15)&~15u;
+    std::vector<int16_t> t_col((size_t)t_out_area*t_ld);
+    std::vector<int8_t>  t_ker((size_t)out_channel*t_ld, 0);
+    for (uint32_t f=0; f<out_channel; ++f)
+        for (uint32_t d=0; d<t_depth; ++d) t_ker[(size_t)f*t_ld+d] = kernel[(size_t)f*t_depth+d];
+    int32_t p; // signed for OpenMP
+
+    #if defined(_OPENMP)
+    #pragma omp parallel for
+    #endif
+    for (p=0; p<(int32_t)t_out_area; ++p) {
+        const int32_t y0 = (int32_t)(p/out_size)*stride-padding;
+        const int32_t x0 = (int32_t)(p%out_size)*stride-padding;
+        int16_t *pC = &t_col[(size_t)p*t_ld];
+        for (uint32_t d=t_depth; d<t_ld; ++d) pC[d] = 0;
+        for (uint16_t ch=0; ch<in_channel; ++ch) {
+            const int8_t *pX = in_data+(uint32_t)ch*t_in_area;
+            for (int32_t i=y0; i<y0+kernel_size; ++i) {
+                for (int32_t j=x0; j<x0+kernel_size; ++j) {
+                    *pC++ = ((i<0)||(i>=in_size)||(j<0)||(j>=in_size)) ? 0
+                          : (int16_t)(pX[(uint32_t)i*in_size+j]-in_zero_point);
+                }
+            }
+        }
+    }
+
+    uint32_t t_block = DLR_QUANT_BLOCK/t_ld;
+    if (t_block<1) t_block = 1;
+    for (uint32_t f0=0; f0<out_channel; f0+=t_block) {
+        const uint32_t f1 = ((f0+t_block)<out_channel) ? (f0+t_block) : out_channel;
+        #if defined(_OPENMP)
+        #pragma omp parallel for
+        #endif
+        for (p=0; p<(int32_t)t_out_area; ++p) {
+            const int16_t *pC = &t_col[(size_t)p*t_ld];
+            for (uint32_t f=f0; f<f1; ++f) {
+                const int32_t accum = SimdDotInt8(pC, &t_ker[(size_t)f*t_ld], t_ld)
+                                    + ((bias_size==0) ? 0 : bias[f]);
+                out_data[f*t_out_area+p] = Requantize(accum, multiplier[f], shift[f], out_zero_point);
+            }
+        }
+    }
+}
+
+// minibatch version: in_data and out_data have leading minibatch dimension
+inline void Convolution2dBatchInt8
+(           int8_t   *out_data      // minibatch x out_channel x out_size x out_size
+    , const int8_t   *in_data       // minibatch x in_channel x in_size x in_size
+    , const int8_t   *kernel        // out_channel x in_channel x kernel_size x kernel_size
+    , const int32_t  *bias          // out_channel
+    , const int32_t  *multiplier    // out_channel
+    , const int8_t   *shift         // out_channel
+    , const int32_t   in_zero_point
+    , const int32_t   out_zero_point
+    , const uint16_t  out_size      // only for square matrix
+    , const uint16_t  in_size       // only for square matrix
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  bias_size     // out_channel
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const uint16_t  minibatch     // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding=0
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+)
+{
+    const uint32_t t_out_step=(uint32_t)out_channel*out_size*out_size;
+    const uint32_t t_in_step =(uint32_t)in_channel*in_size*in_size;
+    int8_t       *pZ = out_data;
+    const int8_t *pX = in_data;
+    uint16_t mb;
+
+    for (mb=0; mb<minibatch; ++mb) {
+        Convolution2dInt8
+        (     pZ
+            , pX
+            , kernel
+            , bias
+            , multiplier
+            , shift
+            , in_zero_point
+            , out_zero_point
+            , out_size
+            , in_size
+            , kernel_size
+            , bias_size
+            , in_channel
+            , out_channel
+            , stride
+            , padding
+            , rigor
+            , verbose
+        );
+        pZ += t_out_step;
+        pX += t_in_step;
+    }
+}
+#endif // !defined(__SYNTHESIS__)
+
 } // namespace dlr
 /*
  * Revision history
  *
+ * 2026.10.18: sum of products goes 'Accumulator<TYPE>', i.e., float for 'Half' and 'BFloat16'.
+ * 2026.10.18: 'Convolution2dInt8' and 'Convolution2dBatchInt8' added for int8 with requantization.
+ * 2026.10.18: SIMD interior of stride 1 for float (dlr_simd.hpp).
+ * 2026.10.18: interior and border of padding split (reference kept for __SYNTHESIS__).
+ * 2026.10.18: 'dlrCheck()' in place of 'assert()' for rigor checks.
+ * 2026.10.18: OpenMP for 'f' loop when built with OpenMP.
+ * 2026.10.18: 'Convolution2dBatch' added for minibatch.
  * 2020.11.12: '*pZ++ = B' HLS pointer arithmetic bug-fixed
  * 2020.10.23: 't_current' size bug-fixed by using 't_width' and 't_height'.
  * 2020.10.01: C++ template version by Ando Ki.
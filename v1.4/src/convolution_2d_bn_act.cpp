@@ -0,0 +1,609 @@
+#include "convolution_2d_bn_act.hpp"
+
+extern "C" {
+
+int Convolution2dBnFoldFloat
+(           float    *kernel_folded // out_channel x in_channel x kernel_size x kernel_size
+    ,       float    *bias_folded   // out_channel
+    , const float    *kernel        // out_channel x in_channel x kernel_size x kernel_size
+    , const float    *bias          // NULL or out_channel
+    , const float    *running_mean  // out_channel [mean]
+    , const float    *running_var   // out_channel [variance, not deviation]
+    , const float    *scale         // NULL or out_channel [gamma: scaling factor]
+    , const float    *shift         // NULL or out_channel [beta: shift factor]
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  bias_size     // 0 or out_channel
+    , const uint16_t  scale_size    // 0 or out_channel
+    , const uint16_t  shift_size    // 0 or out_channel
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const float     epsilon       // default: 1E-5
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dBnFold<float>
+    (     kernel_folded
+        , bias_folded
+        , kernel
+        , bias
+        , running_mean
+        , running_var
+        , scale
+        , shift
+        , kernel_size
+        , bias_size
+        , scale_size
+        , shift_size
+        , in_channel
+        , out_channel
+        , epsilon
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dBnFoldDouble
+(           double   *kernel_folded // out_channel x in_channel x kernel_size x kernel_size
+    ,       double   *bias_folded   // out_channel
+    , const double   *kernel        // out_channel x in_channel x kernel_size x kernel_size
+    , const double   *bias          // NULL or out_channel
+    , const double   *running_mean  // out_channel [mean]
+    , const double   *running_var   // out_channel [variance, not deviation]
+    , const double   *scale         // NULL or out_channel [gamma: scaling factor]
+    , const double   *shift         // NULL or out_channel [beta: shift factor]
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  bias_size     // 0 or out_channel
+    , const uint16_t  scale_size    // 0 or out_channel
+    , const uint16_t  shift_size    // 0 or out_channel
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const float     epsilon       // default: 1E-5
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dBnFold<double>
+    (     kernel_folded
+        , bias_folded
+        , kernel
+        , bias
+        , running_mean
+        , running_var
+        , scale
+        , shift
+        , kernel_size
+        , bias_size
+        , scale_size
+        , shift_size
+        , in_channel
+        , out_channel
+        , epsilon
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dBnActFloat
+(           float    *out_data      // out_channel x out_size x out_size
+    , const float    *in_data       // in_channel x in_size x in_size
+    , const float    *kernel        // out_channel x in_channel x kernel_size x kernel_size (folded)
+    , const float    *bias          // out_channel (folded)
+    , const uint16_t  out_size      // only for square matrix
+    , const uint16_t  in_size       // only for square matrix
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const float     negative_slope // only for LeakyReLu
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dBnAct<float, 0, 0>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , in_channel
+        , out_channel
+        , stride
+        , padding
+        , negative_slope
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dBnActDouble
+(           double   *out_data      // out_channel x out_size x out_size
+    , const double   *in_data       // in_channel x in_size x in_size
+    , const double   *kernel        // out_channel x in_channel x kernel_size x kernel_size (folded)
+    , const double   *bias          // out_channel (folded)
+    , const uint16_t  out_size      // only for square matrix
+    , const uint16_t  in_size       // only for square matrix
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const float     negative_slope // only for LeakyReLu
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dBnAct<double, 0, 0>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , in_channel
+        , out_channel
+        , stride
+        , padding
+        , negative_slope
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dBnActFloatReLu
+(           float    *out_data      // out_channel x out_size x out_size
+    , const float    *in_data       // in_channel x in_size x in_size
+    , const float    *kernel        // out_channel x in_channel x kernel_size x kernel_size (folded)
+    , const float    *bias          // out_channel (folded)
+    , const uint16_t  out_size      // only for square matrix
+    , const uint16_t  in_size       // only for square matrix
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const float     negative_slope // only for LeakyReLu
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dBnAct<float, 1, 0>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , in_channel
+        , out_channel
+        , stride
+        , padding
+        , negative_slope
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dBnActDoubleReLu
+(           double   *out_data      // out_channel x out_size x out_size
+    , const double   *in_data       // in_channel x in_size x in_size
+    , const double   *kernel        // out_channel x in_channel x kernel_size x kernel_size (folded)
+    , const double   *bias          // out_channel (folded)
+    , const uint16_t  out_size      // only for square matrix
+    , const uint16_t  in_size       // only for square matrix
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const float     negative_slope // only for LeakyReLu
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dBnAct<double, 1, 0>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , in_channel
+        , out_channel
+        , stride
+        , padding
+        , negative_slope
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dBnActFloatLeakyReLu
+(           float    *out_data      // out_channel x out_size x out_size
+    , const float    *in_data       // in_channel x in_size x in_size
+    , const float    *kernel        // out_channel x in_channel x kernel_size x kernel_size (folded)
+    , const float    *bias          // out_channel (folded)
+    , const uint16_t  out_size      // only for square matrix
+    , const uint16_t  in_size       // only for square matrix
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const float     negative_slope // only for LeakyReLu
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dBnAct<float, 0, 1>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , in_channel
+        , out_channel
+        , stride
+        , padding
+        , negative_slope
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dBnActDoubleLeakyReLu
+(           double   *out_data      // out_channel x out_size x out_size
+    , const double   *in_data       // in_channel x in_size x in_size
+    , const double   *kernel        // out_channel x in_channel x kernel_size x kernel_size (folded)
+    , const double   *bias          // out_channel (folded)
+    , const uint16_t  out_size      // only for square matrix
+    , const uint16_t  in_size       // only for square matrix
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const float     negative_slope // only for LeakyReLu
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dBnAct<double, 0, 1>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , in_channel
+        , out_channel
+        , stride
+        , padding
+        , negative_slope
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dBnActBatchFloat
+(           float    *out_data      // minibatch x out_channel x out_size x out_size
+    , const float    *in_data       // minibatch x in_channel x in_size x in_size
+    , const float    *kernel        // out_channel x in_channel x kernel_size x kernel_size (folded)
+    , const float    *bias          // out_channel (folded)
+    , const uint16_t  out_size      // only for square matrix
+    , const uint16_t  in_size       // only for square matrix
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const uint16_t  minibatch     // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const float     negative_slope // only for LeakyReLu
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dBnActBatch<float, 0, 0>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        , negative_slope
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dBnActBatchDouble
+(           double   *out_data      // minibatch x out_channel x out_size x out_size
+    , const double   *in_data       // minibatch x in_channel x in_size x in_size
+    , const double   *kernel        // out_channel x in_channel x kernel_size x kernel_size (folded)
+    , const double   *bias          // out_channel (folded)
+    , const uint16_t  out_size      // only for square matrix
+    , const uint16_t  in_size       // only for square matrix
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const uint16_t  minibatch     // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const float     negative_slope // only for LeakyReLu
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dBnActBatch<double, 0, 0>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        , negative_slope
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dBnActBatchFloatReLu
+(           float    *out_data      // minibatch x out_channel x out_size x out_size
+    , const float    *in_data       // minibatch x in_channel x in_size x in_size
+    , const float    *kernel        // out_channel x in_channel x kernel_size x kernel_size (folded)
+    , const float    *bias          // out_channel (folded)
+    , const uint16_t  out_size      // only for square matrix
+    , const uint16_t  in_size       // only for square matrix
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const uint16_t  minibatch     // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const float     negative_slope // only for LeakyReLu
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dBnActBatch<float, 1, 0>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        , negative_slope
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dBnActBatchDoubleReLu
+(           double   *out_data      // minibatch x out_channel x out_size x out_size
+    , const double   *in_data       // minibatch x in_channel x in_size x in_size
+    , const double   *kernel        // out_channel x in_channel x kernel_size x kernel_size (folded)
+    , const double   *bias          // out_channel (folded)
+    , const uint16_t  out_size      // only for square matrix
+    , const uint16_t  in_size       // only for square matrix
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const uint16_t  minibatch     // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const float     negative_slope // only for LeakyReLu
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dBnActBatch<double, 1, 0>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        , negative_slope
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dBnActBatchFloatLeakyReLu
+(           float    *out_data      // minibatch x out_channel x out_size x out_size
+    , const float    *in_data       // minibatch x in_channel x in_size x in_size
+    , const float    *kernel        // out_channel x in_channel x kernel_size x kernel_size (folded)
+    , const float    *bias          // out_channel (folded)
+    , const uint16_t  out_size      // only for square matrix
+    , const uint16_t  in_size       // only for square matrix
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const uint16_t  minibatch     // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const float     negative_slope // only for LeakyReLu
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dBnActBatch<float, 0, 1>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        , negative_slope
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dBnActBatchDoubleLeakyReLu
+(           double   *out_data      // minibatch x out_channel x out_size x out_size
+    , const double   *in_data       // minibatch x in_channel x in_size x in_size
+    , const double   *kernel        // out_channel x in_channel x kernel_size x kernel_size (folded)
+    , const double   *bias          // out_channel (folded)
+    , const uint16_t  out_size      // only for square matrix
+    , const uint16_t  in_size       // only for square matrix
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const uint16_t  minibatch     // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const float     negative_slope // only for LeakyReLu
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dBnActBatch<double, 0, 1>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        , negative_slope
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+} // extern "C"
+
+/*
+ * Revision history
+ *
+ * 2026.10.18: Started.
+ */
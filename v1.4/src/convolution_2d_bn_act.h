@@ -0,0 +1,305 @@
+#pragma once
+#include <stdint.h>
+
+// Convolution2d fused with batch normalization and activation
+// - kernel and bias are folded by Convolution2dBnFold<Float|Double>() once
+// - Convolution2dBnAct<Float|Double>[ReLu|LeakyReLu]() writes each output once
+// - not for integer since folding has fraction
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#define Convolution2dBnFold Convolution2dBnFoldFloat
+#define Convolution2dBnAct Convolution2dBnActFloat
+#define Convolution2dBnActReLu Convolution2dBnActFloatReLu
+#define Convolution2dBnActLeakyReLu Convolution2dBnActFloatLeakyReLu
+#define Convolution2dBnActBatch Convolution2dBnActBatchFloat
+#define Convolution2dBnActBatchReLu Convolution2dBnActBatchFloatReLu
+#define Convolution2dBnActBatchLeakyReLu Convolution2dBnActBatchFloatLeakyReLu
+
+extern int Convolution2dBnFoldFloat
+(           float    *kernel_folded // out_channel x in_channel x kernel_size x kernel_size
+    ,       float    *bias_folded   // out_channel
+    , const float    *kernel        // out_channel x in_channel x kernel_size x kernel_size
+    , const float    *bias          // NULL or out_channel
+    , const float    *running_mean  // out_channel [mean]
+    , const float    *running_var   // out_channel [variance, not deviation]
+    , const float    *scale         // NULL or out_channel [gamma: scaling factor]
+    , const float    *shift         // NULL or out_channel [beta: shift factor]
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  bias_size     // 0 or out_channel
+    , const uint16_t  scale_size    // 0 or out_channel
+    , const uint16_t  shift_size    // 0 or out_channel
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const float     epsilon       // default: 1E-5
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+    #endif
+);
+
+extern int Convolution2dBnFoldDouble
+(           double   *kernel_folded // out_channel x in_channel x kernel_size x kernel_size
+    ,       double   *bias_folded   // out_channel
+    , const double   *kernel        // out_channel x in_channel x kernel_size x kernel_size
+    , const double   *bias          // NULL or out_channel
+    , const double   *running_mean  // out_channel [mean]
+    , const double   *running_var   // out_channel [variance, not deviation]
+    , const double   *scale         // NULL or out_channel [gamma: scaling factor]
+    , const double   *shift         // NULL or out_channel [beta: shift factor]
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  bias_size     // 0 or out_channel
+    , const uint16_t  scale_size    // 0 or out_channel
+    , const uint16_t  shift_size    // 0 or out_channel
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const float     epsilon       // default: 1E-5
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+    #endif
+);
+
+extern int Convolution2dBnActFloat
+(           float    *out_data      // out_channel x out_size x out_size
+    , const float    *in_data       // in_channel x in_size x in_size
+    , const float    *kernel        // out_channel x in_channel x kernel_size x kernel_size (folded)
+    , const float    *bias          // out_channel (folded)
+    , const uint16_t  out_size      // only for square matrix
+    , const uint16_t  in_size       // only for square matrix
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const float     negative_slope // only for LeakyReLu
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+    #endif
+);
+
+extern int Convolution2dBnActDouble
+(           double   *out_data      // out_channel x out_size x out_size
+    , const double   *in_data       // in_channel x in_size x in_size
+    , const double   *kernel        // out_channel x in_channel x kernel_size x kernel_size (folded)
+    , const double   *bias          // out_channel (folded)
+    , const uint16_t  out_size      // only for square matrix
+    , const uint16_t  in_size       // only for square matrix
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const float     negative_slope // only for LeakyReLu
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+    #endif
+);
+
+extern int Convolution2dBnActFloatReLu
+(           float    *out_data      // out_channel x out_size x out_size
+    , const float    *in_data       // in_channel x in_size x in_size
+    , const float    *kernel        // out_channel x in_channel x kernel_size x kernel_size (folded)
+    , const float    *bias          // out_channel (folded)
+    , const uint16_t  out_size      // only for square matrix
+    , const uint16_t  in_size       // only for square matrix
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const float     negative_slope // only for LeakyReLu
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+    #endif
+);
+
+extern int Convolution2dBnActDoubleReLu
+(           double   *out_data      // out_channel x out_size x out_size
+    , const double   *in_data       // in_channel x in_size x in_size
+    , const double   *kernel        // out_channel x in_channel x kernel_size x kernel_size (folded)
+    , const double   *bias          // out_channel (folded)
+    , const uint16_t  out_size      // only for square matrix
+    , const uint16_t  in_size       // only for square matrix
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const float     negative_slope // only for LeakyReLu
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+    #endif
+);
+
+extern int Convolution2dBnActFloatLeakyReLu
+(           float    *out_data      // out_channel x out_size x out_size
+    , const float    *in_data       // in_channel x in_size x in_size
+    , const float    *kernel        // out_channel x in_channel x kernel_size x kernel_size (folded)
+    , const float    *bias          // out_channel (folded)
+    , const uint16_t  out_size      // only for square matrix
+    , const uint16_t  in_size       // only for square matrix
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const float     negative_slope // only for LeakyReLu
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+    #endif
+);
+
+extern int Convolution2dBnActDoubleLeakyReLu
+(           double   *out_data      // out_channel x out_size x out_size
+    , const double   *in_data       // in_channel x in_size x in_size
+    , const double   *kernel        // out_channel x in_channel x kernel_size x kernel_size (folded)
+    , const double   *bias          // out_channel (folded)
+    , const uint16_t  out_size      // only for square matrix
+    , const uint16_t  in_size       // only for square matrix
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const float     negative_slope // only for LeakyReLu
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+    #endif
+);
+
+extern int Convolution2dBnActBatchFloat
+(           float    *out_data      // minibatch x out_channel x out_size x out_size
+    , const float    *in_data       // minibatch x in_channel x in_size x in_size
+    , const float    *kernel        // out_channel x in_channel x kernel_size x kernel_size (folded)
+    , const float    *bias          // out_channel (folded)
+    , const uint16_t  out_size      // only for square matrix
+    , const uint16_t  in_size       // only for square matrix
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const uint16_t  minibatch     // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const float     negative_slope // only for LeakyReLu
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+    #endif
+);
+
+extern int Convolution2dBnActBatchDouble
+(           double   *out_data      // minibatch x out_channel x out_size x out_size
+    , const double   *in_data       // minibatch x in_channel x in_size x in_size
+    , const double   *kernel        // out_channel x in_channel x kernel_size x kernel_size (folded)
+    , const double   *bias          // out_channel (folded)
+    , const uint16_t  out_size      // only for square matrix
+    , const uint16_t  in_size       // only for square matrix
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const uint16_t  minibatch     // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const float     negative_slope // only for LeakyReLu
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+    #endif
+);
+
+extern int Convolution2dBnActBatchFloatReLu
+(           float    *out_data      // minibatch x out_channel x out_size x out_size
+    , const float    *in_data       // minibatch x in_channel x in_size x in_size
+    , const float    *kernel        // out_channel x in_channel x kernel_size x kernel_size (folded)
+    , const float    *bias          // out_channel (folded)
+    , const uint16_t  out_size      // only for square matrix
+    , const uint16_t  in_size       // only for square matrix
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const uint16_t  minibatch     // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const float     negative_slope // only for LeakyReLu
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+    #endif
+);
+
+extern int Convolution2dBnActBatchDoubleReLu
+(           double   *out_data      // minibatch x out_channel x out_size x out_size
+    , const double   *in_data       // minibatch x in_channel x in_size x in_size
+    , const double   *kernel        // out_channel x in_channel x kernel_size x kernel_size (folded)
+    , const double   *bias          // out_channel (folded)
+    , const uint16_t  out_size      // only for square matrix
+    , const uint16_t  in_size       // only for square matrix
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const uint16_t  minibatch     // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const float     negative_slope // only for LeakyReLu
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+    #endif
+);
+
+extern int Convolution2dBnActBatchFloatLeakyReLu
+(           float    *out_data      // minibatch x out_channel x out_size x out_size
+    , const float    *in_data       // minibatch x in_channel x in_size x in_size
+    , const float    *kernel        // out_channel x in_channel x kernel_size x kernel_size (folded)
+    , const float    *bias          // out_channel (folded)
+    , const uint16_t  out_size      // only for square matrix
+    , const uint16_t  in_size       // only for square matrix
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const uint16_t  minibatch     // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const float     negative_slope // only for LeakyReLu
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+    #endif
+);
+
+extern int Convolution2dBnActBatchDoubleLeakyReLu
+(           double   *out_data      // minibatch x out_channel x out_size x out_size
+    , const double   *in_data       // minibatch x in_channel x in_size x in_size
+    , const double   *kernel        // out_channel x in_channel x kernel_size x kernel_size (folded)
+    , const double   *bias          // out_channel (folded)
+    , const uint16_t  out_size      // only for square matrix
+    , const uint16_t  in_size       // only for square matrix
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const uint16_t  minibatch     // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const float     negative_slope // only for LeakyReLu
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+    #endif
+);
+
+#ifdef __cplusplus
+}
+#endif
+/*
+ * Revision history
+ *
+ * 2026.10.18: Started.
+ */
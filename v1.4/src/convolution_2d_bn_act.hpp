@@ -0,0 +1,239 @@
+#pragma once
+/*
+ * Copyright (c) 2019-2020 by Future Design Systems.
+ * All right reserved.
+ * http://www.future-ds.com
+ *
+ * @file convolution_2d_bn_act.hpp
+ * @brief This file contains 2 dimensional convolution fused with
+ *        batch normalization and activation.
+ * @author FDS
+ * @date Oct. 18, 2026
+ */
+#include <stdint.h>
+#include <math.h>
+#if !defined(__SYNTHESIS__)
+#include <stdio.h>
+#include "dlr_common.h"
+#endif
+
+namespace dlr { // deep learning routines
+
+// Folds batch normalization into kernel and bias of convolution,
+// which is done once when the model is loaded.
+//   kernel_folded[f] = kernel[f] * S / sqrt(var+epsilon)
+//   bias_folded[f]   = (bias[f]-mean) * S / sqrt(var+epsilon) + B
+// where S and B are scale (gamma) and shift (beta) of batch normalization.
+template<class TYPE=float>
+void Convolution2dBnFold
+(           TYPE     *kernel_folded // out_channel x in_channel x kernel_size x kernel_size
+    ,       TYPE     *bias_folded   // out_channel
+    , const TYPE     *kernel        // out_channel x in_channel x kernel_size x kernel_size
+    , const TYPE     *bias          // NULL or out_channel
+    , const TYPE     *running_mean  // out_channel [mean]
+    , const TYPE     *running_var   // out_channel [variance, not deviation]
+    , const TYPE     *scale         // NULL or out_channel [gamma: scaling factor]
+    , const TYPE     *shift         // NULL or out_channel [beta: shift factor]
+    , const uint8_t   kernel_size   // only for square matrix
+    , const uint16_t  bias_size     // 0 or out_channel
+    , const uint16_t  scale_size    // 0 or out_channel
+    , const uint16_t  shift_size    // 0 or out_channel
+    , const uint16_t  in_channel    // number of input channels
+    , const uint16_t  out_channel   // number of filters (kernels)
+    , const float     epsilon=1E-5  // default: 1E-5 (noise for regularization)
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+    #endif
+)
+{
+    #if !defined(__SYNTHESIS__)
+    if (verbose) {
+        dlrInfo("kernel_size=%d\n", kernel_size );
+        dlrInfo("bias_size  =%d\n", bias_size   );
+        dlrInfo("scale_size =%d\n", scale_size  );
+        dlrInfo("shift_size =%d\n", shift_size  );
+        dlrInfo("in_channel =%d\n", in_channel  );
+        dlrInfo("out_channel=%d\n", out_channel );
+        dlrInfo("epsilon    =%f\n", epsilon     );
+        fflush(stderr); fflush(stdout);
+    }
+    if (rigor) {
+        dlrCheck (in_channel>0);
+        dlrCheck (out_channel>0);
+        dlrCheck ((bias_size==0)||(out_channel==bias_size));
+        dlrCheck ((scale_size==0)||(out_channel==scale_size));
+        dlrCheck ((shift_size==0)||(out_channel==shift_size));
+    }
+    #endif
+
+    const uint32_t t_size = (uint32_t)in_channel*kernel_size*kernel_size; // kernel of a filter
+    uint16_t f;
+    uint32_t n;
+
+    for (f=0; f<out_channel; ++f) {
+        TYPE S = (scale_size==0) ? (TYPE)1 : scale[f];
+        TYPE B = (shift_size==0) ? (TYPE)0 : shift[f];
+        TYPE b = (bias_size==0)  ? (TYPE)0 : bias[f];
+        TYPE a = (TYPE)(S/sqrt(running_var[f]+epsilon));
+        for (n=0; n<t_size; ++n) {
+            kernel_folded[f*t_size+n] = kernel[f*t_size+n]*a;
+        }
+        bias_folded[f] = (b-running_mean[f])*a+B;
+    }
+}
+
+// Same results as Convolution2d() followed by activation, where kernel and bias
+// are folded by Convolution2dBnFold(). Each output is accumulated over all input
+// channels and written once after bias and activation are applied.
+template< class TYPE=float
+        , int ReLu=0
+        , int LeakyReLu=0
+        >
+void Convolution2dBnAct
+(           TYPE     *out_data       // out_channel x out_size x out_size
+    , const TYPE     *in_data        // in_channel x in_size x in_size
+    , const TYPE     *kernel         // out_channel x in_channel x kernel_size x kernel_size (folded)
+    , const TYPE     *bias           // out_channel (folded)
+    , const uint16_t  out_size       // only for square matrix
+    , const uint16_t  in_size        // only for square matrix
+    , const uint8_t   kernel_size    // only for square matrix
+    , const uint16_t  in_channel     // number of input channels
+    , const uint16_t  out_channel    // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding=0
+    , const float     negative_slope=0.1 // only for LeakyReLu
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+    #endif
+)
+{
+    #if !defined(__SYNTHESIS__)
+    if (verbose) {
+        dlrInfo("out_size   =%d\n", out_size    );
+        dlrInfo("in_size    =%d\n", in_size     );
+        dlrInfo("kernel_size=%d\n", kernel_size );
+        dlrInfo("in_channel =%d\n", in_channel  );
+        dlrInfo("out_channel=%d\n", out_channel );
+        dlrInfo("stride     =%d\n", stride      );
+        dlrInfo("padding    =%d\n", padding     );
+        dlrInfo("activation =%s\n", ReLu ? "ReLu" : LeakyReLu ? "LeakyReLu" : "none");
+        fflush(stderr); fflush(stdout);
+    }
+    if (rigor) {
+        dlrCheck (in_channel>0);
+        dlrCheck (out_channel>0);
+        dlrCheck (out_size==(((in_size-kernel_size+2*padding)/stride)+1));
+        dlrCheck ((kernel_size%2)==1);
+        dlrCheck (stride>0);
+        dlrCheck (padding<=(kernel_size/2));
+    }
+    #endif
+
+    uint16_t f, ch, g, k;
+    uint8_t  i, j;
+    const uint32_t t_in_area  = (uint32_t)in_size*in_size;
+    const uint32_t t_ker_area = (uint32_t)kernel_size*kernel_size;
+
+    #if !defined(__SYNTHESIS__) && defined(_OPENMP)
+    #pragma omp parallel for private(ch, g, k, i, j)
+    #endif
+    for (f=0; f<out_channel; ++f) {
+        TYPE *pZ = out_data+(uint32_t)f*out_size*out_size;
+        const TYPE *pK = kernel+(uint32_t)f*in_channel*t_ker_area;
+        for (g=0; g<out_size; ++g) {
+            // rows of kernel inside of input
+            const int32_t y0 = (int32_t)g*stride-padding;
+            const uint8_t i0 = (y0<0) ? (uint8_t)(-y0) : 0;
+            const uint8_t i1 = ((y0+kernel_size)>in_size) ? (uint8_t)(in_size-y0) : kernel_size;
+            for (k=0; k<out_size; ++k) {
+                // columns of kernel inside of input
+                const int32_t x0 = (int32_t)k*stride-padding;
+                const uint8_t j0 = (x0<0) ? (uint8_t)(-x0) : 0;
+                const uint8_t j1 = ((x0+kernel_size)>in_size) ? (uint8_t)(in_size-x0) : kernel_size;
+                TYPE accum = bias[f];
+                for (ch=0; ch<in_channel; ++ch) {
+                    const TYPE *pX = in_data+ch*t_in_area;
+                    const TYPE *pW = pK+ch*t_ker_area;
+                    for (i=i0; i<i1; ++i) {
+                        for (j=j0; j<j1; ++j) {
+                            accum += pX[(y0+i)*in_size+(x0+j)]*pW[i*kernel_size+j];
+                        }
+                    }
+                }
+                if (ReLu) {
+                    *pZ = (accum<(TYPE)0) ? (TYPE)0 : accum;
+                } else if (LeakyReLu) {
+                    *pZ = (accum<(TYPE)0) ? (TYPE)(accum*negative_slope) : accum;
+                } else {
+                    *pZ = accum;
+                }
+                ++pZ;
+            } // for (k=0
+        } // for (g=0
+    } // for (f=0
+}
+
+// minibatch version: in_data and out_data have leading minibatch dimension
+template< class TYPE=float
+        , int ReLu=0
+        , int LeakyReLu=0
+        >
+void Convolution2dBnActBatch
+(           TYPE     *out_data       // minibatch x out_channel x out_size x out_size
+    , const TYPE     *in_data        // minibatch x in_channel x in_size x in_size
+    , const TYPE     *kernel         // out_channel x in_channel x kernel_size x kernel_size (folded)
+    , const TYPE     *bias           // out_channel (folded)
+    , const uint16_t  out_size       // only for square matrix
+    , const uint16_t  in_size        // only for square matrix
+    , const uint8_t   kernel_size    // only for square matrix
+    , const uint16_t  in_channel     // number of input channels
+    , const uint16_t  out_channel    // number of filters (kernels)
+    , const uint16_t  minibatch      // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding=0
+    , const float     negative_slope=0.1 // only for LeakyReLu
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+    #endif
+)
+{
+    const uint32_t t_out_step=(uint32_t)out_channel*out_size*out_size;
+    const uint32_t t_in_step =(uint32_t)in_channel*in_size*in_size;
+    TYPE       *pZ = out_data;
+    const TYPE *pX = in_data;
+    uint16_t mb;
+
+    for (mb=0; mb<minibatch; ++mb) {
+        Convolution2dBnAct<TYPE, ReLu, LeakyReLu>
+        (     pZ
+            , pX
+            , kernel
+            , bias
+            , out_size
+            , in_size
+            , kernel_size
+            , in_channel
+            , out_channel
+            , stride
+            , padding
+            , negative_slope
+            #if !defined(__SYNTHESIS__)
+            , rigor
+            , verbose
+            #endif
+        );
+        pZ += t_out_step;
+        pX += t_in_step;
+    }
+}
+
+} // namespace dlr
+/*
+ * Revision history
+ *
+ * 2026.10.18: 'dlrCheck()' in place of 'assert()' for rigor checks.
+ * 2026.10.18: Started.
+ */
@@ -0,0 +1,126 @@
+#pragma once
+#include <stdint.h>
+
+// software-only: im2col and blocked GEMM version of Convolution2d
+#if !defined(__SYNTHESIS__)
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#define Convolution2dFast Convolution2dFloatFast
+#define Convolution2dBatchFast Convolution2dBatchFloatFast
+
+extern int Convolution2dIntFast
+(           int      *out_data    // out_channel x out_size x out_size
+    , const int      *in_data     // in_channel x in_size x in_size
+    , const int      *kernel      // in_channel x out_channel x kernel_size x kernel_size
+    , const int      *bias        // bias per kernel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // number of biases, it should be the same as out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride      // stride default 1
+    , const uint8_t   padding     // padding default 0
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dFloatFast
+(           float    *out_data    // out_channel x out_size x out_size
+    , const float    *in_data     // in_channel x in_size x in_size
+    , const float    *kernel      // in_channel x out_channel x kernel_size x kernel_size
+    , const float    *bias        // bias per kernel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // number of biases, it should be the same as out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride      // stride default 1
+    , const uint8_t   padding     // padding default 0
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dDoubleFast
+(           double   *out_data    // out_channel x out_size x out_size
+    , const double   *in_data     // in_channel x in_size x in_size
+    , const double   *kernel      // in_channel x out_channel x kernel_size x kernel_size
+    , const double   *bias        // bias per kernel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // number of biases, it should be the same as out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride      // stride default 1
+    , const uint8_t   padding     // padding default 0
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dBatchIntFast
+(           int      *out_data    // minibatch x out_channel x out_size x out_size
+    , const int      *in_data     // minibatch x in_channel x in_size x in_size
+    , const int      *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const int      *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+extern int Convolution2dBatchFloatFast
+(           float    *out_data    // minibatch x out_channel x out_size x out_size
+    , const float    *in_data     // minibatch x in_channel x in_size x in_size
+    , const float    *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const float    *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+extern int Convolution2dBatchDoubleFast
+(           double   *out_data    // minibatch x out_channel x out_size x out_size
+    , const double   *in_data     // minibatch x in_channel x in_size x in_size
+    , const double   *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const double   *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+#ifdef __cplusplus
+}
+#endif
+#endif // !defined(__SYNTHESIS__)
+/*
+ * Revision history
+ *
+ * 2026.10.18: Started.
+ */
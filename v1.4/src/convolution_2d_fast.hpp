@@ -0,0 +1,198 @@
+#pragma once
+/*
+ * Copyright (c) 2019-2020 by Future Design Systems.
+ * All right reserved.
+ * http://www.future-ds.com
+ *
+ * @file convolution_2d_fast.hpp
+ * @brief This file contains 2 dimensional convolution routine
+ *        using im2col and blocked GEMM (software-only, not for HLS).
+ * @author FDS
+ * @date Oct. 18, 2026
+ */
+#if !defined(__SYNTHESIS__)
+#include <stdint.h>
+#include <stdio.h>
+#include <vector>
+#include "dlr_common.h"
+#include "dlr_gemm.hpp"
+
+namespace dlr { // deep learning routines
+
+#define DLR_IM2COL_SIZE (1<<22) // max num of elements of im2col buffer
+
+// Lowers input to columns for output rows from 'g0' to 'g0+rows-1', i.e.,
+// col[in_channel x kernel_size x kernel_size][rows x out_size].
+template<class TYPE=float>
+void Im2col
+(           TYPE     *col
+    , const TYPE     *in_data     // in_channel x in_size x in_size
+    , const uint32_t  g0          // first output row
+    , const uint32_t  rows        // num of output rows
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint8_t   kernel_size
+    , const uint16_t  in_channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+)
+{
+    const uint32_t t_in_area = (uint32_t)in_size*in_size;
+    uint32_t g, k, ch, i, j;
+    TYPE *pC = col;
+    for (ch=0; ch<in_channel; ++ch) {
+        const TYPE *pX = in_data+ch*t_in_area;
+        for (i=0; i<kernel_size; ++i) {
+            for (j=0; j<kernel_size; ++j) {
+                for (g=g0; g<(g0+rows); ++g) {
+                    const int32_t y = (int32_t)(g*stride+i)-padding;
+                    if ((y<0)||(y>=in_size)) {
+                        for (k=0; k<out_size; ++k) *pC++ = (TYPE)0;
+                        continue;
+                    }
+                    const TYPE *pXr = pX+y*in_size;
+                    for (k=0; k<out_size; ++k) {
+                        const int32_t x = (int32_t)(k*stride+j)-padding;
+                        *pC++ = ((x<0)||(x>=in_size)) ? (TYPE)0 : pXr[x];
+                    }
+                } // for (g=g0
+            } // for (j=0
+        } // for (i=0
+    } // for (ch=0
+}
+
+// Same arguments and results as Convolution2d(), but
+// it lowers input to columns (im2col) for a band of output rows
+// and then multiplies kernel matrix by the columns.
+template<class TYPE=float>
+void Convolution2dFast
+(           TYPE     *out_data    // out_channel x out_size x out_size
+    , const TYPE     *in_data     // in_channel x in_size x in_size
+    , const TYPE     *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const TYPE     *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding=0
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+)
+{
+    if (verbose) {
+        dlrInfo("out_size   =%d\n", out_size    );
+        dlrInfo("in_size    =%d\n", in_size     );
+        dlrInfo("kernel_size=%d\n", kernel_size );
+        dlrInfo("bias_size  =%d\n", bias_size   );
+        dlrInfo("in_channel =%d\n", in_channel  );
+        dlrInfo("out_channel=%d\n", out_channel );
+        dlrInfo("stride     =%d\n", stride      );
+        dlrInfo("padding    =%d\n", padding     );
+        fflush(stderr); fflush(stdout);
+    }
+    if (rigor) {
+        dlrCheck (in_channel>0);
+        dlrCheck (out_channel>0);
+        dlrCheck (out_size==(((in_size-kernel_size+2*padding)/stride)+1));
+        dlrCheck ((kernel_size%2)==1);
+        dlrCheck (stride>0);
+        dlrCheck (padding>=0);
+        dlrCheck (padding<=(kernel_size/2));
+        dlrCheck ((bias_size==0)||(out_channel==bias_size));
+    }
+
+    const uint32_t t_out_area = (uint32_t)out_size*out_size;
+    const uint32_t t_depth    = (uint32_t)in_channel*kernel_size*kernel_size; // rows of im2col
+    uint32_t f, n;
+
+    for (f=0; f<out_channel; ++f) {
+        TYPE B = (bias_size==0) ? (TYPE)0 : bias[f];
+        TYPE *pZ = out_data+f*t_out_area;
+        for (n=0; n<t_out_area; ++n) pZ[n] = B;
+    }
+
+    if ((kernel_size==1)&&(stride==1)&&(padding==0)) { // input itself is im2col
+        Gemm<TYPE>( out_data, kernel, in_data
+                  , out_channel, t_out_area, in_channel
+                  , t_out_area, in_channel, t_out_area);
+        return;
+    }
+
+    // band of output rows to bound the size of im2col buffer
+    uint32_t t_rows = DLR_IM2COL_SIZE/(t_depth*out_size);
+    if (t_rows<1) t_rows = 1;
+    if (t_rows>out_size) t_rows = out_size;
+    std::vector<TYPE> t_col((size_t)t_depth*t_rows*out_size);
+
+    uint32_t g0;
+    for (g0=0; g0<out_size; g0+=t_rows) {
+        const uint32_t rows = ((out_size-g0)<t_rows) ? (out_size-g0) : t_rows;
+        const uint32_t cols = rows*out_size; // output pixels of this band
+        Im2col<TYPE>( t_col.data(), in_data, g0, rows
+                    , out_size, in_size, kernel_size, in_channel
+                    , stride, padding);
+        Gemm<TYPE>( out_data+g0*out_size, kernel, t_col.data()
+                  , out_channel, cols, t_depth
+                  , t_out_area, t_depth, cols);
+    } // for (g0=0
+}
+
+template<class TYPE=float>
+void Convolution2dBatchFast
+(           TYPE     *out_data    // minibatch x out_channel x out_size x out_size
+    , const TYPE     *in_data     // minibatch x in_channel x in_size x in_size
+    , const TYPE     *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const TYPE     *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding=0
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+)
+{
+    const uint32_t t_out_step=(uint32_t)out_channel*out_size*out_size;
+    const uint32_t t_in_step =(uint32_t)in_channel*in_size*in_size;
+    TYPE       *pZ = out_data;
+    const TYPE *pX = in_data;
+    uint16_t mb;
+
+    for (mb=0; mb<minibatch; ++mb) {
+        Convolution2dFast<TYPE>
+        (     pZ
+            , pX
+            , kernel
+            , bias
+            , out_size
+            , in_size
+            , kernel_size
+            , bias_size
+            , in_channel
+            , out_channel
+            , stride
+            , padding
+            , rigor
+            , verbose
+        );
+        pZ += t_out_step;
+        pX += t_in_step;
+    }
+}
+
+} // namespace dlr
+#endif // !defined(__SYNTHESIS__)
+/*
+ * Revision history
+ *
+ * 2026.10.18: 'dlrCheck()' in place of 'assert()' for rigor checks.
+ * 2026.10.18: 'Im2col' separated to be shared with packed weights.
+ * 2026.10.18: Started.
+ */
@@ -0,0 +1,1672 @@
+#include "convolution_2d_pool_2d_max.hpp"
+#include "dlr_fixed.hpp"
+#include "dlr_half.hpp"
+
+extern "C" {
+
+int Convolution2dPool2dMaxInt
+(           int      *out_data    // out_channel x out_size x out_size (pooled)
+    , const int      *in_data     // in_channel x in_size x in_size
+    , const int      *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const int      *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMax<int, 0, 0>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxIntReLu
+(           int      *out_data    // out_channel x out_size x out_size (pooled)
+    , const int      *in_data     // in_channel x in_size x in_size
+    , const int      *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const int      *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMax<int, 1, 0>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxIntLeakyReLu
+(           int      *out_data    // out_channel x out_size x out_size (pooled)
+    , const int      *in_data     // in_channel x in_size x in_size
+    , const int      *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const int      *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMax<int, 0, 1>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxBatchInt
+(           int      *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const int      *in_data     // minibatch x in_channel x in_size x in_size
+    , const int      *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const int      *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMaxBatch<int, 0, 0>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxBatchIntReLu
+(           int      *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const int      *in_data     // minibatch x in_channel x in_size x in_size
+    , const int      *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const int      *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMaxBatch<int, 1, 0>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxBatchIntLeakyReLu
+(           int      *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const int      *in_data     // minibatch x in_channel x in_size x in_size
+    , const int      *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const int      *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMaxBatch<int, 0, 1>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxFloat
+(           float    *out_data    // out_channel x out_size x out_size (pooled)
+    , const float    *in_data     // in_channel x in_size x in_size
+    , const float    *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const float    *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMax<float, 0, 0>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxFloatReLu
+(           float    *out_data    // out_channel x out_size x out_size (pooled)
+    , const float    *in_data     // in_channel x in_size x in_size
+    , const float    *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const float    *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMax<float, 1, 0>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxFloatLeakyReLu
+(           float    *out_data    // out_channel x out_size x out_size (pooled)
+    , const float    *in_data     // in_channel x in_size x in_size
+    , const float    *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const float    *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMax<float, 0, 1>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxBatchFloat
+(           float    *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const float    *in_data     // minibatch x in_channel x in_size x in_size
+    , const float    *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const float    *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMaxBatch<float, 0, 0>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxBatchFloatReLu
+(           float    *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const float    *in_data     // minibatch x in_channel x in_size x in_size
+    , const float    *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const float    *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMaxBatch<float, 1, 0>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxBatchFloatLeakyReLu
+(           float    *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const float    *in_data     // minibatch x in_channel x in_size x in_size
+    , const float    *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const float    *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMaxBatch<float, 0, 1>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxDouble
+(           double   *out_data    // out_channel x out_size x out_size (pooled)
+    , const double   *in_data     // in_channel x in_size x in_size
+    , const double   *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const double   *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMax<double, 0, 0>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxDoubleReLu
+(           double   *out_data    // out_channel x out_size x out_size (pooled)
+    , const double   *in_data     // in_channel x in_size x in_size
+    , const double   *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const double   *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMax<double, 1, 0>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxDoubleLeakyReLu
+(           double   *out_data    // out_channel x out_size x out_size (pooled)
+    , const double   *in_data     // in_channel x in_size x in_size
+    , const double   *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const double   *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMax<double, 0, 1>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxBatchDouble
+(           double   *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const double   *in_data     // minibatch x in_channel x in_size x in_size
+    , const double   *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const double   *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMaxBatch<double, 0, 0>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxBatchDoubleReLu
+(           double   *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const double   *in_data     // minibatch x in_channel x in_size x in_size
+    , const double   *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const double   *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMaxBatch<double, 1, 0>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxBatchDoubleLeakyReLu
+(           double   *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const double   *in_data     // minibatch x in_channel x in_size x in_size
+    , const double   *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const double   *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMaxBatch<double, 0, 1>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+// fixed-point of dlr_fixed.hpp, whose data are raw bits (see dlrSetFixedFormat())
+int Convolution2dPool2dMaxFixed
+(           int32_t  *out_data    // out_channel x out_size x out_size (pooled)
+    , const int32_t  *in_data     // in_channel x in_size x in_size
+    , const int32_t  *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const int32_t  *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMax<dlr::Fixed, 0, 0>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , (const dlr::Fixed*)kernel
+        , (const dlr::Fixed*)bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxFixedReLu
+(           int32_t  *out_data    // out_channel x out_size x out_size (pooled)
+    , const int32_t  *in_data     // in_channel x in_size x in_size
+    , const int32_t  *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const int32_t  *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMax<dlr::Fixed, 1, 0>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , (const dlr::Fixed*)kernel
+        , (const dlr::Fixed*)bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxFixedLeakyReLu
+(           int32_t  *out_data    // out_channel x out_size x out_size (pooled)
+    , const int32_t  *in_data     // in_channel x in_size x in_size
+    , const int32_t  *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const int32_t  *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMax<dlr::Fixed, 0, 1>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , (const dlr::Fixed*)kernel
+        , (const dlr::Fixed*)bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxBatchFixed
+(           int32_t  *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const int32_t  *in_data     // minibatch x in_channel x in_size x in_size
+    , const int32_t  *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const int32_t  *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMaxBatch<dlr::Fixed, 0, 0>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , (const dlr::Fixed*)kernel
+        , (const dlr::Fixed*)bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxBatchFixedReLu
+(           int32_t  *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const int32_t  *in_data     // minibatch x in_channel x in_size x in_size
+    , const int32_t  *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const int32_t  *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMaxBatch<dlr::Fixed, 1, 0>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , (const dlr::Fixed*)kernel
+        , (const dlr::Fixed*)bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxBatchFixedLeakyReLu
+(           int32_t  *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const int32_t  *in_data     // minibatch x in_channel x in_size x in_size
+    , const int32_t  *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const int32_t  *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMaxBatch<dlr::Fixed, 0, 1>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , (const dlr::Fixed*)kernel
+        , (const dlr::Fixed*)bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+// IEEE 754 binary16 (fp16) and bfloat16 storage computed in float (see dlr_half.hpp)
+int Convolution2dPool2dMaxHalf
+(           uint16_t *out_data    // out_channel x out_size x out_size (pooled)
+    , const uint16_t *in_data     // in_channel x in_size x in_size
+    , const uint16_t *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMax<dlr::Half, 0, 0>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , (const dlr::Half*)kernel
+        , (const dlr::Half*)bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxHalfReLu
+(           uint16_t *out_data    // out_channel x out_size x out_size (pooled)
+    , const uint16_t *in_data     // in_channel x in_size x in_size
+    , const uint16_t *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMax<dlr::Half, 1, 0>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , (const dlr::Half*)kernel
+        , (const dlr::Half*)bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxHalfLeakyReLu
+(           uint16_t *out_data    // out_channel x out_size x out_size (pooled)
+    , const uint16_t *in_data     // in_channel x in_size x in_size
+    , const uint16_t *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMax<dlr::Half, 0, 1>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , (const dlr::Half*)kernel
+        , (const dlr::Half*)bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxBatchHalf
+(           uint16_t *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const uint16_t *in_data     // minibatch x in_channel x in_size x in_size
+    , const uint16_t *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMaxBatch<dlr::Half, 0, 0>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , (const dlr::Half*)kernel
+        , (const dlr::Half*)bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxBatchHalfReLu
+(           uint16_t *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const uint16_t *in_data     // minibatch x in_channel x in_size x in_size
+    , const uint16_t *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMaxBatch<dlr::Half, 1, 0>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , (const dlr::Half*)kernel
+        , (const dlr::Half*)bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxBatchHalfLeakyReLu
+(           uint16_t *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const uint16_t *in_data     // minibatch x in_channel x in_size x in_size
+    , const uint16_t *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMaxBatch<dlr::Half, 0, 1>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , (const dlr::Half*)kernel
+        , (const dlr::Half*)bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxBFloat16
+(           uint16_t *out_data    // out_channel x out_size x out_size (pooled)
+    , const uint16_t *in_data     // in_channel x in_size x in_size
+    , const uint16_t *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMax<dlr::BFloat16, 0, 0>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , (const dlr::BFloat16*)kernel
+        , (const dlr::BFloat16*)bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxBFloat16ReLu
+(           uint16_t *out_data    // out_channel x out_size x out_size (pooled)
+    , const uint16_t *in_data     // in_channel x in_size x in_size
+    , const uint16_t *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMax<dlr::BFloat16, 1, 0>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , (const dlr::BFloat16*)kernel
+        , (const dlr::BFloat16*)bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxBFloat16LeakyReLu
+(           uint16_t *out_data    // out_channel x out_size x out_size (pooled)
+    , const uint16_t *in_data     // in_channel x in_size x in_size
+    , const uint16_t *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMax<dlr::BFloat16, 0, 1>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , (const dlr::BFloat16*)kernel
+        , (const dlr::BFloat16*)bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxBatchBFloat16
+(           uint16_t *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const uint16_t *in_data     // minibatch x in_channel x in_size x in_size
+    , const uint16_t *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMaxBatch<dlr::BFloat16, 0, 0>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , (const dlr::BFloat16*)kernel
+        , (const dlr::BFloat16*)bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxBatchBFloat16ReLu
+(           uint16_t *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const uint16_t *in_data     // minibatch x in_channel x in_size x in_size
+    , const uint16_t *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMaxBatch<dlr::BFloat16, 1, 0>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , (const dlr::BFloat16*)kernel
+        , (const dlr::BFloat16*)bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPool2dMaxBatchBFloat16LeakyReLu
+(           uint16_t *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const uint16_t *in_data     // minibatch x in_channel x in_size x in_size
+    , const uint16_t *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPool2dMaxBatch<dlr::BFloat16, 0, 1>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , (const dlr::BFloat16*)kernel
+        , (const dlr::BFloat16*)bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        , pool_size
+        , pool_stride
+        , ceil_mode
+        , negative_slope
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+} // extern "C"
+
+/*
+ * Revision history
+ *
+ * 2026.10.18: fixed-point entries added.
+ * 2026.10.18: Started.
+ */
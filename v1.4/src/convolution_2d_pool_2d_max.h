@@ -0,0 +1,799 @@
+#pragma once
+#include <stdint.h>
+
+// software-only: Convolution2d fused with activation and Pooling2dMax
+// - Convolution2dPool2dMax<Type>[ReLu|LeakyReLu]() writes only pooled outputs,
+//   e.g., 2x2 of stride 2 pooling after convolution of LeNet-5 and Tiny YOLO-V2
+// - pooling has no padding, where 'ceil_mode' clips the last window
+#if !defined(__SYNTHESIS__)
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#define Convolution2dPool2dMax Convolution2dPool2dMaxFloat
+#define Convolution2dPool2dMaxReLu Convolution2dPool2dMaxFloatReLu
+#define Convolution2dPool2dMaxLeakyReLu Convolution2dPool2dMaxFloatLeakyReLu
+#define Convolution2dPool2dMaxBatch Convolution2dPool2dMaxBatchFloat
+#define Convolution2dPool2dMaxBatchReLu Convolution2dPool2dMaxBatchFloatReLu
+#define Convolution2dPool2dMaxBatchLeakyReLu Convolution2dPool2dMaxBatchFloatLeakyReLu
+
+extern int Convolution2dPool2dMaxInt
+(           int      *out_data    // out_channel x out_size x out_size (pooled)
+    , const int      *in_data     // in_channel x in_size x in_size
+    , const int      *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const int      *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxIntReLu
+(           int      *out_data    // out_channel x out_size x out_size (pooled)
+    , const int      *in_data     // in_channel x in_size x in_size
+    , const int      *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const int      *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxIntLeakyReLu
+(           int      *out_data    // out_channel x out_size x out_size (pooled)
+    , const int      *in_data     // in_channel x in_size x in_size
+    , const int      *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const int      *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxBatchInt
+(           int      *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const int      *in_data     // minibatch x in_channel x in_size x in_size
+    , const int      *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const int      *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxBatchIntReLu
+(           int      *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const int      *in_data     // minibatch x in_channel x in_size x in_size
+    , const int      *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const int      *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxBatchIntLeakyReLu
+(           int      *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const int      *in_data     // minibatch x in_channel x in_size x in_size
+    , const int      *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const int      *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxFloat
+(           float    *out_data    // out_channel x out_size x out_size (pooled)
+    , const float    *in_data     // in_channel x in_size x in_size
+    , const float    *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const float    *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxFloatReLu
+(           float    *out_data    // out_channel x out_size x out_size (pooled)
+    , const float    *in_data     // in_channel x in_size x in_size
+    , const float    *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const float    *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxFloatLeakyReLu
+(           float    *out_data    // out_channel x out_size x out_size (pooled)
+    , const float    *in_data     // in_channel x in_size x in_size
+    , const float    *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const float    *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxBatchFloat
+(           float    *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const float    *in_data     // minibatch x in_channel x in_size x in_size
+    , const float    *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const float    *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxBatchFloatReLu
+(           float    *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const float    *in_data     // minibatch x in_channel x in_size x in_size
+    , const float    *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const float    *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxBatchFloatLeakyReLu
+(           float    *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const float    *in_data     // minibatch x in_channel x in_size x in_size
+    , const float    *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const float    *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxDouble
+(           double   *out_data    // out_channel x out_size x out_size (pooled)
+    , const double   *in_data     // in_channel x in_size x in_size
+    , const double   *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const double   *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxDoubleReLu
+(           double   *out_data    // out_channel x out_size x out_size (pooled)
+    , const double   *in_data     // in_channel x in_size x in_size
+    , const double   *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const double   *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxDoubleLeakyReLu
+(           double   *out_data    // out_channel x out_size x out_size (pooled)
+    , const double   *in_data     // in_channel x in_size x in_size
+    , const double   *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const double   *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxBatchDouble
+(           double   *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const double   *in_data     // minibatch x in_channel x in_size x in_size
+    , const double   *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const double   *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxBatchDoubleReLu
+(           double   *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const double   *in_data     // minibatch x in_channel x in_size x in_size
+    , const double   *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const double   *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxBatchDoubleLeakyReLu
+(           double   *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const double   *in_data     // minibatch x in_channel x in_size x in_size
+    , const double   *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const double   *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+// fixed-point of raw bits in the format of dlrSetFixedFormat()
+extern int Convolution2dPool2dMaxFixed
+(           int32_t  *out_data    // out_channel x out_size x out_size (pooled)
+    , const int32_t  *in_data     // in_channel x in_size x in_size
+    , const int32_t  *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const int32_t  *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxFixedReLu
+(           int32_t  *out_data    // out_channel x out_size x out_size (pooled)
+    , const int32_t  *in_data     // in_channel x in_size x in_size
+    , const int32_t  *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const int32_t  *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxFixedLeakyReLu
+(           int32_t  *out_data    // out_channel x out_size x out_size (pooled)
+    , const int32_t  *in_data     // in_channel x in_size x in_size
+    , const int32_t  *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const int32_t  *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxBatchFixed
+(           int32_t  *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const int32_t  *in_data     // minibatch x in_channel x in_size x in_size
+    , const int32_t  *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const int32_t  *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxBatchFixedReLu
+(           int32_t  *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const int32_t  *in_data     // minibatch x in_channel x in_size x in_size
+    , const int32_t  *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const int32_t  *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxBatchFixedLeakyReLu
+(           int32_t  *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const int32_t  *in_data     // minibatch x in_channel x in_size x in_size
+    , const int32_t  *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const int32_t  *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+// IEEE 754 binary16 (fp16) and bfloat16 storage of uint16_t bits computed in float
+extern int Convolution2dPool2dMaxHalf
+(           uint16_t *out_data    // out_channel x out_size x out_size (pooled)
+    , const uint16_t *in_data     // in_channel x in_size x in_size
+    , const uint16_t *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxHalfReLu
+(           uint16_t *out_data    // out_channel x out_size x out_size (pooled)
+    , const uint16_t *in_data     // in_channel x in_size x in_size
+    , const uint16_t *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxHalfLeakyReLu
+(           uint16_t *out_data    // out_channel x out_size x out_size (pooled)
+    , const uint16_t *in_data     // in_channel x in_size x in_size
+    , const uint16_t *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxBatchHalf
+(           uint16_t *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const uint16_t *in_data     // minibatch x in_channel x in_size x in_size
+    , const uint16_t *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxBatchHalfReLu
+(           uint16_t *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const uint16_t *in_data     // minibatch x in_channel x in_size x in_size
+    , const uint16_t *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxBatchHalfLeakyReLu
+(           uint16_t *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const uint16_t *in_data     // minibatch x in_channel x in_size x in_size
+    , const uint16_t *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxBFloat16
+(           uint16_t *out_data    // out_channel x out_size x out_size (pooled)
+    , const uint16_t *in_data     // in_channel x in_size x in_size
+    , const uint16_t *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxBFloat16ReLu
+(           uint16_t *out_data    // out_channel x out_size x out_size (pooled)
+    , const uint16_t *in_data     // in_channel x in_size x in_size
+    , const uint16_t *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxBFloat16LeakyReLu
+(           uint16_t *out_data    // out_channel x out_size x out_size (pooled)
+    , const uint16_t *in_data     // in_channel x in_size x in_size
+    , const uint16_t *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxBatchBFloat16
+(           uint16_t *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const uint16_t *in_data     // minibatch x in_channel x in_size x in_size
+    , const uint16_t *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxBatchBFloat16ReLu
+(           uint16_t *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const uint16_t *in_data     // minibatch x in_channel x in_size x in_size
+    , const uint16_t *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPool2dMaxBatchBFloat16LeakyReLu
+(           uint16_t *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const uint16_t *in_data     // minibatch x in_channel x in_size x in_size
+    , const uint16_t *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const uint16_t *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode
+    , const float     negative_slope // only for LeakyReLu
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+#ifdef __cplusplus
+}
+#endif
+#endif // !defined(__SYNTHESIS__)
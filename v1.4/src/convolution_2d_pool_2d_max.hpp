@@ -0,0 +1,272 @@
+#pragma once
+/*
+ * Copyright (c) 2019-2020 by Future Design Systems.
+ * All right reserved.
+ * http://www.future-ds.com
+ *
+ * @file convolution_2d_pool_2d_max.hpp
+ * @brief This file contains 2 dimensional convolution fused with activation
+ *        and max pooling (software-only, not for HLS).
+ * @author FDS
+ * @date Oct. 18, 2026
+ */
+#if !defined(__SYNTHESIS__)
+#include <stdint.h>
+#include <stdio.h>
+#include <vector>
+#include "dlr_common.h"
+#include "dlr_half.hpp"
+#include "dlr_simd.hpp"
+#include "convolution_2d.hpp"
+
+namespace dlr { // deep learning routines
+
+// A row 'g' of convolution output of a filter over all input channels,
+// i.e., z[k] = B + sum of products of the window at (g,k) for k<conv_size,
+// where windows of columns of [lo, hi) lie inside of input as Convolution2d().
+template<class TYPE=float>
+inline void Convolution2dRow
+(           typename Accumulator<TYPE>::type *z // conv_size
+    , const TYPE     *in_data     // in_channel x in_size x in_size
+    , const TYPE     *kernel      // in_channel x kernel_size x kernel_size of a filter
+    , const typename Accumulator<TYPE>::type B
+    , const uint16_t  g
+    , const uint16_t  conv_size
+    , const uint16_t  in_size
+    , const uint8_t   kernel_size
+    , const uint16_t  in_channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint16_t  lo
+    , const uint16_t  hi
+)
+{
+    typedef typename Accumulator<TYPE>::type ACCUM;
+    const uint32_t t_in_area  = (uint32_t)in_size*in_size;
+    const uint32_t t_ker_area = (uint32_t)kernel_size*kernel_size;
+    const int32_t  y0 = (int32_t)g*stride-padding;
+    const bool     t_inside = (g>=lo)&&(g<hi); // rows of the window inside of input
+    for (uint16_t k=0; k<conv_size; ++k) z[k] = B;
+    for (uint16_t ch=0; ch<in_channel; ++ch) {
+        const TYPE *pX = in_data+(uint32_t)ch*t_in_area;
+        const TYPE *pW = kernel+(uint32_t)ch*t_ker_area;
+        if (!t_inside) {
+            for (uint16_t k=0; k<conv_size; ++k)
+                z[k] += Convolution2dWindow<TYPE>(pX, pW, y0, (int32_t)k*stride-padding, in_size, kernel_size);
+            continue;
+        }
+        for (uint16_t k=0; k<lo; ++k) // left border
+            z[k] += Convolution2dWindow<TYPE>(pX, pW, y0, (int32_t)k*stride-padding, in_size, kernel_size);
+        if ((stride!=1)||!SimdConvRow(z+lo, pX+(uint32_t)y0*in_size+(lo-padding), pW, hi-lo, in_size, kernel_size)) {
+            for (uint16_t k=lo; k<hi; ++k) { // interior
+                const TYPE *pXw = pX+(uint32_t)y0*in_size+((uint32_t)k*stride-padding);
+                const TYPE *pWw = pW;
+                ACCUM accum=0;
+                for (uint8_t i=0; i<kernel_size; ++i) {
+                    for (uint8_t j=0; j<kernel_size; ++j) {
+                        accum += pXw[j]*pWw[j];
+                    }
+                    pXw += in_size;
+                    pWw += kernel_size;
+                }
+                z[k] += accum;
+            }
+        }
+        for (uint16_t k=hi; k<conv_size; ++k) // right border
+            z[k] += Convolution2dWindow<TYPE>(pX, pW, y0, (int32_t)k*stride-padding, in_size, kernel_size);
+    }
+}
+
+// Same results as Convolution2d(), activation and Pooling2dMax() of no padding
+// in a row, where only pooled outputs are written.
+// - rows of convolution of a filter are computed into a ring of 'pool_size'
+//   rows, which stays in cache, and each row is computed once even when
+//   windows of pooling overlap
+// - a window of pooling is reduced by SimdMax() over rows and then by
+//   SimdReduceMax() over columns
+// - activation goes after pooling since ReLu and LeakyReLu of non-negative
+//   slope keep the order, i.e., act(max(x)) is max(act(x)),
+//   while LeakyReLu of negative slope does not and goes to each row before pooling
+// - 'ceil_mode' clips the last window to the convolution output
+template< class TYPE=float
+        , int ReLu=0
+        , int LeakyReLu=0
+        >
+void Convolution2dPool2dMax
+(           TYPE     *out_data    // out_channel x out_size x out_size (pooled)
+    , const TYPE     *in_data     // in_channel x in_size x in_size
+    , const TYPE     *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const TYPE     *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode=0
+    , const float     negative_slope=0.1 // only for LeakyReLu
+    , const int       rigor=0     // check rigorously when 1
+    , const int       verbose=0   // verbose level
+)
+{
+    const uint16_t t_conv_size = (uint16_t)(((int32_t)in_size-kernel_size+2*padding)/stride+1);
+    if (verbose) {
+        dlrInfo("out_size   =%d\n", out_size    );
+        dlrInfo("in_size    =%d\n", in_size     );
+        dlrInfo("kernel_size=%d\n", kernel_size );
+        dlrInfo("bias_size  =%d\n", bias_size   );
+        dlrInfo("in_channel =%d\n", in_channel  );
+        dlrInfo("out_channel=%d\n", out_channel );
+        dlrInfo("stride     =%d\n", stride      );
+        dlrInfo("padding    =%d\n", padding     );
+        dlrInfo("conv_size  =%d\n", t_conv_size );
+        dlrInfo("pool_size  =%d\n", pool_size   );
+        dlrInfo("pool_stride=%d\n", pool_stride );
+        dlrInfo("ceil       =%d\n", ceil_mode   );
+        dlrInfo("activation =%s\n", ReLu ? "ReLu" : LeakyReLu ? "LeakyReLu" : "none");
+        fflush(stderr); fflush(stdout);
+    }
+    if (rigor) {
+        dlrCheck (in_channel>0);
+        dlrCheck (out_channel>0);
+        dlrCheck (stride>0);
+        dlrCheck (padding<=(kernel_size/2));
+        dlrCheck ((bias_size==0)||(out_channel==bias_size));
+        dlrCheck ((pool_size>0)&&(pool_stride>0));
+        dlrCheck (t_conv_size>=pool_size);
+        const int32_t t_span = t_conv_size-pool_size;
+        int32_t expect = (ceil_mode) ? (t_span+pool_stride-1)/pool_stride+1 : t_span/pool_stride+1;
+        if (ceil_mode&&((int32_t)(expect-1)*pool_stride>=t_conv_size)) expect--;
+        if (out_size!=expect) dlrWarn("out_size mis-match: %u, but %d expected\n", out_size, expect);
+    }
+
+    typedef typename Accumulator<TYPE>::type ACCUM;
+    const uint32_t t_out_area = (uint32_t)out_size*out_size;
+    const uint32_t t_ker_size = (uint32_t)in_channel*kernel_size*kernel_size; // kernel of a filter
+    // columns and rows of convolution whose window lies inside of input
+    uint16_t t_hi = ((in_size+padding)>=kernel_size) ? (in_size+padding-kernel_size)/stride+1 : 0;
+    if (t_hi>t_conv_size) t_hi = t_conv_size;
+    uint16_t t_lo = (padding+stride-1)/stride;
+    if (t_lo>t_hi) t_lo = t_hi;
+    // LeakyReLu of negative slope does not keep the order
+    const int t_act_first = LeakyReLu && (negative_slope<0);
+    int32_t f; // signed for OpenMP
+
+    #if defined(_OPENMP)
+    #pragma omp parallel for
+    #endif
+    for (f=0; f<(int32_t)out_channel; ++f) {
+        const ACCUM B = (bias_size==0) ? (ACCUM)0 : (ACCUM)bias[f];
+        const TYPE *pK = kernel+(uint32_t)f*t_ker_size;
+        TYPE *pZ = out_data+(uint32_t)f*t_out_area;
+        std::vector<ACCUM> t_ring((uint32_t)pool_size*t_conv_size); // rows of convolution
+        std::vector<ACCUM> t_max(t_conv_size); // max over rows of a window
+        uint16_t t_done = 0; // rows of convolution computed so far
+        for (uint16_t p=0; p<out_size; ++p) {
+            const uint16_t r0 = p*pool_stride;
+            const uint16_t r1 = ((r0+pool_size)>t_conv_size) ? t_conv_size : r0+pool_size;
+            for (uint16_t r=((t_done>r0) ? t_done : r0); r<r1; ++r) {
+                Convolution2dRow<TYPE>(&t_ring[(uint32_t)(r%pool_size)*t_conv_size], in_data, pK, B
+                                      , r, t_conv_size, in_size, kernel_size, in_channel
+                                      , stride, padding, t_lo, t_hi);
+                if (t_act_first) {
+                    ACCUM *pA = &t_ring[(uint32_t)(r%pool_size)*t_conv_size];
+                    for (uint16_t j=0; j<t_conv_size; ++j) {
+                        if (pA[j]<(ACCUM)0) pA[j] = (ACCUM)(pA[j]*negative_slope);
+                    }
+                }
+            }
+            t_done = r1;
+            const ACCUM *pR = &t_ring[(uint32_t)(r0%pool_size)*t_conv_size];
+            for (uint16_t j=0; j<t_conv_size; ++j) t_max[j] = pR[j];
+            for (uint16_t r=r0+1; r<r1; ++r) {
+                SimdMax(&t_max[0], &t_max[0], &t_ring[(uint32_t)(r%pool_size)*t_conv_size], t_conv_size);
+            }
+            TYPE *pZp = pZ+(uint32_t)p*out_size;
+            for (uint16_t q=0; q<out_size; ++q) {
+                const uint16_t c0 = q*pool_stride;
+                const uint16_t c1 = ((c0+pool_size)>t_conv_size) ? t_conv_size : c0+pool_size;
+                const ACCUM t_value = SimdReduceMax(&t_max[c0], c1-c0);
+                if (ReLu) {
+                    pZp[q] = (TYPE)((t_value<(ACCUM)0) ? (ACCUM)0 : t_value);
+                } else if (LeakyReLu&&!t_act_first) {
+                    pZp[q] = (TYPE)((t_value<(ACCUM)0) ? (ACCUM)(t_value*negative_slope) : t_value);
+                } else {
+                    pZp[q] = (TYPE)t_value;
+                }
+            }
+        }
+    }
+}
+
+// minibatch version: in_data and out_data have leading minibatch dimension
+template< class TYPE=float
+        , int ReLu=0
+        , int LeakyReLu=0
+        >
+void Convolution2dPool2dMaxBatch
+(           TYPE     *out_data    // minibatch x out_channel x out_size x out_size (pooled)
+    , const TYPE     *in_data     // minibatch x in_channel x in_size x in_size
+    , const TYPE     *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const TYPE     *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix (pooled)
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const uint8_t   pool_size   // kernel_size of pooling
+    , const uint8_t   pool_stride // stride of pooling
+    , const int       ceil_mode=0
+    , const float     negative_slope=0.1 // only for LeakyReLu
+    , const int       rigor=0     // check rigorously when 1
+    , const int       verbose=0   // verbose level
+)
+{
+    const uint32_t t_out_step=(uint32_t)out_channel*out_size*out_size;
+    const uint32_t t_in_step =(uint32_t)in_channel*in_size*in_size;
+    TYPE       *pZ = out_data;
+    const TYPE *pX = in_data;
+    uint16_t mb;
+
+    for (mb=0; mb<minibatch; ++mb) {
+        Convolution2dPool2dMax<TYPE, ReLu, LeakyReLu>
+        (     pZ
+            , pX
+            , kernel
+            , bias
+            , out_size
+            , in_size
+            , kernel_size
+            , bias_size
+            , in_channel
+            , out_channel
+            , stride
+            , padding
+            , pool_size
+            , pool_stride
+            , ceil_mode
+            , negative_slope
+            , rigor
+            , verbose
+        );
+        pZ += t_out_step;
+        pX += t_in_step;
+    }
+}
+
+} // namespace dlr
+#endif // !defined(__SYNTHESIS__)
+/*
+ * Revision history
+ *
+ * 2026.10.18: LeakyReLu of negative slope applied to rows before pooling.
+ * 2026.10.18: Started.
+ */
@@ -0,0 +1,183 @@
+#include "convolution_2d_winograd.hpp"
+
+extern "C" {
+
+int Convolution2dWinogradFilterFloat
+(           float    *filter      // 16 x out_channel x in_channel
+    , const float    *kernel      // out_channel x in_channel x 3 x 3
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dWinogradFilter<float> ( filter
+                  , kernel
+                  , in_channel
+                  , out_channel
+                  , rigor
+                  , verbose
+                  );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dWinogradFilterDouble
+(           double   *filter      // 16 x out_channel x in_channel
+    , const double   *kernel      // out_channel x in_channel x 3 x 3
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dWinogradFilter<double> ( filter
+                  , kernel
+                  , in_channel
+                  , out_channel
+                  , rigor
+                  , verbose
+                  );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dWinogradFloat
+(           float    *out_data    // out_channel x out_size x out_size
+    , const float    *in_data     // in_channel x in_size x in_size
+    , const float    *filter      // 16 x out_channel x in_channel (transformed kernel)
+    , const float    *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   padding     // 0 or 1
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dWinograd<float> ( out_data
+                  , in_data
+                  , filter
+                  , bias
+                  , out_size
+                  , in_size
+                  , bias_size
+                  , in_channel
+                  , out_channel
+                  , padding
+                  , rigor
+                  , verbose
+                  );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dWinogradDouble
+(           double   *out_data    // out_channel x out_size x out_size
+    , const double   *in_data     // in_channel x in_size x in_size
+    , const double   *filter      // 16 x out_channel x in_channel (transformed kernel)
+    , const double   *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   padding     // 0 or 1
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dWinograd<double> ( out_data
+                  , in_data
+                  , filter
+                  , bias
+                  , out_size
+                  , in_size
+                  , bias_size
+                  , in_channel
+                  , out_channel
+                  , padding
+                  , rigor
+                  , verbose
+                  );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dWinogradBatchFloat
+(           float    *out_data    // minibatch x out_channel x out_size x out_size
+    , const float    *in_data     // minibatch x in_channel x in_size x in_size
+    , const float    *filter      // 16 x out_channel x in_channel (transformed kernel)
+    , const float    *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   padding     // 0 or 1
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dWinogradBatch<float> ( out_data
+                  , in_data
+                  , filter
+                  , bias
+                  , out_size
+                  , in_size
+                  , bias_size
+                  , in_channel
+                  , out_channel
+                  , minibatch
+                  , padding
+                  , rigor
+                  , verbose
+                  );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dWinogradBatchDouble
+(           double   *out_data    // minibatch x out_channel x out_size x out_size
+    , const double   *in_data     // minibatch x in_channel x in_size x in_size
+    , const double   *filter      // 16 x out_channel x in_channel (transformed kernel)
+    , const double   *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   padding     // 0 or 1
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dWinogradBatch<double> ( out_data
+                  , in_data
+                  , filter
+                  , bias
+                  , out_size
+                  , in_size
+                  , bias_size
+                  , in_channel
+                  , out_channel
+                  , minibatch
+                  , padding
+                  , rigor
+                  , verbose
+                  );
+    return dlrGetLastStatus();
+}
+
+} // extern "C"
+
+/*
+ * Revision history
+ *
+ * 2026.10.18: Started.
+ */
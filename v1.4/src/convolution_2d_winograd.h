@@ -0,0 +1,104 @@
+#pragma once
+#include <stdint.h>
+
+// software-only: Winograd F(2x2,3x3) version of Convolution2d for 3x3 kernel and stride 1
+// - 'filter' is the kernel transformed by Convolution2dWinogradFilter<Float|Double>()
+// - not for integer since the transform has fraction
+#if !defined(__SYNTHESIS__)
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#define Convolution2dWinogradFilter Convolution2dWinogradFilterFloat
+#define Convolution2dWinograd Convolution2dWinogradFloat
+#define Convolution2dWinogradBatch Convolution2dWinogradBatchFloat
+
+extern int Convolution2dWinogradFilterFloat
+(           float    *filter      // 16 x out_channel x in_channel
+    , const float    *kernel      // out_channel x in_channel x 3 x 3
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dWinogradFilterDouble
+(           double   *filter      // 16 x out_channel x in_channel
+    , const double   *kernel      // out_channel x in_channel x 3 x 3
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dWinogradFloat
+(           float    *out_data    // out_channel x out_size x out_size
+    , const float    *in_data     // in_channel x in_size x in_size
+    , const float    *filter      // 16 x out_channel x in_channel (transformed kernel)
+    , const float    *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   padding     // 0 or 1
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dWinogradDouble
+(           double   *out_data    // out_channel x out_size x out_size
+    , const double   *in_data     // in_channel x in_size x in_size
+    , const double   *filter      // 16 x out_channel x in_channel (transformed kernel)
+    , const double   *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   padding     // 0 or 1
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dWinogradBatchFloat
+(           float    *out_data    // minibatch x out_channel x out_size x out_size
+    , const float    *in_data     // minibatch x in_channel x in_size x in_size
+    , const float    *filter      // 16 x out_channel x in_channel (transformed kernel)
+    , const float    *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   padding     // 0 or 1
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dWinogradBatchDouble
+(           double   *out_data    // minibatch x out_channel x out_size x out_size
+    , const double   *in_data     // minibatch x in_channel x in_size x in_size
+    , const double   *filter      // 16 x out_channel x in_channel (transformed kernel)
+    , const double   *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   padding     // 0 or 1
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+#ifdef __cplusplus
+}
+#endif
+#endif // !defined(__SYNTHESIS__)
+/*
+ * Revision history
+ *
+ * 2026.10.18: Started.
+ */
@@ -0,0 +1,257 @@
+#pragma once
+/*
+ * Copyright (c) 2019-2020 by Future Design Systems.
+ * All right reserved.
+ * http://www.future-ds.com
+ *
+ * @file convolution_2d_winograd.hpp
+ * @brief This file contains 2 dimensional convolution routine
+ *        using Winograd F(2x2,3x3) for 3x3 kernel and stride 1
+ *        (software-only, not for HLS).
+ * @author FDS
+ * @date Oct. 18, 2026
+ */
+#if !defined(__SYNTHESIS__)
+#include <stdint.h>
+#include <stdio.h>
+#include <vector>
+#include <algorithm>
+#include "dlr_common.h"
+#include "dlr_gemm.hpp"
+
+namespace dlr { // deep learning routines
+
+#define DLR_WINOGRAD_TILE 16      // num of elements of 4x4 transformed tile
+#define DLR_WINOGRAD_SIZE (1<<22) // max num of elements of transformed tiles
+
+// Transforms 3x3 kernels to Winograd domain, i.e., U = G g G^T,
+// where G = [[1,0,0],[1/2,1/2,1/2],[1/2,-1/2,1/2],[0,0,1]].
+// The result can be reused by Convolution2dWinograd() as far as the kernel is not changed.
+template<class TYPE=float>
+void Convolution2dWinogradFilter
+(           TYPE     *filter      // 16 x out_channel x in_channel
+    , const TYPE     *kernel      // out_channel x in_channel x 3 x 3
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+)
+{
+    if (verbose) {
+        dlrInfo("in_channel =%d\n", in_channel  );
+        dlrInfo("out_channel=%d\n", out_channel );
+        fflush(stderr); fflush(stdout);
+    }
+    if (rigor) {
+        dlrCheck (in_channel>0);
+        dlrCheck (out_channel>0);
+    }
+
+    const uint32_t t_step = (uint32_t)out_channel*in_channel; // between transformed elements
+    uint32_t f, ch, i;
+
+    for (f=0; f<out_channel; ++f) {
+        for (ch=0; ch<in_channel; ++ch) {
+            const TYPE *g = kernel+(f*in_channel+ch)*9;
+            TYPE t[4][3]; // G g
+            TYPE u[4][4]; // (G g) G^T
+            for (i=0; i<3; ++i) {
+                t[0][i] = g[i];
+                t[1][i] = (g[i]+g[3+i]+g[6+i])/(TYPE)2;
+                t[2][i] = (g[i]-g[3+i]+g[6+i])/(TYPE)2;
+                t[3][i] = g[6+i];
+            }
+            for (i=0; i<4; ++i) {
+                u[i][0] = t[i][0];
+                u[i][1] = (t[i][0]+t[i][1]+t[i][2])/(TYPE)2;
+                u[i][2] = (t[i][0]-t[i][1]+t[i][2])/(TYPE)2;
+                u[i][3] = t[i][2];
+            }
+            TYPE *pU = filter+f*in_channel+ch;
+            for (i=0; i<DLR_WINOGRAD_TILE; ++i) pU[i*t_step] = u[i/4][i%4];
+        }
+    }
+}
+
+// Same results as Convolution2d() with kernel_size 3 and stride 1,
+// but it takes the kernel transformed by Convolution2dWinogradFilter().
+// Each 2x2 output tile is computed from 4x4 input tile, V = B^T d B,
+// followed by element-wise products accumulated over input channels,
+// which is done by 16 matrix multiplications, and Y = A^T M A.
+template<class TYPE=float>
+void Convolution2dWinograd
+(           TYPE     *out_data    // out_channel x out_size x out_size
+    , const TYPE     *in_data     // in_channel x in_size x in_size
+    , const TYPE     *filter      // 16 x out_channel x in_channel (transformed kernel)
+    , const TYPE     *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   padding=0   // 0 or 1
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+)
+{
+    if (verbose) {
+        dlrInfo("out_size   =%d\n", out_size    );
+        dlrInfo("in_size    =%d\n", in_size     );
+        dlrInfo("bias_size  =%d\n", bias_size   );
+        dlrInfo("in_channel =%d\n", in_channel  );
+        dlrInfo("out_channel=%d\n", out_channel );
+        dlrInfo("padding    =%d\n", padding     );
+        fflush(stderr); fflush(stdout);
+    }
+    if (rigor) {
+        dlrCheck (in_channel>0);
+        dlrCheck (out_channel>0);
+        dlrCheck (out_size==(in_size-3+2*padding+1));
+        dlrCheck (padding<=1);
+        dlrCheck ((bias_size==0)||(out_channel==bias_size));
+    }
+
+    const uint32_t t_out_area = (uint32_t)out_size*out_size;
+    const uint32_t t_in_area  = (uint32_t)in_size*in_size;
+    const uint32_t t_tiles    = ((uint32_t)out_size+1)/2; // tiles per row
+    uint32_t f, n;
+
+    for (f=0; f<out_channel; ++f) {
+        TYPE B = (bias_size==0) ? (TYPE)0 : bias[f];
+        TYPE *pZ = out_data+f*t_out_area;
+        for (n=0; n<t_out_area; ++n) pZ[n] = B;
+    }
+
+    // band of tile rows to bound the size of transformed tiles
+    uint32_t t_rows = DLR_WINOGRAD_SIZE/(DLR_WINOGRAD_TILE*t_tiles*((uint32_t)in_channel+out_channel));
+    if (t_rows<1) t_rows = 1;
+    if (t_rows>t_tiles) t_rows = t_tiles;
+    std::vector<TYPE> t_V((size_t)DLR_WINOGRAD_TILE*in_channel*t_rows*t_tiles);
+    std::vector<TYPE> t_M((size_t)DLR_WINOGRAD_TILE*out_channel*t_rows*t_tiles);
+
+    uint32_t ty0, ty, tx, ch, i, j;
+    for (ty0=0; ty0<t_tiles; ty0+=t_rows) {
+        const uint32_t rows = ((t_tiles-ty0)<t_rows) ? (t_tiles-ty0) : t_rows;
+        const uint32_t T    = rows*t_tiles; // num of tiles of this band
+
+        // input transform: V = B^T d B
+        for (ch=0; ch<in_channel; ++ch) {
+            const TYPE *pX = in_data+ch*t_in_area;
+            TYPE *pV = t_V.data()+ch*T;
+            for (ty=ty0; ty<(ty0+rows); ++ty) {
+                for (tx=0; tx<t_tiles; ++tx) {
+                    TYPE d[4][4], t[4][4];
+                    for (i=0; i<4; ++i) {
+                        const int32_t y = (int32_t)(2*ty+i)-padding;
+                        for (j=0; j<4; ++j) {
+                            const int32_t x = (int32_t)(2*tx+j)-padding;
+                            d[i][j] = ((y<0)||(y>=in_size)||(x<0)||(x>=in_size))
+                                    ? (TYPE)0 : pX[y*in_size+x];
+                        }
+                    }
+                    for (j=0; j<4; ++j) {
+                        t[0][j] = d[0][j]-d[2][j];
+                        t[1][j] = d[1][j]+d[2][j];
+                        t[2][j] = d[2][j]-d[1][j];
+                        t[3][j] = d[1][j]-d[3][j];
+                    }
+                    const uint32_t t_idx  = (ty-ty0)*t_tiles+tx;
+                    const uint32_t t_step = (uint32_t)in_channel*T;
+                    for (i=0; i<4; ++i) {
+                        pV[(i*4+0)*t_step+t_idx] = t[i][0]-t[i][2];
+                        pV[(i*4+1)*t_step+t_idx] = t[i][1]+t[i][2];
+                        pV[(i*4+2)*t_step+t_idx] = t[i][2]-t[i][1];
+                        pV[(i*4+3)*t_step+t_idx] = t[i][1]-t[i][3];
+                    }
+                } // for (tx=0
+            } // for (ty=ty0
+        } // for (ch=0
+
+        // M[xi] = U[xi] x V[xi] for each element of the tile
+        std::fill(t_M.begin(), t_M.begin()+(size_t)DLR_WINOGRAD_TILE*out_channel*T, (TYPE)0);
+        for (i=0; i<DLR_WINOGRAD_TILE; ++i) {
+            Gemm<TYPE>( t_M.data()+i*out_channel*T
+                      , filter+i*out_channel*in_channel
+                      , t_V.data()+i*in_channel*T
+                      , out_channel, T, in_channel
+                      , T, in_channel, T);
+        }
+
+        // output transform: Y = A^T M A, where A^T = [[1,1,1,0],[0,1,-1,-1]]
+        const uint32_t t_step = (uint32_t)out_channel*T;
+        for (f=0; f<out_channel; ++f) {
+            const TYPE *pM = t_M.data()+f*T;
+            TYPE *pZ = out_data+f*t_out_area;
+            for (ty=ty0; ty<(ty0+rows); ++ty) {
+                for (tx=0; tx<t_tiles; ++tx) {
+                    const uint32_t t_idx = (ty-ty0)*t_tiles+tx;
+                    TYPE m[4][4], t[2][4];
+                    for (i=0; i<DLR_WINOGRAD_TILE; ++i) m[i/4][i%4] = pM[i*t_step+t_idx];
+                    for (j=0; j<4; ++j) {
+                        t[0][j] = m[0][j]+m[1][j]+m[2][j];
+                        t[1][j] = m[1][j]-m[2][j]-m[3][j];
+                    }
+                    for (i=0; i<2; ++i) {
+                        const uint32_t r = 2*ty+i;
+                        if (r>=out_size) break;
+                        pZ[r*out_size+2*tx] += t[i][0]+t[i][1]+t[i][2];
+                        if ((2*tx+1)<out_size)
+                            pZ[r*out_size+2*tx+1] += t[i][1]-t[i][2]-t[i][3];
+                    }
+                } // for (tx=0
+            } // for (ty=ty0
+        } // for (f=0
+    } // for (ty0=0
+}
+
+template<class TYPE=float>
+void Convolution2dWinogradBatch
+(           TYPE     *out_data    // minibatch x out_channel x out_size x out_size
+    , const TYPE     *in_data     // minibatch x in_channel x in_size x in_size
+    , const TYPE     *filter      // 16 x out_channel x in_channel (transformed kernel)
+    , const TYPE     *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   padding=0   // 0 or 1
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+)
+{
+    const uint32_t t_out_step=(uint32_t)out_channel*out_size*out_size;
+    const uint32_t t_in_step =(uint32_t)in_channel*in_size*in_size;
+    TYPE       *pZ = out_data;
+    const TYPE *pX = in_data;
+    uint16_t mb;
+
+    for (mb=0; mb<minibatch; ++mb) {
+        Convolution2dWinograd<TYPE>
+        (     pZ
+            , pX
+            , filter
+            , bias
+            , out_size
+            , in_size
+            , bias_size
+            , in_channel
+            , out_channel
+            , padding
+            , rigor
+            , verbose
+        );
+        pZ += t_out_step;
+        pX += t_in_step;
+    }
+}
+
+} // namespace dlr
+#endif // !defined(__SYNTHESIS__)
+/*
+ * Revision history
+ *
+ * 2026.10.18: 'dlrCheck()' in place of 'assert()' for rigor checks.
+ * 2026.10.18: Started.
+ */
@@ -1,9 +1,10 @@
 
 #include "deconvolution_2d.hpp"
+#include "dlr_fixed.hpp"
 
 extern "C" {
 
-void Deconvolution2dInt
+int Deconvolution2dInt
 (           int      *out_data    // out_channel x out_size x out_size
     , const int      *in_data     // in_channel x in_size x in_size
     , const int      *kernel      // out_channel x kernel_size x kernel_size
@@ -22,6 +23,7 @@ void Deconvolution2dInt
     #endif
 )
 {
+    dlrClearLastError();
     dlr::Deconvolution2d<int>
     (     out_data
         , in_data
@@ -40,9 +42,10 @@ void Deconvolution2dInt
         , verbose
         #endif
     );
+    return dlrGetLastStatus();
 }
 
-void Deconvolution2dFloat
+int Deconvolution2dFloat
 (           float    *out_data    // out_channel x out_size x out_size
     , const float    *in_data     // in_channel x in_size x in_size
     , const float    *kernel      // out_channel x kernel_size x kernel_size
@@ -61,6 +64,7 @@ void Deconvolution2dFloat
     #endif
 )
 {
+    dlrClearLastError();
     dlr::Deconvolution2d<float>
     (     out_data
         , in_data
@@ -79,9 +83,10 @@ void Deconvolution2dFloat
         , verbose
         #endif
     );
+    return dlrGetLastStatus();
 }
 
-void Deconvolution2dDouble
+int Deconvolution2dDouble
 (           double   *out_data    // out_channel x out_size x out_size
     , const double   *in_data     // in_channel x in_size x in_size
     , const double   *kernel      // out_channel x kernel_size x kernel_size
@@ -100,6 +105,7 @@ void Deconvolution2dDouble
     #endif
 )
 {
+    dlrClearLastError();
     dlr::Deconvolution2d<double>
     (     out_data
         , in_data
@@ -118,6 +124,215 @@ void Deconvolution2dDouble
         , verbose
         #endif
     );
+    return dlrGetLastStatus();
 }
 
+int Deconvolution2dBatchInt
+(           int      *out_data    // minibatch x out_channel x out_size x out_size
+    , const int      *in_data     // minibatch x in_channel x in_size x in_size
+    , const int      *kernel      // in_channel x out_channel x kernel_size x kernel_size
+    , const int      *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint8_t   bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Deconvolution2dBatch<int>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Deconvolution2dBatchFloat
+(           float    *out_data    // minibatch x out_channel x out_size x out_size
+    , const float    *in_data     // minibatch x in_channel x in_size x in_size
+    , const float    *kernel      // in_channel x out_channel x kernel_size x kernel_size
+    , const float    *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint8_t   bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Deconvolution2dBatch<float>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Deconvolution2dBatchDouble
+(           double   *out_data    // minibatch x out_channel x out_size x out_size
+    , const double   *in_data     // minibatch x in_channel x in_size x in_size
+    , const double   *kernel      // in_channel x out_channel x kernel_size x kernel_size
+    , const double   *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint8_t   bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Deconvolution2dBatch<double>
+    (     out_data
+        , in_data
+        , kernel
+        , bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+#if !defined(__SYNTHESIS__)
+// fixed-point of dlr_fixed.hpp, whose data are raw bits (see dlrSetFixedFormat())
+int Deconvolution2dFixed
+(           int32_t  *out_data    // out_channel x out_size x out_size
+    , const int32_t  *in_data     // in_channel x in_size x in_size
+    , const int32_t  *kernel      // out_channel x kernel_size x kernel_size
+    , const int32_t  *bias
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint8_t   bias_size
+    , const uint16_t  in_channel
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor   // check rigorously when 1
+    , const int       verbose // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Deconvolution2d<dlr::Fixed>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , (const dlr::Fixed*)kernel
+        , (const dlr::Fixed*)bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , stride
+        , padding
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Deconvolution2dBatchFixed
+(           int32_t  *out_data    // minibatch x out_channel x out_size x out_size
+    , const int32_t  *in_data     // minibatch x in_channel x in_size x in_size
+    , const int32_t  *kernel      // in_channel x out_channel x kernel_size x kernel_size
+    , const int32_t  *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint8_t   bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Deconvolution2dBatch<dlr::Fixed>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , (const dlr::Fixed*)kernel
+        , (const dlr::Fixed*)bias
+        , out_size
+        , in_size
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , minibatch
+        , stride
+        , padding
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+#endif
+
 } // extern "C"
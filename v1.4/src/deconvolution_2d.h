@@ -6,8 +6,9 @@ extern "C" {
 #endif
 
 #define Deconvolution2d Deconvolution2dFloat
+#define Deconvolution2dBatch Deconvolution2dBatchFloat
 
-extern void Deconvolution2dInt
+extern int Deconvolution2dInt
 (           int      *out_data    // out_channel x out_size x out_size
     , const int      *in_data     // in_channel x in_size x in_size
     , const int      *kernel      // out_channel x kernel_size x kernel_size
@@ -26,7 +27,7 @@ extern void Deconvolution2dInt
     #endif
 );
 
-extern void Deconvolution2dFloat
+extern int Deconvolution2dFloat
 (           float    *out_data    // out_channel x out_size x out_size
     , const float    *in_data     // in_channel x in_size x in_size
     , const float    *kernel      // out_channel x kernel_size x kernel_size
@@ -45,7 +46,7 @@ extern void Deconvolution2dFloat
     #endif
 );
 
-extern void Deconvolution2dDouble
+extern int Deconvolution2dDouble
 (           double   *out_data    // out_channel x out_size x out_size
     , const double   *in_data     // in_channel x in_size x in_size
     , const double   *kernel      // out_channel x kernel_size x kernel_size
@@ -64,6 +65,104 @@ extern void Deconvolution2dDouble
     #endif
 );
 
+extern int Deconvolution2dBatchInt
+(           int      *out_data    // minibatch x out_channel x out_size x out_size
+    , const int      *in_data     // minibatch x in_channel x in_size x in_size
+    , const int      *kernel      // in_channel x out_channel x kernel_size x kernel_size
+    , const int      *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint8_t   bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+extern int Deconvolution2dBatchFloat
+(           float    *out_data    // minibatch x out_channel x out_size x out_size
+    , const float    *in_data     // minibatch x in_channel x in_size x in_size
+    , const float    *kernel      // in_channel x out_channel x kernel_size x kernel_size
+    , const float    *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint8_t   bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+extern int Deconvolution2dBatchDouble
+(           double   *out_data    // minibatch x out_channel x out_size x out_size
+    , const double   *in_data     // minibatch x in_channel x in_size x in_size
+    , const double   *kernel      // in_channel x out_channel x kernel_size x kernel_size
+    , const double   *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint8_t   bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+#if !defined(__SYNTHESIS__)
+// fixed-point of raw bits in the format of dlrSetFixedFormat()
+extern int Deconvolution2dFixed
+(           int32_t  *out_data    // out_channel x out_size x out_size
+    , const int32_t  *in_data     // in_channel x in_size x in_size
+    , const int32_t  *kernel      // out_channel x kernel_size x kernel_size
+    , const int32_t  *bias
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint8_t   bias_size
+    , const uint16_t  in_channel
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor   // check rigorously when 1
+    , const int       verbose // verbose level
+);
+
+extern int Deconvolution2dBatchFixed
+(           int32_t  *out_data    // minibatch x out_channel x out_size x out_size
+    , const int32_t  *in_data     // minibatch x in_channel x in_size x in_size
+    , const int32_t  *kernel      // in_channel x out_channel x kernel_size x kernel_size
+    , const int32_t  *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint8_t   bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+#endif
+
 #ifdef __cplusplus
 }
 #endif
@@ -13,7 +13,6 @@
 #include <string.h>
 #if !defined(__SYNTHESIS__)
 #include <stdio.h>
-#include <assert.h>
 #include <typeinfo>
 #include "dlr_common.h"
 #endif
@@ -57,16 +56,16 @@ void Deconvolution2d
         fflush(stderr); fflush(stdout);
     }
     if (rigor) {
-        assert (in_channel>0);
-        assert (out_channel>0);
-        assert (out_size==((in_size-1)*stride-2*padding+(kernel_size-1)+1));
+        dlrCheck (in_channel>0);
+        dlrCheck (out_channel>0);
+        dlrCheck (out_size==((in_size-1)*stride-2*padding+(kernel_size-1)+1));
         //assert (out_size==((in_size-1)*stride-2*padding+dilation*(kernel_size-1)+output_padding+1));
         //assert ((kernel_size%2)==1);
-        assert (out_size>0);
-        assert (stride>0);
+        dlrCheck (out_size>0);
+        dlrCheck (stride>0);
         //assert (padding<=(kernel_size/2));
         //assert (output_padding < dilation && output_padding < stride);
-        assert ((bias_size==0)||(out_channel==bias_size));
+        dlrCheck ((bias_size==0)||(out_channel==bias_size));
     }
     #undef QuoteMacro
     #undef QuoteIdent
@@ -86,6 +85,9 @@ void Deconvolution2d
     uint16_t t_width, t_height;
     uint16_t t_padded_size = out_size + 2*padding;;
 
+    #if !defined(__SYNTHESIS__) && defined(_OPENMP)
+    #pragma omp parallel for private(ch, i, j, k, g, r, c, t_width, t_height)
+    #endif
     for (f=0; f<out_channel; ++f) {
         TYPE B = (bias_size==(TYPE)0) ? (TYPE)0 : *(bias+f);
         TYPE *pZ = (TYPE*)(out_data+(f*out_size*out_size));
@@ -112,19 +114,19 @@ void Deconvolution2d
                     for (g=0; g<kernel_size; ++g){
                         for (k=0; k<kernel_size; ++k){
                             TYPE accum = (TYPE)0;
-                            t_width = j+c;
-                            t_height = r+i;
-                            pZ = (TYPE*)(out_data+(f*out_size*out_size)
-                                                  +((r+g-padding)*out_size
-                                                  +c+k-padding));
+                            t_width = c+k; // column of output in padded
+                            t_height = r+g; // row of output in padded
                             if (padding==0 || !IsPadding(t_width, t_height, padding, out_size)) {
+                                 pZ = (TYPE*)(out_data+(f*out_size*out_size)
+                                                       +((r+g-padding)*out_size
+                                                       +c+k-padding));
                                  pW = (TYPE*)(  kernel+(ch*out_channel*kernel_size*kernel_size)
                                                        +(f*kernel_size*kernel_size)
                                                        +(g*kernel_size
                                                        +k));
                                  accum += (*pX)*(*pW);
+                                 *pZ += accum; // not touching outside of out_data in padding
                             }
-                            *pZ += accum;
                         }
                     }
                 }
@@ -141,10 +143,66 @@ void Deconvolution2d
 
 // output padding is assymmetric. it’s only applied in the right and the bottom of the image.
 
+// minibatch version: in_data and out_data have leading minibatch dimension
+template<class TYPE=float>
+void Deconvolution2dBatch
+(           TYPE     *out_data    // minibatch x out_channel x out_size x out_size
+    , const TYPE     *in_data     // minibatch x in_channel x in_size x in_size
+    , const TYPE     *kernel      // in_channel x out_channel x kernel_size x kernel_size
+    , const TYPE     *bias        // out_channel
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint8_t   bias_size   // out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding=0
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+    #endif
+)
+{
+    const uint32_t t_out_step=(uint32_t)out_channel*out_size*out_size;
+    const uint32_t t_in_step =(uint32_t)in_channel*in_size*in_size;
+    TYPE       *pZ = out_data;
+    const TYPE *pX = in_data;
+    uint16_t mb;
+
+    for (mb=0; mb<minibatch; ++mb) {
+        Deconvolution2d<TYPE>
+        (     pZ
+            , pX
+            , kernel
+            , bias
+            , out_size
+            , in_size
+            , kernel_size
+            , bias_size
+            , in_channel
+            , out_channel
+            , stride
+            , padding
+            #if !defined(__SYNTHESIS__)
+            , rigor
+            , verbose
+            #endif
+        );
+        pZ += t_out_step;
+        pX += t_in_step;
+    }
+}
+
 } // namespace dlr
 /*
  * Revision history
  *
+ * 2026.10.18: 'dlrCheck()' in place of 'assert()' for rigor checks.
+ * 2026.10.18: OpenMP for 'f' loop when built with OpenMP.
+ * 2026.10.18: padding checked at output position, not touching outside of out_data.
+ * 2026.10.18: 'Deconvolution2dBatch' added for minibatch.
  * 2020.11.12: '*pZ++ = B' HLS pointer arithmetic bug-fixed
  * 2020.09.20: parameter order of bias and bias_size changed.
  *             parameter 'rigor' and 'verbose' added.
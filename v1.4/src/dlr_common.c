@@ -16,6 +16,9 @@
 #include <sys/types.h>
 #include <sys/stat.h>
 #include <libgen.h>
+#if defined(_OPENMP)
+#include <omp.h>
+#endif
 
 #include "dlr_common.h"
 
@@ -24,6 +27,28 @@
 #define stream_info  stdout
 #define stream_std   stdout
 
+#if defined(_MSC_VER)
+#define DLR_THREAD_LOCAL __declspec(thread)
+#else
+#define DLR_THREAD_LOCAL __thread
+#endif
+
+// last error of each thread
+static DLR_THREAD_LOCAL int  dlrLastStatus=DLR_SUCCESS;
+static DLR_THREAD_LOCAL char dlrLastError[512];
+
+static void dlrSetErrorVa(const char *file,
+                          const int line,
+                          const char *func,
+                          const char *fmt,
+                          va_list ap)
+{
+    int len = snprintf(dlrLastError, sizeof(dlrLastError), "%s %d %s(): ", basename((char*)file), line, func);
+    if ((len<0)||(len>=(int)sizeof(dlrLastError))) len = 0;
+    vsnprintf(dlrLastError+len, sizeof(dlrLastError)-len, fmt, ap);
+    dlrLastStatus = DLR_FAILURE;
+}
+
 void dlrErrorCore(const char *file,
                   const int line,
                   const char *func,
@@ -36,7 +61,37 @@ void dlrErrorCore(const char *file,
     va_start(ap, fmt);
     vfprintf(stream_error, fmt, ap);
     va_end(ap);
-    exit(1);
+    va_start(ap, fmt);
+    dlrSetErrorVa(file, line, func, fmt, ap);
+    va_end(ap);
+}
+
+int dlrSetErrorCore(const char *file,
+                    const int line,
+                    const char *func,
+                    const char *fmt, ...)
+{
+    va_list ap;
+    va_start(ap, fmt);
+    dlrSetErrorVa(file, line, func, fmt, ap);
+    va_end(ap);
+    return(DLR_FAILURE);
+}
+
+void dlrClearLastError(void)
+{
+    dlrLastStatus   = DLR_SUCCESS;
+    dlrLastError[0] = '\0';
+}
+
+int dlrGetLastStatus(void)
+{
+    return(dlrLastStatus);
+}
+
+const char *dlrGetLastError(void)
+{
+    return(dlrLastError);
 }
 
 int dlrWarnCore(const char *file,
@@ -84,9 +139,31 @@ int dlrPrintCore(const char *file,
     return(ret);
 }
 
+int dlrSetNumThreads(const int num_threads)
+{
+#if defined(_OPENMP)
+    int num = (num_threads>0) ? num_threads : omp_get_num_procs();
+    omp_set_num_threads(num);
+    return(num);
+#else
+    return(1);
+#endif
+}
+
+int dlrGetNumThreads(void)
+{
+#if defined(_OPENMP)
+    return(omp_get_max_threads());
+#else
+    return(1);
+#endif
+}
+
 /*
  * Revision history
  *
+ * 2026.10.18: dlrErrorCore() records the error instead of exit(), dlrGetLastError() added.
+ * 2026.10.18: dlrSetNumThreads() and dlrGetNumThreads() added.
  * 2021.10.04: basename() added
  * 2020.09.20: Started by Ando Ki (adki@future-ds.com)
  */
@@ -25,12 +25,80 @@ extern int  dlrWarnCore (const char *filename, const int lnum, const char *funcn
 extern int  dlrInfoCore (const char *filename, const int lnum, const char *funcname, const char *fmt, ...);
 extern int  dlrPrintCore(const char *filename, const int lnum, const char *funcname, const char *fmt, ...);
 
+// status returned by routines of C interface, where the message of the last
+// error of the calling thread is kept until the next call (see dlrGetLastError()).
+#define DLR_SUCCESS   0
+#define DLR_FAILURE  -1
+
+#define  dlrSetError(...)  dlrSetErrorCore(__FFL__, ##__VA_ARGS__)
+
+extern int         dlrSetErrorCore(const char *filename, const int lnum, const char *funcname, const char *fmt, ...);
+extern void        dlrClearLastError(void);
+extern int         dlrGetLastStatus(void); // DLR_SUCCESS or DLR_FAILURE
+extern const char *dlrGetLastError(void);  // empty string when no error
+
+// checks of 'rigor' in place of assert(), which records the error and
+// returns from the calling routine instead of aborting the process.
+#define dlrCheckReturn(cond, value)\
+    do { if (!(cond)) { dlrSetError("check failed: %s\n", #cond); return value; } } while (0)
+#define dlrCheck(cond) dlrCheckReturn(cond, )
+
+// element-wise routines run in place, i.e., 'out' is 'in' exactly,
+// but 'out' should not overlap 'in' partially for 'num' elements.
+#define dlrCheckAlias(out, in, num)\
+    dlrCheck (((const void*)(out)==(const void*)(in))||\
+              ((const void*)((out)+(num))<=(const void*)(in))||\
+              ((const void*)((in)+(num))<=(const void*)(out)))
+
+// number of threads of the library built with OpenMP (see 'OPENMP' in Makefile).
+// It returns the number of threads to be used; always 1 when built without OpenMP.
+extern int  dlrSetNumThreads(const int num_threads); // 0 for all processors
+extern int  dlrGetNumThreads(void);
+
+// instruction set of float kernels (see dlr_simd.hpp), where the best one
+// of the CPU is selected when the library is loaded.
+#define DLR_ISA_SCALAR  0
+#define DLR_ISA_AVX2    1
+#define DLR_ISA_AVX512  2
+#define DLR_ISA_NEON    3
+extern int  dlrSetIsa(const int isa); // -1 for the best, DLR_FAILURE when not supported by the CPU
+extern int  dlrGetIsa(void);
+
+// accuracy of float approximations such as ActivationSigmoidFloatFast()
+#define DLR_ACCURACY_EXACT 0 // float library function
+#define DLR_ACCURACY_LUT   1 // table with linear interpolation
+#define DLR_ACCURACY_POLY  2 // rational polynomial
+
+// function of table-driven activation for quantized data (see ActivationLutBuildInt())
+#define DLR_LUT_SIGMOID    0
+#define DLR_LUT_TANH       1
+#define DLR_LUT_LEAKYRELU  2
+
+// format of fixed-point routines such as Convolution2dFixed(), whose data are
+// int32_t raw bits of 'value*2^(width-int_width)' (see dlr_fixed.hpp), i.e.,
+// 'ap_fixed<width, int_width, quantization, overflow>' of HLS,
+// where the default is 'ap_fixed<16, 8, AP_TRN, AP_WRAP>'.
+#define DLR_FIXED_TRN      0 // truncation to minus infinity (AP_TRN)
+#define DLR_FIXED_RND      1 // rounding to plus infinity (AP_RND)
+#define DLR_FIXED_RND_CONV 2 // rounding to nearest even (AP_RND_CONV)
+#define DLR_FIXED_WRAP     0 // wrap-around (AP_WRAP)
+#define DLR_FIXED_SAT      1 // saturation (AP_SAT)
+extern int  dlrSetFixedFormat(const int width, const int int_width, const int quantization, const int overflow);
+extern void dlrGetFixedFormat(int *width, int *int_width, int *quantization, int *overflow);
+
 #ifdef __cplusplus
 }
 #endif
 /*
  * Revision history
  *
+ * 2026.10.18: dlrSetFixedFormat() and dlrGetFixedFormat() added.
+ * 2026.10.18: dlrCheckAlias() added for in-place execution.
+ * 2026.10.18: DLR_LUT_SIGMOID/TANH/LEAKYRELU added.
+ * 2026.10.18: DLR_ACCURACY_EXACT/LUT/POLY added.
+ * 2026.10.18: dlrSetIsa() and dlrGetIsa() added.
+ * 2026.10.18: dlrGetLastError() and dlrCheck() added in place of exit() and assert().
+ * 2026.10.18: dlrSetNumThreads() and dlrGetNumThreads() added.
  * 2021.10.04: basename() used.
  * 2020.09.20: Started by Ando Ki (adki@future-ds.com)
  */
@@ -0,0 +1,59 @@
+/*
+ * Copyright (c) 2019-2020 by Future Design Systems.
+ * All right reserved.
+ * http://www.future-ds.com
+ *
+ * @file dlr_fixed.cpp
+ * @brief This file contains the format of fixed-point data type of dlr_fixed.hpp.
+ * @author FDS
+ * @date Oct. 18, 2026
+ */
+#include <stddef.h>
+#include <stdint.h>
+#include "dlr_common.h"
+#include "dlr_fixed.hpp"
+
+namespace dlr { // deep learning routines
+
+// ap_fixed<16, 8, AP_TRN, AP_WRAP>
+FixedFormat fixed_format = { 16, 8, 8, DLR_FIXED_TRN, DLR_FIXED_WRAP, -(1<<15), (1<<15)-1 };
+
+} // namespace dlr
+
+extern "C" {
+
+int dlrSetFixedFormat(const int width, const int int_width, const int quantization, const int overflow)
+{
+    if ((width<1)||(width>32)) return dlrSetError("width should be 1..32: %d\n", width);
+    if (((width-int_width)<0)||((width-int_width)>31))
+        return dlrSetError("fraction bits (width-int_width) should be 0..31: %d\n", width-int_width);
+    if ((quantization!=DLR_FIXED_TRN)&&(quantization!=DLR_FIXED_RND)&&(quantization!=DLR_FIXED_RND_CONV))
+        return dlrSetError("unknown quantization: %d\n", quantization);
+    if ((overflow!=DLR_FIXED_WRAP)&&(overflow!=DLR_FIXED_SAT))
+        return dlrSetError("unknown overflow: %d\n", overflow);
+    dlr::FixedFormat t_format;
+    t_format.width        = width;
+    t_format.int_width    = int_width;
+    t_format.frac         = width-int_width;
+    t_format.quantization = quantization;
+    t_format.overflow     = overflow;
+    t_format.min          = -((int64_t)1<<(width-1));
+    t_format.max          = ((int64_t)1<<(width-1))-1;
+    dlr::fixed_format = t_format;
+    return DLR_SUCCESS;
+}
+
+void dlrGetFixedFormat(int *width, int *int_width, int *quantization, int *overflow)
+{
+    if (width       !=NULL) *width        = dlr::fixed_format.width;
+    if (int_width   !=NULL) *int_width    = dlr::fixed_format.int_width;
+    if (quantization!=NULL) *quantization = dlr::fixed_format.quantization;
+    if (overflow    !=NULL) *overflow     = dlr::fixed_format.overflow;
+}
+
+} // extern "C"
+/*
+ * Revision history
+ *
+ * 2026.10.18: Started.
+ */
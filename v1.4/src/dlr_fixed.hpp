@@ -0,0 +1,229 @@
+#pragma once
+/*
+ * Copyright (c) 2019-2020 by Future Design Systems.
+ * All right reserved.
+ * http://www.future-ds.com
+ *
+ * @file dlr_fixed.hpp
+ * @brief This file contains fixed-point data type emulating 'ap_fixed' of HLS
+ *        for bit-accurate verification of routines (software-only, not for HLS).
+ * @author FDS
+ * @date Oct. 18, 2026
+ */
+#if !defined(__SYNTHESIS__)
+#include <stdint.h>
+#include <math.h>
+#include "dlr_common.h"
+
+namespace dlr { // deep learning routines
+
+// 'Fixed' stands for 'ap_fixed<width, int_width, quantization, overflow>',
+// where the format is shared by all values and set at run time by
+// dlrSetFixedFormat() so that bit-widths change without re-building.
+// - a value is int32_t raw bits of 'value*2^frac', where 'frac=width-int_width'
+// - an expression of Fixed goes 'FixedValue', which keeps all bits of the
+//   result as 'ap_fixed' does, e.g., a product has 2*frac fraction bits
+// - a 'FixedValue' is quantized and checked for overflow when it goes to Fixed,
+//   e.g., 'accum += x*w' rounds once, as 'ap_fixed' does
+// - a quotient is truncated to 'frac' fraction bits before it goes to Fixed
+struct FixedFormat {
+    int32_t width;        // total bits including sign, 1..32
+    int32_t int_width;    // integer bits including sign
+    int32_t frac;         // fraction bits, i.e., width-int_width, 0..31
+    int32_t quantization; // DLR_FIXED_TRN, DLR_FIXED_RND, DLR_FIXED_RND_CONV
+    int32_t overflow;     // DLR_FIXED_WRAP, DLR_FIXED_SAT
+    int64_t min;          // the smallest raw bits
+    int64_t max;          // the largest raw bits
+};
+
+extern FixedFormat fixed_format; // see dlr_fixed.cpp
+
+// Returns raw bits of 'value*2^-frac' in the format
+inline int32_t FixedQuantize(int64_t value, const int32_t frac)
+{
+    const FixedFormat &t_format = fixed_format;
+    const int32_t t_shift = frac-t_format.frac;
+    if (t_shift>0) {
+        if (t_shift>62) {
+            value = (value<0) ? -1 : 0;
+        } else {
+            if (t_format.quantization==DLR_FIXED_RND) {
+                value += (int64_t)1<<(t_shift-1);
+            } else if (t_format.quantization==DLR_FIXED_RND_CONV) {
+                value += (((int64_t)1<<(t_shift-1))-1)+((value>>t_shift)&1);
+            }
+            value >>= t_shift;
+        }
+    } else if (t_shift<0) {
+        value = (int64_t)((uint64_t)value<<-t_shift);
+    }
+    if (t_format.overflow==DLR_FIXED_SAT) {
+        if (value<t_format.min) return (int32_t)t_format.min;
+        if (value>t_format.max) return (int32_t)t_format.max;
+        return (int32_t)value;
+    }
+    const int32_t t_wrap = 64-t_format.width;
+    return (int32_t)((int64_t)((uint64_t)value<<t_wrap)>>t_wrap);
+}
+
+// Returns raw bits of real 'value' in the format
+inline int32_t FixedQuantizeReal(const double value)
+{
+    double t_value = ldexp(value, fixed_format.frac);
+    switch (fixed_format.quantization) {
+    case DLR_FIXED_RND     : t_value = floor(t_value+0.5); break;
+    case DLR_FIXED_RND_CONV: t_value = nearbyint(t_value); break;
+    default                : t_value = floor(t_value); break;
+    }
+    const double t_limit = 4611686018427387904.0; // 2^62
+    if (!(t_value>-t_limit)) t_value = -t_limit; // NaN goes the smallest
+    if (t_value>t_limit) t_value = t_limit;
+    return FixedQuantize((int64_t)t_value, fixed_format.frac);
+}
+
+class Fixed;
+
+// exact value 'mv_raw*2^-mv_frac' of an expression of Fixed
+class FixedValue {
+public:
+    int64_t mv_raw;
+    int32_t mv_frac;
+    FixedValue(const int64_t raw, const int32_t frac) : mv_raw(raw), mv_frac(frac) {}
+    inline FixedValue(const Fixed &value);
+    explicit operator double() const { return ldexp((double)mv_raw, -mv_frac); }
+    explicit operator float() const { return (float)(double)*this; }
+};
+
+class Fixed {
+public:
+    int32_t mv_raw; // raw bits
+    Fixed() = default;
+    Fixed(const int value) : mv_raw(FixedQuantize(value, 0)) {}
+    Fixed(const unsigned int value) : mv_raw(FixedQuantize(value, 0)) {}
+    Fixed(const float value) : mv_raw(FixedQuantizeReal(value)) {}
+    Fixed(const double value) : mv_raw(FixedQuantizeReal(value)) {}
+    explicit Fixed(const FixedValue &value) : mv_raw(FixedQuantize(value.mv_raw, value.mv_frac)) {}
+    Fixed &operator=(const FixedValue &value) { mv_raw = FixedQuantize(value.mv_raw, value.mv_frac); return *this; }
+    explicit operator double() const { return ldexp((double)mv_raw, -fixed_format.frac); }
+    explicit operator float() const { return (float)(double)*this; }
+    explicit operator int() const { return (int)(double)*this; } // truncation to zero
+    static Fixed mf_raw(const int32_t raw) { Fixed t_value; t_value.mv_raw = raw; return t_value; }
+    inline Fixed &operator+=(const FixedValue &value);
+    inline Fixed &operator-=(const FixedValue &value);
+    inline Fixed &operator*=(const FixedValue &value);
+    inline Fixed &operator/=(const FixedValue &value);
+};
+
+static_assert(sizeof(Fixed)==sizeof(int32_t), "Fixed should be raw bits of int32_t");
+
+inline FixedValue::FixedValue(const Fixed &value) : mv_raw(value.mv_raw), mv_frac(fixed_format.frac) {}
+
+// Aligns fraction bits of 'a' and 'b' to the larger one
+inline int32_t FixedAlign(int64_t &a, const int32_t a_frac, int64_t &b, const int32_t b_frac)
+{
+    if (a_frac<b_frac) { a = (int64_t)((uint64_t)a<<(b_frac-a_frac)); return b_frac; }
+    if (a_frac>b_frac) { b = (int64_t)((uint64_t)b<<(a_frac-b_frac)); }
+    return a_frac;
+}
+
+inline FixedValue operator+(const FixedValue &a, const FixedValue &b)
+{
+    int64_t t_a = a.mv_raw, t_b = b.mv_raw;
+    const int32_t t_frac = FixedAlign(t_a, a.mv_frac, t_b, b.mv_frac);
+    return FixedValue(t_a+t_b, t_frac);
+}
+
+inline FixedValue operator-(const FixedValue &a, const FixedValue &b)
+{
+    int64_t t_a = a.mv_raw, t_b = b.mv_raw;
+    const int32_t t_frac = FixedAlign(t_a, a.mv_frac, t_b, b.mv_frac);
+    return FixedValue(t_a-t_b, t_frac);
+}
+
+inline FixedValue operator-(const FixedValue &a)
+{
+    return FixedValue(-a.mv_raw, a.mv_frac);
+}
+
+inline FixedValue operator*(const FixedValue &a, const FixedValue &b)
+{
+    return FixedValue(a.mv_raw*b.mv_raw, a.mv_frac+b.mv_frac);
+}
+
+inline FixedValue operator/(const FixedValue &a, const FixedValue &b)
+{
+    const int32_t t_frac  = fixed_format.frac;
+    const int32_t t_shift = t_frac+b.mv_frac-a.mv_frac;
+    if (b.mv_raw==0) return FixedValue((a.mv_raw<0) ? INT64_MIN/2 : INT64_MAX/2, t_frac);
+    const int64_t t_a = (t_shift>=0) ? (int64_t)((uint64_t)a.mv_raw<<t_shift) : (a.mv_raw>>-t_shift);
+    return FixedValue(t_a/b.mv_raw, t_frac);
+}
+
+// operations with integer are exact, e.g., 'sum/(kernel_size*kernel_size)'
+inline FixedValue operator+(const FixedValue &a, const int b) { return a+FixedValue(b, 0); }
+inline FixedValue operator-(const FixedValue &a, const int b) { return a-FixedValue(b, 0); }
+inline FixedValue operator*(const FixedValue &a, const int b) { return a*FixedValue(b, 0); }
+inline FixedValue operator/(const FixedValue &a, const int b) { return a/FixedValue(b, 0); }
+inline FixedValue operator+(const int a, const FixedValue &b) { return FixedValue(a, 0)+b; }
+inline FixedValue operator-(const int a, const FixedValue &b) { return FixedValue(a, 0)-b; }
+inline FixedValue operator*(const int a, const FixedValue &b) { return FixedValue(a, 0)*b; }
+inline FixedValue operator/(const int a, const FixedValue &b) { return FixedValue(a, 0)/b; }
+
+// real goes Fixed in the format first, e.g., 'var+epsilon'
+inline FixedValue operator+(const FixedValue &a, const double b) { return a+Fixed(b); }
+inline FixedValue operator-(const FixedValue &a, const double b) { return a-Fixed(b); }
+inline FixedValue operator*(const FixedValue &a, const double b) { return a*Fixed(b); }
+inline FixedValue operator/(const FixedValue &a, const double b) { return a/Fixed(b); }
+inline FixedValue operator+(const double a, const FixedValue &b) { return Fixed(a)+b; }
+inline FixedValue operator-(const double a, const FixedValue &b) { return Fixed(a)-b; }
+inline FixedValue operator*(const double a, const FixedValue &b) { return Fixed(a)*b; }
+inline FixedValue operator/(const double a, const FixedValue &b) { return Fixed(a)/b; }
+
+// Returns -1, 0, 1 for 'a<b', 'a==b' and 'a>b'
+inline int FixedCompare(const FixedValue &a, const FixedValue &b)
+{
+    int64_t t_a = a.mv_raw, t_b = b.mv_raw;
+    FixedAlign(t_a, a.mv_frac, t_b, b.mv_frac);
+    return (t_a<t_b) ? -1 : (t_a>t_b) ? 1 : 0;
+}
+
+// Fixed of the same format compares raw bits directly, e.g., for max pooling
+#define DLR_FIXED_COMPARE(OP)\
+    inline bool operator OP(const FixedValue &a, const FixedValue &b) { return FixedCompare(a, b) OP 0; }\
+    inline bool operator OP(const FixedValue &a, const int b) { return FixedCompare(a, FixedValue(b, 0)) OP 0; }\
+    inline bool operator OP(const int a, const FixedValue &b) { return FixedCompare(FixedValue(a, 0), b) OP 0; }\
+    inline bool operator OP(const Fixed &a, const Fixed &b) { return a.mv_raw OP b.mv_raw; }\
+    inline bool operator OP(const Fixed &a, const int b) { return FixedCompare(a, FixedValue(b, 0)) OP 0; }\
+    inline bool operator OP(const int a, const Fixed &b) { return FixedCompare(FixedValue(a, 0), b) OP 0; }\
+    inline bool operator OP(const FixedValue &a, const double b) { return FixedCompare(a, Fixed(b)) OP 0; }\
+    inline bool operator OP(const double a, const FixedValue &b) { return FixedCompare(Fixed(a), b) OP 0; }\
+    inline bool operator OP(const Fixed &a, const double b) { return FixedCompare(a, Fixed(b)) OP 0; }\
+    inline bool operator OP(const double a, const Fixed &b) { return FixedCompare(Fixed(a), b) OP 0; }
+DLR_FIXED_COMPARE(==)
+DLR_FIXED_COMPARE(!=)
+DLR_FIXED_COMPARE(<)
+DLR_FIXED_COMPARE(<=)
+DLR_FIXED_COMPARE(>)
+DLR_FIXED_COMPARE(>=)
+#undef DLR_FIXED_COMPARE
+
+inline Fixed &Fixed::operator+=(const FixedValue &value) { return *this = FixedValue(*this)+value; }
+inline Fixed &Fixed::operator-=(const FixedValue &value) { return *this = FixedValue(*this)-value; }
+inline Fixed &Fixed::operator*=(const FixedValue &value) { return *this = FixedValue(*this)*value; }
+inline Fixed &Fixed::operator/=(const FixedValue &value) { return *this = FixedValue(*this)/value; }
+
+// sqrt() of normalization goes real and rounded in the format,
+// while sqrt() of float and double are kept in namespace dlr.
+using ::sqrt;
+inline Fixed sqrt(const FixedValue &value)
+{
+    return Fixed(::sqrt((double)value));
+}
+
+} // namespace dlr
+#endif // !defined(__SYNTHESIS__)
+/*
+ * Revision history
+ *
+ * 2026.10.18: Started.
+ */
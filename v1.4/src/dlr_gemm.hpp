@@ -0,0 +1,224 @@
+#pragma once
+/*
+ * Copyright (c) 2019-2020 by Future Design Systems.
+ * All right reserved.
+ * http://www.future-ds.com
+ *
+ * @file dlr_gemm.hpp
+ * @brief This file contains cache-blocked and register-tiled matrix multiplication
+ *        for software-only fast routines (not for HLS).
+ * @author FDS
+ * @date Oct. 18, 2026
+ */
+#if !defined(__SYNTHESIS__)
+#include <stdint.h>
+
+namespace dlr { // deep learning routines
+
+#define DLR_GEMM_MR   4 // rows of register tile
+#define DLR_GEMM_NR   8 // columns of register tile
+#define DLR_GEMM_MC  64 // rows of cache block
+#define DLR_GEMM_KC 256 // depth of cache block
+#define DLR_GEMM_NC 512 // columns of cache block
+
+// C[mr][nr] += A[mr][kc] x B[kc][nr] on the register tile
+template<class TYPE=float>
+static inline void GemmMicro
+(           TYPE     *C
+    , const TYPE     *A
+    , const TYPE     *B
+    , const uint32_t  mr
+    , const uint32_t  nr
+    , const uint32_t  kc
+    , const uint32_t  ldc
+    , const uint32_t  lda
+    , const uint32_t  ldb
+)
+{
+    TYPE acc[DLR_GEMM_MR][DLR_GEMM_NR];
+    uint32_t i, j, p;
+
+    for (i=0; i<DLR_GEMM_MR; ++i)
+        for (j=0; j<DLR_GEMM_NR; ++j) acc[i][j] = (TYPE)0;
+
+    if ((mr==DLR_GEMM_MR)&&(nr==DLR_GEMM_NR)) {
+        for (p=0; p<kc; ++p) {
+            const TYPE *pB = B+p*ldb;
+            for (i=0; i<DLR_GEMM_MR; ++i) {
+                const TYPE a = A[i*lda+p];
+                for (j=0; j<DLR_GEMM_NR; ++j) acc[i][j] += a*pB[j];
+            }
+        }
+    } else { // edge of matrix
+        for (p=0; p<kc; ++p) {
+            const TYPE *pB = B+p*ldb;
+            for (i=0; i<mr; ++i) {
+                const TYPE a = A[i*lda+p];
+                for (j=0; j<nr; ++j) acc[i][j] += a*pB[j];
+            }
+        }
+    }
+    for (i=0; i<mr; ++i)
+        for (j=0; j<nr; ++j) C[i*ldc+j] += acc[i][j];
+}
+
+// C[M][N] += A[M][K] x B[K][N], where all matrices are row-major
+// and ldc/lda/ldb are the number of elements between rows.
+template<class TYPE=float>
+void Gemm
+(           TYPE     *C
+    , const TYPE     *A
+    , const TYPE     *B
+    , const uint32_t  M
+    , const uint32_t  N
+    , const uint32_t  K
+    , const uint32_t  ldc
+    , const uint32_t  lda
+    , const uint32_t  ldb
+)
+{
+    uint32_t kk;
+    int32_t  mm; // signed for OpenMP
+
+    for (kk=0; kk<K; kk+=DLR_GEMM_KC) {
+        const uint32_t kc = ((K-kk)<DLR_GEMM_KC) ? (K-kk) : DLR_GEMM_KC;
+        #if defined(_OPENMP)
+        #pragma omp parallel for
+        #endif
+        for (mm=0; mm<(int32_t)M; mm+=DLR_GEMM_MC) {
+            const uint32_t mc = ((M-mm)<DLR_GEMM_MC) ? (M-mm) : DLR_GEMM_MC;
+            uint32_t nn, i, j;
+            for (nn=0; nn<N; nn+=DLR_GEMM_NC) {
+                const uint32_t nc = ((N-nn)<DLR_GEMM_NC) ? (N-nn) : DLR_GEMM_NC;
+                for (i=0; i<mc; i+=DLR_GEMM_MR) {
+                    const uint32_t mr = ((mc-i)<DLR_GEMM_MR) ? (mc-i) : DLR_GEMM_MR;
+                    for (j=0; j<nc; j+=DLR_GEMM_NR) {
+                        const uint32_t nr = ((nc-j)<DLR_GEMM_NR) ? (nc-j) : DLR_GEMM_NR;
+                        GemmMicro<TYPE>( C+(mm+i)*ldc+nn+j
+                                       , A+(mm+i)*lda+kk
+                                       , B+kk*ldb+nn+j
+                                       , mr, nr, kc
+                                       , ldc, lda, ldb);
+                    }
+                }
+            }
+        }
+    }
+}
+
+// Packs A[M][K] into panels of DLR_GEMM_MR rows, i.e., Ap[(M+MR-1)/MR][K][MR],
+// where missing rows of the last panel are filled with zero.
+// Ap should have GemmPackedSize(M,K) elements.
+static inline uint32_t GemmPackedSize(const uint32_t M, const uint32_t K)
+{
+    return ((M+DLR_GEMM_MR-1)/DLR_GEMM_MR)*DLR_GEMM_MR*K;
+}
+
+template<class TYPE=float>
+void GemmPackA
+(           TYPE     *Ap
+    , const TYPE     *A
+    , const uint32_t  M
+    , const uint32_t  K
+    , const uint32_t  lda
+)
+{
+    uint32_t m, i, p;
+    for (m=0; m<M; m+=DLR_GEMM_MR) {
+        TYPE *pA = Ap+m*K;
+        for (p=0; p<K; ++p) {
+            for (i=0; i<DLR_GEMM_MR; ++i) {
+                *pA++ = ((m+i)<M) ? A[(m+i)*lda+p] : (TYPE)0;
+            }
+        }
+    }
+}
+
+// C[mr][nr] += Ap[kc][MR] x B[kc][nr] on the register tile, where Ap is a packed panel
+template<class TYPE=float>
+static inline void GemmMicroPacked
+(           TYPE     *C
+    , const TYPE     *Ap
+    , const TYPE     *B
+    , const uint32_t  mr
+    , const uint32_t  nr
+    , const uint32_t  kc
+    , const uint32_t  ldc
+    , const uint32_t  ldb
+)
+{
+    TYPE acc[DLR_GEMM_MR][DLR_GEMM_NR];
+    uint32_t i, j, p;
+
+    for (i=0; i<DLR_GEMM_MR; ++i)
+        for (j=0; j<DLR_GEMM_NR; ++j) acc[i][j] = (TYPE)0;
+
+    if (nr==DLR_GEMM_NR) {
+        for (p=0; p<kc; ++p) {
+            const TYPE *pA = Ap+p*DLR_GEMM_MR;
+            const TYPE *pB = B+p*ldb;
+            for (i=0; i<DLR_GEMM_MR; ++i)
+                for (j=0; j<DLR_GEMM_NR; ++j) acc[i][j] += pA[i]*pB[j];
+        }
+    } else { // edge of matrix
+        for (p=0; p<kc; ++p) {
+            const TYPE *pA = Ap+p*DLR_GEMM_MR;
+            const TYPE *pB = B+p*ldb;
+            for (i=0; i<DLR_GEMM_MR; ++i)
+                for (j=0; j<nr; ++j) acc[i][j] += pA[i]*pB[j];
+        }
+    }
+    for (i=0; i<mr; ++i)
+        for (j=0; j<nr; ++j) C[i*ldc+j] += acc[i][j];
+}
+
+// C[M][N] += A[M][K] x B[K][N], where A is packed by GemmPackA().
+template<class TYPE=float>
+void GemmPacked
+(           TYPE     *C
+    , const TYPE     *Ap
+    , const TYPE     *B
+    , const uint32_t  M
+    , const uint32_t  N
+    , const uint32_t  K
+    , const uint32_t  ldc
+    , const uint32_t  ldb
+)
+{
+    uint32_t kk;
+    int32_t  mm; // signed for OpenMP
+
+    for (kk=0; kk<K; kk+=DLR_GEMM_KC) {
+        const uint32_t kc = ((K-kk)<DLR_GEMM_KC) ? (K-kk) : DLR_GEMM_KC;
+        #if defined(_OPENMP)
+        #pragma omp parallel for
+        #endif
+        for (mm=0; mm<(int32_t)M; mm+=DLR_GEMM_MC) {
+            const uint32_t mc = ((M-mm)<DLR_GEMM_MC) ? (M-mm) : DLR_GEMM_MC;
+            uint32_t nn, i, j;
+            for (nn=0; nn<N; nn+=DLR_GEMM_NC) {
+                const uint32_t nc = ((N-nn)<DLR_GEMM_NC) ? (N-nn) : DLR_GEMM_NC;
+                for (i=0; i<mc; i+=DLR_GEMM_MR) {
+                    const uint32_t mr = ((mc-i)<DLR_GEMM_MR) ? (mc-i) : DLR_GEMM_MR;
+                    for (j=0; j<nc; j+=DLR_GEMM_NR) {
+                        const uint32_t nr = ((nc-j)<DLR_GEMM_NR) ? (nc-j) : DLR_GEMM_NR;
+                        GemmMicroPacked<TYPE>( C+(mm+i)*ldc+nn+j
+                                             , Ap+(mm+i)*K+kk*DLR_GEMM_MR
+                                             , B+kk*ldb+nn+j
+                                             , mr, nr, kc
+                                             , ldc, ldb);
+                    }
+                }
+            }
+        }
+    }
+}
+
+} // namespace dlr
+#endif // !defined(__SYNTHESIS__)
+/*
+ * Revision history
+ *
+ * 2026.10.18: 'GemmPackA' and 'GemmPacked' added for packed weights.
+ * 2026.10.18: Started.
+ */
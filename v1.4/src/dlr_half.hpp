@@ -0,0 +1,119 @@
+#pragma once
+/*
+ * Copyright (c) 2019-2020 by Future Design Systems.
+ * All right reserved.
+ * http://www.future-ds.com
+ *
+ * @file dlr_half.hpp
+ * @brief This file contains half-precision (fp16) and bfloat16 storage types,
+ *        which are computed and accumulated in float.
+ * @author FDS
+ * @date Oct. 18, 2026
+ */
+#include <stdint.h>
+#include <string.h>
+
+namespace dlr { // deep learning routines
+
+// Type of accumulator for sum of products of TYPE, which is TYPE itself
+// except for storage-only types such as 'Half' and 'BFloat16' below.
+// e.g., 'typename Accumulator<TYPE>::type sum = 0; sum += x*w;'
+template<class TYPE>
+struct Accumulator { typedef TYPE type; };
+
+#if !defined(__SYNTHESIS__)
+// Returns IEEE 754 binary16 bits of 'value' rounded to nearest even
+inline uint16_t FloatToHalf(const float value)
+{
+    uint32_t t_bits;
+    memcpy(&t_bits, &value, sizeof(t_bits));
+    const uint16_t t_sign = (uint16_t)((t_bits>>16)&0x8000);
+    uint32_t t_abs = t_bits&0x7FFFFFFF;
+    if (t_abs>0x7F800000) return t_sign|0x7E00; // NaN goes quiet NaN
+    if (t_abs>=0x477FF000) return t_sign|0x7C00; // 65520 and above go infinity
+    if (t_abs<0x38800000) { // subnormal of half, i.e., less than 2^-14
+        if (t_abs<0x33000000) return t_sign; // 2^-25 and less go zero
+        const uint32_t t_shift = 126-(t_abs>>23);
+        const uint32_t t_man   = (t_abs&0x7FFFFF)|0x800000;
+        const uint32_t t_half  = (uint32_t)1<<(t_shift-1);
+        const uint32_t t_rem   = t_man&((t_half<<1)-1);
+        uint32_t t_value = t_man>>t_shift;
+        if ((t_rem>t_half)||((t_rem==t_half)&&(t_value&1))) t_value++;
+        return t_sign|(uint16_t)t_value;
+    }
+    t_abs -= (uint32_t)112<<23; // exponent bias of 127 to 15
+    t_abs += 0xFFF+((t_abs>>13)&1);
+    return t_sign|(uint16_t)(t_abs>>13);
+}
+
+// Returns float of IEEE 754 binary16 bits
+inline float HalfToFloat(const uint16_t raw)
+{
+    const uint32_t t_sign = (uint32_t)(raw&0x8000)<<16;
+    const uint32_t t_exp  = (raw>>10)&0x1F;
+    const uint32_t t_man  = raw&0x3FF;
+    uint32_t t_bits;
+    if (t_exp==0x1F) {
+        t_bits = t_sign|0x7F800000|(t_man<<13); // infinity or NaN
+    } else if (t_exp!=0) {
+        t_bits = t_sign|((t_exp+112)<<23)|(t_man<<13);
+    } else {
+        const float t_value = (float)t_man*5.9604644775390625e-8f; // subnormal: t_man*2^-24
+        return (t_sign) ? -t_value : t_value;
+    }
+    float t_value;
+    memcpy(&t_value, &t_bits, sizeof(t_value));
+    return t_value;
+}
+
+// Returns bfloat16 bits of 'value' rounded to nearest even, i.e., upper half of float
+inline uint16_t FloatToBFloat16(const float value)
+{
+    uint32_t t_bits;
+    memcpy(&t_bits, &value, sizeof(t_bits));
+    if ((t_bits&0x7FFFFFFF)>0x7F800000) return (uint16_t)((t_bits>>16)|0x40); // quiet NaN
+    t_bits += 0x7FFF+((t_bits>>16)&1);
+    return (uint16_t)(t_bits>>16);
+}
+
+// Returns float of bfloat16 bits
+inline float BFloat16ToFloat(const uint16_t raw)
+{
+    const uint32_t t_bits = (uint32_t)raw<<16;
+    float t_value;
+    memcpy(&t_value, &t_bits, sizeof(t_value));
+    return t_value;
+}
+
+// 16-bit storage of float, where a value goes float for any operation,
+// e.g., 'x*w' is float*float, and is rounded only when stored.
+// Routines halve memory traffic of data, while sum of products goes
+// float by Accumulator<> and is rounded once to the output.
+#define DLR_HALF_TYPE(NAME, TO_RAW, TO_FLOAT)\
+class NAME {\
+public:\
+    uint16_t mv_raw;\
+    NAME() = default;\
+    NAME(const float value) : mv_raw(TO_RAW(value)) {}\
+    NAME(const double value) : mv_raw(TO_RAW((float)value)) {}\
+    NAME(const int value) : mv_raw(TO_RAW((float)value)) {}\
+    NAME(const unsigned int value) : mv_raw(TO_RAW((float)value)) {}\
+    operator float() const { return TO_FLOAT(mv_raw); }\
+    NAME &operator+=(const float value) { mv_raw = TO_RAW(TO_FLOAT(mv_raw)+value); return *this; }\
+    NAME &operator-=(const float value) { mv_raw = TO_RAW(TO_FLOAT(mv_raw)-value); return *this; }\
+    NAME &operator*=(const float value) { mv_raw = TO_RAW(TO_FLOAT(mv_raw)*value); return *this; }\
+    NAME &operator/=(const float value) { mv_raw = TO_RAW(TO_FLOAT(mv_raw)/value); return *this; }\
+};\
+static_assert(sizeof(NAME)==sizeof(uint16_t), #NAME " should be raw bits of uint16_t");\
+template<> struct Accumulator<NAME> { typedef float type; };
+DLR_HALF_TYPE(Half, FloatToHalf, HalfToFloat)         // IEEE 754 binary16 (fp16)
+DLR_HALF_TYPE(BFloat16, FloatToBFloat16, BFloat16ToFloat) // upper half of float (bf16)
+#undef DLR_HALF_TYPE
+#endif // !defined(__SYNTHESIS__)
+
+} // namespace dlr
+/*
+ * Revision history
+ *
+ * 2026.10.18: Started.
+ */
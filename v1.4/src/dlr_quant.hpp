@@ -0,0 +1,53 @@
+#pragma once
+/*
+ * Copyright (c) 2019-2020 by Future Design Systems.
+ * All right reserved.
+ * http://www.future-ds.com
+ *
+ * @file dlr_quant.hpp
+ * @brief This file contains requantization of int32 accumulators to int8
+ *        for quantized routines (software-only, not for HLS).
+ * @author FDS
+ * @date Oct. 18, 2026
+ */
+#if !defined(__SYNTHESIS__)
+#include <stdint.h>
+
+namespace dlr { // deep learning routines
+
+// Quantized value 'q' stands for 'scale*(q-zero_point)', where weights are
+// symmetric (zero_point 0) and scaled per output channel, while activations
+// are asymmetric and scaled per tensor. An accumulator of products of
+// (q_in-in_zero_point) and q_weight has scale of 'in_scale*weight_scale[c]',
+// which goes to the output by the real multiplier
+//     M[c] = in_scale*weight_scale[c]/out_scale = multiplier[c]*2^-(31+shift[c]),
+// where 'multiplier' is Q31 in [2^30, 2^31) and 'shift' is in [-30, 32].
+// Integer-only arithmetic gives the same bits as fixed-point hardware.
+#define DLR_INT8_MIN  (-128)
+#define DLR_INT8_MAX  ( 127)
+
+// bytes of a block of int8 kernels, which stays in cache while all windows
+// of input are multiplied by it
+#define DLR_QUANT_BLOCK (128*1024)
+
+inline int8_t Requantize
+(     const int32_t  accum
+    , const int32_t  multiplier
+    , const int8_t   shift
+    , const int32_t  zero_point
+)
+{
+    const int32_t t_shift = 31+shift;
+    int64_t value = (int64_t)accum*multiplier;
+    value = (value+((int64_t)1<<(t_shift-1)))>>t_shift; // round half up
+    value += zero_point;
+    return (int8_t)((value<DLR_INT8_MIN) ? DLR_INT8_MIN : (value>DLR_INT8_MAX) ? DLR_INT8_MAX : value);
+}
+
+} // namespace dlr
+#endif // !defined(__SYNTHESIS__)
+/*
+ * Revision history
+ *
+ * 2026.10.18: Started.
+ */
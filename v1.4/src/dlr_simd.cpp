@@ -0,0 +1,1039 @@
+/*
+ * Copyright (c) 2019-2020 by Future Design Systems.
+ * All right reserved.
+ * http://www.future-ds.com
+ *
+ * @file dlr_simd.cpp
+ * @brief This file contains float (and int8 dot, half conversion) kernels of AVX2, AVX-512, NEON
+ *        and scalar with their runtime dispatch.
+ * @author FDS
+ * @date Oct. 18, 2026
+ */
+#include <stdint.h>
+#include <math.h>
+#include "dlr_common.h"
+#include "dlr_simd.hpp"
+
+#if defined(__x86_64__) || defined(__i386__)
+#include <immintrin.h>
+#define DLR_SIMD_X86
+#define DLR_TARGET_AVX2   __attribute__((target("avx2,fma")))
+#define DLR_TARGET_AVX512 __attribute__((target("avx512f")))
+#define DLR_TARGET_F16C   __attribute__((target("avx2,f16c")))
+#elif defined(__aarch64__)
+#include <arm_neon.h>
+#define DLR_SIMD_NEON
+#endif
+
+namespace dlr { // deep learning routines
+
+struct SimdKernels {
+    int    isa;
+    float (*dot)(const float *a, const float *b, uint32_t n);
+    void  (*dot_tile)(float *z, uint32_t ldz, const float *x, uint32_t ldx, const float *w, uint32_t ldw, uint32_t n);
+    void  (*conv_row)(float *z, const float *x, const float *w, uint32_t n, uint32_t ld, uint8_t kernel_size);
+    void  (*max)(float *z, const float *a, const float *b, uint32_t n);
+    void  (*scale_shift)(float *z, const float *x, float a, float b, uint32_t n);
+    void  (*relu)(float *z, const float *x, uint32_t n);
+    void  (*leaky_relu)(float *z, const float *x, float slope, uint32_t n);
+    void  (*tanh_poly)(float *z, const float *x, float in_scale, float out_scale, float out_shift, uint32_t n);
+    void  (*sigmoid_lut)(float *z, const float *x, float in_scale, float out_scale, float out_shift, uint32_t n);
+    int32_t (*dot_int8)(const int16_t *x, const int8_t *w, uint32_t n);
+    void  (*half_to_float)(float *z, const uint16_t *x, uint32_t n);
+    void  (*float_to_half)(uint16_t *z, const float *x, uint32_t n);
+    void  (*bfloat16_to_float)(float *z, const uint16_t *x, uint32_t n);
+    void  (*float_to_bfloat16)(uint16_t *z, const float *x, uint32_t n);
+    float (*sum)(const float *x, uint32_t n);
+    float (*reduce_max)(const float *x, uint32_t n);
+};
+
+//------------------------------------------------------------------------------
+// tanh(x) = x*P(x^2)/Q(x^2) for |x|<DLR_TANH_CLAMP, which is within a few ulp
+// of float, and x itself for |x|<DLR_TANH_TINY.
+#define DLR_TANH_CLAMP  7.90531110763549805f
+#define DLR_TANH_TINY   0.0004f
+#define DLR_TANH_A1     4.89352455891786e-03f
+#define DLR_TANH_A3     6.37261928875436e-04f
+#define DLR_TANH_A5     1.48572235717979e-05f
+#define DLR_TANH_A7     5.12229709037114e-08f
+#define DLR_TANH_A9    -8.60467152213735e-11f
+#define DLR_TANH_A11    2.00018790482477e-13f
+#define DLR_TANH_A13   -2.76076847742355e-16f
+#define DLR_TANH_B0     4.89352518554385e-03f
+#define DLR_TANH_B2     2.26843463243900e-03f
+#define DLR_TANH_B4     1.18534705686654e-04f
+#define DLR_TANH_B6     1.19825839466702e-06f
+
+// sigmoid(x) sampled over [-DLR_LUT_RANGE, DLR_LUT_RANGE] at 1/DLR_LUT_SCALE,
+// which is linearly interpolated; the error is about 1.2E-5 (2.4E-5 for tanh).
+#define DLR_LUT_RANGE   16
+#define DLR_LUT_SCALE   32
+#define DLR_LUT_SIZE    (2*DLR_LUT_RANGE*DLR_LUT_SCALE+1)
+
+static float lut_sigmoid[DLR_LUT_SIZE+1]; // one more for interpolation of the last
+
+static bool SimdLutInit(void)
+{
+    for (int i=0; i<=DLR_LUT_SIZE; ++i) {
+        const double x = (double)(i-DLR_LUT_RANGE*DLR_LUT_SCALE)/DLR_LUT_SCALE;
+        lut_sigmoid[i] = (float)(1.0/(1.0+exp(-x)));
+    }
+    return true;
+}
+static const bool lut_ready = SimdLutInit();
+
+//------------------------------------------------------------------------------
+// scalar, which also handles remainders of vector kernels
+static float DotScalar(const float *a, const float *b, uint32_t n)
+{
+    float sum=0.0f;
+    for (uint32_t i=0; i<n; ++i) sum += a[i]*b[i];
+    return sum;
+}
+
+// z[i*ldz+j] = dot of x[i*ldx...] and w[j*ldw...] for i,j<DLR_SIMD_TILE
+static void DotTileScalar(float *z, uint32_t ldz, const float *x, uint32_t ldx, const float *w, uint32_t ldw, uint32_t n)
+{
+    for (uint32_t i=0; i<DLR_SIMD_TILE; ++i) {
+        for (uint32_t j=0; j<DLR_SIMD_TILE; ++j) {
+            z[i*ldz+j] = DotScalar(x+i*ldx, w+j*ldw, n);
+        }
+    }
+}
+
+// dot of int16 'x' and int8 'w' in int32, where x is int8 less zero point
+static int32_t DotInt8Scalar(const int16_t *x, const int8_t *w, uint32_t n)
+{
+    int32_t sum=0;
+    for (uint32_t i=0; i<n; ++i) sum += (int32_t)x[i]*w[i];
+    return sum;
+}
+
+static void ConvRowScalar(float *z, const float *x, const float *w, uint32_t n, uint32_t ld, uint8_t kernel_size)
+{
+    for (uint32_t k=0; k<n; ++k) {
+        float accum=z[k];
+        for (uint8_t i=0; i<kernel_size; ++i) {
+            for (uint8_t j=0; j<kernel_size; ++j) {
+                accum += w[i*kernel_size+j]*x[i*ld+k+j];
+            }
+        }
+        z[k] = accum;
+    }
+}
+
+static void MaxScalar(float *z, const float *a, const float *b, uint32_t n)
+{
+    for (uint32_t i=0; i<n; ++i) z[i] = (a[i]<b[i]) ? b[i] : a[i];
+}
+
+static float SumScalar(const float *x, uint32_t n)
+{
+    float sum=0.0f;
+    for (uint32_t i=0; i<n; ++i) sum += x[i];
+    return sum;
+}
+
+// max of 'max' and x[n], which takes remainders of vector kernels
+static float ReduceMaxScalar(const float *x, uint32_t n, float max)
+{
+    for (uint32_t i=0; i<n; ++i) if (max<x[i]) max = x[i];
+    return max;
+}
+
+static float ReduceMaxScalar(const float *x, uint32_t n)
+{
+    return ReduceMaxScalar(x+1, n-1, x[0]);
+}
+
+static void ScaleShiftScalar(float *z, const float *x, float a, float b, uint32_t n)
+{
+    for (uint32_t i=0; i<n; ++i) z[i] = a*x[i]+b;
+}
+
+static void ReLuScalar(float *z, const float *x, uint32_t n)
+{
+    for (uint32_t i=0; i<n; ++i) z[i] = (x[i]<=0.0f) ? 0.0f : x[i];
+}
+
+static void LeakyReLuScalar(float *z, const float *x, float slope, uint32_t n)
+{
+    for (uint32_t i=0; i<n; ++i) z[i] = (x[i]<0.0f) ? x[i]*slope : x[i];
+}
+
+static inline float TanhPoly(float v)
+{
+    if ((v!=v)||(fabsf(v)<DLR_TANH_TINY)) return v; // NaN or tiny
+    const float x  = (v<-DLR_TANH_CLAMP) ? -DLR_TANH_CLAMP : (v>DLR_TANH_CLAMP) ? DLR_TANH_CLAMP : v;
+    const float x2 = x*x;
+    float p = DLR_TANH_A13;
+    p = p*x2+DLR_TANH_A11;
+    p = p*x2+DLR_TANH_A9;
+    p = p*x2+DLR_TANH_A7;
+    p = p*x2+DLR_TANH_A5;
+    p = p*x2+DLR_TANH_A3;
+    p = p*x2+DLR_TANH_A1;
+    float q = DLR_TANH_B6;
+    q = q*x2+DLR_TANH_B4;
+    q = q*x2+DLR_TANH_B2;
+    q = q*x2+DLR_TANH_B0;
+    return (x*p)/q;
+}
+
+static void TanhPolyScalar(float *z, const float *x, float in_scale, float out_scale, float out_shift, uint32_t n)
+{
+    for (uint32_t i=0; i<n; ++i) z[i] = out_scale*TanhPoly(in_scale*x[i])+out_shift;
+}
+
+static inline float SigmoidLut(float v)
+{
+    if (v!=v) return v; // NaN, which would index out of the table
+    float t = (v+DLR_LUT_RANGE)*DLR_LUT_SCALE;
+    t = (t<0.0f) ? 0.0f : (t>(float)(DLR_LUT_SIZE-1)) ? (float)(DLR_LUT_SIZE-1) : t;
+    const int32_t k = (int32_t)t;
+    const float   f = t-(float)k;
+    return lut_sigmoid[k]+f*(lut_sigmoid[k+1]-lut_sigmoid[k]);
+}
+
+static void SigmoidLutScalar(float *z, const float *x, float in_scale, float out_scale, float out_shift, uint32_t n)
+{
+    for (uint32_t i=0; i<n; ++i) z[i] = out_scale*SigmoidLut(in_scale*x[i])+out_shift;
+}
+
+static void HalfToFloatScalar(float *z, const uint16_t *x, uint32_t n)
+{
+    for (uint32_t i=0; i<n; ++i) z[i] = HalfToFloat(x[i]);
+}
+
+static void FloatToHalfScalar(uint16_t *z, const float *x, uint32_t n)
+{
+    for (uint32_t i=0; i<n; ++i) z[i] = FloatToHalf(x[i]);
+}
+
+static void BFloat16ToFloatScalar(float *z, const uint16_t *x, uint32_t n)
+{
+    for (uint32_t i=0; i<n; ++i) z[i] = BFloat16ToFloat(x[i]);
+}
+
+static void FloatToBFloat16Scalar(uint16_t *z, const float *x, uint32_t n)
+{
+    for (uint32_t i=0; i<n; ++i) z[i] = FloatToBFloat16(x[i]);
+}
+
+static const SimdKernels kernels_scalar = { DLR_ISA_SCALAR
+                                          , DotScalar
+                                          , DotTileScalar
+                                          , ConvRowScalar
+                                          , MaxScalar
+                                          , ScaleShiftScalar
+                                          , ReLuScalar
+                                          , LeakyReLuScalar
+                                          , TanhPolyScalar
+                                          , SigmoidLutScalar
+                                          , DotInt8Scalar
+                                          , HalfToFloatScalar
+                                          , FloatToHalfScalar
+                                          , BFloat16ToFloatScalar
+                                          , FloatToBFloat16Scalar
+                                          , SumScalar
+                                          , ReduceMaxScalar };
+
+#if defined(DLR_SIMD_X86)
+//------------------------------------------------------------------------------
+// AVX2 with FMA: 8 floats, remainder goes scalar
+DLR_TARGET_AVX2
+static float DotAvx2(const float *a, const float *b, uint32_t n)
+{
+    __m256 acc0 = _mm256_setzero_ps();
+    __m256 acc1 = _mm256_setzero_ps();
+    uint32_t i=0;
+    for (; i+16<=n; i+=16) {
+        acc0 = _mm256_fmadd_ps(_mm256_loadu_ps(a+i  ), _mm256_loadu_ps(b+i  ), acc0);
+        acc1 = _mm256_fmadd_ps(_mm256_loadu_ps(a+i+8), _mm256_loadu_ps(b+i+8), acc1);
+    }
+    for (; i+8<=n; i+=8) {
+        acc0 = _mm256_fmadd_ps(_mm256_loadu_ps(a+i), _mm256_loadu_ps(b+i), acc0);
+    }
+    acc0 = _mm256_add_ps(acc0, acc1);
+    __m128 t = _mm_add_ps(_mm256_castps256_ps128(acc0), _mm256_extractf128_ps(acc0, 1));
+    t = _mm_add_ps(t, _mm_movehl_ps(t, t));
+    t = _mm_add_ss(t, _mm_movehdup_ps(t));
+    return _mm_cvtss_f32(t)+DotScalar(a+i, b+i, n-i);
+}
+
+// 16 pairs of int16 by 'madd' into 8 int32, where w goes int16 by sign extension
+DLR_TARGET_AVX2
+static int32_t DotInt8Avx2(const int16_t *x, const int8_t *w, uint32_t n)
+{
+    __m256i acc0 = _mm256_setzero_si256();
+    __m256i acc1 = _mm256_setzero_si256();
+    uint32_t i=0;
+    for (; i+32<=n; i+=32) {
+        const __m256i w0 = _mm256_cvtepi8_epi16(_mm_loadu_si128((const __m128i*)(w+i   )));
+        const __m256i w1 = _mm256_cvtepi8_epi16(_mm_loadu_si128((const __m128i*)(w+i+16)));
+        acc0 = _mm256_add_epi32(acc0, _mm256_madd_epi16(_mm256_loadu_si256((const __m256i*)(x+i   )), w0));
+        acc1 = _mm256_add_epi32(acc1, _mm256_madd_epi16(_mm256_loadu_si256((const __m256i*)(x+i+16)), w1));
+    }
+    for (; i+16<=n; i+=16) {
+        const __m256i w0 = _mm256_cvtepi8_epi16(_mm_loadu_si128((const __m128i*)(w+i)));
+        acc0 = _mm256_add_epi32(acc0, _mm256_madd_epi16(_mm256_loadu_si256((const __m256i*)(x+i)), w0));
+    }
+    acc0 = _mm256_add_epi32(acc0, acc1);
+    __m128i t = _mm_add_epi32(_mm256_castsi256_si128(acc0), _mm256_extracti128_si256(acc0, 1));
+    t = _mm_add_epi32(t, _mm_shuffle_epi32(t, 0x4E));
+    t = _mm_add_epi32(t, _mm_shuffle_epi32(t, 0xB1));
+    return _mm_cvtsi128_si32(t)+DotInt8Scalar(x+i, w+i, n-i);
+}
+
+// two tiles of 4x2, since 4x4 accumulators and loads do not fit 16 registers
+DLR_TARGET_AVX2
+static void DotTileAvx2(float *z, uint32_t ldz, const float *x, uint32_t ldx, const float *w, uint32_t ldw, uint32_t n)
+{
+    for (uint32_t j=0; j<DLR_SIMD_TILE; j+=2) {
+        const float *w0 = w+(j  )*ldw;
+        const float *w1 = w+(j+1)*ldw;
+        __m256 acc[4][2];
+        for (uint32_t i=0; i<4; ++i) acc[i][0] = acc[i][1] = _mm256_setzero_ps();
+        uint32_t k=0;
+        for (; k+8<=n; k+=8) {
+            const __m256 vw0 = _mm256_loadu_ps(w0+k);
+            const __m256 vw1 = _mm256_loadu_ps(w1+k);
+            for (uint32_t i=0; i<4; ++i) {
+                const __m256 vx = _mm256_loadu_ps(x+i*ldx+k);
+                acc[i][0] = _mm256_fmadd_ps(vx, vw0, acc[i][0]);
+                acc[i][1] = _mm256_fmadd_ps(vx, vw1, acc[i][1]);
+            }
+        }
+        for (uint32_t i=0; i<4; ++i) {
+            for (uint32_t jj=0; jj<2; ++jj) {
+                __m128 t = _mm_add_ps(_mm256_castps256_ps128(acc[i][jj]), _mm256_extractf128_ps(acc[i][jj], 1));
+                t = _mm_add_ps(t, _mm_movehl_ps(t, t));
+                t = _mm_add_ss(t, _mm_movehdup_ps(t));
+                z[i*ldz+j+jj] = _mm_cvtss_f32(t)+DotScalar(x+i*ldx+k, w+(j+jj)*ldw+k, n-k);
+            }
+        }
+    }
+}
+
+DLR_TARGET_AVX2
+static void ConvRowAvx2(float *z, const float *x, const float *w, uint32_t n, uint32_t ld, uint8_t kernel_size)
+{
+    uint32_t k=0;
+    for (; k+8<=n; k+=8) {
+        __m256 acc = _mm256_loadu_ps(z+k);
+        for (uint8_t i=0; i<kernel_size; ++i) {
+            const float *pX = x+i*ld+k;
+            const float *pW = w+i*kernel_size;
+            for (uint8_t j=0; j<kernel_size; ++j) {
+                acc = _mm256_fmadd_ps(_mm256_set1_ps(pW[j]), _mm256_loadu_ps(pX+j), acc);
+            }
+        }
+        _mm256_storeu_ps(z+k, acc);
+    }
+    ConvRowScalar(z+k, x+k, w, n-k, ld, kernel_size);
+}
+
+DLR_TARGET_AVX2
+static void MaxAvx2(float *z, const float *a, const float *b, uint32_t n)
+{
+    uint32_t i=0;
+    for (; i+8<=n; i+=8) {
+        // max(b,a) gives 'b' only when a<b as MaxScalar() does
+        _mm256_storeu_ps(z+i, _mm256_max_ps(_mm256_loadu_ps(b+i), _mm256_loadu_ps(a+i)));
+    }
+    MaxScalar(z+i, a+i, b+i, n-i);
+}
+
+DLR_TARGET_AVX2
+static float SumAvx2(const float *x, uint32_t n)
+{
+    __m256 acc0 = _mm256_setzero_ps();
+    __m256 acc1 = _mm256_setzero_ps();
+    uint32_t i=0;
+    for (; i+16<=n; i+=16) {
+        acc0 = _mm256_add_ps(acc0, _mm256_loadu_ps(x+i  ));
+        acc1 = _mm256_add_ps(acc1, _mm256_loadu_ps(x+i+8));
+    }
+    for (; i+8<=n; i+=8) {
+        acc0 = _mm256_add_ps(acc0, _mm256_loadu_ps(x+i));
+    }
+    acc0 = _mm256_add_ps(acc0, acc1);
+    __m128 t = _mm_add_ps(_mm256_castps256_ps128(acc0), _mm256_extractf128_ps(acc0, 1));
+    t = _mm_add_ps(t, _mm_movehl_ps(t, t));
+    t = _mm_add_ss(t, _mm_movehdup_ps(t));
+    return _mm_cvtss_f32(t)+SumScalar(x+i, n-i);
+}
+
+DLR_TARGET_AVX2
+static float ReduceMaxAvx2(const float *x, uint32_t n)
+{
+    if (n<8) return ReduceMaxScalar(x, n);
+    __m256 acc = _mm256_loadu_ps(x);
+    uint32_t i=8;
+    for (; i+8<=n; i+=8) {
+        acc = _mm256_max_ps(_mm256_loadu_ps(x+i), acc);
+    }
+    __m128 t = _mm_max_ps(_mm256_castps256_ps128(acc), _mm256_extractf128_ps(acc, 1));
+    t = _mm_max_ps(t, _mm_movehl_ps(t, t));
+    t = _mm_max_ss(t, _mm_movehdup_ps(t));
+    return ReduceMaxScalar(x+i, n-i, _mm_cvtss_f32(t));
+}
+
+DLR_TARGET_AVX2
+static void ScaleShiftAvx2(float *z, const float *x, float a, float b, uint32_t n)
+{
+    const __m256 va = _mm256_set1_ps(a);
+    const __m256 vb = _mm256_set1_ps(b);
+    uint32_t i=0;
+    for (; i+8<=n; i+=8) {
+        _mm256_storeu_ps(z+i, _mm256_fmadd_ps(va, _mm256_loadu_ps(x+i), vb));
+    }
+    ScaleShiftScalar(z+i, x+i, a, b, n-i);
+}
+
+DLR_TARGET_AVX2
+static void ReLuAvx2(float *z, const float *x, uint32_t n)
+{
+    const __m256 zero = _mm256_setzero_ps();
+    uint32_t i=0;
+    for (; i+8<=n; i+=8) {
+        _mm256_storeu_ps(z+i, _mm256_max_ps(_mm256_loadu_ps(x+i), zero));
+    }
+    ReLuScalar(z+i, x+i, n-i);
+}
+
+DLR_TARGET_AVX2
+static void LeakyReLuAvx2(float *z, const float *x, float slope, uint32_t n)
+{
+    const __m256 zero = _mm256_setzero_ps();
+    const __m256 vs   = _mm256_set1_ps(slope);
+    uint32_t i=0;
+    for (; i+8<=n; i+=8) {
+        __m256 v = _mm256_loadu_ps(x+i);
+        __m256 m = _mm256_cmp_ps(v, zero, _CMP_LT_OQ);
+        _mm256_storeu_ps(z+i, _mm256_blendv_ps(v, _mm256_mul_ps(v, vs), m));
+    }
+    LeakyReLuScalar(z+i, x+i, slope, n-i);
+}
+
+DLR_TARGET_AVX2
+static void TanhPolyAvx2(float *z, const float *x, float in_scale, float out_scale, float out_shift, uint32_t n)
+{
+    const __m256 sign = _mm256_set1_ps(-0.0f);
+    uint32_t i=0;
+    for (; i+8<=n; i+=8) {
+        const __m256 v  = _mm256_mul_ps(_mm256_loadu_ps(x+i), _mm256_set1_ps(in_scale));
+        const __m256 c  = _mm256_min_ps(_mm256_max_ps(v, _mm256_set1_ps(-DLR_TANH_CLAMP)), _mm256_set1_ps(DLR_TANH_CLAMP));
+        const __m256 x2 = _mm256_mul_ps(c, c);
+        __m256 p = _mm256_fmadd_ps(x2, _mm256_set1_ps(DLR_TANH_A13), _mm256_set1_ps(DLR_TANH_A11));
+        p = _mm256_fmadd_ps(x2, p, _mm256_set1_ps(DLR_TANH_A9));
+        p = _mm256_fmadd_ps(x2, p, _mm256_set1_ps(DLR_TANH_A7));
+        p = _mm256_fmadd_ps(x2, p, _mm256_set1_ps(DLR_TANH_A5));
+        p = _mm256_fmadd_ps(x2, p, _mm256_set1_ps(DLR_TANH_A3));
+        p = _mm256_fmadd_ps(x2, p, _mm256_set1_ps(DLR_TANH_A1));
+        __m256 q = _mm256_fmadd_ps(x2, _mm256_set1_ps(DLR_TANH_B6), _mm256_set1_ps(DLR_TANH_B4));
+        q = _mm256_fmadd_ps(x2, q, _mm256_set1_ps(DLR_TANH_B2));
+        q = _mm256_fmadd_ps(x2, q, _mm256_set1_ps(DLR_TANH_B0));
+        __m256 t = _mm256_div_ps(_mm256_mul_ps(c, p), q);
+        const __m256 tiny = _mm256_cmp_ps(_mm256_andnot_ps(sign, v), _mm256_set1_ps(DLR_TANH_TINY), _CMP_LT_OQ);
+        t = _mm256_blendv_ps(t, v, _mm256_or_ps(tiny, _mm256_cmp_ps(v, v, _CMP_UNORD_Q))); // tiny or NaN
+        _mm256_storeu_ps(z+i, _mm256_fmadd_ps(t, _mm256_set1_ps(out_scale), _mm256_set1_ps(out_shift)));
+    }
+    TanhPolyScalar(z+i, x+i, in_scale, out_scale, out_shift, n-i);
+}
+
+DLR_TARGET_AVX2
+static void SigmoidLutAvx2(float *z, const float *x, float in_scale, float out_scale, float out_shift, uint32_t n)
+{
+    uint32_t i=0;
+    for (; i+8<=n; i+=8) {
+        const __m256 v = _mm256_loadu_ps(x+i);
+        __m256 t = _mm256_fmadd_ps(v, _mm256_set1_ps(in_scale*DLR_LUT_SCALE), _mm256_set1_ps((float)(DLR_LUT_RANGE*DLR_LUT_SCALE)));
+        t = _mm256_min_ps(_mm256_max_ps(t, _mm256_setzero_ps()), _mm256_set1_ps((float)(DLR_LUT_SIZE-1)));
+        const __m256i k  = _mm256_cvttps_epi32(t);
+        const __m256  f  = _mm256_sub_ps(t, _mm256_cvtepi32_ps(k));
+        const __m256  y0 = _mm256_i32gather_ps(lut_sigmoid  , k, 4);
+        const __m256  y1 = _mm256_i32gather_ps(lut_sigmoid+1, k, 4);
+        const __m256  y  = _mm256_blendv_ps(_mm256_fmadd_ps(f, _mm256_sub_ps(y1, y0), y0), v
+                                          , _mm256_cmp_ps(v, v, _CMP_UNORD_Q)); // NaN as it is
+        _mm256_storeu_ps(z+i, _mm256_fmadd_ps(y, _mm256_set1_ps(out_scale), _mm256_set1_ps(out_shift)));
+    }
+    SigmoidLutScalar(z+i, x+i, in_scale, out_scale, out_shift, n-i);
+}
+
+// F16C of every AVX2 CPU for half, integer of AVX2 for bfloat16
+DLR_TARGET_F16C
+static void HalfToFloatAvx2(float *z, const uint16_t *x, uint32_t n)
+{
+    uint32_t i=0;
+    for (; i+8<=n; i+=8) _mm256_storeu_ps(z+i, _mm256_cvtph_ps(_mm_loadu_si128((const __m128i*)(x+i))));
+    HalfToFloatScalar(z+i, x+i, n-i);
+}
+
+DLR_TARGET_F16C
+static void FloatToHalfAvx2(uint16_t *z, const float *x, uint32_t n)
+{
+    uint32_t i=0;
+    for (; i+8<=n; i+=8)
+        _mm_storeu_si128((__m128i*)(z+i), _mm256_cvtps_ph(_mm256_loadu_ps(x+i), _MM_FROUND_TO_NEAREST_INT|_MM_FROUND_NO_EXC));
+    FloatToHalfScalar(z+i, x+i, n-i);
+}
+
+DLR_TARGET_AVX2
+static void BFloat16ToFloatAvx2(float *z, const uint16_t *x, uint32_t n)
+{
+    uint32_t i=0;
+    for (; i+8<=n; i+=8) {
+        const __m256i v = _mm256_cvtepu16_epi32(_mm_loadu_si128((const __m128i*)(x+i)));
+        _mm256_storeu_si256((__m256i*)(z+i), _mm256_slli_epi32(v, 16));
+    }
+    BFloat16ToFloatScalar(z+i, x+i, n-i);
+}
+
+DLR_TARGET_AVX2
+static void FloatToBFloat16Avx2(uint16_t *z, const float *x, uint32_t n)
+{
+    const __m256i bias = _mm256_set1_epi32(0x7FFF);
+    const __m256i one  = _mm256_set1_epi32(1);
+    const __m256i qnan = _mm256_set1_epi32(0x40);
+    uint32_t i=0;
+    for (; i+8<=n; i+=8) {
+        const __m256  v = _mm256_loadu_ps(x+i);
+        const __m256i b = _mm256_castps_si256(v);
+        const __m256i r = _mm256_srli_epi32(_mm256_add_epi32(b, _mm256_add_epi32(bias,
+                                            _mm256_and_si256(_mm256_srli_epi32(b, 16), one))), 16);
+        const __m256i q = _mm256_or_si256(_mm256_srli_epi32(b, 16), qnan);
+        const __m256i t = _mm256_blendv_epi8(r, q, _mm256_castps_si256(_mm256_cmp_ps(v, v, _CMP_UNORD_Q)));
+        const __m256i p = _mm256_permute4x64_epi64(_mm256_packus_epi32(t, t), 0xD8);
+        _mm_storeu_si128((__m128i*)(z+i), _mm256_castsi256_si128(p));
+    }
+    FloatToBFloat16Scalar(z+i, x+i, n-i);
+}
+
+static const SimdKernels kernels_avx2 = { DLR_ISA_AVX2
+                                        , DotAvx2
+                                        , DotTileAvx2
+                                        , ConvRowAvx2
+                                        , MaxAvx2
+                                        , ScaleShiftAvx2
+                                        , ReLuAvx2
+                                        , LeakyReLuAvx2
+                                        , TanhPolyAvx2
+                                        , SigmoidLutAvx2
+                                        , DotInt8Avx2
+                                        , HalfToFloatAvx2
+                                        , FloatToHalfAvx2
+                                        , BFloat16ToFloatAvx2
+                                        , FloatToBFloat16Avx2
+                                        , SumAvx2
+                                        , ReduceMaxAvx2 };
+
+//------------------------------------------------------------------------------
+// AVX-512: 16 floats, remainder by mask
+#define DLR_MASK16(r) ((__mmask16)((1u<<(r))-1))
+
+DLR_TARGET_AVX512
+static float DotAvx512(const float *a, const float *b, uint32_t n)
+{
+    __m512 acc = _mm512_setzero_ps();
+    uint32_t i=0;
+    for (; i+16<=n; i+=16) {
+        acc = _mm512_fmadd_ps(_mm512_loadu_ps(a+i), _mm512_loadu_ps(b+i), acc);
+    }
+    if (i<n) {
+        const __mmask16 m = DLR_MASK16(n-i);
+        acc = _mm512_fmadd_ps(_mm512_maskz_loadu_ps(m, a+i), _mm512_maskz_loadu_ps(m, b+i), acc);
+    }
+    return _mm512_reduce_add_ps(acc);
+}
+
+// 4x4 accumulators and 8 loads in 32 registers
+DLR_TARGET_AVX512
+static void DotTileAvx512(float *z, uint32_t ldz, const float *x, uint32_t ldx, const float *w, uint32_t ldw, uint32_t n)
+{
+    __m512 acc[4][4];
+    for (uint32_t i=0; i<4; ++i)
+        for (uint32_t j=0; j<4; ++j) acc[i][j] = _mm512_setzero_ps();
+    for (uint32_t k=0; k<n; k+=16) {
+        const __mmask16 m = ((n-k)<16) ? DLR_MASK16(n-k) : (__mmask16)0xFFFF;
+        __m512 vw[4];
+        for (uint32_t j=0; j<4; ++j) vw[j] = _mm512_maskz_loadu_ps(m, w+j*ldw+k);
+        for (uint32_t i=0; i<4; ++i) {
+            const __m512 vx = _mm512_maskz_loadu_ps(m, x+i*ldx+k);
+            for (uint32_t j=0; j<4; ++j) acc[i][j] = _mm512_fmadd_ps(vx, vw[j], acc[i][j]);
+        }
+    }
+    for (uint32_t i=0; i<4; ++i)
+        for (uint32_t j=0; j<4; ++j) z[i*ldz+j] = _mm512_reduce_add_ps(acc[i][j]);
+}
+
+DLR_TARGET_AVX512
+static void ConvRowAvx512(float *z, const float *x, const float *w, uint32_t n, uint32_t ld, uint8_t kernel_size)
+{
+    for (uint32_t k=0; k<n; k+=16) {
+        const __mmask16 m = ((n-k)>=16) ? (__mmask16)0xFFFF : DLR_MASK16(n-k);
+        __m512 acc = _mm512_maskz_loadu_ps(m, z+k);
+        for (uint8_t i=0; i<kernel_size; ++i) {
+            const float *pX = x+i*ld+k;
+            const float *pW = w+i*kernel_size;
+            for (uint8_t j=0; j<kernel_size; ++j) {
+                acc = _mm512_fmadd_ps(_mm512_set1_ps(pW[j]), _mm512_maskz_loadu_ps(m, pX+j), acc);
+            }
+        }
+        _mm512_mask_storeu_ps(z+k, m, acc);
+    }
+}
+
+DLR_TARGET_AVX512
+static void MaxAvx512(float *z, const float *a, const float *b, uint32_t n)
+{
+    for (uint32_t i=0; i<n; i+=16) {
+        const __mmask16 m = ((n-i)>=16) ? (__mmask16)0xFFFF : DLR_MASK16(n-i);
+        _mm512_mask_storeu_ps(z+i, m, _mm512_max_ps(_mm512_maskz_loadu_ps(m, b+i), _mm512_maskz_loadu_ps(m, a+i)));
+    }
+}
+
+DLR_TARGET_AVX512
+static float SumAvx512(const float *x, uint32_t n)
+{
+    __m512 acc = _mm512_setzero_ps();
+    for (uint32_t i=0; i<n; i+=16) {
+        const __mmask16 m = ((n-i)>=16) ? (__mmask16)0xFFFF : DLR_MASK16(n-i);
+        acc = _mm512_add_ps(acc, _mm512_maskz_loadu_ps(m, x+i));
+    }
+    return _mm512_reduce_add_ps(acc);
+}
+
+// lanes out of x[n] are filled by x[0], which does not change the max
+DLR_TARGET_AVX512
+static float ReduceMaxAvx512(const float *x, uint32_t n)
+{
+    const __m512 first = _mm512_set1_ps(x[0]);
+    __m512 acc = first;
+    for (uint32_t i=0; i<n; i+=16) {
+        const __mmask16 m = ((n-i)>=16) ? (__mmask16)0xFFFF : DLR_MASK16(n-i);
+        acc = _mm512_max_ps(_mm512_mask_loadu_ps(first, m, x+i), acc);
+    }
+    return _mm512_reduce_max_ps(acc);
+}
+
+DLR_TARGET_AVX512
+static void ScaleShiftAvx512(float *z, const float *x, float a, float b, uint32_t n)
+{
+    const __m512 va = _mm512_set1_ps(a);
+    const __m512 vb = _mm512_set1_ps(b);
+    for (uint32_t i=0; i<n; i+=16) {
+        const __mmask16 m = ((n-i)>=16) ? (__mmask16)0xFFFF : DLR_MASK16(n-i);
+        _mm512_mask_storeu_ps(z+i, m, _mm512_fmadd_ps(va, _mm512_maskz_loadu_ps(m, x+i), vb));
+    }
+}
+
+DLR_TARGET_AVX512
+static void ReLuAvx512(float *z, const float *x, uint32_t n)
+{
+    const __m512 zero = _mm512_setzero_ps();
+    for (uint32_t i=0; i<n; i+=16) {
+        const __mmask16 m = ((n-i)>=16) ? (__mmask16)0xFFFF : DLR_MASK16(n-i);
+        _mm512_mask_storeu_ps(z+i, m, _mm512_max_ps(_mm512_maskz_loadu_ps(m, x+i), zero));
+    }
+}
+
+DLR_TARGET_AVX512
+static void LeakyReLuAvx512(float *z, const float *x, float slope, uint32_t n)
+{
+    const __m512 zero = _mm512_setzero_ps();
+    const __m512 vs   = _mm512_set1_ps(slope);
+    for (uint32_t i=0; i<n; i+=16) {
+        const __mmask16 m = ((n-i)>=16) ? (__mmask16)0xFFFF : DLR_MASK16(n-i);
+        __m512 v = _mm512_maskz_loadu_ps(m, x+i);
+        __mmask16 neg = _mm512_cmp_ps_mask(v, zero, _CMP_LT_OQ);
+        _mm512_mask_storeu_ps(z+i, m, _mm512_mask_mul_ps(v, neg, v, vs));
+    }
+}
+DLR_TARGET_AVX512
+static void TanhPolyAvx512(float *z, const float *x, float in_scale, float out_scale, float out_shift, uint32_t n)
+{
+    for (uint32_t i=0; i<n; i+=16) {
+        const __mmask16 m = ((n-i)>=16) ? (__mmask16)0xFFFF : DLR_MASK16(n-i);
+        const __m512 v  = _mm512_mul_ps(_mm512_maskz_loadu_ps(m, x+i), _mm512_set1_ps(in_scale));
+        const __m512 c  = _mm512_min_ps(_mm512_max_ps(v, _mm512_set1_ps(-DLR_TANH_CLAMP)), _mm512_set1_ps(DLR_TANH_CLAMP));
+        const __m512 x2 = _mm512_mul_ps(c, c);
+        __m512 p = _mm512_fmadd_ps(x2, _mm512_set1_ps(DLR_TANH_A13), _mm512_set1_ps(DLR_TANH_A11));
+        p = _mm512_fmadd_ps(x2, p, _mm512_set1_ps(DLR_TANH_A9));
+        p = _mm512_fmadd_ps(x2, p, _mm512_set1_ps(DLR_TANH_A7));
+        p = _mm512_fmadd_ps(x2, p, _mm512_set1_ps(DLR_TANH_A5));
+        p = _mm512_fmadd_ps(x2, p, _mm512_set1_ps(DLR_TANH_A3));
+        p = _mm512_fmadd_ps(x2, p, _mm512_set1_ps(DLR_TANH_A1));
+        __m512 q = _mm512_fmadd_ps(x2, _mm512_set1_ps(DLR_TANH_B6), _mm512_set1_ps(DLR_TANH_B4));
+        q = _mm512_fmadd_ps(x2, q, _mm512_set1_ps(DLR_TANH_B2));
+        q = _mm512_fmadd_ps(x2, q, _mm512_set1_ps(DLR_TANH_B0));
+        __m512 t = _mm512_div_ps(_mm512_mul_ps(c, p), q);
+        const __mmask16 tiny = _mm512_cmp_ps_mask(_mm512_abs_ps(v), _mm512_set1_ps(DLR_TANH_TINY), _CMP_LT_OQ);
+        t = _mm512_mask_mov_ps(t, tiny|_mm512_cmp_ps_mask(v, v, _CMP_UNORD_Q), v); // tiny or NaN
+        _mm512_mask_storeu_ps(z+i, m, _mm512_fmadd_ps(t, _mm512_set1_ps(out_scale), _mm512_set1_ps(out_shift)));
+    }
+}
+
+DLR_TARGET_AVX512
+static void SigmoidLutAvx512(float *z, const float *x, float in_scale, float out_scale, float out_shift, uint32_t n)
+{
+    for (uint32_t i=0; i<n; i+=16) {
+        const __mmask16 m = ((n-i)>=16) ? (__mmask16)0xFFFF : DLR_MASK16(n-i);
+        const __m512 v = _mm512_maskz_loadu_ps(m, x+i);
+        __m512 t = _mm512_fmadd_ps(v, _mm512_set1_ps(in_scale*DLR_LUT_SCALE), _mm512_set1_ps((float)(DLR_LUT_RANGE*DLR_LUT_SCALE)));
+        t = _mm512_min_ps(_mm512_max_ps(t, _mm512_setzero_ps()), _mm512_set1_ps((float)(DLR_LUT_SIZE-1)));
+        const __m512i k  = _mm512_cvttps_epi32(t);
+        const __m512  f  = _mm512_sub_ps(t, _mm512_cvtepi32_ps(k));
+        const __m512  y0 = _mm512_i32gather_ps(k, lut_sigmoid  , 4);
+        const __m512  y1 = _mm512_i32gather_ps(k, lut_sigmoid+1, 4);
+        const __m512  y  = _mm512_mask_mov_ps(_mm512_fmadd_ps(f, _mm512_sub_ps(y1, y0), y0)
+                                             , _mm512_cmp_ps_mask(v, v, _CMP_UNORD_Q), v); // NaN as it is
+        _mm512_mask_storeu_ps(z+i, m, _mm512_fmadd_ps(y, _mm512_set1_ps(out_scale), _mm512_set1_ps(out_shift)));
+    }
+}
+#undef DLR_MASK16
+
+static const SimdKernels kernels_avx512 = { DLR_ISA_AVX512
+                                          , DotAvx512
+                                          , DotTileAvx512
+                                          , ConvRowAvx512
+                                          , MaxAvx512
+                                          , ScaleShiftAvx512
+                                          , ReLuAvx512
+                                          , LeakyReLuAvx512
+                                          , TanhPolyAvx512
+                                          , SigmoidLutAvx512
+                                          , DotInt8Avx2 // int16 of AVX-512 needs AVX512BW
+                                          , HalfToFloatAvx2
+                                          , FloatToHalfAvx2
+                                          , BFloat16ToFloatAvx2
+                                          , FloatToBFloat16Avx2
+                                          , SumAvx512
+                                          , ReduceMaxAvx512 };
+#endif // defined(DLR_SIMD_X86)
+
+#if defined(DLR_SIMD_NEON)
+//------------------------------------------------------------------------------
+// NEON (AArch64): 4 floats, remainder goes scalar
+static float DotNeon(const float *a, const float *b, uint32_t n)
+{
+    float32x4_t acc0 = vdupq_n_f32(0.0f);
+    float32x4_t acc1 = vdupq_n_f32(0.0f);
+    uint32_t i=0;
+    for (; i+8<=n; i+=8) {
+        acc0 = vfmaq_f32(acc0, vld1q_f32(a+i  ), vld1q_f32(b+i  ));
+        acc1 = vfmaq_f32(acc1, vld1q_f32(a+i+4), vld1q_f32(b+i+4));
+    }
+    for (; i+4<=n; i+=4) {
+        acc0 = vfmaq_f32(acc0, vld1q_f32(a+i), vld1q_f32(b+i));
+    }
+    return vaddvq_f32(vaddq_f32(acc0, acc1))+DotScalar(a+i, b+i, n-i);
+}
+
+// 4x4 accumulators and 8 loads in 32 registers
+static void DotTileNeon(float *z, uint32_t ldz, const float *x, uint32_t ldx, const float *w, uint32_t ldw, uint32_t n)
+{
+    float32x4_t acc[4][4];
+    for (uint32_t i=0; i<4; ++i)
+        for (uint32_t j=0; j<4; ++j) acc[i][j] = vdupq_n_f32(0.0f);
+    uint32_t k=0;
+    for (; k+4<=n; k+=4) {
+        float32x4_t vw[4];
+        for (uint32_t j=0; j<4; ++j) vw[j] = vld1q_f32(w+j*ldw+k);
+        for (uint32_t i=0; i<4; ++i) {
+            const float32x4_t vx = vld1q_f32(x+i*ldx+k);
+            for (uint32_t j=0; j<4; ++j) acc[i][j] = vfmaq_f32(acc[i][j], vx, vw[j]);
+        }
+    }
+    for (uint32_t i=0; i<4; ++i)
+        for (uint32_t j=0; j<4; ++j) z[i*ldz+j] = vaddvq_f32(acc[i][j])+DotScalar(x+i*ldx+k, w+j*ldw+k, n-k);
+}
+
+static int32_t DotInt8Neon(const int16_t *x, const int8_t *w, uint32_t n)
+{
+    int32x4_t acc0 = vdupq_n_s32(0);
+    int32x4_t acc1 = vdupq_n_s32(0);
+    uint32_t i=0;
+    for (; i+8<=n; i+=8) {
+        const int16x8_t vx = vld1q_s16(x+i);
+        const int16x8_t vw = vmovl_s8(vld1_s8(w+i));
+        acc0 = vmlal_s16(acc0, vget_low_s16(vx), vget_low_s16(vw));
+        acc1 = vmlal_high_s16(acc1, vx, vw);
+    }
+    return vaddvq_s32(vaddq_s32(acc0, acc1))+DotInt8Scalar(x+i, w+i, n-i);
+}
+
+static void ConvRowNeon(float *z, const float *x, const float *w, uint32_t n, uint32_t ld, uint8_t kernel_size)
+{
+    uint32_t k=0;
+    for (; k+4<=n; k+=4) {
+        float32x4_t acc = vld1q_f32(z+k);
+        for (uint8_t i=0; i<kernel_size; ++i) {
+            const float *pX = x+i*ld+k;
+            const float *pW = w+i*kernel_size;
+            for (uint8_t j=0; j<kernel_size; ++j) {
+                acc = vfmaq_n_f32(acc, vld1q_f32(pX+j), pW[j]);
+            }
+        }
+        vst1q_f32(z+k, acc);
+    }
+    ConvRowScalar(z+k, x+k, w, n-k, ld, kernel_size);
+}
+
+static float SumNeon(const float *x, uint32_t n)
+{
+    float32x4_t acc0 = vdupq_n_f32(0.0f);
+    float32x4_t acc1 = vdupq_n_f32(0.0f);
+    uint32_t i=0;
+    for (; i+8<=n; i+=8) {
+        acc0 = vaddq_f32(acc0, vld1q_f32(x+i  ));
+        acc1 = vaddq_f32(acc1, vld1q_f32(x+i+4));
+    }
+    for (; i+4<=n; i+=4) {
+        acc0 = vaddq_f32(acc0, vld1q_f32(x+i));
+    }
+    return vaddvq_f32(vaddq_f32(acc0, acc1))+SumScalar(x+i, n-i);
+}
+
+static float ReduceMaxNeon(const float *x, uint32_t n)
+{
+    if (n<4) return ReduceMaxScalar(x, n);
+    float32x4_t acc = vld1q_f32(x);
+    uint32_t i=4;
+    for (; i+4<=n; i+=4) {
+        acc = vmaxq_f32(vld1q_f32(x+i), acc);
+    }
+    return ReduceMaxScalar(x+i, n-i, vmaxvq_f32(acc));
+}
+
+static void MaxNeon(float *z, const float *a, const float *b, uint32_t n)
+{
+    uint32_t i=0;
+    for (; i+4<=n; i+=4) {
+        float32x4_t va = vld1q_f32(a+i);
+        float32x4_t vb = vld1q_f32(b+i);
+        vst1q_f32(z+i, vbslq_f32(vcltq_f32(va, vb), vb, va));
+    }
+    MaxScalar(z+i, a+i, b+i, n-i);
+}
+
+static void ScaleShiftNeon(float *z, const float *x, float a, float b, uint32_t n)
+{
+    const float32x4_t vb = vdupq_n_f32(b);
+    uint32_t i=0;
+    for (; i+4<=n; i+=4) {
+        vst1q_f32(z+i, vfmaq_n_f32(vb, vld1q_f32(x+i), a));
+    }
+    ScaleShiftScalar(z+i, x+i, a, b, n-i);
+}
+
+static void ReLuNeon(float *z, const float *x, uint32_t n)
+{
+    const float32x4_t zero = vdupq_n_f32(0.0f);
+    uint32_t i=0;
+    for (; i+4<=n; i+=4) {
+        float32x4_t v = vld1q_f32(x+i);
+        vst1q_f32(z+i, vbslq_f32(vcleq_f32(v, zero), zero, v));
+    }
+    ReLuScalar(z+i, x+i, n-i);
+}
+
+static void LeakyReLuNeon(float *z, const float *x, float slope, uint32_t n)
+{
+    const float32x4_t zero = vdupq_n_f32(0.0f);
+    uint32_t i=0;
+    for (; i+4<=n; i+=4) {
+        float32x4_t v = vld1q_f32(x+i);
+        vst1q_f32(z+i, vbslq_f32(vcltq_f32(v, zero), vmulq_n_f32(v, slope), v));
+    }
+    LeakyReLuScalar(z+i, x+i, slope, n-i);
+}
+
+static void TanhPolyNeon(float *z, const float *x, float in_scale, float out_scale, float out_shift, uint32_t n)
+{
+    uint32_t i=0;
+    for (; i+4<=n; i+=4) {
+        const float32x4_t v  = vmulq_n_f32(vld1q_f32(x+i), in_scale);
+        const float32x4_t c  = vminq_f32(vmaxq_f32(v, vdupq_n_f32(-DLR_TANH_CLAMP)), vdupq_n_f32(DLR_TANH_CLAMP));
+        const float32x4_t x2 = vmulq_f32(c, c);
+        float32x4_t p = vfmaq_f32(vdupq_n_f32(DLR_TANH_A11), x2, vdupq_n_f32(DLR_TANH_A13));
+        p = vfmaq_f32(vdupq_n_f32(DLR_TANH_A9), x2, p);
+        p = vfmaq_f32(vdupq_n_f32(DLR_TANH_A7), x2, p);
+        p = vfmaq_f32(vdupq_n_f32(DLR_TANH_A5), x2, p);
+        p = vfmaq_f32(vdupq_n_f32(DLR_TANH_A3), x2, p);
+        p = vfmaq_f32(vdupq_n_f32(DLR_TANH_A1), x2, p);
+        float32x4_t q = vfmaq_f32(vdupq_n_f32(DLR_TANH_B4), x2, vdupq_n_f32(DLR_TANH_B6));
+        q = vfmaq_f32(vdupq_n_f32(DLR_TANH_B2), x2, q);
+        q = vfmaq_f32(vdupq_n_f32(DLR_TANH_B0), x2, q);
+        float32x4_t t = vdivq_f32(vmulq_f32(c, p), q);
+        t = vbslq_f32(vcltq_f32(vabsq_f32(v), vdupq_n_f32(DLR_TANH_TINY)), v, t);
+        t = vbslq_f32(vceqq_f32(v, v), t, v); // NaN as it is
+        vst1q_f32(z+i, vfmaq_n_f32(vdupq_n_f32(out_shift), t, out_scale));
+    }
+    TanhPolyScalar(z+i, x+i, in_scale, out_scale, out_shift, n-i);
+}
+
+static const SimdKernels kernels_neon = { DLR_ISA_NEON
+                                        , DotNeon
+                                        , DotTileNeon
+                                        , ConvRowNeon
+                                        , MaxNeon
+                                        , ScaleShiftNeon
+                                        , ReLuNeon
+                                        , LeakyReLuNeon
+                                        , TanhPolyNeon
+                                        , SigmoidLutScalar // no gather
+                                        , DotInt8Neon
+                                        , HalfToFloatScalar
+                                        , FloatToHalfScalar
+                                        , BFloat16ToFloatScalar
+                                        , FloatToBFloat16Scalar
+                                        , SumNeon
+                                        , ReduceMaxNeon };
+#endif // defined(DLR_SIMD_NEON)
+
+//------------------------------------------------------------------------------
+// returns kernels of 'isa' when the CPU supports it, otherwise NULL
+static const SimdKernels *SimdGetKernels(const int isa)
+{
+    switch (isa) {
+    case DLR_ISA_SCALAR: return &kernels_scalar;
+    #if defined(DLR_SIMD_X86)
+    case DLR_ISA_AVX2:
+         __builtin_cpu_init();
+         if (__builtin_cpu_supports("avx2")&&__builtin_cpu_supports("fma")) return &kernels_avx2;
+         return NULL;
+    case DLR_ISA_AVX512:
+         __builtin_cpu_init();
+         if (__builtin_cpu_supports("avx512f")) return &kernels_avx512;
+         return NULL;
+    #endif
+    #if defined(DLR_SIMD_NEON)
+    case DLR_ISA_NEON: return &kernels_neon;
+    #endif
+    default: return NULL;
+    }
+}
+
+// the best of the CPU, which is selected when the library is loaded
+static const SimdKernels *SimdGetBest(void)
+{
+    static const int isas[] = { DLR_ISA_AVX512, DLR_ISA_AVX2, DLR_ISA_NEON };
+    for (unsigned int i=0; i<sizeof(isas)/sizeof(isas[0]); ++i) {
+        const SimdKernels *kernels = SimdGetKernels(isas[i]);
+        if (kernels!=NULL) return kernels;
+    }
+    return &kernels_scalar;
+}
+
+static const SimdKernels *simd = SimdGetBest();
+
+float SimdDotFloat(const float *a, const float *b, uint32_t n)
+{
+    return simd->dot(a, b, n);
+}
+
+void SimdDotTileFloat(float *z, uint32_t ldz, const float *x, uint32_t ldx, const float *w, uint32_t ldw, uint32_t n)
+{
+    simd->dot_tile(z, ldz, x, ldx, w, ldw, n);
+}
+
+void SimdConvRowFloat(float *z, const float *x, const float *w, uint32_t n, uint32_t ld, uint8_t kernel_size)
+{
+    simd->conv_row(z, x, w, n, ld, kernel_size);
+}
+
+void SimdMaxFloat(float *z, const float *a, const float *b, uint32_t n)
+{
+    simd->max(z, a, b, n);
+}
+
+void SimdScaleShiftFloat(float *z, const float *x, float a, float b, uint32_t n)
+{
+    simd->scale_shift(z, x, a, b, n);
+}
+
+void SimdReLuFloat(float *z, const float *x, uint32_t n)
+{
+    simd->relu(z, x, n);
+}
+
+void SimdLeakyReLuFloat(float *z, const float *x, float slope, uint32_t n)
+{
+    simd->leaky_relu(z, x, slope, n);
+}
+
+void SimdTanhPolyFloat(float *z, const float *x, float in_scale, float out_scale, float out_shift, uint32_t n)
+{
+    simd->tanh_poly(z, x, in_scale, out_scale, out_shift, n);
+}
+
+void SimdSigmoidLutFloat(float *z, const float *x, float in_scale, float out_scale, float out_shift, uint32_t n)
+{
+    simd->sigmoid_lut(z, x, in_scale, out_scale, out_shift, n);
+}
+
+int32_t SimdDotInt8(const int16_t *x, const int8_t *w, uint32_t n)
+{
+    return simd->dot_int8(x, w, n);
+}
+
+float SimdSumFloat(const float *x, uint32_t n)
+{
+    return simd->sum(x, n);
+}
+
+float SimdReduceMaxFloat(const float *x, uint32_t n)
+{
+    return simd->reduce_max(x, n);
+}
+
+void SimdHalfToFloat(float *z, const uint16_t *x, uint32_t n)
+{
+    simd->half_to_float(z, x, n);
+}
+
+void SimdFloatToHalf(uint16_t *z, const float *x, uint32_t n)
+{
+    simd->float_to_half(z, x, n);
+}
+
+void SimdBFloat16ToFloat(float *z, const uint16_t *x, uint32_t n)
+{
+    simd->bfloat16_to_float(z, x, n);
+}
+
+void SimdFloatToBFloat16(uint16_t *z, const float *x, uint32_t n)
+{
+    simd->float_to_bfloat16(z, x, n);
+}
+
+} // namespace dlr
+
+extern "C" {
+
+int dlrSetIsa(const int isa)
+{
+    const dlr::SimdKernels *kernels = (isa<0) ? dlr::SimdGetBest() : dlr::SimdGetKernels(isa);
+    if (kernels==NULL) return dlrSetError("ISA %d not supported by the CPU\n", isa);
+    dlr::simd = kernels;
+    return DLR_SUCCESS;
+}
+
+int dlrGetIsa(void)
+{
+    return dlr::simd->isa;
+}
+
+} // extern "C"
+/*
+ * Revision history
+ *
+ * 2026.10.18: NaN propagated by tanh_poly and sigmoid_lut kernels.
+ * 2026.10.18: sum and max of a vector (SimdSumFloat(), SimdReduceMaxFloat()) added.
+ * 2026.10.18: conversion kernels of half (F16C) and bfloat16 added.
+ * 2026.10.18: dot_int8 kernels added for int8 routines.
+ * 2026.10.18: dot_tile kernels added for LinearBatch().
+ * 2026.10.18: tanh by rational polynomial and sigmoid by table added.
+ * 2026.10.18: Started.
+ */
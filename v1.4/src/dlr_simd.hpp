@@ -0,0 +1,285 @@
+#pragma once
+/*
+ * Copyright (c) 2019-2020 by Future Design Systems.
+ * All right reserved.
+ * http://www.future-ds.com
+ *
+ * @file dlr_simd.hpp
+ * @brief This file contains hand-vectorized float kernels shared by routines
+ *        (software-only, not for HLS).
+ * @author FDS
+ * @date Oct. 18, 2026
+ */
+#if !defined(__SYNTHESIS__)
+#include <stdint.h>
+#include <math.h>
+#include "dlr_common.h"
+#include "dlr_half.hpp"
+
+namespace dlr { // deep learning routines
+
+// Float kernels of AVX2, AVX-512, NEON or scalar, which are selected
+// from CPUID when the library is loaded (see dlrSetIsa() and dlrGetIsa()).
+float SimdDotFloat      (const float *a, const float *b, uint32_t n);
+void  SimdDotTileFloat  (float *z, uint32_t ldz, const float *x, uint32_t ldx, const float *w, uint32_t ldw, uint32_t n);
+void  SimdConvRowFloat  (float *z, const float *x, const float *w, uint32_t n, uint32_t ld, uint8_t kernel_size);
+void  SimdMaxFloat      (float *z, const float *a, const float *b, uint32_t n);
+void  SimdScaleShiftFloat(float *z, const float *x, float a, float b, uint32_t n);
+void  SimdReLuFloat     (float *z, const float *x, uint32_t n);
+void  SimdLeakyReLuFloat(float *z, const float *x, float slope, uint32_t n);
+// z = out_scale*f(in_scale*x)+out_shift, where f is tanh by rational polynomial
+// or sigmoid by table with linear interpolation.
+void  SimdTanhPolyFloat  (float *z, const float *x, float in_scale, float out_scale, float out_shift, uint32_t n);
+void  SimdSigmoidLutFloat(float *z, const float *x, float in_scale, float out_scale, float out_shift, uint32_t n);
+// sum of x[n]*w[n] in int32, where x is int8 data less its zero point and w is int8 weight,
+// which is for int8 routines (see dlr_quant.hpp).
+int32_t SimdDotInt8     (const int16_t *x, const int8_t *w, uint32_t n);
+// sum and max of x[n], where n>0 for max
+float SimdSumFloat      (const float *x, uint32_t n);
+float SimdReduceMaxFloat(const float *x, uint32_t n);
+// z[n] = x[n] between float and 16-bit storage of dlr_half.hpp, rounded to nearest even
+void  SimdHalfToFloat    (float *z, const uint16_t *x, uint32_t n);
+void  SimdFloatToHalf    (uint16_t *z, const float *x, uint32_t n);
+void  SimdBFloat16ToFloat(float *z, const uint16_t *x, uint32_t n);
+void  SimdFloatToBFloat16(uint16_t *z, const float *x, uint32_t n);
+
+// Helpers called by templates of routines.
+// - SimdMax(), SimdReduceMax() and SimdReLu() give the same results for any TYPE,
+//   where other types than float go scalar.
+// - the others change the order of float operations and are taken only
+//   for float, i.e., returns 'false' for other types, which go their own way.
+
+// z[n] = max(a[n], b[n])
+template<class TYPE>
+inline void SimdMax(TYPE *z, const TYPE *a, const TYPE *b, uint32_t n)
+{
+    for (uint32_t i=0; i<n; ++i) z[i] = (a[i]<b[i]) ? b[i] : a[i];
+}
+inline void SimdMax(float *z, const float *a, const float *b, uint32_t n)
+{
+    SimdMaxFloat(z, a, b, n);
+}
+
+// max of x[n] for n>0
+template<class TYPE>
+inline TYPE SimdReduceMax(const TYPE *x, uint32_t n)
+{
+    TYPE max=x[0];
+    for (uint32_t i=1; i<n; ++i) if (max<x[i]) max = x[i];
+    return max;
+}
+inline float SimdReduceMax(const float *x, uint32_t n)
+{
+    return SimdReduceMaxFloat(x, n);
+}
+
+// z[n] = (x[n]<=0) ? 0 : x[n]
+template<class TYPE>
+inline void SimdReLu(TYPE *z, const TYPE *x, uint32_t n)
+{
+    for (uint32_t i=0; i<n; ++i) z[i] = (x[i]<=(TYPE)0) ? (TYPE)0 : x[i];
+}
+inline void SimdReLu(float *z, const float *x, uint32_t n)
+{
+    SimdReLuFloat(z, x, n);
+}
+
+// *sum = a[0]*b[0] + ... + a[n-1]*b[n-1]
+template<class ACCUM, class TYPE>
+inline bool SimdDot(ACCUM *, const TYPE *, const TYPE *, uint32_t) { return false; }
+inline bool SimdDot(float *sum, const float *a, const float *b, uint32_t n)
+{
+    *sum = SimdDotFloat(a, b, n);
+    return true;
+}
+
+// *sum = x[0] + ... + x[n-1]
+template<class ACCUM, class TYPE>
+inline bool SimdSum(ACCUM *, const TYPE *, uint32_t) { return false; }
+inline bool SimdSum(float *sum, const float *x, uint32_t n)
+{
+    *sum = SimdSumFloat(x, n);
+    return true;
+}
+
+// z[i*ldz+j] = dot of x[i*ldx] and w[j*ldw] over n for i,j<DLR_SIMD_TILE,
+// i.e., a tile of rows of x and rows of w sharing loads in registers
+#define DLR_SIMD_TILE 4
+template<class TYPE>
+inline bool SimdDotTile(TYPE *, uint32_t, const TYPE *, uint32_t, const TYPE *, uint32_t, uint32_t) { return false; }
+inline bool SimdDotTile(float *z, uint32_t ldz, const float *x, uint32_t ldx, const float *w, uint32_t ldw, uint32_t n)
+{
+    SimdDotTileFloat(z, ldz, x, ldx, w, ldw, n);
+    return true;
+}
+
+// z[k] += sum of w[i][j]*x[i*ld+k+j] for k<n, i.e., a row of convolution of stride 1
+template<class ACCUM, class TYPE>
+inline bool SimdConvRow(ACCUM *, const TYPE *, const TYPE *, uint32_t, uint32_t, uint8_t) { return false; }
+inline bool SimdConvRow(float *z, const float *x, const float *w, uint32_t n, uint32_t ld, uint8_t kernel_size)
+{
+    SimdConvRowFloat(z, x, w, n, ld, kernel_size);
+    return true;
+}
+
+// z[n] = ((x[n]-mean)/sqrt(var+epsilon))*scale + shift
+template<class TYPE>
+inline bool SimdNormalize(TYPE *, const TYPE *, TYPE, TYPE, TYPE, TYPE, float, uint32_t) { return false; }
+inline bool SimdNormalize(float *z, const float *x, float mean, float var, float scale, float shift, float epsilon, uint32_t n)
+{
+    const float a = scale/sqrtf(var+epsilon);
+    SimdScaleShiftFloat(z, x, a, shift-mean*a, n);
+    return true;
+}
+
+// z[n] = x[n]*a + b
+template<class TYPE>
+inline bool SimdScaleShift(TYPE *, const TYPE *, TYPE, TYPE, uint32_t) { return false; }
+inline bool SimdScaleShift(float *z, const float *x, float a, float b, uint32_t n)
+{
+    SimdScaleShiftFloat(z, x, a, b, n);
+    return true;
+}
+
+// z[n] = (x[n]<0) ? x[n]*slope : x[n]
+template<class TYPE>
+inline bool SimdLeakyReLu(TYPE *, const TYPE *, float, uint32_t) { return false; }
+inline bool SimdLeakyReLu(float *z, const float *x, float slope, uint32_t n)
+{
+    SimdLeakyReLuFloat(z, x, slope, n);
+    return true;
+}
+
+// z[n] = sigmoid(x[n]) of 'accuracy' (DLR_ACCURACY_LUT or DLR_ACCURACY_POLY),
+// where DLR_ACCURACY_EXACT returns 'false' as well as other types.
+template<class TYPE>
+inline bool SimdSigmoid(TYPE *, const TYPE *, int, uint32_t) { return false; }
+inline bool SimdSigmoid(float *z, const float *x, int accuracy, uint32_t n)
+{
+    if (accuracy==DLR_ACCURACY_LUT) SimdSigmoidLutFloat(z, x, 1.0f, 1.0f, 0.0f, n);
+    else if (accuracy==DLR_ACCURACY_POLY) SimdTanhPolyFloat(z, x, 0.5f, 0.5f, 0.5f, n); // (1+tanh(x/2))/2
+    else return false;
+    return true;
+}
+
+// z[n] = tanh(x[n]) of 'accuracy' as SimdSigmoid()
+template<class TYPE>
+inline bool SimdTanh(TYPE *, const TYPE *, int, uint32_t) { return false; }
+inline bool SimdTanh(float *z, const float *x, int accuracy, uint32_t n)
+{
+    if (accuracy==DLR_ACCURACY_LUT) SimdSigmoidLutFloat(z, x, 2.0f, 2.0f, -1.0f, n); // 2*sigmoid(2x)-1
+    else if (accuracy==DLR_ACCURACY_POLY) SimdTanhPolyFloat(z, x, 1.0f, 1.0f, 0.0f, n);
+    else return false;
+    return true;
+}
+
+// 'Half' and 'BFloat16' go float kernels by blocks of DLR_SIMD_BLOCK, which
+// are widened to float on the stack and narrowed back, i.e., memory traffic
+// is of 16-bit while each value is computed in float and rounded once.
+#define DLR_SIMD_BLOCK 1024
+inline void SimdToFloat(float *z, const Half *x, uint32_t n) { SimdHalfToFloat(z, (const uint16_t*)x, n); }
+inline void SimdToFloat(float *z, const BFloat16 *x, uint32_t n) { SimdBFloat16ToFloat(z, (const uint16_t*)x, n); }
+inline void SimdFromFloat(Half *z, const float *x, uint32_t n) { SimdFloatToHalf((uint16_t*)z, x, n); }
+inline void SimdFromFloat(BFloat16 *z, const float *x, uint32_t n) { SimdFloatToBFloat16((uint16_t*)z, x, n); }
+
+// z[n] = kernel(x[n]) by a float kernel of 'kernel(float *z, const float *x, uint32_t n)'
+template<class TYPE, class KERNEL>
+inline void SimdMapHalf(TYPE *z, const TYPE *x, uint32_t n, KERNEL kernel)
+{
+    float t_x[DLR_SIMD_BLOCK];
+    for (uint32_t i=0; i<n; i+=DLR_SIMD_BLOCK) {
+        const uint32_t t_n = ((n-i)<DLR_SIMD_BLOCK) ? n-i : DLR_SIMD_BLOCK;
+        SimdToFloat(t_x, x+i, t_n);
+        kernel(t_x, t_x, t_n);
+        SimdFromFloat(z+i, t_x, t_n);
+    }
+}
+
+// *sum = a[0]*b[0] + ... + a[n-1]*b[n-1] in float
+template<class TYPE>
+inline void SimdDotHalf(float *sum, const TYPE *a, const TYPE *b, uint32_t n)
+{
+    float t_a[DLR_SIMD_BLOCK], t_b[DLR_SIMD_BLOCK];
+    float t_sum = 0.0f;
+    for (uint32_t i=0; i<n; i+=DLR_SIMD_BLOCK) {
+        const uint32_t t_n = ((n-i)<DLR_SIMD_BLOCK) ? n-i : DLR_SIMD_BLOCK;
+        SimdToFloat(t_a, a+i, t_n);
+        SimdToFloat(t_b, b+i, t_n);
+        t_sum += SimdDotFloat(t_a, t_b, t_n);
+    }
+    *sum = t_sum;
+}
+
+// z[k] += conv row of float as SimdConvRow(), where kernel_size rows of x and w
+// fit the stack, otherwise returns 'false'
+template<class TYPE>
+inline bool SimdConvRowHalf(float *z, const TYPE *x, const TYPE *w, uint32_t n, uint32_t ld, uint8_t kernel_size)
+{
+    float t_buf[4*DLR_SIMD_BLOCK];
+    const uint32_t t_width = n+kernel_size-1;
+    if (((uint32_t)kernel_size*(t_width+kernel_size))>(4*DLR_SIMD_BLOCK)) return false;
+    float *t_w = t_buf+(uint32_t)kernel_size*t_width;
+    for (uint32_t i=0; i<kernel_size; ++i) SimdToFloat(t_buf+i*t_width, x+i*ld, t_width);
+    SimdToFloat(t_w, w, (uint32_t)kernel_size*kernel_size);
+    SimdConvRowFloat(z, t_buf, t_w, n, t_width, kernel_size);
+    return true;
+}
+
+#define DLR_SIMD_HALF(TYPE)\
+inline void SimdMax(TYPE *z, const TYPE *a, const TYPE *b, uint32_t n)\
+{\
+    float t_b[DLR_SIMD_BLOCK];\
+    for (uint32_t i=0; i<n; i+=DLR_SIMD_BLOCK) {\
+        const uint32_t t_n = ((n-i)<DLR_SIMD_BLOCK) ? n-i : DLR_SIMD_BLOCK;\
+        SimdToFloat(t_b, b+i, t_n);\
+        SimdMapHalf(z+i, a+i, t_n, [&](float *tz, const float *tx, uint32_t tn) { SimdMaxFloat(tz, tx, t_b, tn); });\
+    }\
+}\
+inline void SimdReLu(TYPE *z, const TYPE *x, uint32_t n)\
+{\
+    SimdMapHalf(z, x, n, SimdReLuFloat);\
+}\
+inline bool SimdDot(float *sum, const TYPE *a, const TYPE *b, uint32_t n)\
+{\
+    SimdDotHalf(sum, a, b, n);\
+    return true;\
+}\
+inline bool SimdConvRow(float *z, const TYPE *x, const TYPE *w, uint32_t n, uint32_t ld, uint8_t kernel_size)\
+{\
+    return SimdConvRowHalf(z, x, w, n, ld, kernel_size);\
+}\
+inline bool SimdNormalize(TYPE *z, const TYPE *x, TYPE mean, TYPE var, TYPE scale, TYPE shift, float epsilon, uint32_t n)\
+{\
+    const float a = (float)scale/sqrtf((float)var+epsilon);\
+    const float b = (float)shift-(float)mean*a;\
+    SimdMapHalf(z, x, n, [=](float *tz, const float *tx, uint32_t tn) { SimdScaleShiftFloat(tz, tx, a, b, tn); });\
+    return true;\
+}\
+inline bool SimdScaleShift(TYPE *z, const TYPE *x, TYPE a, TYPE b, uint32_t n)\
+{\
+    SimdMapHalf(z, x, n, [=](float *tz, const float *tx, uint32_t tn) { SimdScaleShiftFloat(tz, tx, a, b, tn); });\
+    return true;\
+}\
+inline bool SimdLeakyReLu(TYPE *z, const TYPE *x, float slope, uint32_t n)\
+{\
+    SimdMapHalf(z, x, n, [=](float *tz, const float *tx, uint32_t tn) { SimdLeakyReLuFloat(tz, tx, slope, tn); });\
+    return true;\
+}
+DLR_SIMD_HALF(Half)
+DLR_SIMD_HALF(BFloat16)
+#undef DLR_SIMD_HALF
+
+} // namespace dlr
+#endif // !defined(__SYNTHESIS__)
+/*
+ * Revision history
+ *
+ * 2026.10.18: parameters of fallbacks left unnamed against -Wunused-parameter.
+ * 2026.10.18: SimdSum() and SimdReduceMax() added.
+ * 2026.10.18: helpers of 'Half' and 'BFloat16' by float kernels, SimdDot() and SimdConvRow() of float accumulator.
+ * 2026.10.18: SimdDotInt8() added.
+ * 2026.10.18: SimdDotTile() added.
+ * 2026.10.18: SimdScaleShift() added.
+ * 2026.10.18: SimdSigmoid() and SimdTanh() added.
+ * 2026.10.18: Started.
+ */
@@ -1,9 +1,11 @@
 
 #include "linear_1d.hpp"
+#include "dlr_fixed.hpp"
+#include "dlr_half.hpp"
 
 extern "C" {
 
-void Linear1dInt
+int Linear1dInt
 (           int      *out_data // out_size
     , const int      *in_data  // in_size
     , const int      *weight   // out_size x in_size
@@ -17,6 +19,7 @@ void Linear1dInt
     #endif
     )
 {
+    dlrClearLastError();
     dlr::Linear1d<int, 0, 0> ( out_data
              , in_data
              , weight
@@ -29,9 +32,10 @@ void Linear1dInt
              , verbose 
              #endif
              );
+    return dlrGetLastStatus();
 }
 
-void Linear1dFloat
+int Linear1dFloat
 (           float    *out_data // out_size
     , const float    *in_data  // in_size
     , const float    *weight   // out_size x in_size
@@ -45,6 +49,7 @@ void Linear1dFloat
     #endif
     )
 {
+    dlrClearLastError();
     dlr::Linear1d<float, 0, 0> ( out_data
              , in_data
              , weight
@@ -57,9 +62,10 @@ void Linear1dFloat
              , verbose 
              #endif
              );
+    return dlrGetLastStatus();
 }
 
-void Linear1dDouble
+int Linear1dDouble
 (           double   *out_data // out_size
     , const double   *in_data  // in_size
     , const double   *weight   // out_size x in_size
@@ -73,6 +79,7 @@ void Linear1dDouble
     #endif
     )
 {
+    dlrClearLastError();
     dlr::Linear1d<double, 0, 0> ( out_data
              , in_data
              , weight
@@ -85,9 +92,10 @@ void Linear1dDouble
              , verbose 
              #endif
              );
+    return dlrGetLastStatus();
 }
 
-void Linear1dIntReLu
+int Linear1dIntReLu
 (           int      *out_data // out_size
     , const int      *in_data  // in_size
     , const int      *weight   // out_size x in_size
@@ -101,6 +109,7 @@ void Linear1dIntReLu
     #endif
     )
 {
+    dlrClearLastError();
     dlr::Linear1d<int, 1, 0> ( out_data
              , in_data
              , weight
@@ -113,9 +122,10 @@ void Linear1dIntReLu
              , verbose 
              #endif
              );
+    return dlrGetLastStatus();
 }
 
-void Linear1dFloatReLu
+int Linear1dFloatReLu
 (           float    *out_data // out_size
     , const float    *in_data  // in_size
     , const float    *weight   // out_size x in_size
@@ -129,6 +139,7 @@ void Linear1dFloatReLu
     #endif
     )
 {
+    dlrClearLastError();
     dlr::Linear1d<float, 1, 0> ( out_data
              , in_data
              , weight
@@ -141,9 +152,10 @@ void Linear1dFloatReLu
              , verbose 
              #endif
              );
+    return dlrGetLastStatus();
 }
 
-void Linear1dDoubleReLu
+int Linear1dDoubleReLu
 (           double   *out_data // out_size
     , const double   *in_data  // in_size
     , const double   *weight   // out_size x in_size
@@ -157,6 +169,7 @@ void Linear1dDoubleReLu
     #endif
     )
 {
+    dlrClearLastError();
     dlr::Linear1d<double, 1, 0> ( out_data
              , in_data
              , weight
@@ -169,6 +182,428 @@ void Linear1dDoubleReLu
              , verbose 
              #endif
              );
+    return dlrGetLastStatus();
 }
 
+int Linear1dBatchInt
+(           int      *out_data  // minibatch x out_size
+    , const int      *in_data   // minibatch x in_size
+    , const int      *weight    // out_size x in_size
+    , const int      *bias      // out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size
+    , const uint16_t  minibatch // number of minibatch items
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Linear1dBatch<int>
+    (     out_data
+        , in_data
+        , weight
+        , bias
+        , out_size
+        , in_size
+        , bias_size
+        , minibatch
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Linear1dBatchFloat
+(           float    *out_data  // minibatch x out_size
+    , const float    *in_data   // minibatch x in_size
+    , const float    *weight    // out_size x in_size
+    , const float    *bias      // out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size
+    , const uint16_t  minibatch // number of minibatch items
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Linear1dBatch<float>
+    (     out_data
+        , in_data
+        , weight
+        , bias
+        , out_size
+        , in_size
+        , bias_size
+        , minibatch
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Linear1dBatchDouble
+(           double   *out_data  // minibatch x out_size
+    , const double   *in_data   // minibatch x in_size
+    , const double   *weight    // out_size x in_size
+    , const double   *bias      // out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size
+    , const uint16_t  minibatch // number of minibatch items
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Linear1dBatch<double>
+    (     out_data
+        , in_data
+        , weight
+        , bias
+        , out_size
+        , in_size
+        , bias_size
+        , minibatch
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+#if !defined(__SYNTHESIS__)
+int Linear1dInt8
+(           int8_t   *out_data      // out_size
+    , const int8_t   *in_data       // in_size
+    , const int8_t   *weight        // out_size x in_size
+    , const int32_t  *bias          // out_size
+    , const int32_t  *multiplier    // out_size, Q31 of requantization
+    , const int8_t   *shift         // out_size, shift of requantization
+    , const int32_t   in_zero_point
+    , const int32_t   out_zero_point
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Linear1dInt8 ( out_data
+                  , in_data
+                  , weight
+                  , bias
+                  , multiplier
+                  , shift
+                  , in_zero_point
+                  , out_zero_point
+                  , out_size
+                  , in_size
+                  , bias_size
+                  , rigor
+                  , verbose
+                  );
+    return dlrGetLastStatus();
+}
+
+int Linear1dBatchInt8
+(           int8_t   *out_data      // minibatch x out_size
+    , const int8_t   *in_data       // minibatch x in_size
+    , const int8_t   *weight        // out_size x in_size
+    , const int32_t  *bias          // out_size
+    , const int32_t  *multiplier    // out_size, Q31 of requantization
+    , const int8_t   *shift         // out_size, shift of requantization
+    , const int32_t   in_zero_point
+    , const int32_t   out_zero_point
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size
+    , const uint16_t  minibatch     // number of minibatch items
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Linear1dBatchInt8 ( out_data
+                  , in_data
+                  , weight
+                  , bias
+                  , multiplier
+                  , shift
+                  , in_zero_point
+                  , out_zero_point
+                  , out_size
+                  , in_size
+                  , bias_size
+                  , minibatch
+                  , rigor
+                  , verbose
+                  );
+    return dlrGetLastStatus();
+}
+#endif
+
+#if !defined(__SYNTHESIS__)
+// fixed-point of dlr_fixed.hpp, whose data are raw bits (see dlrSetFixedFormat())
+int Linear1dFixed
+(           int32_t  *out_data // out_size
+    , const int32_t  *in_data  // in_size
+    , const int32_t  *weight   // out_size x in_size
+    , const int32_t  *bias     // out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+    )
+{
+    dlrClearLastError();
+    dlr::Linear1d<dlr::Fixed, 0, 0> ( (dlr::Fixed*)out_data
+             , (const dlr::Fixed*)in_data
+             , (const dlr::Fixed*)weight
+             , (const dlr::Fixed*)bias
+             , out_size
+             , in_size
+             , bias_size
+             , rigor
+             , verbose 
+             );
+    return dlrGetLastStatus();
+}
+
+int Linear1dFixedReLu
+(           int32_t  *out_data // out_size
+    , const int32_t  *in_data  // in_size
+    , const int32_t  *weight   // out_size x in_size
+    , const int32_t  *bias     // out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+    )
+{
+    dlrClearLastError();
+    dlr::Linear1d<dlr::Fixed, 1, 0> ( (dlr::Fixed*)out_data
+             , (const dlr::Fixed*)in_data
+             , (const dlr::Fixed*)weight
+             , (const dlr::Fixed*)bias
+             , out_size
+             , in_size
+             , bias_size
+             , rigor
+             , verbose 
+             );
+    return dlrGetLastStatus();
+}
+
+int Linear1dBatchFixed
+(           int32_t  *out_data  // minibatch x out_size
+    , const int32_t  *in_data   // minibatch x in_size
+    , const int32_t  *weight    // out_size x in_size
+    , const int32_t  *bias      // out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size
+    , const uint16_t  minibatch // number of minibatch items
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Linear1dBatch<dlr::Fixed>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , (const dlr::Fixed*)weight
+        , (const dlr::Fixed*)bias
+        , out_size
+        , in_size
+        , bias_size
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+#endif
+
+#if !defined(__SYNTHESIS__)
+// IEEE 754 binary16 (fp16) storage computed in float (see dlr_half.hpp)
+int Linear1dHalf
+(           uint16_t *out_data // out_size
+    , const uint16_t *in_data  // in_size
+    , const uint16_t *weight   // out_size x in_size
+    , const uint16_t *bias     // out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+    )
+{
+    dlrClearLastError();
+    dlr::Linear1d<dlr::Half, 0, 0> ( (dlr::Half*)out_data
+             , (const dlr::Half*)in_data
+             , (const dlr::Half*)weight
+             , (const dlr::Half*)bias
+             , out_size
+             , in_size
+             , bias_size
+             , rigor
+             , verbose 
+             );
+    return dlrGetLastStatus();
+}
+
+int Linear1dHalfReLu
+(           uint16_t *out_data // out_size
+    , const uint16_t *in_data  // in_size
+    , const uint16_t *weight   // out_size x in_size
+    , const uint16_t *bias     // out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+    )
+{
+    dlrClearLastError();
+    dlr::Linear1d<dlr::Half, 1, 0> ( (dlr::Half*)out_data
+             , (const dlr::Half*)in_data
+             , (const dlr::Half*)weight
+             , (const dlr::Half*)bias
+             , out_size
+             , in_size
+             , bias_size
+             , rigor
+             , verbose 
+             );
+    return dlrGetLastStatus();
+}
+
+int Linear1dBatchHalf
+(           uint16_t *out_data  // minibatch x out_size
+    , const uint16_t *in_data   // minibatch x in_size
+    , const uint16_t *weight    // out_size x in_size
+    , const uint16_t *bias      // out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size
+    , const uint16_t  minibatch // number of minibatch items
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Linear1dBatch<dlr::Half>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , (const dlr::Half*)weight
+        , (const dlr::Half*)bias
+        , out_size
+        , in_size
+        , bias_size
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+// bfloat16 (bf16) storage computed in float (see dlr_half.hpp)
+int Linear1dBFloat16
+(           uint16_t *out_data // out_size
+    , const uint16_t *in_data  // in_size
+    , const uint16_t *weight   // out_size x in_size
+    , const uint16_t *bias     // out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+    )
+{
+    dlrClearLastError();
+    dlr::Linear1d<dlr::BFloat16, 0, 0> ( (dlr::BFloat16*)out_data
+             , (const dlr::BFloat16*)in_data
+             , (const dlr::BFloat16*)weight
+             , (const dlr::BFloat16*)bias
+             , out_size
+             , in_size
+             , bias_size
+             , rigor
+             , verbose 
+             );
+    return dlrGetLastStatus();
+}
+
+int Linear1dBFloat16ReLu
+(           uint16_t *out_data // out_size
+    , const uint16_t *in_data  // in_size
+    , const uint16_t *weight   // out_size x in_size
+    , const uint16_t *bias     // out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+    )
+{
+    dlrClearLastError();
+    dlr::Linear1d<dlr::BFloat16, 1, 0> ( (dlr::BFloat16*)out_data
+             , (const dlr::BFloat16*)in_data
+             , (const dlr::BFloat16*)weight
+             , (const dlr::BFloat16*)bias
+             , out_size
+             , in_size
+             , bias_size
+             , rigor
+             , verbose 
+             );
+    return dlrGetLastStatus();
+}
+
+int Linear1dBatchBFloat16
+(           uint16_t *out_data  // minibatch x out_size
+    , const uint16_t *in_data   // minibatch x in_size
+    , const uint16_t *weight    // out_size x in_size
+    , const uint16_t *bias      // out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size
+    , const uint16_t  minibatch // number of minibatch items
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Linear1dBatch<dlr::BFloat16>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , (const dlr::BFloat16*)weight
+        , (const dlr::BFloat16*)bias
+        , out_size
+        , in_size
+        , bias_size
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+#endif
+
 } // extern "C"
@@ -6,8 +6,9 @@ extern "C" {
 #endif
 
 #define Linear1d Linear1dFloat
+#define Linear1dBatch Linear1dBatchFloat
 
-extern void Linear1dInt
+extern int Linear1dInt
 (           int      *out_data    // out_feature
     , const int      *in_data     // in_feature
     , const int      *weight      // out_feature x in_feature
@@ -21,7 +22,7 @@ extern void Linear1dInt
     #endif
 );
 
-extern void Linear1dFloat
+extern int Linear1dFloat
 (           float    *out_data    // out_feature
     , const float    *in_data     // in_feature
     , const float    *weight      // out_feature x in_feature
@@ -35,7 +36,7 @@ extern void Linear1dFloat
     #endif
 );
 
-extern void Linear1dDouble
+extern int Linear1dDouble
 (           double   *out_data    // out_feature x 1
     , const double   *in_data     // in_feature x 1
     , const double   *weight      // out_feature x in_feature
@@ -51,7 +52,7 @@ extern void Linear1dDouble
 
 #define Linear1dReLu Linear1dFloatReLu
 
-extern void Linear1dIntReLu
+extern int Linear1dIntReLu
 (           int      *out_data    // out_feature
     , const int      *in_data     // in_feature
     , const int      *weight      // out_feature x in_feature
@@ -65,7 +66,7 @@ extern void Linear1dIntReLu
     #endif
 );
 
-extern void Linear1dFloatReLu
+extern int Linear1dFloatReLu
 (           float    *out_data    // out_feature
     , const float    *in_data     // in_feature
     , const float    *weight      // out_feature x in_feature
@@ -79,7 +80,7 @@ extern void Linear1dFloatReLu
     #endif
 );
 
-extern void Linear1dDoubleReLu
+extern int Linear1dDoubleReLu
 (           double   *out_data    // out_feature x 1
     , const double   *in_data     // in_feature x 1
     , const double   *weight      // out_feature x in_feature
@@ -93,6 +94,205 @@ extern void Linear1dDoubleReLu
     #endif
 );
 
+extern int Linear1dBatchInt
+(           int      *out_data  // minibatch x out_size
+    , const int      *in_data   // minibatch x in_size
+    , const int      *weight    // out_size x in_size
+    , const int      *bias      // out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size
+    , const uint16_t  minibatch // number of minibatch items
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+extern int Linear1dBatchFloat
+(           float    *out_data  // minibatch x out_size
+    , const float    *in_data   // minibatch x in_size
+    , const float    *weight    // out_size x in_size
+    , const float    *bias      // out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size
+    , const uint16_t  minibatch // number of minibatch items
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+extern int Linear1dBatchDouble
+(           double   *out_data  // minibatch x out_size
+    , const double   *in_data   // minibatch x in_size
+    , const double   *weight    // out_size x in_size
+    , const double   *bias      // out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size
+    , const uint16_t  minibatch // number of minibatch items
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+#if !defined(__SYNTHESIS__)
+// int8 x int8 --> int32 with requantization to int8 for each output
+extern int Linear1dInt8
+(           int8_t   *out_data      // out_size
+    , const int8_t   *in_data       // in_size
+    , const int8_t   *weight        // out_size x in_size
+    , const int32_t  *bias          // out_size
+    , const int32_t  *multiplier    // out_size, Q31 of requantization
+    , const int8_t   *shift         // out_size, shift of requantization
+    , const int32_t   in_zero_point
+    , const int32_t   out_zero_point
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+);
+
+extern int Linear1dBatchInt8
+(           int8_t   *out_data      // minibatch x out_size
+    , const int8_t   *in_data       // minibatch x in_size
+    , const int8_t   *weight        // out_size x in_size
+    , const int32_t  *bias          // out_size
+    , const int32_t  *multiplier    // out_size, Q31 of requantization
+    , const int8_t   *shift         // out_size, shift of requantization
+    , const int32_t   in_zero_point
+    , const int32_t   out_zero_point
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size
+    , const uint16_t  minibatch     // number of minibatch items
+    , const int       rigor         // check rigorously when 1
+    , const int       verbose       // verbose level
+);
+#endif
+
+#if !defined(__SYNTHESIS__)
+// fixed-point of raw bits in the format of dlrSetFixedFormat()
+extern int Linear1dFixed
+(           int32_t  *out_data    // out_feature
+    , const int32_t  *in_data     // in_feature
+    , const int32_t  *weight      // out_feature x in_feature
+    , const int32_t  *bias
+    , const uint16_t  out_size
+    , const uint16_t  in_size 
+    , const uint16_t  bias_size
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Linear1dFixedReLu
+(           int32_t  *out_data    // out_feature
+    , const int32_t  *in_data     // in_feature
+    , const int32_t  *weight      // out_feature x in_feature
+    , const int32_t  *bias
+    , const uint16_t  out_size
+    , const uint16_t  in_size 
+    , const uint16_t  bias_size
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Linear1dBatchFixed
+(           int32_t  *out_data  // minibatch x out_size
+    , const int32_t  *in_data   // minibatch x in_size
+    , const int32_t  *weight    // out_size x in_size
+    , const int32_t  *bias      // out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size
+    , const uint16_t  minibatch // number of minibatch items
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+#endif
+
+#if !defined(__SYNTHESIS__)
+// IEEE 754 binary16 (fp16) storage of uint16_t bits computed in float
+extern int Linear1dHalf
+(           uint16_t *out_data    // out_feature
+    , const uint16_t *in_data     // in_feature
+    , const uint16_t *weight      // out_feature x in_feature
+    , const uint16_t *bias
+    , const uint16_t  out_size
+    , const uint16_t  in_size 
+    , const uint16_t  bias_size
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Linear1dHalfReLu
+(           uint16_t *out_data    // out_feature
+    , const uint16_t *in_data     // in_feature
+    , const uint16_t *weight      // out_feature x in_feature
+    , const uint16_t *bias
+    , const uint16_t  out_size
+    , const uint16_t  in_size 
+    , const uint16_t  bias_size
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Linear1dBatchHalf
+(           uint16_t *out_data  // minibatch x out_size
+    , const uint16_t *in_data   // minibatch x in_size
+    , const uint16_t *weight    // out_size x in_size
+    , const uint16_t *bias      // out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size
+    , const uint16_t  minibatch // number of minibatch items
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+// bfloat16 (bf16) storage of uint16_t bits computed in float
+extern int Linear1dBFloat16
+(           uint16_t *out_data    // out_feature
+    , const uint16_t *in_data     // in_feature
+    , const uint16_t *weight      // out_feature x in_feature
+    , const uint16_t *bias
+    , const uint16_t  out_size
+    , const uint16_t  in_size 
+    , const uint16_t  bias_size
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Linear1dBFloat16ReLu
+(           uint16_t *out_data    // out_feature
+    , const uint16_t *in_data     // in_feature
+    , const uint16_t *weight      // out_feature x in_feature
+    , const uint16_t *bias
+    , const uint16_t  out_size
+    , const uint16_t  in_size 
+    , const uint16_t  bias_size
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Linear1dBatchBFloat16
+(           uint16_t *out_data  // minibatch x out_size
+    , const uint16_t *in_data   // minibatch x in_size
+    , const uint16_t *weight    // out_size x in_size
+    , const uint16_t *bias      // out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size
+    , const uint16_t  minibatch // number of minibatch items
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+#endif
+
 #ifdef __cplusplus
 }
 #endif
@@ -10,11 +10,14 @@
  * @date Aug. 31, 2020
  */
 #include <stdint.h>
+#include "dlr_half.hpp"
 #if !defined(__SYNTHESIS__)
 #include <stdio.h>
-#include <assert.h>
 #include <typeinfo>
+#include <vector>
 #include "dlr_common.h"
+#include "dlr_simd.hpp"
+#include "dlr_quant.hpp"
 #endif
 
 namespace dlr { // deep learning routines
@@ -51,33 +54,37 @@ void Linear1d
         fflush(stderr); fflush(stdout);
     }
     if (rigor) {
-        assert (in_size>0);
-        assert (out_size>0);
-        assert ((bias_size==0)||(out_size==bias_size));
+        dlrCheck (in_size>0);
+        dlrCheck (out_size>0);
+        dlrCheck ((bias_size==0)||(out_size==bias_size));
     }
     #undef QuoteMacro
     #undef QuoteIdent
     #endif
 
+    typedef typename Accumulator<TYPE>::type ACCUM; // float for 'Half' and 'BFloat16'
     uint16_t o, i;
 
     for(o=0; o<out_size; ++o){
-        TYPE  sum = (TYPE)0;
+        ACCUM sum = (ACCUM)0;
         TYPE *pZ = (TYPE*)(out_data+o);
-        TYPE B = (bias_size==(TYPE)0) ? (TYPE)0 : *(bias+o);
+        ACCUM B = (bias_size==0) ? (ACCUM)0 : (ACCUM)*(bias+o);
+        #if !defined(__SYNTHESIS__)
+        if (!SimdDot(&sum, in_data, weight+(uint32_t)o*in_size, in_size))
+        #endif
         for(i=0; i<in_size; ++i){
             TYPE *pX = (TYPE*)(in_data+i);
             TYPE *pW = (TYPE*)(weight +(o*in_size + i));
             sum += (*pX)*(*pW);
         }
         if (ReLu) {
-            *pZ = ((sum+B)<=(TYPE)0) ? (TYPE)0 : (TYPE)(sum+B);
+            *pZ = ((sum+B)<=(ACCUM)0) ? (TYPE)0 : (TYPE)(sum+B);
         } else if (LeakyReLu) {
              uint32_t ss = negative_slope;
              float slope = *((float *)&ss); // make sure that it is 32-bit wide item
-            *pZ = (sum<(TYPE)0) ? (TYPE)((float)sum*slope) : sum;
+            *pZ = (sum<(ACCUM)0) ? (TYPE)((float)sum*slope) : (TYPE)sum;
         } else {
-            *pZ = sum+B;
+            *pZ = (TYPE)(sum+B);
         }
     }
 }
@@ -88,10 +95,145 @@ void Linear1d
 // B=bias[out_size]
 // Z=X*W'+B, where W' is transposed W.
 
+// minibatch version: in_data and out_data have leading minibatch dimension
+template< class TYPE=float
+        , const int ReLu=0
+        , const int LeakyReLu=0
+        , const uint32_t negative_slope=0x3DCCCCCD // 0.1
+        >
+void Linear1dBatch
+(           TYPE     *out_data  // minibatch x out_size
+    , const TYPE     *in_data   // minibatch x in_size
+    , const TYPE     *weight    // out_size x in_size
+    , const TYPE     *bias      // out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size
+    , const uint16_t  minibatch // number of minibatch items
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+    #endif
+)
+{
+    const uint32_t t_out_step=(uint32_t)out_size;
+    const uint32_t t_in_step =(uint32_t)in_size;
+    TYPE       *pZ = out_data;
+    const TYPE *pX = in_data;
+    uint16_t mb;
+
+    for (mb=0; mb<minibatch; ++mb) {
+        Linear1d<TYPE, ReLu, LeakyReLu, negative_slope>
+        (     pZ
+            , pX
+            , weight
+            , bias
+            , out_size
+            , in_size
+            , bias_size
+            #if !defined(__SYNTHESIS__)
+            , rigor
+            , verbose
+            #endif
+        );
+        pZ += t_out_step;
+        pX += t_in_step;
+    }
+}
+
+#if !defined(__SYNTHESIS__)
+// int8 x int8 --> int32 version, where the accumulator of each output is
+// requantized to int8 by 'multiplier' and 'shift' (see dlr_quant.hpp).
+//  out_data[minibatch][out_size]   int8 of out_scale and out_zero_point
+//  in_data[minibatch][in_size]     int8 of in_scale and in_zero_point
+//  weight[out_size][in_size]       int8 of weight_scale[out_size]
+//  bias[out_size]                  int32 of in_scale*weight_scale[out_size]
+// Z=(X-in_zero_point)*W'+B, where a row of weight is read once for all minibatch items.
+inline void Linear1dBatchInt8
+(           int8_t   *out_data      // minibatch x out_size
+    , const int8_t   *in_data       // minibatch x in_size
+    , const int8_t   *weight        // out_size x in_size
+    , const int32_t  *bias          // out_size
+    , const int32_t  *multiplier    // out_size, Q31 of requantization
+    , const int8_t   *shift         // out_size, shift of requantization
+    , const int32_t   in_zero_point
+    , const int32_t   out_zero_point
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size
+    , const uint16_t  minibatch     // number of minibatch items
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+)
+{
+    if (verbose) {
+        dlrInfo("out_size   =%d\n",    out_size );
+        dlrInfo("in_size    =%d\n",    in_size  );
+        dlrInfo("weight_size=%dx%d\n", out_size, in_size);
+        dlrInfo("bias_size  =%d\n",    bias_size);
+        dlrInfo("minibatch  =%d\n",    minibatch);
+        dlrInfo("zero_point =%d %d\n", in_zero_point, out_zero_point);
+        fflush(stderr); fflush(stdout);
+    }
+    if (rigor) {
+        dlrCheck (in_size>0);
+        dlrCheck (out_size>0);
+        dlrCheck ((bias_size==0)||(out_size==bias_size));
+        dlrCheck ((in_zero_point>=DLR_INT8_MIN)&&(in_zero_point<=DLR_INT8_MAX));
+        dlrCheck ((out_zero_point>=DLR_INT8_MIN)&&(out_zero_point<=DLR_INT8_MAX));
+        for (uint16_t o=0; o<out_size; ++o) {
+            dlrCheck ((multiplier[o]>=0)&&(shift[o]>=-30)&&(shift[o]<=32));
+        }
+    }
+
+    std::vector<int16_t> t_in((size_t)minibatch*in_size); // in_data less in_zero_point
+    for (uint32_t n=0; n<(uint32_t)minibatch*in_size; ++n) t_in[n] = (int16_t)(in_data[n]-in_zero_point);
+    int32_t o; // signed for OpenMP
+
+    #if defined(_OPENMP)
+    #pragma omp parallel for
+    #endif
+    for (o=0; o<(int32_t)out_size; ++o) {
+        const int8_t *pW = weight+(uint32_t)o*in_size;
+        const int32_t B = (bias_size==0) ? 0 : bias[o];
+        for (uint16_t mb=0; mb<minibatch; ++mb) {
+            const int32_t sum = SimdDotInt8(&t_in[(uint32_t)mb*in_size], pW, in_size);
+            out_data[(uint32_t)mb*out_size+o] = Requantize(sum+B, multiplier[o], shift[o], out_zero_point);
+        }
+    }
+}
+
+inline void Linear1dInt8
+(           int8_t   *out_data      // out_size
+    , const int8_t   *in_data       // in_size
+    , const int8_t   *weight        // out_size x in_size
+    , const int32_t  *bias          // out_size
+    , const int32_t  *multiplier    // out_size, Q31 of requantization
+    , const int8_t   *shift         // out_size, shift of requantization
+    , const int32_t   in_zero_point
+    , const int32_t   out_zero_point
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+)
+{
+    Linear1dBatchInt8( out_data, in_data, weight, bias, multiplier, shift
+                     , in_zero_point, out_zero_point, out_size, in_size, bias_size
+                     , 1, rigor, verbose);
+}
+#endif // !defined(__SYNTHESIS__)
+
 } // namespace dlr
 /*
  * Revision history
  *
+ * 2026.10.18: sum goes 'Accumulator<TYPE>', i.e., float for 'Half' and 'BFloat16'.
+ * 2026.10.18: 'Linear1dInt8' and 'Linear1dBatchInt8' added for int8 with requantization.
+ * 2026.10.18: SIMD dot product for float (dlr_simd.hpp).
+ * 2026.10.18: 'dlrCheck()' in place of 'assert()' for rigor checks.
+ * 2026.10.18: 'Linear1dBatch' added for minibatch.
  * 2020.11.12: 'LeakyReLu' template added.
  * 2020.09.20: parameter order of bias and bias_size changed.
  *             parameter 'rigor' and 'verbose' added.
@@ -0,0 +1,193 @@
+#include "linear_batch.hpp"
+#include "dlr_fixed.hpp"
+#include "dlr_half.hpp"
+
+extern "C" {
+
+int LinearBatchInt
+(           int      *out_data  // rows x out_size
+    , const int      *in_data   // rows x in_size
+    , const int      *weight    // out_size x in_size
+    , const int      *bias      // NULL or out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size // 0 or out_size
+    , const uint32_t  rows      // minibatch x ndim
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::LinearBatch<int>
+    (     out_data
+        , in_data
+        , weight
+        , bias
+        , out_size
+        , in_size
+        , bias_size
+        , rows
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int LinearBatchFloat
+(           float    *out_data  // rows x out_size
+    , const float    *in_data   // rows x in_size
+    , const float    *weight    // out_size x in_size
+    , const float    *bias      // NULL or out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size // 0 or out_size
+    , const uint32_t  rows      // minibatch x ndim
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::LinearBatch<float>
+    (     out_data
+        , in_data
+        , weight
+        , bias
+        , out_size
+        , in_size
+        , bias_size
+        , rows
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int LinearBatchDouble
+(           double   *out_data  // rows x out_size
+    , const double   *in_data   // rows x in_size
+    , const double   *weight    // out_size x in_size
+    , const double   *bias      // NULL or out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size // 0 or out_size
+    , const uint32_t  rows      // minibatch x ndim
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::LinearBatch<double>
+    (     out_data
+        , in_data
+        , weight
+        , bias
+        , out_size
+        , in_size
+        , bias_size
+        , rows
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+#if !defined(__SYNTHESIS__)
+// fixed-point of dlr_fixed.hpp, whose data are raw bits (see dlrSetFixedFormat())
+int LinearBatchFixed
+(           int32_t  *out_data  // rows x out_size
+    , const int32_t  *in_data   // rows x in_size
+    , const int32_t  *weight    // out_size x in_size
+    , const int32_t  *bias      // NULL or out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size // 0 or out_size
+    , const uint32_t  rows      // minibatch x ndim
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::LinearBatch<dlr::Fixed>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , (const dlr::Fixed*)weight
+        , (const dlr::Fixed*)bias
+        , out_size
+        , in_size
+        , bias_size
+        , rows
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+#endif
+
+#if !defined(__SYNTHESIS__)
+// IEEE 754 binary16 (fp16) storage computed in float (see dlr_half.hpp)
+int LinearBatchHalf
+(           uint16_t *out_data  // rows x out_size
+    , const uint16_t *in_data   // rows x in_size
+    , const uint16_t *weight    // out_size x in_size
+    , const uint16_t *bias      // NULL or out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size // 0 or out_size
+    , const uint32_t  rows      // minibatch x ndim
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::LinearBatch<dlr::Half>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , (const dlr::Half*)weight
+        , (const dlr::Half*)bias
+        , out_size
+        , in_size
+        , bias_size
+        , rows
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+// bfloat16 (bf16) storage computed in float (see dlr_half.hpp)
+int LinearBatchBFloat16
+(           uint16_t *out_data  // rows x out_size
+    , const uint16_t *in_data   // rows x in_size
+    , const uint16_t *weight    // out_size x in_size
+    , const uint16_t *bias      // NULL or out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size // 0 or out_size
+    , const uint32_t  rows      // minibatch x ndim
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::LinearBatch<dlr::BFloat16>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , (const dlr::BFloat16*)weight
+        , (const dlr::BFloat16*)bias
+        , out_size
+        , in_size
+        , bias_size
+        , rows
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+#endif
+
+} // extern "C"
+/*
+ * Revision history
+ *
+ * 2026.10.18: Started.
+ */
@@ -0,0 +1,106 @@
+#pragma once
+#include <stdint.h>
+#include "dlr_common.h"
+
+// software-only: linear over all rows of minibatch x ndim at once by blocks of weight
+#if !defined(__SYNTHESIS__)
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#define LinearBatch LinearBatchFloat
+
+extern int LinearBatchInt
+(           int      *out_data  // rows x out_size
+    , const int      *in_data   // rows x in_size
+    , const int      *weight    // out_size x in_size
+    , const int      *bias      // NULL or out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size // 0 or out_size
+    , const uint32_t  rows      // minibatch x ndim
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+extern int LinearBatchFloat
+(           float    *out_data  // rows x out_size
+    , const float    *in_data   // rows x in_size
+    , const float    *weight    // out_size x in_size
+    , const float    *bias      // NULL or out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size // 0 or out_size
+    , const uint32_t  rows      // minibatch x ndim
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+extern int LinearBatchDouble
+(           double   *out_data  // rows x out_size
+    , const double   *in_data   // rows x in_size
+    , const double   *weight    // out_size x in_size
+    , const double   *bias      // NULL or out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size // 0 or out_size
+    , const uint32_t  rows      // minibatch x ndim
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+#if !defined(__SYNTHESIS__)
+// fixed-point of raw bits in the format of dlrSetFixedFormat()
+extern int LinearBatchFixed
+(           int32_t  *out_data  // rows x out_size
+    , const int32_t  *in_data   // rows x in_size
+    , const int32_t  *weight    // out_size x in_size
+    , const int32_t  *bias      // NULL or out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size // 0 or out_size
+    , const uint32_t  rows      // minibatch x ndim
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+#endif
+
+#if !defined(__SYNTHESIS__)
+// IEEE 754 binary16 (fp16) storage of uint16_t bits computed in float
+extern int LinearBatchHalf
+(           uint16_t *out_data  // rows x out_size
+    , const uint16_t *in_data   // rows x in_size
+    , const uint16_t *weight    // out_size x in_size
+    , const uint16_t *bias      // NULL or out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size // 0 or out_size
+    , const uint32_t  rows      // minibatch x ndim
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+// bfloat16 (bf16) storage of uint16_t bits computed in float
+extern int LinearBatchBFloat16
+(           uint16_t *out_data  // rows x out_size
+    , const uint16_t *in_data   // rows x in_size
+    , const uint16_t *weight    // out_size x in_size
+    , const uint16_t *bias      // NULL or out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size // 0 or out_size
+    , const uint32_t  rows      // minibatch x ndim
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+#endif
+
+#ifdef __cplusplus
+}
+#endif
+#endif // !defined(__SYNTHESIS__)
+/*
+ * Revision history
+ *
+ * 2026.10.18: Started.
+ */
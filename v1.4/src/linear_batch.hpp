@@ -0,0 +1,113 @@
+#pragma once
+/*
+ * Copyright (c) 2019-2020 by Future Design Systems.
+ * All right reserved.
+ * http://www.future-ds.com
+ *
+ * @file linear_batch.hpp
+ * @brief This file contains linear (fully-connected) routine over all rows
+ *        of minibatch and ndim at once (software-only, not for HLS).
+ * @author FDS
+ * @date Oct. 18, 2026
+ */
+#if !defined(__SYNTHESIS__)
+#include <stdint.h>
+#include <stdio.h>
+#include "dlr_common.h"
+#include "dlr_half.hpp"
+#include "dlr_simd.hpp"
+
+namespace dlr { // deep learning routines
+
+// bytes of a block of weight rows, which stays in cache while all rows of
+// in_data are multiplied by it
+#define DLR_LINEAR_BLOCK (128*1024)
+
+// Z=out_data[rows][out_size]
+// X=in_data[rows][in_size]
+// W=weight[out_size][in_size]
+// B=bias[out_size]
+// Z=X*W'+B, where W' is transposed W and rows are minibatch x ndim.
+// Same as Linear1d() or LinearNd() for each row, but weight is read once
+// per block of out_size rows instead of once per row of in_data, and
+// DLR_SIMD_TILE rows of in_data and weight share loads for float.
+template<class TYPE=float>
+void LinearBatch
+(           TYPE     *out_data // rows x out_size
+    , const TYPE     *in_data  // rows x in_size
+    , const TYPE     *weight   // out_size x in_size
+    , const TYPE     *bias     // NULL or out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size // 0 or out_size
+    , const uint32_t  rows      // minibatch x ndim
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+)
+{
+    if (verbose) {
+        dlrInfo("rows       =%u\n",    rows     );
+        dlrInfo("out_size   =%d\n",    out_size );
+        dlrInfo("in_size    =%d\n",    in_size  );
+        dlrInfo("weight_size=%dx%d\n", out_size, in_size);
+        dlrInfo("bias_size  =%d\n",    bias_size);
+        fflush(stderr); fflush(stdout);
+    }
+    if (rigor) {
+        dlrCheck (rows>0);
+        dlrCheck (in_size>0);
+        dlrCheck (out_size>0);
+        dlrCheck ((bias_size==0)||(out_size==bias_size));
+    }
+
+    typedef typename Accumulator<TYPE>::type ACCUM; // float for 'Half' and 'BFloat16'
+    const uint32_t t_tile  = DLR_SIMD_TILE;
+    uint32_t t_block = DLR_LINEAR_BLOCK/((uint32_t)in_size*sizeof(TYPE));
+    t_block = (t_block<t_tile) ? t_tile : (t_block/t_tile)*t_tile;
+    uint32_t o0;
+
+    for (o0=0; o0<out_size; o0+=t_block) {
+        const uint32_t o1 = ((o0+t_block)<out_size) ? (o0+t_block) : out_size;
+        int32_t r0; // signed for OpenMP
+        #if defined(_OPENMP)
+        #pragma omp parallel for
+        #endif
+        for (r0=0; r0<(int32_t)rows; r0+=t_tile) {
+            const uint32_t r1 = ((r0+t_tile)<rows) ? (r0+t_tile) : rows;
+            uint32_t o, r, i, j;
+            for (o=o0; o<o1; o+=t_tile) {
+                const uint32_t o2 = ((o+t_tile)<o1) ? (o+t_tile) : o1;
+                TYPE *pZ = out_data+(uint32_t)r0*out_size+o;
+                if (((r1-r0)<t_tile)||((o2-o)<t_tile)||
+                    !SimdDotTile(pZ, out_size, in_data+(uint32_t)r0*in_size, in_size,
+                                 weight+o*in_size, in_size, in_size)) {
+                    for (r=r0; r<r1; ++r) { // edge of matrix or other than float
+                        for (j=o; j<o2; ++j) {
+                            const TYPE *pX = in_data+r*in_size;
+                            const TYPE *pW = weight +j*in_size;
+                            ACCUM sum = (ACCUM)0;
+                            if (!SimdDot(&sum, pX, pW, in_size)) {
+                                for (i=0; i<in_size; ++i) sum += pX[i]*pW[i];
+                            }
+                            if (bias_size!=0) sum += (ACCUM)bias[j]; // rounded once to TYPE
+                            out_data[r*out_size+j] = (TYPE)sum;
+                        }
+                    }
+                } else if (bias_size!=0) {
+                    for (r=r0; r<r1; ++r) {
+                        for (j=o; j<o2; ++j) out_data[r*out_size+j] += bias[j];
+                    }
+                }
+            }
+        }
+    }
+}
+
+} // namespace dlr
+#endif // !defined(__SYNTHESIS__)
+/*
+ * Revision history
+ *
+ * 2026.10.18: sum goes 'Accumulator<TYPE>', i.e., float for 'Half' and 'BFloat16'.
+ * 2026.10.18: Started.
+ */
@@ -1,9 +1,11 @@
 
 #include "linear_nd.hpp"
+#include "dlr_fixed.hpp"
+#include "dlr_half.hpp"
 
 extern "C" {
 
-void LinearNdInt
+int LinearNdInt
 (           int      *out_data // ndim x out_size
     , const int      *in_data  // ndim x in_size
     , const int      *weight   // out_size x in_size
@@ -18,6 +20,7 @@ void LinearNdInt
     #endif
     )
 {
+    dlrClearLastError();
     dlr::LinearNd<int, 0> ( out_data
              , in_data
              , weight
@@ -31,9 +34,10 @@ void LinearNdInt
              , verbose 
              #endif
              );
+    return dlrGetLastStatus();
 }
 
-void LinearNdFloat
+int LinearNdFloat
 (           float    *out_data // ndim x out_size
     , const float    *in_data  // ndim x in_size
     , const float    *weight   // out_size x in_size
@@ -48,6 +52,7 @@ void LinearNdFloat
     #endif
     )
 {
+    dlrClearLastError();
     dlr::LinearNd<float, 0> ( out_data
              , in_data
              , weight
@@ -61,9 +66,10 @@ void LinearNdFloat
              , verbose 
              #endif
              );
+    return dlrGetLastStatus();
 }
 
-void LinearNdDouble
+int LinearNdDouble
 (           double   *out_data // ndim x out_size
     , const double   *in_data  // ndim x in_size
     , const double   *weight   // out_size x in_size
@@ -78,6 +84,7 @@ void LinearNdDouble
     #endif
     )
 {
+    dlrClearLastError();
     dlr::LinearNd<double, 0> ( out_data
              , in_data
              , weight
@@ -91,9 +98,10 @@ void LinearNdDouble
              , verbose 
              #endif
              );
+    return dlrGetLastStatus();
 }
 
-void LinearNdIntReLu
+int LinearNdIntReLu
 (           int      *out_data // ndim x out_size
     , const int      *in_data  // ndim x in_size
     , const int      *weight   // out_size x in_size
@@ -108,6 +116,7 @@ void LinearNdIntReLu
     #endif
     )
 {
+    dlrClearLastError();
     dlr::LinearNd<int, 1> ( out_data
              , in_data
              , weight
@@ -121,9 +130,10 @@ void LinearNdIntReLu
              , verbose 
              #endif
              );
+    return dlrGetLastStatus();
 }
 
-void LinearNdFloatReLu
+int LinearNdFloatReLu
 (           float    *out_data // ndim x out_size
     , const float    *in_data  // ndim x in_size
     , const float    *weight   // out_size x in_size
@@ -138,6 +148,7 @@ void LinearNdFloatReLu
     #endif
     )
 {
+    dlrClearLastError();
     dlr::LinearNd<float, 1> ( out_data
              , in_data
              , weight
@@ -151,9 +162,10 @@ void LinearNdFloatReLu
              , verbose 
              #endif
              );
+    return dlrGetLastStatus();
 }
 
-void LinearNdDoubleReLu
+int LinearNdDoubleReLu
 (           double   *out_data // ndim x out_size
     , const double   *in_data  // ndim x in_size
     , const double   *weight   // out_size x in_size
@@ -168,6 +180,7 @@ void LinearNdDoubleReLu
     #endif
     )
 {
+    dlrClearLastError();
     dlr::LinearNd<double, 1> ( out_data
              , in_data
              , weight
@@ -181,6 +194,182 @@ void LinearNdDoubleReLu
              , verbose 
              #endif
              );
+    return dlrGetLastStatus();
 }
 
+#if !defined(__SYNTHESIS__)
+// fixed-point of dlr_fixed.hpp, whose data are raw bits (see dlrSetFixedFormat())
+int LinearNdFixed
+(           int32_t  *out_data // ndim x out_size
+    , const int32_t  *in_data  // ndim x in_size
+    , const int32_t  *weight   // out_size x in_size
+    , const int32_t  *bias     // out_size
+    , const uint16_t  out_size // num of elements per dim
+    , const uint16_t  in_size
+    , const uint16_t  bias_size
+    , const uint8_t   ndim
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+    )
+{
+    dlrClearLastError();
+    dlr::LinearNd<dlr::Fixed, 0> ( (dlr::Fixed*)out_data
+             , (const dlr::Fixed*)in_data
+             , (const dlr::Fixed*)weight
+             , (const dlr::Fixed*)bias
+             , out_size
+             , in_size
+             , bias_size
+             , ndim
+             , rigor
+             , verbose 
+             );
+    return dlrGetLastStatus();
+}
+
+int LinearNdFixedReLu
+(           int32_t  *out_data // ndim x out_size
+    , const int32_t  *in_data  // ndim x in_size
+    , const int32_t  *weight   // out_size x in_size
+    , const int32_t  *bias     // out_size
+    , const uint16_t  out_size // num of elements per dim
+    , const uint16_t  in_size
+    , const uint16_t  bias_size
+    , const uint8_t   ndim
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+    )
+{
+    dlrClearLastError();
+    dlr::LinearNd<dlr::Fixed, 1> ( (dlr::Fixed*)out_data
+             , (const dlr::Fixed*)in_data
+             , (const dlr::Fixed*)weight
+             , (const dlr::Fixed*)bias
+             , out_size
+             , in_size
+             , bias_size
+             , ndim
+             , rigor
+             , verbose 
+             );
+    return dlrGetLastStatus();
+}
+#endif
+
+#if !defined(__SYNTHESIS__)
+// IEEE 754 binary16 (fp16) storage computed in float (see dlr_half.hpp)
+int LinearNdHalf
+(           uint16_t *out_data // ndim x out_size
+    , const uint16_t *in_data  // ndim x in_size
+    , const uint16_t *weight   // out_size x in_size
+    , const uint16_t *bias     // out_size
+    , const uint16_t  out_size // num of elements per dim
+    , const uint16_t  in_size
+    , const uint16_t  bias_size
+    , const uint8_t   ndim
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+    )
+{
+    dlrClearLastError();
+    dlr::LinearNd<dlr::Half, 0> ( (dlr::Half*)out_data
+             , (const dlr::Half*)in_data
+             , (const dlr::Half*)weight
+             , (const dlr::Half*)bias
+             , out_size
+             , in_size
+             , bias_size
+             , ndim
+             , rigor
+             , verbose 
+             );
+    return dlrGetLastStatus();
+}
+
+int LinearNdHalfReLu
+(           uint16_t *out_data // ndim x out_size
+    , const uint16_t *in_data  // ndim x in_size
+    , const uint16_t *weight   // out_size x in_size
+    , const uint16_t *bias     // out_size
+    , const uint16_t  out_size // num of elements per dim
+    , const uint16_t  in_size
+    , const uint16_t  bias_size
+    , const uint8_t   ndim
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+    )
+{
+    dlrClearLastError();
+    dlr::LinearNd<dlr::Half, 1> ( (dlr::Half*)out_data
+             , (const dlr::Half*)in_data
+             , (const dlr::Half*)weight
+             , (const dlr::Half*)bias
+             , out_size
+             , in_size
+             , bias_size
+             , ndim
+             , rigor
+             , verbose 
+             );
+    return dlrGetLastStatus();
+}
+
+// bfloat16 (bf16) storage computed in float (see dlr_half.hpp)
+int LinearNdBFloat16
+(           uint16_t *out_data // ndim x out_size
+    , const uint16_t *in_data  // ndim x in_size
+    , const uint16_t *weight   // out_size x in_size
+    , const uint16_t *bias     // out_size
+    , const uint16_t  out_size // num of elements per dim
+    , const uint16_t  in_size
+    , const uint16_t  bias_size
+    , const uint8_t   ndim
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+    )
+{
+    dlrClearLastError();
+    dlr::LinearNd<dlr::BFloat16, 0> ( (dlr::BFloat16*)out_data
+             , (const dlr::BFloat16*)in_data
+             , (const dlr::BFloat16*)weight
+             , (const dlr::BFloat16*)bias
+             , out_size
+             , in_size
+             , bias_size
+             , ndim
+             , rigor
+             , verbose 
+             );
+    return dlrGetLastStatus();
+}
+
+int LinearNdBFloat16ReLu
+(           uint16_t *out_data // ndim x out_size
+    , const uint16_t *in_data  // ndim x in_size
+    , const uint16_t *weight   // out_size x in_size
+    , const uint16_t *bias     // out_size
+    , const uint16_t  out_size // num of elements per dim
+    , const uint16_t  in_size
+    , const uint16_t  bias_size
+    , const uint8_t   ndim
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+    )
+{
+    dlrClearLastError();
+    dlr::LinearNd<dlr::BFloat16, 1> ( (dlr::BFloat16*)out_data
+             , (const dlr::BFloat16*)in_data
+             , (const dlr::BFloat16*)weight
+             , (const dlr::BFloat16*)bias
+             , out_size
+             , in_size
+             , bias_size
+             , ndim
+             , rigor
+             , verbose 
+             );
+    return dlrGetLastStatus();
+}
+#endif
+
 } // extern "C"
@@ -7,7 +7,7 @@ extern "C" {
 
 #define Linearnd LinearndFloat
 
-extern void LinearNdInt
+extern int LinearNdInt
 (           int      *out_data    // out_feature
     , const int      *in_data     // in_feature
     , const int      *weight      // out_feature x in_feature
@@ -22,7 +22,7 @@ extern void LinearNdInt
     #endif
 );
 
-extern void LinearNdFloat
+extern int LinearNdFloat
 (           float    *out_data    // out_feature
     , const float    *in_data     // in_feature
     , const float    *weight      // out_feature x in_feature
@@ -37,7 +37,7 @@ extern void LinearNdFloat
     #endif
 );
 
-extern void LinearNdDouble
+extern int LinearNdDouble
 (           double   *out_data    // out_feature x 1
     , const double   *in_data     // in_feature x 1
     , const double   *weight      // out_feature x in_feature
@@ -52,6 +52,52 @@ extern void LinearNdDouble
     #endif
 );
 
+#if !defined(__SYNTHESIS__)
+// fixed-point of raw bits in the format of dlrSetFixedFormat()
+extern int LinearNdFixed
+(           int32_t  *out_data    // out_feature
+    , const int32_t  *in_data     // in_feature
+    , const int32_t  *weight      // out_feature x in_feature
+    , const int32_t  *bias
+    , const uint16_t  out_size
+    , const uint16_t  in_size 
+    , const uint16_t  bias_size
+    , const uint8_t   ndim
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+#endif
+
+#if !defined(__SYNTHESIS__)
+// IEEE 754 binary16 (fp16) storage of uint16_t bits computed in float
+extern int LinearNdHalf
+(           uint16_t *out_data    // out_feature
+    , const uint16_t *in_data     // in_feature
+    , const uint16_t *weight      // out_feature x in_feature
+    , const uint16_t *bias
+    , const uint16_t  out_size
+    , const uint16_t  in_size 
+    , const uint16_t  bias_size
+    , const uint8_t   ndim
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+// bfloat16 (bf16) storage of uint16_t bits computed in float
+extern int LinearNdBFloat16
+(           uint16_t *out_data    // out_feature
+    , const uint16_t *in_data     // in_feature
+    , const uint16_t *weight      // out_feature x in_feature
+    , const uint16_t *bias
+    , const uint16_t  out_size
+    , const uint16_t  in_size 
+    , const uint16_t  bias_size
+    , const uint8_t   ndim
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+#endif
+
 #ifdef __cplusplus
 }
 #endif
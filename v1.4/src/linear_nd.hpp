@@ -10,9 +10,9 @@
  * @date Aug. 31, 2020
  */
 #include <stdint.h>
+#include "dlr_half.hpp"
 #if !defined(__SYNTHESIS__)
 #include <stdio.h>
-#include <assert.h>
 #include <typeinfo>
 #include "dlr_common.h"
 #endif
@@ -49,31 +49,32 @@ void LinearNd
         fflush(stderr); fflush(stdout);
     }
     if (rigor) {
-        assert (ndim>0);
-        assert (in_size>0);
-        assert (out_size>0);
-        assert ((bias_size==0)||(out_size==bias_size));
+        dlrCheck (ndim>0);
+        dlrCheck (in_size>0);
+        dlrCheck (out_size>0);
+        dlrCheck ((bias_size==0)||(out_size==bias_size));
     }
     #undef QuoteMacro
     #undef QuoteIdent
     #endif
 
+    typedef typename Accumulator<TYPE>::type ACCUM; // float for 'Half' and 'BFloat16'
     uint8_t n;
     uint16_t o, i;
 
     for (n=0; n<ndim; ++n) {
         for(o=0; o<out_size; ++o){
-            TYPE  sum = (TYPE)0;
+            ACCUM sum = (ACCUM)0;
             TYPE *pZ = (TYPE*)(out_data+n*out_size+o);
-            TYPE B = (bias_size==(TYPE)0) ? (TYPE)0 : *(bias+o);
+            ACCUM B = (bias_size==0) ? (ACCUM)0 : (ACCUM)*(bias+o);
             for(i=0; i<in_size; ++i){
                 TYPE *pX = (TYPE*)(in_data+n*in_size+i);
                 TYPE *pW = (TYPE*)(weight +(o*in_size
                                             + i));
                 sum += (*pX)*(*pW);
             } // for (i=0
-            if (ReLu) *pZ = ((sum+B)<=(TYPE)0) ? (TYPE)0 : (sum+B);
-            else      *pZ = sum+B;
+            if (ReLu) *pZ = ((sum+B)<=(ACCUM)0) ? (TYPE)0 : (TYPE)(sum+B);
+            else      *pZ = (TYPE)(sum+B);
         } // for (o=0;
     } // for (n=0;
 }
@@ -88,6 +89,8 @@ void LinearNd
 /*
  * Revision history
  *
+ * 2026.10.18: sum goes 'Accumulator<TYPE>', i.e., float for 'Half' and 'BFloat16'.
+ * 2026.10.18: 'dlrCheck()' in place of 'assert()' for rigor checks.
  * 2020.09.20: parameter order of bias and bias_size changed.
  *             parameter 'rigor' and 'verbose' added.
  * 2020.08.31: Updated by participants of 2020 Summer Intern Program.
@@ -1,9 +1,11 @@
 
 #include "norm_1d_batch.hpp"
+#include "dlr_fixed.hpp"
+#include "dlr_half.hpp"
 
 extern "C" {
 
-void Norm1dBatchInt
+int Norm1dBatchInt
 (           int      *out_data // in_channel x in_size (contiguous)
     , const int      *in_data  // in_channel x in_size (contiguous)
     , const int      *running_mean // in_channel (contiguous)
@@ -21,6 +23,7 @@ void Norm1dBatchInt
     #endif
 )
 {
+    dlrClearLastError();
     dlr::Norm1dBatch<int>
     (     out_data
         , in_data
@@ -38,9 +41,10 @@ void Norm1dBatchInt
         , verbose
         #endif
     );
+    return dlrGetLastStatus();
 }
 
-void Norm1dBatchFloat
+int Norm1dBatchFloat
 (           float    *out_data // in_channel x in_size (contiguous)
     , const float    *in_data  // in_channel x in_size (contiguous)
     , const float    *running_mean // in_channel (contiguous)
@@ -58,6 +62,7 @@ void Norm1dBatchFloat
     #endif
 )
 {
+    dlrClearLastError();
     dlr::Norm1dBatch<float>
     (     out_data
         , in_data
@@ -75,9 +80,10 @@ void Norm1dBatchFloat
         , verbose
         #endif
     );
+    return dlrGetLastStatus();
 }
 
-void Norm1dBatchDouble
+int Norm1dBatchDouble
 (           double   *out_data // in_channel x in_size (contiguous)
     , const double   *in_data  // in_channel x in_size (contiguous)
     , const double   *running_mean // in_channel (contiguous)
@@ -95,6 +101,7 @@ void Norm1dBatchDouble
     #endif
 )
 {
+    dlrClearLastError();
     dlr::Norm1dBatch<double>
     (     out_data
         , in_data
@@ -112,6 +119,353 @@ void Norm1dBatchDouble
         , verbose
         #endif
     );
+    return dlrGetLastStatus();
 }
 
+int Norm1dBatchBatchInt
+(           int      *out_data     // minibatch x in_channel x in_size (contiguous)
+    , const int      *in_data      // minibatch x in_channel x in_size (contiguous)
+    , const int      *running_mean // in_channel (contiguous) [mean]
+    , const int      *running_var  // in_channel (contiguous) [variance, not deviation]
+    , const int      *scale        // NULL or in_channel (contiguous) [gamma: scaling factor]
+    , const int      *bias         // NULL or in_channel (contiguous) [beta: shift factor]
+    , const uint32_t  in_size      // num of elements per channel
+    , const uint16_t  scale_size   // 0 or in_channel
+    , const uint16_t  bias_size    // 0 or in_channel
+    , const uint16_t  in_channel   // 1 or n
+    , const uint16_t  minibatch    // number of minibatch items
+    , const float     epsilon      // default: 1E-5 (noise for regularization)
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Norm1dBatchBatch<int>
+    (     out_data
+        , in_data
+        , running_mean
+        , running_var
+        , scale
+        , bias
+        , in_size
+        , scale_size
+        , bias_size
+        , in_channel
+        , minibatch
+        , epsilon
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Norm1dBatchBatchFloat
+(           float    *out_data     // minibatch x in_channel x in_size (contiguous)
+    , const float    *in_data      // minibatch x in_channel x in_size (contiguous)
+    , const float    *running_mean // in_channel (contiguous) [mean]
+    , const float    *running_var  // in_channel (contiguous) [variance, not deviation]
+    , const float    *scale        // NULL or in_channel (contiguous) [gamma: scaling factor]
+    , const float    *bias         // NULL or in_channel (contiguous) [beta: shift factor]
+    , const uint32_t  in_size      // num of elements per channel
+    , const uint16_t  scale_size   // 0 or in_channel
+    , const uint16_t  bias_size    // 0 or in_channel
+    , const uint16_t  in_channel   // 1 or n
+    , const uint16_t  minibatch    // number of minibatch items
+    , const float     epsilon      // default: 1E-5 (noise for regularization)
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Norm1dBatchBatch<float>
+    (     out_data
+        , in_data
+        , running_mean
+        , running_var
+        , scale
+        , bias
+        , in_size
+        , scale_size
+        , bias_size
+        , in_channel
+        , minibatch
+        , epsilon
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Norm1dBatchBatchDouble
+(           double   *out_data     // minibatch x in_channel x in_size (contiguous)
+    , const double   *in_data      // minibatch x in_channel x in_size (contiguous)
+    , const double   *running_mean // in_channel (contiguous) [mean]
+    , const double   *running_var  // in_channel (contiguous) [variance, not deviation]
+    , const double   *scale        // NULL or in_channel (contiguous) [gamma: scaling factor]
+    , const double   *bias         // NULL or in_channel (contiguous) [beta: shift factor]
+    , const uint32_t  in_size      // num of elements per channel
+    , const uint16_t  scale_size   // 0 or in_channel
+    , const uint16_t  bias_size    // 0 or in_channel
+    , const uint16_t  in_channel   // 1 or n
+    , const uint16_t  minibatch    // number of minibatch items
+    , const float     epsilon      // default: 1E-5 (noise for regularization)
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Norm1dBatchBatch<double>
+    (     out_data
+        , in_data
+        , running_mean
+        , running_var
+        , scale
+        , bias
+        , in_size
+        , scale_size
+        , bias_size
+        , in_channel
+        , minibatch
+        , epsilon
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+#if !defined(__SYNTHESIS__)
+// fixed-point of dlr_fixed.hpp, whose data are raw bits (see dlrSetFixedFormat())
+int Norm1dBatchFixed
+(           int32_t  *out_data // in_channel x in_size (contiguous)
+    , const int32_t  *in_data  // in_channel x in_size (contiguous)
+    , const int32_t  *running_mean // in_channel (contiguous)
+    , const int32_t  *running_var  // in_channel (contiguous)
+    , const int32_t  *scale // NULL or in_channel (contiguous)
+    , const int32_t  *bias // NULL or in_channel (contiguous)
+    , const uint32_t  in_size // num of elements per channel
+    , const uint16_t  scale_size // 0 or in_channel
+    , const uint16_t  bias_size // 0 or in_channel
+    , const uint16_t  in_channel // 1 or n
+    , const float     epsilon // default: 1E-5
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Norm1dBatch<dlr::Fixed>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , (const dlr::Fixed*)running_mean
+        , (const dlr::Fixed*)running_var
+        , (const dlr::Fixed*)scale
+        , (const dlr::Fixed*)bias
+        , in_size
+        , scale_size
+        , bias_size
+        , in_channel
+        , epsilon
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Norm1dBatchBatchFixed
+(           int32_t  *out_data     // minibatch x in_channel x in_size (contiguous)
+    , const int32_t  *in_data      // minibatch x in_channel x in_size (contiguous)
+    , const int32_t  *running_mean // in_channel (contiguous) [mean]
+    , const int32_t  *running_var  // in_channel (contiguous) [variance, not deviation]
+    , const int32_t  *scale        // NULL or in_channel (contiguous) [gamma: scaling factor]
+    , const int32_t  *bias         // NULL or in_channel (contiguous) [beta: shift factor]
+    , const uint32_t  in_size      // num of elements per channel
+    , const uint16_t  scale_size   // 0 or in_channel
+    , const uint16_t  bias_size    // 0 or in_channel
+    , const uint16_t  in_channel   // 1 or n
+    , const uint16_t  minibatch    // number of minibatch items
+    , const float     epsilon      // default: 1E-5 (noise for regularization)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Norm1dBatchBatch<dlr::Fixed>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , (const dlr::Fixed*)running_mean
+        , (const dlr::Fixed*)running_var
+        , (const dlr::Fixed*)scale
+        , (const dlr::Fixed*)bias
+        , in_size
+        , scale_size
+        , bias_size
+        , in_channel
+        , minibatch
+        , epsilon
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+#endif
+
+#if !defined(__SYNTHESIS__)
+// IEEE 754 binary16 (fp16) storage computed in float (see dlr_half.hpp)
+int Norm1dBatchHalf
+(           uint16_t *out_data // in_channel x in_size (contiguous)
+    , const uint16_t *in_data  // in_channel x in_size (contiguous)
+    , const uint16_t *running_mean // in_channel (contiguous)
+    , const uint16_t *running_var  // in_channel (contiguous)
+    , const uint16_t *scale // NULL or in_channel (contiguous)
+    , const uint16_t *bias // NULL or in_channel (contiguous)
+    , const uint32_t  in_size // num of elements per channel
+    , const uint16_t  scale_size // 0 or in_channel
+    , const uint16_t  bias_size // 0 or in_channel
+    , const uint16_t  in_channel // 1 or n
+    , const float     epsilon // default: 1E-5
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Norm1dBatch<dlr::Half>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , (const dlr::Half*)running_mean
+        , (const dlr::Half*)running_var
+        , (const dlr::Half*)scale
+        , (const dlr::Half*)bias
+        , in_size
+        , scale_size
+        , bias_size
+        , in_channel
+        , epsilon
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Norm1dBatchBatchHalf
+(           uint16_t *out_data     // minibatch x in_channel x in_size (contiguous)
+    , const uint16_t *in_data      // minibatch x in_channel x in_size (contiguous)
+    , const uint16_t *running_mean // in_channel (contiguous) [mean]
+    , const uint16_t *running_var  // in_channel (contiguous) [variance, not deviation]
+    , const uint16_t *scale        // NULL or in_channel (contiguous) [gamma: scaling factor]
+    , const uint16_t *bias         // NULL or in_channel (contiguous) [beta: shift factor]
+    , const uint32_t  in_size      // num of elements per channel
+    , const uint16_t  scale_size   // 0 or in_channel
+    , const uint16_t  bias_size    // 0 or in_channel
+    , const uint16_t  in_channel   // 1 or n
+    , const uint16_t  minibatch    // number of minibatch items
+    , const float     epsilon      // default: 1E-5 (noise for regularization)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Norm1dBatchBatch<dlr::Half>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , (const dlr::Half*)running_mean
+        , (const dlr::Half*)running_var
+        , (const dlr::Half*)scale
+        , (const dlr::Half*)bias
+        , in_size
+        , scale_size
+        , bias_size
+        , in_channel
+        , minibatch
+        , epsilon
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+// bfloat16 (bf16) storage computed in float (see dlr_half.hpp)
+int Norm1dBatchBFloat16
+(           uint16_t *out_data // in_channel x in_size (contiguous)
+    , const uint16_t *in_data  // in_channel x in_size (contiguous)
+    , const uint16_t *running_mean // in_channel (contiguous)
+    , const uint16_t *running_var  // in_channel (contiguous)
+    , const uint16_t *scale // NULL or in_channel (contiguous)
+    , const uint16_t *bias // NULL or in_channel (contiguous)
+    , const uint32_t  in_size // num of elements per channel
+    , const uint16_t  scale_size // 0 or in_channel
+    , const uint16_t  bias_size // 0 or in_channel
+    , const uint16_t  in_channel // 1 or n
+    , const float     epsilon // default: 1E-5
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Norm1dBatch<dlr::BFloat16>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , (const dlr::BFloat16*)running_mean
+        , (const dlr::BFloat16*)running_var
+        , (const dlr::BFloat16*)scale
+        , (const dlr::BFloat16*)bias
+        , in_size
+        , scale_size
+        , bias_size
+        , in_channel
+        , epsilon
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Norm1dBatchBatchBFloat16
+(           uint16_t *out_data     // minibatch x in_channel x in_size (contiguous)
+    , const uint16_t *in_data      // minibatch x in_channel x in_size (contiguous)
+    , const uint16_t *running_mean // in_channel (contiguous) [mean]
+    , const uint16_t *running_var  // in_channel (contiguous) [variance, not deviation]
+    , const uint16_t *scale        // NULL or in_channel (contiguous) [gamma: scaling factor]
+    , const uint16_t *bias         // NULL or in_channel (contiguous) [beta: shift factor]
+    , const uint32_t  in_size      // num of elements per channel
+    , const uint16_t  scale_size   // 0 or in_channel
+    , const uint16_t  bias_size    // 0 or in_channel
+    , const uint16_t  in_channel   // 1 or n
+    , const uint16_t  minibatch    // number of minibatch items
+    , const float     epsilon      // default: 1E-5 (noise for regularization)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Norm1dBatchBatch<dlr::BFloat16>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , (const dlr::BFloat16*)running_mean
+        , (const dlr::BFloat16*)running_var
+        , (const dlr::BFloat16*)scale
+        , (const dlr::BFloat16*)bias
+        , in_size
+        , scale_size
+        , bias_size
+        , in_channel
+        , minibatch
+        , epsilon
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+#endif
+
 } // extern "C"
@@ -1,9 +1,11 @@
 
 #include "norm_2d_batch.hpp"
+#include "dlr_fixed.hpp"
+#include "dlr_half.hpp"
 
 extern "C" {
 
-void Norm2dBatchInt
+int Norm2dBatchInt
 (           int      *out_data // in_channel x in_size (contiguous)
     , const int      *in_data  // in_channel x in_size (contiguous)
     , const int      *running_mean // in_channel (contiguous)
@@ -21,6 +23,7 @@ void Norm2dBatchInt
     #endif
 )
 {
+    dlrClearLastError();
     dlr::Norm2dBatch<int, 0, 0>
     (     out_data
         , in_data
@@ -38,9 +41,10 @@ void Norm2dBatchInt
         , verbose
         #endif
     );
+    return dlrGetLastStatus();
 }
 
-void Norm2dBatchFloat
+int Norm2dBatchFloat
 (           float    *out_data // in_channel x in_size (contiguous)
     , const float    *in_data  // in_channel x in_size (contiguous)
     , const float    *running_mean // in_channel (contiguous)
@@ -58,6 +62,7 @@ void Norm2dBatchFloat
     #endif
 )
 {
+    dlrClearLastError();
     dlr::Norm2dBatch<float, 0, 0>
     (     out_data
         , in_data
@@ -75,9 +80,10 @@ void Norm2dBatchFloat
         , verbose
         #endif
     );
+    return dlrGetLastStatus();
 }
 
-void Norm2dBatchDouble
+int Norm2dBatchDouble
 (           double   *out_data // in_channel x in_size (contiguous)
     , const double   *in_data  // in_channel x in_size (contiguous)
     , const double   *running_mean // in_channel (contiguous)
@@ -95,6 +101,7 @@ void Norm2dBatchDouble
     #endif
 )
 {
+    dlrClearLastError();
     dlr::Norm2dBatch<double, 0, 0>
     (     out_data
         , in_data
@@ -112,9 +119,10 @@ void Norm2dBatchDouble
         , verbose
         #endif
     );
+    return dlrGetLastStatus();
 }
 
-void Norm2dBatchIntLeakyReLu
+int Norm2dBatchIntLeakyReLu
 (           int      *out_data // in_channel x in_size (contiguous)
     , const int      *in_data  // in_channel x in_size (contiguous)
     , const int      *running_mean // in_channel (contiguous)
@@ -132,6 +140,7 @@ void Norm2dBatchIntLeakyReLu
     #endif
 )
 {
+    dlrClearLastError();
     dlr::Norm2dBatch<int, 1, 100>
     (     out_data
         , in_data
@@ -149,9 +158,10 @@ void Norm2dBatchIntLeakyReLu
         , verbose
         #endif
     );
+    return dlrGetLastStatus();
 }
 
-void Norm2dBatchFloatLeakyReLu
+int Norm2dBatchFloatLeakyReLu
 (           float    *out_data // in_channel x in_size (contiguous)
     , const float    *in_data  // in_channel x in_size (contiguous)
     , const float    *running_mean // in_channel (contiguous)
@@ -169,6 +179,7 @@ void Norm2dBatchFloatLeakyReLu
     #endif
 )
 {
+    dlrClearLastError();
     dlr::Norm2dBatch<float, 1, 100>
     (     out_data
         , in_data
@@ -186,9 +197,10 @@ void Norm2dBatchFloatLeakyReLu
         , verbose
         #endif
     );
+    return dlrGetLastStatus();
 }
 
-void Norm2dBatchDoubleLeakyReLu
+int Norm2dBatchDoubleLeakyReLu
 (           double   *out_data // in_channel x in_size (contiguous)
     , const double   *in_data  // in_channel x in_size (contiguous)
     , const double   *running_mean // in_channel (contiguous)
@@ -206,6 +218,7 @@ void Norm2dBatchDoubleLeakyReLu
     #endif
 )
 {
+    dlrClearLastError();
     dlr::Norm2dBatch<double, 1, 100>
     (     out_data
         , in_data
@@ -223,6 +236,652 @@ void Norm2dBatchDoubleLeakyReLu
         , verbose
         #endif
     );
+    return dlrGetLastStatus();
 }
 
+int Norm2dBatchBatchInt
+(           int      *out_data     // minibatch x in_channel x in_size (contiguous)
+    , const int      *in_data      // minibatch x in_channel x in_size (contiguous)
+    , const int      *running_mean // in_channel (contiguous) [mean]
+    , const int      *running_var  // in_channel (contiguous) [variance, not deviation]
+    , const int      *scale        // NULL or in_channel (contiguous) [gamma: scaling factor]
+    , const int      *bias         // NULL or in_channel (contiguous) [beta: shift factor]
+    , const uint32_t  in_size      // num of elements per channel
+    , const uint16_t  scale_size   // 0 or in_channel
+    , const uint16_t  bias_size    // 0 or in_channel
+    , const uint16_t  in_channel   // 1 or n
+    , const uint16_t  minibatch    // number of minibatch items
+    , const float     epsilon      // default: 1E-5 (noise for regularization)
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Norm2dBatchBatch<int>
+    (     out_data
+        , in_data
+        , running_mean
+        , running_var
+        , scale
+        , bias
+        , in_size
+        , scale_size
+        , bias_size
+        , in_channel
+        , minibatch
+        , epsilon
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Norm2dBatchBatchFloat
+(           float    *out_data     // minibatch x in_channel x in_size (contiguous)
+    , const float    *in_data      // minibatch x in_channel x in_size (contiguous)
+    , const float    *running_mean // in_channel (contiguous) [mean]
+    , const float    *running_var  // in_channel (contiguous) [variance, not deviation]
+    , const float    *scale        // NULL or in_channel (contiguous) [gamma: scaling factor]
+    , const float    *bias         // NULL or in_channel (contiguous) [beta: shift factor]
+    , const uint32_t  in_size      // num of elements per channel
+    , const uint16_t  scale_size   // 0 or in_channel
+    , const uint16_t  bias_size    // 0 or in_channel
+    , const uint16_t  in_channel   // 1 or n
+    , const uint16_t  minibatch    // number of minibatch items
+    , const float     epsilon      // default: 1E-5 (noise for regularization)
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Norm2dBatchBatch<float>
+    (     out_data
+        , in_data
+        , running_mean
+        , running_var
+        , scale
+        , bias
+        , in_size
+        , scale_size
+        , bias_size
+        , in_channel
+        , minibatch
+        , epsilon
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Norm2dBatchBatchDouble
+(           double   *out_data     // minibatch x in_channel x in_size (contiguous)
+    , const double   *in_data      // minibatch x in_channel x in_size (contiguous)
+    , const double   *running_mean // in_channel (contiguous) [mean]
+    , const double   *running_var  // in_channel (contiguous) [variance, not deviation]
+    , const double   *scale        // NULL or in_channel (contiguous) [gamma: scaling factor]
+    , const double   *bias         // NULL or in_channel (contiguous) [beta: shift factor]
+    , const uint32_t  in_size      // num of elements per channel
+    , const uint16_t  scale_size   // 0 or in_channel
+    , const uint16_t  bias_size    // 0 or in_channel
+    , const uint16_t  in_channel   // 1 or n
+    , const uint16_t  minibatch    // number of minibatch items
+    , const float     epsilon      // default: 1E-5 (noise for regularization)
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Norm2dBatchBatch<double>
+    (     out_data
+        , in_data
+        , running_mean
+        , running_var
+        , scale
+        , bias
+        , in_size
+        , scale_size
+        , bias_size
+        , in_channel
+        , minibatch
+        , epsilon
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Norm2dBatchFoldFloat
+(           float    *coef_a       // in_channel (contiguous)
+    ,       float    *coef_b       // in_channel (contiguous)
+    , const float    *running_mean // in_channel (contiguous) [mean]
+    , const float    *running_var  // in_channel (contiguous) [variance, not deviation]
+    , const float    *scale        // NULL or in_channel (contiguous) [gamma: scaling factor]
+    , const float    *bias         // NULL or in_channel (contiguous) [beta: shift factor]
+    , const uint16_t  scale_size   // 0 or in_channel
+    , const uint16_t  bias_size    // 0 or in_channel
+    , const uint16_t  in_channel   // 1 or n
+    , const float     epsilon      // default: 1E-5 (noise for regularization)
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Norm2dBatchFold<float>
+    (     coef_a
+        , coef_b
+        , running_mean
+        , running_var
+        , scale
+        , bias
+        , scale_size
+        , bias_size
+        , in_channel
+        , epsilon
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Norm2dBatchPreparedFloat
+(           float    *out_data   // in_channel x in_size (contiguous)
+    , const float    *in_data    // in_channel x in_size (contiguous)
+    , const float    *coef_a     // in_channel (contiguous)
+    , const float    *coef_b     // in_channel (contiguous)
+    , const uint32_t  in_size    // num of elements per channel
+    , const uint16_t  in_channel // 1 or n
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Norm2dBatchPrepared<float>
+    (     out_data
+        , in_data
+        , coef_a
+        , coef_b
+        , in_size
+        , in_channel
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Norm2dBatchPreparedBatchFloat
+(           float    *out_data   // minibatch x in_channel x in_size (contiguous)
+    , const float    *in_data    // minibatch x in_channel x in_size (contiguous)
+    , const float    *coef_a     // in_channel (contiguous)
+    , const float    *coef_b     // in_channel (contiguous)
+    , const uint32_t  in_size    // num of elements per channel
+    , const uint16_t  in_channel // 1 or n
+    , const uint16_t  minibatch  // number of minibatch items
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Norm2dBatchPreparedBatch<float>
+    (     out_data
+        , in_data
+        , coef_a
+        , coef_b
+        , in_size
+        , in_channel
+        , minibatch
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Norm2dBatchFoldDouble
+(           double   *coef_a       // in_channel (contiguous)
+    ,       double   *coef_b       // in_channel (contiguous)
+    , const double   *running_mean // in_channel (contiguous) [mean]
+    , const double   *running_var  // in_channel (contiguous) [variance, not deviation]
+    , const double   *scale        // NULL or in_channel (contiguous) [gamma: scaling factor]
+    , const double   *bias         // NULL or in_channel (contiguous) [beta: shift factor]
+    , const uint16_t  scale_size   // 0 or in_channel
+    , const uint16_t  bias_size    // 0 or in_channel
+    , const uint16_t  in_channel   // 1 or n
+    , const float     epsilon      // default: 1E-5 (noise for regularization)
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Norm2dBatchFold<double>
+    (     coef_a
+        , coef_b
+        , running_mean
+        , running_var
+        , scale
+        , bias
+        , scale_size
+        , bias_size
+        , in_channel
+        , epsilon
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Norm2dBatchPreparedDouble
+(           double   *out_data   // in_channel x in_size (contiguous)
+    , const double   *in_data    // in_channel x in_size (contiguous)
+    , const double   *coef_a     // in_channel (contiguous)
+    , const double   *coef_b     // in_channel (contiguous)
+    , const uint32_t  in_size    // num of elements per channel
+    , const uint16_t  in_channel // 1 or n
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Norm2dBatchPrepared<double>
+    (     out_data
+        , in_data
+        , coef_a
+        , coef_b
+        , in_size
+        , in_channel
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Norm2dBatchPreparedBatchDouble
+(           double   *out_data   // minibatch x in_channel x in_size (contiguous)
+    , const double   *in_data    // minibatch x in_channel x in_size (contiguous)
+    , const double   *coef_a     // in_channel (contiguous)
+    , const double   *coef_b     // in_channel (contiguous)
+    , const uint32_t  in_size    // num of elements per channel
+    , const uint16_t  in_channel // 1 or n
+    , const uint16_t  minibatch  // number of minibatch items
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Norm2dBatchPreparedBatch<double>
+    (     out_data
+        , in_data
+        , coef_a
+        , coef_b
+        , in_size
+        , in_channel
+        , minibatch
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+#if !defined(__SYNTHESIS__)
+// fixed-point of dlr_fixed.hpp, whose data are raw bits (see dlrSetFixedFormat())
+int Norm2dBatchFixed
+(           int32_t  *out_data // in_channel x in_size (contiguous)
+    , const int32_t  *in_data  // in_channel x in_size (contiguous)
+    , const int32_t  *running_mean // in_channel (contiguous)
+    , const int32_t  *running_var  // in_channel (contiguous)
+    , const int32_t  *scale // NULL or in_channel (contiguous)
+    , const int32_t  *bias // NULL or in_channel (contiguous)
+    , const uint32_t  in_size // num of elements per channel
+    , const uint16_t  scale_size // 0 or in_channel
+    , const uint16_t  bias_size // 0 or in_channel
+    , const uint16_t  in_channel // 1 or n
+    , const float     epsilon // default: 1E-5
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Norm2dBatch<dlr::Fixed, 0, 0>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , (const dlr::Fixed*)running_mean
+        , (const dlr::Fixed*)running_var
+        , (const dlr::Fixed*)scale
+        , (const dlr::Fixed*)bias
+        , in_size
+        , scale_size
+        , bias_size
+        , in_channel
+        , epsilon
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Norm2dBatchFixedLeakyReLu
+(           int32_t  *out_data // in_channel x in_size (contiguous)
+    , const int32_t  *in_data  // in_channel x in_size (contiguous)
+    , const int32_t  *running_mean // in_channel (contiguous)
+    , const int32_t  *running_var  // in_channel (contiguous)
+    , const int32_t  *scale // NULL or in_channel (contiguous)
+    , const int32_t  *bias // NULL or in_channel (contiguous)
+    , const uint32_t  in_size // num of elements per channel
+    , const uint16_t  scale_size // 0 or in_channel
+    , const uint16_t  bias_size // 0 or in_channel
+    , const uint16_t  in_channel // 1 or n
+    , const float     epsilon // default: 1E-5
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Norm2dBatch<dlr::Fixed, 1, 100>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , (const dlr::Fixed*)running_mean
+        , (const dlr::Fixed*)running_var
+        , (const dlr::Fixed*)scale
+        , (const dlr::Fixed*)bias
+        , in_size
+        , scale_size
+        , bias_size
+        , in_channel
+        , epsilon
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Norm2dBatchBatchFixed
+(           int32_t  *out_data     // minibatch x in_channel x in_size (contiguous)
+    , const int32_t  *in_data      // minibatch x in_channel x in_size (contiguous)
+    , const int32_t  *running_mean // in_channel (contiguous) [mean]
+    , const int32_t  *running_var  // in_channel (contiguous) [variance, not deviation]
+    , const int32_t  *scale        // NULL or in_channel (contiguous) [gamma: scaling factor]
+    , const int32_t  *bias         // NULL or in_channel (contiguous) [beta: shift factor]
+    , const uint32_t  in_size      // num of elements per channel
+    , const uint16_t  scale_size   // 0 or in_channel
+    , const uint16_t  bias_size    // 0 or in_channel
+    , const uint16_t  in_channel   // 1 or n
+    , const uint16_t  minibatch    // number of minibatch items
+    , const float     epsilon      // default: 1E-5 (noise for regularization)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Norm2dBatchBatch<dlr::Fixed>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , (const dlr::Fixed*)running_mean
+        , (const dlr::Fixed*)running_var
+        , (const dlr::Fixed*)scale
+        , (const dlr::Fixed*)bias
+        , in_size
+        , scale_size
+        , bias_size
+        , in_channel
+        , minibatch
+        , epsilon
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+#endif
+
+#if !defined(__SYNTHESIS__)
+// IEEE 754 binary16 (fp16) storage computed in float (see dlr_half.hpp)
+int Norm2dBatchHalf
+(           uint16_t *out_data // in_channel x in_size (contiguous)
+    , const uint16_t *in_data  // in_channel x in_size (contiguous)
+    , const uint16_t *running_mean // in_channel (contiguous)
+    , const uint16_t *running_var  // in_channel (contiguous)
+    , const uint16_t *scale // NULL or in_channel (contiguous)
+    , const uint16_t *bias // NULL or in_channel (contiguous)
+    , const uint32_t  in_size // num of elements per channel
+    , const uint16_t  scale_size // 0 or in_channel
+    , const uint16_t  bias_size // 0 or in_channel
+    , const uint16_t  in_channel // 1 or n
+    , const float     epsilon // default: 1E-5
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Norm2dBatch<dlr::Half, 0, 0>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , (const dlr::Half*)running_mean
+        , (const dlr::Half*)running_var
+        , (const dlr::Half*)scale
+        , (const dlr::Half*)bias
+        , in_size
+        , scale_size
+        , bias_size
+        , in_channel
+        , epsilon
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Norm2dBatchHalfLeakyReLu
+(           uint16_t *out_data // in_channel x in_size (contiguous)
+    , const uint16_t *in_data  // in_channel x in_size (contiguous)
+    , const uint16_t *running_mean // in_channel (contiguous)
+    , const uint16_t *running_var  // in_channel (contiguous)
+    , const uint16_t *scale // NULL or in_channel (contiguous)
+    , const uint16_t *bias // NULL or in_channel (contiguous)
+    , const uint32_t  in_size // num of elements per channel
+    , const uint16_t  scale_size // 0 or in_channel
+    , const uint16_t  bias_size // 0 or in_channel
+    , const uint16_t  in_channel // 1 or n
+    , const float     epsilon // default: 1E-5
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Norm2dBatch<dlr::Half, 1, 100>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , (const dlr::Half*)running_mean
+        , (const dlr::Half*)running_var
+        , (const dlr::Half*)scale
+        , (const dlr::Half*)bias
+        , in_size
+        , scale_size
+        , bias_size
+        , in_channel
+        , epsilon
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Norm2dBatchBatchHalf
+(           uint16_t *out_data     // minibatch x in_channel x in_size (contiguous)
+    , const uint16_t *in_data      // minibatch x in_channel x in_size (contiguous)
+    , const uint16_t *running_mean // in_channel (contiguous) [mean]
+    , const uint16_t *running_var  // in_channel (contiguous) [variance, not deviation]
+    , const uint16_t *scale        // NULL or in_channel (contiguous) [gamma: scaling factor]
+    , const uint16_t *bias         // NULL or in_channel (contiguous) [beta: shift factor]
+    , const uint32_t  in_size      // num of elements per channel
+    , const uint16_t  scale_size   // 0 or in_channel
+    , const uint16_t  bias_size    // 0 or in_channel
+    , const uint16_t  in_channel   // 1 or n
+    , const uint16_t  minibatch    // number of minibatch items
+    , const float     epsilon      // default: 1E-5 (noise for regularization)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Norm2dBatchBatch<dlr::Half>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , (const dlr::Half*)running_mean
+        , (const dlr::Half*)running_var
+        , (const dlr::Half*)scale
+        , (const dlr::Half*)bias
+        , in_size
+        , scale_size
+        , bias_size
+        , in_channel
+        , minibatch
+        , epsilon
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+// bfloat16 (bf16) storage computed in float (see dlr_half.hpp)
+int Norm2dBatchBFloat16
+(           uint16_t *out_data // in_channel x in_size (contiguous)
+    , const uint16_t *in_data  // in_channel x in_size (contiguous)
+    , const uint16_t *running_mean // in_channel (contiguous)
+    , const uint16_t *running_var  // in_channel (contiguous)
+    , const uint16_t *scale // NULL or in_channel (contiguous)
+    , const uint16_t *bias // NULL or in_channel (contiguous)
+    , const uint32_t  in_size // num of elements per channel
+    , const uint16_t  scale_size // 0 or in_channel
+    , const uint16_t  bias_size // 0 or in_channel
+    , const uint16_t  in_channel // 1 or n
+    , const float     epsilon // default: 1E-5
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Norm2dBatch<dlr::BFloat16, 0, 0>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , (const dlr::BFloat16*)running_mean
+        , (const dlr::BFloat16*)running_var
+        , (const dlr::BFloat16*)scale
+        , (const dlr::BFloat16*)bias
+        , in_size
+        , scale_size
+        , bias_size
+        , in_channel
+        , epsilon
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Norm2dBatchBFloat16LeakyReLu
+(           uint16_t *out_data // in_channel x in_size (contiguous)
+    , const uint16_t *in_data  // in_channel x in_size (contiguous)
+    , const uint16_t *running_mean // in_channel (contiguous)
+    , const uint16_t *running_var  // in_channel (contiguous)
+    , const uint16_t *scale // NULL or in_channel (contiguous)
+    , const uint16_t *bias // NULL or in_channel (contiguous)
+    , const uint32_t  in_size // num of elements per channel
+    , const uint16_t  scale_size // 0 or in_channel
+    , const uint16_t  bias_size // 0 or in_channel
+    , const uint16_t  in_channel // 1 or n
+    , const float     epsilon // default: 1E-5
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Norm2dBatch<dlr::BFloat16, 1, 100>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , (const dlr::BFloat16*)running_mean
+        , (const dlr::BFloat16*)running_var
+        , (const dlr::BFloat16*)scale
+        , (const dlr::BFloat16*)bias
+        , in_size
+        , scale_size
+        , bias_size
+        , in_channel
+        , epsilon
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Norm2dBatchBatchBFloat16
+(           uint16_t *out_data     // minibatch x in_channel x in_size (contiguous)
+    , const uint16_t *in_data      // minibatch x in_channel x in_size (contiguous)
+    , const uint16_t *running_mean // in_channel (contiguous) [mean]
+    , const uint16_t *running_var  // in_channel (contiguous) [variance, not deviation]
+    , const uint16_t *scale        // NULL or in_channel (contiguous) [gamma: scaling factor]
+    , const uint16_t *bias         // NULL or in_channel (contiguous) [beta: shift factor]
+    , const uint32_t  in_size      // num of elements per channel
+    , const uint16_t  scale_size   // 0 or in_channel
+    , const uint16_t  bias_size    // 0 or in_channel
+    , const uint16_t  in_channel   // 1 or n
+    , const uint16_t  minibatch    // number of minibatch items
+    , const float     epsilon      // default: 1E-5 (noise for regularization)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Norm2dBatchBatch<dlr::BFloat16>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , (const dlr::BFloat16*)running_mean
+        , (const dlr::BFloat16*)running_var
+        , (const dlr::BFloat16*)scale
+        , (const dlr::BFloat16*)bias
+        , in_size
+        , scale_size
+        , bias_size
+        , in_channel
+        , minibatch
+        , epsilon
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+#endif
+
 } // extern "C"
@@ -6,8 +6,12 @@ extern "C" {
 #endif
 
 #define Norm2dBatch  Norm2dBatchFloat
+#define Norm2dBatchBatch  Norm2dBatchBatchFloat
+#define Norm2dBatchFold  Norm2dBatchFoldFloat
+#define Norm2dBatchPrepared  Norm2dBatchPreparedFloat
+#define Norm2dBatchPreparedBatch  Norm2dBatchPreparedBatchFloat
 
-extern void Norm2dBatchInt
+extern int Norm2dBatchInt
 (           int      *out_data // in_channel x sqrt(in_size) x srqt(in_size)
     , const int      *in_data  // in_channel x sqrt(in_size) x sqrt(in_size)
     , const int      *running_mean
@@ -25,7 +29,7 @@ extern void Norm2dBatchInt
     #endif
 );
 
-extern void Norm2dBatchFloat
+extern int Norm2dBatchFloat
 (           float    *out_data // in_channel x in_size x in_size
     , const float    *in_data  // in_channel x in_size x in_size
     , const float    *running_mean
@@ -43,7 +47,7 @@ extern void Norm2dBatchFloat
     #endif
 );
 
-extern void Norm2dBatchDouble
+extern int Norm2dBatchDouble
 (           double   *out_data // in_channel x in_size x in_size
     , const double   *in_data  // in_channel x in_size x in_size
     , const double   *running_mean
@@ -61,6 +65,258 @@ extern void Norm2dBatchDouble
     #endif
 );
 
+extern int Norm2dBatchBatchInt
+(           int      *out_data     // minibatch x in_channel x in_size (contiguous)
+    , const int      *in_data      // minibatch x in_channel x in_size (contiguous)
+    , const int      *running_mean // in_channel (contiguous) [mean]
+    , const int      *running_var  // in_channel (contiguous) [variance, not deviation]
+    , const int      *scale        // NULL or in_channel (contiguous) [gamma: scaling factor]
+    , const int      *bias         // NULL or in_channel (contiguous) [beta: shift factor]
+    , const uint32_t  in_size      // num of elements per channel
+    , const uint16_t  scale_size   // 0 or in_channel
+    , const uint16_t  bias_size    // 0 or in_channel
+    , const uint16_t  in_channel   // 1 or n
+    , const uint16_t  minibatch    // number of minibatch items
+    , const float     epsilon      // default: 1E-5 (noise for regularization)
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+extern int Norm2dBatchBatchFloat
+(           float    *out_data     // minibatch x in_channel x in_size (contiguous)
+    , const float    *in_data      // minibatch x in_channel x in_size (contiguous)
+    , const float    *running_mean // in_channel (contiguous) [mean]
+    , const float    *running_var  // in_channel (contiguous) [variance, not deviation]
+    , const float    *scale        // NULL or in_channel (contiguous) [gamma: scaling factor]
+    , const float    *bias         // NULL or in_channel (contiguous) [beta: shift factor]
+    , const uint32_t  in_size      // num of elements per channel
+    , const uint16_t  scale_size   // 0 or in_channel
+    , const uint16_t  bias_size    // 0 or in_channel
+    , const uint16_t  in_channel   // 1 or n
+    , const uint16_t  minibatch    // number of minibatch items
+    , const float     epsilon      // default: 1E-5 (noise for regularization)
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+extern int Norm2dBatchBatchDouble
+(           double   *out_data     // minibatch x in_channel x in_size (contiguous)
+    , const double   *in_data      // minibatch x in_channel x in_size (contiguous)
+    , const double   *running_mean // in_channel (contiguous) [mean]
+    , const double   *running_var  // in_channel (contiguous) [variance, not deviation]
+    , const double   *scale        // NULL or in_channel (contiguous) [gamma: scaling factor]
+    , const double   *bias         // NULL or in_channel (contiguous) [beta: shift factor]
+    , const uint32_t  in_size      // num of elements per channel
+    , const uint16_t  scale_size   // 0 or in_channel
+    , const uint16_t  bias_size    // 0 or in_channel
+    , const uint16_t  in_channel   // 1 or n
+    , const uint16_t  minibatch    // number of minibatch items
+    , const float     epsilon      // default: 1E-5 (noise for regularization)
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+// folded coefficients (see Norm2dBatchFold()) for float and double only
+extern int Norm2dBatchFoldFloat
+(           float    *coef_a       // in_channel (contiguous)
+    ,       float    *coef_b       // in_channel (contiguous)
+    , const float    *running_mean // in_channel (contiguous) [mean]
+    , const float    *running_var  // in_channel (contiguous) [variance, not deviation]
+    , const float    *scale        // NULL or in_channel (contiguous) [gamma: scaling factor]
+    , const float    *bias         // NULL or in_channel (contiguous) [beta: shift factor]
+    , const uint16_t  scale_size   // 0 or in_channel
+    , const uint16_t  bias_size    // 0 or in_channel
+    , const uint16_t  in_channel   // 1 or n
+    , const float     epsilon      // default: 1E-5 (noise for regularization)
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+extern int Norm2dBatchPreparedFloat
+(           float    *out_data   // in_channel x in_size (contiguous)
+    , const float    *in_data    // in_channel x in_size (contiguous)
+    , const float    *coef_a     // in_channel (contiguous)
+    , const float    *coef_b     // in_channel (contiguous)
+    , const uint32_t  in_size    // num of elements per channel
+    , const uint16_t  in_channel // 1 or n
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+extern int Norm2dBatchPreparedBatchFloat
+(           float    *out_data   // minibatch x in_channel x in_size (contiguous)
+    , const float    *in_data    // minibatch x in_channel x in_size (contiguous)
+    , const float    *coef_a     // in_channel (contiguous)
+    , const float    *coef_b     // in_channel (contiguous)
+    , const uint32_t  in_size    // num of elements per channel
+    , const uint16_t  in_channel // 1 or n
+    , const uint16_t  minibatch  // number of minibatch items
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+extern int Norm2dBatchFoldDouble
+(           double   *coef_a       // in_channel (contiguous)
+    ,       double   *coef_b       // in_channel (contiguous)
+    , const double   *running_mean // in_channel (contiguous) [mean]
+    , const double   *running_var  // in_channel (contiguous) [variance, not deviation]
+    , const double   *scale        // NULL or in_channel (contiguous) [gamma: scaling factor]
+    , const double   *bias         // NULL or in_channel (contiguous) [beta: shift factor]
+    , const uint16_t  scale_size   // 0 or in_channel
+    , const uint16_t  bias_size    // 0 or in_channel
+    , const uint16_t  in_channel   // 1 or n
+    , const float     epsilon      // default: 1E-5 (noise for regularization)
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+extern int Norm2dBatchPreparedDouble
+(           double   *out_data   // in_channel x in_size (contiguous)
+    , const double   *in_data    // in_channel x in_size (contiguous)
+    , const double   *coef_a     // in_channel (contiguous)
+    , const double   *coef_b     // in_channel (contiguous)
+    , const uint32_t  in_size    // num of elements per channel
+    , const uint16_t  in_channel // 1 or n
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+extern int Norm2dBatchPreparedBatchDouble
+(           double   *out_data   // minibatch x in_channel x in_size (contiguous)
+    , const double   *in_data    // minibatch x in_channel x in_size (contiguous)
+    , const double   *coef_a     // in_channel (contiguous)
+    , const double   *coef_b     // in_channel (contiguous)
+    , const uint32_t  in_size    // num of elements per channel
+    , const uint16_t  in_channel // 1 or n
+    , const uint16_t  minibatch  // number of minibatch items
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+#if !defined(__SYNTHESIS__)
+// fixed-point of raw bits in the format of dlrSetFixedFormat()
+extern int Norm2dBatchFixed
+(           int32_t  *out_data // in_channel x sqrt(in_size) x srqt(in_size)
+    , const int32_t  *in_data  // in_channel x sqrt(in_size) x sqrt(in_size)
+    , const int32_t  *running_mean
+    , const int32_t  *running_var
+    , const int32_t  *scale
+    , const int32_t  *bias
+    , const uint32_t  in_size // the number of data elements per channel
+    , const uint16_t  scale_size
+    , const uint16_t  bias_size
+    , const uint16_t  in_channel
+    , const float     epsilon
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Norm2dBatchBatchFixed
+(           int32_t  *out_data     // minibatch x in_channel x in_size (contiguous)
+    , const int32_t  *in_data      // minibatch x in_channel x in_size (contiguous)
+    , const int32_t  *running_mean // in_channel (contiguous) [mean]
+    , const int32_t  *running_var  // in_channel (contiguous) [variance, not deviation]
+    , const int32_t  *scale        // NULL or in_channel (contiguous) [gamma: scaling factor]
+    , const int32_t  *bias         // NULL or in_channel (contiguous) [beta: shift factor]
+    , const uint32_t  in_size      // num of elements per channel
+    , const uint16_t  scale_size   // 0 or in_channel
+    , const uint16_t  bias_size    // 0 or in_channel
+    , const uint16_t  in_channel   // 1 or n
+    , const uint16_t  minibatch    // number of minibatch items
+    , const float     epsilon      // default: 1E-5 (noise for regularization)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+#endif
+
+#if !defined(__SYNTHESIS__)
+// IEEE 754 binary16 (fp16) storage of uint16_t bits computed in float
+extern int Norm2dBatchHalf
+(           uint16_t *out_data // in_channel x sqrt(in_size) x srqt(in_size)
+    , const uint16_t *in_data  // in_channel x sqrt(in_size) x sqrt(in_size)
+    , const uint16_t *running_mean
+    , const uint16_t *running_var
+    , const uint16_t *scale
+    , const uint16_t *bias
+    , const uint32_t  in_size // the number of data elements per channel
+    , const uint16_t  scale_size
+    , const uint16_t  bias_size
+    , const uint16_t  in_channel
+    , const float     epsilon
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Norm2dBatchBatchHalf
+(           uint16_t *out_data     // minibatch x in_channel x in_size (contiguous)
+    , const uint16_t *in_data      // minibatch x in_channel x in_size (contiguous)
+    , const uint16_t *running_mean // in_channel (contiguous) [mean]
+    , const uint16_t *running_var  // in_channel (contiguous) [variance, not deviation]
+    , const uint16_t *scale        // NULL or in_channel (contiguous) [gamma: scaling factor]
+    , const uint16_t *bias         // NULL or in_channel (contiguous) [beta: shift factor]
+    , const uint32_t  in_size      // num of elements per channel
+    , const uint16_t  scale_size   // 0 or in_channel
+    , const uint16_t  bias_size    // 0 or in_channel
+    , const uint16_t  in_channel   // 1 or n
+    , const uint16_t  minibatch    // number of minibatch items
+    , const float     epsilon      // default: 1E-5 (noise for regularization)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+// bfloat16 (bf16) storage of uint16_t bits computed in float
+extern int Norm2dBatchBFloat16
+(           uint16_t *out_data // in_channel x sqrt(in_size) x srqt(in_size)
+    , const uint16_t *in_data  // in_channel x sqrt(in_size) x sqrt(in_size)
+    , const uint16_t *running_mean
+    , const uint16_t *running_var
+    , const uint16_t *scale
+    , const uint16_t *bias
+    , const uint32_t  in_size // the number of data elements per channel
+    , const uint16_t  scale_size
+    , const uint16_t  bias_size
+    , const uint16_t  in_channel
+    , const float     epsilon
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Norm2dBatchBatchBFloat16
+(           uint16_t *out_data     // minibatch x in_channel x in_size (contiguous)
+    , const uint16_t *in_data      // minibatch x in_channel x in_size (contiguous)
+    , const uint16_t *running_mean // in_channel (contiguous) [mean]
+    , const uint16_t *running_var  // in_channel (contiguous) [variance, not deviation]
+    , const uint16_t *scale        // NULL or in_channel (contiguous) [gamma: scaling factor]
+    , const uint16_t *bias         // NULL or in_channel (contiguous) [beta: shift factor]
+    , const uint32_t  in_size      // num of elements per channel
+    , const uint16_t  scale_size   // 0 or in_channel
+    , const uint16_t  bias_size    // 0 or in_channel
+    , const uint16_t  in_channel   // 1 or n
+    , const uint16_t  minibatch    // number of minibatch items
+    , const float     epsilon      // default: 1E-5 (noise for regularization)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+#endif
+
 #ifdef __cplusplus
 }
 #endif
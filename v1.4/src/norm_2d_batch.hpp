@@ -13,9 +13,9 @@
 #include <math.h>
 #if !defined(__SYNTHESIS__)
 #include <stdio.h>
-#include <assert.h>
 #include <typeinfo>
 #include "dlr_common.h"
+#include "dlr_simd.hpp"
 #endif
 
 namespace dlr { // deep learning routines
@@ -25,7 +25,7 @@ template< class TYPE=float
         , int negative_slope1000=100> // in order to deal with not supporing float for template
                                       // it is 1000 times of actual slope
 void Norm2dBatch
-(           TYPE     *out_data // in_channel x in_size (contiguous)
+(           TYPE     *out_data // in_channel x in_size (contiguous, can be in_data for in-place)
     , const TYPE     *in_data  // in_channel x in_size (contiguous)
     , const TYPE     *running_mean // in_channel (contiguous) [mean]
     , const TYPE     *running_var  // in_channel (contiguous) [variance, not deviation]
@@ -55,10 +55,11 @@ void Norm2dBatch
         fflush(stderr); fflush(stdout);
     }
     if (rigor) {
-        assert (in_channel>0);
-        assert (in_size>0);
-        assert ((scale_size==0)||(scale_size==in_channel));
-        assert ((bias_size==0)||(bias_size==in_channel));
+        dlrCheck (in_channel>0);
+        dlrCheck (in_size>0);
+        dlrCheckAlias (out_data, in_data, (uint32_t)in_channel*in_size);
+        dlrCheck ((scale_size==0)||(scale_size==in_channel));
+        dlrCheck ((bias_size==0)||(bias_size==in_channel));
     }
     #undef QuoteMacro
     #undef QuoteIdent
@@ -67,13 +68,29 @@ void Norm2dBatch
     uint16_t  f;
     uint32_t  s;
 
+    #if defined(__SYNTHESIS__)
     TYPE *pX = (TYPE*)(in_data);
     TYPE *pZ = (TYPE*)(out_data);
+    #endif
+    #if !defined(__SYNTHESIS__) && defined(_OPENMP)
+    #pragma omp parallel for private(s)
+    #endif
     for (f=0; f<in_channel; ++f) {
+        #if !defined(__SYNTHESIS__)
+        TYPE *pX = (TYPE*)(in_data +((uint32_t)f*in_size));
+        TYPE *pZ = (TYPE*)(out_data+((uint32_t)f*in_size));
+        #endif
         TYPE B     = (bias_size==0) ? (TYPE)0 : *(TYPE *)(bias+f);
         TYPE mean  = *(running_mean+f);
         TYPE var   = *(running_var+f);
         TYPE S     = (scale_size==0) ? (TYPE)1 : *(TYPE *)(scale+f);
+        #if !defined(__SYNTHESIS__)
+        if (SimdNormalize(pZ, pX, mean, var, S, B, epsilon, in_size)) { // float
+            if (ACTIVATION==1) SimdLeakyReLu(pZ, pZ, (float)(TYPE)(negative_slope1000/1000), in_size);
+            else if (ACTIVATION==2) SimdReLu(pZ, pZ, in_size);
+            continue;
+        }
+        #endif
         for (s=0; s<in_size; ++s) {
              if (ACTIVATION==1) { // LeakReLU
                  TYPE value = (TYPE)((((*pX)-mean) / (sqrt(var+epsilon))) * S + B);
@@ -92,10 +109,206 @@ void Norm2dBatch
     }
 }
 
+// minibatch version: in_data and out_data have leading minibatch dimension
+template< class TYPE=float
+        , int ACTIVATION=0 // 0=no, 1=LeakyReLU, 2=ReLU
+        , int negative_slope1000=100> // 1000 times of actual slope
+void Norm2dBatchBatch
+(           TYPE     *out_data     // minibatch x in_channel x in_size (contiguous)
+    , const TYPE     *in_data      // minibatch x in_channel x in_size (contiguous)
+    , const TYPE     *running_mean // in_channel (contiguous) [mean]
+    , const TYPE     *running_var  // in_channel (contiguous) [variance, not deviation]
+    , const TYPE     *scale        // NULL or in_channel (contiguous) [gamma: scaling factor]
+    , const TYPE     *bias         // NULL or in_channel (contiguous) [beta: shift factor]
+    , const uint32_t  in_size      // num of elements per channel
+    , const uint16_t  scale_size   // 0 or in_channel
+    , const uint16_t  bias_size    // 0 or in_channel
+    , const uint16_t  in_channel   // 1 or n
+    , const uint16_t  minibatch    // number of minibatch items
+    , const float     epsilon=1E-5 // default: 1E-5 (noise for regularization)
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+    #endif
+)
+{
+    const uint32_t t_out_step=(uint32_t)in_channel*in_size;
+    const uint32_t t_in_step =(uint32_t)in_channel*in_size;
+    TYPE       *pZ = out_data;
+    const TYPE *pX = in_data;
+    uint16_t mb;
+
+    for (mb=0; mb<minibatch; ++mb) {
+        Norm2dBatch<TYPE, ACTIVATION, negative_slope1000>
+        (     pZ
+            , pX
+            , running_mean
+            , running_var
+            , scale
+            , bias
+            , in_size
+            , scale_size
+            , bias_size
+            , in_channel
+            , epsilon
+            #if !defined(__SYNTHESIS__)
+            , rigor
+            , verbose
+            #endif
+        );
+        pZ += t_out_step;
+        pX += t_in_step;
+    }
+}
+
+// Folds batch normalization into per-channel coefficients once, i.e.,
+//   coef_a[f] = S / sqrt(var+epsilon)
+//   coef_b[f] = B - mean * coef_a[f]
+// so that Norm2dBatchPrepared() costs one multiply-add for each element.
+template<class TYPE=float>
+void Norm2dBatchFold
+(           TYPE     *coef_a       // in_channel (contiguous)
+    ,       TYPE     *coef_b       // in_channel (contiguous)
+    , const TYPE     *running_mean // in_channel (contiguous) [mean]
+    , const TYPE     *running_var  // in_channel (contiguous) [variance, not deviation]
+    , const TYPE     *scale        // NULL or in_channel (contiguous) [gamma: scaling factor]
+    , const TYPE     *bias         // NULL or in_channel (contiguous) [beta: shift factor]
+    , const uint16_t  scale_size   // 0 or in_channel
+    , const uint16_t  bias_size    // 0 or in_channel
+    , const uint16_t  in_channel   // 1 or n
+    , const float     epsilon=1E-5 // default: 1E-5 (noise for regularization)
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+    #endif
+)
+{
+    #if !defined(__SYNTHESIS__)
+    if (verbose) {
+        dlrInfo("in_channel =%d\n", in_channel       );
+        dlrInfo("scale_size =%d\n", scale_size       );
+        dlrInfo("bias_size  =%d\n", bias_size        );
+        dlrInfo("epsilon    =%f\n", epsilon          );
+        fflush(stderr); fflush(stdout);
+    }
+    if (rigor) {
+        dlrCheck (in_channel>0);
+        dlrCheck ((scale_size==0)||(scale_size==in_channel));
+        dlrCheck ((bias_size==0)||(bias_size==in_channel));
+    }
+    #endif
+
+    uint16_t f;
+
+    for (f=0; f<in_channel; ++f) {
+        TYPE S = (scale_size==0) ? (TYPE)1 : scale[f];
+        TYPE B = (bias_size==0)  ? (TYPE)0 : bias[f];
+        TYPE a = (TYPE)(S/sqrt(running_var[f]+epsilon));
+        coef_a[f] = a;
+        coef_b[f] = (TYPE)(B-running_mean[f]*a);
+    }
+}
+
+// Same as Norm2dBatch() without activation, but coefficients are folded
+// by Norm2dBatchFold(), i.e., out = in * coef_a[f] + coef_b[f].
+template<class TYPE=float>
+void Norm2dBatchPrepared
+(           TYPE     *out_data // in_channel x in_size (contiguous, can be in_data for in-place)
+    , const TYPE     *in_data  // in_channel x in_size (contiguous)
+    , const TYPE     *coef_a   // in_channel (contiguous) (see Norm2dBatchFold())
+    , const TYPE     *coef_b   // in_channel (contiguous) (see Norm2dBatchFold())
+    , const uint32_t  in_size  // num of elements per channel
+    , const uint16_t  in_channel // 1 or n
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor=0     // check rigorously when 1
+    , const int       verbose=0   // verbose level
+    #endif
+)
+{
+    #if !defined(__SYNTHESIS__)
+    if (verbose) {
+        dlrInfo("in_channel =%d\n", in_channel       );
+        dlrInfo("in_size    =%d\n", in_size          );
+        fflush(stderr); fflush(stdout);
+    }
+    if (rigor) {
+        dlrCheck (in_channel>0);
+        dlrCheck (in_size>0);
+        dlrCheckAlias (out_data, in_data, (uint32_t)in_channel*in_size);
+    }
+    #endif
+
+    uint16_t  f;
+    uint32_t  s;
+
+    #if !defined(__SYNTHESIS__) && defined(_OPENMP)
+    #pragma omp parallel for private(s)
+    #endif
+    for (f=0; f<in_channel; ++f) {
+        const TYPE *pX = in_data +((uint32_t)f*in_size);
+        TYPE       *pZ = out_data+((uint32_t)f*in_size);
+        const TYPE  a  = coef_a[f];
+        const TYPE  b  = coef_b[f];
+        #if !defined(__SYNTHESIS__)
+        if (SimdScaleShift(pZ, pX, a, b, in_size)) continue; // float
+        #endif
+        for (s=0; s<in_size; ++s) {
+            pZ[s] = pX[s]*a + b;
+        }
+    }
+}
+
+// minibatch version: in_data and out_data have leading minibatch dimension
+template<class TYPE=float>
+void Norm2dBatchPreparedBatch
+(           TYPE     *out_data   // minibatch x in_channel x in_size (contiguous)
+    , const TYPE     *in_data    // minibatch x in_channel x in_size (contiguous)
+    , const TYPE     *coef_a     // in_channel (contiguous) (see Norm2dBatchFold())
+    , const TYPE     *coef_b     // in_channel (contiguous) (see Norm2dBatchFold())
+    , const uint32_t  in_size    // num of elements per channel
+    , const uint16_t  in_channel // 1 or n
+    , const uint16_t  minibatch  // number of minibatch items
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+    #endif
+)
+{
+    const uint32_t t_step=(uint32_t)in_channel*in_size;
+    TYPE       *pZ = out_data;
+    const TYPE *pX = in_data;
+    uint16_t mb;
+
+    for (mb=0; mb<minibatch; ++mb) {
+        Norm2dBatchPrepared<TYPE>
+        (     pZ
+            , pX
+            , coef_a
+            , coef_b
+            , in_size
+            , in_channel
+            #if !defined(__SYNTHESIS__)
+            , rigor
+            , verbose
+            #endif
+        );
+        pZ += t_step;
+        pX += t_step;
+    }
+}
+
 } // namespace dlr
 /*
  * Revision history
  *
+ * 2026.10.18: running pointers of the HLS path restored, per-channel pointers for software only.
+ * 2026.10.18: pX and pZ derived from 'f' in the loop for all builds.
+ * 2026.10.18: Norm2dBatchFold() and Norm2dBatchPrepared[Batch]() added.
+ * 2026.10.18: in-place (out_data==in_data) checked.
+ * 2026.10.18: SIMD scale and shift for float (dlr_simd.hpp).
+ * 2026.10.18: 'dlrCheck()' in place of 'assert()' for rigor checks.
+ * 2026.10.18: OpenMP for 'f' loop when built with OpenMP.
+ * 2026.10.18: 'Norm2dBatchBatch' added for minibatch.
  * 2023.07.08: LeakyReLU --> ACTIVATION
  *             ReLU added
  * 2020.09.20: parameter order of bias and bias_size changed.
@@ -13,16 +13,16 @@
 #include <math.h>
 #if !defined(__SYNTHESIS__)
 #include <stdio.h>
-#include <assert.h>
 #include <typeinfo>
 #include "dlr_common.h"
+#include "dlr_simd.hpp"
 #endif
 
 namespace dlr { // deep learning routines
 
 template<class TYPE=float>
 void Norm3dBatch
-(           TYPE     *out_data // in_channel x in_size (contiguous)
+(           TYPE     *out_data // in_channel x in_size (contiguous, can be in_data for in-place)
     , const TYPE     *in_data  // in_channel x in_size (contiguous)
     , const TYPE     *running_mean // in_channel (contiguous) [mean]
     , const TYPE     *running_var  // in_channel (contiguous) [variance, not deviation]
@@ -52,10 +52,11 @@ void Norm3dBatch
         fflush(stderr); fflush(stdout);
     }
     if (rigor) {
-        assert (in_channel>0);
-        assert (in_size>0);
-        assert ((scale_size==0)||(scale_size==in_channel));
-        assert ((bias_size==0)||(bias_size==in_channel));
+        dlrCheck (in_channel>0);
+        dlrCheck (in_size>0);
+        dlrCheckAlias (out_data, in_data, (uint32_t)in_channel*in_size);
+        dlrCheck ((scale_size==0)||(scale_size==in_channel));
+        dlrCheck ((bias_size==0)||(bias_size==in_channel));
     }
     #undef QuoteMacro
     #undef QuoteIdent
@@ -64,13 +65,27 @@ void Norm3dBatch
     uint16_t  f;
     uint32_t  s;
 
+    #if defined(__SYNTHESIS__)
     TYPE *pX = (TYPE*)(in_data);
     TYPE *pZ = (TYPE*)(out_data);
+    #endif
+    #if !defined(__SYNTHESIS__) && defined(_OPENMP)
+    #pragma omp parallel for private(s)
+    #endif
     for (f=0; f<in_channel; ++f) {
+        #if !defined(__SYNTHESIS__)
+        TYPE *pX = (TYPE*)(in_data +((uint32_t)f*in_size));
+        TYPE *pZ = (TYPE*)(out_data+((uint32_t)f*in_size));
+        #endif
         TYPE B     = (bias_size==0) ? (TYPE)0 : *(TYPE *)(bias+f);
         TYPE mean  = *(running_mean+f);
         TYPE var   = *(running_var+f);
         TYPE S     = (scale_size==0) ? (TYPE)1 : *(TYPE *)(scale+f);
+        #if !defined(__SYNTHESIS__)
+        if (SimdNormalize(pZ, pX, mean, var, S, B, epsilon, in_size)) { // float
+            continue;
+        }
+        #endif
         for (s=0; s<in_size; ++s) {
              *pZ = (TYPE)((((*pX)-mean) / (sqrt(var+epsilon))) * S + B);
              ++pX;
@@ -79,10 +94,67 @@ void Norm3dBatch
     }
 }
 
+// minibatch version: in_data and out_data have leading minibatch dimension
+template<class TYPE=float>
+void Norm3dBatchBatch
+(           TYPE     *out_data     // minibatch x in_channel x in_size (contiguous)
+    , const TYPE     *in_data      // minibatch x in_channel x in_size (contiguous)
+    , const TYPE     *running_mean // in_channel (contiguous) [mean]
+    , const TYPE     *running_var  // in_channel (contiguous) [variance, not deviation]
+    , const TYPE     *scale        // NULL or in_channel (contiguous) [gamma: scaling factor]
+    , const TYPE     *bias         // NULL or in_channel (contiguous) [beta: shift factor]
+    , const uint32_t  in_size      // num of elements per channel
+    , const uint16_t  scale_size   // 0 or in_channel
+    , const uint16_t  bias_size    // 0 or in_channel
+    , const uint16_t  in_channel   // 1 or n
+    , const uint16_t  minibatch    // number of minibatch items
+    , const float     epsilon=1E-5 // default: 1E-5 (noise for regularization)
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+    #endif
+)
+{
+    const uint32_t t_out_step=(uint32_t)in_channel*in_size;
+    const uint32_t t_in_step =(uint32_t)in_channel*in_size;
+    TYPE       *pZ = out_data;
+    const TYPE *pX = in_data;
+    uint16_t mb;
+
+    for (mb=0; mb<minibatch; ++mb) {
+        Norm3dBatch<TYPE>
+        (     pZ
+            , pX
+            , running_mean
+            , running_var
+            , scale
+            , bias
+            , in_size
+            , scale_size
+            , bias_size
+            , in_channel
+            , epsilon
+            #if !defined(__SYNTHESIS__)
+            , rigor
+            , verbose
+            #endif
+        );
+        pZ += t_out_step;
+        pX += t_in_step;
+    }
+}
+
 } // namespace dlr
 /*
  * Revision history
  *
+ * 2026.10.18: running pointers of the HLS path restored, per-channel pointers for software only.
+ * 2026.10.18: pX and pZ derived from 'f' in the loop for all builds.
+ * 2026.10.18: in-place (out_data==in_data) checked.
+ * 2026.10.18: SIMD scale and shift for float (dlr_simd.hpp).
+ * 2026.10.18: 'dlrCheck()' in place of 'assert()' for rigor checks.
+ * 2026.10.18: OpenMP for 'f' loop when built with OpenMP.
+ * 2026.10.18: 'Norm3dBatchBatch' added for minibatch.
  * 2020.09.20: parameter order of bias and bias_size changed.
  *             parameter 'rigor' and 'verbose' added.
  * 2020.08.31: Updated by participants of 2020 Summer Intern Program.
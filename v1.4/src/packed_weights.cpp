@@ -0,0 +1,446 @@
+#include "packed_weights.hpp"
+
+extern "C" {
+
+void *PackedWeightsConvolution2dInt
+(     const int      *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const int      *bias        // out_channel
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    return (dlr::PackedWeightsBase*)dlr::PackWeightsConvolution2d<int>
+    (     kernel
+        , bias
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , rigor
+        , verbose
+    );
+}
+
+void *PackedWeightsConvolution2dFloat
+(     const float    *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const float    *bias        // out_channel
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    return (dlr::PackedWeightsBase*)dlr::PackWeightsConvolution2d<float>
+    (     kernel
+        , bias
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , rigor
+        , verbose
+    );
+}
+
+void *PackedWeightsConvolution2dDouble
+(     const double   *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const double   *bias        // out_channel
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    return (dlr::PackedWeightsBase*)dlr::PackWeightsConvolution2d<double>
+    (     kernel
+        , bias
+        , kernel_size
+        , bias_size
+        , in_channel
+        , out_channel
+        , rigor
+        , verbose
+    );
+}
+
+void *PackedWeightsLinear1dInt
+(     const int      *weight      // out_size x in_size
+    , const int      *bias        // out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size   // 0 or out_size
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    return (dlr::PackedWeightsBase*)dlr::PackWeightsLinear1d<int>
+    (     weight
+        , bias
+        , out_size
+        , in_size
+        , bias_size
+        , rigor
+        , verbose
+    );
+}
+
+void *PackedWeightsLinear1dFloat
+(     const float    *weight      // out_size x in_size
+    , const float    *bias        // out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size   // 0 or out_size
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    return (dlr::PackedWeightsBase*)dlr::PackWeightsLinear1d<float>
+    (     weight
+        , bias
+        , out_size
+        , in_size
+        , bias_size
+        , rigor
+        , verbose
+    );
+}
+
+void *PackedWeightsLinear1dDouble
+(     const double   *weight      // out_size x in_size
+    , const double   *bias        // out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size   // 0 or out_size
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    return (dlr::PackedWeightsBase*)dlr::PackWeightsLinear1d<double>
+    (     weight
+        , bias
+        , out_size
+        , in_size
+        , bias_size
+        , rigor
+        , verbose
+    );
+}
+
+int Convolution2dPackedInt
+(           int      *out_data    // out_channel x out_size x out_size
+    , const int      *in_data     // in_channel x in_size x in_size
+    , const void     *packed      // handle from PackedWeightsConvolution2d<Type>()
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPacked<int>
+    (     out_data
+        , in_data
+        , static_cast<const dlr::PackedWeights<int>*>((const dlr::PackedWeightsBase*)packed)
+        , out_size
+        , in_size
+        , stride
+        , padding
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPackedFloat
+(           float    *out_data    // out_channel x out_size x out_size
+    , const float    *in_data     // in_channel x in_size x in_size
+    , const void     *packed      // handle from PackedWeightsConvolution2d<Type>()
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPacked<float>
+    (     out_data
+        , in_data
+        , static_cast<const dlr::PackedWeights<float>*>((const dlr::PackedWeightsBase*)packed)
+        , out_size
+        , in_size
+        , stride
+        , padding
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPackedDouble
+(           double   *out_data    // out_channel x out_size x out_size
+    , const double   *in_data     // in_channel x in_size x in_size
+    , const void     *packed      // handle from PackedWeightsConvolution2d<Type>()
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPacked<double>
+    (     out_data
+        , in_data
+        , static_cast<const dlr::PackedWeights<double>*>((const dlr::PackedWeightsBase*)packed)
+        , out_size
+        , in_size
+        , stride
+        , padding
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPackedBatchInt
+(           int      *out_data    // minibatch x out_channel x out_size x out_size
+    , const int      *in_data     // minibatch x in_channel x in_size x in_size
+    , const void     *packed      // handle from PackedWeightsConvolution2d<Type>()
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPackedBatch<int>
+    (     out_data
+        , in_data
+        , static_cast<const dlr::PackedWeights<int>*>((const dlr::PackedWeightsBase*)packed)
+        , out_size
+        , in_size
+        , minibatch
+        , stride
+        , padding
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPackedBatchFloat
+(           float    *out_data    // minibatch x out_channel x out_size x out_size
+    , const float    *in_data     // minibatch x in_channel x in_size x in_size
+    , const void     *packed      // handle from PackedWeightsConvolution2d<Type>()
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPackedBatch<float>
+    (     out_data
+        , in_data
+        , static_cast<const dlr::PackedWeights<float>*>((const dlr::PackedWeightsBase*)packed)
+        , out_size
+        , in_size
+        , minibatch
+        , stride
+        , padding
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Convolution2dPackedBatchDouble
+(           double   *out_data    // minibatch x out_channel x out_size x out_size
+    , const double   *in_data     // minibatch x in_channel x in_size x in_size
+    , const void     *packed      // handle from PackedWeightsConvolution2d<Type>()
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Convolution2dPackedBatch<double>
+    (     out_data
+        , in_data
+        , static_cast<const dlr::PackedWeights<double>*>((const dlr::PackedWeightsBase*)packed)
+        , out_size
+        , in_size
+        , minibatch
+        , stride
+        , padding
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Linear1dPackedInt
+(           int      *out_data    // out_size
+    , const int      *in_data     // in_size
+    , const void     *packed      // handle from PackedWeightsLinear1d<Type>()
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Linear1dPacked<int>
+    (     out_data
+        , in_data
+        , static_cast<const dlr::PackedWeights<int>*>((const dlr::PackedWeightsBase*)packed)
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Linear1dPackedFloat
+(           float    *out_data    // out_size
+    , const float    *in_data     // in_size
+    , const void     *packed      // handle from PackedWeightsLinear1d<Type>()
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Linear1dPacked<float>
+    (     out_data
+        , in_data
+        , static_cast<const dlr::PackedWeights<float>*>((const dlr::PackedWeightsBase*)packed)
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Linear1dPackedDouble
+(           double   *out_data    // out_size
+    , const double   *in_data     // in_size
+    , const void     *packed      // handle from PackedWeightsLinear1d<Type>()
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Linear1dPacked<double>
+    (     out_data
+        , in_data
+        , static_cast<const dlr::PackedWeights<double>*>((const dlr::PackedWeightsBase*)packed)
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Linear1dPackedBatchInt
+(           int      *out_data    // minibatch x out_size
+    , const int      *in_data     // minibatch x in_size
+    , const void     *packed      // handle from PackedWeightsLinear1d<Type>()
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Linear1dPackedBatch<int>
+    (     out_data
+        , in_data
+        , static_cast<const dlr::PackedWeights<int>*>((const dlr::PackedWeightsBase*)packed)
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Linear1dPackedBatchFloat
+(           float    *out_data    // minibatch x out_size
+    , const float    *in_data     // minibatch x in_size
+    , const void     *packed      // handle from PackedWeightsLinear1d<Type>()
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Linear1dPackedBatch<float>
+    (     out_data
+        , in_data
+        , static_cast<const dlr::PackedWeights<float>*>((const dlr::PackedWeightsBase*)packed)
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Linear1dPackedBatchDouble
+(           double   *out_data    // minibatch x out_size
+    , const double   *in_data     // minibatch x in_size
+    , const void     *packed      // handle from PackedWeightsLinear1d<Type>()
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Linear1dPackedBatch<double>
+    (     out_data
+        , in_data
+        , static_cast<const dlr::PackedWeights<double>*>((const dlr::PackedWeightsBase*)packed)
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int PackedWeightsFree
+(     void          *packed      // handle from PackedWeights<Op><Type>()
+)
+{
+    dlrClearLastError();
+    delete (dlr::PackedWeightsBase*)packed;
+    return dlrGetLastStatus();
+}
+
+} // extern "C"
+
+/*
+ * Revision history
+ *
+ * 2026.10.18: Started.
+ */
@@ -0,0 +1,220 @@
+#pragma once
+#include <stdint.h>
+
+// software-only: weights reordered once into GEMM panels and kept by a handle
+// - PackedWeights<Op><Type>() returns a handle, which should be released by PackedWeightsFree()
+// - <Op>Packed<Type>() computes with the handle instead of raw weights and bias
+#if !defined(__SYNTHESIS__)
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#define PackedWeightsConvolution2d PackedWeightsConvolution2dFloat
+#define PackedWeightsLinear1d PackedWeightsLinear1dFloat
+#define Convolution2dPacked Convolution2dPackedFloat
+#define Convolution2dPackedBatch Convolution2dPackedBatchFloat
+#define Linear1dPacked Linear1dPackedFloat
+#define Linear1dPackedBatch Linear1dPackedBatchFloat
+
+extern void *PackedWeightsConvolution2dInt
+(     const int      *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const int      *bias        // out_channel
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern void *PackedWeightsConvolution2dFloat
+(     const float    *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const float    *bias        // out_channel
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern void *PackedWeightsConvolution2dDouble
+(     const double   *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const double   *bias        // out_channel
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern void *PackedWeightsLinear1dInt
+(     const int      *weight      // out_size x in_size
+    , const int      *bias        // out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size   // 0 or out_size
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern void *PackedWeightsLinear1dFloat
+(     const float    *weight      // out_size x in_size
+    , const float    *bias        // out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size   // 0 or out_size
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern void *PackedWeightsLinear1dDouble
+(     const double   *weight      // out_size x in_size
+    , const double   *bias        // out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size   // 0 or out_size
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPackedInt
+(           int      *out_data    // out_channel x out_size x out_size
+    , const int      *in_data     // in_channel x in_size x in_size
+    , const void     *packed      // handle from PackedWeightsConvolution2d<Type>()
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPackedFloat
+(           float    *out_data    // out_channel x out_size x out_size
+    , const float    *in_data     // in_channel x in_size x in_size
+    , const void     *packed      // handle from PackedWeightsConvolution2d<Type>()
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPackedDouble
+(           double   *out_data    // out_channel x out_size x out_size
+    , const double   *in_data     // in_channel x in_size x in_size
+    , const void     *packed      // handle from PackedWeightsConvolution2d<Type>()
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPackedBatchInt
+(           int      *out_data    // minibatch x out_channel x out_size x out_size
+    , const int      *in_data     // minibatch x in_channel x in_size x in_size
+    , const void     *packed      // handle from PackedWeightsConvolution2d<Type>()
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPackedBatchFloat
+(           float    *out_data    // minibatch x out_channel x out_size x out_size
+    , const float    *in_data     // minibatch x in_channel x in_size x in_size
+    , const void     *packed      // handle from PackedWeightsConvolution2d<Type>()
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Convolution2dPackedBatchDouble
+(           double   *out_data    // minibatch x out_channel x out_size x out_size
+    , const double   *in_data     // minibatch x in_channel x in_size x in_size
+    , const void     *packed      // handle from PackedWeightsConvolution2d<Type>()
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Linear1dPackedInt
+(           int      *out_data    // out_size
+    , const int      *in_data     // in_size
+    , const void     *packed      // handle from PackedWeightsLinear1d<Type>()
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Linear1dPackedFloat
+(           float    *out_data    // out_size
+    , const float    *in_data     // in_size
+    , const void     *packed      // handle from PackedWeightsLinear1d<Type>()
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Linear1dPackedDouble
+(           double   *out_data    // out_size
+    , const double   *in_data     // in_size
+    , const void     *packed      // handle from PackedWeightsLinear1d<Type>()
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Linear1dPackedBatchInt
+(           int      *out_data    // minibatch x out_size
+    , const int      *in_data     // minibatch x in_size
+    , const void     *packed      // handle from PackedWeightsLinear1d<Type>()
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Linear1dPackedBatchFloat
+(           float    *out_data    // minibatch x out_size
+    , const float    *in_data     // minibatch x in_size
+    , const void     *packed      // handle from PackedWeightsLinear1d<Type>()
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Linear1dPackedBatchDouble
+(           double   *out_data    // minibatch x out_size
+    , const double   *in_data     // minibatch x in_size
+    , const void     *packed      // handle from PackedWeightsLinear1d<Type>()
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int PackedWeightsFree
+(     void          *packed      // handle from PackedWeights<Op><Type>()
+);
+
+#ifdef __cplusplus
+}
+#endif
+#endif // !defined(__SYNTHESIS__)
+/*
+ * Revision history
+ *
+ * 2026.10.18: Started.
+ */
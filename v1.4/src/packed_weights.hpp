@@ -0,0 +1,281 @@
+#pragma once
+/*
+ * Copyright (c) 2019-2020 by Future Design Systems.
+ * All right reserved.
+ * http://www.future-ds.com
+ *
+ * @file packed_weights.hpp
+ * @brief This file contains pre-packed weights and routines using them
+ *        (software-only, not for HLS).
+ * @author FDS
+ * @date Oct. 18, 2026
+ */
+#if !defined(__SYNTHESIS__)
+#include <stdint.h>
+#include <stdio.h>
+#include <vector>
+#include "dlr_common.h"
+#include "dlr_gemm.hpp"
+#include "convolution_2d_fast.hpp"
+
+namespace dlr { // deep learning routines
+
+struct PackedWeightsBase {
+    virtual ~PackedWeightsBase() {}
+};
+
+// Weights reordered once into panels of GEMM register tile (see GemmPackA())
+// together with bias, which is kept across calls.
+template<class TYPE=float>
+struct PackedWeights : public PackedWeightsBase {
+    std::vector<TYPE> weight;      // packed rows x depth
+    std::vector<TYPE> bias;        // rows, empty when no bias
+    uint32_t          rows;        // out_channel or out_size
+    uint32_t          depth;       // in_channel x kernel_size x kernel_size or in_size
+    uint16_t          in_channel;  // 0 for linear
+    uint8_t           kernel_size; // 0 for linear
+};
+
+template<class TYPE=float>
+PackedWeights<TYPE> *PackWeights
+(     const TYPE     *weight // rows x depth
+    , const TYPE     *bias   // rows
+    , const uint32_t  rows
+    , const uint32_t  depth
+    , const uint16_t  bias_size
+)
+{
+    PackedWeights<TYPE> *packed = new PackedWeights<TYPE>;
+    packed->rows  = rows;
+    packed->depth = depth;
+    packed->in_channel  = 0;
+    packed->kernel_size = 0;
+    packed->weight.resize(GemmPackedSize(rows, depth));
+    GemmPackA<TYPE>(packed->weight.data(), weight, rows, depth, depth);
+    if (bias_size!=0) packed->bias.assign(bias, bias+rows);
+    return packed;
+}
+
+template<class TYPE=float>
+PackedWeights<TYPE> *PackWeightsConvolution2d
+(     const TYPE     *kernel      // out_channel x in_channel x kernel_size x kernel_size
+    , const TYPE     *bias        // out_channel
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  bias_size   // 0 or out_channel
+    , const uint16_t  in_channel  // number of input channels
+    , const uint16_t  out_channel // number of filters (kernels)
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+)
+{
+    if (verbose) {
+        dlrInfo("kernel_size=%d\n", kernel_size );
+        dlrInfo("bias_size  =%d\n", bias_size   );
+        dlrInfo("in_channel =%d\n", in_channel  );
+        dlrInfo("out_channel=%d\n", out_channel );
+        fflush(stderr); fflush(stdout);
+    }
+    if (rigor) {
+        dlrCheckReturn (in_channel>0, NULL);
+        dlrCheckReturn (out_channel>0, NULL);
+        dlrCheckReturn ((kernel_size%2)==1, NULL);
+        dlrCheckReturn ((bias_size==0)||(out_channel==bias_size), NULL);
+    }
+    PackedWeights<TYPE> *packed = PackWeights<TYPE>( kernel, bias, out_channel
+                                                   , (uint32_t)in_channel*kernel_size*kernel_size
+                                                   , bias_size);
+    packed->in_channel  = in_channel;
+    packed->kernel_size = kernel_size;
+    return packed;
+}
+
+template<class TYPE=float>
+PackedWeights<TYPE> *PackWeightsLinear1d
+(     const TYPE     *weight    // out_size x in_size
+    , const TYPE     *bias      // out_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint16_t  bias_size // 0 or out_size
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+)
+{
+    if (verbose) {
+        dlrInfo("out_size   =%d\n", out_size  );
+        dlrInfo("in_size    =%d\n", in_size   );
+        dlrInfo("bias_size  =%d\n", bias_size );
+        fflush(stderr); fflush(stdout);
+    }
+    if (rigor) {
+        dlrCheckReturn (in_size>0, NULL);
+        dlrCheckReturn (out_size>0, NULL);
+        dlrCheckReturn ((bias_size==0)||(out_size==bias_size), NULL);
+    }
+    return PackWeights<TYPE>(weight, bias, out_size, in_size, bias_size);
+}
+
+// Same results as Convolution2dFast(), but kernel and bias come from
+// PackWeightsConvolution2d().
+template<class TYPE=float>
+void Convolution2dPacked
+(           TYPE                *out_data // out_channel x out_size x out_size
+    , const TYPE                *in_data  // in_channel x in_size x in_size
+    , const PackedWeights<TYPE> *packed   // kernel and bias
+    , const uint16_t             out_size // only for square matrix
+    , const uint16_t             in_size  // only for square matrix
+    , const uint8_t              stride
+    , const uint8_t              padding=0
+    , const int                  rigor=0   // check rigorously when 1
+    , const int                  verbose=0 // verbose level
+)
+{
+    const uint8_t  kernel_size = packed->kernel_size;
+    const uint16_t in_channel  = packed->in_channel;
+    const uint32_t out_channel = packed->rows;
+    if (verbose) {
+        dlrInfo("out_size   =%d\n", out_size    );
+        dlrInfo("in_size    =%d\n", in_size     );
+        dlrInfo("kernel_size=%d\n", kernel_size );
+        dlrInfo("in_channel =%d\n", in_channel  );
+        dlrInfo("out_channel=%d\n", out_channel );
+        dlrInfo("stride     =%d\n", stride      );
+        dlrInfo("padding    =%d\n", padding     );
+        fflush(stderr); fflush(stdout);
+    }
+    if (rigor) {
+        dlrCheck (kernel_size>0);
+        dlrCheck (out_size==(((in_size-kernel_size+2*padding)/stride)+1));
+        dlrCheck (stride>0);
+        dlrCheck (padding<=(kernel_size/2));
+    }
+
+    const uint32_t t_out_area = (uint32_t)out_size*out_size;
+    const uint32_t t_depth    = packed->depth; // rows of im2col
+    uint32_t f, n;
+
+    for (f=0; f<out_channel; ++f) {
+        TYPE B = packed->bias.empty() ? (TYPE)0 : packed->bias[f];
+        TYPE *pZ = out_data+f*t_out_area;
+        for (n=0; n<t_out_area; ++n) pZ[n] = B;
+    }
+
+    if ((kernel_size==1)&&(stride==1)&&(padding==0)) { // input itself is im2col
+        GemmPacked<TYPE>( out_data, packed->weight.data(), in_data
+                        , out_channel, t_out_area, in_channel
+                        , t_out_area, t_out_area);
+        return;
+    }
+
+    // band of output rows to bound the size of im2col buffer
+    uint32_t t_rows = DLR_IM2COL_SIZE/(t_depth*out_size);
+    if (t_rows<1) t_rows = 1;
+    if (t_rows>out_size) t_rows = out_size;
+    std::vector<TYPE> t_col((size_t)t_depth*t_rows*out_size);
+
+    uint32_t g0;
+    for (g0=0; g0<out_size; g0+=t_rows) {
+        const uint32_t rows = ((out_size-g0)<t_rows) ? (out_size-g0) : t_rows;
+        const uint32_t cols = rows*out_size; // output pixels of this band
+        Im2col<TYPE>( t_col.data(), in_data, g0, rows
+                    , out_size, in_size, kernel_size, in_channel
+                    , stride, padding);
+        GemmPacked<TYPE>( out_data+g0*out_size, packed->weight.data(), t_col.data()
+                        , out_channel, cols, t_depth
+                        , t_out_area, cols);
+    } // for (g0=0
+}
+
+template<class TYPE=float>
+void Convolution2dPackedBatch
+(           TYPE                *out_data  // minibatch x out_channel x out_size x out_size
+    , const TYPE                *in_data   // minibatch x in_channel x in_size x in_size
+    , const PackedWeights<TYPE> *packed    // kernel and bias
+    , const uint16_t             out_size  // only for square matrix
+    , const uint16_t             in_size   // only for square matrix
+    , const uint16_t             minibatch // number of minibatch items
+    , const uint8_t              stride
+    , const uint8_t              padding=0
+    , const int                  rigor=0   // check rigorously when 1
+    , const int                  verbose=0 // verbose level
+)
+{
+    const uint32_t t_out_step=(uint32_t)packed->rows*out_size*out_size;
+    const uint32_t t_in_step =(uint32_t)packed->in_channel*in_size*in_size;
+    TYPE       *pZ = out_data;
+    const TYPE *pX = in_data;
+    uint16_t mb;
+
+    for (mb=0; mb<minibatch; ++mb) {
+        Convolution2dPacked<TYPE>
+        (     pZ
+            , pX
+            , packed
+            , out_size
+            , in_size
+            , stride
+            , padding
+            , rigor
+            , verbose
+        );
+        pZ += t_out_step;
+        pX += t_in_step;
+    }
+}
+
+// Same results as Linear1d(), but weight and bias come from PackWeightsLinear1d().
+template<class TYPE=float>
+void Linear1dPacked
+(           TYPE                *out_data // out_size
+    , const TYPE                *in_data  // in_size
+    , const PackedWeights<TYPE> *packed   // weight and bias
+    , const int                  rigor=0   // check rigorously when 1
+    , const int                  verbose=0 // verbose level
+)
+{
+    if (verbose) {
+        dlrInfo("out_size   =%d\n", packed->rows  );
+        dlrInfo("in_size    =%d\n", packed->depth );
+        fflush(stderr); fflush(stdout);
+    }
+    if (rigor) {
+        dlrCheck (packed->kernel_size==0);
+    }
+    uint32_t o;
+    for (o=0; o<packed->rows; ++o)
+        out_data[o] = packed->bias.empty() ? (TYPE)0 : packed->bias[o];
+    GemmPacked<TYPE>( out_data, packed->weight.data(), in_data
+                    , packed->rows, 1, packed->depth
+                    , 1, 1);
+}
+
+template<class TYPE=float>
+void Linear1dPackedBatch
+(           TYPE                *out_data  // minibatch x out_size
+    , const TYPE                *in_data   // minibatch x in_size
+    , const PackedWeights<TYPE> *packed    // weight and bias
+    , const uint16_t             minibatch // number of minibatch items
+    , const int                  rigor=0   // check rigorously when 1
+    , const int                  verbose=0 // verbose level
+)
+{
+    const uint32_t t_out_step=packed->rows;
+    const uint32_t t_in_step =packed->depth;
+    TYPE       *pZ = out_data;
+    const TYPE *pX = in_data;
+    uint16_t mb;
+
+    for (mb=0; mb<minibatch; ++mb) {
+        Linear1dPacked<TYPE>(pZ, pX, packed, rigor, verbose);
+        pZ += t_out_step;
+        pX += t_in_step;
+    }
+}
+
+} // namespace dlr
+#endif // !defined(__SYNTHESIS__)
+/*
+ * Revision history
+ *
+ * 2026.10.18: 'dlrCheck()' in place of 'assert()' for rigor checks.
+ * 2026.10.18: Started.
+ */
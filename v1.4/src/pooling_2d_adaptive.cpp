@@ -0,0 +1,1120 @@
+#include "pooling_2d_adaptive.hpp"
+#include "dlr_fixed.hpp"
+#include "dlr_half.hpp"
+
+extern "C" {
+
+int Pooling2dGlobalAvgInt
+(           int      *out_data    // channel
+    , const int      *in_data     // channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dGlobalAvg<int>
+    (     out_data
+        , in_data
+        , in_size
+        , channel
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dGlobalAvgBatchInt
+(           int      *out_data    // minibatch x channel
+    , const int      *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dGlobalAvgBatch<int>
+    (     out_data
+        , in_data
+        , in_size
+        , channel
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dGlobalMaxInt
+(           int      *out_data    // channel
+    , const int      *in_data     // channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dGlobalMax<int>
+    (     out_data
+        , in_data
+        , in_size
+        , channel
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dGlobalMaxBatchInt
+(           int      *out_data    // minibatch x channel
+    , const int      *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dGlobalMaxBatch<int>
+    (     out_data
+        , in_data
+        , in_size
+        , channel
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAdaptiveAvgInt
+(           int      *out_data    // channel x out_size x out_size
+    , const int      *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAdaptiveAvg<int>
+    (     out_data
+        , in_data
+        , out_size
+        , in_size
+        , channel
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAdaptiveAvgBatchInt
+(           int      *out_data    // minibatch x channel x out_size x out_size
+    , const int      *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAdaptiveAvgBatch<int>
+    (     out_data
+        , in_data
+        , out_size
+        , in_size
+        , channel
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAdaptiveMaxInt
+(           int      *out_data    // channel x out_size x out_size
+    , const int      *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAdaptiveMax<int>
+    (     out_data
+        , in_data
+        , out_size
+        , in_size
+        , channel
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAdaptiveMaxBatchInt
+(           int      *out_data    // minibatch x channel x out_size x out_size
+    , const int      *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAdaptiveMaxBatch<int>
+    (     out_data
+        , in_data
+        , out_size
+        , in_size
+        , channel
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dGlobalAvgFloat
+(           float    *out_data    // channel
+    , const float    *in_data     // channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dGlobalAvg<float>
+    (     out_data
+        , in_data
+        , in_size
+        , channel
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dGlobalAvgBatchFloat
+(           float    *out_data    // minibatch x channel
+    , const float    *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dGlobalAvgBatch<float>
+    (     out_data
+        , in_data
+        , in_size
+        , channel
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dGlobalMaxFloat
+(           float    *out_data    // channel
+    , const float    *in_data     // channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dGlobalMax<float>
+    (     out_data
+        , in_data
+        , in_size
+        , channel
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dGlobalMaxBatchFloat
+(           float    *out_data    // minibatch x channel
+    , const float    *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dGlobalMaxBatch<float>
+    (     out_data
+        , in_data
+        , in_size
+        , channel
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAdaptiveAvgFloat
+(           float    *out_data    // channel x out_size x out_size
+    , const float    *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAdaptiveAvg<float>
+    (     out_data
+        , in_data
+        , out_size
+        , in_size
+        , channel
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAdaptiveAvgBatchFloat
+(           float    *out_data    // minibatch x channel x out_size x out_size
+    , const float    *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAdaptiveAvgBatch<float>
+    (     out_data
+        , in_data
+        , out_size
+        , in_size
+        , channel
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAdaptiveMaxFloat
+(           float    *out_data    // channel x out_size x out_size
+    , const float    *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAdaptiveMax<float>
+    (     out_data
+        , in_data
+        , out_size
+        , in_size
+        , channel
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAdaptiveMaxBatchFloat
+(           float    *out_data    // minibatch x channel x out_size x out_size
+    , const float    *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAdaptiveMaxBatch<float>
+    (     out_data
+        , in_data
+        , out_size
+        , in_size
+        , channel
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dGlobalAvgDouble
+(           double   *out_data    // channel
+    , const double   *in_data     // channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dGlobalAvg<double>
+    (     out_data
+        , in_data
+        , in_size
+        , channel
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dGlobalAvgBatchDouble
+(           double   *out_data    // minibatch x channel
+    , const double   *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dGlobalAvgBatch<double>
+    (     out_data
+        , in_data
+        , in_size
+        , channel
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dGlobalMaxDouble
+(           double   *out_data    // channel
+    , const double   *in_data     // channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dGlobalMax<double>
+    (     out_data
+        , in_data
+        , in_size
+        , channel
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dGlobalMaxBatchDouble
+(           double   *out_data    // minibatch x channel
+    , const double   *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dGlobalMaxBatch<double>
+    (     out_data
+        , in_data
+        , in_size
+        , channel
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAdaptiveAvgDouble
+(           double   *out_data    // channel x out_size x out_size
+    , const double   *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAdaptiveAvg<double>
+    (     out_data
+        , in_data
+        , out_size
+        , in_size
+        , channel
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAdaptiveAvgBatchDouble
+(           double   *out_data    // minibatch x channel x out_size x out_size
+    , const double   *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAdaptiveAvgBatch<double>
+    (     out_data
+        , in_data
+        , out_size
+        , in_size
+        , channel
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAdaptiveMaxDouble
+(           double   *out_data    // channel x out_size x out_size
+    , const double   *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAdaptiveMax<double>
+    (     out_data
+        , in_data
+        , out_size
+        , in_size
+        , channel
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAdaptiveMaxBatchDouble
+(           double   *out_data    // minibatch x channel x out_size x out_size
+    , const double   *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAdaptiveMaxBatch<double>
+    (     out_data
+        , in_data
+        , out_size
+        , in_size
+        , channel
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+// fixed-point of dlr_fixed.hpp, whose data are raw bits (see dlrSetFixedFormat())
+int Pooling2dGlobalAvgFixed
+(           int32_t  *out_data    // channel
+    , const int32_t  *in_data     // channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dGlobalAvg<dlr::Fixed>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , in_size
+        , channel
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dGlobalAvgBatchFixed
+(           int32_t  *out_data    // minibatch x channel
+    , const int32_t  *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dGlobalAvgBatch<dlr::Fixed>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , in_size
+        , channel
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dGlobalMaxFixed
+(           int32_t  *out_data    // channel
+    , const int32_t  *in_data     // channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dGlobalMax<dlr::Fixed>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , in_size
+        , channel
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dGlobalMaxBatchFixed
+(           int32_t  *out_data    // minibatch x channel
+    , const int32_t  *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dGlobalMaxBatch<dlr::Fixed>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , in_size
+        , channel
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAdaptiveAvgFixed
+(           int32_t  *out_data    // channel x out_size x out_size
+    , const int32_t  *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAdaptiveAvg<dlr::Fixed>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , out_size
+        , in_size
+        , channel
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAdaptiveAvgBatchFixed
+(           int32_t  *out_data    // minibatch x channel x out_size x out_size
+    , const int32_t  *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAdaptiveAvgBatch<dlr::Fixed>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , out_size
+        , in_size
+        , channel
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAdaptiveMaxFixed
+(           int32_t  *out_data    // channel x out_size x out_size
+    , const int32_t  *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAdaptiveMax<dlr::Fixed>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , out_size
+        , in_size
+        , channel
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAdaptiveMaxBatchFixed
+(           int32_t  *out_data    // minibatch x channel x out_size x out_size
+    , const int32_t  *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAdaptiveMaxBatch<dlr::Fixed>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , out_size
+        , in_size
+        , channel
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+// IEEE 754 binary16 (fp16) and bfloat16 storage computed in float (see dlr_half.hpp)
+int Pooling2dGlobalAvgHalf
+(           uint16_t *out_data    // channel
+    , const uint16_t *in_data     // channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dGlobalAvg<dlr::Half>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , in_size
+        , channel
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dGlobalAvgBatchHalf
+(           uint16_t *out_data    // minibatch x channel
+    , const uint16_t *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dGlobalAvgBatch<dlr::Half>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , in_size
+        , channel
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dGlobalMaxHalf
+(           uint16_t *out_data    // channel
+    , const uint16_t *in_data     // channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dGlobalMax<dlr::Half>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , in_size
+        , channel
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dGlobalMaxBatchHalf
+(           uint16_t *out_data    // minibatch x channel
+    , const uint16_t *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dGlobalMaxBatch<dlr::Half>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , in_size
+        , channel
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAdaptiveAvgHalf
+(           uint16_t *out_data    // channel x out_size x out_size
+    , const uint16_t *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAdaptiveAvg<dlr::Half>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , out_size
+        , in_size
+        , channel
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAdaptiveAvgBatchHalf
+(           uint16_t *out_data    // minibatch x channel x out_size x out_size
+    , const uint16_t *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAdaptiveAvgBatch<dlr::Half>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , out_size
+        , in_size
+        , channel
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAdaptiveMaxHalf
+(           uint16_t *out_data    // channel x out_size x out_size
+    , const uint16_t *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAdaptiveMax<dlr::Half>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , out_size
+        , in_size
+        , channel
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAdaptiveMaxBatchHalf
+(           uint16_t *out_data    // minibatch x channel x out_size x out_size
+    , const uint16_t *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAdaptiveMaxBatch<dlr::Half>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , out_size
+        , in_size
+        , channel
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dGlobalAvgBFloat16
+(           uint16_t *out_data    // channel
+    , const uint16_t *in_data     // channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dGlobalAvg<dlr::BFloat16>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , in_size
+        , channel
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dGlobalAvgBatchBFloat16
+(           uint16_t *out_data    // minibatch x channel
+    , const uint16_t *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dGlobalAvgBatch<dlr::BFloat16>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , in_size
+        , channel
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dGlobalMaxBFloat16
+(           uint16_t *out_data    // channel
+    , const uint16_t *in_data     // channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dGlobalMax<dlr::BFloat16>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , in_size
+        , channel
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dGlobalMaxBatchBFloat16
+(           uint16_t *out_data    // minibatch x channel
+    , const uint16_t *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dGlobalMaxBatch<dlr::BFloat16>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , in_size
+        , channel
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAdaptiveAvgBFloat16
+(           uint16_t *out_data    // channel x out_size x out_size
+    , const uint16_t *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAdaptiveAvg<dlr::BFloat16>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , out_size
+        , in_size
+        , channel
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAdaptiveAvgBatchBFloat16
+(           uint16_t *out_data    // minibatch x channel x out_size x out_size
+    , const uint16_t *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAdaptiveAvgBatch<dlr::BFloat16>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , out_size
+        , in_size
+        , channel
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAdaptiveMaxBFloat16
+(           uint16_t *out_data    // channel x out_size x out_size
+    , const uint16_t *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAdaptiveMax<dlr::BFloat16>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , out_size
+        , in_size
+        , channel
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAdaptiveMaxBatchBFloat16
+(           uint16_t *out_data    // minibatch x channel x out_size x out_size
+    , const uint16_t *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAdaptiveMaxBatch<dlr::BFloat16>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , out_size
+        , in_size
+        , channel
+        , minibatch
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+} // extern "C"
+
+/*
+ * Revision history
+ *
+ * 2026.10.18: fixed-point entries added.
+ * 2026.10.18: Started.
+ */
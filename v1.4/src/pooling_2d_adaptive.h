@@ -0,0 +1,507 @@
+#pragma once
+#include <stdint.h>
+
+// software-only: global and adaptive pooling as PyTorch
+// - Pooling2dGlobal<Avg|Max><Type>() reduces each channel to a value
+// - Pooling2dAdaptive<Avg|Max><Type>() takes windows of
+//   floor(k*in_size/out_size) to ceil((k+1)*in_size/out_size)
+#if !defined(__SYNTHESIS__)
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#define Pooling2dGlobalAvg Pooling2dGlobalAvgFloat
+#define Pooling2dGlobalAvgBatch Pooling2dGlobalAvgBatchFloat
+#define Pooling2dGlobalMax Pooling2dGlobalMaxFloat
+#define Pooling2dGlobalMaxBatch Pooling2dGlobalMaxBatchFloat
+#define Pooling2dAdaptiveAvg Pooling2dAdaptiveAvgFloat
+#define Pooling2dAdaptiveAvgBatch Pooling2dAdaptiveAvgBatchFloat
+#define Pooling2dAdaptiveMax Pooling2dAdaptiveMaxFloat
+#define Pooling2dAdaptiveMaxBatch Pooling2dAdaptiveMaxBatchFloat
+
+extern int Pooling2dGlobalAvgInt
+(           int      *out_data    // channel
+    , const int      *in_data     // channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dGlobalAvgBatchInt
+(           int      *out_data    // minibatch x channel
+    , const int      *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dGlobalMaxInt
+(           int      *out_data    // channel
+    , const int      *in_data     // channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dGlobalMaxBatchInt
+(           int      *out_data    // minibatch x channel
+    , const int      *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dAdaptiveAvgInt
+(           int      *out_data    // channel x out_size x out_size
+    , const int      *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dAdaptiveAvgBatchInt
+(           int      *out_data    // minibatch x channel x out_size x out_size
+    , const int      *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dAdaptiveMaxInt
+(           int      *out_data    // channel x out_size x out_size
+    , const int      *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dAdaptiveMaxBatchInt
+(           int      *out_data    // minibatch x channel x out_size x out_size
+    , const int      *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dGlobalAvgFloat
+(           float    *out_data    // channel
+    , const float    *in_data     // channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dGlobalAvgBatchFloat
+(           float    *out_data    // minibatch x channel
+    , const float    *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dGlobalMaxFloat
+(           float    *out_data    // channel
+    , const float    *in_data     // channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dGlobalMaxBatchFloat
+(           float    *out_data    // minibatch x channel
+    , const float    *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dAdaptiveAvgFloat
+(           float    *out_data    // channel x out_size x out_size
+    , const float    *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dAdaptiveAvgBatchFloat
+(           float    *out_data    // minibatch x channel x out_size x out_size
+    , const float    *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dAdaptiveMaxFloat
+(           float    *out_data    // channel x out_size x out_size
+    , const float    *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dAdaptiveMaxBatchFloat
+(           float    *out_data    // minibatch x channel x out_size x out_size
+    , const float    *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dGlobalAvgDouble
+(           double   *out_data    // channel
+    , const double   *in_data     // channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dGlobalAvgBatchDouble
+(           double   *out_data    // minibatch x channel
+    , const double   *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dGlobalMaxDouble
+(           double   *out_data    // channel
+    , const double   *in_data     // channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dGlobalMaxBatchDouble
+(           double   *out_data    // minibatch x channel
+    , const double   *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dAdaptiveAvgDouble
+(           double   *out_data    // channel x out_size x out_size
+    , const double   *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dAdaptiveAvgBatchDouble
+(           double   *out_data    // minibatch x channel x out_size x out_size
+    , const double   *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dAdaptiveMaxDouble
+(           double   *out_data    // channel x out_size x out_size
+    , const double   *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dAdaptiveMaxBatchDouble
+(           double   *out_data    // minibatch x channel x out_size x out_size
+    , const double   *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+// fixed-point of raw bits in the format of dlrSetFixedFormat()
+extern int Pooling2dGlobalAvgFixed
+(           int32_t  *out_data    // channel
+    , const int32_t  *in_data     // channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dGlobalAvgBatchFixed
+(           int32_t  *out_data    // minibatch x channel
+    , const int32_t  *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dGlobalMaxFixed
+(           int32_t  *out_data    // channel
+    , const int32_t  *in_data     // channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dGlobalMaxBatchFixed
+(           int32_t  *out_data    // minibatch x channel
+    , const int32_t  *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dAdaptiveAvgFixed
+(           int32_t  *out_data    // channel x out_size x out_size
+    , const int32_t  *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dAdaptiveAvgBatchFixed
+(           int32_t  *out_data    // minibatch x channel x out_size x out_size
+    , const int32_t  *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dAdaptiveMaxFixed
+(           int32_t  *out_data    // channel x out_size x out_size
+    , const int32_t  *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dAdaptiveMaxBatchFixed
+(           int32_t  *out_data    // minibatch x channel x out_size x out_size
+    , const int32_t  *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+// IEEE 754 binary16 (fp16) and bfloat16 storage of uint16_t bits computed in float
+extern int Pooling2dGlobalAvgHalf
+(           uint16_t *out_data    // channel
+    , const uint16_t *in_data     // channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dGlobalAvgBatchHalf
+(           uint16_t *out_data    // minibatch x channel
+    , const uint16_t *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dGlobalMaxHalf
+(           uint16_t *out_data    // channel
+    , const uint16_t *in_data     // channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dGlobalMaxBatchHalf
+(           uint16_t *out_data    // minibatch x channel
+    , const uint16_t *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dAdaptiveAvgHalf
+(           uint16_t *out_data    // channel x out_size x out_size
+    , const uint16_t *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dAdaptiveAvgBatchHalf
+(           uint16_t *out_data    // minibatch x channel x out_size x out_size
+    , const uint16_t *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dAdaptiveMaxHalf
+(           uint16_t *out_data    // channel x out_size x out_size
+    , const uint16_t *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dAdaptiveMaxBatchHalf
+(           uint16_t *out_data    // minibatch x channel x out_size x out_size
+    , const uint16_t *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dGlobalAvgBFloat16
+(           uint16_t *out_data    // channel
+    , const uint16_t *in_data     // channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dGlobalAvgBatchBFloat16
+(           uint16_t *out_data    // minibatch x channel
+    , const uint16_t *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dGlobalMaxBFloat16
+(           uint16_t *out_data    // channel
+    , const uint16_t *in_data     // channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dGlobalMaxBatchBFloat16
+(           uint16_t *out_data    // minibatch x channel
+    , const uint16_t *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dAdaptiveAvgBFloat16
+(           uint16_t *out_data    // channel x out_size x out_size
+    , const uint16_t *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dAdaptiveAvgBatchBFloat16
+(           uint16_t *out_data    // minibatch x channel x out_size x out_size
+    , const uint16_t *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dAdaptiveMaxBFloat16
+(           uint16_t *out_data    // channel x out_size x out_size
+    , const uint16_t *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+extern int Pooling2dAdaptiveMaxBatchBFloat16
+(           uint16_t *out_data    // minibatch x channel x out_size x out_size
+    , const uint16_t *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor       // check rigorously when 1
+    , const int       verbose     // verbose level
+);
+
+#ifdef __cplusplus
+}
+#endif
+#endif // !defined(__SYNTHESIS__)
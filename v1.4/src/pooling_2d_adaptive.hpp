@@ -0,0 +1,318 @@
+#pragma once
+/*
+ * Copyright (c) 2019-2020 by Future Design Systems.
+ * All right reserved.
+ * http://www.future-ds.com
+ *
+ * @file pooling_2d_adaptive.hpp
+ * @brief This file contains 2 dimensional global and adaptive pooling routines
+ *        (software-only, not for HLS).
+ * @author FDS
+ * @date Oct. 18, 2026
+ */
+#if !defined(__SYNTHESIS__)
+#include <stdint.h>
+#include <stdio.h>
+#include <vector>
+#include "dlr_common.h"
+#include "dlr_half.hpp"
+#include "dlr_simd.hpp"
+
+namespace dlr { // deep learning routines
+
+// Window [lo,hi) of output index 'k' as 'torch.nn.AdaptiveAvgPool2d',
+// i.e., from floor(k*in_size/out_size) to ceil((k+1)*in_size/out_size),
+// which is the same for rows and columns.
+inline void Pooling2dAdaptiveWindows
+(           std::vector<uint16_t> &lo
+    ,       std::vector<uint16_t> &hi
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+)
+{
+    lo.resize(out_size);
+    hi.resize(out_size);
+    for (uint16_t k=0; k<out_size; ++k) {
+        lo[k] = (uint16_t)(((uint32_t)k*in_size)/out_size);
+        hi[k] = (uint16_t)(((uint32_t)(k+1)*in_size+out_size-1)/out_size);
+    }
+}
+
+// Average of each channel, i.e., a single sum over in_size x in_size.
+template<class TYPE=float>
+void Pooling2dGlobalAvg
+(           TYPE     *out_data    // channel
+    , const TYPE     *in_data     // channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor=0     // check rigorously when 1
+    , const int       verbose=0
+)
+{
+    if (verbose) {
+        dlrInfo("in_size    =%d\n", in_size );
+        dlrInfo("channel    =%d\n", channel );
+        fflush(stderr); fflush(stdout);
+    }
+    if (rigor) {
+        dlrCheck (in_size>0);
+    }
+
+    typedef typename Accumulator<TYPE>::type ACCUM;
+    const uint32_t t_area = (uint32_t)in_size*in_size;
+    int32_t ch; // signed for OpenMP
+
+    #if defined(_OPENMP)
+    #pragma omp parallel for
+    #endif
+    for (ch=0; ch<(int32_t)channel; ++ch) {
+        const TYPE *pX = in_data+(uint32_t)ch*t_area;
+        ACCUM t_sum=0;
+        if (!SimdSum(&t_sum, pX, t_area)) {
+            for (uint32_t i=0; i<t_area; ++i) t_sum += (ACCUM)pX[i];
+        }
+        out_data[ch] = (TYPE)(t_sum/(ACCUM)t_area);
+    }
+}
+
+// Max of each channel, i.e., a single max over in_size x in_size.
+template<class TYPE=float>
+void Pooling2dGlobalMax
+(           TYPE     *out_data    // channel
+    , const TYPE     *in_data     // channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor=0     // check rigorously when 1
+    , const int       verbose=0
+)
+{
+    if (verbose) {
+        dlrInfo("in_size    =%d\n", in_size );
+        dlrInfo("channel    =%d\n", channel );
+        fflush(stderr); fflush(stdout);
+    }
+    if (rigor) {
+        dlrCheck (in_size>0);
+    }
+
+    const uint32_t t_area = (uint32_t)in_size*in_size;
+    int32_t ch; // signed for OpenMP
+
+    #if defined(_OPENMP)
+    #pragma omp parallel for
+    #endif
+    for (ch=0; ch<(int32_t)channel; ++ch) {
+        out_data[ch] = SimdReduceMax(in_data+(uint32_t)ch*t_area, t_area);
+    }
+}
+
+// Average over windows of Pooling2dAdaptiveWindows() as 'torch.nn.AdaptiveAvgPool2d',
+// where rows of a window row are summed into a row of ACCUM once
+// and then each window is a single sum of the row.
+// - integer goes truncated toward zero by the divide
+// - 'out_size' of 1 goes Pooling2dGlobalAvg()
+template<class TYPE=float>
+void Pooling2dAdaptiveAvg
+(           TYPE     *out_data    // channel x out_size x out_size
+    , const TYPE     *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor=0     // check rigorously when 1
+    , const int       verbose=0
+)
+{
+    if (verbose) {
+        dlrInfo("out_size   =%d\n", out_size);
+        dlrInfo("in_size    =%d\n", in_size );
+        dlrInfo("channel    =%d\n", channel );
+        fflush(stderr); fflush(stdout);
+    }
+    if (rigor) {
+        dlrCheck (out_size>0);
+        dlrCheck (in_size>0);
+    }
+    if (out_size==1) {
+        Pooling2dGlobalAvg<TYPE>(out_data, in_data, in_size, channel, 0, 0);
+        return;
+    }
+
+    typedef typename Accumulator<TYPE>::type ACCUM;
+    const uint32_t t_in_area  = (uint32_t)in_size*in_size;
+    const uint32_t t_out_area = (uint32_t)out_size*out_size;
+    std::vector<uint16_t> t_lo, t_hi;
+    Pooling2dAdaptiveWindows(t_lo, t_hi, out_size, in_size);
+    int32_t ch; // signed for OpenMP
+
+    #if defined(_OPENMP)
+    #pragma omp parallel for
+    #endif
+    for (ch=0; ch<(int32_t)channel; ++ch) {
+        std::vector<ACCUM> t_row(in_size);
+        const TYPE *pX = in_data+(uint32_t)ch*t_in_area;
+        TYPE *pZ = out_data+(uint32_t)ch*t_out_area;
+        for (uint16_t g=0; g<out_size; ++g) {
+            const TYPE *pXr = pX+(uint32_t)t_lo[g]*in_size;
+            for (uint16_t j=0; j<in_size; ++j) t_row[j] = (ACCUM)pXr[j];
+            for (uint16_t i=t_lo[g]+1; i<t_hi[g]; ++i) {
+                pXr = pX+(uint32_t)i*in_size;
+                for (uint16_t j=0; j<in_size; ++j) t_row[j] += (ACCUM)pXr[j];
+            }
+            const uint32_t t_rows = t_hi[g]-t_lo[g];
+            TYPE *pZg = pZ+(uint32_t)g*out_size;
+            for (uint16_t k=0; k<out_size; ++k) {
+                const uint32_t t_cols = t_hi[k]-t_lo[k];
+                ACCUM t_sum=0;
+                if (!SimdSum(&t_sum, &t_row[t_lo[k]], t_cols)) {
+                    for (uint16_t j=t_lo[k]; j<t_hi[k]; ++j) t_sum += t_row[j];
+                }
+                pZg[k] = (TYPE)(t_sum/(ACCUM)(t_rows*t_cols));
+            }
+        }
+    }
+}
+
+// Max over windows of Pooling2dAdaptiveWindows() as 'torch.nn.AdaptiveMaxPool2d',
+// where rows of a window row are reduced into a row by SimdMax() once
+// and then each window is a single max of the row.
+// - 'out_size' of 1 goes Pooling2dGlobalMax()
+template<class TYPE=float>
+void Pooling2dAdaptiveMax
+(           TYPE     *out_data    // channel x out_size x out_size
+    , const TYPE     *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const int       rigor=0     // check rigorously when 1
+    , const int       verbose=0
+)
+{
+    if (verbose) {
+        dlrInfo("out_size   =%d\n", out_size);
+        dlrInfo("in_size    =%d\n", in_size );
+        dlrInfo("channel    =%d\n", channel );
+        fflush(stderr); fflush(stdout);
+    }
+    if (rigor) {
+        dlrCheck (out_size>0);
+        dlrCheck (in_size>0);
+    }
+    if (out_size==1) {
+        Pooling2dGlobalMax<TYPE>(out_data, in_data, in_size, channel, 0, 0);
+        return;
+    }
+
+    const uint32_t t_in_area  = (uint32_t)in_size*in_size;
+    const uint32_t t_out_area = (uint32_t)out_size*out_size;
+    std::vector<uint16_t> t_lo, t_hi;
+    Pooling2dAdaptiveWindows(t_lo, t_hi, out_size, in_size);
+    int32_t ch; // signed for OpenMP
+
+    #if defined(_OPENMP)
+    #pragma omp parallel for
+    #endif
+    for (ch=0; ch<(int32_t)channel; ++ch) {
+        std::vector<TYPE> t_row(in_size);
+        const TYPE *pX = in_data+(uint32_t)ch*t_in_area;
+        TYPE *pZ = out_data+(uint32_t)ch*t_out_area;
+        for (uint16_t g=0; g<out_size; ++g) {
+            const TYPE *pXr = pX+(uint32_t)t_lo[g]*in_size;
+            for (uint16_t j=0; j<in_size; ++j) t_row[j] = pXr[j];
+            for (uint16_t i=t_lo[g]+1; i<t_hi[g]; ++i) {
+                SimdMax(&t_row[0], &t_row[0], pX+(uint32_t)i*in_size, in_size);
+            }
+            TYPE *pZg = pZ+(uint32_t)g*out_size;
+            for (uint16_t k=0; k<out_size; ++k) {
+                pZg[k] = SimdReduceMax(&t_row[t_lo[k]], t_hi[k]-t_lo[k]);
+            }
+        }
+    }
+}
+
+// minibatch version: in_data and out_data have leading minibatch dimension
+template<class TYPE=float>
+void Pooling2dGlobalAvgBatch
+(           TYPE     *out_data    // minibatch x channel
+    , const TYPE     *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor=0     // check rigorously when 1
+    , const int       verbose=0   // verbose level
+)
+{
+    const uint32_t t_in_step =(uint32_t)channel*in_size*in_size;
+    for (uint16_t mb=0; mb<minibatch; ++mb) {
+        Pooling2dGlobalAvg<TYPE>(out_data+(uint32_t)mb*channel, in_data+mb*t_in_step
+                                , in_size, channel, rigor, verbose);
+    }
+}
+
+// minibatch version: in_data and out_data have leading minibatch dimension
+template<class TYPE=float>
+void Pooling2dGlobalMaxBatch
+(           TYPE     *out_data    // minibatch x channel
+    , const TYPE     *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor=0     // check rigorously when 1
+    , const int       verbose=0   // verbose level
+)
+{
+    const uint32_t t_in_step =(uint32_t)channel*in_size*in_size;
+    for (uint16_t mb=0; mb<minibatch; ++mb) {
+        Pooling2dGlobalMax<TYPE>(out_data+(uint32_t)mb*channel, in_data+mb*t_in_step
+                                , in_size, channel, rigor, verbose);
+    }
+}
+
+// minibatch version: in_data and out_data have leading minibatch dimension
+template<class TYPE=float>
+void Pooling2dAdaptiveAvgBatch
+(           TYPE     *out_data    // minibatch x channel x out_size x out_size
+    , const TYPE     *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor=0     // check rigorously when 1
+    , const int       verbose=0   // verbose level
+)
+{
+    const uint32_t t_out_step=(uint32_t)channel*out_size*out_size;
+    const uint32_t t_in_step =(uint32_t)channel*in_size*in_size;
+    for (uint16_t mb=0; mb<minibatch; ++mb) {
+        Pooling2dAdaptiveAvg<TYPE>(out_data+mb*t_out_step, in_data+mb*t_in_step
+                                  , out_size, in_size, channel, rigor, verbose);
+    }
+}
+
+// minibatch version: in_data and out_data have leading minibatch dimension
+template<class TYPE=float>
+void Pooling2dAdaptiveMaxBatch
+(           TYPE     *out_data    // minibatch x channel x out_size x out_size
+    , const TYPE     *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const int       rigor=0     // check rigorously when 1
+    , const int       verbose=0   // verbose level
+)
+{
+    const uint32_t t_out_step=(uint32_t)channel*out_size*out_size;
+    const uint32_t t_in_step =(uint32_t)channel*in_size*in_size;
+    for (uint16_t mb=0; mb<minibatch; ++mb) {
+        Pooling2dAdaptiveMax<TYPE>(out_data+mb*t_out_step, in_data+mb*t_in_step
+                                  , out_size, in_size, channel, rigor, verbose);
+    }
+}
+
+} // namespace dlr
+#endif // !defined(__SYNTHESIS__)
+/*
+ * Revision history
+ *
+ * 2026.10.18: Started.
+ */
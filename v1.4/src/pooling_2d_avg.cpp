@@ -1,8 +1,10 @@
 #include "pooling_2d_avg.hpp"
+#include "dlr_fixed.hpp"
+#include "dlr_half.hpp"
 
 extern "C" {
 
-void Pooling2dAvgInt
+int Pooling2dAvgInt
 (           int      *out_data    // out_channel x out_size x out_size
     , const int      *in_data     // in_channel x in_size x in_size
     , const uint16_t  out_size    // only for square matrix
@@ -18,6 +20,7 @@ void Pooling2dAvgInt
     #endif
     )
 {
+    dlrClearLastError();
     dlr::Pooling2dAvg<int> ( out_data
                 , in_data
                 , out_size
@@ -32,9 +35,10 @@ void Pooling2dAvgInt
                 , verbose
                 #endif
                 );
+    return dlrGetLastStatus();
 }
 
-void Pooling2dAvgFloat
+int Pooling2dAvgFloat
 (           float    *out_data    // out_channel x out_size x out_size
     , const float    *in_data     // in_channel x in_size x in_size
     , const uint16_t  out_size    // only for square matrix
@@ -50,6 +54,7 @@ void Pooling2dAvgFloat
     #endif
     )
 {
+    dlrClearLastError();
     dlr::Pooling2dAvg<float> ( out_data
                 , in_data
                 , out_size
@@ -64,9 +69,10 @@ void Pooling2dAvgFloat
                 , verbose
                 #endif
                 );
+    return dlrGetLastStatus();
 }
 
-void Pooling2dAvgDouble
+int Pooling2dAvgDouble
 (           double   *out_data    // out_channel x out_size x out_size
     , const double   *in_data     // in_channel x in_size x in_size
     , const uint16_t  out_size    // only for square matrix
@@ -82,6 +88,7 @@ void Pooling2dAvgDouble
     #endif
     )
 {
+    dlrClearLastError();
     dlr::Pooling2dAvg<double> ( out_data
                 , in_data
                 , out_size
@@ -96,6 +103,658 @@ void Pooling2dAvgDouble
                 , verbose
                 #endif
                 );
+    return dlrGetLastStatus();
 }
 
+int Pooling2dAvgBatchInt
+(           int      *out_data    // minibatch x channel x out_size x out_size
+    , const int      *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAvgBatch<int>
+    (     out_data
+        , in_data
+        , out_size
+        , in_size
+        , kernel_size
+        , channel
+        , minibatch
+        , stride
+        , padding
+        , ceil_mode
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAvgBatchFloat
+(           float    *out_data    // minibatch x channel x out_size x out_size
+    , const float    *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAvgBatch<float>
+    (     out_data
+        , in_data
+        , out_size
+        , in_size
+        , kernel_size
+        , channel
+        , minibatch
+        , stride
+        , padding
+        , ceil_mode
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAvgBatchDouble
+(           double   *out_data    // minibatch x channel x out_size x out_size
+    , const double   *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAvgBatch<double>
+    (     out_data
+        , in_data
+        , out_size
+        , in_size
+        , kernel_size
+        , channel
+        , minibatch
+        , stride
+        , padding
+        , ceil_mode
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+#if !defined(__SYNTHESIS__)
+// fixed-point of dlr_fixed.hpp, whose data are raw bits (see dlrSetFixedFormat())
+int Pooling2dAvgFixed
+(           int32_t  *out_data    // out_channel x out_size x out_size
+    , const int32_t  *in_data     // in_channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    , const int       rigor // check rigorously when 1
+    , const int       verbose
+    )
+{
+    dlrClearLastError();
+    dlr::Pooling2dAvg<dlr::Fixed> ( (dlr::Fixed*)out_data
+                , (const dlr::Fixed*)in_data
+                , out_size
+                , in_size
+                , kernel_size
+                , channel
+                , stride
+                , padding
+                , ceil_mode
+                , rigor
+                , verbose
+                );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAvgBatchFixed
+(           int32_t  *out_data    // minibatch x channel x out_size x out_size
+    , const int32_t  *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAvgBatch<dlr::Fixed>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , out_size
+        , in_size
+        , kernel_size
+        , channel
+        , minibatch
+        , stride
+        , padding
+        , ceil_mode
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+#endif
+
+#if !defined(__SYNTHESIS__)
+// IEEE 754 binary16 (fp16) storage computed in float (see dlr_half.hpp)
+int Pooling2dAvgHalf
+(           uint16_t *out_data    // out_channel x out_size x out_size
+    , const uint16_t *in_data     // in_channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    , const int       rigor // check rigorously when 1
+    , const int       verbose
+    )
+{
+    dlrClearLastError();
+    dlr::Pooling2dAvg<dlr::Half> ( (dlr::Half*)out_data
+                , (const dlr::Half*)in_data
+                , out_size
+                , in_size
+                , kernel_size
+                , channel
+                , stride
+                , padding
+                , ceil_mode
+                , rigor
+                , verbose
+                );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAvgBatchHalf
+(           uint16_t *out_data    // minibatch x channel x out_size x out_size
+    , const uint16_t *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAvgBatch<dlr::Half>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , out_size
+        , in_size
+        , kernel_size
+        , channel
+        , minibatch
+        , stride
+        , padding
+        , ceil_mode
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+// bfloat16 (bf16) storage computed in float (see dlr_half.hpp)
+int Pooling2dAvgBFloat16
+(           uint16_t *out_data    // out_channel x out_size x out_size
+    , const uint16_t *in_data     // in_channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    , const int       rigor // check rigorously when 1
+    , const int       verbose
+    )
+{
+    dlrClearLastError();
+    dlr::Pooling2dAvg<dlr::BFloat16> ( (dlr::BFloat16*)out_data
+                , (const dlr::BFloat16*)in_data
+                , out_size
+                , in_size
+                , kernel_size
+                , channel
+                , stride
+                , padding
+                , ceil_mode
+                , rigor
+                , verbose
+                );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAvgBatchBFloat16
+(           uint16_t *out_data    // minibatch x channel x out_size x out_size
+    , const uint16_t *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAvgBatch<dlr::BFloat16>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , out_size
+        , in_size
+        , kernel_size
+        , channel
+        , minibatch
+        , stride
+        , padding
+        , ceil_mode
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+#endif
+
+#if !defined(__SYNTHESIS__)
+// summed-area table of cost per output independent of kernel_size,
+// where 'count_include_pad' and 'ceil_mode' go as 'torch.nn.functional.avg_pool2d()'
+int Pooling2dAvgIntIntegral
+(           int      *out_data    // channel x out_size x out_size
+    , const int      *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       count_include_pad // 1 to count padding for the divisor
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAvgIntegral<int>
+    (     out_data
+        , in_data
+        , out_size
+        , in_size
+        , kernel_size
+        , channel
+        , stride
+        , padding
+        , ceil_mode
+        , count_include_pad
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAvgBatchIntIntegral
+(           int      *out_data    // minibatch x channel x out_size x out_size
+    , const int      *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       count_include_pad // 1 to count padding for the divisor
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAvgBatchIntegral<int>
+    (     out_data
+        , in_data
+        , out_size
+        , in_size
+        , kernel_size
+        , channel
+        , minibatch
+        , stride
+        , padding
+        , ceil_mode
+        , count_include_pad
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAvgFloatIntegral
+(           float    *out_data    // channel x out_size x out_size
+    , const float    *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       count_include_pad // 1 to count padding for the divisor
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAvgIntegral<float>
+    (     out_data
+        , in_data
+        , out_size
+        , in_size
+        , kernel_size
+        , channel
+        , stride
+        , padding
+        , ceil_mode
+        , count_include_pad
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAvgBatchFloatIntegral
+(           float    *out_data    // minibatch x channel x out_size x out_size
+    , const float    *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       count_include_pad // 1 to count padding for the divisor
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAvgBatchIntegral<float>
+    (     out_data
+        , in_data
+        , out_size
+        , in_size
+        , kernel_size
+        , channel
+        , minibatch
+        , stride
+        , padding
+        , ceil_mode
+        , count_include_pad
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAvgDoubleIntegral
+(           double   *out_data    // channel x out_size x out_size
+    , const double   *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       count_include_pad // 1 to count padding for the divisor
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAvgIntegral<double>
+    (     out_data
+        , in_data
+        , out_size
+        , in_size
+        , kernel_size
+        , channel
+        , stride
+        , padding
+        , ceil_mode
+        , count_include_pad
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAvgBatchDoubleIntegral
+(           double   *out_data    // minibatch x channel x out_size x out_size
+    , const double   *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       count_include_pad // 1 to count padding for the divisor
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAvgBatchIntegral<double>
+    (     out_data
+        , in_data
+        , out_size
+        , in_size
+        , kernel_size
+        , channel
+        , minibatch
+        , stride
+        , padding
+        , ceil_mode
+        , count_include_pad
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAvgHalfIntegral
+(           uint16_t *out_data    // channel x out_size x out_size
+    , const uint16_t *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       count_include_pad // 1 to count padding for the divisor
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAvgIntegral<dlr::Half>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , out_size
+        , in_size
+        , kernel_size
+        , channel
+        , stride
+        , padding
+        , ceil_mode
+        , count_include_pad
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAvgBatchHalfIntegral
+(           uint16_t *out_data    // minibatch x channel x out_size x out_size
+    , const uint16_t *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       count_include_pad // 1 to count padding for the divisor
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAvgBatchIntegral<dlr::Half>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , out_size
+        , in_size
+        , kernel_size
+        , channel
+        , minibatch
+        , stride
+        , padding
+        , ceil_mode
+        , count_include_pad
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAvgBFloat16Integral
+(           uint16_t *out_data    // channel x out_size x out_size
+    , const uint16_t *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       count_include_pad // 1 to count padding for the divisor
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAvgIntegral<dlr::BFloat16>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , out_size
+        , in_size
+        , kernel_size
+        , channel
+        , stride
+        , padding
+        , ceil_mode
+        , count_include_pad
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dAvgBatchBFloat16Integral
+(           uint16_t *out_data    // minibatch x channel x out_size x out_size
+    , const uint16_t *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       count_include_pad // 1 to count padding for the divisor
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dAvgBatchIntegral<dlr::BFloat16>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , out_size
+        , in_size
+        , kernel_size
+        , channel
+        , minibatch
+        , stride
+        , padding
+        , ceil_mode
+        , count_include_pad
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+#endif
+
 } // extern "C"
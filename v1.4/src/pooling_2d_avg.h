@@ -6,8 +6,9 @@ extern "C" {
 #endif
 
 #define Pooling2dAvg Pooling2dAvgFloat
+#define Pooling2dAvgBatch Pooling2dAvgBatchFloat
 
-extern void Pooling2dAvgInt
+extern int Pooling2dAvgInt
 (           int      *out_data    // out_channel x out_size x out_size
     , const int      *in_data     // in_channel x in_size x in_size
     , const uint16_t  out_size    // only for square matrix
@@ -23,7 +24,7 @@ extern void Pooling2dAvgInt
     #endif
 );
 
-extern void Pooling2dAvgFloat
+extern int Pooling2dAvgFloat
 (           float    *out_data    // out_channel x out_size x out_size   
     , const float    *in_data     // in_channel x in_size x in_size
     , const uint16_t  out_size    // only for square matrix
@@ -39,7 +40,7 @@ extern void Pooling2dAvgFloat
     #endif
 );
 
-extern void Pooling2dAvgDouble
+extern int Pooling2dAvgDouble
 (           double   *out_data    // out_channel x out_size x out_size
     , const double   *in_data     // in_channel x in_size x in_size
     , const uint16_t  out_size    // only for square matrix
@@ -55,6 +56,310 @@ extern void Pooling2dAvgDouble
     #endif
 );
 
+extern int Pooling2dAvgBatchInt
+(           int      *out_data    // minibatch x channel x out_size x out_size
+    , const int      *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+extern int Pooling2dAvgBatchFloat
+(           float    *out_data    // minibatch x channel x out_size x out_size
+    , const float    *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+extern int Pooling2dAvgBatchDouble
+(           double   *out_data    // minibatch x channel x out_size x out_size
+    , const double   *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+#if !defined(__SYNTHESIS__)
+// fixed-point of raw bits in the format of dlrSetFixedFormat()
+extern int Pooling2dAvgFixed
+(           int32_t  *out_data    // out_channel x out_size x out_size
+    , const int32_t  *in_data     // in_channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       rigor // check rigorously when 1
+    , const int       verbose
+);
+
+extern int Pooling2dAvgBatchFixed
+(           int32_t  *out_data    // minibatch x channel x out_size x out_size
+    , const int32_t  *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+#endif
+
+#if !defined(__SYNTHESIS__)
+// IEEE 754 binary16 (fp16) storage of uint16_t bits computed in float
+extern int Pooling2dAvgHalf
+(           uint16_t *out_data    // out_channel x out_size x out_size
+    , const uint16_t *in_data     // in_channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       rigor // check rigorously when 1
+    , const int       verbose
+);
+
+extern int Pooling2dAvgBatchHalf
+(           uint16_t *out_data    // minibatch x channel x out_size x out_size
+    , const uint16_t *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+// bfloat16 (bf16) storage of uint16_t bits computed in float
+extern int Pooling2dAvgBFloat16
+(           uint16_t *out_data    // out_channel x out_size x out_size
+    , const uint16_t *in_data     // in_channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       rigor // check rigorously when 1
+    , const int       verbose
+);
+
+extern int Pooling2dAvgBatchBFloat16
+(           uint16_t *out_data    // minibatch x channel x out_size x out_size
+    , const uint16_t *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+#endif
+
+#if !defined(__SYNTHESIS__)
+// summed-area table of cost per output independent of kernel_size,
+// where 'count_include_pad' and 'ceil_mode' go as 'torch.nn.functional.avg_pool2d()'
+extern int Pooling2dAvgIntIntegral
+(           int      *out_data    // channel x out_size x out_size
+    , const int      *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       count_include_pad // 1 to count padding for the divisor
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+extern int Pooling2dAvgBatchIntIntegral
+(           int      *out_data    // minibatch x channel x out_size x out_size
+    , const int      *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       count_include_pad // 1 to count padding for the divisor
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+extern int Pooling2dAvgFloatIntegral
+(           float    *out_data    // channel x out_size x out_size
+    , const float    *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       count_include_pad // 1 to count padding for the divisor
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+extern int Pooling2dAvgBatchFloatIntegral
+(           float    *out_data    // minibatch x channel x out_size x out_size
+    , const float    *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       count_include_pad // 1 to count padding for the divisor
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+extern int Pooling2dAvgDoubleIntegral
+(           double   *out_data    // channel x out_size x out_size
+    , const double   *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       count_include_pad // 1 to count padding for the divisor
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+extern int Pooling2dAvgBatchDoubleIntegral
+(           double   *out_data    // minibatch x channel x out_size x out_size
+    , const double   *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       count_include_pad // 1 to count padding for the divisor
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+extern int Pooling2dAvgHalfIntegral
+(           uint16_t *out_data    // channel x out_size x out_size
+    , const uint16_t *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       count_include_pad // 1 to count padding for the divisor
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+extern int Pooling2dAvgBatchHalfIntegral
+(           uint16_t *out_data    // minibatch x channel x out_size x out_size
+    , const uint16_t *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       count_include_pad // 1 to count padding for the divisor
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+extern int Pooling2dAvgBFloat16Integral
+(           uint16_t *out_data    // channel x out_size x out_size
+    , const uint16_t *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       count_include_pad // 1 to count padding for the divisor
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+extern int Pooling2dAvgBatchBFloat16Integral
+(           uint16_t *out_data    // minibatch x channel x out_size x out_size
+    , const uint16_t *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       count_include_pad // 1 to count padding for the divisor
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+#endif
+
 #ifdef __cplusplus
 }
 #endif
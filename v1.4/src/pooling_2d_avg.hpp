@@ -13,13 +13,142 @@
 #include <math.h>
 #if !defined(__SYNTHESIS__)
 #include <stdio.h>
-#include <assert.h>
 #include <typeinfo>
+#include <type_traits>
+#include <vector>
 #include "dlr_common.h"
+#include "dlr_half.hpp"
+#endif
+
+// kernel_size from which summed-area table is taken (software-only)
+#if !defined(DLR_POOLING_INTEGRAL)
+#define DLR_POOLING_INTEGRAL 3
 #endif
 
 namespace dlr { // deep learning routines
 
+#if !defined(__SYNTHESIS__)
+// Returns sum of a window at (y0,x0) of input,
+// where the window is clipped to input, i.e., padding is skipped.
+template<class TYPE=float>
+inline typename Accumulator<TYPE>::type Pooling2dAvgWindow
+(     const TYPE     *in_data     // in_size x in_size of a channel
+    , const int32_t   y0          // top row of the window, negative in padding
+    , const int32_t   x0          // left column of the window, negative in padding
+    , const uint16_t  in_size
+    , const uint8_t   kernel_size
+)
+{
+    const int32_t i0 = (y0<0) ? -y0 : 0;
+    const int32_t j0 = (x0<0) ? -x0 : 0;
+    const int32_t i1 = ((y0+kernel_size)>in_size) ? in_size-y0 : kernel_size;
+    const int32_t j1 = ((x0+kernel_size)>in_size) ? in_size-x0 : kernel_size;
+    typename Accumulator<TYPE>::type sum=0;
+    for (int32_t i=i0; i<i1; ++i) {
+        for (int32_t j=j0; j<j1; ++j) {
+            sum += in_data[(y0+i)*in_size+(x0+j)];
+        }
+    }
+    return sum;
+}
+
+// Average pooling of summed-area table (integral image), where the sum of
+// any window is four entries of the table, i.e., cost per output does not
+// grow with the kernel. The table goes int64_t for integer and double for
+// the others so that the sum is exact or rounded once when divided.
+// - windows are clipped to input, i.e., padding is skipped for the sum
+// - 'count_include_pad' of 1 counts padding for the divisor but not beyond,
+//   i.e., windows of 'ceil_mode' going over padding are cut as
+//   'torch.nn.functional.avg_pool2d()', while 0 counts input only
+// - 'out_size' of 'ceil_mode' is given by caller and any window should
+//   start in input or left padding
+template<class TYPE=float>
+void Pooling2dAvgIntegral
+(           TYPE     *out_data    // channel x out_size x out_size
+    , const TYPE     *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint8_t   stride
+    , const uint8_t   padding=0
+    , const int       ceil_mode=0
+    , const int       count_include_pad=1
+    , const int       rigor=0 // check rigorously when 1
+    , const int       verbose=0
+)
+{
+    if (verbose) {
+        dlrInfo("out_size   =%d\n", out_size    );
+        dlrInfo("in_size    =%d\n", in_size     );
+        dlrInfo("kernel_size=%d\n", kernel_size );
+        dlrInfo("channel    =%d\n", channel     );
+        dlrInfo("stride     =%d\n", stride      );
+        dlrInfo("padding    =%d\n", padding     );
+        dlrInfo("ceil       =%d\n", ceil_mode   );
+        dlrInfo("count_pad  =%d\n", count_include_pad);
+        fflush(stderr); fflush(stdout);
+    }
+    if (rigor) {
+        const int32_t t_span = (int32_t)in_size+2*padding-kernel_size;
+        int32_t expect = (t_span<0) ? 0 : (ceil_mode) ? (t_span+stride-1)/stride+1 : t_span/stride+1;
+        if (ceil_mode&&(expect>0)&&((int32_t)(expect-1)*stride>=((int32_t)in_size+padding))) expect--;
+        if (out_size!=expect) dlrWarn("out_size mis-match: %u, but %d expected\n", out_size, expect);
+        dlrCheck (kernel_size>0);
+        dlrCheck (stride>0);
+        dlrCheck (padding<=(kernel_size/2));
+        dlrCheck (((int32_t)(out_size-1)*stride)<((int32_t)in_size+padding));
+    }
+
+    typedef typename std::conditional<std::is_integral<TYPE>::value, int64_t, double>::type SUM;
+    const uint32_t t_in_area  = (uint32_t)in_size*in_size;
+    const uint32_t t_out_area = (uint32_t)out_size*out_size;
+    const uint32_t t_ld       = (uint32_t)in_size+1; // leading row and column of zero
+
+    // window of each output row or column, which is the same for both
+    std::vector<uint16_t> t_lo(out_size), t_hi(out_size), t_count(out_size);
+    for (uint16_t k=0; k<out_size; ++k) {
+        const int32_t x0 = (int32_t)k*stride-padding;
+        const int32_t x1 = x0+kernel_size;
+        const int32_t e  = (x1>(int32_t)(in_size+padding)) ? in_size+padding : x1; // end of padding
+        t_lo[k] = (x0<0) ? 0 : x0;
+        t_hi[k] = (x1>(int32_t)in_size) ? in_size : x1;
+        if (t_hi[k]<t_lo[k]) t_hi[k] = t_lo[k];
+        t_count[k] = (count_include_pad) ? e-x0 : t_hi[k]-t_lo[k];
+    }
+    int32_t ch; // signed for OpenMP
+
+    #if defined(_OPENMP)
+    #pragma omp parallel for
+    #endif
+    for (ch=0; ch<(int32_t)channel; ++ch) {
+        std::vector<SUM> t_table(t_ld*t_ld, (SUM)0);
+        const TYPE *pX = in_data+(uint32_t)ch*t_in_area;
+        TYPE *pZ = out_data+(uint32_t)ch*t_out_area;
+        for (uint16_t i=0; i<in_size; ++i) {
+            SUM *pT = &t_table[(uint32_t)(i+1)*t_ld+1];
+            const SUM *pU = pT-t_ld; // the row above
+            const TYPE *pXr = pX+(uint32_t)i*in_size;
+            SUM t_row = 0;
+            for (uint16_t j=0; j<in_size; ++j) {
+                t_row += (SUM)pXr[j];
+                pT[j] = pU[j]+t_row;
+            }
+        }
+        for (uint16_t g=0; g<out_size; ++g) {
+            const SUM *pT0 = &t_table[(uint32_t)t_lo[g]*t_ld];
+            const SUM *pT1 = &t_table[(uint32_t)t_hi[g]*t_ld];
+            TYPE *pZg = pZ+(uint32_t)g*out_size;
+            for (uint16_t k=0; k<out_size; ++k) {
+                const SUM t_sum = pT1[t_hi[k]]-pT1[t_lo[k]]-pT0[t_hi[k]]+pT0[t_lo[k]];
+                const SUM t_div = (SUM)t_count[g]*t_count[k];
+                pZg[k] = (t_div==0) ? (TYPE)0 : (TYPE)(t_sum/t_div);
+            }
+        }
+    }
+}
+#endif
+
 template<class TYPE=float>
 void Pooling2dAvg
 (           TYPE    *out_data    // out_channel x out_size x out_size
@@ -56,15 +185,16 @@ void Pooling2dAvg
         uint16_t expect=(ceil_mode) ? (int)ceil(((in_size-kernel_size+(2*padding))/stride)+1+in_size%kernel_size)
                                     : (int)floor(((in_size-kernel_size+(2*padding))/stride)+1);
         if (out_size!=expect) dlrWarn("out_size mis-match: %u, but %u expected\n", out_size, expect);
-        assert ((kernel_size%2)==0);
-        assert (stride>0);
-        assert (padding>=0);
-        assert (padding<=(kernel_size/2));
+        dlrCheck ((kernel_size%2)==0);
+        dlrCheck (stride>0);
+        dlrCheck (padding>=0);
+        dlrCheck (padding<=(kernel_size/2));
     }
     #undef QuoteMacro
     #undef QuoteIdent
     #endif
 
+    #if defined(__SYNTHESIS__)
     #define UpperPadding(CURSOR, PADDING)          (CURSOR <   PADDING)
     #define LowerPadding(CURSOR, PADDING, IN_SIZE) (CURSOR >= (PADDING+IN_SIZE))
     #define LeftPadding( CURSOR, PADDING)          (CURSOR <   PADDING)
@@ -115,13 +245,157 @@ void Pooling2dAvg
     #undef LeftPadding
     #undef RightPadding
     #undef IsPadding
+    #else // !defined(__SYNTHESIS__)
+    // Only the border ring of outputs touches padding. The window of outputs
+    // in rows and columns of [t_lo, t_hi) lies inside of input and goes over
+    // contiguous input rows without checking padding, while the window of
+    // the others is clipped to input by Pooling2dAvgWindow().
+    // Note that the divisor is always kernel_size*kernel_size (padding counted).
+    const uint32_t t_in_area  = (uint32_t)in_size*in_size;
+    const uint32_t t_out_area = (uint32_t)out_size*out_size;
+    uint16_t t_hi = ((in_size+padding)>=kernel_size) ? (in_size+padding-kernel_size)/stride+1 : 0;
+    if (t_hi>out_size) t_hi = out_size;
+    uint16_t t_lo = (padding+stride-1)/stride;
+    if (t_lo>t_hi) t_lo = t_hi;
+    typedef typename Accumulator<TYPE>::type ACCUM; // float for 'Half' and 'BFloat16'
+    const ACCUM t_div = (ACCUM)(kernel_size*kernel_size);
+    if (std::is_arithmetic<TYPE>::value&&(kernel_size>=DLR_POOLING_INTEGRAL)
+        &&(((uint32_t)(out_size-1)*stride+kernel_size)<=((uint32_t)in_size+2*padding))) {
+        // no window goes over padding, i.e., the divisor is kernel_size*kernel_size
+        Pooling2dAvgIntegral<TYPE>(out_data, in_data, out_size, in_size, kernel_size
+                                  , channel, stride, padding, ceil_mode, 1, 0, 0);
+        return;
+    }
+
+    uint16_t ch, g, k;
+    uint8_t  i, j;
+
+    #if defined(_OPENMP)
+    #pragma omp parallel for private(g, k, i, j)
+    #endif
+    for (ch=0; ch<channel; ++ch) {
+        const TYPE *pX = in_data+(uint32_t)ch*t_in_area;
+        TYPE *pZ = out_data+(uint32_t)ch*t_out_area;
+        for (g=0; g<out_size; ++g) {
+            const int32_t y0 = (int32_t)g*stride-padding;
+            TYPE *pZg = pZ+(uint32_t)g*out_size;
+            if ((g<t_lo)||(g>=t_hi)) { // border row
+                for (k=0; k<out_size; ++k)
+                    pZg[k] = Pooling2dAvgWindow<TYPE>(pX, y0, (int32_t)k*stride-padding, in_size, kernel_size)/t_div;
+                continue;
+            }
+            for (k=0; k<t_lo; ++k) // left border
+                pZg[k] = Pooling2dAvgWindow<TYPE>(pX, y0, (int32_t)k*stride-padding, in_size, kernel_size)/t_div;
+            for (k=t_lo; k<t_hi; ++k) { // interior
+                const TYPE *pXw = pX+(uint32_t)y0*in_size+((uint32_t)k*stride-padding);
+                ACCUM avg=0;
+                for (i=0; i<kernel_size; ++i) {
+                    for (j=0; j<kernel_size; ++j) {
+                        avg += pXw[j];
+                    }
+                    pXw += in_size;
+                }
+                pZg[k] = avg/t_div;
+            }
+            for (k=t_hi; k<out_size; ++k) // right border
+                pZg[k] = Pooling2dAvgWindow<TYPE>(pX, y0, (int32_t)k*stride-padding, in_size, kernel_size)/t_div;
+        } // for (g=0
+    } // for (ch=0
+    #endif // !defined(__SYNTHESIS__)
+}
+
+// minibatch version: in_data and out_data have leading minibatch dimension
+template<class TYPE=float>
+void Pooling2dAvgBatch
+(           TYPE     *out_data    // minibatch x channel x out_size x out_size
+    , const TYPE     *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding=0
+    , const int       ceil_mode=0 // not implemented yet
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+    #endif
+)
+{
+    const uint32_t t_out_step=(uint32_t)channel*out_size*out_size;
+    const uint32_t t_in_step =(uint32_t)channel*in_size*in_size;
+    TYPE       *pZ = out_data;
+    const TYPE *pX = in_data;
+    uint16_t mb;
+
+    for (mb=0; mb<minibatch; ++mb) {
+        Pooling2dAvg<TYPE>
+        (     pZ
+            , pX
+            , out_size
+            , in_size
+            , kernel_size
+            , channel
+            , stride
+            , padding
+            , ceil_mode
+            #if !defined(__SYNTHESIS__)
+            , rigor
+            , verbose
+            #endif
+        );
+        pZ += t_out_step;
+        pX += t_in_step;
+    }
+}
+
+#if !defined(__SYNTHESIS__)
+// minibatch version: in_data and out_data have leading minibatch dimension
+template<class TYPE=float>
+void Pooling2dAvgBatchIntegral
+(           TYPE     *out_data    // minibatch x channel x out_size x out_size
+    , const TYPE     *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding=0
+    , const int       ceil_mode=0
+    , const int       count_include_pad=1
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+)
+{
+    const uint32_t t_out_step=(uint32_t)channel*out_size*out_size;
+    const uint32_t t_in_step =(uint32_t)channel*in_size*in_size;
+    TYPE       *pZ = out_data;
+    const TYPE *pX = in_data;
+    uint16_t mb;
+
+    for (mb=0; mb<minibatch; ++mb) {
+        Pooling2dAvgIntegral<TYPE>(pZ, pX, out_size, in_size, kernel_size, channel
+                                  , stride, padding, ceil_mode, count_include_pad
+                                  , rigor, verbose);
+        pZ += t_out_step;
+        pX += t_in_step;
+    }
 }
+#endif // !defined(__SYNTHESIS__)
 
 } // namespace dlr
 
 /*
  * Revision history
  *
+ * 2026.10.18: 'Pooling2dAvgIntegral' of summed-area table with 'count_include_pad', taken for large kernel_size.
+ * 2026.10.18: sum goes 'Accumulator<TYPE>', i.e., float for 'Half' and 'BFloat16'.
+ * 2026.10.18: interior and border of padding split (reference kept for __SYNTHESIS__).
+ * 2026.10.18: 'dlrCheck()' in place of 'assert()' for rigor checks.
+ * 2026.10.18: OpenMP for 'ch' loop when built with OpenMP.
+ * 2026.10.18: 'Pooling2dAvgBatch' added for minibatch.
  * 2020.09.20: parameter order of bias and bias_size changed.
  * 2020.08.31: Updated by participants of 2020 Summer Intern Program.
  *             - ChaeEon Lim; GeunSu Song; YoonSeong Lim;
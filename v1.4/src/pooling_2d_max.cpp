@@ -1,9 +1,11 @@
 
 #include "pooling_2d_max.hpp"
+#include "dlr_fixed.hpp"
+#include "dlr_half.hpp"
 
 extern "C" {
 
-void Pooling2dMaxInt
+int Pooling2dMaxInt
 (           int      *out_data    // out_channel x out_size x out_size
     , const int      *in_data     // in_channel x in_size x in_size
     , const uint16_t  out_size    // only for square matrix
@@ -19,6 +21,7 @@ void Pooling2dMaxInt
     #endif
     )
 {
+    dlrClearLastError();
     dlr::Pooling2dMax<int, 0, 0>( out_data
                 , in_data
                 , out_size
@@ -33,9 +36,10 @@ void Pooling2dMaxInt
                 , verbose
                 #endif
                 );
+    return dlrGetLastStatus();
 }
 
-void Pooling2dMaxFloat
+int Pooling2dMaxFloat
 (           float    *out_data    // out_channel x out_size x out_size
     , const float    *in_data     // in_channel x in_size x in_size
     , const uint16_t  out_size    // only for square matrix
@@ -51,6 +55,7 @@ void Pooling2dMaxFloat
     #endif
     )
 {
+    dlrClearLastError();
     dlr::Pooling2dMax<float, 0, 0>( out_data
                 , in_data
                 , out_size
@@ -65,9 +70,10 @@ void Pooling2dMaxFloat
                 , verbose
                 #endif
                 );
+    return dlrGetLastStatus();
 }
 
-void Pooling2dMaxDouble
+int Pooling2dMaxDouble
 (           double   *out_data    // out_channel x out_size x out_size
     , const double   *in_data     // in_channel x in_size x in_size
     , const uint16_t  out_size    // only for square matrix
@@ -83,6 +89,7 @@ void Pooling2dMaxDouble
     #endif
     )
 {
+    dlrClearLastError();
     dlr::Pooling2dMax<double, 0, 0>( out_data
                 , in_data
                 , out_size
@@ -97,9 +104,10 @@ void Pooling2dMaxDouble
                 , verbose
                 #endif
                 );
+    return dlrGetLastStatus();
 }
 
-void Pooling2dMaxIntReLu
+int Pooling2dMaxIntReLu
 (           int      *out_data    // out_channel x out_size x out_size
     , const int      *in_data     // in_channel x in_size x in_size
     , const uint16_t  out_size    // only for square matrix
@@ -115,6 +123,7 @@ void Pooling2dMaxIntReLu
     #endif
     )
 {
+    dlrClearLastError();
     dlr::Pooling2dMax<int, 1, 0>( out_data
                 , in_data
                 , out_size
@@ -129,9 +138,10 @@ void Pooling2dMaxIntReLu
                 , verbose
                 #endif
                 );
+    return dlrGetLastStatus();
 }
 
-void Pooling2dMaxFloatReLu
+int Pooling2dMaxFloatReLu
 (           float    *out_data    // out_channel x out_size x out_size
     , const float    *in_data     // in_channel x in_size x in_size
     , const uint16_t  out_size    // only for square matrix
@@ -147,6 +157,7 @@ void Pooling2dMaxFloatReLu
     #endif
     )
 {
+    dlrClearLastError();
     dlr::Pooling2dMax<float, 1, 0>( out_data
                 , in_data
                 , out_size
@@ -161,9 +172,10 @@ void Pooling2dMaxFloatReLu
                 , verbose
                 #endif
                 );
+    return dlrGetLastStatus();
 }
 
-void Pooling2dMaxDoubleReLu
+int Pooling2dMaxDoubleReLu
 (           double   *out_data    // out_channel x out_size x out_size
     , const double   *in_data     // in_channel x in_size x in_size
     , const uint16_t  out_size    // only for square matrix
@@ -179,6 +191,7 @@ void Pooling2dMaxDoubleReLu
     #endif
     )
 {
+    dlrClearLastError();
     dlr::Pooling2dMax<double, 1, 0>( out_data
                 , in_data
                 , out_size
@@ -193,6 +206,675 @@ void Pooling2dMaxDoubleReLu
                 , verbose
                 #endif
                 );
+    return dlrGetLastStatus();
 }
 
+int Pooling2dMaxBatchInt
+(           int      *out_data    // minibatch x channel x out_size x out_size
+    , const int      *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dMaxBatch<int>
+    (     out_data
+        , in_data
+        , out_size
+        , in_size
+        , kernel_size
+        , channel
+        , minibatch
+        , stride
+        , padding
+        , ceil_mode
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dMaxBatchFloat
+(           float    *out_data    // minibatch x channel x out_size x out_size
+    , const float    *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dMaxBatch<float>
+    (     out_data
+        , in_data
+        , out_size
+        , in_size
+        , kernel_size
+        , channel
+        , minibatch
+        , stride
+        , padding
+        , ceil_mode
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dMaxBatchDouble
+(           double   *out_data    // minibatch x channel x out_size x out_size
+    , const double   *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dMaxBatch<double>
+    (     out_data
+        , in_data
+        , out_size
+        , in_size
+        , kernel_size
+        , channel
+        , minibatch
+        , stride
+        , padding
+        , ceil_mode
+        #if !defined(__SYNTHESIS__)
+        , rigor
+        , verbose
+        #endif
+    );
+    return dlrGetLastStatus();
+}
+
+#if !defined(__SYNTHESIS__)
+int Pooling2dMaxInt8
+(           int8_t   *out_data    // channel x out_size x out_size
+    , const int8_t   *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       rigor // check rigorously when 1
+    , const int       verbose
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dMaxInt8 ( out_data
+                  , in_data
+                  , out_size
+                  , in_size
+                  , kernel_size
+                  , channel
+                  , stride
+                  , padding
+                  , ceil_mode
+                  , rigor
+                  , verbose
+                  );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dMaxBatchInt8
+(           int8_t   *out_data    // minibatch x channel x out_size x out_size
+    , const int8_t   *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dMaxBatchInt8 ( out_data
+                  , in_data
+                  , out_size
+                  , in_size
+                  , kernel_size
+                  , channel
+                  , minibatch
+                  , stride
+                  , padding
+                  , ceil_mode
+                  , rigor
+                  , verbose
+                  );
+    return dlrGetLastStatus();
+}
+#endif
+
+#if !defined(__SYNTHESIS__)
+// fixed-point of dlr_fixed.hpp, whose data are raw bits (see dlrSetFixedFormat())
+int Pooling2dMaxFixed
+(           int32_t  *out_data    // out_channel x out_size x out_size
+    , const int32_t  *in_data     // in_channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    , const int       rigor // check rigorously when 1
+    , const int       verbose
+    )
+{
+    dlrClearLastError();
+    dlr::Pooling2dMax<dlr::Fixed, 0, 0>( (dlr::Fixed*)out_data
+                , (const dlr::Fixed*)in_data
+                , out_size
+                , in_size
+                , kernel_size
+                , channel
+                , stride
+                , padding
+                , ceil_mode
+                , rigor
+                , verbose
+                );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dMaxFixedReLu
+(           int32_t  *out_data    // out_channel x out_size x out_size
+    , const int32_t  *in_data     // in_channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    , const int       rigor // check rigorously when 1
+    , const int       verbose
+    )
+{
+    dlrClearLastError();
+    dlr::Pooling2dMax<dlr::Fixed, 1, 0>( (dlr::Fixed*)out_data
+                , (const dlr::Fixed*)in_data
+                , out_size
+                , in_size
+                , kernel_size
+                , channel
+                , stride
+                , padding
+                , ceil_mode
+                , rigor
+                , verbose
+                );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dMaxBatchFixed
+(           int32_t  *out_data    // minibatch x channel x out_size x out_size
+    , const int32_t  *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dMaxBatch<dlr::Fixed>
+    (     (dlr::Fixed*)out_data
+        , (const dlr::Fixed*)in_data
+        , out_size
+        , in_size
+        , kernel_size
+        , channel
+        , minibatch
+        , stride
+        , padding
+        , ceil_mode
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+#endif
+
+#if !defined(__SYNTHESIS__)
+// IEEE 754 binary16 (fp16) storage computed in float (see dlr_half.hpp)
+int Pooling2dMaxHalf
+(           uint16_t *out_data    // out_channel x out_size x out_size
+    , const uint16_t *in_data     // in_channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    , const int       rigor // check rigorously when 1
+    , const int       verbose
+    )
+{
+    dlrClearLastError();
+    dlr::Pooling2dMax<dlr::Half, 0, 0>( (dlr::Half*)out_data
+                , (const dlr::Half*)in_data
+                , out_size
+                , in_size
+                , kernel_size
+                , channel
+                , stride
+                , padding
+                , ceil_mode
+                , rigor
+                , verbose
+                );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dMaxHalfReLu
+(           uint16_t *out_data    // out_channel x out_size x out_size
+    , const uint16_t *in_data     // in_channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    , const int       rigor // check rigorously when 1
+    , const int       verbose
+    )
+{
+    dlrClearLastError();
+    dlr::Pooling2dMax<dlr::Half, 1, 0>( (dlr::Half*)out_data
+                , (const dlr::Half*)in_data
+                , out_size
+                , in_size
+                , kernel_size
+                , channel
+                , stride
+                , padding
+                , ceil_mode
+                , rigor
+                , verbose
+                );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dMaxBatchHalf
+(           uint16_t *out_data    // minibatch x channel x out_size x out_size
+    , const uint16_t *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dMaxBatch<dlr::Half>
+    (     (dlr::Half*)out_data
+        , (const dlr::Half*)in_data
+        , out_size
+        , in_size
+        , kernel_size
+        , channel
+        , minibatch
+        , stride
+        , padding
+        , ceil_mode
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+// bfloat16 (bf16) storage computed in float (see dlr_half.hpp)
+int Pooling2dMaxBFloat16
+(           uint16_t *out_data    // out_channel x out_size x out_size
+    , const uint16_t *in_data     // in_channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    , const int       rigor // check rigorously when 1
+    , const int       verbose
+    )
+{
+    dlrClearLastError();
+    dlr::Pooling2dMax<dlr::BFloat16, 0, 0>( (dlr::BFloat16*)out_data
+                , (const dlr::BFloat16*)in_data
+                , out_size
+                , in_size
+                , kernel_size
+                , channel
+                , stride
+                , padding
+                , ceil_mode
+                , rigor
+                , verbose
+                );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dMaxBFloat16ReLu
+(           uint16_t *out_data    // out_channel x out_size x out_size
+    , const uint16_t *in_data     // in_channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    , const int       rigor // check rigorously when 1
+    , const int       verbose
+    )
+{
+    dlrClearLastError();
+    dlr::Pooling2dMax<dlr::BFloat16, 1, 0>( (dlr::BFloat16*)out_data
+                , (const dlr::BFloat16*)in_data
+                , out_size
+                , in_size
+                , kernel_size
+                , channel
+                , stride
+                , padding
+                , ceil_mode
+                , rigor
+                , verbose
+                );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dMaxBatchBFloat16
+(           uint16_t *out_data    // minibatch x channel x out_size x out_size
+    , const uint16_t *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dMaxBatch<dlr::BFloat16>
+    (     (dlr::BFloat16*)out_data
+        , (const dlr::BFloat16*)in_data
+        , out_size
+        , in_size
+        , kernel_size
+        , channel
+        , minibatch
+        , stride
+        , padding
+        , ceil_mode
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+#endif
+
+#if !defined(__SYNTHESIS__)
+// max pooling with argmax indices as 'return_indices' of PyTorch
+int Pooling2dMaxIndicesInt
+(           int      *out_data    // channel x out_size x out_size
+    ,       int32_t  *out_indices // channel x out_size x out_size, index in channel of in_data
+    , const int      *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dMaxIndices<int>
+    (     out_data
+        , out_indices
+        , in_data
+        , out_size
+        , in_size
+        , kernel_size
+        , channel
+        , stride
+        , padding
+        , ceil_mode
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dMaxIndicesBatchInt
+(           int      *out_data    // minibatch x channel x out_size x out_size
+    ,       int32_t  *out_indices // minibatch x channel x out_size x out_size, index in channel of in_data
+    , const int      *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dMaxIndicesBatch<int>
+    (     out_data
+        , out_indices
+        , in_data
+        , out_size
+        , in_size
+        , kernel_size
+        , channel
+        , minibatch
+        , stride
+        , padding
+        , ceil_mode
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dMaxIndicesFloat
+(           float    *out_data    // channel x out_size x out_size
+    ,       int32_t  *out_indices // channel x out_size x out_size, index in channel of in_data
+    , const float    *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dMaxIndices<float>
+    (     out_data
+        , out_indices
+        , in_data
+        , out_size
+        , in_size
+        , kernel_size
+        , channel
+        , stride
+        , padding
+        , ceil_mode
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dMaxIndicesBatchFloat
+(           float    *out_data    // minibatch x channel x out_size x out_size
+    ,       int32_t  *out_indices // minibatch x channel x out_size x out_size, index in channel of in_data
+    , const float    *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dMaxIndicesBatch<float>
+    (     out_data
+        , out_indices
+        , in_data
+        , out_size
+        , in_size
+        , kernel_size
+        , channel
+        , minibatch
+        , stride
+        , padding
+        , ceil_mode
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dMaxIndicesDouble
+(           double   *out_data    // channel x out_size x out_size
+    ,       int32_t  *out_indices // channel x out_size x out_size, index in channel of in_data
+    , const double   *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dMaxIndices<double>
+    (     out_data
+        , out_indices
+        , in_data
+        , out_size
+        , in_size
+        , kernel_size
+        , channel
+        , stride
+        , padding
+        , ceil_mode
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+
+int Pooling2dMaxIndicesBatchDouble
+(           double   *out_data    // minibatch x channel x out_size x out_size
+    ,       int32_t  *out_indices // minibatch x channel x out_size x out_size, index in channel of in_data
+    , const double   *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+)
+{
+    dlrClearLastError();
+    dlr::Pooling2dMaxIndicesBatch<double>
+    (     out_data
+        , out_indices
+        , in_data
+        , out_size
+        , in_size
+        , kernel_size
+        , channel
+        , minibatch
+        , stride
+        , padding
+        , ceil_mode
+        , rigor
+        , verbose
+    );
+    return dlrGetLastStatus();
+}
+#endif
+
 } // extern "C"
@@ -6,8 +6,9 @@ extern "C" {
 #endif
 
 #define Pooling2dMax Pooling2dMaxFloat
+#define Pooling2dMaxBatch Pooling2dMaxBatchFloat
 
-extern void Pooling2dMaxInt
+extern int Pooling2dMaxInt
 (           int      *out_data    // out_channel x out_size x out_size
     , const int      *in_data     // in_channel x in_size x in_size
     , const uint16_t  out_size    // only for square matrix
@@ -23,7 +24,7 @@ extern void Pooling2dMaxInt
     #endif
 );
 
-extern void Pooling2dMaxFloat
+extern int Pooling2dMaxFloat
 (           float    *out_data    // out_channel x out_size x out_size   
     , const float    *in_data     // in_channel x in_size x in_size
     , const uint16_t  out_size    // only for square matrix
@@ -39,7 +40,7 @@ extern void Pooling2dMaxFloat
     #endif
 );
 
-extern void Pooling2dMaxDouble
+extern int Pooling2dMaxDouble
 (           double   *out_data    // out_channel x out_size x out_size
     , const double   *in_data     // in_channel x in_size x in_size
     , const uint16_t  out_size    // only for square matrix
@@ -57,7 +58,7 @@ extern void Pooling2dMaxDouble
 
 #define Pooling2dMaxReLu Pooling2dMaxFloatReLu
 
-extern void Pooling2dMaxIntReLu
+extern int Pooling2dMaxIntReLu
 (           int      *out_data    // out_channel x out_size x out_size
     , const int      *in_data     // in_channel x in_size x in_size
     , const uint16_t  out_size    // only for square matrix
@@ -73,7 +74,7 @@ extern void Pooling2dMaxIntReLu
     #endif
 );
 
-extern void Pooling2dMaxFloatReLu
+extern int Pooling2dMaxFloatReLu
 (           float    *out_data    // out_channel x out_size x out_size   
     , const float    *in_data     // in_channel x in_size x in_size
     , const uint16_t  out_size    // only for square matrix
@@ -89,7 +90,7 @@ extern void Pooling2dMaxFloatReLu
     #endif
 );
 
-extern void Pooling2dMaxDoubleReLu
+extern int Pooling2dMaxDoubleReLu
 (           double   *out_data    // out_channel x out_size x out_size
     , const double   *in_data     // in_channel x in_size x in_size
     , const uint16_t  out_size    // only for square matrix
@@ -105,6 +106,321 @@ extern void Pooling2dMaxDoubleReLu
     #endif
 );
 
+extern int Pooling2dMaxBatchInt
+(           int      *out_data    // minibatch x channel x out_size x out_size
+    , const int      *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+extern int Pooling2dMaxBatchFloat
+(           float    *out_data    // minibatch x channel x out_size x out_size
+    , const float    *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+extern int Pooling2dMaxBatchDouble
+(           double   *out_data    // minibatch x channel x out_size x out_size
+    , const double   *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+    #endif
+);
+
+#if !defined(__SYNTHESIS__)
+// int8 with the same scale and zero point for in_data and out_data
+extern int Pooling2dMaxInt8
+(           int8_t   *out_data    // channel x out_size x out_size
+    , const int8_t   *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       rigor // check rigorously when 1
+    , const int       verbose
+);
+
+extern int Pooling2dMaxBatchInt8
+(           int8_t   *out_data    // minibatch x channel x out_size x out_size
+    , const int8_t   *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+#endif
+
+#if !defined(__SYNTHESIS__)
+// fixed-point of raw bits in the format of dlrSetFixedFormat()
+extern int Pooling2dMaxFixed
+(           int32_t  *out_data    // out_channel x out_size x out_size
+    , const int32_t  *in_data     // in_channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       rigor // check rigorously when 1
+    , const int       verbose
+);
+
+extern int Pooling2dMaxFixedReLu
+(           int32_t  *out_data    // out_channel x out_size x out_size
+    , const int32_t  *in_data     // in_channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       rigor // check rigorously when 1
+    , const int       verbose
+);
+
+extern int Pooling2dMaxBatchFixed
+(           int32_t  *out_data    // minibatch x channel x out_size x out_size
+    , const int32_t  *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+#endif
+
+#if !defined(__SYNTHESIS__)
+// IEEE 754 binary16 (fp16) storage of uint16_t bits computed in float
+extern int Pooling2dMaxHalf
+(           uint16_t *out_data    // out_channel x out_size x out_size
+    , const uint16_t *in_data     // in_channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       rigor // check rigorously when 1
+    , const int       verbose
+);
+
+extern int Pooling2dMaxHalfReLu
+(           uint16_t *out_data    // out_channel x out_size x out_size
+    , const uint16_t *in_data     // in_channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       rigor // check rigorously when 1
+    , const int       verbose
+);
+
+extern int Pooling2dMaxBatchHalf
+(           uint16_t *out_data    // minibatch x channel x out_size x out_size
+    , const uint16_t *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+// bfloat16 (bf16) storage of uint16_t bits computed in float
+extern int Pooling2dMaxBFloat16
+(           uint16_t *out_data    // out_channel x out_size x out_size
+    , const uint16_t *in_data     // in_channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       rigor // check rigorously when 1
+    , const int       verbose
+);
+
+extern int Pooling2dMaxBFloat16ReLu
+(           uint16_t *out_data    // out_channel x out_size x out_size
+    , const uint16_t *in_data     // in_channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       rigor // check rigorously when 1
+    , const int       verbose
+);
+
+extern int Pooling2dMaxBatchBFloat16
+(           uint16_t *out_data    // minibatch x channel x out_size x out_size
+    , const uint16_t *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode   // not implemented yet
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+#endif
+
+#if !defined(__SYNTHESIS__)
+// max pooling with argmax indices as 'return_indices' of PyTorch
+extern int Pooling2dMaxIndicesInt
+(           int      *out_data    // channel x out_size x out_size
+    ,       int32_t  *out_indices // channel x out_size x out_size, index in channel of in_data
+    , const int      *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+extern int Pooling2dMaxIndicesBatchInt
+(           int      *out_data    // minibatch x channel x out_size x out_size
+    ,       int32_t  *out_indices // minibatch x channel x out_size x out_size, index in channel of in_data
+    , const int      *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+extern int Pooling2dMaxIndicesFloat
+(           float    *out_data    // channel x out_size x out_size
+    ,       int32_t  *out_indices // channel x out_size x out_size, index in channel of in_data
+    , const float    *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+extern int Pooling2dMaxIndicesBatchFloat
+(           float    *out_data    // minibatch x channel x out_size x out_size
+    ,       int32_t  *out_indices // minibatch x channel x out_size x out_size, index in channel of in_data
+    , const float    *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+extern int Pooling2dMaxIndicesDouble
+(           double   *out_data    // channel x out_size x out_size
+    ,       int32_t  *out_indices // channel x out_size x out_size, index in channel of in_data
+    , const double   *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+
+extern int Pooling2dMaxIndicesBatchDouble
+(           double   *out_data    // minibatch x channel x out_size x out_size
+    ,       int32_t  *out_indices // minibatch x channel x out_size x out_size, index in channel of in_data
+    , const double   *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const int       ceil_mode
+    , const int       rigor     // check rigorously when 1
+    , const int       verbose   // verbose level
+);
+#endif
+
 #ifdef __cplusplus
 }
 #endif
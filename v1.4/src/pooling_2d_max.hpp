@@ -13,15 +13,126 @@
 #include <math.h>
 #if !defined(__SYNTHESIS__)
 #include <stdio.h>
-#include <assert.h>
 #include <typeinfo>
+#include <vector>
 #include "dlr_common.h"
+#include "dlr_simd.hpp"
 #endif
 
 #define TYPE_MIN -255
 
+// kernel_size from which van Herk/Gil-Werman is taken (software-only),
+// which is twice for stride 1, where windows of a row go vector kernel at once
+#if !defined(DLR_POOLING_BLOCKS)
+#define DLR_POOLING_BLOCKS 5
+#endif
+
 namespace dlr { // deep learning routines
 
+#if !defined(__SYNTHESIS__)
+// Running max over 'n' rows of 'width' of 'x' in blocks of 'kernel_size' rows,
+// i.e., 'G' from the first row of each block and 'H' to the last row of each
+// block, where the last block may be short.
+template<class TYPE>
+inline void MaxOfBlocksRows
+(           TYPE     *G // n x width
+    ,       TYPE     *H // n x width
+    , const TYPE     *x // n x width
+    , const uint16_t  n
+    , const uint16_t  width
+    , const uint8_t   kernel_size
+)
+{
+    for (uint16_t i=0; i<n; ++i) {
+        const uint32_t t_at = (uint32_t)i*width;
+        if ((i%kernel_size)==0) {
+            for (uint16_t j=0; j<width; ++j) G[t_at+j] = x[t_at+j];
+        } else {
+            SimdMax(G+t_at, G+t_at-width, x+t_at, width);
+        }
+    }
+    for (int32_t i=n-1; i>=0; --i) {
+        const uint32_t t_at = (uint32_t)i*width;
+        if (((i%kernel_size)==(kernel_size-1))||(i==(n-1))) {
+            for (uint16_t j=0; j<width; ++j) H[t_at+j] = x[t_at+j];
+        } else {
+            SimdMax(H+t_at, H+t_at+width, x+t_at, width);
+        }
+    }
+}
+
+// Returns row of max over rows 'first' to 'last' (at most 'kernel_size' rows)
+// by 'G' and 'H' of MaxOfBlocksRows(), which is 'z' only when two blocks meet.
+template<class TYPE>
+inline const TYPE *MaxOfBlocksRow
+(           TYPE     *z // width
+    , const TYPE     *G
+    , const TYPE     *H
+    , const int32_t   first
+    , const int32_t   last
+    , const uint16_t  width
+    , const uint8_t   kernel_size
+)
+{
+    if ((first/kernel_size)!=(last/kernel_size)) {
+        SimdMax(z, H+(uint32_t)first*width, G+(uint32_t)last*width, width);
+        return z;
+    }
+    // within a block, which starts at 'first' or ends at 'last'
+    return ((first%kernel_size)==0) ? G+(uint32_t)last*width : H+(uint32_t)first*width;
+}
+
+// Max pooling of a channel by van Herk/Gil-Werman, where rows of the window
+// go first by MaxOfBlocksRows() and MaxOfBlocksRow() over rows of input and
+// then columns go the same over rows of the transposed, i.e., all steps are
+// vector kernels over rows. Windows are clipped to input as Pooling2dMax()
+// and 'empty' is for windows entirely in padding.
+template<class TYPE>
+inline void Pooling2dMaxBlocks
+(           TYPE     *out_data    // out_size x out_size
+    , const TYPE     *in_data     // in_size x in_size
+    , const uint16_t  out_size
+    , const uint16_t  in_size
+    , const uint8_t   kernel_size
+    , const uint8_t   stride
+    , const uint8_t   padding
+    , const TYPE      empty
+)
+{
+    const uint32_t t_in_area = (uint32_t)in_size*in_size;
+    const uint32_t t_cols    = (uint32_t)in_size*out_size;
+    std::vector<TYPE> t_G((t_in_area>t_cols) ? t_in_area : t_cols);
+    std::vector<TYPE> t_H(t_G.size());
+    std::vector<TYPE> t_C(t_cols); // in_size x out_size: max of window rows transposed
+    std::vector<TYPE> t_tmp((in_size>out_size) ? in_size : out_size);
+
+    MaxOfBlocksRows(&t_G[0], &t_H[0], in_data, in_size, in_size, kernel_size);
+    for (uint16_t g=0; g<out_size; ++g) {
+        const int32_t y0 = (int32_t)g*stride-padding;
+        const int32_t i0 = (y0<0) ? 0 : y0;
+        const int32_t i1 = ((y0+kernel_size)>in_size) ? in_size : y0+kernel_size;
+        if (i0>=i1) {
+            for (uint16_t j=0; j<in_size; ++j) t_C[(uint32_t)j*out_size+g] = empty;
+            continue;
+        }
+        const TYPE *pR = MaxOfBlocksRow(&t_tmp[0], &t_G[0], &t_H[0], i0, i1-1, in_size, kernel_size);
+        for (uint16_t j=0; j<in_size; ++j) t_C[(uint32_t)j*out_size+g] = pR[j];
+    }
+    MaxOfBlocksRows(&t_G[0], &t_H[0], &t_C[0], in_size, out_size, kernel_size);
+    for (uint16_t k=0; k<out_size; ++k) {
+        const int32_t x0 = (int32_t)k*stride-padding;
+        const int32_t j0 = (x0<0) ? 0 : x0;
+        const int32_t j1 = ((x0+kernel_size)>in_size) ? in_size : x0+kernel_size;
+        if (j0>=j1) {
+            for (uint16_t g=0; g<out_size; ++g) out_data[(uint32_t)g*out_size+k] = empty;
+            continue;
+        }
+        const TYPE *pR = MaxOfBlocksRow(&t_tmp[0], &t_G[0], &t_H[0], j0, j1-1, out_size, kernel_size);
+        for (uint16_t g=0; g<out_size; ++g) out_data[(uint32_t)g*out_size+k] = pR[g];
+    }
+}
+#endif // !defined(__SYNTHESIS__)
+
 template< class TYPE=float
         , const int ReLu=0
         , const int LeakyReLu=0
@@ -63,15 +174,16 @@ void Pooling2dMax
         uint16_t expect=(ceil_mode) ? (int)ceil(((in_size-kernel_size+(2*padding))/stride)+1+in_size%kernel_size)
                                     : (int)floor(((in_size-kernel_size+(2*padding))/stride)+1);
         if (out_size!=expect) dlrWarn("out_size mis-match: %u, but %u expected\n", out_size, expect);
-        assert ((kernel_size%2)==0);
-        assert (stride>0);
-        assert (padding>=0);
-        assert (padding<=(kernel_size/2));
+        dlrCheck ((kernel_size%2)==0);
+        dlrCheck (stride>0);
+        dlrCheck (padding>=0);
+        dlrCheck (padding<=(kernel_size/2));
     }
     #undef QuoteMacro
     #undef QuoteIdent
     #endif
 
+    #if defined(__SYNTHESIS__)
     #define UpperPadding(CURSOR, PADDING)          (CURSOR <   PADDING)
     #define LowerPadding(CURSOR, PADDING, IN_SIZE) (CURSOR >= (PADDING+IN_SIZE))
     #define LeftPadding( CURSOR, PADDING)          (CURSOR <   PADDING)
@@ -93,6 +205,9 @@ void Pooling2dMax
     const uint16_t kernel_height=kernel_size;
 
     // TYPE *pZ = out_data; // contiguous memory
+    #if !defined(__SYNTHESIS__) && defined(_OPENMP)
+    #pragma omp parallel for private(i, j, k, g, r, c, t_width, t_height)
+    #endif
     for (ch=0; ch<channel; ++ch) {
         for (g=0, r=0; g<out_height; ++g, r+=stride) {
             for (k=0, c=0; k<out_width; ++k, c+=stride) {
@@ -127,13 +242,364 @@ void Pooling2dMax
     #undef LeftPadding
     #undef RightPadding
     #undef IsPadding
+    #else // !defined(__SYNTHESIS__)
+    // Max is separable: rows of the window are reduced into 't_col' first,
+    // then columns of 't_col' into each output, where windows are clipped
+    // to input, i.e., padding is skipped. Both steps go vector kernel for
+    // float and the result is the same as the reference for any TYPE.
+    // Large kernels go van Herk/Gil-Werman by Pooling2dMaxBlocks(), whose
+    // cost per output does not grow with the kernel.
+    const uint32_t t_in_area  = (uint32_t)in_size*in_size;
+    const uint32_t t_out_area = (uint32_t)out_size*out_size;
+    uint16_t t_hi = ((in_size+padding)>=kernel_size) ? (in_size+padding-kernel_size)/stride+1 : 0;
+    if (t_hi>out_size) t_hi = out_size;
+    uint16_t t_lo = (padding+stride-1)/stride;
+    if (t_lo>t_hi) t_lo = t_hi;
+
+    const bool t_blocks = (kernel_size>=((stride==1) ? 2*DLR_POOLING_BLOCKS : DLR_POOLING_BLOCKS));
+    uint16_t ch;
+
+    #if defined(_OPENMP)
+    #pragma omp parallel for
+    #endif
+    for (ch=0; ch<channel; ++ch) {
+        std::vector<TYPE> t_col(in_size); // max of window rows for each column
+        std::vector<TYPE> t_row(out_size);
+        const TYPE *pX = in_data+(uint32_t)ch*t_in_area;
+        TYPE *pZ = out_data+(uint32_t)ch*t_out_area;
+        std::vector<TYPE> t_max(t_blocks ? t_out_area : 0);
+        if (t_blocks) {
+            Pooling2dMaxBlocks(&t_max[0], pX, out_size, in_size, kernel_size
+                              , stride, padding, (TYPE)TYPE_MIN);
+        }
+        for (uint16_t g=0; g<out_size; ++g) {
+            const int32_t y0 = (int32_t)g*stride-padding;
+            const int32_t i0 = (y0<0) ? 0 : y0;
+            const int32_t i1 = ((y0+kernel_size)>in_size) ? in_size : y0+kernel_size;
+            TYPE *pZg = pZ+(uint32_t)g*out_size;
+            if (t_blocks) {
+                for (uint16_t k=0; k<out_size; ++k) t_row[k] = t_max[(uint32_t)g*out_size+k];
+            } else if (i0>=i1) {
+                for (uint16_t k=0; k<out_size; ++k) t_row[k] = (TYPE)TYPE_MIN;
+            } else {
+                for (uint16_t j=0; j<in_size; ++j) t_col[j] = pX[(uint32_t)i0*in_size+j];
+                for (int32_t i=i0+1; i<i1; ++i)
+                    SimdMax(&t_col[0], &t_col[0], pX+(uint32_t)i*in_size, in_size);
+                for (uint16_t k=0; k<out_size; ++k) {
+                    if ((stride==1)&&(k>=t_lo)&&(k<t_hi)) { // interior columns at once
+                        const TYPE *pC = &t_col[k-padding];
+                        const uint32_t n = t_hi-t_lo;
+                        for (uint32_t m=0; m<n; ++m) t_row[k+m] = pC[m];
+                        for (uint8_t j=1; j<kernel_size; ++j)
+                            SimdMax(&t_row[k], &t_row[k], pC+j, n);
+                        k = t_hi-1;
+                        continue;
+                    }
+                    const int32_t x0 = (int32_t)k*stride-padding;
+                    const int32_t j0 = (x0<0) ? 0 : x0;
+                    const int32_t j1 = ((x0+kernel_size)>in_size) ? in_size : x0+kernel_size;
+                    TYPE max=t_col[j0];
+                    for (int32_t j=j0+1; j<j1; ++j) if (max<t_col[j]) max = t_col[j];
+                    t_row[k] = max;
+                }
+            }
+            for (uint16_t k=0; k<out_size; ++k) {
+                TYPE max = (t_row[k]<(TYPE)TYPE_MIN) ? (TYPE)TYPE_MIN : t_row[k];
+                if (ReLu) {
+                    pZg[k] = (max<=(TYPE)0) ? (TYPE)0 : max;
+                } else if (LeakyReLu) {
+                    uint32_t ss = negative_slope;
+                    float slope = *((float *)&ss); // make sure that it is 32-bit wide item
+                    pZg[k] = (max<(TYPE)0) ? (TYPE)((float)max*slope) : max;
+                } else {
+                    pZg[k] = max;
+                }
+            }
+        } // for (g=0
+    } // for (ch=0
+    #endif // !defined(__SYNTHESIS__)
 }
 #undef  TYPE_MIN
 
+// minibatch version: in_data and out_data have leading minibatch dimension
+template< class TYPE=float
+        , const int ReLu=0
+        , const int LeakyReLu=0
+        , const uint32_t negative_slope=0x3DCCCCCD // 0.1
+        >
+void Pooling2dMaxBatch
+(           TYPE     *out_data    // minibatch x channel x out_size x out_size
+    , const TYPE     *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding=0
+    , const int       ceil_mode=0 // not implemented yet
+    #if !defined(__SYNTHESIS__)
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+    #endif
+)
+{
+    const uint32_t t_out_step=(uint32_t)channel*out_size*out_size;
+    const uint32_t t_in_step =(uint32_t)channel*in_size*in_size;
+    TYPE       *pZ = out_data;
+    const TYPE *pX = in_data;
+    uint16_t mb;
+
+    for (mb=0; mb<minibatch; ++mb) {
+        Pooling2dMax<TYPE, ReLu, LeakyReLu, negative_slope>
+        (     pZ
+            , pX
+            , out_size
+            , in_size
+            , kernel_size
+            , channel
+            , stride
+            , padding
+            , ceil_mode
+            #if !defined(__SYNTHESIS__)
+            , rigor
+            , verbose
+            #endif
+        );
+        pZ += t_out_step;
+        pX += t_in_step;
+    }
+}
+
+#if !defined(__SYNTHESIS__)
+// Max pooling with argmax, where 'out_indices' has index of the max in the
+// channel of input, i.e., 'row*in_size+column', as 'return_indices' of
+// 'torch.nn.functional.max_pool2d()'. Ties go the first in row-major order
+// of the window and values are not limited by TYPE_MIN of Pooling2dMax()
+// so that each value is the input at its index. Rows of the window go first
+// with their row index kept, then columns in the same pass, where windows
+// are clipped to input, i.e., padding is skipped.
+template<class TYPE=float>
+void Pooling2dMaxIndices
+(           TYPE     *out_data    // channel x out_size x out_size
+    ,       int32_t  *out_indices // channel x out_size x out_size
+    , const TYPE     *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint8_t   stride
+    , const uint8_t   padding=0
+    , const int       ceil_mode=0
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+)
+{
+    if (verbose) {
+        dlrInfo("out_size   =%d\n", out_size    );
+        dlrInfo("in_size    =%d\n", in_size     );
+        dlrInfo("kernel_size=%d\n", kernel_size );
+        dlrInfo("channel    =%d\n", channel     );
+        dlrInfo("stride     =%d\n", stride      );
+        dlrInfo("padding    =%d\n", padding     );
+        dlrInfo("ceil       =%d\n", ceil_mode   );
+        fflush(stderr); fflush(stdout);
+    }
+    if (rigor) {
+        dlrCheck (stride>0);
+        dlrCheck (kernel_size>0);
+        dlrCheck (padding<=(kernel_size/2));
+        dlrCheck (((uint32_t)(out_size-1)*stride)<((uint32_t)in_size+padding));
+    }
+
+    const uint32_t t_in_area  = (uint32_t)in_size*in_size;
+    const uint32_t t_out_area = (uint32_t)out_size*out_size;
+    int32_t ch; // signed for OpenMP
+
+    #if defined(_OPENMP)
+    #pragma omp parallel for
+    #endif
+    for (ch=0; ch<(int32_t)channel; ++ch) {
+        std::vector<TYPE> t_col(in_size); // max of window rows for each column
+        std::vector<int32_t> t_row(in_size); // row of the max for each column
+        const TYPE *pX = in_data+(uint32_t)ch*t_in_area;
+        TYPE *pZ = out_data+(uint32_t)ch*t_out_area;
+        int32_t *pI = out_indices+(uint32_t)ch*t_out_area;
+        for (uint16_t g=0; g<out_size; ++g) {
+            const int32_t y0 = (int32_t)g*stride-padding;
+            const int32_t i0 = (y0<0) ? 0 : y0;
+            const int32_t i1 = ((y0+kernel_size)>in_size) ? in_size : y0+kernel_size;
+            for (uint16_t j=0; j<in_size; ++j) { t_col[j] = pX[(uint32_t)i0*in_size+j]; t_row[j] = i0; }
+            for (int32_t i=i0+1; i<i1; ++i) {
+                const TYPE *pXr = pX+(uint32_t)i*in_size;
+                for (uint16_t j=0; j<in_size; ++j) {
+                    if (t_col[j]<pXr[j]) { t_col[j] = pXr[j]; t_row[j] = i; }
+                }
+            }
+            for (uint16_t k=0; k<out_size; ++k) {
+                const int32_t x0 = (int32_t)k*stride-padding;
+                const int32_t j0 = (x0<0) ? 0 : x0;
+                const int32_t j1 = ((x0+kernel_size)>in_size) ? in_size : x0+kernel_size;
+                const uint32_t t_at = (uint32_t)g*out_size+k;
+                if ((i0>=i1)||(j0>=j1)) { // window entirely in padding
+                    pZ[t_at] = (TYPE)0;
+                    pI[t_at] = -1;
+                    continue;
+                }
+                int32_t t_j = j0;
+                for (int32_t j=j0+1; j<j1; ++j) {
+                    if ((t_col[t_j]<t_col[j])||(!(t_col[j]<t_col[t_j])&&(t_row[j]<t_row[t_j]))) t_j = j;
+                }
+                pZ[t_at] = t_col[t_j];
+                pI[t_at] = t_row[t_j]*in_size+t_j;
+            }
+        }
+    }
+}
+
+// minibatch version: in_data, out_data and out_indices have leading minibatch dimension
+template<class TYPE=float>
+void Pooling2dMaxIndicesBatch
+(           TYPE     *out_data    // minibatch x channel x out_size x out_size
+    ,       int32_t  *out_indices // minibatch x channel x out_size x out_size
+    , const TYPE     *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding=0
+    , const int       ceil_mode=0
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+)
+{
+    const uint32_t t_out_step=(uint32_t)channel*out_size*out_size;
+    const uint32_t t_in_step =(uint32_t)channel*in_size*in_size;
+    TYPE       *pZ = out_data;
+    int32_t    *pI = out_indices;
+    const TYPE *pX = in_data;
+    uint16_t mb;
+
+    for (mb=0; mb<minibatch; ++mb) {
+        Pooling2dMaxIndices<TYPE>(pZ, pI, pX, out_size, in_size, kernel_size, channel
+                                 , stride, padding, ceil_mode, rigor, verbose);
+        pZ += t_out_step;
+        pI += t_out_step;
+        pX += t_in_step;
+    }
+}
+
+// int8 version, where max of quantized data is the quantized max since
+// quantization is monotonic, i.e., out_data has the same scale and zero point
+// as in_data without requantization. Windows are clipped to input, i.e.,
+// padding is skipped, which covers 'ceil_mode' as well.
+inline void Pooling2dMaxInt8
+(           int8_t   *out_data    // channel x out_size x out_size
+    , const int8_t   *in_data     // channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint8_t   stride
+    , const uint8_t   padding=0
+    , const int       ceil_mode=0
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+)
+{
+    if (verbose) {
+        dlrInfo("out_size   =%d\n", out_size    );
+        dlrInfo("in_size    =%d\n", in_size     );
+        dlrInfo("kernel_size=%d\n", kernel_size );
+        dlrInfo("channel    =%d\n", channel     );
+        dlrInfo("stride     =%d\n", stride      );
+        dlrInfo("padding    =%d\n", padding     );
+        dlrInfo("ceil       =%d\n", ceil_mode   );
+        fflush(stderr); fflush(stdout);
+    }
+    if (rigor) {
+        dlrCheck (stride>0);
+        dlrCheck (kernel_size>0);
+        dlrCheck (padding<=(kernel_size/2));
+        dlrCheck (((uint32_t)(out_size-1)*stride)<((uint32_t)in_size+padding));
+    }
+
+    const uint32_t t_in_area  = (uint32_t)in_size*in_size;
+    const uint32_t t_out_area = (uint32_t)out_size*out_size;
+    int32_t ch; // signed for OpenMP
+
+    #if defined(_OPENMP)
+    #pragma omp parallel for
+    #endif
+    for (ch=0; ch<(int32_t)channel; ++ch) {
+        std::vector<int8_t> t_col(in_size); // max of window rows for each column
+        const int8_t *pX = in_data+(uint32_t)ch*t_in_area;
+        int8_t *pZ = out_data+(uint32_t)ch*t_out_area;
+        for (uint16_t g=0; g<out_size; ++g) {
+            const int32_t y0 = (int32_t)g*stride-padding;
+            const int32_t i0 = (y0<0) ? 0 : y0;
+            const int32_t i1 = ((y0+kernel_size)>in_size) ? in_size : y0+kernel_size;
+            for (uint16_t j=0; j<in_size; ++j) t_col[j] = pX[(uint32_t)i0*in_size+j];
+            for (int32_t i=i0+1; i<i1; ++i) {
+                const int8_t *pXr = pX+(uint32_t)i*in_size;
+                for (uint16_t j=0; j<in_size; ++j) if (t_col[j]<pXr[j]) t_col[j] = pXr[j];
+            }
+            for (uint16_t k=0; k<out_size; ++k) {
+                const int32_t x0 = (int32_t)k*stride-padding;
+                const int32_t j0 = (x0<0) ? 0 : x0;
+                const int32_t j1 = ((x0+kernel_size)>in_size) ? in_size : x0+kernel_size;
+                int8_t max = t_col[j0];
+                for (int32_t j=j0+1; j<j1; ++j) if (max<t_col[j]) max = t_col[j];
+                pZ[(uint32_t)g*out_size+k] = max;
+            }
+        }
+    }
+}
+
+// minibatch version: in_data and out_data have leading minibatch dimension
+inline void Pooling2dMaxBatchInt8
+(           int8_t   *out_data    // minibatch x channel x out_size x out_size
+    , const int8_t   *in_data     // minibatch x channel x in_size x in_size
+    , const uint16_t  out_size    // only for square matrix
+    , const uint16_t  in_size     // only for square matrix
+    , const uint8_t   kernel_size // only for square matrix
+    , const uint16_t  channel     // in/out channel
+    , const uint16_t  minibatch   // number of minibatch items
+    , const uint8_t   stride
+    , const uint8_t   padding=0
+    , const int       ceil_mode=0
+    , const int       rigor=0   // check rigorously when 1
+    , const int       verbose=0 // verbose level
+)
+{
+    const uint32_t t_out_step=(uint32_t)channel*out_size*out_size;
+    const uint32_t t_in_step =(uint32_t)channel*in_size*in_size;
+    int8_t       *pZ = out_data;
+    const int8_t *pX = in_data;
+    uint16_t mb;
+
+    for (mb=0; mb<minibatch; ++mb) {
+        Pooling2dMaxInt8(pZ, pX, out_size, in_size, kernel_size, channel
+                        , stride, padding, ceil_mode, rigor, verbose);
+        pZ += t_out_step;
+        pX += t_in_step;
+    }
+}
+#endif // !defined(__SYNTHESIS__)
+
 } // namespace dlr
 /*
  * Revision history
  *
+ * 2026.10.18: 'Pooling2dMaxIndices' and 'Pooling2dMaxIndicesBatch' added for argmax.
+ * 2026.10.18: van Herk/Gil-Werman for large kernel_size (reference kept for __SYNTHESIS__).
+ * 2026.10.18: 'Pooling2dMaxInt8' and 'Pooling2dMaxBatchInt8' added for int8.
+ * 2026.10.18: separable max with SIMD for float (reference kept for __SYNTHESIS__).
+ * 2026.10.18: 'dlrCheck()' in place of 'assert()' for rigor checks.
+ * 2026.10.18: OpenMP for 'ch' loop when built with OpenMP.
+ * 2026.10.18: 'Pooling2dMaxBatch' added for minibatch.
  * 2020.11.12: 'LeakyReLu' template added.
  * 2020.10.01: C++ template version by Ando Ki.
  * 2020.09.20: parameter order of bias and bias_size changed.